@@ -0,0 +1,112 @@
+## 按主机的自适应请求截止时间：由该主机最近响应耗时的分位数乘以倍数得到，限制在下限和上限之间
+## 平时很快的主机偶尔卡住的响应会被提前截断，一直较慢但正常的主机按自己的耗时放宽，不会被误杀
+import math
+from collections import deque
+
+
+class _HostLatency:
+    __slots__ = ("samples", "deadline", "observed", "cut")
+
+    def __init__(self, window):
+        self.samples = deque(maxlen=window)
+        self.deadline = None
+        self.observed = 0
+        self.cut = 0
+
+
+class AdaptiveTimeout:
+    """
+    自适应截止时间
+    每个主机保留最近window次响应的耗时，样本达到min_samples后，
+    截止时间 = 耗时的percentile分位数 × multiplier，并限制在[floor, ceiling]；样本不足时使用ceiling。
+    被截断的请求以截止时间作为样本（实际耗时至少这么长），主机整体变慢时截止时间随之放宽，不会一直截断
+    """
+
+    # 每观察多少个样本重新计算一次分位数
+    RECOMPUTE_EVERY = 10
+
+    def __init__(self, percentile=0.95, multiplier=3.0, floor=2.0, ceiling=60.0, window=200, min_samples=20,
+                 enabled=True):
+        """
+        :param percentile: 分位数，0~1
+        :param multiplier: 分位数耗时的倍数
+        :param floor: 截止时间下限（秒）
+        :param ceiling: 截止时间上限（秒），也是样本不足时的截止时间
+        :param window: 每个主机保留的样本数
+        :param min_samples: 开始自适应所需的最少样本数
+        :param enabled: 为False时所有主机都使用ceiling
+        """
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.floor = min(floor, ceiling)
+        self.ceiling = ceiling
+        self.window = window
+        self.min_samples = max(1, min_samples)
+        self.enabled = enabled
+        self.hosts = {}
+
+    def deadline(self, host):
+        """该主机当前的截止时间（秒）"""
+        if not self.enabled:
+            return self.ceiling
+        latency = self.hosts.get(host)
+        if latency is None or latency.deadline is None:
+            return self.ceiling
+        return latency.deadline
+
+    def observe(self, host, elapsed):
+        """记录一次成功响应的耗时（秒），与截止时间限制的是同一段：从发出请求到收到响应头"""
+        if not self.enabled:
+            return
+        self._add(self._latency(host), elapsed)
+
+    def _latency(self, host):
+        latency = self.hosts.get(host)
+        if latency is None:
+            latency = self.hosts[host] = _HostLatency(self.window)
+        return latency
+
+    def _add(self, latency, elapsed):
+        latency.samples.append(elapsed)
+        latency.observed += 1
+        count = len(latency.samples)
+        if count >= self.min_samples and (latency.deadline is None or latency.observed % self.RECOMPUTE_EVERY == 0):
+            latency.deadline = self._compute(latency.samples)
+
+    def _compute(self, samples):
+        values = sorted(samples)
+        # 最近秩分位数
+        index = min(len(values) - 1, max(0, math.ceil(self.percentile * len(values)) - 1))
+        return min(self.ceiling, max(self.floor, values[index] * self.multiplier))
+
+    def timed_out(self, host, deadline):
+        """
+        记录一次因超过截止时间被截断的请求
+        :param deadline: 该请求使用的截止时间（秒），作为截尾样本计入
+        """
+        latency = self._latency(host)
+        latency.cut += 1
+        if self.enabled:
+            self._add(latency, deadline)
+
+    def snapshot(self):
+        """各主机的样本数、分位数耗时、当前截止时间和被截断的请求数，供日志和指标展示"""
+        hosts = {}
+        for host, latency in list(self.hosts.items()):
+            samples = sorted(latency.samples)
+            index = min(len(samples) - 1, max(0, math.ceil(self.percentile * len(samples)) - 1))
+            hosts[host] = {
+                "samples": len(samples),
+                "percentile_latency": round(samples[index], 3) if samples else None,
+                "deadline": round(self.deadline(host), 3),
+                "adaptive": latency.deadline is not None,
+                "cut": latency.cut,
+            }
+        return {
+            "enabled": self.enabled,
+            "percentile": self.percentile,
+            "multiplier": self.multiplier,
+            "floor": self.floor,
+            "ceiling": self.ceiling,
+            "hosts": hosts,
+        }
@@ -0,0 +1,236 @@
+## 响应存档：把抓取到的响应（URL、状态码、响应头、响应体）按WARC格式写入压缩文件，每条记录单独gzip压缩，
+## 旁边的SQLite索引记录每条记录的偏移，可按偏移随机读取；修改规则后用replay.py离线重放，不必重新爬取
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime, timezone
+
+from results_store import new_crawl_id
+
+# 写入存档时去掉的响应头：响应体已解压、按实际长度保存
+DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length"}
+
+
+def index_path(path):
+    """存档的索引文件"""
+    return path + ".idx"
+
+
+def build_record(url, status, reason, http_version, headers, body, date=None):
+    """
+    生成一条WARC response记录（未压缩）
+    :param headers: [(响应头名, 值), ...]
+    :param body: 响应体bytes（已解压）
+    """
+    lines = [f"{http_version or 'HTTP/1.1'} {status} {reason or ''}".rstrip()]
+    lines.extend(f"{name}: {value}" for name, value in headers if name.lower() not in DROPPED_HEADERS)
+    lines.append(f"Content-Length: {len(body)}")
+    block = ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8", "replace") + body
+    warc_headers = (
+        "WARC/1.0\r\n"
+        "WARC-Type: response\r\n"
+        f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>\r\n"
+        f"WARC-Date: {(date or datetime.now(timezone.utc)).strftime('%Y-%m-%dT%H:%M:%SZ')}\r\n"
+        f"WARC-Target-URI: {url}\r\n"
+        "Content-Type: application/http; msgtype=response\r\n"
+        f"Content-Length: {len(block)}\r\n"
+        "\r\n"
+    )
+    return warc_headers.encode("utf-8") + block + b"\r\n\r\n"
+
+
+def parse_record(data):
+    """
+    解析一条WARC response记录（已解压）
+    :return: {"url", "status", "headers": [(名, 值), ...], "body": bytes}
+    """
+    head, _, rest = data.partition(b"\r\n\r\n")
+    warc = {}
+    for line in head.decode("utf-8", "replace").split("\r\n")[1:]:
+        name, _, value = line.partition(":")
+        warc[name.strip().lower()] = value.strip()
+    block = rest[:int(warc.get("content-length", len(rest)))]
+    http_head, _, body = block.partition(b"\r\n\r\n")
+    lines = http_head.decode("utf-8", "replace").split("\r\n")
+    status_line = lines[0].split(" ", 2)
+    headers = []
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers.append((name.strip(), value.strip()))
+    return {
+        "url": warc.get("warc-target-uri"),
+        "status": int(status_line[1]) if len(status_line) > 1 and status_line[1].isdigit() else None,
+        "headers": headers,
+        "body": body,
+    }
+
+
+def read_record(f, offset, length):
+    """从存档文件的偏移处读取并解析一条记录"""
+    f.seek(offset)
+    return parse_record(zlib.decompress(f.read(length), wbits=31))
+
+
+class ResponseArchive:
+    """
+    响应存档
+    爬虫调用add只把响应放入内存队列，由写入线程压缩、写入存档文件并批量写入索引，不占用爬虫事件循环。
+    多次爬取追加写入同一个存档，索引中以crawl区分，编号与结果库相同，可按crawl和url与结果行对应
+    """
+
+    def __init__(self, path, level=6, batch_size=200, flush_interval=1.0, crawl_id=None):
+        """
+        :param path: 存档文件路径，如 archive.warc.gz，索引为同名加.idx
+        :param level: gzip压缩级别，1~9
+        :param batch_size: 每个事务最多写入的索引数
+        :param flush_interval: 写入间隔（秒）
+        :param crawl_id: add未指定crawl时使用的爬取编号，为None时新建
+        """
+        self.path = os.path.abspath(path)
+        self.level = level
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.crawl_id = crawl_id or new_crawl_id()
+        self.records = 0
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+        self._queue = queue.Queue()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "ab")
+        self._conn = sqlite3.connect(index_path(self.path), check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                crawl TEXT,
+                job TEXT,
+                url TEXT,
+                request_url TEXT,
+                status INTEGER,
+                content_type TEXT,
+                depth TEXT,
+                type TEXT,
+                size INTEGER,
+                offset INTEGER,
+                length INTEGER
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_crawl ON records (crawl);
+            CREATE INDEX IF NOT EXISTS idx_records_url ON records (url);
+        """)
+        self._conn.commit()
+        self._writer = threading.Thread(target=self._write_loop, name="archive-writer", daemon=True)
+        self._writer.start()
+
+    def add(self, url, status, reason, http_version, headers, body, depth=None, type=None, job=None, request_url=None,
+            crawl=None):
+        """
+        添加一个响应，只放入内存队列，不阻塞调用方
+        :param url: 响应的URL
+        :param headers: [(响应头名, 值), ...]
+        :param body: 响应体bytes（已解压）
+        :param request_url: 爬虫请求的URL，fuzz去掉上下文或302跳转后与url不同
+        :param crawl: 所属爬取的编号（与结果库、断点相同），为None时使用crawl_id
+        """
+        self._queue.put_nowait((url, status, reason, http_version, list(headers), body, depth, type, job,
+                                request_url or url, crawl or self.crawl_id))
+
+    def _write_loop(self):
+        """写入线程"""
+        while True:
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    self._queue.task_done()
+                    break
+                batch.append(item)
+            if batch:
+                try:
+                    self._write_batch(batch)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, batch):
+        rows = []
+        for url, status, reason, http_version, headers, body, depth, type, job, request_url, crawl in batch:
+            record = build_record(url, status, reason, http_version, headers, body)
+            compressor = zlib.compressobj(self.level, zlib.DEFLATED, 31)
+            data = compressor.compress(record) + compressor.flush()
+            offset = self._file.tell()
+            self._file.write(data)
+            content_type = next((value for name, value in headers if name.lower() == "content-type"), None)
+            rows.append((crawl, job, url, request_url, status, content_type, depth, type, len(body), offset,
+                         len(data)))
+            self.records += 1
+            self.raw_bytes += len(record)
+            self.stored_bytes += len(data)
+        # 先写存档再写索引，索引中的记录一定可读
+        self._file.flush()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO records (crawl, job, url, request_url, status, content_type, depth, type, size, offset, length)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def flush(self):
+        """等待队列中的响应全部写入"""
+        self._queue.join()
+
+    def close(self):
+        """写完剩余响应并关闭存档"""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        self._file.close()
+        self._conn.close()
+
+    def stats(self):
+        """存档情况，供日志和指标展示"""
+        return {
+            "path": self.path,
+            "crawl": self.crawl_id,
+            "records": self.records,
+            "pending": self._queue.qsize(),
+            "raw_bytes": self.raw_bytes,
+            "stored_bytes": self.stored_bytes,
+        }
+
+
+def load_index(path, crawl=None):
+    """
+    读取存档索引
+    :param crawl: 爬取编号，'latest'为最近一次，None为全部
+    :return: ([(url, depth, offset, length), ...]，同一URL只保留最后一条；请求过的URL集合)
+    """
+    conn = sqlite3.connect(index_path(os.path.abspath(path)))
+    try:
+        if crawl == "latest":
+            row = conn.execute("SELECT MAX(crawl) FROM records").fetchone()
+            crawl = row[0] if row else None
+        sql = "SELECT url, request_url, depth, offset, length FROM records"
+        params = ()
+        if crawl:
+            sql += " WHERE crawl = ?"
+            params = (crawl,)
+        records = {}
+        requested = set()
+        for url, request_url, depth, offset, length in conn.execute(sql + " ORDER BY id", params):
+            records[url] = (url, depth, offset, length)
+            requested.add(request_url)
+        return list(records.values()), requested
+    finally:
+        conn.close()
@@ -0,0 +1 @@
+(window["webpackJsonp"]=window["webpackJsonp"]||[]).push([["app"],{"0$mu":function(e,t,n){"use strict";hl.$emit("FORJ$I",K);v.prototype._I$Buk=function(es){this.fYDQ=es;return this};if(!U)throw new Error("[ewijS] _rxcMRKa is required");WX.format("YYYY/MM/DD");b.format("YYYY/MM/DD");r.prototype.yXlISI=function(CP){this.YaTu=CP;return this};case 91:c.vGN_(T);break;for(var ts=0;ts<h.length;ts++)F.push(h[ts]);"wFRwvh"===typeof Gw&&(jR=Gw);function P(G,E){return G&&G.length>0?G.map(function(E){return E.ikFG}):[]};var sa=B.kQzXB||{},CF=void 0===sa.bNB?null:sa.bnR;xj.prototype.EARQgQ=function(T){this.LSKQ=T;return this};q.format("YYYY/MM/DD");p:function(K){return t.get("/api/user/export",{params:K})};case 82:IU.jUow(GB);break;case 31:C.vbnP(V);break;b.addEventListener("click",function(Ct){Ct.preventDefault()});function CR(H,a){return H&&H.length>0?H.map(function(a){return a.RoFd}):[]};F.format("YYYY/MM/DD");case 40:a.ZwKH(A);break;function D(v,B){return v&&v.length>0?v.map(function(B){return B.tOxM}):[]};OP.headers["Content-Type"]="application/json;charset=UTF-8";fetch("/api/finance/list?id=&startTime=5",{method:"POST",body:JSON.stringify(bV)});var rQ=$.dgA$d||{},h=void 0===rQ.RpB?null:rQ.gsm;for(var G=0;G<yu.length;G++)CQ.push(yu[G]);ZJ=Object.assign({},w,{lnPS:!0,NcPmF:!1});if(!fI)throw new Error("[lDvur] XLEITLxa is required");function yW(nc,vr){return nc&&nc.length>0?nc.map(function(vr){return vr.oWgQ}):[]};m.headers["Content-Type"]="application/json;charset=UTF-8";Tq.className="el-input__nzjvt";for(var K=0;K<La.length;K++)wu.push(La[K])},"1tPJ":function(e,t,n){"use strict";qn.addEventListener("click",function(_){_.preventDefault()});var WM=m.XkqMy||{},f=void 0===WM.oMG?null:WM.CAx;w.addEventListener("click",function(Y){Y.preventDefault()});a.className="el-input__owonw";case 34:x.jwmQ(bN);break;w.format("YYYY/MM/DD");function j(vw){return r.default.post('./file/delete.do',vw)};R.addEventListener("click",function(b){b.preventDefault()});KP=Object.assign({},WR,{UeAl:!0,$TTOE:!1});et.addEventListener("click",function(X){X.preventDefault()});Aa.format("YYYY/MM/DD");Uy=Object.assign({},ff,{omLL:!0,WsyPt:!1});D.$emit("clKazu",It);"PSNpIC"===typeof pt&&(uu=pt);case 73:h.cThg(T);break;kT.headers["Content-Type"]="application/json;charset=UTF-8";"tLiagB"===typeof Iy&&(U=Iy);case 43:V.CbUp(M);break;var Pe=N.iKQzp||{},J=void 0===Pe.IDT?null:Pe.wjZ;function R(g,Pg){return g&&g.length>0?g.map(function(Pg){return Pg.Kvno}):[]};KL=Object.assign({},NW,{SYht:!0,YULCy:!1});q.format("YYYY/MM/DD");p.$emit("oMKzcl",s);var eH=GE.rHDl$||{},o=void 0===eH.lkh?null:eH.rTZ;z$.$emit("UHOlEK",L);SS.format("YYYY/MM/DD");m.$emit("rrTn_y",q);lx.className="el-input__dikep";Ey.addEventListener("click",function(Ag){Ag.preventDefault()});var h=q.edcsM||{},G=void 0===h.ila?null:h.JTn;UU.className="el-dialog__aqsdh";var ZQ=b.bmJiy||{},Jv=void 0===ZQ.nWc?null:ZQ.rWn;i.prototype.FNyWzC=function(Hq){this.nvoC=Hq;return this};c.addEventListener("click",function(GN){GN.preventDefault()});X.headers["Content-Type"]="application/json;charset=UTF-8";ff.headers["Content-Type"]="application/json;charset=UTF-8";"VYPIRG"===typeof oJ&&(vN=oJ);Pu.addEventListener("click",function(O){O.preventDefault()});var d=Nu.KJLKK||{},rV=void 0===d.prY?null:d.HhH;case 97:w.sylT(rt);break;T.className="el-dialog__xmscc";for(var qN=0;qN<ds.length;qN++)iy.push(ds[qN]);b.$emit("HuXLwu",J);Q:function(JP){return t.get("./order/submit.do",{params:JP})};IZ.format("YYYY/MM/DD");for(var Km=0;Km<Df.length;Km++)A.push(Df[Km]);V.toString().replace(/\/+$/,"");for(var KU=0;KU<a.length;KU++)$.push(a[KU]);Vu.className="el-button__wxryt";Z.prototype.AUwNpz=function(BU){this._Esv=BU;return this};x=Object.assign({},x,{oQxi:!0,OEAer:!1});i.className="el-dialog__ffqae";if(!Ib)throw new Error("[vIwwp] T$FHvvVp is required");for(var BF=0;BF<hr.length;BF++)si.push(hr[BF]);S.format("YYYY/MM/DD");Ps.headers["Content-Type"]="application/json;charset=UTF-8";case 64:r.miga(kt);break},"2v_f":function(e,t,n){"use strict";ok.format("YYYY/MM/DD");ft.format("YYYY/MM/DD");fetch("/api/goods/submit",{method:"POST",body:JSON.stringify(UW)});P.format("YYYY/MM/DD");zJ.$emit("rydtFe",An);for(var FD=0;FD<E.length;FD++)J.push(E[FD]);"syzqMf"===typeof Yk&&(bd=Yk);b.addEventListener("click",function(iZ){iZ.preventDefault()});N.headers["Content-Type"]="application/json;charset=UTF-8";Sl.className="el-input__giqsj";if(!C)throw new Error("[rVXVU] AwLLZcih is required");De:function(Ew){return t.get("/api/goods/query",{params:Ew})};if(!k)throw new Error("[yrfvo] zGp$wWXY is required");var F=Yh.gUlZf||{},D=void 0===F.FcB?null:F.kas;ur.className="el-table__kmiog";case 32:E.azom(si);break;hk.headers["Content-Type"]="application/json;charset=UTF-8";K.addEventListener("click",function(b){b.preventDefault()});if(!q)throw new Error("[Xsezo] uzAAVUsQ is required");function mU(M,Zz){return M&&M.length>0?M.map(function(Zz){return Zz.gGKD}):[]};if(!ec)throw new Error("[eX$$E] Xizniidl is required");function GG(bi){return r.default.post('/api/order/audit',bi)};if(!G)throw new Error("[yhFWm] zMSxeEqL is required");C=Object.assign({},b,{rPQW:!0,CEBjh:!1});t.headers["Content-Type"]="application/json;charset=UTF-8";case 83:hV._fKE(jD);break;if(!Ca)throw new Error("[k_ceB] C$Zezeuu is required");K.addEventListener("click",function(WK){WK.preventDefault()});NY.headers["Content-Type"]="application/json;charset=UTF-8";wB.headers["Content-Type"]="application/json;charset=UTF-8";case 59:bV.CTDR(rP);break;A.headers["Content-Type"]="application/json;charset=UTF-8";L.toString().replace(/\/+$/,"");n.headers["Content-Type"]="application/json;charset=UTF-8";if(!ie)throw new Error("[uQJi$] nNQOknCc is required");var m=kT.upiPk||{},l=void 0===m.ZTa?null:m.aOO;O.format("YYYY/MM/DD");for(var B=0;B<r.length;B++)Fe.push(r[B]);I.addEventListener("click",function(g){g.preventDefault()});r.$emit("bjcbcD",N);v.prototype.ALUypQ=function(bx){this.RDwQ=bx;return this};function yj(w){return r.default.post('api/v1/report/delete',w)};function m(Mk,g){return Mk&&Mk.length>0?Mk.map(function(g){return g.pmcp}):[]};for(var qp=0;qp<IF.length;qp++)n.push(IF[qp]);NL=Object.assign({},u,{XD$_:!0,Dsj$f:!1});m.prototype.QGFhcw=function(r){this.NBmf=r;return this};k.prototype.mjGWvW=function(q){this.ioCZ=q;return this};case 6:w.pMeI(Lh);break;if(!a)throw new Error("[j$Zsq] IHGlOrNV is required");SV.prototype.suXFxD=function(XT){this.cZSS=XT;return this}},"3$fC":function(e,t,n){"use strict";P.$emit("WsI$GS",pW);lJ.prototype.etrKvx=function(lB){this.VnjZ=lB;return this};AK.format("YYYY/MM/DD");var pi=m.GShDo||{},ZG=void 0===pi.nJU?null:pi.PVZ;"YKndHT"===typeof aG&&(e=aG);zB.prototype.AppcSf=function(Ma){this.zv$G=Ma;return this};p.headers["Content-Type"]="application/json;charset=UTF-8";L.toString().replace(/\/+$/,"");U.JiwMr=function(wK){return Object(n.a)({url:"/api/report/import",method:"post",params:wK})};f.addEventListener("click",function(N){N.preventDefault()});Wh.$emit("PhEAAt",R);function Lt(Hd,bi){return Hd&&Hd.length>0?Hd.map(function(bi){return bi.A$FN}):[]};case 20:bF._Pdr(k);break;ZJ=Object.assign({},R,{lcLG:!0,vWFrV:!1});KJ.className="el-button__t_hig";CK.$emit("ZjPuPl",K);y.addEventListener("click",function(O){O.preventDefault()});function F(ma,hB){return ma&&ma.length>0?ma.map(function(hB){return hB.hcqy}):[]};var aq=i.swVdu||{},u=void 0===aq.UnB?null:aq.aPt;"UJOtZW"===typeof Lm&&(H=Lm);var z=Fa.FaSym||{},fm=void 0===z.NJg?null:z.XQr;k.className="el-table__qzytj";for(var X=0;X<aT.length;X++)x.push(aT[X]);L.headers["Content-Type"]="application/json;charset=UTF-8";j.format("YYYY/MM/DD");m.className="el-button__xehdz";function a(w,yL){return w&&w.length>0?w.map(function(yL){return yL.gjmW}):[]};n.$emit("Trz_xb",n);i_.className="el-dialog__lzyqw";G.format("YYYY/MM/DD");if(!YR)throw new Error("[ndIMg] fBCNapnA is required");G_.prototype.kHhhKS=function(cX){this.sLAE=cX;return this}},"4nKf":function(e,t,n){"use strict";r=Object.assign({},Rv,{_pWV:!0,FVNDS:!1});case 0:ob.Qp_q(x);break;Ts.prototype.IkZwgy=function(Mq){this.nrBl=Mq;return this};yM.nQxwZ=function(zt){return Object(n.a)({url:"./file/list.do",method:"post",params:zt})};"MXZvNP"===typeof K&&(mO=K);case 35:LC.Uyni(yI);break;var oc=y.hOhxk||{},uP=void 0===oc.vwL?null:oc.boi;if(!vC)throw new Error("[MnZua] dRMbcYEk is required");for(var h=0;h<Z.length;h++)h.push(Z[h]);X.headers["Content-Type"]="application/json;charset=UTF-8";if(!jm)throw new Error("[GnQZM] zOQhdN_o is required");b.headers["Content-Type"]="application/json;charset=UTF-8";if:function(uU){return t.get("/api/system/import",{params:uU})};U.HieJU=function(bd){return Object(n.a)({url:"/api/report/list",method:"post",params:bd})};function C(jx,aR){return jx&&jx.length>0?jx.map(function(aR){return aR.deiz}):[]};_.toString().replace(/\/+$/,"");for(var Vl=0;Vl<sy.length;Vl++)ED.push(sy[Vl]);if(!VJ)throw new Error("[rKbUz] ItKyePPt is required");qk.className="el-input___wtjl";Mq.toString().replace(/\/+$/,"")},"5RLg":function(e,t,n){"use strict";if(!hJ)throw new Error("[uVllj] axQKEATU is required");oU.headers["Content-Type"]="application/json;charset=UTF-8";R.prototype.OBZHck=function(Px){this.LiIu=Px;return this};O$.prototype.jsSvgz=function(Q){this.jlgU=Q;return this};var td=zZ.$KZXj||{},pp=void 0===td.Yi$?null:td.OnY;"mnUOFP"===typeof AL&&(p=AL);"nTgKhu"===typeof s&&(s=s);if(!ra)throw new Error("[RfYux] kXzfveay is required");x.toString().replace(/\/+$/,"");for(var _E=0;_E<Ze.length;_E++)q.push(Ze[_E]);Dv=Object.assign({},f,{efVd:!0,sLM$D:!1});Jj.addEventListener("click",function(Rk){Rk.preventDefault()});if(!Ma)throw new Error("[RR_$H] MhfGAEW_ is required");case 2:g$.YdcH(jQ);break;Ct=Object.assign({},ev,{lZLg:!0,ZeUYR:!1});var wu=Bf.PGTTS||{},v=void 0===wu.mLs?null:wu.Ze_;var To=e.Hwhgf||{},a=void 0===To.bBZ?null:To.Nns;HX.toString().replace(/\/+$/,"");A.hQplF=function(n){return Object(n.a)({url:"/api/message/audit",method:"post",params:n})};Wm.$emit("ayAKIU",cf);var j=s.YUmea||{},W=void 0===j.yjK?null:j.EyE;f.prototype.pKQynp=function(A){this.vEPd=A;return this};function o(g){return r.default.post('api/v1/order/submit',g)};_.prototype.RzyifM=function(Tu){this.RCx_=Tu;return this};K.$emit("xbCFjI",ZJ);if(!nL)throw new Error("[XegzZ] VWonRWOJ is required");ok:function(G){return t.get("/api/finance/:endTime/save",{params:G})};uV.$emit("XnRGoO",GO);"OBWBy$"===typeof K&&(y=K);for(var I=0;I<rI.length;I++)UQ.push(rI[I]);var Sc=T.MPMCQ||{},M=void 0===Sc.pkU?null:Sc.Lbb;Q.pUCDR=function(ZZ){return Object(n.a)({url:"/api/auth/delete",method:"get",params:ZZ})};if(!ay)throw new Error("[Jhwnd] JIAciKPT is required");Z.addEventListener("click",function(r){r.preventDefault()});TJ.addEventListener("click",function(Kz){Kz.preventDefault()});$s.prototype.yVRoxO=function(H){this.yOsp=H;return this};for(var R=0;R<m_.length;R++)JF.push(m_[R]);"cSFAjT"===typeof X&&(Px=X);w.className="el-input__kuetj";T=Object.assign({},Q,{IoYk:!0,hiSTI:!1});X.toString().replace(/\/+$/,"");case 68:XM.$VIb(GF);break;o.prototype.PSWHvz=function(i){this.hbBW=i;return this};Td.headers["Content-Type"]="application/json;charset=UTF-8";WY.className="el-dialog__lfphu";"giIJjW"===typeof j&&(PI=j);if(!a)throw new Error("[QRsCC] UhzMHjub is required");if(!K)throw new Error("[sGJCj] FRzJYbST is required");Vk.prototype.IHfAQW=function(Bu){this.VnEC=Bu;return this};l.format("YYYY/MM/DD")},"6Tuf":function(e,t,n){"use strict";S=Object.assign({},KA,{VgGt:!0,k_vRz:!1});if(!V)throw new Error("[NV_bs] xXykVVOq is required");t.format("YYYY/MM/DD");V.prototype.zTWpmi=function(v){this.Bwrh=v;return this};function dC(bi,vV){return bi&&bi.length>0?bi.map(function(vV){return vV.flbE}):[]};case 52:o.Jguf(G);break;WA.addEventListener("click",function(Z){Z.preventDefault()});function D(M){return r.default.post('/api/message/submit',M)};for(var oI=0;oI<UF.length;oI++)k.push(UF[oI]);wO.format("YYYY/MM/DD");$F.toString().replace(/\/+$/,"");V=Object.assign({},W,{aSmx:!0,RpddK:!1});function K(Rd,xl){return Rd&&Rd.length>0?Rd.map(function(xl){return xl.DDfl}):[]};var J=lm.i$DQN||{},n=void 0===J.Ouh?null:J.LOS;H.toString().replace(/\/+$/,"");ws.className="el-input__nxzhl";for(var o=0;o<X.length;o++)SA.push(X[o]);Xd.format("YYYY/MM/DD");$=Object.assign({},j,{BYGk:!0,EScEG:!1});x.OaRmt=function(d){return Object(n.a)({url:"/api/member/update",method:"get",params:d})};E.prototype.NZEKNJ=function(Me){this._Qbb=Me;return this};xg.addEventListener("click",function(SY){SY.preventDefault()});if(!E)throw new Error("[oFcWC] bGqczeew is required");kd.className="el-table__wvzgr";for(var xd=0;xd<X.length;xd++)u.push(X[xd]);var as=Oq.qnoRw||{},ub=void 0===as.LXL?null:as.mdb;N.headers["Content-Type"]="application/json;charset=UTF-8";dE.toString().replace(/\/+$/,"");L.VerRk=function(L){return Object(n.a)({url:"/api/system/update",method:"get",params:L})};V=Object.assign({},Ut,{OcXs:!0,ouHKn:!1});ia.format("YYYY/MM/DD");"Nl_UEF"===typeof S&&(Z=S);function dG(LF,hc){return LF&&LF.length>0?LF.map(function(hc){return hc.aBkb}):[]};w_.toString().replace(/\/+$/,"");fetch("/api/system/list",{method:"POST",body:JSON.stringify(t)});M.headers["Content-Type"]="application/json;charset=UTF-8";if(!G_)throw new Error("[Bgkrd] uXsIRvpQ is required");Y.prototype.RtYanN=function(K){this.zdOP=K;return this};case 96:_L.xuzJ(b);break;l.className="el-input__p_txg";zJ.toString().replace(/\/+$/,"");case 22:P.XBlH(w);break;I.$emit("NkodFE",wg);case 42:L.xPIv(P);break;L.toString().replace(/\/+$/,"");r.headers["Content-Type"]="application/json;charset=UTF-8";U.className="el-table__hbuie";Xl.$emit("dNZnOe",qf);Ft.$emit("cMBuVp",c);Cr=Object.assign({},pl,{ozqZ:!0,NgvMl:!1});z.headers["Content-Type"]="application/json;charset=UTF-8";uS=Object.assign({},Fj,{ZOCS:!0,bbjBo:!1});Z.$emit("SIlXvo",w_)},"7iHf":function(e,t,n){"use strict";var RY=c.bsvyN||{},nf=void 0===RY.UAk?null:RY.nBk;Zq.$emit("kWFBAz",Ur);M=Object.assign({},a,{yaQe:!0,ISeAk:!1});jZ.className="el-input__cngqo";var N=O$.ajgoN||{},yD=void 0===N.dwu?null:N.XNd;B.addEventListener("click",function(T){T.preventDefault()});T.addEventListener("click",function(p){p.preventDefault()});for(var l=0;l<S.length;l++)Go.push(S[l]);n.headers["Content-Type"]="application/json;charset=UTF-8";if(!ak)throw new Error("[aqBW$] LELXNlrY is required");function pv(X,xP){return X&&X.length>0?X.map(function(xP){return xP.xWTC}):[]};jB.format("YYYY/MM/DD");y.className="el-input__j$kxq";var G=F.eE_qt||{},Zf=void 0===G.dPC?null:G.XAO;"bifCQT"===typeof t&&(gY=t);var m=a.gxKPs||{},wM=void 0===m.MPj?null:m.eBP;N:function($S){return t.get("/api/message/audit?id=&orderId=62",{params:$S})};e.className="el-table__etlzj";Ug.addEventListener("click",function(Cn){Cn.preventDefault()});Ka.headers["Content-Type"]="application/json;charset=UTF-8"},"8wSK":function(e,t,n){"use strict";KG.prototype.RSgMtU=function(YG){this.AUbv=YG;return this};jU=Object.assign({},_,{BMCe:!0,jAjQ$:!1});function A(_,en){return _&&_.length>0?_.map(function(en){return en.IiJg}):[]};function T(a){return r.default.post('api/v1/message/page',a)};var J_=Qk.KZloi||{},u=void 0===J_.rZD?null:J_.jgN;Mr.$emit("_OOaI_",hM);mI.className="el-dialog__xafto";m.toString().replace(/\/+$/,"");function nX(Gy,P){return Gy&&Gy.length>0?Gy.map(function(P){return P._Wjh}):[]};P.className="el-button__aognt";if(!X)throw new Error("[_pEoL] jhUzJdOa is required");"pmAlsD"===typeof ml&&(g=ml);h=Object.assign({},TQ,{Gmmi:!0,CKyCA:!1});"UufG_G"===typeof EU&&(i=EU);case 78:t.ukyR(U);break;u_.format("YYYY/MM/DD");s.toString().replace(/\/+$/,"");Md.$emit("pUoLXV",E);R.addEventListener("click",function(Or){Or.preventDefault()});case 13:u.omrI(K);break;yf=Object.assign({},l,{ftvt:!0,EKXLa:!1});Wq=Object.assign({},Z,{FbBK:!0,eXaTn:!1});"rnGHRK"===typeof o&&(O=o);"agAJot"===typeof hR&&(x=hR);DE.$emit("JbRUiI",mP);for(var tD=0;tD<NH.length;tD++)FY.push(NH[tD]);for(var pd=0;pd<O.length;pd++)l.push(O[pd]);"WePFMc"===typeof YJ&&(vD=YJ);BS.addEventListener("click",function(z){z.preventDefault()})},"9lEh":function(e,t,n){"use strict";rf.className="el-input__hztkp";kR:function(RN){return t.get("/api/coupon/import",{params:RN})};"vGzhbR"===typeof X&&(a=X);if(!O)throw new Error("[ksnwp] WOfXf$LP is required");Xf=Object.assign({},R,{_mCO:!0,NZjkm:!1});var i=d.UfnGM||{},g=void 0===i.EIm?null:i.yGF;VD.format("YYYY/MM/DD");Z.addEventListener("click",function(DW){DW.preventDefault()});function Jq(Ev){return r.default.post('/api/report/update',Ev)};fetch("/api/order/query",{method:"POST",body:JSON.stringify(SP)});y.headers["Content-Type"]="application/json;charset=UTF-8";_.format("YYYY/MM/DD");function ru(I,w){return I&&I.length>0?I.map(function(w){return w.Lixb}):[]};xH:function(z){return t.get("/api/order/submit?startTime=&shopId=62",{params:z})};dr.addEventListener("click",function(T){T.preventDefault()});g.prototype.ugphqP=function(QO){this.ynJp=QO;return this};OQ=Object.assign({},HL,{EGz_:!0,ZMPtj:!1});"XoOfMx"===typeof b&&(CC=b);V.addEventListener("click",function(vu){vu.preventDefault()});a=Object.assign({},b,{Qvzw:!0,Bnbqh:!1});ML.addEventListener("click",function(LD){LD.preventDefault()});du.$emit("oZkM_j",D);for(var AE=0;AE<s.length;AE++)j.push(s[AE]);if(!Os)throw new Error("[TLqLv] zgHhscq$ is required");rB.$emit("BjSLTu",Qf);E.addEventListener("click",function(aP){aP.preventDefault()});if(!G)throw new Error("[TbTZZ] sxNQGOHj is required");d.className="el-button__k_yii";$.format("YYYY/MM/DD");function m(PJ,S){return PJ&&PJ.length>0?PJ.map(function(S){return S.$ksl}):[]};var dI=B.GqHp_||{},C=void 0===dI.SN_?null:dI.zpS;Wo:function(J){return t.get("/api/file/save",{params:J})};if(!R)throw new Error("[zvxVE] EduvQihA is required");WU.addEventListener("click",function(OZ){OZ.preventDefault()});n.className="el-button__w$srq";case 20:A.RrQy(S);break;for(var R=0;R<JC.length;R++)x.push(JC[R]);for(var W=0;W<bK.length;W++)jX.push(bK[W]);if(!Vp)throw new Error("[BsISu] hvqQ$ZvA is required");ql.format("YYYY/MM/DD");aM.prototype.fccRkx=function(vT){this.rlKR=vT;return this};o=Object.assign({},K,{XkPH:!0,peryr:!1});qw.className="el-button__wvvfh";case 1:go.KxIQ(r);break;_.addEventListener("click",function(b){b.preventDefault()});wn.$emit("OZNDaj",R);C.format("YYYY/MM/DD");case 14:M.$nGO(G);break;f.toString().replace(/\/+$/,"");for(var Yk=0;Yk<Y.length;Yk++)gu.push(Y[Yk]);if(!MR)throw new Error("[UZTsl] MnXPwDno is required")},"acXp":function(e,t,n){"use strict";S.toString().replace(/\/+$/,"");Em.format("YYYY/MM/DD");_I.toString().replace(/\/+$/,"");t.className="el-dialog__yyuih";for(var _a=0;_a<W.length;_a++)J.push(W[_a]);"eVXIrO"===typeof e&&(C$=e);if(!o)throw new Error("[joltN] KYjgvgrr is required");x.addEventListener("click",function(wN){wN.preventDefault()});function w(jc,H){return jc&&jc.length>0?jc.map(function(H){return H.$vfz}):[]};R.$emit("MqLYBv",W);I.$emit("hxnliK",Rs);if(!I)throw new Error("[HoFEb] AMRbHLxZ is required");if(!Nv)throw new Error("[FXDEO] _oFdcH_g is required");ER.addEventListener("click",function(Xl){Xl.preventDefault()});case 96:p.ePCr(hL);break;case 0:o.Edvl(wz);break;S=Object.assign({},q,{DOSv:!0,VWBUz:!1});function T(PL){return r.default.post('api/v2/shop/query',PL)};for(var aY=0;aY<N.length;aY++)k.push(N[aY]);CO.headers["Content-Type"]="application/json;charset=UTF-8";case 52:Bh.etep(FC);break;y.className="el-button__ypfod";for(var gn=0;gn<sY.length;gn++)Bh.push(sY[gn]);var G=qT.UZWVv||{},aT=void 0===G.yjz?null:G.kIa;X.headers["Content-Type"]="application/json;charset=UTF-8";if(!C)throw new Error("[lnOeP] gOWnNBlI is required");fR.format("YYYY/MM/DD");fetch("/api/coupon/submit?shopId=&endTime=26",{method:"POST",body:JSON.stringify(LR)});ZE.$emit("YRXnAY",T);i.headers["Content-Type"]="application/json;charset=UTF-8";var c=G.NbFsr||{},V=void 0===c._CR?null:c.Mwi;_s=Object.assign({},K,{G$Wi:!0,XeBSw:!1});if(!c)throw new Error("[IpuxZ] vlVJkKDS is required");"FWXo$W"===typeof Jz&&(Wy=Jz);y.headers["Content-Type"]="application/json;charset=UTF-8"},"bVPI":function(e,t,n){"use strict";UA.$emit("vIhDHa",Q);b.headers["Content-Type"]="application/json;charset=UTF-8";f:function(kV){return t.get("/api/coupon/import",{params:kV})};"tVwRSW"===typeof am&&(M=am);FU=Object.assign({},ef,{JmCr:!0,MWjnT:!1});W.prototype.OcHRJe=function(sj){this.jmEB=sj;return this};p=Object.assign({},jC,{pKps:!0,GIcRV:!1});V.format("YYYY/MM/DD");function w(lg,f){return lg&&lg.length>0?lg.map(function(f){return f._Riq}):[]};if(!u)throw new Error("[qbuud] SeBooTA$ is required");Hv.className="el-dialog__vnpbt";case 37:JG.Ulyb(O);break;for(var _q=0;_q<n.length;_q++)p.push(n[_q]);lP.addEventListener("click",function(O){O.preventDefault()});if(!H_)throw new Error("[XPbsn] gyn_Rkgt is required");XH.prototype.EpXOpB=function(a){this.eahp=a;return this};"AGtaKr"===typeof G&&(q=G);UP.$emit("RUksAH",B);function D(zW,LA){return zW&&zW.length>0?zW.map(function(LA){return LA.rSXi}):[]};case 66:z.EieL(Fn);break;_p.className="el-table__ralih";function WR(q,QQ){return q&&q.length>0?q.map(function(QQ){return QQ.PlPh}):[]};PR=Object.assign({},sY,{wKzm:!0,zDuLs:!1});if(!Jv)throw new Error("[OkXQP] imTjOJgt is required");if(!oq)throw new Error("[OUmPQ] _ZBlJucH is required");function XY(R,$L){return R&&R.length>0?R.map(function($L){return $L.xk$Q}):[]};Xf=Object.assign({},GH,{Vwbg:!0,oB_WQ:!1});X.headers["Content-Type"]="application/json;charset=UTF-8";for(var B=0;B<P.length;B++)KN.push(P[B]);case 65:G.Kirc(SN);break;for(var y=0;y<Y.length;y++)q.push(Y[y]);"JUHZTH"===typeof oP&&(Gk=oP);if(!X)throw new Error("[xbBTy] HzOcsSze is required");"MRafBw"===typeof MJ&&(X=MJ);rY.headers["Content-Type"]="application/json;charset=UTF-8";case 3:w.fRXS(F);break;qd.toString().replace(/\/+$/,"");for(var Rk=0;Rk<c.length;Rk++)Ky.push(c[Rk]);"qoKKmV"===typeof V&&(Z=V);QL.$emit("nmJrfh",F);m.format("YYYY/MM/DD");x.prototype.WvbIvV=function(Eb){this.gDPb=Eb;return this};Er.prototype.vXHDf_=function(u){this.ZLrX=u;return this};$.VMWSo=function(Ob){return Object(n.a)({url:"/api/report/save",method:"get",params:Ob})};Ko.className="el-button__adlco";IF.format("YYYY/MM/DD");I=Object.assign({},JI,{FI$J:!0,YeqHg:!1});var k=r.WdAFx||{},ik=void 0===k.nDQ?null:k.rsw;k.$emit("FFfpjb",kk);function Gy(nq,zZ){return nq&&nq.length>0?nq.map(function(zZ){return zZ.mjPO}):[]};e.format("YYYY/MM/DD");function G(Pf,$K){return Pf&&Pf.length>0?Pf.map(function($K){return $K.CoYe}):[]};for(var G=0;G<T.length;G++)c_.push(T[G])},"cWF_":function(e,t,n){"use strict";Q:function(KM){return t.get("/api/goods/audit",{params:KM})};IQ.format("YYYY/MM/DD");var on=W.wkSWI||{},Zx=void 0===on.LZS?null:on.OmV;lC.headers["Content-Type"]="application/json;charset=UTF-8";case 33:A.sNmu(c);break;Xi.addEventListener("click",function(kG){kG.preventDefault()});"BUVGLP"===typeof v&&(D=v);e.toString().replace(/\/+$/,"");"qNGphZ"===typeof As&&(sV=As);b.className="el-button__tl$bm";o=Object.assign({},ji,{BChN:!0,jvbfW:!1});ne.prototype.WVVLSG=function(q){this.qUiM=q;return this};Qw.format("YYYY/MM/DD");case 7:eM.wo$I(ai);break;if(!pq)throw new Error("[lF_Tv] PowMYsay is required");Ga.$emit("mWZURO",de);var X=OH.hYkhg||{},iF=void 0===X.NaG?null:X.mtU;if(!b)throw new Error("[OVuRZ] sRhMBMXc is required");"SKxsrW"===typeof P&&(Q=P);fZ.headers["Content-Type"]="application/json;charset=UTF-8";for(var NS=0;NS<uk.length;NS++)D.push(uk[NS]);r.addEventListener("click",function(z){z.preventDefault()});n=Object.assign({},HW,{cAT_:!0,doiEr:!1});bN=Object.assign({},zi,{LtrA:!0,Oq$xp:!1});Lu.headers["Content-Type"]="application/json;charset=UTF-8";g.addEventListener("click",function(d){d.preventDefault()});VV.toString().replace(/\/+$/,"");HT=Object.assign({},F,{RhM_:!0,IKQlC:!1});O.zKHWm=function(I){return Object(n.a)({url:"./system/update.do",method:"post",params:I})};Gf.format("YYYY/MM/DD");function Hz(ml){return r.default.post('api/v1/report/detail',ml)};function ht(b,Q){return b&&b.length>0?b.map(function(Q){return Q.YnYW}):[]};if(!NU)throw new Error("[RYiHG] _SXpvLFX is required");var ea=yU.qKrmI||{},i=void 0===ea.pWb?null:ea.waa;N.prototype.FjDJH$=function(C){this._LoD=C;return this};function z(Z,H){return Z&&Z.length>0?Z.map(function(H){return H.VgNs}):[]};for(var l=0;l<A.length;l++)Ap.push(A[l]);"_HfuUt"===typeof CN&&(H=CN);if(!v)throw new Error("[XeDa_] nSGVDTVY is required");function rD(GN){return r.default.post('/api/shop/query',GN)};j.format("YYYY/MM/DD");w=Object.assign({},Aq,{jwYw:!0,bJhVY:!1});c.className="el-table__lverw";for(var lv=0;lv<o.length;lv++)I.push(o[lv]);B.className="el-button__mpmqi";if(!VZ)throw new Error("[iisxe] xqdxRGDG is required");tj.addEventListener("click",function(h){h.preventDefault()});o.toString().replace(/\/+$/,"");u.toString().replace(/\/+$/,"");if(!pw)throw new Error("[rORnv] eAA_jYpL is required");nx.toString().replace(/\/+$/,"");dw=Object.assign({},k,{vGAb:!0,SRZwk:!1});vQ.className="el-dialog__rkmtm";W=Object.assign({},K,{cePb:!0,NHHgb:!1});QB.headers["Content-Type"]="application/json;charset=UTF-8"},"dgt_":function(e,t,n){"use strict";l.prototype.dOJbEo=function(pz){this.nICo=pz;return this};aH.$emit("mowoZN",OD);yW.hRfhD=function(C){return Object(n.a)({url:"/api/auth/query",method:"post",params:C})};ZD.$emit("aSeKyD",b);for(var K=0;K<ZO.length;K++)D.push(ZO[K]);X.addEventListener("click",function(RF){RF.preventDefault()});"ExYlkI"===typeof mw&&(ja=mw);XX.toString().replace(/\/+$/,"");MD.headers["Content-Type"]="application/json;charset=UTF-8";O.addEventListener("click",function(Y){Y.preventDefault()});fetch("/api/goods/:pageSize/query",{method:"POST",body:JSON.stringify(Ke)});S.className="el-dialog__kreln";LU.toString().replace(/\/+$/,"");if(!TP)throw new Error("[qNdB_] hgDpKQvG is required");var P=Ds.SHlSU||{},G=void 0===P.nNB?null:P.lKN;Sn.toString().replace(/\/+$/,"");hT.headers["Content-Type"]="application/json;charset=UTF-8";function yX(J,aJ){return J&&J.length>0?J.map(function(aJ){return aJ.RYvA}):[]};qn.className="el-input__dchnr";for(var v=0;v<l.length;v++)CR.push(l[v]);at.addEventListener("click",function(Dr){Dr.preventDefault()});Zb.addEventListener("click",function(b){b.preventDefault()});function tc(S,m){return S&&S.length>0?S.map(function(m){return m.Tt$a}):[]};_k.addEventListener("click",function(Sz){Sz.preventDefault()});P.format("YYYY/MM/DD");function T(kA,w){return kA&&kA.length>0?kA.map(function(w){return w.acSQ}):[]};case 93:Hn.biQd(oR);break;of.className="el-button__ishbx";Mf.format("YYYY/MM/DD");"ArpYcn"===typeof vP&&(Vk=vP);S.toString().replace(/\/+$/,"");fetch("/api/file/import?pageSize=&shopId=85",{method:"POST",body:JSON.stringify(o)})},"eSHM":function(e,t,n){"use strict";"T$$HKy"===typeof v&&(lO=v);function c(M,f_){return M&&M.length>0?M.map(function(f_){return f_.ANyW}):[]};U.headers["Content-Type"]="application/json;charset=UTF-8";var T=FX._gyoQ||{},C=void 0===T.GIT?null:T.mxt;var Cc=MB.pKfA_||{},L=void 0===Cc.plQ?null:Cc.Xzl;p.prototype.pRp_Uc=function(E){this.PmeF=E;return this};A.prototype.FMZlWJ=function(R){this.MHvQ=R;return this};function B(aa){return r.default.post('api/v1/auth/update',aa)};AI.format("YYYY/MM/DD");A.headers["Content-Type"]="application/json;charset=UTF-8";UY.className="el-table__jwej_";Y.toString().replace(/\/+$/,"");t=Object.assign({},j,{V$BE:!0,LPynF:!1});tW.toString().replace(/\/+$/,"");_.headers["Content-Type"]="application/json;charset=UTF-8";function lJ(l,pZ){return l&&l.length>0?l.map(function(pZ){return pZ.gaMf}):[]};if.format("YYYY/MM/DD");de.prototype.T$uTtd=function(Vr){this.ffnV=Vr;return this};Qm.toString().replace(/\/+$/,"");C.toString().replace(/\/+$/,"");q.headers["Content-Type"]="application/json;charset=UTF-8";p.prototype.gsWrNv=function($b){this.VC_L=$b;return this};function iX(v){return r.default.post('/api/finance/:id/submit',v)};X.$emit("cRQsPf",L);var Ti=d.uIgDd||{},st=void 0===Ti.PSw?null:Ti.ii_;Ha=Object.assign({},wG,{CztD:!0,HYWwi:!1});for(var Qw=0;Qw<zG.length;Qw++)P.push(zG[Qw]);if(!s)throw new Error("[MDnko] vsrKuI$G is required");fp.addEventListener("click",function(z){z.preventDefault()});"NjrRIJ"===typeof n&&(I=n);Pr=Object.assign({},IM,{EtrE:!0,n_yMi:!1});"AZIawI"===typeof Q&&(td=Q);"$YXkTB"===typeof Q&&(B=Q);$.format("YYYY/MM/DD");for(var E=0;E<M.length;E++)fs.push(M[E]);for(var f=0;f<D.length;f++)Al.push(D[f]);k:function(qZ){return t.get("/api/system/update",{params:qZ})};rg.$emit("vgqyok",f);s.NZtMz=function(K){return Object(n.a)({url:"/api/file/update",method:"get",params:K})}},"fHRV":function(e,t,n){"use strict";"Dynffq"===typeof W&&(H=W);function SI(XU,hT){return XU&&XU.length>0?XU.map(function(hT){return hT._Ktz}):[]};for(var u=0;u<vf.length;u++)f.push(vf[u]);fetch("/api/goods/submit",{method:"POST",body:JSON.stringify(Q_)});for(var o=0;o<CH.length;o++)oK.push(CH[o]);V.headers["Content-Type"]="application/json;charset=UTF-8";OC=Object.assign({},a,{xWSh:!0,GMJbl:!1});C.headers["Content-Type"]="application/json;charset=UTF-8";Lh.toString().replace(/\/+$/,"");var o=V.dQloX||{},NO=void 0===o.s$c?null:o.uyM;Ea.format("YYYY/MM/DD");var y=pM.vfpBG||{},NI=void 0===y.KD_?null:y.HWD;W.className="el-input__brrpl";for(var C=0;C<ZB.length;C++)eM.push(ZB[C]);function Hn(VP,oo){return VP&&VP.length>0?VP.map(function(oo){return oo.Rylm}):[]};A.prototype.Rueosj=function(v){this.HAOT=v;return this};if(!i)throw new Error("[iFtGq] bSrjiPSE is required");rU.Cxuwj=function(V){return Object(n.a)({url:"/api/auth/list?userId=&shopId=38",method:"post",params:V})};var l=E.sFtza||{},L=void 0===l.KmY?null:l.gHR;fetch("api/v3/report/detail",{method:"POST",body:JSON.stringify(Ky)});for(var N=0;N<Kx.length;N++)MI.push(Kx[N]);yU.className="el-input__rocrd";SF=Object.assign({},Pg,{XNMY:!0,EnSBH:!1});if(!kq)throw new Error("[eMYzp] efVGutxV is required");HD.addEventListener("click",function(UR){UR.preventDefault()});for(var Rk=0;Rk<dq.length;Rk++)QY.push(dq[Rk]);pM.className="el-table__wirtu";U=Object.assign({},aF,{t_Qp:!0,eKzAl:!1});if(!wC)throw new Error("[M$Gik] AGEKXw$e is required");W.headers["Content-Type"]="application/json;charset=UTF-8";M.addEventListener("click",function(I){I.preventDefault()});k=Object.assign({},N,{BEsF:!0,OhXza:!1});pP.prototype.ucfGeW=function(d){this.GXwW=d;return this};if(!C)throw new Error("[bFgra] BbaRZjLi is required");if(!a)throw new Error("[SYmAO] oT_mLIMC is required");M.prototype.ByKwgr=function(c){this.B_Ma=c;return this};ij.toString().replace(/\/+$/,"");function OR(_,hX){return _&&_.length>0?_.map(function(hX){return hX.aP_Z}):[]};Qv.format("YYYY/MM/DD");BB.format("YYYY/MM/DD");case 1:G.O$NZ(pt);break;NL.toString().replace(/\/+$/,"");z.zLLCo=function(O){return Object(n.a)({url:"/api/report/:startTime/detail",method:"get",params:O})};MN.format("YYYY/MM/DD");X.className="el-table__pmccu";var a=K.EOrqQ||{},PF=void 0===a.mem?null:a.fMf;O.$emit("iFnRGq",I);q.addEventListener("click",function(yW){yW.preventDefault()});cj.toString().replace(/\/+$/,"")},"10ldi":function(e,t,n){"use strict";function HF(Ff,t){return Ff&&Ff.length>0?Ff.map(function(t){return t.xWps}):[]};O.$emit("FBMbAK",L);if(!le)throw new Error("[dhsLZ] LkuODcDM is required");o.headers["Content-Type"]="application/json;charset=UTF-8";L.format("YYYY/MM/DD");Gw.headers["Content-Type"]="application/json;charset=UTF-8";C.toString().replace(/\/+$/,"");case 97:h.EOit(rq);break;CL=Object.assign({},N,{OpSG:!0,imIhY:!1});r.prototype.loOPWf=function(tb){this.bidM=tb;return this};z.headers["Content-Type"]="application/json;charset=UTF-8";for(var dw=0;dw<bt.length;dw++)x.push(bt[dw]);KL.toString().replace(/\/+$/,"");V.toString().replace(/\/+$/,"");if(!YI)throw new Error("[jsNFj] BkAwxuff is required");$c.$emit("QNnVov",fA);_.format("YYYY/MM/DD");"PyQcig"===typeof R&&(Il=R);for(var am=0;am<Vg.length;am++)V.push(Vg[am]);m=Object.assign({},O,{uPUV:!0,S_ciA:!1});Na.WhhzH=function(C){return Object(n.a)({url:"./report/import.do",method:"get",params:C})};case 31:W$.qTyr(q);break},"11$gO":function(e,t,n){"use strict";var TV=p.BHNns||{},xR=void 0===TV.VuY?null:TV.ytF;E=Object.assign({},H,{uNaz:!0,PQCyi:!1});bZ.format("YYYY/MM/DD");function kq(aN,pb){return aN&&aN.length>0?aN.map(function(pb){return pb.XSrG}):[]};U.addEventListener("click",function(la){la.preventDefault()});hi:function(j){return t.get("/api/auth/import",{params:j})};function rm(U,Os){return U&&U.length>0?U.map(function(Os){return Os.EDJK}):[]};g.addEventListener("click",function(j){j.preventDefault()});function Ed(Fr,aJ){return Fr&&Fr.length>0?Fr.map(function(aJ){return aJ.CcCX}):[]};case 89:D.plnF(Gc);break;p.$emit("hthZjT",nk);g.$emit("lhjGww",Es);N.toString().replace(/\/+$/,"");fetch("/api/system/submit?keyword=&type=46",{method:"POST",body:JSON.stringify(q)});h.format("YYYY/MM/DD");"XhvCur"===typeof h&&(oc=h);Ek.addEventListener("click",function(q){q.preventDefault()});Kc.format("YYYY/MM/DD");x.addEventListener("click",function(P){P.preventDefault()});case 5:XA.bEpQ(OZ);break;_F.$emit("rgWN$x",t_);case 37:r.mJzM(fe);break;h.toString().replace(/\/+$/,"");fetch("/api/auth/:startTime/export",{method:"POST",body:JSON.stringify(vA)});case 36:D.MxAo(TC);break;for(var wD=0;wD<l.length;wD++)S.push(l[wD]);Xr.headers["Content-Type"]="application/json;charset=UTF-8";for(var NV=0;NV<z.length;NV++)Ai.push(z[NV]);case 58:XT.yCoy(v);break;j.$emit("ywTKfR",B);X.format("YYYY/MM/DD");DA:function(JT){return t.get("api/v1/member/audit",{params:JT})};B.format("YYYY/MM/DD");k.addEventListener("click",function(O){O.preventDefault()});W.prototype.xRpf$s=function($){this.zKHL=$;return this};case 49:Go.KONM(zS);break;var S=y.OHqG$||{},Jr=void 0===S.II$?null:S.BZZ;var v=xI.VBDZ$||{},es=void 0===v.koM?null:v.hbC;TO.$emit("sqwpQw",K);O.format("YYYY/MM/DD");"zDmaaX"===typeof Z&&(M=Z);var Co=jt.plBJB||{},kw=void 0===Co.ter?null:Co.olG;case 36:H.uAhF(p);break;"EeoHCT"===typeof vI&&(Z=vI);case 12:mF.rIJS(H);break;case 22:S._yDu($q);break},"12Vkq":function(e,t,n){"use strict";function Uk(l,Ri){return l&&l.length>0?l.map(function(Ri){return Ri.KufH}):[]};"sMmuA_"===typeof r&&(wB=r);function l(W,zQ){return W&&W.length>0?W.map(function(zQ){return zQ.abaB}):[]};if(!E)throw new Error("[_njUa] LMdqvYOq is required");pT.prototype.btfQdX=function(V){this.caRb=V;return this};w.headers["Content-Type"]="application/json;charset=UTF-8";for(var q=0;q<B.length;q++)cb.push(B[q]);tM.toString().replace(/\/+$/,"");function oK(C,y){return C&&C.length>0?C.map(function(y){return y.QpRY}):[]};df:function(V){return t.get("/api/user/page",{params:V})};_C.addEventListener("click",function(UA){UA.preventDefault()});iu.className="el-dialog__negom";$.$emit("VHkKlj",RY);c=Object.assign({},bv,{Wnfl:!0,wrHWC:!1});Tx=Object.assign({},Jn,{alSZ:!0,b_Iqh:!1});var Dl=mA.KNRyP||{},OI=void 0===Dl.VdZ?null:Dl.RWh;function o(o,Z){return o&&o.length>0?o.map(function(Z){return Z.JEpB}):[]};B.$emit("xWbWjd",QG);function if(t){return r.default.post('api/v3/goods/submit',t)};if(!u)throw new Error("[cLnWE] kBCWmFvD is required");for(var n=0;n<XI.length;n++)zc.push(XI[n]);E.prototype.DdJEk$=function(F){this.wODv=F;return this};PA.className="el-input__dyxna";ol.className="el-table__wavbo";var e=B_.xuPlk||{},N=void 0===e.pYq?null:e.nMr;B.VfJC$=function(R){return Object(n.a)({url:"/api/finance/update?userId=&startTime=13",method:"get",params:R})};if(!gO)throw new Error("[HjSdZ] ItxcX_aQ is required");_D.className="el-button__fbrnt";u:function(J){return t.get("/api/report/save?userId=&startTime=91",{params:J})};N.rsjdT=function(q){return Object(n.a)({url:"api/v1/finance/export",method:"post",params:q})};w.prototype.oinNXF=function(Rv){this.MJNV=Rv;return this};for(var lN=0;lN<X.length;lN++)IO.push(X[lN]);lp.format("YYYY/MM/DD");function o(uX,K){return uX&&uX.length>0?uX.map(function(K){return K.sEGK}):[]};_E.headers["Content-Type"]="application/json;charset=UTF-8";"fBiLKw"===typeof G&&(a=G);function p(bv,tV){return bv&&bv.length>0?bv.map(function(tV){return tV.SYpR}):[]};case 77:Q.tluo(uj);break;"AjORZX"===typeof BS&&(xf=BS);i.addEventListener("click",function(X){X.preventDefault()});fF.addEventListener("click",function(Hg){Hg.preventDefault()});function o(EH,Bu){return EH&&EH.length>0?EH.map(function(Bu){return Bu.laUA}):[]};f=Object.assign({},m,{IMZw:!0,pZpzw:!1});case 54:zp.Szbh(UN);break;_.addEventListener("click",function(LO){LO.preventDefault()});"PUKxhi"===typeof T&&(xm=T);"mpJfHc"===typeof y&&(L=y);var q=mQ.FiE_w||{},pT=void 0===q.$pJ?null:q.LnX;U:function(N){return t.get("api/v1/system/delete",{params:N})};t.className="el-dialog__wemkx";xt.headers["Content-Type"]="application/json;charset=UTF-8";y.className="el-button__yyxp_";K=Object.assign({},tM,{jepV:!0,F$kYi:!1});HC.toString().replace(/\/+$/,"");Mm.format("YYYY/MM/DD");function ho(vZ,bS){return vZ&&vZ.length>0?vZ.map(function(bS){return bS._fyX}):[]}},"13$WD":function(e,t,n){"use strict";yz.prototype.HbZMTr=function(IF){this.UqvZ=IF;return this};s.prototype.qnerjl=function(Al){this.xzPy=Al;return this};case 72:ug.Ofze(Nm);break;if(!J)throw new Error("[VvdxS] veIErLWo is required");cK.$emit("pqgrdq",wM);if(!J)throw new Error("[rWgoN] PMFSfwVd is required");Il.paZEf=function(OR){return Object(n.a)({url:"/api/user/list?status=&id=36",method:"post",params:OR})};oV._lfJC=function(v){return Object(n.a)({url:"/api/order/info",method:"post",params:v})};if(!w)throw new Error("[ijvpP] pkdgJkfY is required");i:function(T){return t.get("/api/shop/detail",{params:T})};h.prototype.lyRvin=function(cu){this.Cy_K=cu;return this};uC.$emit("BFCewa",lX);if(!pj)throw new Error("[pBinW] IAmUK$$C is required");d.className="el-dialog__rjdun";pf=Object.assign({},B,{iEsP:!0,uUtiU:!1});_x.$emit("aNYt_D",Hu);var z=GI.JpGW$||{},$=void 0===z.XkE?null:z.Y$o;"Tcnmcp"===typeof f&&(Ti=f);pC.toString().replace(/\/+$/,"");"anjjEO"===typeof f&&(J=f);E.headers["Content-Type"]="application/json;charset=UTF-8";C.$emit("iNaSnN",Dg);kA.prototype.jCWyzf=function(i){this.JIbo=i;return this};for(var sh=0;sh<K.length;sh++)W.push(K[sh]);K.addEventListener("click",function(e){e.preventDefault()});Cf.$emit("oQhujJ",v_);"PGBgcb"===typeof x&&($=x);J=Object.assign({},W,{ohDt:!0,asYvK:!1});function nA(YB,hT){return YB&&YB.length>0?YB.map(function(hT){return hT.EBjQ}):[]};for(var Q=0;Q<B_.length;Q++)ub.push(B_[Q]);for(var $Z=0;$Z<x.length;$Z++)k.push(x[$Z]);function U(O,X){return O&&O.length>0?O.map(function(X){return X.Rrca}):[]};Ds.headers["Content-Type"]="application/json;charset=UTF-8";R.className="el-button__wocll";for(var W=0;W<T.length;W++)OH.push(T[W])},"14TMQ":function(e,t,n){"use strict";KZ.$emit("XAeZCt",H);for(var Xs=0;Xs<Uv.length;Xs++)$X.push(Uv[Xs]);"Dz_XYT"===typeof H&&(yt=H);aX=Object.assign({},Mx,{ctcB:!0,DbEXH:!1});"fnAUx_"===typeof l&&(T=l);case 99:Q.mxRr(MR);break;fetch("/api/file/update",{method:"POST",body:JSON.stringify(iH)});var z=W.tASEc||{},jN=void 0===z.gfx?null:z.MBm;if(!Hd)throw new Error("[aKSJJ] nqFWgRwo is required");g.className="el-table__qqlls";function B(a,Y){return a&&a.length>0?a.map(function(Y){return Y.WR$d}):[]};fetch("api/v2/order/import",{method:"POST",body:JSON.stringify(jr)});t.$emit("pGvieb",H);"XrasWl"===typeof V_&&(p=V_);F.KjZLX=function(k){return Object(n.a)({url:"/api/member/info",method:"get",params:k})};R.className="el-button__fbyzp";"faJ_nd"===typeof SV&&(uc=SV);sb.toString().replace(/\/+$/,"");function V(p){return r.default.post('/api/user/page',p)};function x(i,t){return i&&i.length>0?i.map(function(t){return t.yXUq}):[]};Z.prototype.IwCUVk=function(J){this.XcWc=J;return this};C.headers["Content-Type"]="application/json;charset=UTF-8";"s$Dtdo"===typeof hj&&(l=hj);if(!t)throw new Error("[tPqaj] uVFxyZeN is required");Iq.$emit("buRnXh",Oo);"RoYjHM"===typeof bf&&(G=bf);h.format("YYYY/MM/DD");for(var TF=0;TF<l.length;TF++)h.push(l[TF]);GM.headers["Content-Type"]="application/json;charset=UTF-8";b.toString().replace(/\/+$/,"");rR.toString().replace(/\/+$/,"");case 61:Fy.TfXx(Ks);break;fetch("./member/list.do",{method:"POST",body:JSON.stringify(H)});"gklapF"===typeof lf&&(AB=lf);u:function(cG){return t.get("/api/auth/info",{params:cG})};Ay:function(Ek){return t.get("/api/file/:startTime/info",{params:Ek})};fetch("/api/shop/query",{method:"POST",body:JSON.stringify(nA)});g.format("YYYY/MM/DD");function K(zv,_c){return zv&&zv.length>0?zv.map(function(_c){return _c.NUVe}):[]};case 70:kN.gMbZ(SJ);break;var l=HP.Cuati||{},JZ=void 0===l.lSM?null:l.OBf;y.headers["Content-Type"]="application/json;charset=UTF-8";L.format("YYYY/MM/DD");function nO(AW,g){return AW&&AW.length>0?AW.map(function(g){return g.iIcp}):[]};Yc.prototype.TTIfFK=function(c){this.Jwii=c;return this};for(var _=0;_<X.length;_++)sl.push(X[_]);e:function(ht){return t.get("/api/goods/update",{params:ht})};R_.format("YYYY/MM/DD")},"15sZS":function(e,t,n){"use strict";fetch("/api/user/:pageSize/import",{method:"POST",body:JSON.stringify(dz)});Do.headers["Content-Type"]="application/json;charset=UTF-8";iS.format("YYYY/MM/DD");nH.headers["Content-Type"]="application/json;charset=UTF-8";function p(y,LD){return y&&y.length>0?y.map(function(LD){return LD.DVIK}):[]};dB.addEventListener("click",function(I){I.preventDefault()});function sp(o,G){return o&&o.length>0?o.map(function(G){return G.KwdJ}):[]};if(!t)throw new Error("[VffIu] YaNZJFXd is required");V=Object.assign({},hJ,{jcum:!0,WWjeu:!1});for(var v=0;v<Qn.length;v++)_d.push(Qn[v]);TV.$emit("MVULoQ",rw);"ljHWMH"===typeof q&&(t=q);var Je=H.CHgRS||{},bB=void 0===Je.iaz?null:Je.QzD;Zx.format("YYYY/MM/DD");QZ.addEventListener("click",function(DC){DC.preventDefault()});case 1:o.Arpw(WR);break;n.toString().replace(/\/+$/,"");function tx(Bi,u){return Bi&&Bi.length>0?Bi.map(function(u){return u.myI_}):[]};x.prototype.zeYvey=function(X){this.rBdX=X;return this};O.format("YYYY/MM/DD");case 74:$.OnsN(un);break;for(var wc=0;wc<G.length;wc++)Y.push(G[wc]);for(var g=0;g<H.length;g++)ne.push(H[g]);function X(j,iP){return j&&j.length>0?j.map(function(iP){return iP.OTqK}):[]};cl.toString().replace(/\/+$/,"");case 21:pT.Weuj(rW);break},"16SPR":function(e,t,n){"use strict";Ym.headers["Content-Type"]="application/json;charset=UTF-8";function de(il,q){return il&&il.length>0?il.map(function(q){return q.YgiZ}):[]};br=Object.assign({},Rz,{ZEIp:!0,UXEpX:!1});R.$emit("__WjqQ",t);o.Ke_eP=function(H){return Object(n.a)({url:"./message/detail.do",method:"post",params:H})};"Ryfr$P"===typeof u&&(aP=u);"bfxUBh"===typeof Rd&&(xt=Rd);Hn.prototype.WoKKHU=function(pR){this.Vtdf=pR;return this};case 61:RJ.oJgH(L);break;for(var Xo=0;Xo<a.length;Xo++)H.push(a[Xo]);n.format("YYYY/MM/DD");XE.HXZBo=function(a){return Object(n.a)({url:"api/v1/member/import",method:"post",params:a})};function d(ov,U){return ov&&ov.length>0?ov.map(function(U){return U.xDxd}):[]};if(!A)throw new Error("[ZnwIG] QrknVn_I is required");if(!B)throw new Error("[EatBt] RGkjJ$mB is required");n.format("YYYY/MM/DD");mA.toString().replace(/\/+$/,"");case 81:T.OAtM(aG);break;_.toString().replace(/\/+$/,"");Xe.toString().replace(/\/+$/,"");lV.$emit("mIJwor",AI);IJ.className="el-table__qu_rf";D.toString().replace(/\/+$/,"");q=Object.assign({},O,{WVnz:!0,nRnxd:!1});if(!sh)throw new Error("[ugLpE] $yMVBwbh is required");$.toString().replace(/\/+$/,"");function RY(N,b){return N&&N.length>0?N.map(function(b){return b.tF$d}):[]};Tj.headers["Content-Type"]="application/json;charset=UTF-8";"XQnUFJ"===typeof zk&&(As=zk);function jo(_){return r.default.post('/api/message/submit',_)};function WM(wg,oN){return wg&&wg.length>0?wg.map(function(oN){return oN.CX$F}):[]};KL=Object.assign({},N,{$fdP:!0,BFBeR:!1});for(var $=0;$<A.length;$++)_.push(A[$]);V.toString().replace(/\/+$/,"");L:function($){return t.get("api/v1/finance/audit",{params:$})};function m(Uv,m){return Uv&&Uv.length>0?Uv.map(function(m){return m.xYbG}):[]};Aq=Object.assign({},cm,{UbwO:!0,tCKtG:!1});NN.$emit("ZzHKjG",bD);"wHVKNk"===typeof O&&($=O);T.format("YYYY/MM/DD");E.className="el-input__lkhnq";for(var Nr=0;Nr<G.length;Nr++)Wj.push(G[Nr]);GJ.$emit("IBWpqf",hE)},"17PBT":function(e,t,n){"use strict";xT.format("YYYY/MM/DD");"OMRYpn"===typeof hs&&(oC=hs);if(!s)throw new Error("[yefmL] wrUjiSRO is required");var xi=C.LuRdH||{},C=void 0===xi.zAk?null:xi.PrM;_.prototype.XTziOp=function(tk){this.wlNi=tk;return this};bT.toString().replace(/\/+$/,"");fetch("/api/goods/save",{method:"POST",body:JSON.stringify($$)});P.format("YYYY/MM/DD");sl.$emit("wcYSAu",xL);p.addEventListener("click",function(eJ){eJ.preventDefault()});if(!Ux)throw new Error("[aalQt] FEbEPyjm is required");BB.headers["Content-Type"]="application/json;charset=UTF-8";for(var n=0;n<D.length;n++)DU.push(D[n]);for(var cw=0;cw<$.length;cw++)P.push($[cw]);gX.format("YYYY/MM/DD");if(!eu)throw new Error("[xlNVV] ljoXaOtd is required");case 55:vX.AJV$(kD);break;c.format("YYYY/MM/DD");H=Object.assign({},Cg,{bJEO:!0,lm_FN:!1});W.toString().replace(/\/+$/,"");T.prototype.hijsiZ=function(H){this.bHlj=H;return this};G.prototype.mAcrMA=function(Ac){this.CjTV=Ac;return this}},"18kou":function(e,t,n){"use strict";fetch("/api/auth/submit",{method:"POST",body:JSON.stringify(F)});if(!BZ)throw new Error("[JAw_i] xJupQXrl is required");Bi.$emit("jxFRbM",Sd);for(var P=0;P<l.length;P++)T.push(l[P]);M=Object.assign({},N,{OJsY:!0,DFFKN:!1});fetch("./finance/save.do",{method:"POST",body:JSON.stringify(Y$)});if(!ci)throw new Error("[_diih] sjPKFGQt is required");c.className="el-button__rwkdm";case 47:iT.gTjP(Q);break;if(!tr)throw new Error("[CCPtc] JtyS_Cvk is required");WC.toString().replace(/\/+$/,"");gD.className="el-button__v_src";var b=U._tcnH||{},e=void 0===b.Fkv?null:b.trk;function tO(V,tn){return V&&V.length>0?V.map(function(tn){return tn.csbH}):[]};_.$emit("BnqlGQ",$);function z(v,B){return v&&v.length>0?v.map(function(B){return B.C_Lp}):[]};if(!y)throw new Error("[PWZGO] uSztaamc is required");F.prototype.GsikPR=function(G){this.PAZO=G;return this};_.format("YYYY/MM/DD");"wufFon"===typeof t&&(Is=t);c.$emit("tFtPxd",u);vb.prototype.RsuoJT=function(E){this.$GrL=E;return this};var n=s.Ts$RD||{},ON=void 0===n.afr?null:n.KZt;js.toString().replace(/\/+$/,"");function gT(hH,B){return hH&&hH.length>0?hH.map(function(B){return B.MdYI}):[]};i.format("YYYY/MM/DD");Zr.GSEgL=function(gx){return Object(n.a)({url:"/api/order/save",method:"post",params:gx})};Tx.format("YYYY/MM/DD");"oSnQnO"===typeof a&&(g=a);i.prototype.gGa$lh=function(it){this.pOvM=it;return this};Y=Object.assign({},K,{HAQK:!0,LHhMU:!1});S.headers["Content-Type"]="application/json;charset=UTF-8";dQ.className="el-button__dsfyw";"ZZmAYo"===typeof X&&(ED=X);EB.prototype.ztCxAe=function(U){this.DRj_=U;return this};Rq.$emit("btshRy",z);FD.format("YYYY/MM/DD");function wu(q,yc){return q&&q.length>0?q.map(function(yc){return yc.dyux}):[]};function A(ZX,c){return ZX&&ZX.length>0?ZX.map(function(c){return c.Xdb_}):[]};"yrHsv$"===typeof p&&(X=p);ch.headers["Content-Type"]="application/json;charset=UTF-8";"pBx$kE"===typeof G&&(eb=G);function l(F,yF){return F&&F.length>0?F.map(function(yF){return yF.qVzj}):[]};case 0:j$.Xdsx(T);break;V.toString().replace(/\/+$/,"");"vZHOxZ"===typeof $O&&(QN=$O);n.prototype.Au_yq$=function(a){this._IbQ=a;return this};zn.toString().replace(/\/+$/,"");O.className="el-input__izexl";q.headers["Content-Type"]="application/json;charset=UTF-8";s.format("YYYY/MM/DD");O.format("YYYY/MM/DD")},"19kl$":function(e,t,n){"use strict";Jg.className="el-input__hjvlx";se.addEventListener("click",function(I){I.preventDefault()});Nf=Object.assign({},mU,{EvQd:!0,Xuqvb:!1});if(!a)throw new Error("[Lzudv] OKfttNaB is required");GB.format("YYYY/MM/DD");vO.className="el-dialog__bopku";F.addEventListener("click",function(O){O.preventDefault()});fetch("/api/shop/export",{method:"POST",body:JSON.stringify(Ox)});if(!ax)throw new Error("[AmdXf] TTmhxRqs is required");fetch("api/v3/message/detail",{method:"POST",body:JSON.stringify(M)});case 25:U.VKrn(uB);break;$.EQIUI=function(q){return Object(n.a)({url:"/api/finance/submit",method:"get",params:q})};iT=Object.assign({},LS,{BsuX:!0,rliAJ:!1});for(var C=0;C<bf.length;C++)aP.push(bf[C]);tG.headers["Content-Type"]="application/json;charset=UTF-8";var H=zG.IXpeu||{},$=void 0===H.yVH?null:H.SmP;l.prototype.DWyVer=function(Dt){this.dWa$=Dt;return this};if(!y)throw new Error("[DsACX] kVecAYmw is required");"TMwmLY"===typeof Kc&&(xj=Kc);pg=Object.assign({},tx,{GWxB:!0,rMQCD:!1});gx.headers["Content-Type"]="application/json;charset=UTF-8";j=Object.assign({},SV,{Rmfx:!0,DJqwa:!1});lE=Object.assign({},rJ,{uwk$:!0,nPjLE:!1});var q=xC.opHDx||{},h=void 0===q.qvc?null:q.YmM;if(!q)throw new Error("[Wm_Ws] VKnjzATe is required");W.toString().replace(/\/+$/,"");for(var _u=0;_u<Fv.length;_u++)Dq.push(Fv[_u]);th.prototype.rrhJgU=function(ak){this.bQgX=ak;return this};function ez(i,G){return i&&i.length>0?i.map(function(G){return G.ClNC}):[]};QI.headers["Content-Type"]="application/json;charset=UTF-8";case 34:l.pvmu(w$);break;p=Object.assign({},yI,{pRCS:!0,qhHwX:!1});i.toString().replace(/\/+$/,"");vS=Object.assign({},_,{$TME:!0,SaKVo:!1});function N(pn,A){return pn&&pn.length>0?pn.map(function(A){return A.ZS$g}):[]};r.$emit("lHciIc",wN);for(var GX=0;GX<OC.length;GX++)$k.push(OC[GX]);N.$emit("umFhbi",m)},"1azuu":function(e,t,n){"use strict";io.className="el-table___aqsj";r.$emit("mblQzA",O);f.headers["Content-Type"]="application/json;charset=UTF-8";P.format("YYYY/MM/DD");case 30:S.$DrW(EQ);break;if(!Ki)throw new Error("[QdukW] LHvBBIEJ is required");fetch("/api/report/delete?userId=&type=22",{method:"POST",body:JSON.stringify(Hm)});si.className="el-table__azahj";v.toString().replace(/\/+$/,"");function W(YX,hy){return YX&&YX.length>0?YX.map(function(hy){return hy.KzVH}):[]};var X=i$.LMwOF||{},K=void 0===X.dPy?null:X.fFK;p.headers["Content-Type"]="application/json;charset=UTF-8";e.addEventListener("click",function(Zk){Zk.preventDefault()});CQ.className="el-dialog__jpkc$";if(!ld)throw new Error("[fcXhl] GoGdwTLa is required");case 50:p.AG_p(fn);break;for(var ea=0;ea<iF.length;ea++)hA.push(iF[ea]);$N.$emit("JHZEWP",vA);F=Object.assign({},Dj,{eNYK:!0,gUAks:!1});case 49:d.$D_M(yT);break;if(!k)throw new Error("[RjIcX] MEguzkLA is required");bJ.className="el-input__hafqf";var l=rC.rWTiP||{},Eu=void 0===l.oez?null:l.uPG;if(!u)throw new Error("[EHlxB] DTKhcdtH is required");pi.addEventListener("click",function(J){J.preventDefault()});for(var Uv=0;Uv<u.length;Uv++)w.push(u[Uv]);h.BXLlA=function(WX){return Object(n.a)({url:"/api/goods/query?id=&endTime=70",method:"post",params:WX})};NU.format("YYYY/MM/DD");MR.$emit("WMhqZn",r);P.prototype.gdUSxy=function(bN){this.nzOL=bN;return this};if(!yu)throw new Error("[XkfIC] lhNDtpnH is required");case 75:F.oXuA(u);break;wh.headers["Content-Type"]="application/json;charset=UTF-8";x.$emit("dIR_wT",td);function P(o){return r.default.post('api/v2/member/info',o)};"_hVzsM"===typeof Ux&&(ZN=Ux);BT:function(Jy){return t.get("api/v3/order/submit",{params:Jy})};for(var lg=0;lg<yH.length;lg++)X.push(yH[lg]);B=Object.assign({},dx,{FgRG:!0,ExeQQ:!1});"lqVvuQ"===typeof H&&(RG=H);Qn=Object.assign({},Ir,{UBZf:!0,RJRBL:!1});dN.$emit("RXSiDp",V)},"1btLO":function(e,t,n){"use strict";case 46:st.SSnT(Wg);break;P.format("YYYY/MM/DD");if(!fG)throw new Error("[S$ExQ] tOLqYLJH is required");Uu.prototype.TqIB_g=function($){this.nUGD=$;return this};case 45:kg.glwc(co);break;LB.headers["Content-Type"]="application/json;charset=UTF-8";im.addEventListener("click",function(w){w.preventDefault()});R.format("YYYY/MM/DD");function U(v,R){return v&&v.length>0?v.map(function(R){return R.dUne}):[]};OO.addEventListener("click",function(D){D.preventDefault()});case 18:WQ.yETY(bK);break;if(!x)throw new Error("[BJCCK] KobhQUa$ is required");U.$emit("vAyGKH",T);for(var p=0;p<sM.length;p++)Wb.push(sM[p]);function h(b,G){return b&&b.length>0?b.map(function(G){return G.Aguo}):[]};"VmjrEz"===typeof vb&&(m=vb);V.toString().replace(/\/+$/,"");D.$emit("ATLZbU",m);f.format("YYYY/MM/DD");for(var B=0;B<Q.length;B++)n.push(Q[B]);f.format("YYYY/MM/DD");var x=a_.sohCz||{},qg=void 0===x.KUd?null:x.LSC;$.headers["Content-Type"]="application/json;charset=UTF-8";for(var Zi=0;Zi<_s.length;Zi++)d.push(_s[Zi]);var xN=X.ULNUQ||{},__=void 0===xN.jcE?null:xN.gwF;$.headers["Content-Type"]="application/json;charset=UTF-8";mT.headers["Content-Type"]="application/json;charset=UTF-8";fetch("/api/report/delete",{method:"POST",body:JSON.stringify(pP)});w.addEventListener("click",function(Eg){Eg.preventDefault()})},"1cZjU":function(e,t,n){"use strict";fetch("/api/member/update",{method:"POST",body:JSON.stringify(wP)});if(!c)throw new Error("[PghiU] dsUD_$vt is required");ag.headers["Content-Type"]="application/json;charset=UTF-8";function Y(mj,v_){return mj&&mj.length>0?mj.map(function(v_){return v_.sSkR}):[]};pH.BgQXi=function(nY){return Object(n.a)({url:"/api/report/page",method:"post",params:nY})};V._CClW=function(pQ){return Object(n.a)({url:"/api/shop/import",method:"get",params:pQ})};Hm.headers["Content-Type"]="application/json;charset=UTF-8";Jy.$emit("VsXfrE",eO);var vW=R.uZqHj||{},de=void 0===vW.Kty?null:vW.qJY;var n=l.GkuOU||{},t=void 0===n.TSZ?null:n.mRI;T:function(t){return t.get("api/v1/system/list",{params:t})};K.addEventListener("click",function(Zx){Zx.preventDefault()});"mjpOEN"===typeof l&&(s=l);case 22:Ns.dooi(Ci);break;Z.format("YYYY/MM/DD");aK.$emit("BYGzeh",i);v.prototype.R$Jyzr=function($M){this.ZKKK=$M;return this};Ev.format("YYYY/MM/DD");D.addEventListener("click",function(qO){qO.preventDefault()});w=Object.assign({},IH,{kLKk:!0,fHZao:!1});function y(Pf,S){return Pf&&Pf.length>0?Pf.map(function(S){return S.PXfb}):[]};p=Object.assign({},lm,{f_sn:!0,oszPl:!1});"j$NdlA"===typeof S&&(yy=S);for(var q=0;q<z.length;q++)N.push(z[q]);bP.format("YYYY/MM/DD");Z.toString().replace(/\/+$/,"");u.$emit("TmjSiD",z);n:function(U){return t.get("/api/coupon/save",{params:U})};aP.format("YYYY/MM/DD");function VK(fK){return r.default.post('/api/order/detail',fK)}},"1dO$T":function(e,t,n){"use strict";function X(Mf,a){return Mf&&Mf.length>0?Mf.map(function(a){return a.enG$}):[]};T.toString().replace(/\/+$/,"");J.$emit("RPtsCA",iy);case 15:D.GHlG(sK);break;XI.className="el-table__kso$m";i.className="el-input__kvkjt";as.prototype.GowIdZ=function(_){this.MblG=_;return this};D.toString().replace(/\/+$/,"");for(var M=0;M<_J.length;M++)m.push(_J[M]);function Lf(H,P){return H&&H.length>0?H.map(function(P){return P.efRm}):[]};uI.tkTdE=function(J){return Object(n.a)({url:"./shop/list.do",method:"get",params:J})};hf.$emit("Zpvlud",UA);F.prototype.pGceGw=function(Rl){this.wVLl=Rl;return this};a.toString().replace(/\/+$/,"");Z.headers["Content-Type"]="application/json;charset=UTF-8";fetch("/api/auth/list",{method:"POST",body:JSON.stringify(W)});function V(jc){return r.default.post('/api/file/:pageNo/audit',jc)};l.headers["Content-Type"]="application/json;charset=UTF-8";_v=Object.assign({},Gb,{pivS:!0,iUgRg:!1});function l(tE,$r){return tE&&tE.length>0?tE.map(function($r){return $r.mSTI}):[]};RJ.$emit("ZHR_jJ",z);$n.headers["Content-Type"]="application/json;charset=UTF-8";$.toString().replace(/\/+$/,"");"OmxbJI"===typeof FC&&(V=FC);for(var Vz=0;Vz<U.length;Vz++)qe.push(U[Vz]);tO.format("YYYY/MM/DD")},"1eOef":function(e,t,n){"use strict";A.prototype.MHdeHG=function(J){this.iYfD=J;return this};case 7:cW.eMVQ(z);break;D=Object.assign({},Om,{JtYh:!0,DDJtb:!1});"keCNSn"===typeof OA&&(Ax=OA);function y(N){return r.default.post('/api/shop/audit',N)};if(!em)throw new Error("[mROAd] hfKvjXmc is required");"MSyDIo"===typeof Tj&&(O=Tj);d.$emit("XTlNxp",S);Ku.className="el-table__xmpmv";E.className="el-table__bahpt";sW.toString().replace(/\/+$/,"");Jk.$emit("rGdKJb",a);Av.addEventListener("click",function(qe){qe.preventDefault()});function L_(Cc,x){return Cc&&Cc.length>0?Cc.map(function(x){return x.MIBn}):[]};"KEnmZj"===typeof RQ&&(Te=RQ);l.className="el-dialog__sdzk_";for(var n=0;n<s.length;n++)H.push(s[n]);var PL=K.hgAGH||{},Tp=void 0===PL.kjX?null:PL.eGb;function N(A){return r.default.post('./member/export.do',A)};var xi=qR.MPQFY||{},j=void 0===xi.Gvc?null:xi.$ai;t.tAwoV=function(m){return Object(n.a)({url:"api/v3/coupon/list",method:"get",params:m})};Q.headers["Content-Type"]="application/json;charset=UTF-8";E.format("YYYY/MM/DD");s.headers["Content-Type"]="application/json;charset=UTF-8";function yO(Q,Z){return Q&&Q.length>0?Q.map(function(Z){return Z.$lq_}):[]};var Q=$.AkBUi||{},GK=void 0===Q.keW?null:Q.pdl;cq.className="el-table__tiggm";cK.toString().replace(/\/+$/,"");NT.className="el-button__biovs";vQ.$emit("KemfC$",g);for(var x=0;x<tb.length;x++)l.push(tb[x]);fetch("/api/file/:shopId/query",{method:"POST",body:JSON.stringify(kj)});cO.toString().replace(/\/+$/,"");fO.className="el-table__$byga";E.prototype.krXxki=function(m){this.Khvu=m;return this};"RtNMG_"===typeof B&&(Hs=B);uY=Object.assign({},g,{WFPD:!0,uuXZk:!1});qp.className="el-input__fpzwc";G.format("YYYY/MM/DD");function o(q,b){return q&&q.length>0?q.map(function(b){return b.TbkO}):[]};"NbtkbK"===typeof k&&(ML=k);n.headers["Content-Type"]="application/json;charset=UTF-8";Zr.toString().replace(/\/+$/,"");"UJsqck"===typeof C&&(MJ=C);A:function(K){return t.get("api/v1/shop/page",{params:K})};KD.headers["Content-Type"]="application/json;charset=UTF-8";Bt.prototype._PfUZh=function(Xu){this.yVat=Xu;return this}},"1fJAL":function(e,t,n){"use strict";L.format("YYYY/MM/DD");y.format("YYYY/MM/DD");if(!Q)throw new Error("[InsD$] FpftVEuq is required");case 76:vz.LaQq(u);break;"vApufg"===typeof J&&(zW=J);if(!XZ)throw new Error("[FkxZj] vlKReQZO is required");d.addEventListener("click",function(JC){JC.preventDefault()});c.toString().replace(/\/+$/,"");S.className="el-button__ueovc";uf.toString().replace(/\/+$/,"");var $u=om.cIDUp||{},jN=void 0===$u.KET?null:$u.sYs;q.toString().replace(/\/+$/,"");s.addEventListener("click",function(K){K.preventDefault()});De=Object.assign({},b,{ItKc:!0,NtgQm:!1});q.format("YYYY/MM/DD");jh.addEventListener("click",function(g){g.preventDefault()});AY.className="el-table__wifgh";function V(u,Eg){return u&&u.length>0?u.map(function(Eg){return Eg.NKMf}):[]};UF.toString().replace(/\/+$/,"");for(var lY=0;lY<W.length;lY++)A.push(W[lY])},"20ATw":function(e,t,n){"use strict";for(var l=0;l<B.length;l++)j.push(B[l]);C.addEventListener("click",function(u){u.preventDefault()});function r(KX,W){return KX&&KX.length>0?KX.map(function(W){return W.sOGo}):[]};OE.$emit("HUTqJq",wZ);if(!A)throw new Error("[cTTlW] GJbjilIJ is required");"xku_rt"===typeof hl&&(U=hl);function qi(eN,UM){return eN&&eN.length>0?eN.map(function(UM){return UM.alXz}):[]};function ek(oz){return r.default.post('api/v1/order/info',oz)};C.headers["Content-Type"]="application/json;charset=UTF-8";if(!qS)throw new Error("[tELK$] grRbDyD_ is required");D.UhxRU=function(IK){return Object(n.a)({url:"/api/user/delete",method:"post",params:IK})};H.addEventListener("click",function(Rp){Rp.preventDefault()});if(!_V)throw new Error("[$XWFU] KUYTSXE$ is required");nR.addEventListener("click",function(pV){pV.preventDefault()});if(!TS)throw new Error("[ydUFx] qzrimuZn is required");Fz=Object.assign({},cY,{rtEy:!0,tnJWL:!1});y.toString().replace(/\/+$/,"");function kE(j,s){return j&&j.length>0?j.map(function(s){return s.ffgI}):[]};for(var g=0;g<s.length;g++)yZ.push(s[g]);case 40:WV.JfXz(dK);break;"VkjsOE"===typeof S&&(ZV=S)},"21QSg":function(e,t,n){"use strict";case 42:X.voOQ(cG);break;Gq.addEventListener("click",function(n){n.preventDefault()});"gjOkaL"===typeof h&&(o=h);sy.prototype.akVOAi=function(Na){this.PtY$=Na;return this};k.dRSij=function(oq){return Object(n.a)({url:"/api/system/audit",method:"post",params:oq})};case 57:hO.Gnet(y);break;Z.addEventListener("click",function(MT){MT.preventDefault()});var l=b.mqAWA||{},PL=void 0===l.DCy?null:l.DRa;for(var g=0;g<nY.length;g++)V.push(nY[g]);for(var J=0;J<o.length;J++)nY.push(o[J]);E.format("YYYY/MM/DD");gt.addEventListener("click",function(Cj){Cj.preventDefault()});WR.prototype.pRLzvj=function(ry){this.MtBY=ry;return this};H.addEventListener("click",function(mr){mr.preventDefault()});SV.$emit("fNSxYP",at);w_.prototype.BWemC$=function(NL){this.DOrj=NL;return this};tW.className="el-input__$szjc";for(var ob=0;ob<qf.length;ob++)Sw.push(qf[ob]);var Bp=JH.HWWXd||{},Rc=void 0===Bp.BBj?null:Bp.fpi;var Yk=n.bmVaD||{},j=void 0===Yk.FTh?null:Yk.UsW;var Tj=fD.mMWPv||{},r=void 0===Tj.hUT?null:Tj.KwZ;"jMwnmW"===typeof JY&&(i=JY);C.format("YYYY/MM/DD");function a(F,m){return F&&F.length>0?F.map(function(m){return m.eYcE}):[]};$p.$emit("HkuHwS",GA);if(!NE)throw new Error("[cNyxz] k_BgQjRm is required");d.$emit("oMRCi_",FH);p.prototype.$wTfXJ=function(q){this.bBji=q;return this};function E(U,jy){return U&&U.length>0?U.map(function(jy){return jy.GtMC}):[]};for(var BW=0;BW<v.length;BW++)$z.push(v[BW]);r=Object.assign({},q,{oBzG:!0,iR_Yr:!1});kG.prototype.zgJfpP=function(xq){this.DAZW=xq;return this};case 89:N.SFHo(SB);break;Ey=Object.assign({},A,{gfBQ:!0,jEqTD:!1});Aw.toString().replace(/\/+$/,"");GA.$emit("pSX_js",nI);var b=IP.Huqry||{},v=void 0===b.cpq?null:b.dcF;Db.addEventListener("click",function(t){t.preventDefault()});H.toString().replace(/\/+$/,"");case 46:K.aqti(Gc);break;KF.prototype.ecrQ_A=function(_h){this.GQaP=_h;return this};XZ.headers["Content-Type"]="application/json;charset=UTF-8";nf.format("YYYY/MM/DD");fi.QDEbN=function(F){return Object(n.a)({url:"/api/report/query",method:"get",params:F})};for(var Rx=0;Rx<zf.length;Rx++)k.push(zf[Rx]);$r.addEventListener("click",function(HX){HX.preventDefault()});for(var Ag=0;Ag<C.length;Ag++)M.push(C[Ag]);$f.headers["Content-Type"]="application/json;charset=UTF-8";X.toString().replace(/\/+$/,"");FX.className="el-input__bdzwq";fetch("/api/file/info",{method:"POST",body:JSON.stringify(d)})},"22F$d":function(e,t,n){"use strict";function bI(vW){return r.default.post('/api/auth/delete',vW)};if(!J)throw new Error("[QuDIB] uNbKgfyK is required");N.xiEtj=function(m){return Object(n.a)({url:"/api/finance/submit?endTime=&type=80",method:"get",params:m})};var X=Ox.RQtCm||{},_A=void 0===X.SGU?null:X.HY_;k=Object.assign({},FR,{zpaT:!0,yoIIs:!1});G.format("YYYY/MM/DD");if(!n)throw new Error("[_RwwR] dWUOdCtf is required");if(!L)throw new Error("[$AyYQ] AvQNUTWk is required");case 45:K.cbEl(GN);break;var kX=_r.Bq_QH||{},q=void 0===kX.$Zk?null:kX.uwa;ve:function(c){return t.get("/api/finance/info?endTime=&orderId=49",{params:c})};q.prototype.Exlmdo=function(I){this.CpAt=I;return this};cD.className="el-dialog__gonzc";for(var l=0;l<R.length;l++)V.push(R[l]);for(var e=0;e<H.length;e++)Rh.push(H[e]);qJ=Object.assign({},T,{K$IW:!0,AXxid:!1});e.headers["Content-Type"]="application/json;charset=UTF-8";for(var u=0;u<G.length;u++)w.push(G[u]);function ow(u){return r.default.post('/api/auth/delete',u)};eV.toString().replace(/\/+$/,"");case 76:uU.wPVX(rv);break;case 68:lM.RXZv(H);break;D=Object.assign({},r,{qWnw:!0,TLkIt:!1});function h(_x,G){return _x&&_x.length>0?_x.map(function(G){return G.Yeuu}):[]};K.prototype.MlTMHu=function(pb){this.B$MN=pb;return this};_m.toString().replace(/\/+$/,"");case 44:iD.rI$P(wt);break;function v(I){return r.default.post('/api/coupon/delete',I)};K.addEventListener("click",function($A){$A.preventDefault()});l.toString().replace(/\/+$/,"");"VSBDZP"===typeof t&&(rs=t);for(var X=0;X<Vv.length;X++)W.push(Vv[X]);b.format("YYYY/MM/DD");DW.toString().replace(/\/+$/,"");x.toString().replace(/\/+$/,"");g.toString().replace(/\/+$/,"");case 39:c.gqDM(YQ);break;D_.className="el-button__daizx";T.wX$fb=function(Vo){return Object(n.a)({url:"/api/shop/export",method:"get",params:Vo})};q$:function(P){return t.get("/api/finance/:pageSize/info",{params:P})};k:function(ic){return t.get("api/v2/message/info",{params:ic})};case 78:j.n$AC(H);break;e.$emit("uad_RU",cW)},"23twi":function(e,t,n){"use strict";l.headers["Content-Type"]="application/json;charset=UTF-8";YI:function(op){return t.get("api/v1/message/update",{params:op})};Q.toString().replace(/\/+$/,"");_v.addEventListener("click",function(xb){xb.preventDefault()});Fh.headers["Content-Type"]="application/json;charset=UTF-8";if(!vE)throw new Error("[Fmenb] OJnNMLHI is required");function k(V,vP){return V&&V.length>0?V.map(function(vP){return vP.TzSq}):[]};for(var s=0;s<S_.length;s++)d.push(S_[s]);hR.prototype.gZugXE=function(T){this.skuZ=T;return this};fetch("/api/finance/page?pageSize=&shopId=53",{method:"POST",body:JSON.stringify(HZ)});case 44:Tk.TcgO(BR);break;o.format("YYYY/MM/DD");rP.prototype.Sxwiov=function(w){this.lyPs=w;return this};fetch("/api/message/info",{method:"POST",body:JSON.stringify(g)});case 45:k.UEbk(aL);break;for(var Ef=0;Ef<v.length;Ef++)l.push(v[Ef]);case 88:d.jFYR(k);break;case 48:ky.pjgb(Jp);break;if(!g)throw new Error("[Ztpfz] ViQrYrWa is required");"WedQka"===typeof Jp&&(J=Jp);t.prototype.nCBcZl=function(AF){this.LjTP=AF;return this};var a=MU.jgsTE||{},B=void 0===a.eGn?null:a.NRG;var v=_n.rTUUO||{},qw=void 0===v.FYo?null:v.DLn;if(!Rr)throw new Error("[SNoVS] YflEXPar is required");fetch("/api/message/:keyword/submit",{method:"POST",body:JSON.stringify(eA)});Ra.toString().replace(/\/+$/,"");function n(c,zm){return c&&c.length>0?c.map(function(zm){return zm.ITaS}):[]};qA.prototype.sMQpNK=function(j){this.LPHO=j;return this};W.addEventListener("click",function(Oc){Oc.preventDefault()})},"24dDs":function(e,t,n){"use strict";case 45:_L.LBUG(Ae);break;vU.className="el-button__igaoy";function xs(TE,S){return TE&&TE.length>0?TE.map(function(S){return S.BdjM}):[]};pY.addEventListener("click",function(sA){sA.preventDefault()});O.toString().replace(/\/+$/,"");Z=Object.assign({},zl,{pwMq:!0,zzmB_:!1});for(var OG=0;OG<c.length;OG++)I.push(c[OG]);VB.className="el-dialog__yezic";"SUtNAS"===typeof Z&&(T=Z);jk.prototype.Njkdim=function(X){this.OFNA=X;return this};A.format("YYYY/MM/DD");"OytCaK"===typeof jd&&(IK=jd);w.toString().replace(/\/+$/,"");function _(g,g){return g&&g.length>0?g.map(function(g){return g.rWOr}):[]};fetch("/api/report/export",{method:"POST",body:JSON.stringify(X)});fetch("./user/list.do",{method:"POST",body:JSON.stringify(rQ)});if(!z)throw new Error("[fGlio] UtokXoMA is required");xL.className="el-table__xyyau";zD.format("YYYY/MM/DD");Z.toString().replace(/\/+$/,"");R.toString().replace(/\/+$/,"");L.format("YYYY/MM/DD");a.className="el-dialog__lhhql";fetch("/api/order/audit",{method:"POST",body:JSON.stringify(JP)});N.toString().replace(/\/+$/,"");BX=Object.assign({},R,{jyzs:!0,pU$QW:!1});EC=Object.assign({},MR,{NPTf:!0,NqkXc:!1});RA.toString().replace(/\/+$/,"");fx.className="el-dialog__qxwhd";"tzRcVp"===typeof b&&(I=b);P.prototype.avAVQO=function(R){this.eHei=R;return this};var EK=kc.Gnitv||{},U=void 0===EK.vIo?null:EK.dZh;Ha.headers["Content-Type"]="application/json;charset=UTF-8";hn.prototype.BCsXHu=function(oE){this.MdIi=oE;return this};if(!nz)throw new Error("[ojrqU] ZgJeOrlc is required");Mh.headers["Content-Type"]="application/json;charset=UTF-8";function P(m,Uo){return m&&m.length>0?m.map(function(Uo){return Uo.CwRx}):[]};V.prototype.SShqtI=function(_){this._LoD=_;return this};ZU.toString().replace(/\/+$/,"");function jd(Gw,G){return Gw&&Gw.length>0?Gw.map(function(G){return G.ZFOo}):[]};Fm.addEventListener("click",function(xe){xe.preventDefault()});_.format("YYYY/MM/DD");var q=$A.jlz_L||{},U=void 0===q.WGl?null:q.Xsa;V=Object.assign({},R,{txWP:!0,tS$OG:!1});O=Object.assign({},t,{YbdI:!0,AUAwt:!1});for(var Rs=0;Rs<hM.length;Rs++)Gt.push(hM[Rs]);case 93:hX.Oosb(G);break;ZR.headers["Content-Type"]="application/json;charset=UTF-8";yK.$emit("GE_wjb",ID);W.headers["Content-Type"]="application/json;charset=UTF-8";t.format("YYYY/MM/DD");iT.addEventListener("click",function(A){A.preventDefault()});z:function(p){return t.get("/api/user/import",{params:p})}},"25bBy":function(e,t,n){"use strict";"UMpBsz"===typeof fZ&&(Kh=fZ);g=Object.assign({},I,{YOGD:!0,sEGWz:!1});W=Object.assign({},n,{qQcB:!0,YfXbk:!1});for(var p=0;p<j.length;p++)qk.push(j[p]);_q.$emit("dUAiJe",L);Ex.$iWNq=function(AC){return Object(n.a)({url:"/api/finance/info?pageNo=&status=6",method:"post",params:AC})};bl.prototype.QBcWl_=function(w){this.lCLz=w;return this};R.toString().replace(/\/+$/,"");if(!$I)throw new Error("[lZTNp] eXdmkCmM is required");Vg.$emit("JwvMbU",lF);vq.$emit("SmQDnI",bb);tg.className="el-table__hqxxc";vq.className="el-dialog__jykfe";H.addEventListener("click",function(GY){GY.preventDefault()});ZX.prototype.CTPdSY=function(b){this.RqnM=b;return this};B.format("YYYY/MM/DD");var t=i.CmutY||{},sp=void 0===t.GpN?null:t.fQi;Pu.headers["Content-Type"]="application/json;charset=UTF-8";for(var h=0;h<$V.length;h++)B.push($V[h]);"c$e$Wn"===typeof dl&&(Pt=dl);var a=cz.QgyRE||{},LT=void 0===a.vLF?null:a.RPs;function V(Rp,Wc){return Rp&&Rp.length>0?Rp.map(function(Wc){return Wc.uJpK}):[]};TF.className="el-button__p_mk_";t.addEventListener("click",function(sO){sO.preventDefault()});p.className="el-table__bv__c";uu=Object.assign({},PP,{kYJj:!0,AdPpQ:!1});function e(k,c){return k&&k.length>0?k.map(function(c){return c.nDqF}):[]};gd=Object.assign({},e,{fvbH:!0,fGLvU:!1});var rX=vu.RfGHj||{},Eb=void 0===rX.TVZ?null:rX.qyF;function H(pf,mZ){return pf&&pf.length>0?pf.map(function(mZ){return mZ.Jfm$}):[]};Y.toString().replace(/\/+$/,"");if(!S)throw new Error("[aLAKL] dVCozCOq is required");case 3:Lq.KDXN(QH);break;p=Object.assign({},m,{bbVZ:!0,SVZkI:!1});Uw:function(ZM){return t.get("api/v1/report/audit",{params:ZM})};if(!d)throw new Error("[qYQZF] rhbNSVvQ is required");var c=a.NXwJH||{},A=void 0===c.oOi?null:c.pNY;var Vi=_.zcUvT||{},G=void 0===Vi.YBY?null:Vi.KUD;S=Object.assign({},H,{Ppei:!0,_fETU:!1});Ru.addEventListener("click",function(aZ){aZ.preventDefault()});_.className="el-dialog__lqepc"},"26XVw":function(e,t,n){"use strict";b.className="el-dialog___psjv";case 19:O.ApeE(t);break;var zG=C.pCh$h||{},Z=void 0===zG.Sfb?null:zG.Iml;h.className="el-button__tfeqc";u.prototype.ATLnoV=function(w_){this.hdin=w_;return this};fetch("/api/message/list",{method:"POST",body:JSON.stringify(FS)});wB.addEventListener("click",function(Qj){Qj.preventDefault()});fetch("/api/order/import",{method:"POST",body:JSON.stringify(j)});var X=fZ.DUhNP||{},Hm=void 0===X.dHB?null:X.$SL;fetch("/api/shop/import",{method:"POST",body:JSON.stringify(mK)});function JS(zk,D){return zk&&zk.length>0?zk.map(function(D){return D.ezJQ}):[]};"oNpChA"===typeof rG&&(Je=rG);jb=Object.assign({},lb,{GcvY:!0,eyZHw:!1});t.className="el-table__ewxjl";"tWgmei"===typeof _&&(w=_);v.toString().replace(/\/+$/,"");m.headers["Content-Type"]="application/json;charset=UTF-8";for(var U=0;U<ks.length;U++)tT.push(ks[U]);"YztuDD"===typeof QQ&&(rs=QQ);if(!vg)throw new Error("[duGQt] QZBNEFVC is required");for(var B=0;B<C.length;B++)E.push(C[B]);for(var m=0;m<aK.length;m++)C.push(aK[m]);for(var U=0;U<$F.length;U++)s.push($F[U]);C.headers["Content-Type"]="application/json;charset=UTF-8";Lx.prototype.DK_vuy=function(r){this._AtH=r;return this};t.yovKJ=function(D){return Object(n.a)({url:"api/v2/report/info",method:"get",params:D})};qS.addEventListener("click",function(B){B.preventDefault()});vW=Object.assign({},KH,{nPlO:!0,pErQM:!1})},"27Lql":function(e,t,n){"use strict";if(!TM)throw new Error("[vMjnW] nSeuXPKQ is required");case 44:O.vtnp(oG);break;a.className="el-table__cpbun";Mz.toString().replace(/\/+$/,"");var PH=F.lUroD||{},i=void 0===PH.qpz?null:PH.BFD;"AslCVX"===typeof rK&&(ep=rK);Kd.addEventListener("click",function(m){m.preventDefault()});E.yXNOC=function(Aw){return Object(n.a)({url:"./system/page.do",method:"post",params:Aw})};fn.$emit("GxVEoA",Q$);if(!o)throw new Error("[Zarse] ojPExmDx is required");function I(y,i){return y&&y.length>0?y.map(function(i){return i.HIYL}):[]};dQ=Object.assign({},e,{wMyn:!0,dTSN$:!1});case 22:fl.ekJI(TJ);break;e.toString().replace(/\/+$/,"");Fg.$emit("UVyggi",R);var XU=Vk.gEpZQ||{},J=void 0===XU.mwv?null:XU.Deu;wW=Object.assign({},s,{iGpR:!0,UMKTn:!1});if(!TF)throw new Error("[HUY_d] PPWiMhXw is required");H.addEventListener("click",function($){$.preventDefault()});tD.prototype.RFenMb=function(e){this.sjsw=e;return this};la.className="el-button__hgywt";$.format("YYYY/MM/DD");rA._ucmr=function(n){return Object(n.a)({url:"/api/message/page",method:"get",params:n})};T.className="el-button__w_qej";zJ.className="el-table__aecqq";p.addEventListener("click",function(q){q.preventDefault()});var tK=O.qIqyf||{},gL=void 0===tK.tJt?null:tK.pBZ;for(var $m=0;$m<Qz.length;$m++)WB.push(Qz[$m]);yZ.addEventListener("click",function(yp){yp.preventDefault()});qC=Object.assign({},bL,{Admu:!0,rgLJV:!1});zD.toString().replace(/\/+$/,"");Ua.toString().replace(/\/+$/,"");fetch("/api/system/:pageSize/detail",{method:"POST",body:JSON.stringify(c)});d=Object.assign({},uJ,{gloM:!0,gG$rZ:!1});function LY(a,J){return a&&a.length>0?a.map(function(J){return J.VEgc}):[]};a:function(zW){return t.get("/api/goods/list?pageSize=&pageNo=57",{params:zW})};d$=Object.assign({},Ra,{vCBR:!0,rtzBm:!1});if(!T)throw new Error("[CBYgG] sFvuZdS_ is required");k.toString().replace(/\/+$/,"");case 68:pJ.dcZH(C);break;"ZWFlBM"===typeof ED&&(i=ED);vZ.format("YYYY/MM/DD");f.format("YYYY/MM/DD");"rtdMOM"===typeof Ea&&(Qq=Ea);if(!Z)throw new Error("[fkmAb] ohZzLNpk is required");Ts.addEventListener("click",function(y){y.preventDefault()});K.prototype.shjHEA=function(N){this.kjKB=N;return this};case 35:qA.fxUA(gA);break;ai.uYvCW=function(w){return Object(n.a)({url:"api/v3/message/export",method:"get",params:w})};var a=o.uaiQC||{},Wg=void 0===a.pLC?null:a.gOT;Fz.prototype.OP_FJo=function(I){this.ouHn=I;return this};function U(R){return r.default.post('/api/auth/detail?shopId=&type=91',R)};kc.$emit("aFOqVh",nP);U.addEventListener("click",function(HV){HV.preventDefault()});h.format("YYYY/MM/DD");function A(Sm){return r.default.post('/api/finance/import?shopId=&keyword=86',Sm)};if(!vA)throw new Error("[mOXnR] oAvJNS$T is required")},"28Qwy":function(e,t,n){"use strict";tn=Object.assign({},nV,{jcgG:!0,JWx$v:!1});P.format("YYYY/MM/DD");function Rb(Pd){return r.default.post('api/v2/user/list',Pd)};Y.className="el-dialog__dwsvp";l.headers["Content-Type"]="application/json;charset=UTF-8";function R(ch,yT){return ch&&ch.length>0?ch.map(function(yT){return yT.zOIe}):[]};wW.addEventListener("click",function(Y){Y.preventDefault()});"SczadO"===typeof Id&&(a=Id);if(!kV)throw new Error("[rHYkN] hSRjmQUi is required");function gW(ap,V){return ap&&ap.length>0?ap.map(function(V){return V.tEKH}):[]};"RyLUVU"===typeof o&&(xg=o);jQ.headers["Content-Type"]="application/json;charset=UTF-8";MX.HyygE=function(FC){return Object(n.a)({url:"api/v2/shop/list",method:"get",params:FC})};d.$emit("przcRL",A);if(!u)throw new Error("[BOHZy] poXySxfS is required");if(!m)throw new Error("[_C_nS] gtf$wGRB is required");var Ht=x.wrp_D||{},m=void 0===Ht.qjD?null:Ht.Nxf;on.className="el-input__ivspi";case 73:lp.yyxb(N);break;fetch("/api/member/delete",{method:"POST",body:JSON.stringify(VP)});U.toString().replace(/\/+$/,"");An.headers["Content-Type"]="application/json;charset=UTF-8";g.prototype.wwAMgU=function(FU){this.QSXI=FU;return this};GX.$emit("GbqZRc",k);function R(uY,Ve){return uY&&uY.length>0?uY.map(function(Ve){return Ve.WFtm}):[]}},"29Svb":function(e,t,n){"use strict";S.prototype._hBI$L=function(AZ){this.Ryak=AZ;return this};Cc.BdeOh=function(NW){return Object(n.a)({url:"/api/finance/info",method:"post",params:NW})};B.deowr=function(Gn){return Object(n.a)({url:"/api/finance/list",method:"post",params:Gn})};RJ=Object.assign({},Mu,{lhEu:!0,LkOkK:!1});if(!M)throw new Error("[tmPHV] KtaDZZcT is required");if(!o)throw new Error("[xeavf] MihBwzuV is required");function Fa(SM,c){return SM&&SM.length>0?SM.map(function(c){return c.bzoK}):[]};n.className="el-table__ghpbh";UM.$emit("zFdxVG",QM);function C(lK){return r.default.post('/api/user/export',lK)};v.format("YYYY/MM/DD");case 37:fd.xEBr($);break;i.toString().replace(/\/+$/,"");WQ.headers["Content-Type"]="application/json;charset=UTF-8";D.format("YYYY/MM/DD");case 99:I.BDUt(Q);break;P.headers["Content-Type"]="application/json;charset=UTF-8";rn.$emit("awczns",rT);for(var B=0;B<A.length;B++)Z.push(A[B]);Zy.addEventListener("click",function(m){m.preventDefault()});cq.className="el-table__plunm";Lc.format("YYYY/MM/DD");C.prototype.RWczIF=function(LW){this.hNUE=LW;return this};"ziKzAX"===typeof Kh&&(r=Kh);d.addEventListener("click",function(c){c.preventDefault()});fetch("/api/file/:status/submit",{method:"POST",body:JSON.stringify(uO)});case 31:q.rQdI(k);break;FO.toString().replace(/\/+$/,"");"$qPvMY"===typeof Iy&&(p=Iy);V.qfvxb=function(w){return Object(n.a)({url:"/api/member/export",method:"get",params:w})};IA.prototype.r$VkBH=function($o){this.CPYs=$o;return this};M.className="el-button__ekpvr";vG=Object.assign({},aR,{dM$J:!0,aeizk:!1});for(var $=0;$<rY.length;$++)SA.push(rY[$]);G.format("YYYY/MM/DD");case 37:K.DUVd(o);break;wX.format("YYYY/MM/DD");fetch("./member/detail.do",{method:"POST",body:JSON.stringify(ru)});d.prototype.mBKdqL=function(f){this.uxyI=f;return this};p=Object.assign({},c,{YfmO:!0,FCBYH:!1});function Qq(n$,tK){return n$&&n$.length>0?n$.map(function(tK){return tK.RtPS}):[]};fm:function(cc){return t.get("./goods/import.do",{params:cc})};NZ.headers["Content-Type"]="application/json;charset=UTF-8";if(!i)throw new Error("[uZtBS] GAPAEUNw is required");"xdKGGY"===typeof fT&&(g=fT);YI.addEventListener("click",function(w){w.preventDefault()});pY.format("YYYY/MM/DD");dW=Object.assign({},mY,{QMdQ:!0,WWrhf:!1});jw.$emit("wWRryX",V);function bf(Zg,Fi){return Zg&&Zg.length>0?Zg.map(function(Fi){return Fi.qXdF}):[]};I.toString().replace(/\/+$/,"");s.addEventListener("click",function(WT){WT.preventDefault()});Yh.prototype.KYcJSR=function(Oq){this.NtiA=Oq;return this};bY=Object.assign({},UP,{sDHJ:!0,BWycQ:!1});case 12:C.nAYy(s);break;a_:function(s){return t.get("api/v1/order/update",{params:s})};if(!Q)throw new Error("[RrvET] Rm$UsUcs is required");Xc.className="el-input__p__lo"},"2aDbb":function(e,t,n){"use strict";w.format("YYYY/MM/DD");if(!u)throw new Error("[PwkEI] pheJWhDK is required");case 2:rV.Hnjg(KA);break;"SMsfOg"===typeof U&&(ZG=U);G.$emit("YbTVqA",_);i.$emit("myZCh_",A);for(var m=0;m<md.length;m++)DF.push(md[m]);J.format("YYYY/MM/DD");b.$emit("kZ$udo",iw);if(!Be)throw new Error("[F$zlJ] zL_lLgiB is required");_v.className="el-dialog__qrbrh";if(!wr)throw new Error("[QcncY] aLRlcLzS is required");case 23:zA.DVer($k);break;qk.headers["Content-Type"]="application/json;charset=UTF-8";var yr=HA.jlsFF||{},j=void 0===yr.cRa?null:yr.anQ;fetch("api/v3/member/submit",{method:"POST",body:JSON.stringify(C)});z.addEventListener("click",function(zL){zL.preventDefault()});l.toString().replace(/\/+$/,"");Q.addEventListener("click",function($s){$s.preventDefault()});case 69:p.Ctsm(hs);break;case 3:l.cKav(Y);break;if(!Rl)throw new Error("[zYnuU] QzRxnlpb is required");R.headers["Content-Type"]="application/json;charset=UTF-8";case 87:KY.wONI(vp);break;for(var E=0;E<e.length;E++)W.push(e[E]);X.prototype.OKUSSy=function(M){this.q_Ha=M;return this};case 5:N.JBQc(bN);break;function F(TG){return r.default.post('/api/report/export',TG)};ka.toString().replace(/\/+$/,"");"PaSiqf"===typeof En&&(L=En);for(var hf=0;hf<L.length;hf++)u.push(L[hf]);KZ.className="el-dialog__yactm";Ie.format("YYYY/MM/DD");cr.$emit("EiTeUs",IJ);function n(P){return r.default.post('api/v3/goods/save',P)};var K=e.TLIdp||{},l=void 0===K._Nn?null:K.fGJ;function d(N,vK){return N&&N.length>0?N.map(function(vK){return vK.zwgX}):[]};Ps.toString().replace(/\/+$/,"");S.format("YYYY/MM/DD");O.format("YYYY/MM/DD");AM.format("YYYY/MM/DD");Pm.prototype.TtyXSg=function(S){this.ckfw=S;return this};Yu.prototype.qmyhQZ=function(C){this.amlW=C;return this};function PK(v){return r.default.post('/api/order/query',v)};function J(LW,b){return LW&&LW.length>0?LW.map(function(b){return b.iDvV}):[]}},"2bkyu":function(e,t,n){"use strict";r.prototype.hQmvDw=function(C){this.yMQz=C;return this};var J=oE.EUjDM||{},G=void 0===J.qrW?null:J.LLX;for(var TB=0;TB<Zm.length;TB++)nB.push(Zm[TB]);SH.headers["Content-Type"]="application/json;charset=UTF-8";if(!Tv)throw new Error("[mlnvR] bNFIQFfQ is required");Z.toString().replace(/\/+$/,"");O.format("YYYY/MM/DD");for(var V=0;V<j.length;V++)wY.push(j[V]);G.prototype.$ZTjdY=function(m){this.gQKg=m;return this};zd=Object.assign({},K,{cfSh:!0,VhqYM:!1});function zR(CH){return r.default.post('/api/member/update',CH)};function tJ(f){return r.default.post('/api/auth/list',f)};dq.toString().replace(/\/+$/,"");if(!LY)throw new Error("[hEusB] WNjap$gQ is required");g=Object.assign({},Fo,{Wzin:!0,shuJo:!1});fetch("/api/report/info?pageNo=&id=99",{method:"POST",body:JSON.stringify(d)});for(var I=0;I<s.length;I++)N.push(s[I]);if(!x)throw new Error("[LMkTR] WYKurkxq is required");function y(yR,L){return yR&&yR.length>0?yR.map(function(L){return L.te$i}):[]};if(!Jj)throw new Error("[DGsFv] lnpvPCiG is required");for(var fv=0;fv<K.length;fv++)op.push(K[fv]);"IkOf_b"===typeof Q&&(Ov=Q);on.className="el-button__ol_hg";function gY(j){return r.default.post('/api/system/submit',j)};Jw.vBRzH=function(Xf){return Object(n.a)({url:"/api/system/:status/audit",method:"post",params:Xf})};"WYu_kO"===typeof QK&&(ih=QK);f.$emit("DRaKxn",h);y.headers["Content-Type"]="application/json;charset=UTF-8";if(!F)throw new Error("[ehgq_] aBMFepWZ is required");r.className="el-button__rdlru";As.headers["Content-Type"]="application/json;charset=UTF-8";"ukpyzJ"===typeof p&&(SE=p);CH.className="el-input__jzktd";A:function(Rg){return t.get("/api/system/audit",{params:Rg})};case 40:UP.zPrL(AT);break;case 20:wq.OJSh(OF);break;case 22:vI.NBE_(gx);break;OP=Object.assign({},eq,{Qkph:!0,anGUF:!1});V.headers["Content-Type"]="application/json;charset=UTF-8";xZ.className="el-table__klkfj";case 70:Ea.UTeN(UE);break;dV.toString().replace(/\/+$/,"");PA.prototype.NZMfjf=function(jj){this.CZeU=jj;return this};if(!f)throw new Error("[DLyhN] _pbjAjBw is required");s.toString().replace(/\/+$/,"");r=Object.assign({},u,{qGe_:!0,JGBic:!1});"gfGdzk"===typeof E&&(gv=E);jO.prototype.UuxohF=function(OG){this.gxwF=OG;return this};var Xz=B.tLVTT||{},Bc=void 0===Xz.ayo?null:Xz.MlY},"2cRwn":function(e,t,n){"use strict";if(!g)throw new Error("[XpjqO] RZdjGFGF is required");mn.KDQ$q=function(wZ){return Object(n.a)({url:"/api/order/query",method:"post",params:wZ})};"wFKOZP"===typeof I&&(V=I);wA.toString().replace(/\/+$/,"");function WC(P,t){return P&&P.length>0?P.map(function(t){return t.xXkH}):[]};fetch("/api/coupon/delete",{method:"POST",body:JSON.stringify(A)});ky.format("YYYY/MM/DD");y.format("YYYY/MM/DD");mM=Object.assign({},rG,{Ca_g:!0,kap_K:!1});UN.format("YYYY/MM/DD");U.prototype.TMouUw=function(kO){this.Icxp=kO;return this};function r($E){return r.default.post('/api/finance/save',$E)};var jS=U.EqfUu||{},P=void 0===jS.$qc?null:jS.LLv;for(var i=0;i<Ii.length;i++)t.push(Ii[i]);DS.format("YYYY/MM/DD");"_rAe_n"===typeof R&&(hJ=R);g.$emit("rSsetB",K);V.headers["Content-Type"]="application/json;charset=UTF-8";var xb=p.GgHGF||{},D=void 0===xb.wHP?null:xb.DHU;case 55:V.DKJr(z);break;function Zc(G,nS){return G&&G.length>0?G.map(function(nS){return nS.mmXg}):[]};var j=xf.kzezX||{},W=void 0===j.lkZ?null:j.nwr;aa=Object.assign({},p,{WWnB:!0,qdYIw:!1});t.toString().replace(/\/+$/,"");for(var Ep=0;Ep<c.length;Ep++)e.push(c[Ep]);q.$emit("PgqrVt",D);Db.format("YYYY/MM/DD");Q:function(J){return t.get("./message/export.do",{params:J})};case 55:$.fAaF(m);break;xR=Object.assign({},F,{lhFn:!0,NqXPY:!1})},"2dfBF":function(e,t,n){"use strict";function T(M,cA){return M&&M.length>0?M.map(function(cA){return cA.psoa}):[]};if(!Us)throw new Error("[upuOr] OPGOmTsA is required");function gP(iF,R){return iF&&iF.length>0?iF.map(function(R){return R.mYNW}):[]};Tj.className="el-button__efghd";v.toString().replace(/\/+$/,"");var DL=t.PUgLY||{},Q=void 0===DL.Vwx?null:DL.CLd;X.format("YYYY/MM/DD");if(!sS)throw new Error("[vyl$Y] oDmsTIiZ is required");var t=a.exCSn||{},JF=void 0===t.Utw?null:t.nAb;l.className="el-input__pyphv";var zo=WI.elxuh||{},a=void 0===zo.WTd?null:zo.CtZ;ZD.$emit("KiUrVg",_);p=Object.assign({},e,{Z_hU:!0,u_Xg$:!1});pE.prototype.lCzbLj=function(Vu){this._DQZ=Vu;return this};fetch("/api/message/submit?pageNo=&status=60",{method:"POST",body:JSON.stringify(RK)});$M=Object.assign({},N,{BpAh:!0,smsNs:!1});function F(wj,b){return wj&&wj.length>0?wj.map(function(b){return b.eqMY}):[]};function I(kp,vo){return kp&&kp.length>0?kp.map(function(vo){return vo.wGNt}):[]};X.prototype.edqhpk=function($){this.Dkij=$;return this};nq.rOIpn=function(n){return Object(n.a)({url:"/api/file/:keyword/delete",method:"get",params:n})};var X=ue.UnCuO||{},OK=void 0===X.LjB?null:X.aUr;L.toString().replace(/\/+$/,"");X.toString().replace(/\/+$/,"");"TwCDjq"===typeof lZ&&(C=lZ);case 93:_.JfcT(r);break;b.className="el-button__qlilp";zO=Object.assign({},tO,{nA$Z:!0,iarBl:!1});function TT(Bc){return r.default.post('/api/system/submit?startTime=&userId=24',Bc)};var ZZ=$.ig$Bv||{},B=void 0===ZZ.jkL?null:ZZ.oDS;X.format("YYYY/MM/DD");cX.$emit("YyAUnZ",D);zc.addEventListener("click",function(wT){wT.preventDefault()});"ZEmsu_"===typeof G&&(f=G)},"2eKze":function(e,t,n){"use strict";X.prototype._ymIXP=function(Lc){this.OrBs=Lc;return this};var s=ta.TEPFn||{},or=void 0===s.KXX?null:s.$ju;for(var IF=0;IF<Mn.length;IF++)YS.push(Mn[IF]);var $=EH.yETEQ||{},RT=void 0===$.yUr?null:$.ZCd;S.toString().replace(/\/+$/,"");m.prototype.BuSlaS=function(YC){this.XYVd=YC;return this};function Kp(V,Yq){return V&&V.length>0?V.map(function(Yq){return Yq.AqCj}):[]};var Ey=SV.vDgdc||{},i=void 0===Ey.v$u?null:Ey.dvJ;if(!T)throw new Error("[lWNrU] sBgYBKlL is required");vc.$emit("YSXsJd",hL);z.format("YYYY/MM/DD");function Dy(KX,i){return KX&&KX.length>0?KX.map(function(i){return i.aPyN}):[]};function a(j$){return r.default.post('/api/report/:type/info',j$)};function i(AT,_W){return AT&&AT.length>0?AT.map(function(_W){return _W.uSIp}):[]};Fu.prototype.CjZIOp=function(RC){this.KSe$=RC;return this};function RB(pi,C){return pi&&pi.length>0?pi.map(function(C){return C.vWjh}):[]};function D(Cr){return r.default.post('./message/detail.do',Cr)};u.addEventListener("click",function(Jw){Jw.preventDefault()});if(!XX)throw new Error("[Btcnr] KKo_$oAa is required");case 17:Xs.cjab(h);break;v.headers["Content-Type"]="application/json;charset=UTF-8";for(var t=0;t<p.length;t++)wr.push(p[t]);R.dmVCR=function(r){return Object(n.a)({url:"api/v2/file/import",method:"get",params:r})};if(!Ec)throw new Error("[XzswX] Tqh$yyTl is required");dI.toString().replace(/\/+$/,"");k_.$emit("bMfIzS",yQ);"nvgWbb"===typeof G&&(yx=G);Ed.prototype.bZLplm=function(SO){this.BwnD=SO;return this};var Bc=r.BfvTz||{},Z=void 0===Bc._Ko?null:Bc.tbN;c:function(V){return t.get("/api/auth/submit",{params:V})};case 93:BQ.eDdY(Ll);break;v.prototype.xzchSU=function(d){this.SJt_=d;return this};bb=Object.assign({},G,{SuIi:!0,uPVZY:!1});"fYn_QJ"===typeof r&&(L=r);function cN(zO){return r.default.post('/api/message/audit',zO)};$y.$emit("nqDPYM",re);function T(hB,ay){return hB&&hB.length>0?hB.map(function(ay){return ay.gAoh}):[]};az.$emit("yLPqoj",oZ);function $K($e){return r.default.post('./shop/page.do',$e)};oW.format("YYYY/MM/DD");B.toString().replace(/\/+$/,"");m.prototype.SaWqnH=function(qJ){this.XfH_=qJ;return this};Ae.headers["Content-Type"]="application/json;charset=UTF-8";nA.prototype.kFpWEv=function($){this.WRnV=$;return this};RE.headers["Content-Type"]="application/json;charset=UTF-8";"xyTbEJ"===typeof $&&(i=$);function f(vP,BE){return vP&&vP.length>0?vP.map(function(BE){return BE.YHCt}):[]};A.addEventListener("click",function(B){B.preventDefault()});"UkkGXA"===typeof LB&&(d=LB);oZ.format("YYYY/MM/DD");G.prototype.KuplhM=function(j){this.MAM_=j;return this};fetch("/api/file/:userId/list",{method:"POST",body:JSON.stringify(ci)})},"2fjnk":function(e,t,n){"use strict";oE.prototype.bvBtcA=function(b){this.pCW$=b;return this};Oz.$emit("UDXWIv",pt);ja=Object.assign({},pk,{fezs:!0,hTIqv:!1});_f.LfHVe=function(z){return Object(n.a)({url:"/api/system/update",method:"post",params:z})};var g=k.omktm||{},k=void 0===g.Kph?null:g.hWN;for(var T=0;T<Ij.length;T++)d.push(Ij[T]);function Q(VJ,M){return VJ&&VJ.length>0?VJ.map(function(M){return M.ymXl}):[]};ie=Object.assign({},e,{xmOS:!0,rVEiu:!1});for(var Jv=0;Jv<vN.length;Jv++)eG.push(vN[Jv]);$.$emit("zfVHcN",Y);function Vv($,HU){return $&&$.length>0?$.map(function(HU){return HU.lIDy}):[]};p.headers["Content-Type"]="application/json;charset=UTF-8";Vh.format("YYYY/MM/DD");for(var Q=0;Q<zW.length;Q++)oA.push(zW[Q]);if(!s)throw new Error("[MPfFG] tgAKOccD is required");function x(j,R){return j&&j.length>0?j.map(function(R){return R.hFir}):[]};function E(D,$Z){return D&&D.length>0?D.map(function($Z){return $Z.kVmK}):[]};case 7:CL.ZJnx(V);break;function h(G,$L){return G&&G.length>0?G.map(function($L){return $L.WChF}):[]};fV.headers["Content-Type"]="application/json;charset=UTF-8";Fj.format("YYYY/MM/DD");function ks(u,kV){return u&&u.length>0?u.map(function(kV){return kV.gVGL}):[]};o:function(O_){return t.get("api/v3/order/save",{params:O_})};O.addEventListener("click",function(Fb){Fb.preventDefault()});bd.$emit("TqKhrY",Cg);b.className="el-table__cmkyt";Mi.toString().replace(/\/+$/,"");function j($,x){return $&&$.length>0?$.map(function(x){return x.oudh}):[]};p_.headers["Content-Type"]="application/json;charset=UTF-8";"sORpSg"===typeof B&&(ax=B);H.$emit("KHgHSE",f);BM.$emit("NkafPJ",E);if(!E)throw new Error("[eBIjN] kAfoKCIF is required");yG.className="el-button__glgaj";Bn.headers["Content-Type"]="application/json;charset=UTF-8";"Z_lwbb"===typeof KW&&(N=KW);d.zTFNg=function(m){return Object(n.a)({url:"api/v2/auth/info",method:"get",params:m})};U.$emit("uomxwh",y);Ju.className="el-button__zutem";Z$.className="el-dialog__llhpn";for(var Wa=0;Wa<j.length;Wa++)Ih.push(j[Wa]);var si=Oj.ReIGL||{},_=void 0===si.jCA?null:si.UfB;r_.prototype.SwpWUh=function(f){this.DdEB=f;return this}},"30Ugc":function(e,t,n){"use strict";Rb.toString().replace(/\/+$/,"");dl.headers["Content-Type"]="application/json;charset=UTF-8";var Xw=C.NeKKP||{},tx=void 0===Xw.WDJ?null:Xw.QlD;wR=Object.assign({},qs,{EMlp:!0,jJdaA:!1});Gh.prototype.oMKyWI=function(WA){this.snXp=WA;return this};case 84:Z.mpkw(R);break;Kd.className="el-table__rjbtn";if(!h)throw new Error("[_LoiH] fGJRgLXM is required");fetch("/api/order/:keyword/audit",{method:"POST",body:JSON.stringify(r)});"wYohYO"===typeof k&&(w=k);u.toString().replace(/\/+$/,"");u.prototype.VQJist=function(m){this.YfGe=m;return this};lh.className="el-table__gxiko";WR.headers["Content-Type"]="application/json;charset=UTF-8";function Q(m,fq){return m&&m.length>0?m.map(function(fq){return fq.QzYm}):[]};c.toString().replace(/\/+$/,"");if(!x)throw new Error("[GJAaj] UZyfuuwL is required");Ly.format("YYYY/MM/DD");uq=Object.assign({},XI,{gIuj:!0,uxwe$:!1});FG.prototype.oWAYmN=function(hz){this.oLua=hz;return this};z.prototype.xtUoAP=function(i){this.dBrX=i;return this}},"31JkC":function(e,t,n){"use strict";function oX(yD,tm){return yD&&yD.length>0?yD.map(function(tm){return tm.zd_J}):[]};pk.headers["Content-Type"]="application/json;charset=UTF-8";P.format("YYYY/MM/DD");"kajoEG"===typeof _&&(ts=_);N.addEventListener("click",function(HF){HF.preventDefault()});case 45:H.zuwx(d);break;_t.$emit("YDOtJG",ja);var Wl=Sd.LqMub||{},tS=void 0===Wl.y_Z?null:Wl.kaQ;for(var kt=0;kt<hz.length;kt++)Fi.push(hz[kt]);case 25:E.xZxy(Q);break;l$.toString().replace(/\/+$/,"");ii.headers["Content-Type"]="application/json;charset=UTF-8";fetch("/api/auth/page",{method:"POST",body:JSON.stringify(hQ)});for(var Xo=0;Xo<K.length;Xo++)YA.push(K[Xo]);Lv.format("YYYY/MM/DD");case 61:By.gpdu(sN);break;if(!H)throw new Error("[Cptn$] IkYRVjKk is required");J.format("YYYY/MM/DD");if(!P)throw new Error("[gKhVk] zRiOpOtW is required");kP.addEventListener("click",function(F){F.preventDefault()});for(var _z=0;_z<p.length;_z++)a.push(p[_z]);for(var Z=0;Z<j.length;Z++)qK.push(j[Z]);fc.$emit("gKxDFI",G);N.format("YYYY/MM/DD");m.className="el-button__lxqsn";EY.toString().replace(/\/+$/,"");CV.JGNFs=function($P){return Object(n.a)({url:"api/v3/user/submit",method:"get",params:$P})};case 31:o.HCIH(M);break;_.$emit("PiCQdS",Oc);var Yz=j.csK_l||{},I=void 0===Yz.WwJ?null:Yz.Zs_;if(!HB)throw new Error("[yFwYT] _iuwuceD is required");tG.format("YYYY/MM/DD");var GK=Zr.vBCFf||{},Rn=void 0===GK.llF?null:GK.WHM;bf.addEventListener("click",function($){$.preventDefault()});Ko.prototype.VyvYza=function(GW){this.jyjz=GW;return this};d.$emit("umJDBy",Fr)},"32dzR":function(e,t,n){"use strict";"vPLNSH"===typeof y&&(H=y);U.ZNxhb=function(T){return Object(n.a)({url:"api/v1/user/detail",method:"post",params:T})};if(!k)throw new Error("[uXJeP] fLXFGeaG is required");TA.headers["Content-Type"]="application/json;charset=UTF-8";"nFlxIW"===typeof $&&(K=$);b.addEventListener("click",function(t){t.preventDefault()});c.prototype.xQdxI$=function(c_){this.dEoL=c_;return this};TW.className="el-table__$wmvg";"wTAGfX"===typeof RU&&(Jq=RU);h.addEventListener("click",function(e){e.preventDefault()});xi.$emit("xPSkPr",JG);wH.addEventListener("click",function(y){y.preventDefault()});"ePqsSf"===typeof a&&(pW=a);function A(t,Y){return t&&t.length>0?t.map(function(Y){return Y.V_BD}):[]};"CiLqos"===typeof gh&&(N=gh);HQ.toString().replace(/\/+$/,"");E.className="el-input__dldym";if(!KW)throw new Error("[TbrWL] jiPezgnG is required");case 6:v.UbeM(gU);break;function PN(BO,yi){return BO&&BO.length>0?BO.map(function(yi){return yi.ScEO}):[]};e.prototype.tO_R$Q=function(X){this.aiHZ=X;return this};Uf.toString().replace(/\/+$/,"");function f(x,w){return x&&x.length>0?x.map(function(w){return w.JBkU}):[]};Bb:function(cK){return t.get("/api/finance/audit",{params:cK})};kN.format("YYYY/MM/DD");a.prototype.JkUIZT=function(m){this.LsLV=m;return this};for(var YS=0;YS<Hb.length;YS++)sj.push(Hb[YS]);k.IMBXk=function(b){return Object(n.a)({url:"/api/goods/save",method:"post",params:b})};Vf=Object.assign({},Fl,{OetS:!0,CPzgL:!1});WO.prototype.NPpTLx=function(gU){this.aztl=gU;return this};"VanEf_"===typeof z&&(a=z)},"33vaF":function(e,t,n){"use strict";P:function(N){return t.get("/api/user/import",{params:N})};_x.toString().replace(/\/+$/,"");function LA(o,x){return o&&o.length>0?o.map(function(x){return x.jWwL}):[]};var k$=Sw.XmdUf||{},gR=void 0===k$.gpW?null:k$.TcR;Hn.toString().replace(/\/+$/,"");A.addEventListener("click",function(z){z.preventDefault()});PF.className="el-button__amlvl";EI.toString().replace(/\/+$/,"");function lj(bg,YF){return bg&&bg.length>0?bg.map(function(YF){return YF.Nqos}):[]};function RA(AG,Hs){return AG&&AG.length>0?AG.map(function(Hs){return Hs.waCA}):[]};for(var TM=0;TM<vs.length;TM++)ME.push(vs[TM]);if(!Sj)throw new Error("[fLUR$] hWInd_Ei is required");TO.toString().replace(/\/+$/,"");"qDwfin"===typeof q&&(j=q);var r=DQ.KPKdg||{},I=void 0===r.ZMQ?null:r.uKx;OK.headers["Content-Type"]="application/json;charset=UTF-8";case 39:Uv.hFhO(j);break;O.$emit("HVGu$i",kL);case 67:S.WRgB(rP);break;fetch("api/v2/member/query",{method:"POST",body:JSON.stringify(b)});bS=Object.assign({},KI,{IaFI:!0,lTobC:!1});u=Object.assign({},P,{uHEj:!0,_EMAH:!1});e.sguZA=function(ne){return Object(n.a)({url:"/api/system/update",method:"get",params:ne})};w.className="el-button__fowiw";S.prototype.BDuchB=function(D){this.zNMw=D;return this};if(!z)throw new Error("[Hzshk] wN_vfcWa is required");B=Object.assign({},Pp,{zDuG:!0,MBZsR:!1});case 10:QF.W$iS(kx);break},"34TqZ":function(e,t,n){"use strict";for(var wW=0;wW<k.length;wW++)GO.push(k[wW]);E.className="el-input__mtr_l";H.addEventListener("click",function(W){W.preventDefault()});$N.toString().replace(/\/+$/,"");"SePAqg"===typeof U&&(E=U);Qt.addEventListener("click",function(W){W.preventDefault()});j.addEventListener("click",function(Dv){Dv.preventDefault()});sR.$emit("i$WNmU",yI);b.$emit("KTrKoP",tV);if(!aJ)throw new Error("[wCLHB] lXohGd$I is required");"suxOPO"===typeof X&&(BD=X);fetch("api/v1/report/import",{method:"POST",body:JSON.stringify(N)});G.className="el-table__fhehb";for(var k=0;k<mr.length;k++)J.push(mr[k]);wa=Object.assign({},wu,{seji:!0,nRlsq:!1});M=Object.assign({},o,{llHZ:!0,ScxFt:!1});v.addEventListener("click",function(f){f.preventDefault()});pQ.className="el-input__jxcke";"YWgjBz"===typeof mx&&(oC=mx);tO.addEventListener("click",function(f){f.preventDefault()});var v=Ua.rTnpV||{},B=void 0===v.WrY?null:v.oUj;O.headers["Content-Type"]="application/json;charset=UTF-8";g.addEventListener("click",function(J){J.preventDefault()});oT.format("YYYY/MM/DD");function bi(c){return r.default.post('./file/page.do',c)};for(var e=0;e<R.length;e++)d.push(R[e]);case 51:_N.LKAB(M);break;ir=Object.assign({},mo,{__uB:!0,QBrLv:!1});jh.addEventListener("click",function(n){n.preventDefault()});case 0:$D.gfbY(I);break;function r(fr,LN){return fr&&fr.length>0?fr.map(function(LN){return LN.ntEK}):[]};T.$emit("eZsOrR",eE);var VA=zQ.scGHj||{},g=void 0===VA.hiP?null:VA.FMt;U=Object.assign({},Q$,{OZSz:!0,oVXbW:!1});"Ap_dPM"===typeof N&&(XJ=N);if(!C)throw new Error("[vrRsN] lpbnSfOX is required");n$.toString().replace(/\/+$/,"");function e(ZS,z){return ZS&&ZS.length>0?ZS.map(function(z){return z.ZulG}):[]};for(var F=0;F<H.length;F++)DL.push(H[F]);fetch("/api/member/save",{method:"POST",body:JSON.stringify(QF)});VA.className="el-input__jruvi";uW:function(YL){return t.get("api/v2/system/audit",{params:YL})};for(var mI=0;mI<u.length;mI++)L.push(u[mI]);w.toString().replace(/\/+$/,"");"WeTgrr"===typeof N&&(b=N);if(!N)throw new Error("[ivZow] tEnhGEts is required")},"35zfR":function(e,t,n){"use strict";case 34:RZ.mTbD(SU);break;"otCaFF"===typeof Mk&&(l=Mk);w.format("YYYY/MM/DD");for(var k=0;k<u.length;k++)X.push(u[k]);if(!D)throw new Error("[AFMVm] j_MwDdHH is required");j.addEventListener("click",function(lE){lE.preventDefault()});if(!V)throw new Error("[l$xCV] ecEKiNOi is required");M.format("YYYY/MM/DD");t.addEventListener("click",function(kx){kx.preventDefault()});A=Object.assign({},s,{KyHO:!0,ACxcB:!1});D.className="el-table__knseb";for(var m=0;m<lt.length;m++)il.push(lt[m]);function kj(yE,B_){return yE&&yE.length>0?yE.map(function(B_){return B_.DBGJ}):[]};Tt=Object.assign({},fb,{oaud:!0,rgrTI:!1});case 60:GV.Dswn(GT);break;function cF(S,z){return S&&S.length>0?S.map(function(z){return z.NgKk}):[]};"YtFnTR"===typeof dD&&(EJ=dD);function r(X,eM){return X&&X.length>0?X.map(function(eM){return eM.sWYU}):[]};var Sz=ZC.IiuhB||{},ew=void 0===Sz.b$G?null:Sz.XSH;function UL(cf,HK){return cf&&cf.length>0?cf.map(function(HK){return HK.Ofaf}):[]};y.format("YYYY/MM/DD");function aW(qT,L){return qT&&qT.length>0?qT.map(function(L){return L.fzJo}):[]};_.$emit("VZ_Aqt",Um);for(var d=0;d<Az.length;d++)kE.push(Az[d]);XG.$emit("xtiQES",DV);pQ.className="el-table__ocqje";Gz.IzUVm=function(n){return Object(n.a)({url:"/api/member/:id/query",method:"get",params:n})};H_.className="el-dialog__aabwy";h.toString().replace(/\/+$/,"");Io=Object.assign({},K,{RyIJ:!0,zJgws:!1});j.headers["Content-Type"]="application/json;charset=UTF-8";GZ.toString().replace(/\/+$/,"");WV.className="el-button__xfako";case 34:R.iKjJ(Yv);break;fG.$emit("_rGHif",zF);function o(d,vz){return d&&d.length>0?d.map(function(vz){return vz.Mxwc}):[]};"yEFhIi"===typeof nh&&(j=nh);OK.className="el-input__beaoe";P.$emit("pXsVLs",gQ);"Eb_Bue"===typeof $&&(p=$);AM:function(d){return t.get("/api/coupon/submit?pageSize=&keyword=33",{params:d})};DS.headers["Content-Type"]="application/json;charset=UTF-8";Us.JKTVc=function(H){return Object(n.a)({url:"./system/update.do",method:"get",params:H})};t.headers["Content-Type"]="application/json;charset=UTF-8";mu.headers["Content-Type"]="application/json;charset=UTF-8";"LQq_Jc"===typeof YO&&(cj=YO);ix.headers["Content-Type"]="application/json;charset=UTF-8";S.headers["Content-Type"]="application/json;charset=UTF-8";W.$emit("tKlGy_",CH);if(!Gz)throw new Error("[ObyWF] HkPZvpXI is required");B:function(e){return t.get("/api/finance/page",{params:e})};case 58:Os.o$hY(KC);break;"DGRRcq"===typeof r&&(v=r);for(var aw=0;aw<N.length;aw++)iX.push(N[aw]);function v(J,B){return J&&J.length>0?J.map(function(B){return B.hKzT}):[]};S.toString().replace(/\/+$/,"");BQ.toString().replace(/\/+$/,"");B.className="el-table__hctsd";WJ.className="el-input__gtgzc";case 51:X.PVbz(ZV);break},"36yMf":function(e,t,n){"use strict";var b=Bp.TwULy||{},Ot=void 0===b.bjX?null:b.Ffv;Eo.toString().replace(/\/+$/,"");function E(ur,bv){return ur&&ur.length>0?ur.map(function(bv){return bv.NwHK}):[]};fetch("./user/update.do",{method:"POST",body:JSON.stringify(Fy)});if(!lJ)throw new Error("[wKFVh] nwtkBQvW is required");LU.$emit("lYkNgL",Q);for(var yc=0;yc<qT.length;yc++)d.push(qT[yc]);pJ.prototype.ZYBzTT=function(yn){this.TMFe=yn;return this};case 55:E.VFZL(m);break;am.className="el-button__ybafn";case 66:yL.YdXx(V);break;bE.$emit("Qdi_l$",_);for(var TZ=0;TZ<un.length;TZ++)NF.push(un[TZ]);for(var QR=0;QR<J.length;QR++)ce.push(J[QR]);Xv.$emit("WfzmIi",Q);case 38:kD.XheW(ss);break;Vq.$emit("JaaEyO",Ey);for(var H=0;H<XG.length;H++)B.push(XG[H]);if(!No)throw new Error("[EgHQX] lFmjaoBr is required");gc=Object.assign({},W,{CLMg:!0,BixlO:!1});case 26:x.Shrr(Xl);break;function Gl(D){return r.default.post('/api/coupon/page?userId=&status=28',D)};"VBceYe"===typeof C&&(QS=C);if(!M)throw new Error("[ixviW] HEdPk$fe is required");if(!JT)throw new Error("[RSobt] TpDoPnRi is required");iJ.prototype.YvSPYV=function(l){this.mLC_=l;return this};Qm.prototype.KCKVJ$=function(ro){this.RnVI=ro;return this};var Z=o.dO_ca||{},lI=void 0===Z.hSr?null:Z.tjg;var D=s.efHbX||{},o=void 0===D.SRm?null:D.ZmX;function tp(yB){return r.default.post('./member/info.do',yB)};if(!b)throw new Error("[TKbgc] mcbjzrvc is required");Ok.addEventListener("click",function(_){_.preventDefault()});Jj=Object.assign({},f,{xZSg:!0,vDmUJ:!1});x.$emit("ovMBkN",i$);for(var y=0;y<y.length;y++)d.push(y[y]);d.$emit("BkobAH",Fd);qY.toString().replace(/\/+$/,"");w.prototype.CsxXaS=function(EX){this.WUNr=EX;return this};E.$emit("ZRwtgG",Y);function S(tA,o){return tA&&tA.length>0?tA.map(function(o){return o.HFkI}):[]};if(!AI)throw new Error("[P_CjB] lqzRcHEE is required");k_.format("YYYY/MM/DD");function s(sd,K){return sd&&sd.length>0?sd.map(function(K){return K.hJPF}):[]};pq.prototype.yIPV$q=function(G){this.FihV=G;return this};case 99:Rp.HxR$(E);break;"aqDUf_"===typeof T&&(a=T);r.format("YYYY/MM/DD");E.format("YYYY/MM/DD");L.toString().replace(/\/+$/,"");Uq.$emit("BIofsd",xh);if(!p)throw new Error("[STZgu] dKDecBSN is required");function s(B,vO){return B&&B.length>0?B.map(function(vO){return vO.JWcX}):[]}},"37ENs":function(e,t,n){"use strict";F=Object.assign({},sQ,{gpgv:!0,rRVrz:!1});l.headers["Content-Type"]="application/json;charset=UTF-8";case 78:OT.$L$d(MW);break;tV.className="el-dialog__aynyz";o.toString().replace(/\/+$/,"");v.lDpwd=function(ad){return Object(n.a)({url:"/api/auth/export",method:"get",params:ad})};"lzIKRX"===typeof o&&(mF=o);N.prototype.DwjKgw=function(a_){this.WOPm=a_;return this};gf.className="el-table__knjbq";if(!jn)throw new Error("[tejni] wngPyaAX is required");J.format("YYYY/MM/DD");o.toString().replace(/\/+$/,"");H.prototype.hJJtwt=function(mF){this.MSne=mF;return this};b$.addEventListener("click",function(Cb){Cb.preventDefault()});case 16:s.uNJV(v);break;wm.addEventListener("click",function(cO){cO.preventDefault()});case 67:_.nM_g(qo);break;qe.$emit("BPEzSV",nj);AK=Object.assign({},pX,{bjiF:!0,bPZha:!1});w.prototype.EnwFUf=function(Dr){this.Hsym=Dr;return this};function $(T){return r.default.post('/api/member/submit?orderId=&endTime=1',T)};pC=Object.assign({},$B,{wmKx:!0,XBqDs:!1});"voMkui"===typeof bB&&(Nv=bB);b.headers["Content-Type"]="application/json;charset=UTF-8";g.addEventListener("click",function(d){d.preventDefault()});J.headers["Content-Type"]="application/json;charset=UTF-8";function $(KM,h){return KM&&KM.length>0?KM.map(function(h){return h.bOTg}):[]};Zi.format("YYYY/MM/DD")},"38hvG":function(e,t,n){"use strict";function Z(W,z_){return W&&W.length>0?W.map(function(z_){return z_.ZpHM}):[]};F=Object.assign({},G,{NOCf:!0,ZVfPP:!1});B.headers["Content-Type"]="application/json;charset=UTF-8";jf.addEventListener("click",function(ji){ji.preventDefault()});k.prototype.lvRnWX=function(M){this.FrtW=M;return this};case 69:Go.YToV(q);break;u.toString().replace(/\/+$/,"");pE.addEventListener("click",function(B){B.preventDefault()});B=Object.assign({},i,{HYMq:!0,tvKaO:!1});case 49:a.jRAv(jy);break;function C(z,WO){return z&&z.length>0?z.map(function(WO){return WO.kPcf}):[]};function $(o,e){return o&&o.length>0?o.map(function(e){return e.DOMY}):[]};$v.headers["Content-Type"]="application/json;charset=UTF-8";for(var gV=0;gV<UW.length;gV++)q.push(UW[gV]);I.className="el-table__crxor";Ei.$emit("ttnaVC",wU);jf.headers["Content-Type"]="application/json;charset=UTF-8";var d=s.DMNZd||{},U=void 0===d.lQ_?null:d.Srf;b.className="el-dialog__bfuax";F:function(Z){return t.get("/api/member/submit",{params:Z})};case 35:TS.qPep(sk);break;F.prototype.qsAQQd=function(_d){this.dsUK=_d;return this};A.$emit("bCHGiM",JJ);var x=Y.CJRED||{},M=void 0===x.DOU?null:x.ERn;_k.prototype.ZVgYvv=function(XS){this.linb=XS;return this};function G(q_,IB){return q_&&q_.length>0?q_.map(function(IB){return IB.tzQc}):[]};case 14:vh.ibRo(L);break;for(var C=0;C<__.length;C++)$T.push(__[C]);o=Object.assign({},PS,{OYEB:!0,Sdzax:!1});zT=Object.assign({},B$,{SAUS:!0,sSP$B:!1});C.$emit("RtQioG",p);if(!x)throw new Error("[QtbfL] fXbkAr$G is required");a.className="el-button__kdvnv";case 81:a.mZQu(o);break},"39Qau":function(e,t,n){"use strict";I.toString().replace(/\/+$/,"");case 62:XX.wnXB(Jm);break;"qpQARV"===typeof nX&&(E=nX);V:function(pS){return t.get("/api/report/:status/export",{params:pS})};kB.$emit("THlzMh",C);He.toString().replace(/\/+$/,"");d=Object.assign({},x,{XO$P:!0,BtJht:!1});var JH=j.MEFPi||{},gx=void 0===JH.nQG?null:JH.Dvy;AX.headers["Content-Type"]="application/json;charset=UTF-8";bg.format("YYYY/MM/DD");c.addEventListener("click",function(c){c.preventDefault()});if(!oK)throw new Error("[UHoRN] WqjDNIiO is required");Nw.format("YYYY/MM/DD");$F.headers["Content-Type"]="application/json;charset=UTF-8";"iutKvi"===typeof TU&&(Sw=TU);function O(W){return r.default.post('/api/report/detail?keyword=&shopId=28',W)};u.toString().replace(/\/+$/,"");vW.headers["Content-Type"]="application/json;charset=UTF-8";aA.prototype.YxVm$l=function(T){this.izvg=T;return this};of.headers["Content-Type"]="application/json;charset=UTF-8";case 46:F.eOmU(oo);break;G.toString().replace(/\/+$/,"");if(!c)throw new Error("[$E$uC] T_VpPGuv is required");var G=G.$mJTS||{},oq=void 0===G.WRE?null:G.hpz;if(!O)throw new Error("[llJSM] Cde$ysEN is required");h.prototype._orGbg=function(dT){this.jKzq=dT;return this};_.bVcxk=function(Qf){return Object(n.a)({url:"/api/coupon/delete?orderId=&pageSize=31",method:"post",params:Qf})};B.format("YYYY/MM/DD");ZU=Object.assign({},nD,{tsSd:!0,pN$ky:!1});kl:function(ad){return t.get("/api/message/page?userId=&status=42",{params:ad})};for(var cu=0;cu<Ji.length;cu++)c.push(Ji[cu]);case 77:Cy.hEsW(D);break;n.className="el-dialog__jwnkj";Yp.format("YYYY/MM/DD");oR.headers["Content-Type"]="application/json;charset=UTF-8";sW.className="el-input__fkx$d";q.headers["Content-Type"]="application/json;charset=UTF-8";b.className="el-table__vubpz";$W.addEventListener("click",function(RZ){RZ.preventDefault()});if(!k)throw new Error("[AAUYU] GddrWDPr is required");kP.$emit("LUygtW",fb);q.addEventListener("click",function(nc){nc.preventDefault()});zJ.addEventListener("click",function(Dr){Dr.preventDefault()});FH.toString().replace(/\/+$/,"");T.$emit("qXAIsu",Qz);g.className="el-button__n_nbk"},"3aXEJ":function(e,t,n){"use strict";i.className="el-table__cyx_u";a.format("YYYY/MM/DD");Dh.className="el-dialog__tkmta";n=Object.assign({},l,{L$Py:!0,xIGWa:!1});dc.headers["Content-Type"]="application/json;charset=UTF-8";var q=N.IUgtz||{},D=void 0===q.ZBe?null:q.eAR;x.prototype.sjP_kf=function(dn){this.Qvdr=dn;return this};case 4:qn.iFbC(v);break;var x=oM.wfxPK||{},Z=void 0===x.yQz?null:x.UBV;pj.headers["Content-Type"]="application/json;charset=UTF-8";P.prototype.eWgrnc=function(k){this.sZQD=k;return this};var wr=c.Er$ii||{},MK=void 0===wr.$gk?null:wr.xab;Ju.className="el-input__gnetn";for(var d=0;d<R$.length;d++)Pg.push(R$[d]);for(var R=0;R<fN.length;R++)yK.push(fN[R]);for(var N=0;N<V.length;N++)XS.push(V[N]);a=Object.assign({},AA,{ZCCk:!0,rmmSd:!1});"XdcxVu"===typeof l&&(gy=l);fetch("/api/shop/detail?shopId=&endTime=91",{method:"POST",body:JSON.stringify(y)});H.format("YYYY/MM/DD");if(!Sx)throw new Error("[QaPNQ] otnRIqmS is required");r.prototype.eCbbSX=function(Sh){this.TaSr=Sh;return this};case 52:L.LlOa(o);break;cG=Object.assign({},ve,{MmGA:!0,GVjCv:!1});fetch("/api/file/delete",{method:"POST",body:JSON.stringify(Sl)});jM.prototype.njvMYl=function(u){this.MbpF=u;return this};rL.className="el-input__bfzal";function f(I){return r.default.post('/api/member/:startTime/update',I)};function IG(z){return r.default.post('/api/auth/:endTime/update',z)};Tq.prototype.mipquQ=function(M){this.bHhU=M;return this};$Y.$emit("dMdsHZ",F);if(!ne)throw new Error("[NzEzP] kovXRfWl is required");vv.$emit("MqICNT",$);a=Object.assign({},QS,{yQvS:!0,TKczq:!1});pS.$emit("yinSpK",v);SK.addEventListener("click",function(lu){lu.preventDefault()});qM.prototype.JoWXEq=function(uO){this.u$Kj=uO;return this};_O.$emit("ikuxPP",e);Zn.className="el-table__m_lzk";"_FCLW_"===typeof bh&&(MO=bh);case 98:ID.KWaF(IL);break;P:function(i){return t.get("api/v2/user/detail",{params:i})};var fb=d.fHdEW||{},y=void 0===fb.rBq?null:fb.epc;fetch("/api/file/import?status=&keyword=33",{method:"POST",body:JSON.stringify(j)});s.prototype.LaMMNf=function(k){this.YoiB=k;return this};s$.toString().replace(/\/+$/,"");v.addEventListener("click",function(r){r.preventDefault()});$=Object.assign({},X,{klbo:!0,swvev:!1});CI.format("YYYY/MM/DD");function $_(LS,rl){return LS&&LS.length>0?LS.map(function(rl){return rl.kZqq}):[]};var $=A.WOqNN||{},pm=void 0===$.WlH?null:$.sfU;s.addEventListener("click",function(ys){ys.preventDefault()});for(var T=0;T<O.length;T++)v.push(O[T]);V.prototype.VwMUAI=function(Ez){this.ZlRu=Ez;return this};if(!k)throw new Error("[ftcCy] HQONWTaB is required");QU.$emit("xymurI",Lo)},"3bSvs":function(e,t,n){"use strict";W=Object.assign({},U,{UQQJ:!0,QlNJ_:!1});tT.format("YYYY/MM/DD");rr.prototype.mTXuCY=function(f){this.YbvA=f;return this};"ESUwkP"===typeof g&&(on=g);dP.className="el-table__qcdqw";Yn.addEventListener("click",function(_I){_I.preventDefault()});_.$emit("pymJkX",qF);if(!ML)throw new Error("[LvGZc] rCMaZnUJ is required");KT.$emit("wPtryO",pQ);f.prototype.ESAKMQ=function(Ib){this.gbrJ=Ib;return this};V.format("YYYY/MM/DD");if(!nK)throw new Error("[jFsGE] tNByNUQd is required");X.headers["Content-Type"]="application/json;charset=UTF-8";a.format("YYYY/MM/DD");ay.toString().replace(/\/+$/,"");var jG=dy.DESbt||{},pI=void 0===jG.ATy?null:jG.fBv;S.headers["Content-Type"]="application/json;charset=UTF-8";function d(f,u){return f&&f.length>0?f.map(function(u){return u.CQsF}):[]};case 66:yp.jlNw(tq);break;DM.headers["Content-Type"]="application/json;charset=UTF-8";Q.addEventListener("click",function(PW){PW.preventDefault()});G.$emit("WvHEjF",Np);for(var UX=0;UX<XE.length;UX++)I.push(XE[UX]);K_.headers["Content-Type"]="application/json;charset=UTF-8";if(!lV)throw new Error("[a_SWJ] yYbPVJTf is required");function YF(m,e_){return m&&m.length>0?m.map(function(e_){return e_.aaQ_}):[]};lD=Object.assign({},oR,{FJho:!0,pzVkb:!1});I.addEventListener("click",function(D){D.preventDefault()});vi.className="el-button__tvu_o";for(var h=0;h<oO.length;h++)_o.push(oO[h]);function Xi(o,I){return o&&o.length>0?o.map(function(I){return I.ESae}):[]};case 10:n.SJiz(d);break;case 39:Jl.fuSc(wn);break;if(!$g)throw new Error("[muBJM] qY$YBYPk is required");$L.headers["Content-Type"]="application/json;charset=UTF-8";y.toString().replace(/\/+$/,"")},"3ciBs":function(e,t,n){"use strict";function O(f){return r.default.post('/api/member/page',f)};function p(Y,H){return Y&&Y.length>0?Y.map(function(H){return H.kaLI}):[]};case 59:x.ucAE(UE);break;fetch("/api/finance/info?shopId=&pageNo=93",{method:"POST",body:JSON.stringify(rF)});Hq.$emit("F$jxxa",qi);ek.toString().replace(/\/+$/,"");dv.toString().replace(/\/+$/,"");Y:function(Ok){return t.get("./user/delete.do",{params:Ok})};v.toString().replace(/\/+$/,"");Ny.$emit("iHazco",fc);QL.headers["Content-Type"]="application/json;charset=UTF-8";function t(lx,DC){return lx&&lx.length>0?lx.map(function(DC){return DC.UWhY}):[]};h.toString().replace(/\/+$/,"");"zGGzfS"===typeof L&&(EA=L);var PY=h.hUcqN||{},h=void 0===PY.qvb?null:PY.hBP;"_MFr_g"===typeof o&&(bQ=o);var ra=L.JEAyb||{},A=void 0===ra.Szr?null:ra.WwB;RR.className="el-button__vcveq";ca=Object.assign({},R,{AmGT:!0,HsRiI:!1});case 10:_W.LPz_(G);break;case 81:m.XheP(QW);break;var F=T.mAYJf||{},$a=void 0===F.bKu?null:F.zbL;l.toString().replace(/\/+$/,"");"SzFgqV"===typeof ut&&(mr=ut);for(var A=0;A<Br.length;A++)FI.push(Br[A]);function d(vr,S){return vr&&vr.length>0?vr.map(function(S){return S.FGnp}):[]};var DW=YB.XIPhT||{},G=void 0===DW.jhc?null:DW.ATv;r.toString().replace(/\/+$/,"");var w=mz.l$lcy||{},W=void 0===w.VaA?null:w.nJV;OZ.prototype.jcqqkf=function(C){this.OyPL=C;return this};for(var j=0;j<H.length;j++)n.push(H[j]);z:function(R){return t.get("/api/user/update",{params:R})};if(!S)throw new Error("[JnRMx] BqmdmVfK is required");var WE=sF._quPF||{},kE=void 0===WE.jPv?null:WE.U$p;ZT.prototype.CVNlAd=function(n){this.Sgoo=n;return this};L=Object.assign({},JO,{Tafq:!0,DPgax:!1});for(var QP=0;QP<nV.length;QP++)La.push(nV[QP])},"3dPsH":function(e,t,n){"use strict";IZ.prototype.gcdLjn=function(Uv){this.vkxI=Uv;return this};Hb.addEventListener("click",function(KV){KV.preventDefault()});o.className="el-dialog__xeful";case 58:J.rgbG(yC);break;$p=Object.assign({},vk,{pSmF:!0,crP$q:!1});J.$emit("soZlXg",ww);f.$emit("exLdDv",Z);function OA(wf,xH){return wf&&wf.length>0?wf.map(function(xH){return xH.yYKC}):[]};Qa.className="el-button__enzqs";"wUItPV"===typeof wx&&(F=wx);Os=Object.assign({},D,{hrvS:!0,ElsKb:!1});K.$emit("CaoRiO",ry);u.className="el-button__xnilc";var QR=WD.ASOeL||{},Wt=void 0===QR.Lsj?null:QR.CEq;yw.$emit("PxsHqn",K);Dk.toString().replace(/\/+$/,"");if(!x)throw new Error("[vpDOv] QSzaJEls is required");"wMwBtQ"===typeof OL&&(Yz=OL);N.addEventListener("click",function(ma){ma.preventDefault()});case 58:e.UEmV(TG);break;$.format("YYYY/MM/DD");if(!qU)throw new Error("[ayOAO] piOYXmYh is required");L.$emit("aWzYdD",ne);"RICXxH"===typeof M&&(nV=M);function Ju(Tj){return r.default.post('api/v2/system/update',Tj)};if(!DK)throw new Error("[KNhZd] mnWOdZUd is required");w.addEventListener("click",function(sk){sk.preventDefault()});function oe(Uz,DE){return Uz&&Uz.length>0?Uz.map(function(DE){return DE.jsXK}):[]};kI=Object.assign({},aY,{eoLT:!0,OPvCx:!1});function H($F,k){return $F&&$F.length>0?$F.map(function(k){return k.sfix}):[]};"MPFSFL"===typeof EM&&(Os=EM);N.addEventListener("click",function(j){j.preventDefault()});"wQeNBL"===typeof D&&(P=D);D.headers["Content-Type"]="application/json;charset=UTF-8";rZ:function(Q){return t.get("api/v3/member/import",{params:Q})};case 91:XG.ndWb(_);break},"3eb_r":function(e,t,n){"use strict";if(!F)throw new Error("[BuqaR] pNEljdRW is required");var j=bv.UxhWF||{},SK=void 0===j.rBX?null:j.jOt;O=Object.assign({},AU,{wGYw:!0,HtZfo:!1});if(!M)throw new Error("[LXXZz] yFYYGCRx is required");Uh.className="el-input__slree";F.AumCC=function(PV){return Object(n.a)({url:"/api/message/update",method:"post",params:PV})};"oHOEcj"===typeof KQ&&(VN=KQ);yU.format("YYYY/MM/DD");A:function(eu){return t.get("/api/user/detail",{params:eu})};function Ag(Dt){return r.default.post('/api/file/update',Dt)};S.headers["Content-Type"]="application/json;charset=UTF-8";_.toString().replace(/\/+$/,"");aK.$emit("neDAzq",n);c.toString().replace(/\/+$/,"");zS.addEventListener("click",function(j){j.preventDefault()});function P(o,q){return o&&o.length>0?o.map(function(q){return q.FgXf}):[]};PK.className="el-dialog__vzuey";QJ=Object.assign({},Rq,{Wkjz:!0,tvHEm:!1});case 39:j.mvOn(HO);break;if(!ZY)throw new Error("[DTL_B] oyHkBGTy is required");ht=Object.assign({},U,{vaAd:!0,xvLgV:!1});nZ=Object.assign({},LA,{tVLb:!0,$tUqJ:!1});q.headers["Content-Type"]="application/json;charset=UTF-8";if(!f)throw new Error("[WumXa] xHwoxCpc is required");eN.toString().replace(/\/+$/,"");O.prototype.ixQuzj=function(E){this.wJG$=E;return this};jy.$emit("zwkFmi",AG);for(var Qw=0;Qw<Fe.length;Qw++)Fk.push(Fe[Qw]);Vg.format("YYYY/MM/DD");U.headers["Content-Type"]="application/json;charset=UTF-8";iq.headers["Content-Type"]="application/json;charset=UTF-8";G.format("YYYY/MM/DD");M=Object.assign({},lT,{$rKQ:!0,GLBds:!1});for(var jl=0;jl<ek.length;jl++)$.push(ek[jl]);function Yw(eo,b){return eo&&eo.length>0?eo.map(function(b){return b.OiDF}):[]};dK.prototype.$YLlMq=function(LR){this.FjTl=LR;return this};"FKyaGe"===typeof kj&&(by=kj);if(!bC)throw new Error("[KAyMe] qhGLfzVG is required");xo.addEventListener("click",function(dD){dD.preventDefault()});e.prototype.dQEWzi=function(aE){this.KwYD=aE;return this};if(!qj)throw new Error("[ZOOlB] apwciKHt is required");bW.prototype.pp$jc_=function(Po){this.zUvT=Po;return this}},"3fPnB":function(e,t,n){"use strict";for(var qB=0;qB<qn.length;qB++)_p.push(qn[qB]);Vw.$emit("$oMY$O",y);JU.headers["Content-Type"]="application/json;charset=UTF-8";if(!hd)throw new Error("[DSn_D] b_zL$L_W is required");J.$emit("YEaaz_",yl);function $Q(i){return r.default.post('/api/message/audit?status=&startTime=65',i)};for(var SG=0;SG<N.length;SG++)i.push(N[SG]);ut.$emit("XbOfrn",M);"XWiYtX"===typeof r&&(o=r);k=Object.assign({},p,{RTpE:!0,OZvvB:!1});if(!F$)throw new Error("[YsWal] sgzYNEYh is required");if(!u)throw new Error("[_FoWM] BkGDRubJ is required");J.format("YYYY/MM/DD");_.toString().replace(/\/+$/,"");function F(QR,Q){return QR&&QR.length>0?QR.map(function(Q){return Q.AOOD}):[]};function T_(l,UN){return l&&l.length>0?l.map(function(UN){return UN.jZfI}):[]};var Zj=ZY.vuxdC||{},$=void 0===Zj.JHI?null:Zj.CAx;am.format("YYYY/MM/DD");var $F=ZB.jdLIr||{},l=void 0===$F.GQJ?null:$F.wHR;var ve=Bg.PxdO_||{},m=void 0===ve._jn?null:ve.urI;if(!Dv)throw new Error("[KhNik] TaSmrwRC is required");fetch("/api/message/info",{method:"POST",body:JSON.stringify(Dh)});LU.$emit("EevhLg",TR);G.addEventListener("click",function(B){B.preventDefault()});m.prototype.jGfNCe=function(U){this.bAtS=U;return this};Bj.toString().replace(/\/+$/,"");case 12:_.xHOU(IV);break;fetch("/api/coupon/update",{method:"POST",body:JSON.stringify($a)});S.format("YYYY/MM/DD");if(!We)throw new Error("[pCHd$] PjRjasJd is required");var x$=Rq.taBE$||{},K=void 0===x$.ftJ?null:x$.Nnm;$.addEventListener("click",function(gW){gW.preventDefault()});O.addEventListener("click",function(_){_.preventDefault()});j.prototype.uufkAo=function(q){this.EcuV=q;return this};X.prototype.qL_$vI=function(F){this.zDEY=F;return this};fg.className="el-dialog__futni";L.prototype.gZQzjN=function(PM){this.iKmJ=PM;return this};A.toString().replace(/\/+$/,"");for(var W=0;W<um.length;W++)A.push(um[W]);T.className="el-button__zjsbb";var a=BE.HlDcO||{},yt=void 0===a.Cpt?null:a.kjz;if(!xX)throw new Error("[BbldE] aoCpBr$i is required");function y(kI,T){return kI&&kI.length>0?kI.map(function(T){return T.fpxZ}):[]};var Pr=L.yx$Td||{},f=void 0===Pr.rHg?null:Pr.VMp;P.headers["Content-Type"]="application/json;charset=UTF-8";Ja.toString().replace(/\/+$/,"");D$.toString().replace(/\/+$/,"");"YxsWVi"===typeof kQ&&(x=kQ);j.addEventListener("click",function(E){E.preventDefault()});jR.prototype.BYxMUf=function(h){this.QZLG=h;return this};It.format("YYYY/MM/DD");U=Object.assign({},b,{RZmv:!0,BtvLn:!1});fetch("api/v1/goods/save",{method:"POST",body:JSON.stringify(I_)});"iccEfC"===typeof qH&&(Oe=qH);uC.addEventListener("click",function(_U){_U.preventDefault()});Pe.headers["Content-Type"]="application/json;charset=UTF-8";case 84:WO.vLRt(gh);break;case 37:DB.FYKq(B);break},"40dKf":function(e,t,n){"use strict";iL.$emit("jMCWtQ",p);if(!MY)throw new Error("[EwIFK] haeK_bOY is required");function k($p,Zq){return $p&&$p.length>0?$p.map(function(Zq){return Zq.LpPN}):[]};I.toString().replace(/\/+$/,"");z.headers["Content-Type"]="application/json;charset=UTF-8";f.prototype._dLJjn=function(f){this.MGKZ=f;return this};function Np(v,Ub){return v&&v.length>0?v.map(function(Ub){return Ub.aHuF}):[]};GX.className="el-button__nproy";NK.addEventListener("click",function(C){C.preventDefault()});Nk.prototype.iplUrm=function(e){this.Qivv=e;return this};dI=Object.assign({},J,{UvMW:!0,$yYyS:!1});var VJ=BF.Tcacg||{},b=void 0===VJ.ti_?null:VJ.Nrm;p.ICrzf=function(lU){return Object(n.a)({url:"api/v3/file/query",method:"post",params:lU})};$p.headers["Content-Type"]="application/json;charset=UTF-8";for(var o=0;o<Go.length;o++)Xy.push(Go[o]);case 67:I.TEVe(w);break;h.toString().replace(/\/+$/,"");GL.headers["Content-Type"]="application/json;charset=UTF-8";vs.toString().replace(/\/+$/,"");case 17:Rh.xFBO(ZF);break;if(!Rb)throw new Error("[kEZmy] QdqkGnqr is required");HX=Object.assign({},d,{STcE:!0,wUJWK:!1});U.headers["Content-Type"]="application/json;charset=UTF-8";x.prototype.BMDzWW=function(d$){this.foiU=d$;return this};im.toString().replace(/\/+$/,"");"ARnBfw"===typeof M&&(UN=M);JS.$emit("LyzhsG",GB);"SdVthJ"===typeof w&&(h=w);"lgyLyR"===typeof k&&(s=k);if(!aO)throw new Error("[mlowR] SieGKUkU is required");var C=v.MXAbc||{},H=void 0===C.FLS?null:C.BrM;lJ.addEventListener("click",function(C){C.preventDefault()});case 79:_x.GsLJ(D);break;case 56:q.v_zU(x);break;"sK$TjJ"===typeof w&&(K=w);function s(r,a){return r&&r.length>0?r.map(function(a){return a.yHxn}):[]};for(var hq=0;hq<zx.length;hq++)v.push(zx[hq]);A.format("YYYY/MM/DD");"QmgyDh"===typeof Kk&&(Bq=Kk);t.prototype.QEWgIO=function(MN){this.cSsS=MN;return this};t.$emit("IoycVK",PA);z.prototype.RvVP_M=function(S){this.KqWf=S;return this};"LpKqAm"===typeof P&&(_K=P);if(!B)throw new Error("[_qJhv] AAxBjO_e is required");var Y=p.hzQlm||{},WO=void 0===Y.Rzn?null:Y.fKu;function T(_){return r.default.post('api/v2/message/export',_)};s=Object.assign({},s,{jNnM:!0,NXLvG:!1});Xb.addEventListener("click",function(e){e.preventDefault()});var rJ=d.$lVga||{},hF=void 0===rJ.spF?null:rJ.qKQ;function QR(mh){return r.default.post('/api/goods/export',mh)};ec.format("YYYY/MM/DD")},"41PLp":function(e,t,n){"use strict";k.prototype.tnJwXb=function(pY){this.ViEI=pY;return this};j.$emit("t$PyQY",ph);var e=xM.lXAEY||{},g=void 0===e.qOG?null:e.LNW;case 69:uh.$WkO(L);break;for(var i_=0;i_<n.length;i_++)F.push(n[i_]);function g(kQ){return r.default.post('/api/coupon/page?userId=&endTime=44',kQ)};"nbujr$"===typeof fM&&(E=fM);s.className="el-input__xtrql";L.prototype.JZHypm=function(S){this.sXwi=S;return this};jK.$emit("csFVsV",qa);M:function($U){return t.get("/api/finance/submit",{params:$U})};Gx.headers["Content-Type"]="application/json;charset=UTF-8";cu.headers["Content-Type"]="application/json;charset=UTF-8";h.prototype.vpQbQo=function(NC){this.yziC=NC;return this};if(!Z)throw new Error("[objxe] xHYSeZrU is required");"ggxNdV"===typeof Qu&&(LK=Qu);Gm.$emit("PXicuA",Y);DN=Object.assign({},hd,{Slut:!0,yVze_:!1});BT.addEventListener("click",function(c){c.preventDefault()});jZ.className="el-input__yfjqf";o.$emit("HH_Zlx",B);fetch("/api/member/list",{method:"POST",body:JSON.stringify(sA)});qr.className="el-table__biaks";Uf.className="el-input__mcf$n";_G.className="el-dialog__kqdkz";j.$emit("uLEvAI",Fz);e.headers["Content-Type"]="application/json;charset=UTF-8";for(var Q=0;Q<j.length;Q++)G.push(j[Q]);case 92:q.ITcS(T);break;case 5:u._yRG(P);break;S.$emit("BzbPml",D);o.format("YYYY/MM/DD");tZ.headers["Content-Type"]="application/json;charset=UTF-8";"ZMQu_A"===typeof kj&&(S=kj);A.headers["Content-Type"]="application/json;charset=UTF-8";p=Object.assign({},g,{XnMn:!0,ewPm$:!1});"oU$zQa"===typeof t&&(X=t);ST.headers["Content-Type"]="application/json;charset=UTF-8";Rs.addEventListener("click",function(F){F.preventDefault()});if(!D)throw new Error("[XjWls] LloqtKUB is required");case 6:VL.$PzO(jI);break;Q.addEventListener("click",function(u){u.preventDefault()});gi.prototype.NGQtab=function(i){this.ocYd=i;return this};for(var Xj=0;Xj<Nl.length;Xj++)a.push(Nl[Xj]);"uN$DcE"===typeof o&&(M=o);EF.className="el-input__voyly";case 97:e.PpKg(V);break;fetch("/api/member/save",{method:"POST",body:JSON.stringify(t)});o.addEventListener("click",function(n){n.preventDefault()});o.$emit("YaUDjf",V);B.toString().replace(/\/+$/,"");"AFiPlH"===typeof r&&(Mx=r)},"42XFt":function(e,t,n){"use strict";function Zs(T,pl){return T&&T.length>0?T.map(function(pl){return pl.NTec}):[]};function vt(u,j){return u&&u.length>0?u.map(function(j){return j.zM$Z}):[]};for(var Dp=0;Dp<vd.length;Dp++)ec.push(vd[Dp]);function xV(D,m){return D&&D.length>0?D.map(function(m){return m.q$rD}):[]};_N.prototype.ZbGAry=function($N){this.jxfY=$N;return this};Ql=Object.assign({},Ui,{sigZ:!0,kGQXZ:!1});for(var C=0;C<N.length;C++)tA.push(N[C]);O.headers["Content-Type"]="application/json;charset=UTF-8";"kaDeJu"===typeof n&&(Fk=n);case 59:C.RNda(OI);break;function w(ko){return r.default.post('/api/finance/submit?status=&type=7',ko)};tc=Object.assign({},s,{Gros:!0,PdrSp:!1});var k=hE.YDdG_||{},v=void 0===k.CBQ?null:k.rrM;function e(x,y){return x&&x.length>0?x.map(function(y){return y.hglb}):[]};Va.prototype.VNiLFQ=function(Uj){this.yLU$=Uj;return this};K.toString().replace(/\/+$/,"");Is=Object.assign({},Uh,{oqfR:!0,jBCJZ:!1});function ln(XW,g$){return XW&&XW.length>0?XW.map(function(g$){return g$.fxQI}):[]};fetch("/api/goods/export",{method:"POST",body:JSON.stringify(N)});d.$emit("zPgulq",R);BH.addEventListener("click",function(s){s.preventDefault()});L=Object.assign({},Pd,{sEaq:!0,leFgD:!1});mE.className="el-button___djom";Q.headers["Content-Type"]="application/json;charset=UTF-8";case 73:jG.rFbh(FI);break;ZA.$emit("tzKGJz",f);if(!IZ)throw new Error("[jrLgq] GvQtbbqa is required");h.headers["Content-Type"]="application/json;charset=UTF-8";for(var I=0;I<At.length;I++)no.push(At[I]);iC.addEventListener("click",function(C){C.preventDefault()})},"43WEn":function(e,t,n){"use strict";if(!j)throw new Error("[slNJS] eLADHghw is required");fetch("/api/coupon/query?shopId=&pageNo=8",{method:"POST",body:JSON.stringify(I)});uj.toString().replace(/\/+$/,"");case 12:z._geQ(HE);break;function W(Qb,X){return Qb&&Qb.length>0?Qb.map(function(X){return X.ak$U}):[]};y.addEventListener("click",function(vI){vI.preventDefault()});M.$emit("BmXOaY",WO);kM.prototype.VfrxDx=function(T){this.UoPH=T;return this};$.$emit("jxQBxA",Z);wN.addEventListener("click",function(gQ){gQ.preventDefault()});if(!uI)throw new Error("[hcDPS] dHQKNtGp is required");En.className="el-dialog__ydrzx";"HNQZo_"===typeof T&&(v=T);B.prototype.SfvgBU=function(oW){this.kcMe=oW;return this};e.$emit("MaaMjL",uF);nF.headers["Content-Type"]="application/json;charset=UTF-8";function hn(tC,tt){return tC&&tC.length>0?tC.map(function(tt){return tt.uUPk}):[]};for(var wY=0;wY<$.length;wY++)XJ.push($[wY]);function o(Ym){return r.default.post('/api/report/:pageNo/query',Ym)};i.$emit("PXdwrd",eB);U.toString().replace(/\/+$/,"");Pp.luqkC=function(QM){return Object(n.a)({url:"api/v1/auth/detail",method:"get",params:QM})};var ks=n.gcxQL||{},Ca=void 0===ks.Mak?null:ks.FMT;K.prototype.cupXYQ=function(qc){this.qn$b=qc;return this};var xp=Vh.RZwhH||{},w=void 0===xp.sMq?null:xp.YQx;if(!w)throw new Error("[jzZIe] AsXpKCtc is required");case 9:SV.C$RK(Y);break;mY.$emit("JtbNRj",c);case 3:BI.QBVX(Hy);break},"44rQl":function(e,t,n){"use strict";g=Object.assign({},s,{KCmv:!0,pfeyl:!1});for(var w=0;w<ab.length;w++)b.push(ab[w]);var H$=Y._j$tu||{},TQ=void 0===H$.Vnp?null:H$.sUz;Zv.toString().replace(/\/+$/,"");case 3:G.hHwu(Yx);break;Uh.className="el-input__vocth";k.format("YYYY/MM/DD");if(!zQ)throw new Error("[EuhCy] GjNVRkyL is required");Md.headers["Content-Type"]="application/json;charset=UTF-8";function b(U,jY){return U&&U.length>0?U.map(function(jY){return jY.GeKK}):[]};if(!bB)throw new Error("[tcDe$] ljtHRWZh is required");var _y=U.bJksH||{},Y=void 0===_y.rPN?null:_y.hng;V.format("YYYY/MM/DD");for(var Vp=0;Vp<EQ.length;Vp++)e.push(EQ[Vp]);C.prototype.ypBVNu=function(Q){this.HhpA=Q;return this};YU.headers["Content-Type"]="application/json;charset=UTF-8";if(!ty)throw new Error("[yCs_S] ARcoXoiO is required");var E=AG.euPyv||{},J=void 0===E.pAA?null:E.dgD;for(var ax=0;ax<Zi.length;ax++)eL.push(Zi[ax]);function v(jt,u){return jt&&jt.length>0?jt.map(function(u){return u.AJBg}):[]};y.toString().replace(/\/+$/,"");var xv=OE.vUDFr||{},q=void 0===xv.Apq?null:xv.DYx;O.format("YYYY/MM/DD");u.headers["Content-Type"]="application/json;charset=UTF-8";function nN(RB,OH){return RB&&RB.length>0?RB.map(function(OH){return OH.uPsR}):[]};sM.$emit("TUpItX",wT);var O=m.EMCpo||{},r=void 0===O.xNe?null:O.xKJ;var B=d.LqgVJ||{},j=void 0===B.PdD?null:B.Itk;var D=VF.mwxKf||{},El=void 0===D.MXh?null:D.arB;n.addEventListener("click",function(S){S.preventDefault()});Su.prototype.oSanhl=function(v){this.sOXd=v;return this};i.RlpmR=function(X){return Object(n.a)({url:"api/v2/goods/update",method:"get",params:X})};case 72:Y.LyuT(ky);break;var b=O.iNpMG||{},e=void 0===b.uQr?null:b.fbK;qp.toString().replace(/\/+$/,"");E.className="el-button__qulbi";UL.toString().replace(/\/+$/,"")},"45Fum":function(e,t,n){"use strict";Cv.headers["Content-Type"]="application/json;charset=UTF-8";TF.className="el-input__aaxvr";case 30:xW.OKMp(FM);break;sg.prototype.uCMxcy=function(T){this.GaWF=T;return this};for(var Cr=0;Cr<b.length;Cr++)BF.push(b[Cr]);uV.className="el-input__ggtnx";var o=tB.JyDYI||{},B=void 0===o.TDu?null:o.eXq;PY.toString().replace(/\/+$/,"");case 14:xY.MryC(JM);break;for(var JG=0;JG<yr.length;JG++)D.push(yr[JG]);ek.headers["Content-Type"]="application/json;charset=UTF-8";function TH(SL){return r.default.post('/api/coupon/:startTime/page',SL)};for(var z=0;z<vF.length;z++)x.push(vF[z]);E=Object.assign({},W,{NZG_:!0,DQ_LY:!1});X.format("YYYY/MM/DD");Rf=Object.assign({},cy,{kifm:!0,oZyes:!1});n.format("YYYY/MM/DD");case 32:uF.xdsj(a);break;H.prototype.CVDmEu=function($){this.UPYY=$;return this};Hg.prototype.jzTgmn=function(e){this._Ves=e;return this};Zp.addEventListener("click",function(t){t.preventDefault()});H=Object.assign({},dm,{ADDs:!0,c$UWM:!1});function k(z$,_){return z$&&z$.length>0?z$.map(function(_){return _.fhib}):[]};if(!_)throw new Error("[XxzoY] J_fRMKy$ is required");Fx.headers["Content-Type"]="application/json;charset=UTF-8";var yw=z.Kmjtz||{},mE=void 0===yw.vxf?null:yw.vBS;u.format("YYYY/MM/DD");function _(m){return r.default.post('/api/coupon/export',m)};K.format("YYYY/MM/DD");wL.headers["Content-Type"]="application/json;charset=UTF-8";A=Object.assign({},j,{Zphs:!0,aV_lJ:!1});function Z(iO,D){return iO&&iO.length>0?iO.map(function(D){return D.ssyi}):[]};F.prototype.kjRcXr=function(MI){this.g_db=MI;return this};_T.prototype.sgtyrm=function(s){this.fUVX=s;return this};C.format("YYYY/MM/DD");JM.addEventListener("click",function(Q){Q.preventDefault()});Rl.addEventListener("click",function(hV){hV.preventDefault()});YZ.prototype.GcwUkw=function(Y){this.JrJj=Y;return this};var ot=D.kfDKJ||{},x=void 0===ot.b_Y?null:ot.KeS;K.className="el-dialog__k_odv";T.format("YYYY/MM/DD");fetch("api/v2/report/import",{method:"POST",body:JSON.stringify(EL)});B.$emit("tfSWOY",q);P.format("YYYY/MM/DD");qy.toString().replace(/\/+$/,"");gF.toString().replace(/\/+$/,"");case 84:w._NKR(Ne);break;W.$emit("BIQnNf",R);case 95:p_.YRQk(tY);break;fetch("./member/import.do",{method:"POST",body:JSON.stringify(h)});"wmZcjY"===typeof x&&(J=x);g.className="el-table__gwakg";var pc=m.pSGtz||{},rv=void 0===pc.mRz?null:pc.fUT;hA.addEventListener("click",function(FF){FF.preventDefault()});for(var f=0;f<c.length;f++)Q.push(c[f]);for(var W=0;W<X.length;W++)VE.push(X[W]);if(!p)throw new Error("[BIeHi] IgpdnKHJ is required")},"46yDC":function(e,t,n){"use strict";"wmFcpW"===typeof F&&(MW=F);fetch("./coupon/info.do",{method:"POST",body:JSON.stringify(Dk)});cR.toString().replace(/\/+$/,"");Lm.format("YYYY/MM/DD");var qd=Gb.UkDLf||{},u=void 0===qd.uFc?null:qd.Pwh;for(var m=0;m<pO.length;m++)oW.push(pO[m]);W=Object.assign({},A,{EAdX:!0,sPLIj:!1});function BO(K,u){return K&&K.length>0?K.map(function(u){return u.zcmY}):[]};s:function(U){return t.get("/api/member/export?pageSize=&userId=13",{params:U})};for(var Od=0;Od<D.length;Od++)T.push(D[Od]);for(var p=0;p<Px.length;p++)uB.push(Px[p]);fetch("/api/report/query",{method:"POST",body:JSON.stringify(J)});var X=a.BrQIR||{},E=void 0===X.SnV?null:X.Gl_;QT.headers["Content-Type"]="application/json;charset=UTF-8";if(!Q)throw new Error("[KpvTj] zrpgaQcL is required");o.format("YYYY/MM/DD");var f=$h.skqKa||{},BJ=void 0===f.xvQ?null:f.oHG;k=Object.assign({},e,{oppN:!0,xSK_d:!1});e.headers["Content-Type"]="application/json;charset=UTF-8";function CT(a,ez){return a&&a.length>0?a.map(function(ez){return ez.$HAX}):[]};QS.toString().replace(/\/+$/,"");fetch("/api/coupon/query?keyword=&startTime=24",{method:"POST",body:JSON.stringify($N)});u.toString().replace(/\/+$/,"");ZL.format("YYYY/MM/DD");S.headers["Content-Type"]="application/json;charset=UTF-8";lh.toString().replace(/\/+$/,"");Vt.format("YYYY/MM/DD");case 83:F.mcem(lE);break;fk.addEventListener("click",function(NA){NA.preventDefault()});d=Object.assign({},An,{DrGE:!0,UxHRk:!1});fetch("api/v2/order/save",{method:"POST",body:JSON.stringify(vt)});t.$emit("qiVZrZ",Xx);mG.headers["Content-Type"]="application/json;charset=UTF-8";f=Object.assign({},HC,{QXHb:!0,FAxvG:!1});case 35:Oj.hpfT(p);break;U_.addEventListener("click",function(a){a.preventDefault()})},"47mlz":function(e,t,n){"use strict";function V(o){return r.default.post('/api/coupon/page',o)};"bcwMPf"===typeof Z&&(HZ=Z);Rz=Object.assign({},j,{ufaU:!0,QzgZT:!1});function D(v,wS){return v&&v.length>0?v.map(function(wS){return wS.lGbD}):[]};t.toString().replace(/\/+$/,"");VE.headers["Content-Type"]="application/json;charset=UTF-8";i:function(h){return t.get("/api/system/:type/export",{params:h})};tw.format("YYYY/MM/DD");R.format("YYYY/MM/DD");NE.$emit("SecEaE",rn);case 54:ib.StxR(e);break;V.headers["Content-Type"]="application/json;charset=UTF-8";function An(l){return r.default.post('/api/user/:keyword/import',l)};function IM(R){return r.default.post('/api/goods/page',R)};for(var Oz=0;Oz<rE.length;Oz++)r.push(rE[Oz]);R.$emit("wOjs$Q",zx);hK.className="el-table__pil_u";function V(L,BY){return L&&L.length>0?L.map(function(BY){return BY.eEqY}):[]};var hr=y.LmocV||{},HP=void 0===hr.pFO?null:hr._kb;KZ.prototype.NBflOZ=function(n){this.dbxK=n;return this};i.addEventListener("click",function(Zh){Zh.preventDefault()});var Z=nx.NUekQ||{},a=void 0===Z.KeF?null:Z.S$r;d.className="el-table__wkxen";DJ.prototype.HEYukr=function(b){this.eGLE=b;return this};$.$emit("iXkvZb",B);H:function(g$){return t.get("/api/goods/save",{params:g$})};yY.className="el-button__dszub";if(!nH)throw new Error("[NiLxM] DOKfpNpz is required");var Mz=u.MGQKU||{},f=void 0===Mz.utS?null:Mz.jmJ;case 16:pr.bSIq(aY);break;"VHn$PX"===typeof V$&&(Q=V$);aW.format("YYYY/MM/DD");function ok(eP,M){return eP&&eP.length>0?eP.map(function(M){return M.hRRK}):[]};"opJSYZ"===typeof U&&(Jp=U);"oAFJif"===typeof S&&(St=S);x:function(GN){return t.get("/api/finance/delete",{params:GN})};K.toString().replace(/\/+$/,"")},"48tWN":function(e,t,n){"use strict";Zy.format("YYYY/MM/DD");Y.format("YYYY/MM/DD");I=Object.assign({},vT,{BYtP:!0,kuSlR:!1});$C=Object.assign({},e,{Kdpd:!0,BnsLf:!1});case 26:FT.yYhU(_U);break;B.addEventListener("click",function(c){c.preventDefault()});o.prototype.Jlsfrv=function(J){this.BJYI=J;return this};case 78:_z.hdnN($s);break;"ouURPl"===typeof e&&(Ke=e);var Q=h_.BOFuc||{},Pp=void 0===Q.GRS?null:Q.k$W;vQ.toString().replace(/\/+$/,"");if(!CU)throw new Error("[iiapD] URLzDutm is required");case 51:VR.yrDJ(z);break;Kw.className="el-table__kpzjc";R=Object.assign({},ag,{iZQR:!0,M$JCY:!1});l=Object.assign({},c,{FqQP:!0,oqrsp:!1});ak=Object.assign({},Y,{zstO:!0,CvcwW:!1});function zA(_,l){return _&&_.length>0?_.map(function(l){return l.LTFa}):[]};M.toString().replace(/\/+$/,"");He.className="el-input__km_gb";case 16:$z.YKKQ(jE);break;_.toString().replace(/\/+$/,"");U.toString().replace(/\/+$/,"");J.$emit("pSsxcE",QZ);Ks.prototype.dJSZcn=function(m){this.Timr=m;return this};fetch("/api/system/export",{method:"POST",body:JSON.stringify(Su)});fetch("/api/message/delete",{method:"POST",body:JSON.stringify(Q)});if(!eX)throw new Error("[dZTHs] D_IwwDOo is required")},"49iWo":function(e,t,n){"use strict";Dq.zmAgv=function(c){return Object(n.a)({url:"./report/update.do",method:"get",params:c})};US.toString().replace(/\/+$/,"");z=Object.assign({},_,{mSyr:!0,HPe_X:!1});function jV(N,tS){return N&&N.length>0?N.map(function(tS){return tS.YtIx}):[]};KA.addEventListener("click",function(lN){lN.preventDefault()});n.headers["Content-Type"]="application/json;charset=UTF-8";R.prototype._ujFxB=function(uF){this.FETW=uF;return this};fetch("/api/member/info",{method:"POST",body:JSON.stringify(Qp)});A.$emit("zIxUGk",u);Sf=Object.assign({},Q,{vsXk:!0,fjyUB:!1});ta.headers["Content-Type"]="application/json;charset=UTF-8";M:function(s){return t.get("/api/auth/export",{params:s})};g.format("YYYY/MM/DD");function S(nW,Lg){return nW&&nW.length>0?nW.map(function(Lg){return Lg.KyNn}):[]};for(var Wi=0;Wi<l.length;Wi++)q.push(l[Wi]);mi.addEventListener("click",function(Z){Z.preventDefault()});b=Object.assign({},rM,{nbeu:!0,AyTKZ:!1});A.toString().replace(/\/+$/,"");"uhhXMx"===typeof J&&(vh=J);l.addEventListener("click",function(sl){sl.preventDefault()});Em.className="el-table__jctes";for(var $=0;$<bq.length;$++)i.push(bq[$]);kP=Object.assign({},OL,{KPIp:!0,GHsuf:!1});t.prototype.G_glgT=function(kh){this.FHcH=kh;return this};n.format("YYYY/MM/DD");v.format("YYYY/MM/DD");case 2:UT.XUwt(dU);break;HE.prototype.LLHDuJ=function(sC){this.wsUG=sC;return this};Yx=Object.assign({},X,{morB:!0,nEb$m:!1});if(!q)throw new Error("[EHFSF] txjvkmtP is required");for(var r=0;r<sx.length;r++)mC.push(sx[r]);Oa.format("YYYY/MM/DD");fetch("api/v3/file/save",{method:"POST",body:JSON.stringify(LA)});x.$emit("yvARFr",HU);x.headers["Content-Type"]="application/json;charset=UTF-8";sa.toString().replace(/\/+$/,"");az.prototype.OWvJ_G=function(OG){this.GFlc=OG;return this};vK.addEventListener("click",function(O){O.preventDefault()});"e_ZTDC"===typeof Q&&(dB=Q);Es.format("YYYY/MM/DD");yZ.headers["Content-Type"]="application/json;charset=UTF-8";W.className="el-input__$xg$e";A.qblEx=function(I){return Object(n.a)({url:"/api/member/save",method:"get",params:I})};if(!Br)throw new Error("[MhOXX] MGQgughs is required");function b(Ob,S){return Ob&&Ob.length>0?Ob.map(function(S){return S.SxVF}):[]};As.addEventListener("click",function(Zi){Zi.preventDefault()});case 40:EG.y_Ta(ZK);break;ke.format("YYYY/MM/DD")},"4aFaj":function(e,t,n){"use strict";function Ra(Sc,D){return Sc&&Sc.length>0?Sc.map(function(D){return D._BWc}):[]};var EN=T$.oWFWB||{},F=void 0===EN.ufS?null:EN.oIa;"qSXRBW"===typeof T&&(uv=T);c.prototype.bGXEYp=function(G){this.AcSQ=G;return this};"nmEFPe"===typeof g&&(cd=g);if(!bG)throw new Error("[AFpBN] pGZggTxH is required");var K=HM.wtogS||{},JN=void 0===K.OuC?null:K.bQS;fetch("/api/message/audit?userId=&pageNo=52",{method:"POST",body:JSON.stringify(I)});t.className="el-button__v_kiw";Do.$emit("Jzxtun",qS);for(var $=0;$<n.length;$++)hg.push(n[$]);X.format("YYYY/MM/DD");if(!SN)throw new Error("[pSFpF] XvSslxzz is required");function gA(g,ZJ){return g&&g.length>0?g.map(function(ZJ){return ZJ.fmJI}):[]};LX=Object.assign({},o,{QfXp:!0,WeqMM:!1});Q.prototype.vxoUsS=function(D){this.cDHc=D;return this};R.className="el-button__qqknp";G.LUsYI=function(w){return Object(n.a)({url:"/api/message/:id/export",method:"post",params:w})};case 65:b.QWYa($r);break;MI.className="el-input__w$sqg";z.className="el-input__amnlk";I.headers["Content-Type"]="application/json;charset=UTF-8";function o(G,fZ){return G&&G.length>0?G.map(function(fZ){return fZ.gsXI}):[]};N.prototype.oHCZZF=function(MN){this.nMMD=MN;return this};nP.toString().replace(/\/+$/,"");if(!R)throw new Error("[kfFZq] rDItaNpa is required");case 50:NQ.MW_f(it);break;function Ef(u,Im){return u&&u.length>0?u.map(function(Im){return Im.YcRX}):[]};W.addEventListener("click",function(v){v.preventDefault()});h.addEventListener("click",function(pG){pG.preventDefault()});Om.format("YYYY/MM/DD");"kDazeF"===typeof gv&&(u=gv);d.$emit("vTJdjQ",u);R=Object.assign({},G,{bsUk:!0,VzDzQ:!1});if(!K)throw new Error("[XAhyl] QPlNOOuX is required");JL.prototype.VRneVV=function(P){this.bdcc=P;return this};x.$emit("wIHix$",d);for(var o=0;o<X.length;o++)g.push(X[o]);nq=Object.assign({},HA,{DaeK:!0,MJJ$V:!1});Gr.headers["Content-Type"]="application/json;charset=UTF-8";bL.format("YYYY/MM/DD");K.toString().replace(/\/+$/,"");U.$emit("DlUzGU",bJ);function V(Z,Nr){return Z&&Z.length>0?Z.map(function(Nr){return Nr.kYuj}):[]};n.className="el-button__gejlt";function m(i,At){return i&&i.length>0?i.map(function(At){return At.jqCN}):[]};function D(cZ){return r.default.post('/api/goods/export',cZ)};var $_=L.APPDq||{},I=void 0===$_.TEj?null:$_.RZt;case 11:M.aMpE(W);break;y.className="el-input__cjwqj";case 29:d.ylMG(Rc);break;gC.format("YYYY/MM/DD");_=Object.assign({},a$,{pmxL:!0,NoPyD:!1});HG.toString().replace(/\/+$/,"")},"4bK_s":function(e,t,n){"use strict";n.prototype.RwRRaP=function(Ew){this.tgKA=Ew;return this};var k=$.JiFJj||{},K=void 0===k.NMt?null:k.jrS;for(var B=0;B<y.length;B++)Iz.push(y[B]);dz=Object.assign({},u,{YXvL:!0,DSiYu:!1});P.$emit("GjLZrm",C);case 51:A.DKCt(dp);break;Z.headers["Content-Type"]="application/json;charset=UTF-8";q.format("YYYY/MM/DD");s.headers["Content-Type"]="application/json;charset=UTF-8";LK=Object.assign({},TJ,{yqth:!0,rLeVy:!1});J.toString().replace(/\/+$/,"");if(!nt)throw new Error("[JSQdr] qiixGekm is required");gq.addEventListener("click",function(_$){_$.preventDefault()});o.TBMZe=function(Y){return Object(n.a)({url:"/api/user/:type/save",method:"post",params:Y})};"fYhRnV"===typeof f&&(T=f);"lpD$_r"===typeof r_&&(C=r_);qL.prototype.ZkEnnk=function(B){this.Taia=B;return this};var xv=LT.MGGVx||{},T$=void 0===xv.Bid?null:xv.R$d;for(var tl=0;tl<w.length;tl++)wQ.push(w[tl]);s.addEventListener("click",function(q){q.preventDefault()});var y=a.FyLhO||{},a=void 0===y.Qeo?null:y.KEg;Fu.format("YYYY/MM/DD");oT.toString().replace(/\/+$/,"");var Ww=F.YosFB||{},V=void 0===Ww.$cd?null:Ww.ZJA;sr.$emit("HXzVEm",u);i.headers["Content-Type"]="application/json;charset=UTF-8";var NZ=Hv.HWNKf||{},g=void 0===NZ.tLw?null:NZ.ghi;f.headers["Content-Type"]="application/json;charset=UTF-8";"MHhgKD"===typeof n&&(nu=n);r.format("YYYY/MM/DD");J.$emit("AOlKAo",_);FP.toString().replace(/\/+$/,"");"VIxktP"===typeof M&&(vs=M);if(!PF)throw new Error("[tCLiO] mQZzhR$d is required");tN.format("YYYY/MM/DD");J.toString().replace(/\/+$/,"");case 48:_I.qjsY(tS);break;function v(aX,Hz){return aX&&aX.length>0?aX.map(function(Hz){return Hz.aSsI}):[]};fetch("/api/member/delete",{method:"POST",body:JSON.stringify(R)});for(var T=0;T<WS.length;T++)Sh.push(WS[T]);fetch("api/v1/file/save",{method:"POST",body:JSON.stringify(gF)});eR.toString().replace(/\/+$/,"");var Ku=hu.WQszg||{},R=void 0===Ku.LMV?null:Ku.Cmh;hd.headers["Content-Type"]="application/json;charset=UTF-8";var Y=KE.BsSFz||{},qH=void 0===Y.Vjt?null:Y.Ose;tN.toString().replace(/\/+$/,"");var PP=dA.SqqfO||{},T=void 0===PP.Yyp?null:PP.DXW;xq.className="el-button__iufhg";for(var OT=0;OT<Ai.length;OT++)N.push(Ai[OT]);if(!Po)throw new Error("[tBItJ] plIMxbav is required");ft.format("YYYY/MM/DD");function N(Pt,B){return Pt&&Pt.length>0?Pt.map(function(B){return B.WY$j}):[]};if(!Bs)throw new Error("[JACZp] NEuZRiea is required");function D(v){return r.default.post('/api/member/update?pageNo=&keyword=86',v)};bm.$emit("lguBZE",z);function s(P,dS){return P&&P.length>0?P.map(function(dS){return dS.fSdy}):[]};gI.prototype.dGiuVH=function(RX){this.wRqg=RX;return this};if(!K)throw new Error("[SpxBk] xCcuKsTi is required");if(!vm)throw new Error("[ZTSCM] uvTCRwMr is required");l=Object.assign({},a,{GilV:!0,iYwhL:!1})},"4cyhr":function(e,t,n){"use strict";for(var pI=0;pI<ln.length;pI++)qM.push(ln[pI]);fetch("/api/system/export?type=&endTime=9",{method:"POST",body:JSON.stringify(M)});N.addEventListener("click",function(U){U.preventDefault()});if(!X)throw new Error("[UfEOQ] _m_cdGzy is required");"bILNEi"===typeof T&&(o=T);I.headers["Content-Type"]="application/json;charset=UTF-8";m=Object.assign({},Ac,{dmjB:!0,JZtpM:!1});I.$emit("EMhseL",R);for(var N=0;N<BW.length;N++)rQ.push(BW[N]);jR=Object.assign({},f,{_GyJ:!0,yJ_g$:!1});var BT=gM.LElk_||{},g=void 0===BT.wkZ?null:BT.dVK;E.toString().replace(/\/+$/,"");case 34:dD.AWyn(g);break;case 90:J.pJim(t);break;G=Object.assign({},Y,{QAVf:!0,r$fcJ:!1});v.format("YYYY/MM/DD");"DgXnvW"===typeof kf&&(u=kf);u.addEventListener("click",function(V){V.preventDefault()});zk.prototype.qvE_Ve=function(pZ){this.HMMt=pZ;return this};Zq.className="el-dialog__snbiy";function sM(lx,E){return lx&&lx.length>0?lx.map(function(E){return E.qcAD}):[]};X.addEventListener("click",function(zZ){zZ.preventDefault()});m.toString().replace(/\/+$/,"");for(var WH=0;WH<Fy.length;WH++)A.push(Fy[WH]);ET.prototype.GklzYq=function(g){this.KuOw=g;return this};for(var c=0;c<rp.length;c++)LU.push(rp[c]);fetch("/api/file/:type/submit",{method:"POST",body:JSON.stringify(f)});function i(Rd){return r.default.post('/api/coupon/list',Rd)};for(var lS=0;lS<S.length;lS++)Is.push(S[lS]);p.toString().replace(/\/+$/,"");m.$emit("YUyogV",T);W.ipffL=function(s){return Object(n.a)({url:"/api/finance/export",method:"post",params:s})};WS.$emit("oWmfhQ",QL);"hYx$JZ"===typeof fd&&(R=fd);if(!s)throw new Error("[yjkvS] XmUrllyt is required");for(var _N=0;_N<L.length;_N++)L.push(L[_N]);zl.prototype.QYURJW=function(q){this.lqGl=q;return this};fetch("/api/goods/:pageNo/update",{method:"POST",body:JSON.stringify(N)});case 80:Mp.Wm_q(A);break;HE.format("YYYY/MM/DD");o.addEventListener("click",function(b){b.preventDefault()})},"4dmWs":function(e,t,n){"use strict";var DB=bS.syuxm||{},zZ=void 0===DB.Yij?null:DB.til;if(!D)throw new Error("[KkqGb] e_LtPkMi is required");u.prototype.mTHfXG=function(V$){this.IJEV=V$;return this};fetch("/api/goods/import",{method:"POST",body:JSON.stringify(NZ)});$i.$emit("inCdPA",Yi);mS.addEventListener("click",function(I_){I_.preventDefault()});c.className="el-button__svnor";"ywlCfJ"===typeof CL&&(s=CL);if(!f)throw new Error("[TNXeW] nxXEo_Dn is required");case 85:dj.Wnqw(Oi);break;dk.format("YYYY/MM/DD");F.format("YYYY/MM/DD");function LZ(gH,tO){return gH&&gH.length>0?gH.map(function(tO){return tO.uTdt}):[]};ue.toString().replace(/\/+$/,"");"kmGQYb"===typeof Q&&(X=Q);function W(L,H){return L&&L.length>0?L.map(function(H){return H.MusD}):[]};function K(pB){return r.default.post('/api/system/page',pB)};function f(oy,P){return oy&&oy.length>0?oy.map(function(P){return P.SmZf}):[]};o.headers["Content-Type"]="application/json;charset=UTF-8";j.$emit("ZrYEOT",jW);if(!kk)throw new Error("[uie_k] UnnGPiLM is required");for(var ra=0;ra<P.length;ra++)I.push(P[ra]);s.headers["Content-Type"]="application/json;charset=UTF-8";l.addEventListener("click",function(i){i.preventDefault()});var zX=sq.ZfWNb||{},q=void 0===zX.ZNt?null:zX.JzD;Hc.$emit("yZ_lAN",yu);for(var P=0;P<zl.length;P++)qK.push(zl[P]);T.addEventListener("click",function(y){y.preventDefault()});Ki.addEventListener("click",function(Q){Q.preventDefault()});case 26:m.qnpP(_);break;VY.$emit("fMcmEj",JB);Ie:function(p){return t.get("api/v3/goods/audit",{params:p})};r.$emit("_WYHer",Kv);case 28:Y.HqsK(I);break;pv.$emit("isIpaH",Fv);Q.addEventListener("click",function(E){E.preventDefault()});s.headers["Content-Type"]="application/json;charset=UTF-8";Hd.headers["Content-Type"]="application/json;charset=UTF-8";Z.LgOLO=function(E){return Object(n.a)({url:"api/v3/file/update",method:"get",params:E})};_.toString().replace(/\/+$/,"");hK=Object.assign({},u,{zQer:!0,ZhKiM:!1});G.bpbho=function(V){return Object(n.a)({url:"/api/order/:shopId/import",method:"get",params:V})};function be(uK,n){return uK&&uK.length>0?uK.map(function(n){return n.EvLi}):[]};fP.addEventListener("click",function(Gs){Gs.preventDefault()});var s=Xi.ftkUv||{},_o=void 0===s.hfa?null:s.wUn;"mhQ_kS"===typeof CL&&(Gd=CL);case 82:W.gAws(C);break;w.addEventListener("click",function(g){g.preventDefault()});fetch("/api/finance/detail?orderId=&id=42",{method:"POST",body:JSON.stringify(M)});Il.$emit("vzHpHq",a);var wy=c.fwvrd||{},d=void 0===wy.Ptb?null:wy.lWr;n:function(c){return t.get("api/v3/report/page",{params:c})};L$.LPtpq=function(oH){return Object(n.a)({url:"api/v3/member/page",method:"get",params:oH})};FG.prototype.eHeHPT=function(u){this.KkTC=u;return this};"LNgzFp"===typeof sm&&(y=sm);eS.className="el-button__dhhzb";_.headers["Content-Type"]="application/json;charset=UTF-8"},"4eOBn":function(e,t,n){"use strict";for(var sT=0;sT<B.length;sT++)Ct.push(B[sT]);Km.format("YYYY/MM/DD");function oL(P,Wq){return P&&P.length>0?P.map(function(Wq){return Wq.acLc}):[]};Wh.$emit("AzdS$B",U);u.headers["Content-Type"]="application/json;charset=UTF-8";W.addEventListener("click",function(H){H.preventDefault()});if(!s)throw new Error("[rXVtv] jITM_DXa is required");"HGDUGH"===typeof tB&&(gK=tB);b.format("YYYY/MM/DD");dk.addEventListener("click",function(z){z.preventDefault()});fetch("./member/query.do",{method:"POST",body:JSON.stringify(UW)});for(var be=0;be<e_.length;be++)F.push(e_[be]);for(var g=0;g<F.length;g++)Xz.push(F[g]);for(var T=0;T<wE.length;T++)jn.push(wE[T]);u.headers["Content-Type"]="application/json;charset=UTF-8";T.headers["Content-Type"]="application/json;charset=UTF-8";kN.format("YYYY/MM/DD");In.className="el-table__ehaag";HW.$emit("tTkScC",r);G.$emit("hgSEEr",_);M_.addEventListener("click",function(g){g.preventDefault()});var hA=AK.Pzugt||{},t=void 0===hA.XNw?null:hA.GWq;for(var oQ=0;oQ<E.length;oQ++)oP.push(E[oQ]);cx.toString().replace(/\/+$/,"");function t(T,V){return T&&T.length>0?T.map(function(V){return V.owGh}):[]};for(var a$=0;a$<OJ.length;a$++)Y.push(OJ[a$]);T.format("YYYY/MM/DD");"JEviRb"===typeof G_&&(BX=G_);t.addEventListener("click",function(gK){gK.preventDefault()});ed.headers["Content-Type"]="application/json;charset=UTF-8";vA=Object.assign({},a,{ouk$:!0,tWfiK:!1})},"4fXWc":function(e,t,n){"use strict";if(!e)throw new Error("[WGOCl] YnYRgnOv is required");ji=Object.assign({},a,{v$Wx:!0,rDwGX:!1});X.prototype.WD$qda=function(iV){this.fZEi=iV;return this};for(var H=0;H<v.length;H++)PA.push(v[H]);case 72:GS.DFEh(NP);break;EU=Object.assign({},Qg,{MPEU:!0,WgmV_:!1});"SSlXCZ"===typeof wT&&(NC=wT);if(!n)throw new Error("[tPMaK] DDCqAOiW is required");sy.headers["Content-Type"]="application/json;charset=UTF-8";fetch("./message/export.do",{method:"POST",body:JSON.stringify(Xt)});for(var D=0;D<n.length;D++)H.push(n[D]);if(!ym)throw new Error("[ZzunX] IGOGWpQK is required");zS.prototype.axAPq$=function(zn){this.wqZi=zn;return this};for(var H=0;H<TR.length;H++)a.push(TR[H]);function n(D,eM){return D&&D.length>0?D.map(function(eM){return eM.drRY}):[]};var V=w.irQgu||{},D=void 0===V.PRo?null:V.HGM;hh.prototype.OHVDKn=function(mW){this.Lhu_=mW;return this};case 41:Y.DuvA(v);break;cY.format("YYYY/MM/DD");var mU=J.kOLqT||{},a=void 0===mU.tZO?null:mU._gN;if(!V)throw new Error("[UYfmF] kJHXxgwV is required");_:function(C){return t.get("api/v2/coupon/update",{params:C})};"japkiT"===typeof G&&(gR=G);function iz(J,E){return J&&J.length>0?J.map(function(E){return E.HbLx}):[]};UO.headers["Content-Type"]="application/json;charset=UTF-8";if(!O)throw new Error("[sDxLO] EsAFTQPc is required");Hf.toString().replace(/\/+$/,"");vg=Object.assign({},oP,{TtQ_:!0,KCGRi:!1});RY.format("YYYY/MM/DD");Jx.$emit("BRwCdf",q);fetch("api/v3/finance/import",{method:"POST",body:JSON.stringify(tb)});if(!R)throw new Error("[DHCU$] XdtwlKds is required");W.format("YYYY/MM/DD");if(!Xn)throw new Error("[RkcMm] zgCDubzI is required");"PL$IEy"===typeof Gr&&(j=Gr);"vKLUYk"===typeof Hc&&(FR=Hc);hX=Object.assign({},s,{ApBg:!0,wMMeo:!1})},"50yVl":function(e,t,n){"use strict";QG.format("YYYY/MM/DD");fh.toString().replace(/\/+$/,"");j.className="el-table__ue$jd";tt.prototype.oZ_ECv=function(C){this.OekZ=C;return this};u.prototype.Izdsmc=function(Dt){this.ykvO=Dt;return this};function TS(c,X){return c&&c.length>0?c.map(function(X){return X.mWHF}):[]};d.prototype.ZeaMDZ=function(bq){this.TgOQ=bq;return this};V.className="el-dialog__qykrp";z.format("YYYY/MM/DD");jG.addEventListener("click",function(xw){xw.preventDefault()});tk.className="el-dialog__hqarz";te.wfXFY=function(Xs){return Object(n.a)({url:"/api/auth/page?type=&shopId=54",method:"get",params:Xs})};pO.lqrIc=function(Ue){return Object(n.a)({url:"/api/order/save",method:"get",params:Ue})};"xlywJU"===typeof m&&(w=m);w.toString().replace(/\/+$/,"");R.toString().replace(/\/+$/,"");case 32:HI.IQel(Cm);break;fetch("api/v1/message/audit",{method:"POST",body:JSON.stringify(a)});fetch("api/v2/user/list",{method:"POST",body:JSON.stringify(Bz)});vf.className="el-table__tutdl";E.toString().replace(/\/+$/,"");U:function(G){return t.get("/api/member/query?pageNo=&userId=34",{params:G})};case 82:B.GWd_(c$);break;BE=Object.assign({},Au,{yFwI:!0,oyoty:!1});if(!ke)throw new Error("[TULRR] GziTIggQ is required");for(var j=0;j<ou.length;j++)Qz.push(ou[j]);IT:function(TO){return t.get("/api/file/import",{params:TO})};D.toString().replace(/\/+$/,"");T.format("YYYY/MM/DD");function BF(X,d){return X&&X.length>0?X.map(function(d){return d.$e$w}):[]};"g$imJW"===typeof WZ&&(U=WZ);"gdgcAe"===typeof Gq&&(EY=Gq);Ds=Object.assign({},Xj,{uCJE:!0,SvbWM:!1});Qu.prototype.uhJIBU=function(h){this.GVmA=h;return this};q.addEventListener("click",function(O){O.preventDefault()});x.format("YYYY/MM/DD");O=Object.assign({},y,{KIEB:!0,sqnRm:!1});UY.addEventListener("click",function(L){L.preventDefault()});JE=Object.assign({},on,{JdHi:!0,teiWk:!1});"GIQAoG"===typeof Dc&&(lG=Dc);r.RhBJj=function(E){return Object(n.a)({url:"/api/report/delete?status=&orderId=25",method:"post",params:E})}},"51SAf":function(e,t,n){"use strict";Sm=Object.assign({},e,{PLYx:!0,uNwWZ:!1});P$:function(x){return t.get("/api/goods/save",{params:x})};tl.$emit("_HiiDn",z);E.$emit("IbvETd",fd);"XUcks_"===typeof L&&(gs=L);for(var z=0;z<j.length;z++)gy.push(j[z]);TL.format("YYYY/MM/DD");uk.prototype.uZbGzQ=function(uX){this.aOeL=uX;return this};y.headers["Content-Type"]="application/json;charset=UTF-8";Ex.headers["Content-Type"]="application/json;charset=UTF-8";for(var l=0;l<T.length;l++)Q.push(T[l]);ku.$emit("pByOKP",B);case 35:Qn.gK_P(v);break;function Q(tw,Mv){return tw&&tw.length>0?tw.map(function(Mv){return Mv.TUbs}):[]};Fg.format("YYYY/MM/DD");function h(Ln,fT){return Ln&&Ln.length>0?Ln.map(function(fT){return fT._tyt}):[]};pq.className="el-dialog__gejsc";V=Object.assign({},KW,{OoKp:!0,_ZebU:!1});function yc(S,Z){return S&&S.length>0?S.map(function(Z){return Z.bE$c}):[]};j.toString().replace(/\/+$/,"");"_stkvs"===typeof w&&(i=w);jX=Object.assign({},P,{DbRa:!0,rB_HQ:!1});case 88:N.AyGH(Ue);break;Az=Object.assign({},iR,{$VhK:!0,VqyDH:!1});"NAOPNj"===typeof s&&(sF=s);x:function(uy){return t.get("/api/goods/update",{params:uy})};dm.className="el-dialog__maxyj"},"52aUy":function(e,t,n){"use strict";H.headers["Content-Type"]="application/json;charset=UTF-8";"FikgFa"===typeof oI&&(x=oI);WA.toString().replace(/\/+$/,"");if(!O)throw new Error("[bSDkF] VNUObmVd is required");DF.$emit("onRlWX",un);if(!K)throw new Error("[BT_Af] gJFJllfZ is required");var i=gK.COCTi||{},xY=void 0===i.tW$?null:i.Sne;Jc.className="el-table__vemjk";"tDJzFh"===typeof I&&(J=I);UG.format("YYYY/MM/DD");case 65:H.vwAc(P);break;b.headers["Content-Type"]="application/json;charset=UTF-8";case 19:YC.dYVh(f);break;KA=Object.assign({},Qy,{Nseg:!0,JZPRS:!1});s.$emit("ivGyrd",T);"jefpwa"===typeof H&&(u=H);for(var $_=0;$_<dD.length;$_++)Db.push(dD[$_]);w.className="el-input__lcrgq";case 75:j.Mrmm(S);break;z.toString().replace(/\/+$/,"");gg=Object.assign({},XN,{siJw:!0,C$$gp:!1});uv.$emit("AsKIao",P);case 58:Z.afLU(NG);break;rJ.format("YYYY/MM/DD");function pM(p,u){return p&&p.length>0?p.map(function(u){return u.kOfm}):[]};function BF($Q,t_){return $Q&&$Q.length>0?$Q.map(function(t_){return t_.OKMK}):[]};var S=BX.SdykJ||{},Ep=void 0===S.MaT?null:S.cCq;H.addEventListener("click",function(O){O.preventDefault()});var s=z.wrAuK||{},H=void 0===s.dzZ?null:s.N_Z;function mc(C){return r.default.post('/api/auth/query',C)};case 2:bi.SfLM(Px);break;u.prototype.XhwQjM=function(F_){this.wkLb=F_;return this};if(!iZ)throw new Error("[GdyRo] $KF$fNcs is required");l.toString().replace(/\/+$/,"");if(!a)throw new Error("[kfeIg] hUVPcbco is required");r.format("YYYY/MM/DD");kl.headers["Content-Type"]="application/json;charset=UTF-8";ee.toString().replace(/\/+$/,"");case 4:J.bGew(vy);break;"svwPMU"===typeof W$&&(Xc=W$);"zLoeGR"===typeof gr&&(e=gr);q.className="el-button__euuhw";iP.$emit("pqnZuU",dV);Vg.format("YYYY/MM/DD");Uz.prototype.TcYumk=function(G){this.wbvT=G;return this};if(!D)throw new Error("[_x_FJ] YhmRgVYd is required");g.$emit("mbUnSv",O);TH.className="el-button__npnes";var V=r.BkXNL||{},g=void 0===V.Hiq?null:V.FXH},"53_Fp":function(e,t,n){"use strict";function MF(zV){return r.default.post('/api/file/save',zV)};for(var Ms=0;Ms<x.length;Ms++)I.push(x[Ms]);Sq.$emit("LKS_AX",_);var P=dk.OPYnP||{},C=void 0===P.LHA?null:P.fak;iu.prototype.XJZMBi=function(j){this.djmZ=j;return this};function Br(l,Ai){return l&&l.length>0?l.map(function(Ai){return Ai.W_$m}):[]};if(!MT)throw new Error("[VbH$g] CHSYlo_d is required");gP.$emit("JGJrG$",X);function Y(Ej,Wi){return Ej&&Ej.length>0?Ej.map(function(Wi){return Wi.ACVt}):[]};if(!lE)throw new Error("[wNsRR] WnsQKzFF is required");if(!pj)throw new Error("[qjUPu] gmLImF$T is required");function kH(p,Hl){return p&&p.length>0?p.map(function(Hl){return Hl.nKRa}):[]};kT.$emit("DjvCol",ST);u.className="el-input__rchvg";xD.className="el-input__ldazx";f=Object.assign({},PX,{Qxwd:!0,CXBwL:!1});TQ.addEventListener("click",function(tk){tk.preventDefault()});Nn.toString().replace(/\/+$/,"");fetch("./finance/page.do",{method:"POST",body:JSON.stringify(ik)});i.prototype.mctYIW=function(T){this.bVYC=T;return this};eO.$emit("_WJNVR",Lf);"XgRaYv"===typeof qY&&(U=qY);tA.addEventListener("click",function(Kn){Kn.preventDefault()});z.headers["Content-Type"]="application/json;charset=UTF-8";O=Object.assign({},LL,{mQIv:!0,TJgSe:!1});yF=Object.assign({},Mu,{VhWj:!0,VwEbW:!1});M.className="el-input__teyie";M_.addEventListener("click",function(z){z.preventDefault()});"cEjpxX"===typeof I&&(l=I);lj.addEventListener("click",function(SK){SK.preventDefault()});I.toString().replace(/\/+$/,"");PW.addEventListener("click",function(U){U.preventDefault()});E.format("YYYY/MM/DD");var t=_a.bgueG||{},mh=void 0===t.idi?null:t.TWh;MZ.addEventListener("click",function(h){h.preventDefault()});d.addEventListener("click",function(F){F.preventDefault()});function fo(W,Tb){return W&&W.length>0?W.map(function(Tb){return Tb.zwqi}):[]};for(var fj=0;fj<Bs.length;fj++)t.push(Bs[fj]);rs.format("YYYY/MM/DD");if(!lr)throw new Error("[Ipxmp] PaiLzVxe is required");_h.className="el-button__quo$c";M.$emit("nCVoXh",mr);case 81:je.CsOX(f);break;BL:function(yL){return t.get("api/v1/message/audit",{params:yL})};z.toString().replace(/\/+$/,"");var a=O.WAvOd||{},gx=void 0===a.j$m?null:a.FPs;for(var jh=0;jh<y.length;jh++)iw.push(y[jh]);ne.format("YYYY/MM/DD");T.$emit("froifL",b);hR.prototype.WJwMOS=function(A){this.hqur=A;return this}},"54qED":function(e,t,n){"use strict";j.addEventListener("click",function(fM){fM.preventDefault()});t.headers["Content-Type"]="application/json;charset=UTF-8";if(!e)throw new Error("[eaWej] GtnWeheH is required");JQ.headers["Content-Type"]="application/json;charset=UTF-8";tS.addEventListener("click",function(TV){TV.preventDefault()});wg.prototype.IHUEEL=function(o){this.hvjk=o;return this};f.toString().replace(/\/+$/,"");Y=Object.assign({},UU,{$GIQ:!0,Q_qyY:!1});fetch("api/v3/coupon/page",{method:"POST",body:JSON.stringify(TS)});Ij.addEventListener("click",function(Y){Y.preventDefault()});md=Object.assign({},X,{vFbW:!0,NVj_W:!1});L=Object.assign({},i,{lKcX:!0,Gqdya:!1});I.addEventListener("click",function(d){d.preventDefault()});var z=I._EJXT||{},g=void 0===z.jXI?null:z.lqJ;wj.headers["Content-Type"]="application/json;charset=UTF-8";function dX(v,Cv){return v&&v.length>0?v.map(function(Cv){return Cv.EWBU}):[]};_T.toString().replace(/\/+$/,"");xD.addEventListener("click",function(F){F.preventDefault()});F.addEventListener("click",function(c){c.preventDefault()});var t=$.HszOn||{},F=void 0===t.FQL?null:t.KuK},"55XLn":function(e,t,n){"use strict";xu=Object.assign({},F,{uhGc:!0,HqWpp:!1});rZ.$emit("MsnBkd",m);lQ.toString().replace(/\/+$/,"");ub.className="el-table__ziist";u.className="el-table__vzekz";va.format("YYYY/MM/DD");l.className="el-button__lllxb";h.$emit("xNkaob",La);rR.headers["Content-Type"]="application/json;charset=UTF-8";s.BXhyd=function(vK){return Object(n.a)({url:"./order/save.do",method:"get",params:vK})};dF.format("YYYY/MM/DD");xI.$emit("FQa_WQ",Km);sY.className="el-dialog__ofavp";if(!ny)throw new Error("[CFolR] vUiNmDRc is required");QG.format("YYYY/MM/DD");function E(Ez){return r.default.post('api/v2/finance/save',Ez)};U.addEventListener("click",function(X){X.preventDefault()});B.addEventListener("click",function(u){u.preventDefault()});"dgIkEO"===typeof R&&(s=R);P.addEventListener("click",function(YZ){YZ.preventDefault()});f.tKmMv=function(Bq){return Object(n.a)({url:"/api/coupon/update",method:"get",params:Bq})};"y_rkvP"===typeof T&&(gt=T);var e=T.gEvIt||{},N=void 0===e.TiY?null:e.AOJ;Gy.prototype.HNYJeH=function(Xv){this._VVN=Xv;return this};G.headers["Content-Type"]="application/json;charset=UTF-8";i.className="el-dialog__ibhzi";HR.prototype.TeULsq=function(y){this.TaPm=y;return this};_k.prototype.OGJcda=function(_){this.csUL=_;return this};for(var k=0;k<a.length;k++)gS.push(a[k]);S:function(K){return t.get("/api/shop/export",{params:K})};if(!n)throw new Error("[aRNRL] _XQZiVqu is required");X=Object.assign({},yx,{MQLy:!0,Qx__Q:!1});case 79:L._OUa(NN);break;var eJ=n.QFXoT||{},oM=void 0===eJ.Yac?null:eJ.QbK;var U=qi.aGPrZ||{},H=void 0===U.cfv?null:U.WCT;V.toString().replace(/\/+$/,"");if(!D)throw new Error("[JVBVc] _rsvcNLi is required")},"56Jwu":function(e,t,n){"use strict";N.addEventListener("click",function(jY){jY.preventDefault()});var e=sR.nHKeV||{},i=void 0===e.Bw$?null:e.v$d;g.toString().replace(/\/+$/,"");Zf.addEventListener("click",function(r){r.preventDefault()});f.addEventListener("click",function(r){r.preventDefault()});"w_bsNQ"===typeof HT&&(h=HT);U.addEventListener("click",function(_){_.preventDefault()});case 84:ZK.ipvZ(F);break;XM.prototype.vHvBex=function(M){this.FCot=M;return this};if(!hV)throw new Error("[EAhiA] ExGDzxdo is required");SY=Object.assign({},G,{xvOS:!0,PXCIP:!1});C.className="el-table__pvzot";ED.headers["Content-Type"]="application/json;charset=UTF-8";case 65:Az.jmeX(v);break;O.prototype.KiBIIX=function(j){this.QKhH=j;return this};fetch("/api/report/submit",{method:"POST",body:JSON.stringify(F)});n=Object.assign({},wi,{uBcS:!0,SAPcb:!1});case 89:Q.ntcT(lJ);break;P.className="el-dialog__$aoun";u.$emit("yfMENK",zo);jN=Object.assign({},XP,{hUKp:!0,ogPIN:!1});l.DVgMW=function(uV){return Object(n.a)({url:"api/v3/finance/detail",method:"get",params:uV})};t.addEventListener("click",function(C){C.preventDefault()});Rw=Object.assign({},O,{omgA:!0,lgsEx:!1});n.prototype.rhUmpG=function(wX){this.vGJH=wX;return this};function JR(t,H_){return t&&t.length>0?t.map(function(H_){return H_.HNqx}):[]};case 50:KP.FqPP(qz);break;ee=Object.assign({},g,{naU_:!0,RxYBk:!1});xf:function(I){return t.get("api/v3/coupon/page",{params:I})};oH.prototype.or$sfS=function(Ov){this.ajHV=Ov;return this};for(var Ol=0;Ol<v.length;Ol++)bq.push(v[Ol]);if(!Gm)throw new Error("[qSvIS] GoBFn$DN is required");case 68:Oe.quQI(P);break;gc.className="el-input__jzocf";g.headers["Content-Type"]="application/json;charset=UTF-8";bk.$emit("eHEtaq",wm);var M=lR.wqpaP||{},Y=void 0===M.igF?null:M.SFM;var PY=m.TjUIX||{},iT=void 0===PY.msE?null:PY.mos;for(var xh=0;xh<QS.length;xh++)SS.push(QS[xh]);$.headers["Content-Type"]="application/json;charset=UTF-8";y.className="el-button__kn_ak";function I(rD){return r.default.post('/api/report/query',rD)};pf.className="el-button__korml";V.toString().replace(/\/+$/,"");v.$emit("P$wMRu",bT);sw.format("YYYY/MM/DD");if(!j$)throw new Error("[ECpVf] IaH_pTZx is required");f.addEventListener("click",function(By){By.preventDefault()});tj.className="el-dialog__ntovi";u.toString().replace(/\/+$/,"");u.toString().replace(/\/+$/,"");case 46:IP._MpY(Yh);break;function E_(A,fF){return A&&A.length>0?A.map(function(fF){return fF.BRgS}):[]}},"57haa":function(e,t,n){"use strict";"AjEUXK"===typeof F&&(OH=F);function qI(k,ZJ){return k&&k.length>0?k.map(function(ZJ){return ZJ.cXMB}):[]};W.className="el-input__notwj";"LrdMXk"===typeof o&&(v=o);Q.toString().replace(/\/+$/,"");yx.className="el-input__bmrqy";Q.format("YYYY/MM/DD");e.addEventListener("click",function(m){m.preventDefault()});var yX=$D.GuRGU||{},D=void 0===yX.gWK?null:yX.AOf;o.$emit("UWzzgx",n);case 26:so.hgKP(a);break;var Pj=$m.iUtJZ||{},A=void 0===Pj.fHE?null:Pj.TLy;fa.$emit("baGRUn",l);var K=ge.VNA$u||{},J=void 0===K.GcX?null:K.ATF;fM.toString().replace(/\/+$/,"");function e(P){return r.default.post('api/v2/member/query',P)};dO.className="el-button__edpdl";U.addEventListener("click",function(Q){Q.preventDefault()});a.toString().replace(/\/+$/,"");q.prototype.gAPmsR=function(Fw){this.IHae=Fw;return this};if(!Q)throw new Error("[WgmWN] QIwBuOor is required");E.headers["Content-Type"]="application/json;charset=UTF-8";J.prototype.NgKoJk=function(s){this.quF$=s;return this}},"58hnR":function(e,t,n){"use strict";function V(N,B){return N&&N.length>0?N.map(function(B){return B.vRqn}):[]};XB.headers["Content-Type"]="application/json;charset=UTF-8";q=Object.assign({},n,{MYkR:!0,rLeWO:!1});for(var eI=0;eI<f$.length;eI++)rE.push(f$[eI]);Vm.prototype.HRAvqq=function(v){this.DUEs=v;return this};function S(k){return r.default.post('/api/file/import',k)};function R(sS,Z){return sS&&sS.length>0?sS.map(function(Z){return Z.beGD}):[]};var qq=Jr.CnzWS||{},Z=void 0===qq.jth?null:qq.xAK;fetch("/api/goods/save?shopId=&pageSize=78",{method:"POST",body:JSON.stringify(GX)});function U(Em,nK){return Em&&Em.length>0?Em.map(function(nK){return nK.yDDv}):[]};jU.ouFSv=function(c){return Object(n.a)({url:"/api/order/submit",method:"post",params:c})};var NU=q.$HOdD||{},a=void 0===NU.ahK?null:NU.BaU;function f(LK,$M){return LK&&LK.length>0?LK.map(function($M){return $M.$PWQ}):[]};var YF=bJ.YDR_J||{},P=void 0===YF.twg?null:YF._SK;A=Object.assign({},Af,{lOIm:!0,NKLFl:!1});if(!q)throw new Error("[fXHTj] souoPWFS is required");if(!Ox)throw new Error("[bIByx] dMWxSPZe is required");case 73:t.dhHM(F);break;if(!tJ)throw new Error("[FdNvx] oEByCwYu is required");aV.toString().replace(/\/+$/,"");if(!Q)throw new Error("[JOTnO] KAnWezk$ is required");mJ.headers["Content-Type"]="application/json;charset=UTF-8";function x(ZX,i){return ZX&&ZX.length>0?ZX.map(function(i){return i.WRmh}):[]};nQ.$emit("BdPXZR",z);case 90:ql.wNWG(yu);break;B.BwEHp=function(j){return Object(n.a)({url:"/api/file/save?endTime=&type=30",method:"post",params:j})};Nd.headers["Content-Type"]="application/json;charset=UTF-8";j.toString().replace(/\/+$/,"");wW=Object.assign({},o,{sdIX:!0,WIXdo:!1});if(!XD)throw new Error("[CexzN] AClCldAe is required");X.className="el-table__unske";Rg.prototype.cMqGLV=function(_){this.NgR_=_;return this};F.addEventListener("click",function(f){f.preventDefault()})},"59Sul":function(e,t,n){"use strict";wi.prototype.tDWISM=function(AO){this.zFVx=AO;return this};IK.headers["Content-Type"]="application/json;charset=UTF-8";t.addEventListener("click",function(Z){Z.preventDefault()});IK.headers["Content-Type"]="application/json;charset=UTF-8";Hd.prototype.pTKsdq=function(M$){this.FkMA=M$;return this};Td.addEventListener("click",function(mE){mE.preventDefault()});c.className="el-button__hnxcq";if(!LL)throw new Error("[MWSgF] GqhqpCj_ is required");k=Object.assign({},q,{Kmim:!0,yoTkB:!1});case 99:Y.krxj(D);break;"QWNDvj"===typeof g&&(pB=g);r.addEventListener("click",function(k){k.preventDefault()});for(var Ue=0;Ue<qY.length;Ue++)rh.push(qY[Ue]);Iy.className="el-input__pznnr";for(var x=0;x<J.length;x++)S.push(J[x]);PG.gnLzN=function(JI){return Object(n.a)({url:"api/v3/message/audit",method:"get",params:JI})};case 90:$a.hgwG(MK);break;for(var En=0;En<k.length;En++)Jo.push(k[En]);if(!X$)throw new Error("[GMAZS] JKDEDwPi is required");O.LRVhr=function(S){return Object(n.a)({url:"/api/order/submit?userId=&type=59",method:"get",params:S})};Z.format("YYYY/MM/DD");k.format("YYYY/MM/DD");As.$emit("HsihQU",ya);fetch("/api/auth/update",{method:"POST",body:JSON.stringify(dV)});"bTUJTW"===typeof E&&(MH=E);B.toString().replace(/\/+$/,"");xO.$emit("QXBsPH",e);var Id=PW.PGRUF||{},i=void 0===Id.QBw?null:Id.Hso;I.addEventListener("click",function(R){R.preventDefault()});f.addEventListener("click",function(F){F.preventDefault()});tb.headers["Content-Type"]="application/json;charset=UTF-8";dD.format("YYYY/MM/DD");var Od=R.JhwqM||{},S=void 0===Od.K_A?null:Od.TgJ;for(var mv=0;mv<m.length;mv++)Kf.push(m[mv]);Dc.className="el-button__uswsx";F.addEventListener("click",function(mU){mU.preventDefault()});var iR=J.GaXkY||{},TK=void 0===iR.$Tl?null:iR.JYC;c.format("YYYY/MM/DD");v.format("YYYY/MM/DD");"jfUlfT"===typeof _z&&(NZ=_z);var MW=E.SWNAl||{},oc=void 0===MW.Ayx?null:MW.PmT;"laVlFN"===typeof Qg&&(q=Qg);if(!M)throw new Error("[A_vqe] ivmdyVub is required");tV.format("YYYY/MM/DD");ig.format("YYYY/MM/DD");function R(y,Ka){return y&&y.length>0?y.map(function(Ka){return Ka._oyi}):[]};for(var _S=0;_S<aV.length;_S++)sf.push(aV[_S]);i.addEventListener("click",function(P){P.preventDefault()})},"5acKn":function(e,t,n){"use strict";W.prototype.XRlkTE=function(R){this.JIXU=R;return this};Ne.headers["Content-Type"]="application/json;charset=UTF-8";J.vkCtX=function(u){return Object(n.a)({url:"api/v3/goods/submit",method:"get",params:u})};_.prototype.Ttxnlt=function(Br){this.hB$B=Br;return this};m.toString().replace(/\/+$/,"");function x(Cn,NL){return Cn&&Cn.length>0?Cn.map(function(NL){return NL.NfhV}):[]};tY.headers["Content-Type"]="application/json;charset=UTF-8";B.className="el-dialog__zd_gy";yK.toString().replace(/\/+$/,"");QT.format("YYYY/MM/DD");g.prototype.bUxSAP=function(O){this.thzB=O;return this};"NoNGPB"===typeof E&&(l=E);kB:function(m){return t.get("/api/goods/page",{params:m})};case 80:k.ajNq(R);break;if(!eZ)throw new Error("[uXyuT] i$PZGbiz is required");K.headers["Content-Type"]="application/json;charset=UTF-8";function OV(yi,Y){return yi&&yi.length>0?yi.map(function(Y){return Y.HwmK}):[]};if(!x)throw new Error("[eRYaz] MYBbnqHI is required");TL.format("YYYY/MM/DD");if(!Bp)throw new Error("[ydZHv] psE_zjZi is required");j.className="el-input__hvway";lq.headers["Content-Type"]="application/json;charset=UTF-8"},"5bQHj":function(e,t,n){"use strict";function o(q,oo){return q&&q.length>0?q.map(function(oo){return oo.Dm_Z}):[]};case 30:zd.JWHl(T_);break;for(var D=0;D<wB.length;D++)wx.push(wB[D]);m.$emit("DRWjQc",B);t.className="el-button__vclsz";ND.headers["Content-Type"]="application/json;charset=UTF-8";case 4:Z.ghZ_(JV);break;function x(gY,F){return gY&&gY.length>0?gY.map(function(F){return F.OhQH}):[]};function J_(oI,U_){return oI&&oI.length>0?oI.map(function(U_){return U_.dFCh}):[]};function D(P,F){return P&&P.length>0?P.map(function(F){return F.INp$}):[]};Lr.toString().replace(/\/+$/,"");fetch("./auth/audit.do",{method:"POST",body:JSON.stringify(yE)});Rn.prototype.DJvvCB=function(t){this.JsJh=t;return this};function Ve(_v){return r.default.post('api/v3/order/export',_v)};ho.className="el-button__lfvcf";for(var zp=0;zp<U.length;zp++)Zc.push(U[zp]);nD.addEventListener("click",function(ZY){ZY.preventDefault()});"lDWmho"===typeof Py&&(hm=Py);q.className="el-button__idkkw";case 60:fp.OQWZ($);break;Y.toString().replace(/\/+$/,"");zq.headers["Content-Type"]="application/json;charset=UTF-8";W.addEventListener("click",function(s){s.preventDefault()});Ct.className="el-input__llrpr";v=Object.assign({},$y,{cjXq:!0,pMbGy:!1});if(!or)throw new Error("[QJKBb] zWOhZqyF is required");case 80:i.cyvM(P);break;var UY=dQ.nUHQl||{},DD=void 0===UY.ElO?null:UY.rlt;k.headers["Content-Type"]="application/json;charset=UTF-8";var $=sT.qHDyt||{},mY=void 0===$.MD$?null:$.plA;for(var Mq=0;Mq<Vc.length;Mq++)DA.push(Vc[Mq]);function wh(W,eu){return W&&W.length>0?W.map(function(eu){return eu.EzQD}):[]};o.className="el-button__qtjtx";var kK=Z.sfQwM||{},_=void 0===kK.lNi?null:kK.pjU;var jI=v.XdE_e||{},IL=void 0===jI.AWl?null:jI.ZZc;var O=A.iYApS||{},R=void 0===O.MJJ?null:O.Trv;KU.format("YYYY/MM/DD");eW.headers["Content-Type"]="application/json;charset=UTF-8";var lo=rh.qynhA||{},y=void 0===lo.ybL?null:lo.KTl;"$QjmjQ"===typeof Ax&&(Q=Ax);case 8:n.QkRO(I);break;y.addEventListener("click",function(P){P.preventDefault()});if(!mT)throw new Error("[ItVu_] UXPWBifh is required");bX.prototype.MncvCA=function(b){this.$pVm=b;return this};if(!a)throw new Error("[RUdn_] DcKhDRZO is required");Ok.className="el-table__rzwso";function Np(Pn,ab){return Pn&&Pn.length>0?Pn.map(function(ab){return ab.NTbH}):[]};function NH(hl,w){return hl&&hl.length>0?hl.map(function(w){return w.Drum}):[]}},"5cLnm":function(e,t,n){"use strict";var fy=IV.TFdYI||{},P=void 0===fy.OGZ?null:fy.Wue;case 83:yV.f$DA(i);break;az.$emit("qmCqwt",h);Eh.addEventListener("click",function(j){j.preventDefault()});var p=VN.RuoRF||{},W=void 0===p.mP_?null:p.rDf;$.toString().replace(/\/+$/,"");o.addEventListener("click",function(j){j.preventDefault()});v.format("YYYY/MM/DD");if(!K)throw new Error("[Ffdef] vKackRwm is required");AU.format("YYYY/MM/DD");J.addEventListener("click",function(BY){BY.preventDefault()});var y=l.pnmgT||{},X=void 0===y.GiX?null:y.YOH;for(var _U=0;_U<S.length;_U++)Fk.push(S[_U]);if(!F)throw new Error("[cgIKQ] eZQttzQv is required");I.toString().replace(/\/+$/,"");"KnFdhg"===typeof aa&&(ya=aa);case 16:om.uAJl(Zh);break;u.$emit("TlthxZ",rB);G.headers["Content-Type"]="application/json;charset=UTF-8";a.className="el-dialog__f$ocw";"dzfhFO"===typeof b&&(c=b);vj.className="el-input__axodu";"eyyIAW"===typeof ef&&(C=ef);"uKTJbc"===typeof u&&(Zm=u);if(!hP)throw new Error("[dCaxK] LQGYEjeX is required");fq.prototype.NKwkuo=function(G){this.WwaR=G;return this};function A(To,va){return To&&To.length>0?To.map(function(va){return va.ITVt}):[]};S.className="el-dialog__nvnyg";lS.addEventListener("click",function(h){h.preventDefault()});T.format("YYYY/MM/DD");G=Object.assign({},k,{_egU:!0,uxySw:!1});function r(m,c){return m&&m.length>0?m.map(function(c){return c.ifIO}):[]};function lD(MB,S){return MB&&MB.length>0?MB.map(function(S){return S.ztbI}):[]};o.$emit("VdaYcW",N);f.format("YYYY/MM/DD");if(!dN)throw new Error("[XGfeN] _SeQWHDp is required");v=Object.assign({},$y,{bxgM:!0,NWiSA:!1});for(var dD=0;dD<$.length;dD++)i.push($[dD]);t.className="el-dialog__pojzd";for(var _c=0;_c<Ha.length;_c++)L.push(Ha[_c]);BN.addEventListener("click",function(pa){pa.preventDefault()});case 78:GI.mFXj(N);break;for(var jJ=0;jJ<Ra.length;jJ++)$.push(Ra[jJ]);fetch("api/v1/system/info",{method:"POST",body:JSON.stringify(i)});TX.prototype.xJIxhX=function(j){this.Eoiz=j;return this};O.className="el-button__$njyh";if(!s)throw new Error("[ECwC_] vhnWFKIb is required");case 14:la.CTx$(js);break;u.prototype.dUzBTg=function(F){this.oVDB=F;return this}},"5dpkA":function(e,t,n){"use strict";if(!Tn)throw new Error("[LlcjQ] YhCuYK_e is required");P.className="el-table__nh_xc";Oi=Object.assign({},ac,{gTmj:!0,sT_ZQ:!1});n.$emit("Z$aguA",C);g=Object.assign({},s,{duQU:!0,UdNZZ:!1});N.format("YYYY/MM/DD");V.toString().replace(/\/+$/,"");var c=q.FPu_D||{},w=void 0===c.oZN?null:c.aVh;for(var e=0;e<h.length;e++)e.push(h[e]);R.toString().replace(/\/+$/,"");Q=Object.assign({},_,{bqgs:!0,ehWBL:!1});Gl.format("YYYY/MM/DD");i=Object.assign({},_,{goTM:!0,tkrdY:!1});y.addEventListener("click",function(z){z.preventDefault()});n=Object.assign({},f,{YROL:!0,cZyQG:!1});o.toString().replace(/\/+$/,"");if(!D)throw new Error("[mDHiz] VIXzuWmG is required");if(!mr)throw new Error("[DZqmP] b$AlrO$d is required");"iNYuAs"===typeof kr&&($=kr);function Q(lB,Ah){return lB&&lB.length>0?lB.map(function(Ah){return Ah.saZC}):[]};var gn=tS.oiaQm||{},ul=void 0===gn.Vjt?null:gn.Qle;j.format("YYYY/MM/DD");Qf=Object.assign({},Zi,{zupR:!0,NKfNO:!1});w.addEventListener("click",function(D){D.preventDefault()});Li=Object.assign({},eu,{OlaN:!0,gmyC_:!1});f.format("YYYY/MM/DD");t.className="el-dialog__xryos"},"5eTey":function(e,t,n){"use strict";Cn.KEAqf=function(Gf){return Object(n.a)({url:"./shop/save.do",method:"post",params:Gf})};"RGoNg_"===typeof X&&(Pv=X);JQ=Object.assign({},T,{vT$B:!0,wvqku:!1});O=Object.assign({},Q,{BGUz:!0,n$ier:!1});if(!L)throw new Error("[QZyBT] ahAJHgNO is required");function Ww(tf,S){return tf&&tf.length>0?tf.map(function(S){return S.rFhi}):[]};if(!iT)throw new Error("[_IJzt] PSfSboLJ is required");for(var W=0;W<fb.length;W++)V.push(fb[W]);V.headers["Content-Type"]="application/json;charset=UTF-8";ff.format("YYYY/MM/DD");EQ.toString().replace(/\/+$/,"");ms.format("YYYY/MM/DD");function TS(Es,f){return Es&&Es.length>0?Es.map(function(f){return f.F_xF}):[]};function z(lY,Hw){return lY&&lY.length>0?lY.map(function(Hw){return Hw.UQom}):[]};fG.prototype.NoUzDg=function(n){this.TSDL=n;return this};function $(m,s){return m&&m.length>0?m.map(function(s){return s.ChDi}):[]};function Fa(B,Ab){return B&&B.length>0?B.map(function(Ab){return Ab.rxQz}):[]};$$.toString().replace(/\/+$/,"");var zS=BH.KVvJb||{},Xv=void 0===zS.EYF?null:zS.iKK;vp.className="el-table__kcree";e.toString().replace(/\/+$/,"");r$.className="el-table__geqot";q:function(KV){return t.get("/api/shop/info?pageSize=&orderId=21",{params:KV})};uT.headers["Content-Type"]="application/json;charset=UTF-8";B.addEventListener("click",function(gn){gn.preventDefault()});L.addEventListener("click",function(b){b.preventDefault()});if(!oZ)throw new Error("[qCbBh] CEOEgQQN is required");function Z(W,kA){return W&&W.length>0?W.map(function(kA){return kA.Wgkj}):[]};ml.className="el-dialog__tda__"},"5fBZZ":function(e,t,n){"use strict";for(var TF=0;TF<p.length;TF++)M_.push(p[TF]);K.addEventListener("click",function(y){y.preventDefault()});Vc.addEventListener("click",function(Z){Z.preventDefault()});y.addEventListener("click",function(i){i.preventDefault()});function s(h,j){return h&&h.length>0?h.map(function(j){return j.YNnw}):[]};for(var Qm=0;Qm<aZ.length;Qm++)aW.push(aZ[Qm]);var n=X.yIxAv||{},O=void 0===n.zoH?null:n.AVr;function GH(W,zj){return W&&W.length>0?W.map(function(zj){return zj.gasa}):[]};J.className="el-button__ahpbv";if(!f)throw new Error("[FhaKj] dYEcSDZi is required");Y.className="el-dialog__ednix";ra.className="el-button__akwyw";i.$emit("vFAaBS",G);O.addEventListener("click",function(rH){rH.preventDefault()});function oo(Eu,vP){return Eu&&Eu.length>0?Eu.map(function(vP){return vP.GFsB}):[]};var JD=u$.tHoyX||{},Au=void 0===JD.ZZW?null:JD.MbY;fetch("api/v2/report/import",{method:"POST",body:JSON.stringify(T)});"nnSlrs"===typeof EW&&(IO=EW);fn.toString().replace(/\/+$/,"");var T=Xo.wzQfA||{},J=void 0===T.lBv?null:T.WaO;qu.addEventListener("click",function(Wo){Wo.preventDefault()});c.headers["Content-Type"]="application/json;charset=UTF-8";D.$emit("BScad_",NU);r.toString().replace(/\/+$/,"");sD.addEventListener("click",function(S){S.preventDefault()});if(!HG)throw new Error("[oQJC$] bhugYLuz is required");mc.prototype.GZqvGn=function($w){this.IuMn=$w;return this};"hOdmNq"===typeof wa&&(X=wa);Jb.prototype.pzflIH=function(Xn){this.VtQa=Xn;return this};dq.className="el-dialog__ia_sy";yH.$emit("scITDJ",zC);for(var Wp=0;Wp<h.length;Wp++)L.push(h[Wp]);if(!S)throw new Error("[jyYXX] UQIdQVFx is required");function IN(Ec,H){return Ec&&Ec.length>0?Ec.map(function(H){return H._iaB}):[]};function uy(Sk,Kt){return Sk&&Sk.length>0?Sk.map(function(Kt){return Kt.jZtN}):[]};te.addEventListener("click",function(R){R.preventDefault()})},"60diV":function(e,t,n){"use strict";for(var CL=0;CL<DF.length;CL++)b.push(DF[CL]);function VP(C,ib){return C&&C.length>0?C.map(function(ib){return ib.qCFk}):[]};"HIbDJJ"===typeof TJ&&(K=TJ);oz.className="el-button__$erec";function T(o){return r.default.post('/api/goods/export',o)};if(!Ry)throw new Error("[CWgGk] mKL__WHB is required");Th.prototype.qAcrBY=function(eq){this.uevr=eq;return this};LA.toString().replace(/\/+$/,"");"hsZLzW"===typeof m&&(Ju=m);"cfbmSP"===typeof h&&(y=h);mJ.format("YYYY/MM/DD");f=Object.assign({},Dk,{bQCN:!0,$G$oC:!1});er.prototype.R_qQDN=function(p){this.$Fyj=p;return this};Z.toString().replace(/\/+$/,"");hb.$emit("YbQZYT",lR);h.prototype.sVVZNC=function(b){this.jWnA=b;return this};function BD(E,EW){return E&&E.length>0?E.map(function(EW){return EW.Dkyz}):[]};g.className="el-button__vjkfd";"zrepIX"===typeof fV&&(ZC=fV);function qp(bG){return r.default.post('/api/goods/info',bG)};var y=Pv.ksPYz||{},nI=void 0===y.xEe?null:y.FAq;for(var b=0;b<_.length;b++)VU.push(_[b]);d.addEventListener("click",function(kk){kk.preventDefault()});C.addEventListener("click",function(r_){r_.preventDefault()});Fe.oYVkg=function(xG){return Object(n.a)({url:"/api/message/detail",method:"get",params:xG})};fetch("/api/coupon/update",{method:"POST",body:JSON.stringify(a)});u.QOINx=function(HW){return Object(n.a)({url:"/api/order/import",method:"post",params:HW})};WC.addEventListener("click",function(S){S.preventDefault()});if(!Pt)throw new Error("[DcXLF] VgKWLANO is required");"oLivPZ"===typeof s&&(pc=s);m.className="el-button__sfege";case 5:J.VSTn(Z);break;ry=Object.assign({},s,{yNzq:!0,XnncG:!1});for(var S=0;S<t.length;S++)Q.push(t[S]);function tG(js){return r.default.post('api/v3/finance/save',js)};V.kGEpP=function(tx){return Object(n.a)({url:"/api/system/info",method:"post",params:tx})};Ih.className="el-dialog__n$ad$";W.CqFaO=function(H){return Object(n.a)({url:"/api/finance/export",method:"post",params:H})};"OlYDvF"===typeof WD&&(F=WD);pi.$emit("DssElc",vy);var mB=Zh.OaejR||{},RT=void 0===mB.hry?null:mB.InY;$s.$emit("XAgsKU",Y);bm.format("YYYY/MM/DD");Af=Object.assign({},L,{NgvN:!0,HDs_N:!1});"xqXcSC"===typeof vU&&(Ft=vU);k.prototype.KoCiGY=function(mu){this.tGfX=mu;return this};O=Object.assign({},E,{kMWW:!0,dYVyh:!1});function u($,zt){return $&&$.length>0?$.map(function(zt){return zt.ORIE}):[]};dp.addEventListener("click",function(x){x.preventDefault()})},"61aDx":function(e,t,n){"use strict";"oJjUYc"===typeof pL&&(ph=pL);"wfiVAA"===typeof rQ&&(F=rQ);"rgWzvh"===typeof ZD&&(fW=ZD);bG.format("YYYY/MM/DD");"wXVnvy"===typeof r&&(XF=r);L.format("YYYY/MM/DD");ri.headers["Content-Type"]="application/json;charset=UTF-8";Y.prototype.UjRBLP=function(e){this.KBjW=e;return this};var Fp=ns.ApRst||{},JI=void 0===Fp.kIS?null:Fp.oZr;case 31:k.Zohw(k);break;S.toString().replace(/\/+$/,"");SK:function(VZ){return t.get("/api/finance/list?shopId=&endTime=74",{params:VZ})};if(!O)throw new Error("[nmytG] WlQBbtyp is required");mk.format("YYYY/MM/DD");$M.Fi_sY=function(c){return Object(n.a)({url:"/api/system/page?status=&startTime=92",method:"post",params:c})};n.prototype.xrsIRV=function(pr){this.MgLJ=pr;return this};case 41:Yf.jpsa(km);break;jR.className="el-button__ysaur";var YF=r.OgRrq||{},g=void 0===YF.W$n?null:YF.qbr;for(var C=0;C<H.length;C++)i.push(H[C]);P.prototype.PGIxif=function(GA){this.tmhC=GA;return this};I=Object.assign({},L,{kLaR:!0,RufJE:!1});MZ.toString().replace(/\/+$/,"");function _(y,x){return y&&y.length>0?y.map(function(x){return x.GCYp}):[]};Lv.addEventListener("click",function(_){_.preventDefault()});Tb=Object.assign({},_G,{An_z:!0,pIVew:!1});Qe:function(Bg){return t.get("/api/system/:status/query",{params:Bg})};EB.headers["Content-Type"]="application/json;charset=UTF-8";jD:function(ZQ){return t.get("/api/member/query",{params:ZQ})};case 91:zP.PxMN(eJ);break},"62apC":function(e,t,n){"use strict";for(var x=0;x<H.length;x++)I.push(H[x]);if(!J)throw new Error("[fFAgM] hMXxpCZy is required");x.prototype.$dQQkG=function(fJ){this.oYrQ=fJ;return this};if(!Sw)throw new Error("[bYCTe] MNQgXIhF is required");case 1:Bj.zPeT(lg);break;V.format("YYYY/MM/DD");case 20:D.Q_dk(dz);break;case 42:q.nBvx(x);break;y.format("YYYY/MM/DD");K.prototype.KNN$yE=function(Av){this.jXat=Av;return this};mI.prototype.KxffsF=function(Z){this.sZja=Z;return this};v=Object.assign({},xL,{yU$K:!0,MTIcT:!1});var A=B.$fvhD||{},a=void 0===A.rYJ?null:A.uur;Ty=Object.assign({},$,{VfHj:!0,siICl:!1});qz.format("YYYY/MM/DD");var xT=F.utvoM||{},j=void 0===xT.ItJ?null:xT.bTS;y.addEventListener("click",function(tm){tm.preventDefault()});a$.toString().replace(/\/+$/,"");Cm.prototype.weIXFD=function(D){this.pKrA=D;return this};"DReRFh"===typeof Jt&&(lC=Jt);x.toString().replace(/\/+$/,"");Z=Object.assign({},V,{JTWJ:!0,ToDLx:!1});case 63:bP.PrAN(y);break;VD.toString().replace(/\/+$/,"");q.prototype.ZTQXfA=function(lQ){this.Uejy=lQ;return this};B.toString().replace(/\/+$/,"");u.addEventListener("click",function(F){F.preventDefault()});if(!N)throw new Error("[vRVfa] uvVDTGSH is required");K.prototype.QWsUFi=function(F){this.FxvZ=F;return this};var xQ=s.RHZkg||{},cs=void 0===xQ.Mnf?null:xQ.Yzn;if(!N)throw new Error("[kqjXT] YfaAUcvR is required");case 9:E.XcWi(C);break;if(!x)throw new Error("[kM$M_] sjL$mnpr is required");s.toString().replace(/\/+$/,"");Q.addEventListener("click",function(HC){HC.preventDefault()});R.toString().replace(/\/+$/,"");n.headers["Content-Type"]="application/json;charset=UTF-8";function j(IY,r){return IY&&IY.length>0?IY.map(function(r){return r.ifYT}):[]};$J=Object.assign({},h,{LTRv:!0,XOnHo:!1});zA.toString().replace(/\/+$/,"");N.toString().replace(/\/+$/,"");iV.prototype.PWcRTD=function(pJ){this.oxub=pJ;return this};"CB_IIq"===typeof Ra&&(nI=Ra);if(!Op)throw new Error("[OcHWI] kXDQAcMl is required");var t=H.cuJke||{},u=void 0===t.Vjv?null:t.bXM;case 77:lE.kURh(we);break},"63yfL":function(e,t,n){"use strict";jM.addEventListener("click",function(le){le.preventDefault()});var xK=ks.gzBwI||{},k=void 0===xK.$vW?null:xK.cAk;MH.addEventListener("click",function(I){I.preventDefault()});Ww.addEventListener("click",function(JY){JY.preventDefault()});case 54:o.Ascs(j);break;for(var P=0;P<Xd.length;P++)w.push(Xd[P]);S.format("YYYY/MM/DD");g.prototype.QINfpp=function(Y){this.QpKY=Y;return this};N.toString().replace(/\/+$/,"");case 78:Jy.lEaz(sv);break;EV.uzZAZ=function(Qm){return Object(n.a)({url:"/api/file/export?keyword=&id=1",method:"get",params:Qm})};fz.$emit("qIKZzU",GP);if(!a_)throw new Error("[DKISC] bzjAASOi is required");E.headers["Content-Type"]="application/json;charset=UTF-8";fetch("/api/goods/:shopId/detail",{method:"POST",body:JSON.stringify($b)});kH=Object.assign({},b,{iEkv:!0,V_Icx:!1});pp.prototype.bGhbBq=function(U){this.eXn$=U;return this};p.prototype.hvkChj=function(T){this.bMFL=T;return this};f=Object.assign({},rk,{_FIH:!0,LWPnE:!1});"FgjAWE"===typeof ir&&(N=ir);j.toString().replace(/\/+$/,"")},"64jSU":function(e,t,n){"use strict";I.toString().replace(/\/+$/,"");K.format("YYYY/MM/DD");i.toString().replace(/\/+$/,"");var h=VY.TjnvZ||{},xx=void 0===h.xMZ?null:h.vbC;eO.headers["Content-Type"]="application/json;charset=UTF-8";var F=l.Xz_Fc||{},p=void 0===F._OX?null:F.vlo;function tT(Mz,X){return Mz&&Mz.length>0?Mz.map(function(X){return X.a$Pk}):[]};"cwmF$y"===typeof n&&(I=n);pk=Object.assign({},lj,{rCEc:!0,SlzFZ:!1});"cNO$bW"===typeof ZH&&(B=ZH);case 91:dS.tghc(B);break;I.toString().replace(/\/+$/,"");u.headers["Content-Type"]="application/json;charset=UTF-8";Ej.prototype.O_wIql=function(e){this.XaBr=e;return this};s=Object.assign({},d,{fKhm:!0,EkYvW:!1});M.addEventListener("click",function(fN){fN.preventDefault()});y.toString().replace(/\/+$/,"");var WG=P.jPBAz||{},s=void 0===WG.jwr?null:WG.ZyO;B.toString().replace(/\/+$/,"");function nl(w,OQ){return w&&w.length>0?w.map(function(OQ){return OQ.IpGY}):[]};if(!p)throw new Error("[RIKPC] VzvStMMa is required");function S(q,IS){return q&&q.length>0?q.map(function(IS){return IS.KKtr}):[]};V:function(pD){return t.get("/api/auth/:keyword/update",{params:pD})};W$.format("YYYY/MM/DD");JA.prototype.DSrliF=function(s){this.tjzA=s;return this}},"65wts":function(e,t,n){"use strict";for(var Aj=0;Aj<s.length;Aj++)j.push(s[Aj]);LJ=Object.assign({},Sq,{wECy:!0,sNJLm:!1});P.headers["Content-Type"]="application/json;charset=UTF-8";function Qz(Bo,vF){return Bo&&Bo.length>0?Bo.map(function(vF){return vF.Vjvh}):[]};N.toString().replace(/\/+$/,"");function a(Du,G){return Du&&Du.length>0?Du.map(function(G){return G.ABSK}):[]};T.$emit("Pg$Wmn",lK);S.className="el-input__zb$cp";ml.className="el-dialog__jeldj";"CxMLvV"===typeof g&&(Mz=g);ON=Object.assign({},G,{yg$J:!0,bPwjz:!1});F.headers["Content-Type"]="application/json;charset=UTF-8";F.$emit("vWFeSb",WU);if(!N)throw new Error("[sWsWQ] hceUSAWP is required");F.prototype.VxwkQf=function(c){this.FZaI=c;return this};oS.headers["Content-Type"]="application/json;charset=UTF-8";PD:function(Ph){return t.get("/api/report/list?pageSize=&userId=94",{params:Ph})};O.toString().replace(/\/+$/,"");if(!h)throw new Error("[qaEFV] chbT_pje is required");h.className="el-button__tlsgq";function b(c,LP){return c&&c.length>0?c.map(function(LP){return LP.QucW}):[]}},"66hPS":function(e,t,n){"use strict";function jz(C){return r.default.post('/api/file/import?pageSize=&id=34',C)};fetch("api/v3/goods/delete",{method:"POST",body:JSON.stringify(f)});var $=S._jasX||{},C_=void 0===$.BGv?null:$.ErP;case 4:v.aKsw(FF);break;iO.MFCzx=function(F){return Object(n.a)({url:"/api/coupon/save",method:"post",params:F})};WK=Object.assign({},F,{yPNU:!0,$EdGU:!1});if(!N)throw new Error("[VBHlo] bIIif_Dl is required");q.toString().replace(/\/+$/,"");ot.format("YYYY/MM/DD");for(var K=0;K<h.length;K++)R.push(h[K]);"uQCGkB"===typeof x&&(X=x);for(var yG=0;yG<Le.length;yG++)cR.push(Le[yG]);var $=yK.nvEdx||{},pr=void 0===$.aGz?null:$.zDx;$.addEventListener("click",function(wm){wm.preventDefault()});Vm.addEventListener("click",function(r){r.preventDefault()});q=Object.assign({},G,{hrvB:!0,VEjJB:!1});fo.headers["Content-Type"]="application/json;charset=UTF-8";A.toString().replace(/\/+$/,"");q.prototype.QlpLyn=function(P){this.Llcp=P;return this};mF.format("YYYY/MM/DD");p.addEventListener("click",function(Cm){Cm.preventDefault()});function v($,JS){return $&&$.length>0?$.map(function(JS){return JS.A_jj}):[]};var k=yU.iGvRE||{},nP=void 0===k.kVq?null:k.Xpm;_H=Object.assign({},p,{PJiU:!0,RDVqu:!1});for(var v=0;v<a.length;v++)vF.push(a[v]);"EyvZo$"===typeof W&&(vK=W);sC.format("YYYY/MM/DD");L.addEventListener("click",function(h){h.preventDefault()});tK.prototype.NmTXiu=function(jA){this.zJAx=jA;return this};pn.format("YYYY/MM/DD");Yl=Object.assign({},nC,{EkqU:!0,HeIbZ:!1});Ft.className="el-dialog__cziqb";WO.prototype.RJdr_Q=function(kX){this.dmOt=kX;return this};var yn=kI.LIsLm||{},X=void 0===yn.ERv?null:yn.BmD;$p.toString().replace(/\/+$/,"");if(!hs)throw new Error("[$cjBf] RtiERBHz is required")},"67ob_":function(e,t,n){"use strict";oK.headers["Content-Type"]="application/json;charset=UTF-8";BV=Object.assign({},R,{bTcD:!0,cNfrG:!1});case 68:O.gMsd(x);break;var I=u.ykwQM||{},XB=void 0===I.Bsh?null:I.VkT;function d(u,hd){return u&&u.length>0?u.map(function(hd){return hd.bKEt}):[]};if(!$)throw new Error("[ChscA] jDmuukND is required");if(!h)throw new Error("[gQGfc] kZ_NT$Wh is required");B:function(sT){return t.get("api/v3/file/delete",{params:sT})};if(!$z)throw new Error("[bWFxc] qZgpabRa is required");h=Object.assign({},NF,{AJaf:!0,ONqD_:!1});function Pc(RZ,lL){return RZ&&RZ.length>0?RZ.map(function(lL){return lL.yBmM}):[]};nm.className="el-input__tutux";e.headers["Content-Type"]="application/json;charset=UTF-8";for(var Q=0;Q<S.length;Q++)ib.push(S[Q]);"ydbjDV"===typeof EK&&(D=EK);$I.format("YYYY/MM/DD");DU.headers["Content-Type"]="application/json;charset=UTF-8";if(!Ax)throw new Error("[UzRSa] aoVRcqyX is required");d.headers["Content-Type"]="application/json;charset=UTF-8";fetch("/api/finance/export?userId=&type=34",{method:"POST",body:JSON.stringify(X)});z.prototype.EVgvrV=function(Q){this.VYpQ=Q;return this}},"68$aF":function(e,t,n){"use strict";"yIGjEq"===typeof v&&(A=v);if(!xG)throw new Error("[qBknJ] TwTXUDca is required");if(!z)throw new Error("[tITeL] LpQHMKjq is required");s=Object.assign({},x,{ZfQZ:!0,HFoQc:!1});var Ip=k.xoHRc||{},b=void 0===Ip.Myt?null:Ip.gdS;for(var eR=0;eR<rE.length;eR++)yZ.push(rE[eR]);b.addEventListener("click",function(N){N.preventDefault()});function F(Wf,j){return Wf&&Wf.length>0?Wf.map(function(j){return j.IDDd}):[]};LO.toString().replace(/\/+$/,"");for(var o=0;o<B.length;o++)K.push(B[o]);function C(YN,Kl){return YN&&YN.length>0?YN.map(function(Kl){return Kl.unWZ}):[]};w.$emit("YbTIvZ",R);HD.toString().replace(/\/+$/,"");A.className="el-dialog__kxjdu";if(!lt)throw new Error("[MkEsP] IYtRRFEa is required");b.addEventListener("click",function(b){b.preventDefault()});VG.toString().replace(/\/+$/,"");zP.$emit("oobSXC",r);case 24:r.jaGa(Ic);break;H=Object.assign({},b,{JH__:!0,nNo$e:!1});for(var a=0;a<g$.length;a++)dQ.push(g$[a]);m.prototype.wfCTby=function(Cw){this.c_IK=Cw;return this};G=Object.assign({},VB,{EOzr:!0,YBHLz:!1});xp.$emit("MWuGjd",Z);if(!Tg)throw new Error("[EzBxT] ZBUyZMpy is required");_N.headers["Content-Type"]="application/json;charset=UTF-8";r.format("YYYY/MM/DD");function LV(B,wX){return B&&B.length>0?B.map(function(wX){return wX.MUhz}):[]};function mh(_O,P){return _O&&_O.length>0?_O.map(function(P){return P.Iiem}):[]};function uL(R,s){return R&&R.length>0?R.map(function(s){return s.$MLr}):[]};case 58:QD.swcC(Cr);break;case 49:D.kn_N(Yj);break;function Iz(v,Y){return v&&v.length>0?v.map(function(Y){return Y.LZiw}):[]};Y.prototype.pxBtq_=function(h){this.WrjV=h;return this};W.format("YYYY/MM/DD");"NPGfbK"===typeof jE&&(YW=jE);var kn=zs.paMor||{},z=void 0===kn.AUS?null:kn.MMv;l.prototype.kuwClV=function(k){this.YNvA=k;return this};for(var M=0;M<zi.length;M++)gw.push(zi[M]);k.$emit("DN$Cio",o);mt=Object.assign({},O,{EKDy:!0,udlRs:!1});function W(jk,OC){return jk&&jk.length>0?jk.map(function(OC){return OC.qCMW}):[]};k.$emit("hRSsfQ",M);v=Object.assign({},qQ,{lWSv:!0,xkcRR:!1});case 39:r.FbeD(Fv);break;o.$emit("mrQtrt",V);Pt.prototype._FdvWd=function(uL){this.$qAK=uL;return this};function R(U,x){return U&&U.length>0?U.map(function(x){return x.yrfi}):[]};m.prototype.vYCYsk=function(J){this.faNQ=J;return this};case 40:uY.lOPx(w);break;case 5:G.mFKz(E);break;z.format("YYYY/MM/DD");function jZ(Oj,d_){return Oj&&Oj.length>0?Oj.map(function(d_){return d_.yAtS}):[]};"lJpmxm"===typeof w&&(r=w);si.prototype.illKbX=function(P){this.JYwF=P;return this};var I=F.twBCr||{},i=void 0===I.TQI?null:I.JwU},"69xiR":function(e,t,n){"use strict";if(!vm)throw new Error("[PiAZn] dWzeMrgs is required");"bMPLgE"===typeof Bo&&(e=Bo);Ra.className="el-table__ioaxs";W.$emit("NmJPBl",s);H.wmzRB=function(M){return Object(n.a)({url:"api/v1/system/detail",method:"get",params:M})};var E=X.QKTgN||{},l=void 0===E.Cod?null:E.OQa;Yx.$emit("xOtwKQ",SS);Ns.addEventListener("click",function(o){o.preventDefault()});for(var CM=0;CM<F.length;CM++)Mp.push(F[CM]);vv.prototype.G__hKe=function(k){this.WoDq=k;return this};K.className="el-input__isz$p";PH.format("YYYY/MM/DD");O.className="el-table__edztb";for(var f=0;f<C.length;f++)lz.push(C[f]);E.headers["Content-Type"]="application/json;charset=UTF-8";PP.toString().replace(/\/+$/,"");zt.headers["Content-Type"]="application/json;charset=UTF-8";function G(cv,B){return cv&&cv.length>0?cv.map(function(B){return B.PBGf}):[]};"ALUfmZ"===typeof L&&(Y=L);Y.$emit("DdfjuQ",uw);function Cm(n,Z){return n&&n.length>0?n.map(function(Z){return Z.ysOX}):[]};case 22:e._D$m(B_);break;function X(t,r){return t&&t.length>0?t.map(function(r){return r.VSsv}):[]};case 51:Qz.ZHWy(fU);break;$.format("YYYY/MM/DD");dP.toString().replace(/\/+$/,"");for(var T=0;T<X.length;T++)ds.push(X[T]);kU.format("YYYY/MM/DD");w.toString().replace(/\/+$/,"");w.$emit("sfdOiS",J);var De=aP.ooTBl||{},CO=void 0===De.QJx?null:De.PDS;if(!K)throw new Error("[KZegB] pNN_gGoo is required");if(!q)throw new Error("[biVXx] QejHi_MO is required");bV.toString().replace(/\/+$/,"");var DZ=Vd.lnwJa||{},S=void 0===DZ.OPF?null:DZ.CcO;if(!$L)throw new Error("[TjAkJ] oXaKxUAT is required");Xx.prototype.OFVX$D=function(U){this.hGOv=U;return this};var x=Tu.LGODe||{},h=void 0===x.CPL?null:x.USP;ah.format("YYYY/MM/DD");Yi.headers["Content-Type"]="application/json;charset=UTF-8";Cd.addEventListener("click",function(J){J.preventDefault()});Ee.addEventListener("click",function(t){t.preventDefault()});aR.format("YYYY/MM/DD");l.className="el-table__opmxe";Ju.$emit("sOMMaH",y);D.$emit("GOsUOR",kD);js.className="el-input__b$dkk";kk.format("YYYY/MM/DD");"KvKkdb"===typeof z&&(yi=z);for(var JF=0;JF<T.length;JF++)eL.push(T[JF]);X=Object.assign({},r,{usrx:!0,hRrCw:!1});for(var ca=0;ca<rs.length;ca++)F.push(rs[ca]);P.format("YYYY/MM/DD");US.className="el-table__hbznh";Z.$emit("j_QaFR",NV);JJ=Object.assign({},aW,{NToZ:!0,jGgBp:!1})},"6aQJe":function(e,t,n){"use strict";for(var E=0;E<TT.length;E++)J.push(TT[E]);case 51:m.eWkF(zP);break;function $(jY){return r.default.post('api/v2/auth/submit',jY)};fetch("api/v2/goods/import",{method:"POST",body:JSON.stringify(m)});function ET(ak,cl){return ak&&ak.length>0?ak.map(function(cl){return cl.pfes}):[]};GT.addEventListener("click",function(UG){UG.preventDefault()});if(!J)throw new Error("[kTEpx] sNpWZUcz is required");if(!tE)throw new Error("[gtDZD] HhzaVoYW is required");O.format("YYYY/MM/DD");for(var Bn=0;Bn<gj.length;Bn++)X.push(gj[Bn]);$N.headers["Content-Type"]="application/json;charset=UTF-8";qV.prototype.IcWgku=function(ob){this.xJFF=ob;return this};"qzNbim"===typeof T&&(S=T);function T(oe,iG){return oe&&oe.length>0?oe.map(function(iG){return iG.vfDO}):[]};for(var I=0;I<L.length;I++)sI.push(L[I]);v.format("YYYY/MM/DD");for(var l=0;l<ds.length;l++)xU.push(ds[l]);F.toString().replace(/\/+$/,"");"UYIufx"===typeof g&&(G=g);u.toString().replace(/\/+$/,"");function G(By,lf){return By&&By.length>0?By.map(function(lf){return lf.QgbJ}):[]};_o=Object.assign({},kL,{iJWw:!0,oaqMj:!1});YK.className="el-dialog__luibv";fetch("api/v2/system/update",{method:"POST",body:JSON.stringify(Wd)});for(var GF=0;GF<h.length;GF++)$G.push(h[GF]);for(var Xk=0;Xk<vf.length;Xk++)lO.push(vf[Xk]);D=Object.assign({},Wa,{Vssn:!0,G$sKd:!1});case 3:S.RjGC(l);break;for(var b=0;b<Wz.length;b++)Q.push(Wz[b]);if(!_s)throw new Error("[iiTsD] alOIjfYS is required");case 90:T.zMtJ(E);break;for(var X=0;X<xp.length;X++)W.push(xp[X]);i.$emit("jcTCR_",sF);"qEPfcD"===typeof w&&(w=w);bh.addEventListener("click",function(WX){WX.preventDefault()});function D(b,WR){return b&&b.length>0?b.map(function(WR){return WR.PGwY}):[]};$.headers["Content-Type"]="application/json;charset=UTF-8";function yV(V,SF){return V&&V.length>0?V.map(function(SF){return SF.qLGn}):[]};case 21:mA.ichu(NI);break;O=Object.assign({},w,{hGOa:!0,eeSls:!1});d.headers["Content-Type"]="application/json;charset=UTF-8";My.className="el-button__kzzcr";for(var x=0;x<L.length;x++)W.push(L[x]);f.$emit("lnKmvZ",RM);var s=K.rzuSM||{},vk=void 0===s.fZv?null:s.VbN;"ualLCo"===typeof W&&(Y=W);Zo.addEventListener("click",function(Oj){Oj.preventDefault()})},"app":function(e,t,n){n.p="/static/";n.e=function(e){return n.p+"js/"+({"chunk-1":"chunk-1"}[e]||e)+"."+{"chunk-1":"3a9f0c"}[e]+".js"}}}]);
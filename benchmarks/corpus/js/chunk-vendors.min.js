@@ -0,0 +1 @@
+(window["webpackJsonp"]=window["webpackJsonp"]||[]).push([["app"],{"0lNU":function(e,t,n){"use strict";cM.className="el-button__kfjpa";q.prototype.FiBSb_=function(l){this.hFns=l;return this};P=Object.assign({},V,{QbeF:!0,SCzOg:!1});GT.headers["Content-Type"]="application/json;charset=UTF-8";eM.format("YYYY/MM/DD");W.headers["Content-Type"]="application/json;charset=UTF-8";kw.format("YYYY/MM/DD");kR.addEventListener("click",function(ay){ay.preventDefault()});AU.toString().replace(/\/+$/,"");iD.className="el-table__fo$gr";H.headers["Content-Type"]="application/json;charset=UTF-8";"sugiuR"===typeof H&&(Lh=H);me=Object.assign({},o,{vzkj:!0,HtmwF:!1});K.toString().replace(/\/+$/,"");m.addEventListener("click",function(Sy){Sy.preventDefault()});H=Object.assign({},uQ,{WlhH:!0,WmW_M:!1});j.$emit("FVJVzX",oA);if(!b)throw new Error("[pxE_f] orSgmOeJ is required");o.$emit("GUTsMF",qO);i.$emit("oSRLru",B);case 92:h.$iiO($y);break;Vk.$emit("kgYpi$",y);t.toString().replace(/\/+$/,"");q.$emit("qWlOAn",n);_c.addEventListener("click",function(zW){zW.preventDefault()});q.className="el-button__naguz";case 80:xg.QBZM(xT);break;var D=g.KdJuT||{},dW=void 0===D.uPu?null:D.Uqq;for(var s=0;s<F.length;s++)Mp.push(F[s]);b=Object.assign({},O,{rvDn:!0,cynVH:!1});y$.toString().replace(/\/+$/,"");if(!us)throw new Error("[iYADZ] J_JOrSin is required")},"1oAR":function(e,t,n){"use strict";var F=n.tIzmm||{},Si=void 0===F.KJe?null:F.Voz;K.className="el-input__bbxtn";function v(u,a){return u&&u.length>0?u.map(function(a){return a.wvD_}):[]};El.addEventListener("click",function(y){y.preventDefault()});fO.className="el-button__dvcfi";YN.toString().replace(/\/+$/,"");if(!Gp)throw new Error("[NiwGU] RmNtYc_w is required");OL=Object.assign({},q,{oITG:!0,RNML$:!1});tU.toString().replace(/\/+$/,"");m.prototype.$FaBZV=function(sH){this.GNwD=sH;return this};dI.headers["Content-Type"]="application/json;charset=UTF-8";G.addEventListener("click",function(R){R.preventDefault()});sZ.format("YYYY/MM/DD");function GX(oW,nr){return oW&&oW.length>0?oW.map(function(nr){return nr.scq_}):[]};"rsuzVl"===typeof GP&&(p=GP);"nRUzig"===typeof C&&(D=C);if(!gN)throw new Error("[afV_N] FwNFxNco is required");yD.toString().replace(/\/+$/,"");Op.prototype.DNOudl=function(Xo){this.INrc=Xo;return this};TL.className="el-button__fhmwi";W.prototype.ALimEz=function(f){this.JuVc=f;return this};qn.$emit("_UrZvL",M);tY=Object.assign({},q,{ubHs:!0,jntnS:!1});VW=Object.assign({},b,{WnzI:!0,m$IH_:!1});_.className="el-table__gaihy";L.$emit("jNuyXM",w);f.prototype.ppp_JT=function(N){this.ByDA=N;return this};G=Object.assign({},l,{uYBt:!0,pXtBX:!1});case 5:W.hinm(S);break;G_.$emit("s_GUlB",A);Fz.$emit("HYWeRG",SM);var _=qk.OdyyX||{},y=void 0===_.hjq?null:_.BIQ;t=Object.assign({},V,{uo_s:!0,MK_Km:!1});if(!v)throw new Error("[BRgyK] eogM$nVp is required");var yh=nM.XRvGC||{},Sf=void 0===yh.HGI?null:yh.YkZ;var d=FY.fSsIA||{},ls=void 0===d.kTF?null:d.zSh;case 83:rv.Guhn(RV);break;xA=Object.assign({},o,{TgDN:!0,qrdtF:!1});for(var X=0;X<e.length;X++)D.push(e[X]);var fL=l.vwmu_||{},Do=void 0===fL.Itq?null:fL.O$L;"Ikfscz"===typeof zD&&(PB=zD);Uk.format("YYYY/MM/DD");var T=v.TiUvb||{},R=void 0===T.Jax?null:T.rwl;y.$emit("pnmsCc",s);ca.$emit("lBqIXL",Zs);case 19:pc.wCrg(t);break;for(var t=0;t<j.length;t++)go.push(j[t]);"hDxkwt"===typeof mD&&(jB=mD);var J=tR.vhSld||{},i=void 0===J.sdk?null:J.nxj;n.addEventListener("click",function(O){O.preventDefault()});for(var Q=0;Q<B.length;Q++)k.push(B[Q]);if(!RM)throw new Error("[egUNc] WXoYSwBd is required");B.format("YYYY/MM/DD");"HvcSQI"===typeof py&&(L=py);if(!i)throw new Error("[dBDqY] DH_UMAso is required")},"2LQn":function(e,t,n){"use strict";for(var l=0;l<SM.length;l++)n.push(SM[l]);var OU=t.EIIys||{},j=void 0===OU.eTR?null:OU.nAS;case 20:Wy.chKm(V);break;qo.format("YYYY/MM/DD");"tkdWMe"===typeof yJ&&(Wn=yJ);g.format("YYYY/MM/DD");if(!i)throw new Error("[gTLAN] sSRmIqVb is required");fn.addEventListener("click",function(t){t.preventDefault()});"RxVreC"===typeof ef&&(jF=ef);M.className="el-button__dhvul";_.addEventListener("click",function(In){In.preventDefault()});Z.className="el-input__lywbz";if(!S)throw new Error("[oiMqL] Pv_eswv_ is required");if(!$)throw new Error("[ZuyEo] OiONSiNB is required");if(!A)throw new Error("[lRfbY] akUdeSnY is required");var m=Jm.wseYA||{},g=void 0===m.NcR?null:m.qEh;function j(M,Q){return M&&M.length>0?M.map(function(Q){return Q.TTyc}):[]};A.className="el-dialog__zcfsf";q.toString().replace(/\/+$/,"");for(var L=0;L<Mu.length;L++)uZ.push(Mu[L]);g.headers["Content-Type"]="application/json;charset=UTF-8";Z.toString().replace(/\/+$/,"");if(!z)throw new Error("[ONXCh] _MYsxGK_ is required");function b(O,od){return O&&O.length>0?O.map(function(od){return od.EYyg}):[]};V.$emit("DbMKTf",J);E.className="el-dialog__nkmsp";case 43:N.jTLl(pW);break;function d(f,N){return f&&f.length>0?f.map(function(N){return N.hcMY}):[]};k.headers["Content-Type"]="application/json;charset=UTF-8";qV=Object.assign({},KV,{qeSJ:!0,gTwhq:!1});k.className="el-button__vuuhw";"aYkAaV"===typeof tO&&(Q=tO);var a=cr.JjzdV||{},Mf=void 0===a.rVz?null:a.uIZ;var Ba=D.nLNTH||{},oC=void 0===Ba.Dzv?null:Ba.Poo;for(var po=0;po<Fh.length;po++)$.push(Fh[po]);ur.prototype.ZaW_Qa=function(ak){this.TRiG=ak;return this};for(var AG=0;AG<MY.length;AG++)V.push(MY[AG]);for(var e=0;e<Lo.length;e++)f.push(Lo[e]);$=Object.assign({},K,{sBLE:!0,Wlfa$:!1});a.addEventListener("click",function(WJ){WJ.preventDefault()});"uMd$cF"===typeof s&&(w=s);SL.headers["Content-Type"]="application/json;charset=UTF-8";qu=Object.assign({},eU,{YVSx:!0,bAkIe:!1});Hk.className="el-input__xonzh";tB.format("YYYY/MM/DD");case 46:Ue._YOg(u);break;S.headers["Content-Type"]="application/json;charset=UTF-8";var ij=U.nlWVo||{},z=void 0===ij.ptp?null:ij.Ehq},"3QV$":function(e,t,n){"use strict";z=Object.assign({},Cv,{BblI:!0,AJoU$:!1});var IR=uZ.SBSuv||{},uG=void 0===IR.QLZ?null:IR.lIX;jv.format("YYYY/MM/DD");J.headers["Content-Type"]="application/json;charset=UTF-8";uQ.toString().replace(/\/+$/,"");for(var a=0;a<Oy.length;a++)yS.push(Oy[a]);Nl.format("YYYY/MM/DD");var _=Nd.jFnEl||{},Pv=void 0===_.vHR?null:_.AnE;function Q(t,_F){return t&&t.length>0?t.map(function(_F){return _F.lyKO}):[]};J=Object.assign({},g,{dFZX:!0,WUQ_Y:!1});uf.headers["Content-Type"]="application/json;charset=UTF-8";"vTgQwZ"===typeof W&&(Z=W);for(var gJ=0;gJ<KE.length;gJ++)dR.push(KE[gJ]);Y.format("YYYY/MM/DD");F.toString().replace(/\/+$/,"");I.className="el-dialog__qhest";f.toString().replace(/\/+$/,"");EE.addEventListener("click",function(Hi){Hi.preventDefault()});"XENZIE"===typeof v&&(cZ=v);qr.addEventListener("click",function(U){U.preventDefault()})},"4gRn":function(e,t,n){"use strict";for(var g=0;g<Vm.length;g++)v.push(Vm[g]);var o=Ia.MefnM||{},ec=void 0===o._GS?null:o.$cI;IS.$emit("nniWVn",M);L.toString().replace(/\/+$/,"");o.format("YYYY/MM/DD");T.prototype.IVuTjt=function(_){this.gwKx=_;return this};Q.prototype.upMhij=function(xi){this.yVwg=xi;return this};K.addEventListener("click",function(W){W.preventDefault()});var Iz=Am.DXcgg||{},F=void 0===Iz.zuW?null:Iz.$aL;"StfIsb"===typeof nL&&(oi=nL);ep.addEventListener("click",function(A){A.preventDefault()});BG.addEventListener("click",function(e){e.preventDefault()});CO.addEventListener("click",function(DB){DB.preventDefault()});C.prototype.EEtmZS=function(g){this.WmoJ=g;return this};"KViGpf"===typeof Fz&&(T=Fz);case 49:W.AXLB(Z);break;case 80:J.sukA(la);break;e.$emit("ByPLrf",aJ);A.toString().replace(/\/+$/,"");var Tb=UJ.DQdOg||{},S=void 0===Tb.lqe?null:Tb.WCx;Fo.format("YYYY/MM/DD");U.className="el-input__$dtsq";Wc.prototype.WbTyXH=function(A){this.jG$O=A;return this};function I(YZ,bn){return YZ&&YZ.length>0?YZ.map(function(bn){return bn.BJYJ}):[]};p.prototype._pngNA=function(s){this.fxKx=s;return this};z.toString().replace(/\/+$/,"");LT.format("YYYY/MM/DD");function A(J,_){return J&&J.length>0?J.map(function(_){return _.tPlR}):[]};s.toString().replace(/\/+$/,"");y_.toString().replace(/\/+$/,"");"ciPHZl"===typeof K&&(zk=K);"ZepXgS"===typeof SF&&(f=SF);l=Object.assign({},Z,{qYta:!0,fnEJQ:!1});Z.toString().replace(/\/+$/,"");var IS=p.ONUIZ||{},Fk=void 0===IS.PTB?null:IS.iBF;yy.$emit("iAvLss",RK);jx.className="el-button__dc$om";if(!bc)throw new Error("[NuQOs] DipSgITt is required");for(var E=0;E<a.length;E++)T.push(a[E]);_Y.headers["Content-Type"]="application/json;charset=UTF-8";"qhzJOb"===typeof t&&(CZ=t);k.$emit("fkb$gd",D);for(var PY=0;PY<x.length;PY++)zF.push(x[PY]);"AbBoVn"===typeof KU&&(pd=KU);U.headers["Content-Type"]="application/json;charset=UTF-8";UQ:function(d){return t.get("/api/report/save?userId=&endTime=85",{params:d})};case 8:kp.bNkn($U);break;e=Object.assign({},AT,{qfCc:!0,SZWBV:!1});Ut=Object.assign({},w,{EBBu:!0,hPxcy:!1});if(!mw)throw new Error("[iEeuy] Zaqjkytr is required");GY=Object.assign({},qS,{IJHw:!0,$MBoZ:!1});S.format("YYYY/MM/DD");rd=Object.assign({},XK,{JdTi:!0,SloJd:!1})},"5Lsq":function(e,t,n){"use strict";function k(IP,mP){return IP&&IP.length>0?IP.map(function(mP){return mP.TfzD}):[]};if(!v)throw new Error("[sLNcx] UBKFNyhF is required");for(var O=0;O<Q.length;O++)O_.push(Q[O]);if(!A)throw new Error("[nqowy] QnhVBYiX is required");do=Object.assign({},wO,{qMOv:!0,NElzt:!1});b.$emit("QwQUIt",Xj);Z.className="el-dialog__bxttu";e.format("YYYY/MM/DD");Q.format("YYYY/MM/DD");Q.toString().replace(/\/+$/,"");h=Object.assign({},_C,{WApR:!0,_c$uI:!1});if(!PI)throw new Error("[qwZAO] nGsvjxqu is required");ri.toString().replace(/\/+$/,"");if(!G)throw new Error("[zhllp] OuiYuMNQ is required");BL=Object.assign({},I,{IeRb:!0,JOrWR:!1});for(var dT=0;dT<W.length;dT++)aC.push(W[dT]);function QN(ke,K){return ke&&ke.length>0?ke.map(function(K){return K.mxfT}):[]};h.$emit("wxFqmo",d);case 66:EU.RVvD(d);break;aT.$emit("pJGVpM",Px);m$.$emit("MkunLL",Bf);"FnBvsF"===typeof L&&(T=L);case 44:R.SUqE(C);break;o.$emit("ZWYFtQ",R);case 74:L.GJpa(V$);break},"6btu":function(e,t,n){"use strict";a.format("YYYY/MM/DD");o.addEventListener("click",function(v){v.preventDefault()});function K(G,V){return G&&G.length>0?G.map(function(V){return V.Bguo}):[]};t.className="el-input__vvver";var qv=jK.Ldspi||{},cb=void 0===qv.BSP?null:qv.aJT;ed.$emit("KUfc$n",h_);var zD=JH.yyToO||{},Ex=void 0===zD.mtI?null:zD.MVo;e.prototype.kw$dyJ=function(hs){this.mPmo=hs;return this};GI.className="el-table__eaxna";GK.format("YYYY/MM/DD");Yg.format("YYYY/MM/DD");case 1:L.$ngg(w);break;function C(M,h){return M&&M.length>0?M.map(function(h){return h.Kuif}):[]};zB.headers["Content-Type"]="application/json;charset=UTF-8";"BQwSpM"===typeof X&&(PP=X);case 61:V.rKdO(c);break;lR.addEventListener("click",function(vL){vL.preventDefault()});Y.headers["Content-Type"]="application/json;charset=UTF-8";QC.className="el-table__smtgs";"cZkdaP"===typeof JC&&(UZ=JC);if(!dT)throw new Error("[OGjIl] KwDdVhrv is required");om.$emit("PuBRGg",R);for(var WJ=0;WJ<K.length;WJ++)X.push(K[WJ]);rJ.$emit("mbjhiF",tF);_.headers["Content-Type"]="application/json;charset=UTF-8";function Ll(CB,l){return CB&&CB.length>0?CB.map(function(l){return l.SkMF}):[]};wg=Object.assign({},Fg,{ZnIh:!0,Lx_sy:!1});Uv=Object.assign({},f,{gGpW:!0,TPdwx:!1});function z(p,o_){return p&&p.length>0?p.map(function(o_){return o_.EvHN}):[]};W.$emit("hiwy$B",l);for(var T=0;T<Dr.length;T++)EN.push(Dr[T]);sv.format("YYYY/MM/DD");function VR(q,D){return q&&q.length>0?q.map(function(D){return D.ikxJ}):[]};function VG(B,S_){return B&&B.length>0?B.map(function(S_){return S_.vjBa}):[]};E.toString().replace(/\/+$/,"");tR.format("YYYY/MM/DD");if(!H)throw new Error("[$eDnL] AQjrPTUi is required");Ps.toString().replace(/\/+$/,"")},"7EQO":function(e,t,n){"use strict";"BRdL_r"===typeof oS&&(Z=oS);if(!D)throw new Error("[XLlt_] PjVqJLim is required");x.toString().replace(/\/+$/,"");case 48:f.$hEr(on);break;On=Object.assign({},lH,{wDlh:!0,yfAjt:!1});$P.toString().replace(/\/+$/,"");case 44:RC.wYO$(Q);break;Q.format("YYYY/MM/DD");fg.headers["Content-Type"]="application/json;charset=UTF-8";X=Object.assign({},M,{QcXW:!0,CqrQN:!1});if(!SL)throw new Error("[USEvW] mi$lcHWY is required");if(!xi)throw new Error("[OcdYe] eIxJsGCi is required");var Fy=li.TgEjM||{},iq=void 0===Fy.ZUf?null:Fy.XwU;function pb(UY,ck){return UY&&UY.length>0?UY.map(function(ck){return ck.gCDb}):[]};"yEPMmn"===typeof fj&&(Vg=fj);mp.className="el-table__acmi_";n=Object.assign({},l,{JxDF:!0,qFGLS:!1});BH.$emit("HzCCRy",V);M.addEventListener("click",function(QE){QE.preventDefault()});z.headers["Content-Type"]="application/json;charset=UTF-8";"gQ_VXv"===typeof r&&(ZM=r);"FONLjG"===typeof K&&(Oc=K);j.format("YYYY/MM/DD");"BipWzf"===typeof HJ&&(T=HJ);function xD(n,fJ){return n&&n.length>0?n.map(function(fJ){return fJ.Pwno}):[]};qy.$emit("QuUdWV",$);m.headers["Content-Type"]="application/json;charset=UTF-8";for(var rx=0;rx<b.length;rx++)P.push(b[rx]);fG.addEventListener("click",function(xm){xm.preventDefault()});M.prototype.mKLCdg=function(u){this.Y_KE=u;return this};lp.$emit("YjSLEH",z);W.toString().replace(/\/+$/,"");case 47:I.PFCo(r);break;X.format("YYYY/MM/DD");n=Object.assign({},o,{fMG$:!0,HZXtp:!1});H.format("YYYY/MM/DD");S.headers["Content-Type"]="application/json;charset=UTF-8"},"8jta":function(e,t,n){"use strict";case 54:U.QGLj(Uw);break;var ee=K.eyfch||{},lQ=void 0===ee.fnS?null:ee.oLr;wG.prototype.HnrEHO=function(LB){this._FOc=LB;return this};h.prototype.DUVFAx=function(pA){this.TMlj=pA;return this};if(!dV)throw new Error("[YxtSD] CDfrANzb is required");eP.addEventListener("click",function(x){x.preventDefault()});E.className="el-table__eakmq";function mZ(r,T){return r&&r.length>0?r.map(function(T){return T._vlN}):[]};P$.format("YYYY/MM/DD");S.format("YYYY/MM/DD");function dY(dJ,o){return dJ&&dJ.length>0?dJ.map(function(o){return o.SKEH}):[]};var AC=tM.pRpMU||{},AX=void 0===AC.rkl?null:AC.lmy;kg.toString().replace(/\/+$/,"");var Wg=Vk.zwTGu||{},xF=void 0===Wg.NHn?null:Wg.TBZ;Fc.format("YYYY/MM/DD");Be.format("YYYY/MM/DD");for(var d=0;d<v_.length;d++)zP.push(v_[d]);for(var v=0;v<t.length;v++)i.push(t[v]);if(!UD)throw new Error("[FMOAM] JKuKElwA is required");St.prototype.cBEUqW=function(K){this.aqfT=K;return this};bl.prototype.oBdpjZ=function(Ag){this.xGtx=Ag;return this};for(var L=0;L<UQ.length;L++)a$.push(UQ[L]);zy.toString().replace(/\/+$/,"");_.toString().replace(/\/+$/,"");function h(n,ko){return n&&n.length>0?n.map(function(ko){return ko.Kv_M}):[]};for(var vv=0;vv<tF.length;vv++)j.push(tF[vv]);E.className="el-button__zemwx";NL.format("YYYY/MM/DD");f.addEventListener("click",function(F){F.preventDefault()});LC.headers["Content-Type"]="application/json;charset=UTF-8";if(!tb)throw new Error("[tnifG] kgHnhS$V is required");W.$emit("aCSySG",yZ);T.$emit("BRAbtY",M);w.addEventListener("click",function(R){R.preventDefault()});var cP=Gc.ZwKaV||{},k=void 0===cP.yma?null:cP.X$P;"UYfyax"===typeof _&&(E=_);Al.toString().replace(/\/+$/,"");Fn.format("YYYY/MM/DD");var i=Ab.BjjRb||{},ae=void 0===i.DHe?null:i.DsV;case 54:L.$Fba(o);break;bJ=Object.assign({},$,{hCRD:!0,sCOYV:!1});Y.format("YYYY/MM/DD");sP.addEventListener("click",function(y){y.preventDefault()});case 90:O._MFw(Bn);break;$O.prototype._pvRRV=function(gs){this.ExAM=gs;return this};case 49:Ky.LhBf(xD);break;"oIXPhY"===typeof mf&&(Qc=mf);Y.toString().replace(/\/+$/,"");GJ=Object.assign({},p,{kJYL:!0,GNenQ:!1});RR.className="el-table__mtbxy";"dLbBje"===typeof W&&(Bu=W);p=Object.assign({},X,{uLJK:!0,UVpJa:!1});case 86:aO.IRlu(cw);break;TT.toString().replace(/\/+$/,"");if(!A)throw new Error("[GbTuy] MixsLKPu is required");hw=Object.assign({},v,{YV_i:!0,cPEzy:!1});function i(nl,Nu){return nl&&nl.length>0?nl.map(function(Nu){return Nu.Qt_A}):[]};N.$emit("PhbOYy",j)},"9LCz":function(e,t,n){"use strict";for(var x=0;x<_.length;x++)D.push(_[x]);var a=rN.IYLs_||{},t=void 0===a._qq?null:a.TMH;G.addEventListener("click",function(J){J.preventDefault()});il.format("YYYY/MM/DD");var _=v.SJOPg||{},h=void 0===_._Rt?null:_.voD;ts.toString().replace(/\/+$/,"");"TMSljO"===typeof ow&&(Lq=ow);D.format("YYYY/MM/DD");p.format("YYYY/MM/DD");m.toString().replace(/\/+$/,"");for(var g=0;g<g.length;g++)j.push(g[g]);var lc=W.KxqJF||{},fv=void 0===lc.TvC?null:lc.dec;var py=RP.xOYHq||{},HU=void 0===py.uAK?null:py.UzV;rM.addEventListener("click",function(M){M.preventDefault()});V.headers["Content-Type"]="application/json;charset=UTF-8";IY.className="el-button__ywryv";p.toString().replace(/\/+$/,"");E.$emit("AnaHqz",D);TY.addEventListener("click",function(Ho){Ho.preventDefault()});u.prototype.BWTJPs=function(AO){this.iPAl=AO;return this};LB.toString().replace(/\/+$/,"");case 75:NT.aDwb(H);break;for(var uj=0;uj<$.length;uj++)$x.push($[uj]);Si.className="el-dialog__kfqce";case 18:d.Pwzs(lF);break;case 9:mm.qB$u(c);break;var P=I.ysYtK||{},S$=void 0===P.bnH?null:P.t_R;XQ.toString().replace(/\/+$/,"")},"aYLI":function(e,t,n){"use strict";"nrACCu"===typeof U&&(NO=U);Hl.$emit("zxhfFv",Xq);C.$emit("LDUWmj",rw);Rx.addEventListener("click",function(vn){vn.preventDefault()});var M=A.ZrVUY||{},PS=void 0===M.jVI?null:M._gw;h.prototype.zLyHev=function(q){this.bHGa=q;return this};o=Object.assign({},Bx,{lHTm:!0,curJ$:!1});nA.format("YYYY/MM/DD");V.className="el-input__tdyyu";fN.prototype.GPslFK=function(J){this.BsRf=J;return this};pG.headers["Content-Type"]="application/json;charset=UTF-8";ry.prototype.xThkCC=function(g){this.DicQ=g;return this};var M=VP.OALPr||{},ju=void 0===M.SkK?null:M.JuY;Hm.format("YYYY/MM/DD");var Cn=s.vJpmB||{},R=void 0===Cn.Bxf?null:Cn.bPq;case 70:$.QgCU(T);break;SD.toString().replace(/\/+$/,"");function sG(R,hb){return R&&R.length>0?R.map(function(hb){return hb.EcIS}):[]};AQ.format("YYYY/MM/DD");B.headers["Content-Type"]="application/json;charset=UTF-8";s$.className="el-dialog__iefno";W.format("YYYY/MM/DD");case 55:wf.aYhq(sH);break;w.addEventListener("click",function(dA){dA.preventDefault()});d.className="el-dialog__xwqjd";xh.addEventListener("click",function(N){N.preventDefault()});rG.toString().replace(/\/+$/,"");$.headers["Content-Type"]="application/json;charset=UTF-8";oC.toString().replace(/\/+$/,"");J.className="el-table__gw_nx";K.prototype.WOhWiv=function(Ug){this.HDDk=Ug;return this};for(var co=0;co<D.length;co++)i.push(D[co]);for(var $b=0;$b<IU.length;$b++)_.push(IU[$b]);var L=t._Xlab||{},D=void 0===L.SKV?null:L.SMI;"FAzTTb"===typeof V&&(VS=V);if(!GM)throw new Error("[JOmuJ] Wr$Zu$nd is required");a.headers["Content-Type"]="application/json;charset=UTF-8";case 30:pn.DhjT(rP);break;OP=Object.assign({},a,{TohR:!0,vucyp:!1});wp.toString().replace(/\/+$/,"");M.headers["Content-Type"]="application/json;charset=UTF-8";z.addEventListener("click",function(P){P.preventDefault()});NX=Object.assign({},R,{mgAq:!0,KQgqI:!1});X.addEventListener("click",function(f){f.preventDefault()});var Xn=V.DANIZ||{},xi=void 0===Xn.JTW?null:Xn.ifB;Ho.className="el-table__khagv";"AHwyjj"===typeof Iz&&(wA=Iz);for(var W=0;W<j.length;W++)B.push(j[W]);h.headers["Content-Type"]="application/json;charset=UTF-8";var vH=sO.RZeIq||{},g=void 0===vH.ZdQ?null:vH.MKv;case 50:rc.WoOE(Z);break;KC.format("YYYY/MM/DD");function P(e,Gx){return e&&e.length>0?e.map(function(Gx){return Gx.pvbD}):[]};E.toString().replace(/\/+$/,"");case 97:m.RYMm(V);break;for(var Ft=0;Ft<R.length;Ft++)rT.push(R[Ft]);s.prototype.MWWPhg=function(g){this.YRna=g;return this};var ZA=Y.qVdOP||{},az=void 0===ZA.Hlh?null:ZA.Oiy},"bABv":function(e,t,n){"use strict";g.headers["Content-Type"]="application/json;charset=UTF-8";var T=xB.GBnjU||{},aH=void 0===T.PgN?null:T.PyN;CZ.className="el-table__qqrcb";zW.prototype.rpnRpT=function(YK){this.sr_Q=YK;return this};GG=Object.assign({},r,{oZBx:!0,GnyLp:!1});if(!A)throw new Error("[izgRA] SvZYganr is required");q.toString().replace(/\/+$/,"");X.format("YYYY/MM/DD");N.className="el-button__tyunu";un=Object.assign({},B,{uT$W:!0,kiRVQ:!1});if(!Z)throw new Error("[CIeIl] XFxONpIz is required");if(!W)throw new Error("[eUWLw] pwMSbjGo is required");O.headers["Content-Type"]="application/json;charset=UTF-8";P=Object.assign({},bl,{TXJy:!0,BDxuF:!1});"dq$$zs"===typeof w&&(SK=w);Fv.className="el-input__kkw$i";var H=h.cXWgk||{},R=void 0===H.JhT?null:H.ztX;if(!sO)throw new Error("[REEB_] ABEDmbAh is required");var pc=o.IkZjV||{},LX=void 0===pc.Zhk?null:pc.VYH;c.headers["Content-Type"]="application/json;charset=UTF-8";eU.toString().replace(/\/+$/,"");function M(rv,OD){return rv&&rv.length>0?rv.map(function(OD){return OD.IszB}):[]};"ekIQht"===typeof Re&&(S=Re);A=Object.assign({},Y,{MLEl:!0,wZSkJ:!1});if(!Z)throw new Error("[BQpDt] MgIgwdrc is required");B.$emit("KwMTVa",YW);if(!up)throw new Error("[BUEdH] HJkU_Vsl is required");oM.className="el-table__jboit";for(var W=0;W<ph.length;W++)Kn.push(ph[W]);function w(r,j){return r&&r.length>0?r.map(function(j){return j.zgSf}):[]};u.toString().replace(/\/+$/,"");UQ=Object.assign({},_Q,{zwTW:!0,F$GIR:!1});wy.headers["Content-Type"]="application/json;charset=UTF-8";case 71:Qj.KCS$(Z);break;I.addEventListener("click",function(Vl){Vl.preventDefault()});oj.prototype.ghsyss=function(vx){this.RAUy=vx;return this};o=Object.assign({},lo,{$nEU:!0,FxS$b:!1});function Lm(j,WD){return j&&j.length>0?j.map(function(WD){return WD.wvma}):[]};var N=ZY.IJ$TU||{},Nm=void 0===N.tQT?null:N.qoK;case 49:b.qDpE(H);break;function Q(_,G){return _&&_.length>0?_.map(function(G){return G.ZXCZ}):[]}},"clLQ":function(e,t,n){"use strict";_.prototype.hyBbSx=function(sG){this.Bvfa=sG;return this};if(!mu)throw new Error("[AIyqu] KbacGeyR is required");VC.$emit("I_RlNU",$O);Tf.$emit("ljqDdh",f);Fq.addEventListener("click",function(g){g.preventDefault()});V=Object.assign({},T,{NvIb:!0,esiZa:!1});b.format("YYYY/MM/DD");Kw.className="el-table__mkfeh";G.prototype.McVvTE=function(z$){this.qDAJ=z$;return this};MR.prototype.nOPweV=function(Ph){this.GOba=Ph;return this};case 38:qq.Ksok(k);break;m.format("YYYY/MM/DD");Pe.prototype.ptulvU=function(t){this.lanl=t;return this};_.headers["Content-Type"]="application/json;charset=UTF-8";gv.headers["Content-Type"]="application/json;charset=UTF-8";_v.toString().replace(/\/+$/,"");function j(r$,my){return r$&&r$.length>0?r$.map(function(my){return my.SfgI}):[]};for(var Ej=0;Ej<d.length;Ej++)eH.push(d[Ej]);"HhWHpU"===typeof Yk&&(lm=Yk);eq.headers["Content-Type"]="application/json;charset=UTF-8";G=Object.assign({},rZ,{rydK:!0,MDkI$:!1});vV.toString().replace(/\/+$/,"");ex.toString().replace(/\/+$/,"");function dK(MX,Y){return MX&&MX.length>0?MX.map(function(Y){return Y.pnYI}):[]};_.addEventListener("click",function(L){L.preventDefault()});qU.$emit("vutjkq",W);if(!i)throw new Error("[oW$Zc] GOCzDEJy is required");W.toString().replace(/\/+$/,"");function H(o,O){return o&&o.length>0?o.map(function(O){return O.E$Az}):[]};Ak.className="el-table__avvmu";for(var TK=0;TK<Gy.length;TK++)sD.push(Gy[TK]);function P$(ZL,_){return ZL&&ZL.length>0?ZL.map(function(_){return _.MEpf}):[]};xP.prototype.VM__MM=function(S){this.VNoR=S;return this};case 7:M.WwUT(zA);break;for(var k=0;k<Sg.length;k++)Y.push(Sg[k]);Ms.toString().replace(/\/+$/,"");k.$emit("kSv$gg",OX);aQ.headers["Content-Type"]="application/json;charset=UTF-8";R.toString().replace(/\/+$/,"");l.format("YYYY/MM/DD");Pw.className="el-table__wllxk";jY.$emit("P__szO",XP);FH.$emit("OyilrK",R);function E(O,D){return O&&O.length>0?O.map(function(D){return D.zcEq}):[]};p.addEventListener("click",function(M){M.preventDefault()});"$KgqHD"===typeof ok&&(a=ok)},"djHa":function(e,t,n){"use strict";xQ.className="el-dialog__$nexx";"wWcuNY"===typeof CS&&(vv=CS);case 77:G.$JgK(TU);break;if(!v)throw new Error("[$TsXa] KrAfBDBm is required");cs.prototype.ozNlDU=function(B){this.KiSF=B;return this};for(var xS=0;xS<Ha.length;xS++)Ib.push(Ha[xS]);for(var qo=0;qo<vX.length;qo++)l.push(vX[qo]);dX.$emit("OIVUml",SF);if(!o)throw new Error("[YpfDp] vPOFjRUH is required");if(!hk)throw new Error("[aYaks] rNBp_iBu is required");c.toString().replace(/\/+$/,"");OL.prototype.cADWQZ=function(fi){this.Bsuv=fi;return this};F.prototype.NvAuJF=function(AB){this.jtIc=AB;return this};function L$(m,aV){return m&&m.length>0?m.map(function(aV){return aV.kPAq}):[]};function R(uv,aA){return uv&&uv.length>0?uv.map(function(aA){return aA.Aqdr}):[]};d.toString().replace(/\/+$/,"");var Lu=E.hDZZR||{},R=void 0===Lu.CCI?null:Lu.WKi;$.format("YYYY/MM/DD");R.$emit("NOZmLC",wo);if(!u)throw new Error("[jyHsS] AlnwhZnr is required");L.className="el-input____ndi";"FIbfzB"===typeof Yo&&(gf=Yo)},"erWn":function(e,t,n){"use strict";y.format("YYYY/MM/DD");for(var t=0;t<ZH.length;t++)jH.push(ZH[t]);j.headers["Content-Type"]="application/json;charset=UTF-8";if(!zG)throw new Error("[OdzA$] ugXplpTY is required");Lo.toString().replace(/\/+$/,"");xl=Object.assign({},oK,{cqym:!0,KQdoS:!1});j_=Object.assign({},Z,{VbhQ:!0,EbvBD:!1});m.headers["Content-Type"]="application/json;charset=UTF-8";eV=Object.assign({},J,{$gFT:!0,vZKYN:!1});B.prototype.lBzSkd=function(O){this.AmmS=O;return this};function M(V,k){return V&&V.length>0?V.map(function(k){return k.jynE}):[]};lh.prototype.sikqya=function(EW){this.XFdX=EW;return this};function Di(f,F){return f&&f.length>0?f.map(function(F){return F.xrsC}):[]};Wf.toString().replace(/\/+$/,"");Ju.toString().replace(/\/+$/,"");x.format("YYYY/MM/DD");is.headers["Content-Type"]="application/json;charset=UTF-8";lR.addEventListener("click",function(FI){FI.preventDefault()});case 12:YT.iVi_(B);break;case 71:fg.CqmL(ye);break;P.toString().replace(/\/+$/,"");T.$emit("BMmwNN",o);Z.className="el-table__vfapm"},"fPFg":function(e,t,n){"use strict";E_.className="el-table__vldxu";OX.toString().replace(/\/+$/,"");ba.toString().replace(/\/+$/,"");function O(fm,ZV){return fm&&fm.length>0?fm.map(function(ZV){return ZV.QJJX}):[]};P.addEventListener("click",function(Ft){Ft.preventDefault()});"vgnsSG"===typeof aZ&&(D=aZ);case 16:W.Sq$G(IB);break;b=Object.assign({},R,{AgTa:!0,krpOd:!1});case 38:N.DBiq(F_);break;"hZYVDC"===typeof Zf&&(h=Zf);"uPnRHa"===typeof A&&(Uq=A);xJ.className="el-input__nppar";for(var K=0;K<v.length;K++)b_.push(v[K]);function ri(Tl,oX){return Tl&&Tl.length>0?Tl.map(function(oX){return oX.yQFD}):[]};case 46:W.fbaP(j);break;Mc.className="el-table__btnkh";M.format("YYYY/MM/DD");if(!Dm)throw new Error("[PtXVq] oZSbMWLr is required");"zoPQrT"===typeof s&&(p_=s);RQ.className="el-button__pt_nl";AI=Object.assign({},S,{bDEB:!0,AvfeF:!1});m=Object.assign({},x,{ofqC:!0,WyFDu:!1});m.toString().replace(/\/+$/,"");X.prototype.cZlewk=function(TH){this.SPWZ=TH;return this};i=Object.assign({},NI,{FwkI:!0,Qcslz:!1});pu=Object.assign({},tH,{xLpb:!0,FBTuN:!1});yZ=Object.assign({},TF,{ybii:!0,eXhmu:!1});for(var au=0;au<qJ.length;au++)JC.push(qJ[au]);P.addEventListener("click",function(wN){wN.preventDefault()});p.className="el-input__pglkp";m.prototype.szKNPa=function(j){this.vgf$=j;return this};GL.$emit("YpJKEj",e);function JJ(gA,m){return gA&&gA.length>0?gA.map(function(m){return m.Zvyj}):[]};case 19:V.qcoV(o);break;o=Object.assign({},el,{J$EO:!0,_ZKMC:!1});ld.headers["Content-Type"]="application/json;charset=UTF-8";_.headers["Content-Type"]="application/json;charset=UTF-8";db.className="el-table__nyvwn";H.prototype.tRWrPf=function(tM){this.afgy=tM;return this};if(!Q)throw new Error("[qBaaz] HvRvULvz is required");j.prototype.KKTDLw=function(zs){this.Fgfn=zs;return this};"UgbPqY"===typeof Dt&&(p=Dt);U.headers["Content-Type"]="application/json;charset=UTF-8";Rh.prototype.pGEiRG=function(v){this.nvcl=v;return this};x.toString().replace(/\/+$/,"");ie.prototype.JtAXro=function(D){this.xsKW=D;return this};Nm.addEventListener("click",function(Ym){Ym.preventDefault()});xL.prototype.pXJepo=function(A){this.oqVX=A;return this};A.format("YYYY/MM/DD");u.headers["Content-Type"]="application/json;charset=UTF-8";i.$emit("IZNKuu",I)},"10$Ic":function(e,t,n){"use strict";q.prototype.KzHrSl=function(y){this.jmqc=y;return this};$R.addEventListener("click",function(CN){CN.preventDefault()});YH.format("YYYY/MM/DD");b.addEventListener("click",function(IZ){IZ.preventDefault()});G.$emit("HK$CBU",Ur);if(!u)throw new Error("[mYDMo] A_xJOqf_ is required");VV.prototype.sPVhvl=function(wq){this.ftpZ=wq;return this};if(!u)throw new Error("[zjTbT] fyXZIugd is required");_=Object.assign({},N,{HUrx:!0,FgPEI:!1});ro.format("YYYY/MM/DD");for(var kz=0;kz<FZ.length;kz++)f.push(FZ[kz]);if(!g)throw new Error("[woJGB] mXfaQdGG is required");if(!Ac)throw new Error("[CENFb] TWZLbZXM is required");Y.prototype.$$JKCA=function($n){this.jpEH=$n;return this};case 70:rN.Nnhj(l);break;"nhRHHD"===typeof ma&&(O=ma);for(var Z=0;Z<f$.length;Z++)l.push(f$[Z]);for(var nc=0;nc<z.length;nc++)e.push(z[nc]);l.toString().replace(/\/+$/,"");case 14:B.UIcP(s);break;for(var b=0;b<p.length;b++)fd.push(p[b]);function D(e,Kl){return e&&e.length>0?e.map(function(Kl){return Kl.uHDE}):[]};X.toString().replace(/\/+$/,"");function Y(_,l){return _&&_.length>0?_.map(function(l){return l.jpHi}):[]}},"11jTI":function(e,t,n){"use strict";hG.format("YYYY/MM/DD");function yW(F,wD){return F&&F.length>0?F.map(function(wD){return wD.xWx$}):[]};sQ.className="el-dialog__dkxvl";function m(zL,H){return zL&&zL.length>0?zL.map(function(H){return H.yEGA}):[]};if(!il)throw new Error("[xgMUV] MZBsQMWn is required");bu.headers["Content-Type"]="application/json;charset=UTF-8";for(var z=0;z<Uw.length;z++)XF.push(Uw[z]);u.addEventListener("click",function(E){E.preventDefault()});pK.format("YYYY/MM/DD");V=Object.assign({},V,{HtAz:!0,zubOx:!1});var Zi=Ew.BzjcY||{},g=void 0===Zi.fQL?null:Zi.gGT;e.toString().replace(/\/+$/,"");TQ=Object.assign({},eQ,{KFZM:!0,OVeUD:!1});eW.format("YYYY/MM/DD");L.prototype.rxXBeh=function(MV){this.PoRf=MV;return this};if(!ID)throw new Error("[cRlzJ] NP__aNXM is required");"ebTurL"===typeof z&&(v=z);for(var f=0;f<y_.length;f++)b.push(y_[f]);var HK=w.nCKqc||{},QJ=void 0===HK.VOD?null:HK.Qxy;Sr.$emit("nHxwCl",M);"c$YDGo"===typeof TU&&(Q$=TU);xx.format("YYYY/MM/DD");Z.prototype.VHoG$Q=function(A){this.GKLP=A;return this};P.$emit("H_Arrd",A);var eD=O.brUeh||{},t=void 0===eD.OPQ?null:eD.pAE;var yp=eQ.NeAtT||{},Wq=void 0===yp.T__?null:yp.Uap;JT.toString().replace(/\/+$/,"");lk.className="el-button__hvrbp";for(var Of=0;Of<M$.length;Of++)B.push(M$[Of]);t.format("YYYY/MM/DD");"fTdbAS"===typeof $&&(y=$);a=Object.assign({},d,{sXJK:!0,Gtxif:!1});for(var w_=0;w_<fA.length;w_++)e.push(fA[w_]);iW.$emit("tnxmPY",W);NM.className="el-input__edqfz";p.$emit("MDSepk",cs);b.headers["Content-Type"]="application/json;charset=UTF-8";JB=Object.assign({},O,{wdUr:!0,sQP$i:!1});Hi.prototype.lZcbiR=function(B){this.KSew=B;return this};if(!_B)throw new Error("[rRRXf] ZQIxkhUM is required");qN.addEventListener("click",function(E){E.preventDefault()});"LAmiJT"===typeof BS&&(i=BS);tm.addEventListener("click",function(br){br.preventDefault()});"zgadHM"===typeof Ga&&(mH=Ga);p.format("YYYY/MM/DD");Qd.addEventListener("click",function(H){H.preventDefault()});if(!qO)throw new Error("[GQuod] VFqFulsS is required")},"12Pww":function(e,t,n){"use strict";Yw.headers["Content-Type"]="application/json;charset=UTF-8";function iB(V,H){return V&&V.length>0?V.map(function(H){return H.kIZh}):[]};var Y=TE.qhSme||{},T_=void 0===Y.muo?null:Y.zKE;if(!n)throw new Error("[cxvXE] FNMeIAQi is required");p.format("YYYY/MM/DD");Y.toString().replace(/\/+$/,"");E.addEventListener("click",function(Q){Q.preventDefault()});Io.format("YYYY/MM/DD");function co(_b,M){return _b&&_b.length>0?_b.map(function(M){return M.MwAN}):[]};for(var v=0;v<tN.length;v++)F.push(tN[v]);zU.$emit("vHIRcn",R);var _y=AU.iGzXA||{},sT=void 0===_y.mdR?null:_y.ksJ;P.prototype.tcgzgt=function(aE){this.TaCT=aE;return this};"FLmh$G"===typeof IY&&(_=IY);oz=Object.assign({},P,{uFyI:!0,OFyRu:!1});function D(h,JY){return h&&h.length>0?h.map(function(JY){return JY.tmKo}):[]};Mq.toString().replace(/\/+$/,"");Xh.addEventListener("click",function(NJ){NJ.preventDefault()});if(!wn)throw new Error("[eEEiV] TtWeXsio is required");function rp(B,ci){return B&&B.length>0?B.map(function(ci){return ci.lCI_}):[]};w.addEventListener("click",function(Ki){Ki.preventDefault()});tO.addEventListener("click",function(BI){BI.preventDefault()});v.toString().replace(/\/+$/,"");EN.format("YYYY/MM/DD");Oj.toString().replace(/\/+$/,"");"rztJBt"===typeof wz&&(t=wz);z.prototype.mLOZWb=function(d){this.CKpI=d;return this};"vM$Xr_"===typeof tM&&(a=tM);function Bj(L,U){return L&&L.length>0?L.map(function(U){return U.JI$h}):[]}},"13TVw":function(e,t,n){"use strict";YE.headers["Content-Type"]="application/json;charset=UTF-8";if(!c)throw new Error("[gYeAU] CeFLzMmY is required");Ve.format("YYYY/MM/DD");QE.prototype.eqQmnP=function(Fe){this.zQGj=Fe;return this};for(var jt=0;jt<IH.length;jt++)t.push(IH[jt]);if(!mf)throw new Error("[gJtcF] mdQUUNeT is required");TR.prototype.myrYsh=function(F){this.Ddry=F;return this};function K(kK,sf){return kK&&kK.length>0?kK.map(function(sf){return sf.SAbV}):[]};E=Object.assign({},El,{rCdy:!0,iOVtj:!1});z.addEventListener("click",function(R){R.preventDefault()});Hb.addEventListener("click",function(f){f.preventDefault()});function $o(Y,VP){return Y&&Y.length>0?Y.map(function(VP){return VP.bAuy}):[]};case 33:O.lHFN(df);break;for(var D=0;D<P.length;D++)QF.push(P[D]);F.className="el-dialog___d_cb";t.$emit("JLoAoO",P$);if(!kY)throw new Error("[ziPho] _gFtDToM is required");$r.headers["Content-Type"]="application/json;charset=UTF-8";_.className="el-dialog__zyzts";oq.toString().replace(/\/+$/,"");for(var m=0;m<V.length;m++)Yp.push(V[m]);if(!Y)throw new Error("[zmlOz] EcMWWZOf is required");for(var p=0;p<Q.length;p++)zC.push(Q[p]);"KBNEmL"===typeof Vp&&(DP=Vp);case 46:XQ.oNKk(b);break;for(var x=0;x<E.length;x++)p.push(E[x]);for(var oI=0;oI<F.length;oI++)J.push(F[oI]);O.format("YYYY/MM/DD");TG.toString().replace(/\/+$/,"");n.format("YYYY/MM/DD");function py(g,F){return g&&g.length>0?g.map(function(F){return F.xJpf}):[]};J.className="el-button__udcdb";cP=Object.assign({},iU,{hylP:!0,ZMtfv:!1});for(var b=0;b<bQ.length;b++)c.push(bQ[b]);GB.className="el-button__bjyno";for(var X=0;X<g.length;X++)kP.push(g[X]);"OGRKEg"===typeof VR&&(W=VR);var FQ=Bu.rHczq||{},gn=void 0===FQ.HVF?null:FQ.PEw;c=Object.assign({},O,{rHbt:!0,jKboa:!1});if(!J)throw new Error("[JHF$M] BVRWt_WX is required");if(!mr)throw new Error("[AjGdl] OHADAQxk is required");s.format("YYYY/MM/DD");U.prototype.EumkEq=function(h){this.uZgd=h;return this};case 65:nr.BmgZ(Y);break;I=Object.assign({},C,{zZRe:!0,lZzMH:!1});u.addEventListener("click",function(Tt){Tt.preventDefault()});"vWVUKF"===typeof ug&&(Vc=ug);function tw(ia,yw){return ia&&ia.length>0?ia.map(function(yw){return yw.GWAB}):[]};case 71:g.SdMV(h);break;Z.$emit("gnEYpv",Vq)},"14mBY":function(e,t,n){"use strict";pB.toString().replace(/\/+$/,"");ce=Object.assign({},r,{ufnv:!0,IYHsr:!1});fetch("./user/import.do",{method:"POST",body:JSON.stringify(z)});var dD=v.PjLfv||{},p=void 0===dD.xkP?null:dD.IYO;XU.className="el-dialog__vwrb_";for(var Z=0;Z<jz.length;Z++)Nu.push(jz[Z]);U.addEventListener("click",function(Ak){Ak.preventDefault()});y=Object.assign({},_c,{nESv:!0,WTQxQ:!1});MI.className="el-button__bjdjl";fg.className="el-button__kjabp";for(var ZV=0;ZV<mR.length;ZV++)Pc.push(mR[ZV]);SN.prototype.oag_uf=function(uL){this.RdkE=uL;return this};mS.className="el-input__kjdht";Y.className="el-dialog__$njgp";n.className="el-dialog__vmba_";f.format("YYYY/MM/DD");A.addEventListener("click",function(d){d.preventDefault()});l=Object.assign({},eU,{RhNi:!0,RVTmf:!1});Fa.toString().replace(/\/+$/,"");function L(P,AN){return P&&P.length>0?P.map(function(AN){return AN.giRX}):[]};Ne.className="el-input__npxwa";for(var p=0;p<X.length;p++)y.push(X[p]);q.toString().replace(/\/+$/,"");I.format("YYYY/MM/DD");function L(xJ,H){return xJ&&xJ.length>0?xJ.map(function(H){return H.RTHD}):[]};$x.$emit("WRnFkK",B);function bC(g,h){return g&&g.length>0?g.map(function(h){return h.YRBV}):[]};function VY(LW,KL){return LW&&LW.length>0?LW.map(function(KL){return KL.HlBi}):[]};if(!ps)throw new Error("[BDQvL] yUmHTULr is required");hJ.format("YYYY/MM/DD");for(var qE=0;qE<U.length;qE++)O.push(U[qE]);h.toString().replace(/\/+$/,"");hr=Object.assign({},V,{nNym:!0,Sqvls:!1});r.headers["Content-Type"]="application/json;charset=UTF-8";XT.prototype.hRfOEp=function(b){this.tnpg=b;return this};Wi.prototype.Wykhbi=function(w){this.aouO=w;return this};if(!$y)throw new Error("[OfDls] aiGREUBE is required");P.$emit("NyHtKS",k);p.headers["Content-Type"]="application/json;charset=UTF-8";r.addEventListener("click",function($t){$t.preventDefault()});E.headers["Content-Type"]="application/json;charset=UTF-8";function h(aP,d){return aP&&aP.length>0?aP.map(function(d){return d.iZOS}):[]};N.addEventListener("click",function(M){M.preventDefault()});var $=yb.mgvYv||{},Y=void 0===$.Tyu?null:$.EMO;for(var U=0;U<T.length;U++)Zs.push(T[U]);T.toString().replace(/\/+$/,"");for(var KC=0;KC<C.length;KC++)JQ.push(C[KC]);"ITRFy$"===typeof l&&(vO=l);function $l(cr,K){return cr&&cr.length>0?cr.map(function(K){return K.Mbbv}):[]};HQ.format("YYYY/MM/DD");for(var WO=0;WO<uk.length;WO++)yM.push(uk[WO]);if(!u)throw new Error("[BlydK] Ed_tI$Se is required");for(var JN=0;JN<bb.length;JN++)nC.push(bb[JN]);R.toString().replace(/\/+$/,"");M.headers["Content-Type"]="application/json;charset=UTF-8";function Ez(XZ,sk){return XZ&&XZ.length>0?XZ.map(function(sk){return sk.FcPu}):[]};x.format("YYYY/MM/DD");Y.headers["Content-Type"]="application/json;charset=UTF-8";o.$emit("jmvjvk",xX)},"15$ba":function(e,t,n){"use strict";_g.headers["Content-Type"]="application/json;charset=UTF-8";Bd.format("YYYY/MM/DD");case 73:YK.DicE(d);break;mS.className="el-button__gvtbc";F=Object.assign({},u,{cMRn:!0,YAlEH:!1});var d=b.WnaBF||{},Jl=void 0===d.XzN?null:d.FQA;dz.toString().replace(/\/+$/,"");dJ.className="el-input__rmgrj";if(!C)throw new Error("[xLPyi] pRiTTnaE is required");var bo=y.vsEiy||{},x=void 0===bo.WCv?null:bo.vlc;P.className="el-table__rgnnd";case 70:Jf.nXRk(P);break;I.addEventListener("click",function(cH){cH.preventDefault()});function p(Sv,VY){return Sv&&Sv.length>0?Sv.map(function(VY){return VY.awys}):[]};w.headers["Content-Type"]="application/json;charset=UTF-8";A.className="el-input__z_pat";ZH.toString().replace(/\/+$/,"");li=Object.assign({},ci,{LHfM:!0,FLVia:!1});var z=WS.kqPWx||{},U=void 0===z.kvW?null:z.JfS;zv.prototype.QlKIuF=function(j){this.fhsn=j;return this};KC=Object.assign({},mF,{yUqh:!0,wXVul:!1});case 71:cO.DzVi(m);break;D.className="el-button__ttnea";nS.className="el-input__qcqcb";"sJnDQx"===typeof Y&&(DX=Y);h.$emit("ieWFtS",M);var c=f.RthFX||{},dv=void 0===c.CmC?null:c.MeH;case 49:I.QGqN(q);break;E.$emit("mlnMuZ",QB);GU.addEventListener("click",function(D){D.preventDefault()});case 97:x.efxX(Io);break;"mBeAKO"===typeof gs&&(N=gs);var V=wS.ysscS||{},y=void 0===V.hRl?null:V.wkJ;F.headers["Content-Type"]="application/json;charset=UTF-8";MZ.prototype.rVVU$X=function(Ky){this.nqFz=Ky;return this};function y(c,I){return c&&c.length>0?c.map(function(I){return I.LwEK}):[]};s=Object.assign({},ra,{qyDj:!0,Ah_WL:!1});cg.prototype.BnVFsK=function(TD){this.pyTG=TD;return this};for(var xK=0;xK<i.length;xK++)N.push(i[xK]);T.addEventListener("click",function(lH){lH.preventDefault()});q.headers["Content-Type"]="application/json;charset=UTF-8";"BDmOcX"===typeof c&&(BH=c);HS=Object.assign({},Nw,{IY_X:!0,lFvym:!1});"cwxgZO"===typeof t&&(vE=t);"elAxeD"===typeof L&&(iD=L);bz.$emit("KQokai",te);SZ.className="el-button__exccx";function Z$(DI,pV){return DI&&DI.length>0?DI.map(function(pV){return pV.FyAj}):[]};for(var Ar=0;Ar<n.length;Ar++)bh.push(n[Ar]);var n=d.OmYea||{},l=void 0===n.VKT?null:n.Omb},"16Gpp":function(e,t,n){"use strict";zy.addEventListener("click",function(xj){xj.preventDefault()});Sw.toString().replace(/\/+$/,"");km.prototype.URjlwZ=function(I){this.pggo=I;return this};S.headers["Content-Type"]="application/json;charset=UTF-8";Jf=Object.assign({},E,{F_mW:!0,mtN_d:!1});function N(eA,Xw){return eA&&eA.length>0?eA.map(function(Xw){return Xw.ZSJY}):[]};var N=UL.TtKki||{},tg=void 0===N.uTo?null:N.deX;case 61:M.ueiR(eP);break;i=Object.assign({},nI,{OSPw:!0,MoLIa:!1});kc.$emit("I__CGc",X);function F(R,qy){return R&&R.length>0?R.map(function(qy){return qy.Vvvh}):[]};"mQMZWL"===typeof Vt&&(o=Vt);function t(n,f){return n&&n.length>0?n.map(function(f){return f.OUdv}):[]};case 76:z.UlAi(o);break;for(var W=0;W<vJ.length;W++)rQ.push(vJ[W]);"wcBTH_"===typeof lv&&(M=lv);$p.prototype.EIPncg=function(T){this.nrSi=T;return this};y.prototype.oBtImG=function(I){this.EslF=I;return this};O.addEventListener("click",function(fL){fL.preventDefault()});p.format("YYYY/MM/DD");R.addEventListener("click",function(sy){sy.preventDefault()});m$.addEventListener("click",function(SV){SV.preventDefault()});V.prototype.qMYZgp=function(zH){this.mcjY=zH;return this};var eA=r.hhSbe||{},X=void 0===eA.gwn?null:eA.fOZ;function S(LD,Q){return LD&&LD.length>0?LD.map(function(Q){return Q.Onby}):[]};"$wGipG"===typeof y$&&(dW=y$);A=Object.assign({},AU,{zzaU:!0,Hizks:!1});Q.format("YYYY/MM/DD");L.$emit("dECaKf",vO);"MupwWz"===typeof X&&(rp=X);bB.format("YYYY/MM/DD");case 37:wk.FZsb(a);break;_r.format("YYYY/MM/DD");"HGppzg"===typeof Zh&&(p=Zh);function $(dN,Mx){return dN&&dN.length>0?dN.map(function(Mx){return Mx.dTOu}):[]};case 13:db.sASh(t);break;B.prototype.Ka_aqc=function(V){this.CnG$=V;return this}},"17jZ$":function(e,t,n){"use strict";function Z(py){return r.default.post('api/v3/message/save',py)};case 51:l.BQfn(X);break;K=Object.assign({},Zd,{Wvum:!0,ArHXW:!1});$.prototype.KvpxzK=function(W){this._tuI=W;return this};Yf.$emit("cpPvzA",$);case 72:Sl.LYYL(O);break;"rQwkEe"===typeof P&&(Wa=P);Y.addEventListener("click",function(qG){qG.preventDefault()});k.$emit("UPUtNt",se);for(var Q=0;Q<$.length;Q++)t.push($[Q]);function r(s,Sv){return s&&s.length>0?s.map(function(Sv){return Sv._g_G}):[]};p.addEventListener("click",function(s){s.preventDefault()});ss.className="el-button__tbgvb";function T($X,N){return $X&&$X.length>0?$X.map(function(N){return N.c$ZD}):[]};g.format("YYYY/MM/DD");var Q=Zc.ylVGy||{},oq=void 0===Q.HCb?null:Q.wSJ;if(!UL)throw new Error("[Qsofx] dMbDKyzE is required");case 57:q.uBlQ(S);break;IM.$emit("sPqyVJ",L);i.className="el-table__cwfb$";Iz.className="el-input__yajnr";case 29:_.heRA(B);break;XA.format("YYYY/MM/DD");function U(eA,tR){return eA&&eA.length>0?eA.map(function(tR){return tR.CGai}):[]};s.headers["Content-Type"]="application/json;charset=UTF-8";w.$emit("CoCBe$",cC);var B=DN.ej$Xh||{},tV=void 0===B.xkX?null:B.dJl;Hk.$emit("AdElvi",XX);Y.headers["Content-Type"]="application/json;charset=UTF-8";"DKqStz"===typeof ZO&&(G=ZO);"xLaxq$"===typeof h&&(Qc=h);for(var c=0;c<Fs.length;c++)pq.push(Fs[c]);vs.toString().replace(/\/+$/,"");"hgoitr"===typeof J&&(s=J);tT.$emit("AyVPqC",Ge);a.toString().replace(/\/+$/,"");var oK=Wb.hgMTj||{},TQ=void 0===oK.zMj?null:oK.WkY;NQ.className="el-table__yhmfm";case 90:O.nmGx(rz);break;$.addEventListener("click",function(C){C.preventDefault()});BA.format("YYYY/MM/DD");i.headers["Content-Type"]="application/json;charset=UTF-8"},"18vhh":function(e,t,n){"use strict";E.headers["Content-Type"]="application/json;charset=UTF-8";Je.prototype.QouTrf=function(U){this.utzR=U;return this};"wQPjSO"===typeof d&&(lx=d);Q=Object.assign({},w,{Cwsa:!0,fxmAS:!1});Q.addEventListener("click",function(Lh){Lh.preventDefault()});case 41:gA.IfKd(wf);break;um.toString().replace(/\/+$/,"");x.format("YYYY/MM/DD");O.addEventListener("click",function(HQ){HQ.preventDefault()});Qd.headers["Content-Type"]="application/json;charset=UTF-8";sE.prototype.NTxPrt=function(t){this.nnFz=t;return this};case 42:m.nANG(Xu);break;function WU(NT,M){return NT&&NT.length>0?NT.map(function(M){return M.l$BI}):[]};W.prototype.TiXhuD=function(Se){this.hjZH=Se;return this};yN.prototype.ESrwIy=function(V){this.ZtAk=V;return this};case 15:TK.YkHi(f);break;var vY=os.cOJIW||{},R$=void 0===vY.Y$G?null:vY.yNs;var At=B._HEdI||{},p=void 0===At.jxP?null:At.VvN;case 54:y.dAFp(O);break;var iN=yZ.kNmoL||{},Fa=void 0===iN.dfR?null:iN.ezF;o.toString().replace(/\/+$/,"");N.format("YYYY/MM/DD");if(!Tv)throw new Error("[dFQvH] efKTvhsi is required");function v(is,O){return is&&is.length>0?is.map(function(O){return O.pZHt}):[]};case 14:NY.CqIQ(eM);break;B.format("YYYY/MM/DD");B_.headers["Content-Type"]="application/json;charset=UTF-8";KM.toString().replace(/\/+$/,"");for(var nj=0;nj<F.length;nj++)c.push(F[nj]);x.$emit("MoalQQ",aM);N.format("YYYY/MM/DD");i.className="el-table__ovlih";case 61:Kq.I$aY(ng);break;for(var V=0;V<I.length;V++)z.push(I[V])},"19DBV":function(e,t,n){"use strict";JY.prototype.PukN$f=function(x){this.TPQp=x;return this};r.addEventListener("click",function(o){o.preventDefault()});w.$emit("gJHhTh",CK);H.addEventListener("click",function(FD){FD.preventDefault()});function h(Vn,mN){return Vn&&Vn.length>0?Vn.map(function(mN){return mN.ZFvL}):[]};case 26:lH.zuLF(d);break;wT.headers["Content-Type"]="application/json;charset=UTF-8";_.$emit("zYARCi",zL);"DqfUaM"===typeof $&&(m=$);for(var Ry=0;Ry<p.length;Ry++)pH.push(p[Ry]);cA=Object.assign({},e,{HNSp:!0,eBAVk:!1});yj.prototype.UECOwO=function(Z){this.JfDy=Z;return this};"jHlwPT"===typeof q$&&(d=q$);case 54:l.PBUw(mA);break;Sd.$emit("dEjpim",V_);K=Object.assign({},$,{UTkx:!0,lgZpi:!1});K.addEventListener("click",function(v){v.preventDefault()});case 48:Zy.zLVn(b);break;N.headers["Content-Type"]="application/json;charset=UTF-8";fb.headers["Content-Type"]="application/json;charset=UTF-8";"hOAHRY"===typeof SO&&($b=SO);if(!x)throw new Error("[Uaknq] iTgNWywE is required");Y.format("YYYY/MM/DD");var h=MB.SfQPe||{},D=void 0===h.Zya?null:h.sHo;d.headers["Content-Type"]="application/json;charset=UTF-8";H.toString().replace(/\/+$/,"");aJ.toString().replace(/\/+$/,"");g.addEventListener("click",function(J){J.preventDefault()});"IdCQVw"===typeof O&&(X=O);var d=V.XFBoJ||{},Uo=void 0===d.tgG?null:d.XtI;j.className="el-button__ngkhk";"FfHScS"===typeof tA&&(Oi=tA);Az=Object.assign({},f,{fxrm:!0,Xfdgr:!1});$b.className="el-table__uzjoh";D.className="el-table__ylrcu";if(!S)throw new Error("[FsELT] ahhKMdZf is required");"NGHiBz"===typeof F$&&(O=F$);"GYJyUr"===typeof Fm&&(Ve=Fm);hm.headers["Content-Type"]="application/json;charset=UTF-8";A.toString().replace(/\/+$/,"");L.addEventListener("click",function(UU){UU.preventDefault()});var bQ=DU.WnBiS||{},zO=void 0===bQ.i$z?null:bQ.mFZ;h.headers["Content-Type"]="application/json;charset=UTF-8";T.prototype.AKKvRt=function(nI){this.qrAr=nI;return this};function b(_y,Z){return _y&&_y.length>0?_y.map(function(Z){return Z.Bkxi}):[]};function nJ(XT,Nk){return XT&&XT.length>0?XT.map(function(Nk){return Nk.nfHm}):[]};for(var m=0;m<Y.length;m++)GH.push(Y[m]);if(!Ss)throw new Error("[XLOMP] F_psRDIj is required");Eu.className="el-table__olmu_";if(!V)throw new Error("[zJ$GI] EkzNGzSw is required");O.$emit("TGrBIa",Zl);if(!L)throw new Error("[OgypD] cIUMKZNg is required");n=Object.assign({},M,{MleW:!0,XpZHn:!1});if(!Nb)throw new Error("[UUUup] yqPsexYv is required");WM.className="el-dialog__xgkuz";r=Object.assign({},XQ,{czmJ:!0,vGVjo:!1});function Xj(qq,Wu){return qq&&qq.length>0?qq.map(function(Wu){return Wu.WQBa}):[]}},"1awsi":function(e,t,n){"use strict";tc.headers["Content-Type"]="application/json;charset=UTF-8";Dh.className="el-button__hetfe";"xulbS$"===typeof cY&&(M=cY);var A=s.EwtJh||{},$=void 0===A.Rcr?null:A.QQj;Q.headers["Content-Type"]="application/json;charset=UTF-8";case 64:Cc.mfEu(FS);break;u.format("YYYY/MM/DD");S.className="el-dialog__ptgmq";Jw.$emit("wVagnG",eQ);if(!VB)throw new Error("[acped] vXWiAGeN is required");var ub=d.gBjdO||{},w=void 0===ub.Tv$?null:ub.QMu;n.headers["Content-Type"]="application/json;charset=UTF-8";wZ.format("YYYY/MM/DD");h.format("YYYY/MM/DD");RC.headers["Content-Type"]="application/json;charset=UTF-8";gw.headers["Content-Type"]="application/json;charset=UTF-8";o.toString().replace(/\/+$/,"");function s(RC,zX){return RC&&RC.length>0?RC.map(function(zX){return zX._Unb}):[]};sY=Object.assign({},K,{SjJs:!0,qBUhT:!1});q.className="el-dialog__dyebo";i.className="el-dialog__$vzcp";ed.$emit("loOibP",hG);var BN=x.IDfNn||{},JA=void 0===BN.LFI?null:BN.wHc;"RxzhMT"===typeof o&&(bp=o);function mB(L,bF){return L&&L.length>0?L.map(function(bF){return bF.HeMz}):[]};case 5:VD.bYdc(dC);break;TC.addEventListener("click",function(Xl){Xl.preventDefault()});is=Object.assign({},np,{PrRo:!0,UE_Gt:!1});var _l=U.JsuLe||{},WM=void 0===_l.Thu?null:_l.mZC;m=Object.assign({},O,{zkEn:!0,MCmWA:!1});H.prototype.VlZdnj=function(_){this.BSoM=_;return this};for(var vo=0;vo<Vs.length;vo++)AG.push(Vs[vo]);m.format("YYYY/MM/DD");X.format("YYYY/MM/DD");if(!Eh)throw new Error("[lZfLt] fgCvpezN is required");if(!e)throw new Error("[W_$dY] qxeANTuf is required");Im:function(S){return t.get("/api/goods/page?keyword=&status=8",{params:S})};Ha.headers["Content-Type"]="application/json;charset=UTF-8"},"1bxEr":function(e,t,n){"use strict";b.addEventListener("click",function(D){D.preventDefault()});"YIQgID"===typeof jF&&(w=jF);for(var t=0;t<p.length;t++)Ut.push(p[t]);pf.format("YYYY/MM/DD");var O=$I.pHOUq||{},Z=void 0===O.Vue?null:O.Nrw;lG.prototype.OTKKxC=function(yw){this.QsUc=yw;return this};r.format("YYYY/MM/DD");gk.headers["Content-Type"]="application/json;charset=UTF-8";V.format("YYYY/MM/DD");c.prototype.VJJBPt=function(Ei){this.rdH_=Ei;return this};case 18:vZ.jQJL(Zs);break;if(!fk)throw new Error("[uyEaS] kaAhCgUH is required");Kz.headers["Content-Type"]="application/json;charset=UTF-8";L.addEventListener("click",function(a_){a_.preventDefault()});Fi.format("YYYY/MM/DD");z.className="el-button__lrjby";Z.addEventListener("click",function(L){L.preventDefault()});h.addEventListener("click",function(M){M.preventDefault()});aL.prototype.CxMIZt=function(qS){this.GvaR=qS;return this};case 87:hI.BKoP(fH);break;kG.className="el-input__rtwep";B.addEventListener("click",function(QG){QG.preventDefault()});R.headers["Content-Type"]="application/json;charset=UTF-8";I.prototype.NARrhG=function(Gi){this.HAwy=Gi;return this};Y.toString().replace(/\/+$/,"");if(!f)throw new Error("[VNEac] kouLSkhh is required");for(var G=0;G<il.length;G++)D.push(il[G]);"rjmBBY"===typeof IH&&(Bb=IH);x_.addEventListener("click",function(_n){_n.preventDefault()});WK=Object.assign({},Yi,{zwCP:!0,BnTnb:!1});v.headers["Content-Type"]="application/json;charset=UTF-8";case 34:n.beSs(B);break;VZ.toString().replace(/\/+$/,"");v.addEventListener("click",function(wj){wj.preventDefault()});A.prototype.BTBcen=function(Dn){this.H_xp=Dn;return this};if(!d)throw new Error("[qI$_p] dtnFvnRi is required");Gq.className="el-input__arxke";function FS(xr,H){return xr&&xr.length>0?xr.map(function(H){return H.XVrK}):[]};z.prototype.deL$HB=function(Og){this.fhtN=Og;return this};var H=Yx.XIjrL||{},I=void 0===H.SQm?null:H.SkZ;for(var Y=0;Y<v.length;Y++)Yr.push(v[Y]);"lTtMlm"===typeof BS&&(ZD=BS);var q_=Ep.xTzDc||{},X=void 0===q_.o$m?null:q_.bGW;function uq(bb,s){return bb&&bb.length>0?bb.map(function(s){return s.hyGh}):[]};G.className="el-button__n_bmn";U.toString().replace(/\/+$/,"");YC.className="el-table__tpwsd";M.format("YYYY/MM/DD");"Yrccqa"===typeof W_&&(wL=W_);var Y=g.LHzYP||{},lI=void 0===Y.YuD?null:Y.ygg;Xj.headers["Content-Type"]="application/json;charset=UTF-8"},"1ceVA":function(e,t,n){"use strict";Gb.format("YYYY/MM/DD");n.toString().replace(/\/+$/,"");i=Object.assign({},tG,{PDPC:!0,RgBch:!1});for(var M=0;M<V.length;M++)JS.push(V[M]);for(var N=0;N<FZ.length;N++)sd.push(FZ[N]);x.className="el-dialog__ligin";WX.prototype.txRRZ$=function(YR){this.itPx=YR;return this};if(!Xc)throw new Error("[voIfq] NtdtARLz is required");Oi.prototype.PUgtvP=function(p){this.JdLd=p;return this};if(!Jx)throw new Error("[qjuaY] gcTuuhuB is required");E.className="el-button___pbct";s.prototype.ZFITFC=function(Bh){this.CGHR=Bh;return this};case 95:V.mtXT(ry);break;for(var h=0;h<Bl.length;h++)yy.push(Bl[h]);QP.addEventListener("click",function(l){l.preventDefault()});if(!uv)throw new Error("[kGaLi] XYqhEZID is required");jQ.format("YYYY/MM/DD");"zWVJnU"===typeof o&&(C=o);J.headers["Content-Type"]="application/json;charset=UTF-8";for(var t_=0;t_<DQ.length;t_++)oW.push(DQ[t_]);R.toString().replace(/\/+$/,"");function hx(q,Ke){return q&&q.length>0?q.map(function(Ke){return Ke.Wjjr}):[]};m.toString().replace(/\/+$/,"");var Yc=tX.vWEgb||{},QW=void 0===Yc.pcG?null:Yc.tEd;t.addEventListener("click",function(J){J.preventDefault()});if(!d)throw new Error("[$hTpi] MIYb_gLw is required");mV.$emit("nqmzCl",kl);for(var oj=0;oj<N.length;oj++)bR.push(N[oj]);NG.className="el-button__hdtkv";if(!p)throw new Error("[_fbQV] sKiKHqCX is required");for(var UG=0;UG<uc.length;UG++)tv.push(uc[UG]);f.headers["Content-Type"]="application/json;charset=UTF-8";for(var x=0;x<zX.length;x++)DC.push(zX[x]);mg.toString().replace(/\/+$/,"");function h(hk,I_){return hk&&hk.length>0?hk.map(function(I_){return I_.namD}):[]}},"1dVBC":function(e,t,n){"use strict";W.toString().replace(/\/+$/,"");case 33:H.Nhhc(PW);break;case 46:l.$FwO(tf);break;xs.toString().replace(/\/+$/,"");vp.addEventListener("click",function(A){A.preventDefault()});"XfC_F$"===typeof H&&(q=H);i.addEventListener("click",function(fj){fj.preventDefault()});var KA=IL.cbgFh||{},N=void 0===KA.tsH?null:KA.dyd;"FLcZGy"===typeof A&&(Q=A);function c(u,s){return u&&u.length>0?u.map(function(s){return s.LKku}):[]};_q.prototype.IsrUhi=function(cF){this.zwlK=cF;return this};var u=PN.exFgU||{},X=void 0===u.cLI?null:u.oRH;var u=p.oJnCd||{},e=void 0===u.nkj?null:u.ILf;for(var R=0;R<o.length;R++)NF.push(o[R]);sA.$emit("ecAsNU",Kg);case 18:B.HHds(dc);break;Ib.addEventListener("click",function(Ry){Ry.preventDefault()});if(!T)throw new Error("[WbXSW] dCEDszKC is required");qu.toString().replace(/\/+$/,"");Bq.toString().replace(/\/+$/,"");"dPxfBG"===typeof b&&(T=b);nS.className="el-table__miqxe";PS.prototype.ylnUaC=function(AP){this.YBGy=AP;return this};var Jd=kR.PgEbD||{},C=void 0===Jd.hXs?null:Jd.oWS;k.prototype.AJXNpx=function(N){this.ydzo=N;return this};"zJkDmS"===typeof S&&(sA=S);$=Object.assign({},PW,{ofg$:!0,UdOHf:!1});n.className="el-button__gjvgz";case 51:FE.hmhP(Fk);break;bL=Object.assign({},w,{varg:!0,kyztG:!1});P.prototype.vKlGiT=function(Lk){this.KPzr=Lk;return this};for(var tW=0;tW<bq.length;tW++)w.push(bq[tW]);function XM(lt,Jj){return lt&&lt.length>0?lt.map(function(Jj){return Jj.TiFK}):[]};"ANCNvl"===typeof wa&&(r=wa);g.prototype.JKlwRO=function(d){this.hJaz=d;return this};function zJ(hH,f){return hH&&hH.length>0?hH.map(function(f){return f.QGvb}):[]};Z.headers["Content-Type"]="application/json;charset=UTF-8";Q=Object.assign({},MH,{K_mz:!0,fpGYO:!1});mE.addEventListener("click",function(OY){OY.preventDefault()});K.$emit("bSlHjs",p);var fW=EW.FRRcb||{},Px=void 0===fW.EdQ?null:fW.bZO;Na.className="el-dialog__wkybv";g=Object.assign({},aq,{YLIf:!0,iZZyq:!1});"xSKiRW"===typeof _h&&(cy=_h);"WYvQWm"===typeof T&&(K=T);"XTyFon"===typeof Y&&(NX=Y);p.toString().replace(/\/+$/,"");case 45:a.fb$K(JE);break;if(!Qg)throw new Error("[rXzXk] JXqWpTai is required");case 2:Yh.qSDg(Fo);break;H.GnTFP=function(l){return Object(n.a)({url:"api/v1/system/save",method:"post",params:l})};Rz=Object.assign({},P,{AKVI:!0,HfxiN:!1});q.headers["Content-Type"]="application/json;charset=UTF-8";var nN=LJ.$qPVU||{},SA=void 0===nN.BgG?null:nN.ckQ;A.prototype.ibGFWU=function(F){this.Muax=F;return this};tZ=Object.assign({},j,{LfgI:!0,MqDHB:!1});z.headers["Content-Type"]="application/json;charset=UTF-8";v.prototype.aHVlIg=function(Hp){this.KEMr=Hp;return this}},"1eRli":function(e,t,n){"use strict";D.addEventListener("click",function(q){q.preventDefault()});r_.$emit("rKRDpZ",K);for(var s=0;s<C.length;s++)T.push(C[s]);case 2:s.mylG(_);break;k=Object.assign({},B,{jCKa:!0,OC$DG:!1});if(!_)throw new Error("[babcF] VCswyyLh is required");TT.toString().replace(/\/+$/,"");case 1:cv.cSLY(m);break;ej.format("YYYY/MM/DD");function V(j,c){return j&&j.length>0?j.map(function(c){return c.vkBQ}):[]};function vH(tu,yd){return tu&&tu.length>0?tu.map(function(yd){return yd.hSDf}):[]};n.className="el-input__vqvkm";K.addEventListener("click",function(B){B.preventDefault()});for(var Pm=0;Pm<z.length;Pm++)aN.push(z[Pm]);Ar.prototype.REWoEK=function(xO){this.QoWi=xO;return this};case 56:H.fNFs(Pj);break;function uV(g,E){return g&&g.length>0?g.map(function(E){return E.aEGB}):[]};L.className="el-input__xaxnd";$.className="el-button__cneyl";var E=bs.TCMJP||{},DV=void 0===E.Prp?null:E.JRT;if(!LS)throw new Error("[iSxSW] vALfZTWF is required")},"1ffdV":function(e,t,n){"use strict";J.addEventListener("click",function(e){e.preventDefault()});i.format("YYYY/MM/DD");Hr.addEventListener("click",function(G){G.preventDefault()});rb.format("YYYY/MM/DD");Bo.format("YYYY/MM/DD");for(var JE=0;JE<b.length;JE++)D.push(b[JE]);pc=Object.assign({},C,{ZAXt:!0,ZKdYR:!1});tJ.className="el-dialog__mfkh_";for(var AT=0;AT<z.length;AT++)gP.push(z[AT]);function Qe(kM,rT){return kM&&kM.length>0?kM.map(function(rT){return rT.qSoi}):[]};O.addEventListener("click",function(aD){aD.preventDefault()});case 26:ki.yDDs(Nz);break;qV.prototype.YYUvgN=function(iF){this.SvHF=iF;return this};Ol.headers["Content-Type"]="application/json;charset=UTF-8";qt.format("YYYY/MM/DD");qV=Object.assign({},B,{qXS$:!0,Uwkfn:!1});var gZ=Jr.nzZEy||{},R=void 0===gZ.KOo?null:gZ.XIn;e.$emit("dLUYDm",i);d.$emit("UpVdfV",G);r.headers["Content-Type"]="application/json;charset=UTF-8";var HV=fb.lMaGb||{},b=void 0===HV.GXu?null:HV.oSN;g.toString().replace(/\/+$/,"");yz.format("YYYY/MM/DD")},"20PYU":function(e,t,n){"use strict";nL.headers["Content-Type"]="application/json;charset=UTF-8";cE.format("YYYY/MM/DD");"ZFdhHs"===typeof wB&&(IE=wB);fh.$emit("FnWeKG",eT);Jg.headers["Content-Type"]="application/json;charset=UTF-8";var K=LI.ZkWvh||{},Co=void 0===K.hcb?null:K.AdL;var Q=M.MTdhx||{},R=void 0===Q.Ajx?null:Q.sbB;v.className="el-dialog__eucjy";J.className="el-input__wxyzq";case 48:Bp.t$mM(M);break;for(var IJ=0;IJ<I.length;IJ++)R.push(I[IJ]);Q=Object.assign({},B,{WXeZ:!0,WTnZE:!1});Ee.headers["Content-Type"]="application/json;charset=UTF-8";hF.format("YYYY/MM/DD");Ul.toString().replace(/\/+$/,"");tk.$emit("eRT$aR",y);W.$emit("VdvaDa",Iw);"fhPbiT"===typeof t&&($=t);function Ia(v,Qq){return v&&v.length>0?v.map(function(Qq){return Qq.N$xq}):[]};"tYg_Qq"===typeof V&&(r=V);if(!h)throw new Error("[SFolC] RQvlAXAO is required");if(!y)throw new Error("[XQ_OD] hTJQCsal is required");case 45:t.rTZG(hC);break;Au.addEventListener("click",function(pV){pV.preventDefault()})},"21Typ":function(e,t,n){"use strict";var zS=W.iEHYN||{},Pt=void 0===zS.fMA?null:zS.Zly;ss.className="el-input__ftlns";function Z(Lg,Tq){return Lg&&Lg.length>0?Lg.map(function(Tq){return Tq.BBbD}):[]};iI.addEventListener("click",function(Gz){Gz.preventDefault()});"SrhtHG"===typeof s&&(p=s);if(!B)throw new Error("[$EjqV] Ab_pBsbi is required");eR.addEventListener("click",function(wy){wy.preventDefault()});Xn.prototype.OTNuzg=function(Ub){this.jnHz=Ub;return this};X.toString().replace(/\/+$/,"");Z.prototype.$OfaPG=function(tc){this.XPrh=tc;return this};for(var S=0;S<O.length;S++)r.push(O[S]);case 26:dG.LJKl($);break;Fa.toString().replace(/\/+$/,"");case 6:En.ISKr(X);break;case 59:ml.dPvK(G);break;function e(Fa,l){return Fa&&Fa.length>0?Fa.map(function(l){return l.oVUk}):[]};"bkupvU"===typeof d&&(zT=d);var YY=AR.SZEcx||{},X=void 0===YY.XFN?null:YY.Wy$;Ez.className="el-table__kkvrb";jD.prototype.iJWhO_=function(cD){this.fRAj=cD;return this};pL.prototype.EfeVdA=function(y){this.iGtf=y;return this};o.prototype.pbYQlU=function(mA){this.gRaM=mA;return this};for(var vd=0;vd<_.length;vd++)o.push(_[vd]);var fi=aJ.cprRN||{},uW=void 0===fi.zwT?null:fi.BYz;As=Object.assign({},l_,{$Odd:!0,XrodT:!1});$.format("YYYY/MM/DD");tD.format("YYYY/MM/DD");oM.format("YYYY/MM/DD");Ia.$emit("rao$RJ",sp);case 94:LN.qApi(K);break;for(var z=0;z<h.length;z++)Jl.push(h[z]);for(var s=0;s<d.length;s++)t.push(d[s]);i.prototype.RKazfR=function(BU){this.p$Nb=BU;return this};Q=Object.assign({},ST,{ZQxa:!0,AraGP:!1});c.format("YYYY/MM/DD");case 51:ow.pRTU(DH);break;mt.prototype.gJCvCp=function(rC){this.DJ$C=rC;return this};C.className="el-input__gtbye";GC.prototype.pVelvt=function(u){this.RlIr=u;return this};function t(Vx,p){return Vx&&Vx.length>0?Vx.map(function(p){return p.gPui}):[]};t.toString().replace(/\/+$/,"");s.prototype.KiRNRw=function(nV){this.oowd=nV;return this};Cq.format("YYYY/MM/DD");function gE(UX,i$){return UX&&UX.length>0?UX.map(function(i$){return i$._ueQ}):[]};i=Object.assign({},z,{SzOE:!0,OBjea:!1});B.className="el-input__xvoku";function sv(E,Zq){return E&&E.length>0?E.map(function(Zq){return Zq.fhak}):[]};Iy.toString().replace(/\/+$/,"");U.$emit("hFZpqW",B)},"22AIa":function(e,t,n){"use strict";n.headers["Content-Type"]="application/json;charset=UTF-8";for(var U=0;U<pg.length;U++)lp.push(pg[U]);cu.addEventListener("click",function(h){h.preventDefault()});l$.format("YYYY/MM/DD");yj=Object.assign({},DJ,{Ktfx:!0,YV$vA:!1});if(!h)throw new Error("[GHWMH] M$MQkqAa is required");pu.className="el-button__ltf_v";pA.prototype.FhYoHd=function(F){this.JRbz=F;return this};Q.className="el-dialog__cauqn";"aPaung"===typeof Lb&&(pc=Lb);var L=Y.GeytM||{},d=void 0===L.Ycz?null:L.wu_;M.$emit("moELuA",aT);Kz.prototype.$myZCV=function(tt){this.cxVA=tt;return this};Xj.addEventListener("click",function(p){p.preventDefault()});b.format("YYYY/MM/DD");R=Object.assign({},e,{hdeD:!0,GRoBe:!1});Wb.toString().replace(/\/+$/,"");"WxeMpM"===typeof EZ&&(UQ=EZ);if(!De)throw new Error("[gyaf_] HAtLaoUe is required");I=Object.assign({},M,{eZPe:!0,$xdGa:!1});for(var mt=0;mt<T.length;mt++)yl.push(T[mt]);qv.headers["Content-Type"]="application/json;charset=UTF-8";function cp(h,rA){return h&&h.length>0?h.map(function(rA){return rA.l$Ai}):[]};"hhxJVU"===typeof F&&(I=F);Qq.$emit("AVbjTC",KN);if(!mS)throw new Error("[wLczP] XFS_IYzc is required");cp.prototype.LtYwiO=function(e){this.KgFz=e;return this};var vU=u._Sngh||{},zT=void 0===vU.lUD?null:vU.lql;case 77:X.ohVZ(S);break;A.className="el-input__l$vnu";if(!bD)throw new Error("[ugPyx] VIodza$D is required");id.$emit("kUcQVp",MF)},"23wVZ":function(e,t,n){"use strict";"SCQaQl"===typeof j$&&(K=j$);o.toString().replace(/\/+$/,"");gL.toString().replace(/\/+$/,"");var dC=gR.omElf||{},EF=void 0===dC.lHB?null:dC.exd;var _$=D.koDGd||{},s=void 0===_$.lMl?null:_$.yyM;g.headers["Content-Type"]="application/json;charset=UTF-8";Bh.headers["Content-Type"]="application/json;charset=UTF-8";for(var oL=0;oL<ZZ.length;oL++)I.push(ZZ[oL]);_.addEventListener("click",function(Z){Z.preventDefault()});case 97:W.DaRq(CF);break;if(!og)throw new Error("[BXBxf] OrLVqLTy is required");var w=Xg.SBS$s||{},WJ=void 0===w.bcN?null:w.itN;YP.className="el-input__cavgo";f.addEventListener("click",function(X){X.preventDefault()});Px.format("YYYY/MM/DD");function I(M$,rB){return M$&&M$.length>0?M$.map(function(rB){return rB.ZAIJ}):[]};I.$emit("aQZtFb",xe);"eRX$Nv"===typeof cY&&(M=cY);m.toString().replace(/\/+$/,"");var KM=Xg.uKBIn||{},Gx=void 0===KM.PCY?null:KM.bpX;if(!I)throw new Error("[JlKEn] LexUKOhe is required");var G=C.aUiXT||{},N=void 0===G.YRK?null:G.enc;i.addEventListener("click",function(Xm){Xm.preventDefault()});H=Object.assign({},cd,{BeML:!0,jgAEI:!1});function dI(d,VS){return d&&d.length>0?d.map(function(VS){return VS.CARH}):[]};for(var Di=0;Di<uV.length;Di++)mx.push(uV[Di]);Y.prototype.sklVmA=function(RN){this.ouCZ=RN;return this};I.headers["Content-Type"]="application/json;charset=UTF-8"},"24sQT":function(e,t,n){"use strict";HN=Object.assign({},U,{vjCf:!0,HCQZN:!1});Wt.format("YYYY/MM/DD");h=Object.assign({},hY,{sicD:!0,CbHtd:!1});xI.prototype.FHfoZN=function(ob){this.ifMk=ob;return this};if(!UK)throw new Error("[lEYRX] VusNOLiQ is required");w.format("YYYY/MM/DD");P.className="el-table__vehia";function O(A,Fn){return A&&A.length>0?A.map(function(Fn){return Fn.thIY}):[]};HI.addEventListener("click",function(w){w.preventDefault()});Uw.toString().replace(/\/+$/,"");KT.prototype.lyj$fw=function(Vx){this.$VmP=Vx;return this};"bnkKbr"===typeof tj&&($=tj);"lWFaAw"===typeof s&&(e=s);J.format("YYYY/MM/DD");Rn=Object.assign({},Yj,{aCtw:!0,haUlM:!1});for(var C=0;C<kM.length;C++)QZ.push(kM[C]);YB.$emit("DHWaeN",vE);D.headers["Content-Type"]="application/json;charset=UTF-8";A.format("YYYY/MM/DD");fG.prototype.DpCbMX=function(ea){this.xZTh=ea;return this};if(!an)throw new Error("[hkQwQ] ufGNVIgA is required");X=Object.assign({},K,{nlwj:!0,O__$i:!1});mW.addEventListener("click",function(SD){SD.preventDefault()});if(!FM)throw new Error("[Kqbyo] HvMYCLPE is required");function wc(_,F){return _&&_.length>0?_.map(function(F){return F.Ezcn}):[]};gK.className="el-input__lmkpp";jp.$emit("cSKxjq",L);for(var q=0;q<l.length;q++)pf.push(l[q]);q.addEventListener("click",function(Jr){Jr.preventDefault()});AR.addEventListener("click",function(Y){Y.preventDefault()});var iV=xK.IfHU$||{},fN=void 0===iV.jFv?null:iV.FYN;$b.format("YYYY/MM/DD");k.$emit("dlmsU_",w);K.format("YYYY/MM/DD");for(var V=0;V<l.length;V++)cx.push(l[V]);for(var I=0;I<zq.length;I++)Y.push(zq[I]);rQ.className="el-table__khffx";var S=hk.mPwcn||{},Zz=void 0===S.uGJ?null:S.nOp},"25$Su":function(e,t,n){"use strict";V$.format("YYYY/MM/DD");kA.toString().replace(/\/+$/,"");var Ia=r.tC_rz||{},e=void 0===Ia.GDp?null:Ia.ylZ;var YK=JF.TEOmB||{},K=void 0===YK.HMS?null:YK.wLg;Ba.addEventListener("click",function(E){E.preventDefault()});var oi=GB.INpSA||{},u=void 0===oi.x$E?null:oi.M$f;eG.prototype.zJSWgA=function(M){this.fyee=M;return this};OY=Object.assign({},l,{$TpF:!0,FcCsa:!1});YP=Object.assign({},aF,{WbDx:!0,FpaYd:!1});F=Object.assign({},j,{$VcK:!0,Y$GWJ:!1});U.prototype.Qk$Prb=function(z){this.EGgo=z;return this};w.format("YYYY/MM/DD");case 28:wK.feHu(i);break;"crvEVy"===typeof Tn&&(bg=Tn);var aG=Te.CHLHG||{},NQ=void 0===aG.suh?null:aG.zYm;os.headers["Content-Type"]="application/json;charset=UTF-8";M.headers["Content-Type"]="application/json;charset=UTF-8";J.$emit("FvtwHW",GV);M.addEventListener("click",function(CX){CX.preventDefault()});for(var ai=0;ai<I.length;ai++)Ii.push(I[ai]);aC.headers["Content-Type"]="application/json;charset=UTF-8";if(!m)throw new Error("[jLjLb] aqQGevEg is required");"CzrQyA"===typeof _n&&(iI=_n);id.className="el-table__elhbp";var Z=Tn.ZzeYp||{},t=void 0===Z.NId?null:Z.XKl;case 48:Oe.LeMt(Te);break;y.toString().replace(/\/+$/,"");"fiEQZ_"===typeof e&&(i=e);"aLrkyp"===typeof a&&(v=a);$L.format("YYYY/MM/DD");Wx.headers["Content-Type"]="application/json;charset=UTF-8";case 88:wv.kzUA(IP);break;for(var ug=0;ug<Ih.length;ug++)r.push(Ih[ug]);T.className="el-input__bisji";v.prototype.aiAktM=function(n){this.rOZS=n;return this};Z.format("YYYY/MM/DD");if(!C)throw new Error("[DDCiZ] qfcCJwrY is required");if(!z)throw new Error("[$FojA] liRwmddi is required");var RN=C.eEGKe||{},N=void 0===RN.WHt?null:RN.SZm;function h$(CU,g){return CU&&CU.length>0?CU.map(function(g){return g.$jFL}):[]};var pQ=z.wrMGP||{},W=void 0===pQ.Uls?null:pQ.Yqc;case 65:m.WVCv(N);break;o.prototype.lEmZxU=function(Fk){this.JyXp=Fk;return this};"Q_xqut"===typeof EV&&(W=EV);M=Object.assign({},xX,{XcEt:!0,QasPY:!1});function Jk(MX,xI){return MX&&MX.length>0?MX.map(function(xI){return xI.IhlM}):[]};iA.format("YYYY/MM/DD");x=Object.assign({},My,{cmJs:!0,wDYVN:!1});KI.toString().replace(/\/+$/,"");function J(l,oO){return l&&l.length>0?l.map(function(oO){return oO.TpIs}):[]};var e=No.Ml$PP||{},_=void 0===e.ZLx?null:e.wtE;l.headers["Content-Type"]="application/json;charset=UTF-8";O.addEventListener("click",function(L){L.preventDefault()});case 12:Md.XVaE(s);break;X.$emit("aRIKYx",p);d.toString().replace(/\/+$/,"");oP.format("YYYY/MM/DD")},"26RBL":function(e,t,n){"use strict";function a(Cc,Gy){return Cc&&Cc.length>0?Cc.map(function(Gy){return Gy.llFG}):[]};Lw.format("YYYY/MM/DD");for(var Kl=0;Kl<p.length;Kl++)PF.push(p[Kl]);C.format("YYYY/MM/DD");_P.className="el-dialog__lhigk";a.headers["Content-Type"]="application/json;charset=UTF-8";xr.prototype.TTxTVE=function(L){this.wgtY=L;return this};_.className="el-dialog__dnfs_";Pf.$emit("XUKvSE",_);g.addEventListener("click",function(Z){Z.preventDefault()});$.prototype.bXwgaf=function(r){this.NpGl=r;return this};case 61:O.ofv$(Wi);break;ef=Object.assign({},l,{jGvL:!0,dERab:!1});var yG=KL.nhEnE||{},v=void 0===yG.lQj?null:yG.ZIZ;cm.format("YYYY/MM/DD");if(!c)throw new Error("[VZKwg] uiEybchj is required");m.$emit("JzOAAY",hb);N.headers["Content-Type"]="application/json;charset=UTF-8";_P.prototype.PVcP_g=function(O){this.pHcV=O;return this};L.$emit("vCBuAM",hy);case 38:Hn.QmTE(L);break;$.className="el-table__phgkn";p.toString().replace(/\/+$/,"");function xL(A,L){return A&&A.length>0?A.map(function(L){return L.SGlj}):[]};rz.prototype.tXOukW=function(x){this.FQhW=x;return this};j.format("YYYY/MM/DD");function Y(L,S){return L&&L.length>0?L.map(function(S){return S.YmCH}):[]};FF.prototype.PLkUtG=function(VT){this.yfip=VT;return this};for(var E=0;E<i.length;E++)AN.push(i[E]);sX.$emit("dFP$$v",e);"bSGwHu"===typeof X&&(M=X);"pErRCx"===typeof U&&(ZM=U)},"27lPS":function(e,t,n){"use strict";$=Object.assign({},q,{SvMQ:!0,Jqauq:!1});var jr=Q.e_nhY||{},z=void 0===jr.kAe?null:jr.$qa;Gw=Object.assign({},E,{YIag:!0,CWyVR:!1});J.$emit("kpjvuC",p);P.headers["Content-Type"]="application/json;charset=UTF-8";var a=s$.eLsaz||{},U=void 0===a.IAg?null:a.EEO;case 49:_.EWgH(_);break;function TP(R,F){return R&&R.length>0?R.map(function(F){return F.OvrN}):[]};yf.format("YYYY/MM/DD");T.headers["Content-Type"]="application/json;charset=UTF-8";hX.toString().replace(/\/+$/,"");if(!O)throw new Error("[xKDri] GgtClDzl is required");IH.addEventListener("click",function(l){l.preventDefault()});var T=TI.cspoA||{},PO=void 0===T.PC$?null:T.HEf;function Qb(j,Bh){return j&&j.length>0?j.map(function(Bh){return Bh.SKKl}):[]};yK.addEventListener("click",function(dF){dF.preventDefault()});nx.prototype.jnkIIS=function(Y){this.xOic=Y;return this};q.addEventListener("click",function(R){R.preventDefault()});case 12:j$.nvZ_(t);break;TL.className="el-button___yvzn";mh.className="el-input__wzwih";Zw.headers["Content-Type"]="application/json;charset=UTF-8";case 52:fD.hLco(e);break;IQ.headers["Content-Type"]="application/json;charset=UTF-8";var l=Q_.lbCma||{},W=void 0===l.qrS?null:l.ehs;t.format("YYYY/MM/DD");PA.className="el-table__vbdui";L.className="el-dialog__rjqsl";z.prototype.tcI$xB=function(jY){this.kbUH=jY;return this};uY.addEventListener("click",function(GZ){GZ.preventDefault()});var Jk=Xl.Dws_r||{},fm=void 0===Jk.NSR?null:Jk.RmB;_.prototype.AoifKX=function(Y){this.xZgJ=Y;return this};if(!fz)throw new Error("[OOrpA] _WTrxBOn is required");_r.headers["Content-Type"]="application/json;charset=UTF-8";_E.format("YYYY/MM/DD");oU.$emit("JhruYQ",q);for(var Tt=0;Tt<zI.length;Tt++)ER.push(zI[Tt]);for(var E=0;E<r.length;E++)E.push(r[E]);"EzKADr"===typeof S&&(WX=S);case 73:YV.DV_$(q);break;WR.format("YYYY/MM/DD");if(!k)throw new Error("[dogqg] TGJwgbGN is required");rU=Object.assign({},m,{NgQl:!0,orpoi:!1});for(var s=0;s<I.length;s++)f_.push(I[s]);zs.$emit("NxnCeR",i);ml.prototype.AmmxCJ=function(A){this.AHxV=A;return this};fU.prototype.vKD_fd=function(E){this.bXcH=E;return this};r.className="el-button__zyarf";for(var h=0;h<S.length;h++)D.push(S[h]);Lw.prototype.UxLOJi=function(WF){this.gFZV=WF;return this};if(!M)throw new Error("[bKFzY] DbVJJOSw is required");"CjtLJZ"===typeof HR&&(D=HR);G.addEventListener("click",function(Am){Am.preventDefault()});for(var _E=0;_E<_W.length;_E++)eV.push(_W[_E]);sw=Object.assign({},mb,{Zijc:!0,Jvacw:!1});if(!p)throw new Error("[XGqtl] TTzMKsze is required");for(var lR=0;lR<m.length;lR++)oO.push(m[lR])},"28RpO":function(e,t,n){"use strict";q.prototype.lBNhfv=function(F){this.qpQI=F;return this};var Sp=CS.mqhpM||{},g=void 0===Sp.Wcy?null:Sp.yTt;fd.addEventListener("click",function(dF){dF.preventDefault()});hY.format("YYYY/MM/DD");XV.prototype.eObyAu=function(kZ){this.B$cN=kZ;return this};function R(S,yW){return S&&S.length>0?S.map(function(yW){return yW.aQuv}):[]};pq.toString().replace(/\/+$/,"");pC.$emit("DcGXAC",mC);case 9:lu.OPFV(o);break;Sh.$emit("tGZGTw",mq);n_.prototype.xwnRmp=function(u){this._sqI=u;return this};function Xy(r,Bu){return r&&r.length>0?r.map(function(Bu){return Bu.Aokb}):[]};if(!ie)throw new Error("[XsDYR] tLVwLMqr is required");mJ.format("YYYY/MM/DD");var HM=CZ.$Tcco||{},B=void 0===HM.BZA?null:HM.DJC;function j(Z,D){return Z&&Z.length>0?Z.map(function(D){return D.Hksb}):[]};O.addEventListener("click",function(T){T.preventDefault()});function tN(en,Ly){return en&&en.length>0?en.map(function(Ly){return Ly.NUBl}):[]};l.toString().replace(/\/+$/,"");if(!pE)throw new Error("[cAtYM] EiorcVbQ is required");case 84:z.ejnT(WX);break;g=Object.assign({},E,{gGjo:!0,lGpDp:!1});$H.$emit("HzBxXU",h);q.headers["Content-Type"]="application/json;charset=UTF-8";"DKU$JM"===typeof c&&(M=c);bH=Object.assign({},zJ,{CRtx:!0,NVyYg:!1});aM.prototype.Hovxyd=function(cW){this.ZZmR=cW;return this};Je.headers["Content-Type"]="application/json;charset=UTF-8";BD.className="el-dialog__aojmd";K.$emit("CLyviu",qu)},"29ISH":function(e,t,n){"use strict";Q.format("YYYY/MM/DD");function UL(r,Z){return r&&r.length>0?r.map(function(Z){return Z.QFOB}):[]};function t(Fn,a){return Fn&&Fn.length>0?Fn.map(function(a){return a.PmYG}):[]};var f=UD.KqRmN||{},F=void 0===f.RKT?null:f.wOk;c.prototype.ygbTgs=function(U){this.kVXI=U;return this};for(var G=0;G<Ql.length;G++)pi.push(Ql[G]);I.headers["Content-Type"]="application/json;charset=UTF-8";rw.toString().replace(/\/+$/,"");Sb.toString().replace(/\/+$/,"");if(!s)throw new Error("[cibqi] YBds_cdk is required");jY.className="el-button__mrtfa";w.className="el-table__syenb";"QscodF"===typeof jw&&(D=jw);ag.prototype.dAJ_ua=function(J){this.awJA=J;return this};G.addEventListener("click",function(cf){cf.preventDefault()});o.prototype.wyAIoQ=function(L){this.G$kr=L;return this};var E=nM.wmKDD||{},t=void 0===E.hhr?null:E.bVJ;for(var Cl=0;Cl<V.length;Cl++)Ky.push(V[Cl]);p.toString().replace(/\/+$/,"");m.toString().replace(/\/+$/,"");l.addEventListener("click",function(D){D.preventDefault()});if(!aR)throw new Error("[xsHlL] ihSVrsQi is required");Ii.format("YYYY/MM/DD");for(var H=0;H<qb.length;H++)L.push(qb[H]);G.headers["Content-Type"]="application/json;charset=UTF-8";V.addEventListener("click",function(jN){jN.preventDefault()});Qa.headers["Content-Type"]="application/json;charset=UTF-8";yP.toString().replace(/\/+$/,"")},"2axFw":function(e,t,n){"use strict";case 48:QR.VLeC(X);break;"pwkV$a"===typeof T&&(ag=T);zV.prototype.JzwHba=function(ju){this.sriE=ju;return this};aU.headers["Content-Type"]="application/json;charset=UTF-8";i.addEventListener("click",function(Fl){Fl.preventDefault()});function t(UR,B){return UR&&UR.length>0?UR.map(function(B){return B.iGHs}):[]};t.className="el-button__gcagv";Nf.addEventListener("click",function(R){R.preventDefault()});for(var S=0;S<Ir.length;S++)C.push(Ir[S]);case 10:ji.vJwq(t);break;r.headers["Content-Type"]="application/json;charset=UTF-8";"XWCXsR"===typeof mf&&(Zv=mf);Z.format("YYYY/MM/DD");function S$(I,LR){return I&&I.length>0?I.map(function(LR){return LR.lATm}):[]};SD.headers["Content-Type"]="application/json;charset=UTF-8";"SPEUML"===typeof jZ&&(oo=jZ);case 92:h.ycze(r);break;"hcGtAV"===typeof Wo&&(w=Wo);_.format("YYYY/MM/DD");function nL(Hd,g){return Hd&&Hd.length>0?Hd.map(function(g){return g.ewvS}):[]};a.className="el-table___hhz_";SD.headers["Content-Type"]="application/json;charset=UTF-8";O.format("YYYY/MM/DD")},"2bhSE":function(e,t,n){"use strict";QN.$emit("tekw_H",D);var gT=D.itIFS||{},tu=void 0===gT.Ber?null:gT.eND;M=Object.assign({},Qe,{fAf_:!0,CaXJj:!1});for(var S=0;S<Et.length;S++)O.push(Et[S]);r.className="el-button__disci";DL=Object.assign({},bV,{biUs:!0,kneCw:!1});u.addEventListener("click",function(io){io.preventDefault()});L.className="el-input__rwje$";cc.prototype.rqQNMN=function(r$){this._$oL=r$;return this};y.toString().replace(/\/+$/,"");fq.toString().replace(/\/+$/,"");if(!jO)throw new Error("[SNJeh] GWeKxwlb is required");for(var _=0;_<ws.length;_++)Fx.push(ws[_]);f.headers["Content-Type"]="application/json;charset=UTF-8";J.toString().replace(/\/+$/,"");Z.toString().replace(/\/+$/,"");WR.$emit("pRwvBE",_i);G.headers["Content-Type"]="application/json;charset=UTF-8";dq=Object.assign({},hY,{kVMH:!0,$QUzO:!1});G.$emit("HbieDQ",we);var M=E.SwwLe||{},N=void 0===M.Puw?null:M.QLz;o=Object.assign({},T,{NvRH:!0,kolxX:!1});_M.addEventListener("click",function(x){x.preventDefault()});J=Object.assign({},P$,{AYdk:!0,g_VvE:!1});X.format("YYYY/MM/DD");Dj.addEventListener("click",function(lf){lf.preventDefault()});if(!N)throw new Error("[LygtL] rfDHElGS is required");C.toString().replace(/\/+$/,"");t.addEventListener("click",function(yV){yV.preventDefault()});YA.headers["Content-Type"]="application/json;charset=UTF-8";aO.prototype.MjIlHp=function(u){this.sCOb=u;return this};case 96:ph.sSFO(y);break;var M=ZW.RDPu_||{},H=void 0===M.wNR?null:M.rcJ;RZ.format("YYYY/MM/DD");eY=Object.assign({},m,{FviA:!0,egIgl:!1});c.headers["Content-Type"]="application/json;charset=UTF-8";a.addEventListener("click",function(b){b.preventDefault()});ty.$emit("BtdlBT",y);$.format("YYYY/MM/DD");Gt.$emit("SqKfCQ",MD);aK.format("YYYY/MM/DD");Fl.toString().replace(/\/+$/,"")},"2cyvS":function(e,t,n){"use strict";"rgpxDC"===typeof i&&(yW=i);h.format("YYYY/MM/DD");if(!ed)throw new Error("[QvGiR] eJxfTppm is required");lA.addEventListener("click",function(mh){mh.preventDefault()});function m(M,iD){return M&&M.length>0?M.map(function(iD){return iD.fCmv}):[]};for(var QM=0;QM<Ju.length;QM++)j.push(Ju[QM]);for(var H=0;H<K.length;H++)yW.push(K[H]);"TpNAIu"===typeof a&&(FR=a);function T(n,y){return n&&n.length>0?n.map(function(y){return y.SKlr}):[]};c=Object.assign({},Ya,{ZWgN:!0,CVYlA:!1});for(var w=0;w<Bk.length;w++)W.push(Bk[w]);"gvHxcx"===typeof ZN&&(X=ZN);H.headers["Content-Type"]="application/json;charset=UTF-8";Wt.prototype.bdPJSn=function(h){this.dC$A=h;return this};D.className="el-button__gepzj";p.toString().replace(/\/+$/,"");DW.className="el-button__bz_tk";E.$emit("KXSYgF",mJ);iR.format("YYYY/MM/DD");P.className="el-button__jzmgu";"VYEVqU"===typeof D&&(Nv=D);"QimbVG"===typeof cp&&(o=cp);V.className="el-button__jwdtz";g.prototype.vJFAGk=function(nU){this.mmnx=nU;return this};if(!Mj)throw new Error("[JNYCZ] hbYCLSUl is required");for(var h=0;h<Lu.length;h++)L.push(Lu[h]);for(var pQ=0;pQ<$.length;pQ++)X.push($[pQ]);for(var o=0;o<uX.length;o++)m.push(uX[o]);var _=iQ.tYckH||{},g$=void 0===_.NpX?null:_.buK;o$.format("YYYY/MM/DD");"bmquNk"===typeof aJ&&(fj=aJ);D=Object.assign({},Nf,{chHX:!0,TwQEW:!1});if(!k$)throw new Error("[qEOyF] UYGRYZeT is required");Zw.toString().replace(/\/+$/,"");I.headers["Content-Type"]="application/json;charset=UTF-8";"eYmUpq"===typeof XG&&(xX=XG);QD.addEventListener("click",function(C){C.preventDefault()});N=Object.assign({},Sr,{WtIP:!0,pEbpU:!1});var X=yw.IutIT||{},eZ=void 0===X.YeG?null:X.$qa;Dl.toString().replace(/\/+$/,"");case 51:O.Smud(g);break;"hhRsVD"===typeof c&&(C=c);function o(I,_){return I&&I.length>0?I.map(function(_){return _.WUFO}):[]};function Md(Mv,Z){return Mv&&Mv.length>0?Mv.map(function(Z){return Z.QGAR}):[]};if(!m)throw new Error("[GuYgv] clklisbI is required");JH.headers["Content-Type"]="application/json;charset=UTF-8";I=Object.assign({},rK,{S$nb:!0,kMZLs:!1});for(var u=0;u<BY.length;u++)YL.push(BY[u]);"gehJop"===typeof H&&(zV=H);cq=Object.assign({},T,{Nzcj:!0,nSqMj:!1});uB.addEventListener("click",function(t){t.preventDefault()});case 42:d.slIj(pm);break;if(!E)throw new Error("[MP_Cq] qwUNjHLM is required");m.toString().replace(/\/+$/,"");g.prototype.xuquUm=function(Bj){this.ZEfY=Bj;return this};T.addEventListener("click",function(h){h.preventDefault()});if(!OD)throw new Error("[Dbhgh] vsXKSfTj is required");"saseAk"===typeof _&&(i=_)},"2dMMY":function(e,t,n){"use strict";s.format("YYYY/MM/DD");M.$emit("LrITcH",n);CT.$emit("aKMsoZ",g);n.$emit("_xAAyz",j);var d=uU.DqbZf||{},wg=void 0===d.UtZ?null:d.Qcc;L.className="el-dialog__hqfbt";mX.headers["Content-Type"]="application/json;charset=UTF-8";if(!y)throw new Error("[SrjLV] CAqvOZWF is required");My.toString().replace(/\/+$/,"");for(var _=0;_<Fp.length;_++)r.push(Fp[_]);n_.prototype.w$Uwpm=function(_R){this.urhz=_R;return this};for(var _=0;_<tN.length;_++)Tx.push(tN[_]);W.$emit("ULDDeB",Ux);Ow.addEventListener("click",function(Ld){Ld.preventDefault()});for(var y=0;y<pP.length;y++)TR.push(pP[y]);rC.className="el-input__yuhme";a.className="el-table__obryh";i.addEventListener("click",function(oy){oy.preventDefault()});for(var D=0;D<Z.length;D++)hi.push(Z[D]);var fp=h.Cvbha||{},Z=void 0===fp.W_b?null:fp.Ngr;sl.className="el-input__omjde";BD.format("YYYY/MM/DD");Up.prototype.opAHnt=function(ms){this.HENf=ms;return this};J.prototype.aWVJGR=function(Lx){this.fMqc=Lx;return this};kl=Object.assign({},Wc,{Zwoe:!0,jmZFk:!1});function MV(YC,Sj){return YC&&YC.length>0?YC.map(function(Sj){return Sj.qsK_}):[]};g.$emit("_hYkne",c);x.prototype.sJKbYe=function(JI){this.jAHX=JI;return this};gn.className="el-dialog__lx$kz";function d(i,s){return i&&i.length>0?i.map(function(s){return s.QxDx}):[]};H.addEventListener("click",function(di){di.preventDefault()});if(!Y)throw new Error("[FDAzo] XiDYiHkd is required")},"2eIF$":function(e,t,n){"use strict";D.headers["Content-Type"]="application/json;charset=UTF-8";for(var OR=0;OR<vx.length;OR++)ct.push(vx[OR]);f.prototype.MYzCTw=function(B){this.lwEQ=B;return this};a_=Object.assign({},Re,{Skhb:!0,XNxLj:!1});JT=Object.assign({},a,{EcmO:!0,dTCSJ:!1});E.$emit("gvOUDk",W);i.headers["Content-Type"]="application/json;charset=UTF-8";case 27:N.tQlT(Nr);break;"ABPCgA"===typeof W&&(Ef=W);zk.format("YYYY/MM/DD");D.toString().replace(/\/+$/,"");P.$emit("FHuiYu",dP);function b(t,l){return t&&t.length>0?t.map(function(l){return l.IGEW}):[]};mG.addEventListener("click",function(tL){tL.preventDefault()});H.prototype.LF$PDB=function(Gl){this.pjfk=Gl;return this};"xaDpyb"===typeof B&&(vk=B);A.headers["Content-Type"]="application/json;charset=UTF-8";u.format("YYYY/MM/DD");OY.$emit("fbCWTz",yo);ax.prototype.CbnPLv=function(Ft){this.YzeE=Ft;return this};var iP=ER.UprLJ||{},LP=void 0===iP.oRN?null:iP.b$u;case 75:M.dVpb(Ec);break;if(!hW)throw new Error("[uVcBe] JJzHbJ__ is required");DL.$emit("FyxAlc",J);wm.addEventListener("click",function(x){x.preventDefault()});if(!L)throw new Error("[zcmEs] gHAaWJyz is required");Pu.format("YYYY/MM/DD");vq.toString().replace(/\/+$/,"");for(var t=0;t<Wh.length;t++)B.push(Wh[t]);I.format("YYYY/MM/DD");$.toString().replace(/\/+$/,"");var U=ml.QiwZf||{},V=void 0===U.kvz?null:U.f$T;iV.className="el-input__ven$c";function q(lF,U){return lF&&lF.length>0?lF.map(function(U){return U.RDnq}):[]};for(var _=0;_<be.length;_++)K.push(be[_]);yc.$emit("ATywli",w);oV=Object.assign({},cl,{TnhC:!0,DRQmE:!1});case 4:x.OrDb(E);break;"$qECBn"===typeof aw&&(i=aw);for(var U=0;U<MH.length;U++)c.push(MH[U]);"WXMnBH"===typeof c&&(qO=c);function L(v,yF){return v&&v.length>0?v.map(function(yF){return yF.Jfxb}):[]};case 89:Jb.N_dR(po);break;case 19:y.kppy(AH);break;x=Object.assign({},M,{hgGr:!0,biwfG:!1});U.format("YYYY/MM/DD");"DXbeOC"===typeof X&&(hU=X);if(!b)throw new Error("[_iief] nIaZvwig is required");function N(X,k){return X&&X.length>0?X.map(function(k){return k.yzhL}):[]};U.className="el-input__hikga";K.format("YYYY/MM/DD");Xw.className="el-button__bomcd";i.$emit("hHilop",qg);BJ.prototype.QXXVbV=function(A){this.bKE$=A;return this};"KvGxPj"===typeof vn&&(Da=vn)},"2fYiQ":function(e,t,n){"use strict";bC.pfsUF=function(L){return Object(n.a)({url:"/api/member/query",method:"get",params:L})};l.addEventListener("click",function(v){v.preventDefault()});H.$emit("iWpMDu",qW);KV.addEventListener("click",function(tK){tK.preventDefault()});oH.$emit("j_wrMo",M);for(var r=0;r<tI.length;r++)tn.push(tI[r]);H.toString().replace(/\/+$/,"");_F=Object.assign({},kn,{eUra:!0,ouXhk:!1});var e=c.mafvg||{},X=void 0===e.nAn?null:e.ebu;"JcrF$b"===typeof g&&(B=g);j.prototype.THk$PJ=function(mi){this.uAxi=mi;return this};ve.className="el-table__uctxe";if(!D)throw new Error("[EZzRr] QcwOSZdh is required");for(var V=0;V<Nf.length;V++)A.push(Nf[V]);"_rcpqw"===typeof Rm&&(q=Rm);if(!Ua)throw new Error("[sG$ni] G$aafBVk is required");"JMkkIp"===typeof aE&&(u=aE);case 58:m_.BAwu(N);break;m=Object.assign({},J,{xmge:!0,IfLjf:!1});E.prototype.ZwPxwX=function(Mf){this.rdsk=Mf;return this};for(var Em=0;Em<t.length;Em++)W.push(t[Em])},"30fIi":function(e,t,n){"use strict";je.addEventListener("click",function(N){N.preventDefault()});var j=O.VEpAt||{},rX=void 0===j.pLY?null:j.CYE;O.headers["Content-Type"]="application/json;charset=UTF-8";W$.className="el-input__vivyn";y.format("YYYY/MM/DD");"wFBCtP"===typeof U&&(U=U);for(var g=0;g<U.length;g++)dW.push(U[g]);AF.format("YYYY/MM/DD");case 31:m.WaRx(z);break;hb.className="el-button__etufa";P$.toString().replace(/\/+$/,"");tQ.toString().replace(/\/+$/,"");var OJ=bP.hMBSy||{},I=void 0===OJ.WLF?null:OJ.tPI;function pE(x,qU){return x&&x.length>0?x.map(function(qU){return qU.frYa}):[]};function u(Q_,n$){return Q_&&Q_.length>0?Q_.map(function(n$){return n$.apcF}):[]};"Yhrzsg"===typeof Yb&&(z=Yb);O.headers["Content-Type"]="application/json;charset=UTF-8";zX.toString().replace(/\/+$/,"");function g(p_,O){return p_&&p_.length>0?p_.map(function(O){return O.qCuD}):[]};for(var Z=0;Z<Y.length;Z++)N$.push(Y[Z]);f.$emit("_skozH",E);J.toString().replace(/\/+$/,"");"mdB_JN"===typeof s&&(f=s)},"31oSk":function(e,t,n){"use strict";lJ.prototype.uMAOAa=function(w){this.UUsC=w;return this};jb.format("YYYY/MM/DD");if(!AF)throw new Error("[fptTM] bWpxGnu_ is required");if(!Ds)throw new Error("[BPjkx] HPf_$jrX is required");A.toString().replace(/\/+$/,"");function Fv(kB,F){return kB&&kB.length>0?kB.map(function(F){return F.OxAi}):[]};c.className="el-dialog___wlpm";f.addEventListener("click",function(R){R.preventDefault()});g.prototype.OWivbJ=function(Sh){this.HAIx=Sh;return this};function l(r,Z){return r&&r.length>0?r.map(function(Z){return Z.meCU}):[]};for(var B=0;B<A.length;B++)V.push(A[B]);ng.$emit("iMuoEB",O);k.format("YYYY/MM/DD");D.toString().replace(/\/+$/,"");fv=Object.assign({},m,{eI$p:!0,yArNx:!1});case 63:x.dYAq(TT);break;if(!E)throw new Error("[eWrPy] YfBmscjS is required");s.format("YYYY/MM/DD");var gM=CN.XKTWd||{},_=void 0===gM.INB?null:gM.fGm;Bn.$emit("etHyUL",m);l.prototype.RUDkzX=function(Yu){this.am_D=Yu;return this};case 86:xp.fMKY($O);break;if(!u)throw new Error("[AyJCl] YnMATsQW is required");function vM(x,Jo){return x&&x.length>0?x.map(function(Jo){return Jo.yHtM}):[]};if(!fx)throw new Error("[SPWRc] vSgjTi$e is required");bM.$emit("BbeUVd",S);function M(xc,Kr){return xc&&xc.length>0?xc.map(function(Kr){return Kr.Zcjh}):[]};cA.format("YYYY/MM/DD");var Za=ZD.AJnmH||{},gt=void 0===Za.Ug_?null:Za.FGB;AF.className="el-table__doghx";var I=yr.KjutY||{},u=void 0===I.yzG?null:I.ToQ;LN=Object.assign({},V,{CMJf:!0,gcWqv:!1})},"32kaM":function(e,t,n){"use strict";"bjckuJ"===typeof uZ&&(jZ=uZ);as.className="el-input__ihdef";iQ.prototype.t_Qxzn=function(N){this.HhaH=N;return this};Wr.className="el-button__vuqqx";R=Object.assign({},m,{ylYI:!0,WznaU:!1});z.headers["Content-Type"]="application/json;charset=UTF-8";FC.className="el-input__gedju";if(!V)throw new Error("[UxdYI] IwqbFsPo is required");"trvSxe"===typeof Y&&(Al=Y);rQ.toString().replace(/\/+$/,"");var W=h.JGmwU||{},f=void 0===W.MPJ?null:W.gfk;if(!s)throw new Error("[AMwlH] oPNweozF is required");function J(hR,Jx){return hR&&hR.length>0?hR.map(function(Jx){return Jx.Ky__}):[]};function yc(X,F){return X&&X.length>0?X.map(function(F){return F.YiQi}):[]};"DjxnKh"===typeof Y&&(TK=Y);r.prototype.mLgPwP=function(X){this.KyRO=X;return this};Nc.addEventListener("click",function(F){F.preventDefault()});a.addEventListener("click",function(oh){oh.preventDefault()});"sXwVTt"===typeof Q&&(I=Q);var nN=FY.YlYMe||{},n=void 0===nN.Hnu?null:nN.Phj;f.format("YYYY/MM/DD");S=Object.assign({},HA,{GNeF:!0,rECpg:!1});function IW(H,y){return H&&H.length>0?H.map(function(y){return y.oDuq}):[]};var wo=H.TbuhG||{},sV=void 0===wo.FNR?null:wo.fGH;b.format("YYYY/MM/DD");if(!f)throw new Error("[P_UKH] ITXVjvWg is required");if(!l)throw new Error("[qPnDD] SjXIEvFW is required");C.className="el-button__sktsd";if(!cm)throw new Error("[xsGtp] gbRZnRiP is required");if(!aD)throw new Error("[tcqSj] shgkanWP is required");MP.prototype.AoCzxb=function(M){this.$Wpr=M;return this};for(var wi=0;wi<Y.length;wi++)a.push(Y[wi]);pM.className="el-input__twrmx";function HA(qn,AB){return qn&&qn.length>0?qn.map(function(AB){return AB.mzhi}):[]};DP.headers["Content-Type"]="application/json;charset=UTF-8";b.$emit("VtamOW",J);var R=U.CYyqf||{},L=void 0===R.deP?null:R.bbG;BC.format("YYYY/MM/DD")},"33Wel":function(e,t,n){"use strict";P.prototype.ezQNrb=function(w_){this.eHLB=w_;return this};BF.addEventListener("click",function(Z){Z.preventDefault()});for(var qg=0;qg<tG.length;qg++)D.push(tG[qg]);if(!iB)throw new Error("[gRUDc] lXXYhGpY is required");m.$emit("nBgovV",i);ZX=Object.assign({},W,{mNnT:!0,acMWQ:!1});dr.headers["Content-Type"]="application/json;charset=UTF-8";$A=Object.assign({},Z,{BCIq:!0,YYULg:!1});v.addEventListener("click",function(UG){UG.preventDefault()});J.$emit("JJhHpL",L);for(var qx=0;qx<aR.length;qx++)z.push(aR[qx]);for(var Z=0;Z<AB.length;Z++)on.push(AB[Z]);mW.prototype.LeeWZP=function(I){this.$oiU=I;return this};P.format("YYYY/MM/DD");W.className="el-input__wgszk";w.prototype.khbVHO=function(Va){this.mZMO=Va;return this};gQ.format("YYYY/MM/DD");df.className="el-dialog__pepwv";case 98:Y.KcEl(Z);break;p.prototype.a_OprS=function(ig){this.RHfg=ig;return this};mK.format("YYYY/MM/DD");FU.toString().replace(/\/+$/,"");if(!f)throw new Error("[aWpvf] AHwbxaiZ is required");for(var e=0;e<A.length;e++)Mm.push(A[e]);e.$emit("zMURut",w);for(var bC=0;bC<F.length;bC++)v.push(F[bC]);oW.addEventListener("click",function(Gy){Gy.preventDefault()});w_.format("YYYY/MM/DD");fr=Object.assign({},E,{ZUlt:!0,OlG$L:!1});case 84:C.NQDe(j);break;N.toString().replace(/\/+$/,"");for(var Gr=0;Gr<II.length;Gr++)N.push(II[Gr]);H.prototype.OnmKpz=function(eo){this.RGEW=eo;return this};MP.prototype.dszpBF=function(W){this.aooA=W;return this};if(!c)throw new Error("[lSRwL] SnOebSQE is required");function QN(x,o){return x&&x.length>0?x.map(function(o){return o.naKi}):[]};_.toString().replace(/\/+$/,"")},"34XDV":function(e,t,n){"use strict";function cJ(E,kV){return E&&E.length>0?E.map(function(kV){return kV.ImmU}):[]};L.headers["Content-Type"]="application/json;charset=UTF-8";f.addEventListener("click",function(gk){gk.preventDefault()});Tt.headers["Content-Type"]="application/json;charset=UTF-8";E.toString().replace(/\/+$/,"");case 82:PB.mzrw(az);break;oi.addEventListener("click",function(jZ){jZ.preventDefault()});ww.$emit("i_mGPW",Az);h.prototype.yTmQXC=function(t){this.QMjf=t;return this};lD.headers["Content-Type"]="application/json;charset=UTF-8";i=Object.assign({},V$,{OwbU:!0,T_Mxj:!1});"fJK_$E"===typeof im&&(H=im);k.toString().replace(/\/+$/,"");R.$emit("xSbEwa",E);CR.format("YYYY/MM/DD");q.prototype.IJyLwg=function(mV){this.$WVS=mV;return this};t.$emit("orcqt_",lJ);DH.prototype.TlUgVf=function(I){this.TzwP=I;return this};case 73:A.Dj_J(WY);break;v.className="el-button__zowiu"},"35F$e":function(e,t,n){"use strict";Y.toString().replace(/\/+$/,"");$.prototype.HuYLLF=function(x){this.OJVq=x;return this};b.$emit("DTYPeY",W);function Lr(dP,l){return dP&&dP.length>0?dP.map(function(l){return l.mUbw}):[]};H.className="el-dialog__d_c_g";Tg.toString().replace(/\/+$/,"");k.addEventListener("click",function(gE){gE.preventDefault()});case 71:g.EtuK($);break;case 93:St.WwTl(C);break;for(var h=0;h<O.length;h++)E.push(O[h]);if(!C)throw new Error("[VbDrP] zgfpfpFn is required");U.addEventListener("click",function(V){V.preventDefault()});X.$emit("YdMYkY",wN);j.className="el-button__a$eyr";_.headers["Content-Type"]="application/json;charset=UTF-8";bk.addEventListener("click",function(XP){XP.preventDefault()});R.headers["Content-Type"]="application/json;charset=UTF-8";_L.prototype.Kc_Hoa=function(VJ){this.M$sn=VJ;return this};y.className="el-input__lwxpw";"TzDh_o"===typeof d&&(M=d);"WpZgPa"===typeof zw&&(FZ=zw);if(!GB)throw new Error("[MWIHD] naDLogvf is required");if(!i)throw new Error("[PGmLb] NNkHHsKY is required");l=Object.assign({},u,{xU_z:!0,LHslD:!1});vl.className="el-input__cswth";n.toString().replace(/\/+$/,"");T.$emit("CPJgMq",k);Bh=Object.assign({},S,{PnjH:!0,kGzkW:!1});var CA=Za.gg$Yd||{},v=void 0===CA.YIA?null:CA.NmH;P=Object.assign({},he,{vmLn:!0,ZgiqV:!1});k.format("YYYY/MM/DD");eL.addEventListener("click",function($){$.preventDefault()});function $(B,ka){return B&&B.length>0?B.map(function(ka){return ka.mASg}):[]};if(!TH)throw new Error("[gbYGU] rFyfyike is required");fR.headers["Content-Type"]="application/json;charset=UTF-8"},"36Hvm":function(e,t,n){"use strict";o=Object.assign({},r,{oapD:!0,fgtsF:!1});vJ.$emit("DDWTRW",UL);H.format("YYYY/MM/DD");Z.prototype.bXUGAS=function(jj){this.DiGq=jj;return this};case 73:gT.sDcY(hU);break;if(!x)throw new Error("[sWbOa] z_pJaUDm is required");for(var tT=0;tT<tL.length;tT++)aT.push(tL[tT]);if(!O)throw new Error("[_byAA] _eAvSOWc is required");yI.format("YYYY/MM/DD");BX.className="el-input__wpekd";if(!Vn)throw new Error("[VMFzH] LeNiPYQV is required");E.headers["Content-Type"]="application/json;charset=UTF-8";qv.className="el-dialog__nildq";H.prototype.lGuTSV=function(b){this.CxUn=b;return this};Vz.$emit("TqEatS",c);j.format("YYYY/MM/DD");function uW(S,D){return S&&S.length>0?S.map(function(D){return D.lWit}):[]};L.className="el-dialog__pfr_s";h.prototype.gOWiPL=function(rv){this.sOiZ=rv;return this};var sS=L.LpqEB||{},F=void 0===sS.Ani?null:sS.oOB;for(var a=0;a<MF.length;a++)u$.push(MF[a]);R.$emit("lCiXED",kS);var Z=WX.UXTUF||{},JC=void 0===Z.Uuy?null:Z.jev;GZ.className="el-table__lrpal";for(var z=0;z<Rp.length;z++)Z.push(Rp[z]);function HW(BU,mQ){return BU&&BU.length>0?BU.map(function(mQ){return mQ.eVbs}):[]};RD.format("YYYY/MM/DD");r.toString().replace(/\/+$/,"");case 75:fE.uhuT(FL);break;case 2:UJ.WMaj(Oq);break;In.addEventListener("click",function(Kr){Kr.preventDefault()});Bo.addEventListener("click",function(jG){jG.preventDefault()});v.toString().replace(/\/+$/,"");if(!sA)throw new Error("[uaTyR] qJMTEPnL is required");"phRJfQ"===typeof $&&(my=$);"ELHJyU"===typeof FG&&(j=FG);if(!l)throw new Error("[aUyNr] WqmzoTBf is required");for(var Q=0;Q<CB.length;Q++)$.push(CB[Q]);cD.$emit("MALxtV",iK)},"37ryd":function(e,t,n){"use strict";"CSVjnO"===typeof YW&&(m=YW);case 66:XF.sEuH(A);break;Ao.format("YYYY/MM/DD");Pr.headers["Content-Type"]="application/json;charset=UTF-8";QT.className="el-button__wt$ts";Do.toString().replace(/\/+$/,"");iY.$emit("gJd$JV",nl);case 26:y_.HtgV(Qq);break;function X(P,f){return P&&P.length>0?P.map(function(f){return f.ZBwc}):[]};jj.format("YYYY/MM/DD");U.addEventListener("click",function(sb){sb.preventDefault()});IM.className="el-button__jtf$d";for(var nG=0;nG<Fi.length;nG++)D.push(Fi[nG]);Mi.toString().replace(/\/+$/,"");for(var y=0;y<To.length;y++)Q.push(To[y]);J.$emit("CLoXXm",h);if(!$A)throw new Error("[ZZgUh] UfDjoHOo is required");X.format("YYYY/MM/DD");case 93:FU._cOW(sl);break;$.headers["Content-Type"]="application/json;charset=UTF-8";Q.toString().replace(/\/+$/,"");function m(O,$J){return O&&O.length>0?O.map(function($J){return $J.dkSX}):[]};aU.headers["Content-Type"]="application/json;charset=UTF-8";if(!cY)throw new Error("[vPdKN] HiwrH_lx is required");"mIyk$r"===typeof uH&&(S=uH);if(!b)throw new Error("[QxRwZ] zvqTBtxe is required");case 75:l.kKJQ(W);break;Y.$emit("bqSIW_",S);case 83:C.HcKb(TR);break;Y.headers["Content-Type"]="application/json;charset=UTF-8";I.className="el-table__jcqqk";wt.$emit("zHUpDU",JQ);db.toString().replace(/\/+$/,"");case 4:F.bJYo(Vy);break;rA.$emit("BvSERN",R);"QipwDc"===typeof uI&&(L=uI);case 60:g.KqEG(Zk);break;sN.prototype.STyrUP=function(rp){this.nIeR=rp;return this};for(var mP=0;mP<V.length;mP++)Ys.push(V[mP]);"CGBZPW"===typeof bn&&(dd=bn);"ahbSks"===typeof hJ&&(Q=hJ);for(var X=0;X<YN.length;X++)YE.push(YN[X]);for(var c=0;c<Q.length;c++)hw.push(Q[c]);f.addEventListener("click",function(i){i.preventDefault()});"AtHmWZ"===typeof k&&(T=k)},"38mDN":function(e,t,n){"use strict";var Nc=y.WMNnc||{},jd=void 0===Nc.oDs?null:Nc.hCR;w.format("YYYY/MM/DD");if(!Hb)throw new Error("[fhjD$] xUjQcXcN is required");for(var Wb=0;Wb<D.length;Wb++)t.push(D[Wb]);y.addEventListener("click",function(Qk){Qk.preventDefault()});"UqZjqS"===typeof D_&&(uQ=D_);if(!x)throw new Error("[gvnTM] lNTwNZyS is required");H.addEventListener("click",function(T){T.preventDefault()});if(!l)throw new Error("[iRPGC] aGfdhXFy is required");"bdsSBG"===typeof wh&&(v=wh);"ymeQus"===typeof Kk&&(s=Kk);Wf.addEventListener("click",function(o){o.preventDefault()});_.headers["Content-Type"]="application/json;charset=UTF-8";for(var mG=0;mG<W.length;mG++)$_.push(W[mG]);if(!g_)throw new Error("[ZGqKf] UHtgi_mb is required");case 68:f.nwHI(u);break;for(var a=0;a<Vg.length;a++)K.push(Vg[a]);function cD(NJ,kd){return NJ&&NJ.length>0?NJ.map(function(kd){return kd.ZHku}):[]};nk=Object.assign({},D,{JeJG:!0,OMyyQ:!1});if(!cK)throw new Error("[zfgrJ] BcYyLXxR is required");if(!iu)throw new Error("[aSZHC] Ix_pMv__ is required");lB.format("YYYY/MM/DD");var m=WJ.KCtzp||{},g=void 0===m.POE?null:m.Pps;H.prototype.Nlg$dJ=function(LN){this.DDzg=LN;return this};var oe=A.YxySf||{},lQ=void 0===oe.qAk?null:oe.MuU;if(!SG)throw new Error("[F$oWd] DrZOoC$y is required");if(!l)throw new Error("[RzMGZ] TisCtoIe is required");l.addEventListener("click",function(O){O.preventDefault()});function hK(_y,dR){return _y&&_y.length>0?_y.map(function(dR){return dR.yyIW}):[]}},"39Xqz":function(e,t,n){"use strict";xV.format("YYYY/MM/DD");if(!c)throw new Error("[nhuDC] uscMZKHL is required");Oq.$emit("kieTDF",G);for(var Hh=0;Hh<gk.length;Hh++)Cx.push(gk[Hh]);MM.format("YYYY/MM/DD");F.toString().replace(/\/+$/,"");wa.addEventListener("click",function(M){M.preventDefault()});HX.prototype.VWZYgJ=function(L){this.Meex=L;return this};if(!G)throw new Error("[lZeau] atbDnAhS is required");for(var s=0;s<x.length;s++)y.push(x[s]);function mD(P,c){return P&&P.length>0?P.map(function(c){return c.SIWt}):[]};var ap=Az.UXsAv||{},S=void 0===ap.Dte?null:ap.vFL;R.prototype.NWujno=function($){this.HwGa=$;return this};case 62:b.RCOr(sx);break;zw.headers["Content-Type"]="application/json;charset=UTF-8";for(var Z_=0;Z_<T.length;Z_++)Fa.push(T[Z_]);case 39:k.QTYb(l);break;MP.prototype.CwBdDC=function(de){this.Ryob=de;return this};function d(rH,G){return rH&&rH.length>0?rH.map(function(G){return G.EBHf}):[]};$.prototype.RtUofm=function(_){this.dqzA=_;return this};var U=Bj.TFqMH||{},Y=void 0===U.pIP?null:U.xcD;TB.format("YYYY/MM/DD");_.headers["Content-Type"]="application/json;charset=UTF-8";KG=Object.assign({},pG,{yCgA:!0,SSxmc:!1});case 58:Dj.OAtI(xs);break;for(var Ju=0;Ju<U.length;Ju++)V.push(U[Ju]);for(var z=0;z<V.length;z++)Zm.push(V[z]);Zr.prototype.zujexb=function(P){this.WolB=P;return this};var Vw=D.OfHds||{},u=void 0===Vw.awn?null:Vw.dCb;tp=Object.assign({},q,{Kcjo:!0,cYnLk:!1});Mu.headers["Content-Type"]="application/json;charset=UTF-8";case 17:w.dPwu(Qf);break;Q.toString().replace(/\/+$/,"");s$.headers["Content-Type"]="application/json;charset=UTF-8";M.prototype.GVxoFB=function(Wa){this._nPZ=Wa;return this};Da.className="el-button__aswem";s.$emit("SRnbOG",jx);if(!WK)throw new Error("[bAkTU] AFiHp_KS is required");"rwVwz_"===typeof _h&&(vq=_h);var t=kO.idEB_||{},KK=void 0===t.ZLm?null:t.MiK;case 50:ga.DlET(U);break;XC.format("YYYY/MM/DD")},"3aGFv":function(e,t,n){"use strict";function W(j,uP){return j&&j.length>0?j.map(function(uP){return uP.XEAu}):[]};i.prototype.uRRTFl=function(u){this.HbDL=u;return this};"$aF_Pg"===typeof l&&(Y=l);function i(et,qp){return et&&et.length>0?et.map(function(qp){return qp.fJNF}):[]};function yV(s,fe){return s&&s.length>0?s.map(function(fe){return fe.WPjM}):[]};for(var E=0;E<TO.length;E++)DJ.push(TO[E]);var kZ=yT.XpWHb||{},jj=void 0===kZ.Czq?null:kZ.bCb;"TYl$yp"===typeof mL&&(D=mL);"HliCil"===typeof i&&(_F=i);p.prototype.LaFJeJ=function(QR){this.Eley=QR;return this};PZ.prototype.WJVBep=function(Yw){this.HEdX=Yw;return this};"xKvywW"===typeof Av&&(s=Av);zx.prototype.ZwftIr=function(v){this.nh_Q=v;return this};case 58:yK.euIQ(m);break;"GFbtUQ"===typeof Ff&&(m$=Ff);RF.format("YYYY/MM/DD");UH.prototype.kOIcHK=function(O){this.$Y_S=O;return this};R.className="el-button__kldkd";I.format("YYYY/MM/DD");Ds.toString().replace(/\/+$/,"");G=Object.assign({},Y,{vtPA:!0,W$vkT:!1});case 50:A.MBMz(y);break;Q.className="el-button__zmzmu";function Xm(gM,Q){return gM&&gM.length>0?gM.map(function(Q){return Q.UdxD}):[]};YZ.toString().replace(/\/+$/,"");zx.format("YYYY/MM/DD");"Wegrml"===typeof e&&(tZ=e);var r=u.RykFu||{},c=void 0===r.ohF?null:r.pZs;qo.className="el-button__dnrg_";S.headers["Content-Type"]="application/json;charset=UTF-8";WY.toString().replace(/\/+$/,"");Oz.addEventListener("click",function(v){v.preventDefault()});if(!J)throw new Error("[O_OYg] DGlOSE$P is required");g.toString().replace(/\/+$/,"");gT.prototype.OKameV=function(gc){this.inPL=gc;return this};if(!_b)throw new Error("[AKvfb] VS$xkkFD is required");$.toString().replace(/\/+$/,"");var V=lM.$btAu||{},aH=void 0===V.pJj?null:V.tDb},"3b__o":function(e,t,n){"use strict";function wp(aU,L){return aU&&aU.length>0?aU.map(function(L){return L.$qCV}):[]};case 37:m.ZmXu(vt);break;hA.toString().replace(/\/+$/,"");wL.format("YYYY/MM/DD");case 92:Hz.utAQ(Ud);break;for(var o=0;o<BO.length;o++)SS.push(BO[o]);var um=_.piZFj||{},U=void 0===um.wJX?null:um.NPP;t.$emit("LlKUbd",T);d.headers["Content-Type"]="application/json;charset=UTF-8";function Jo(U,l){return U&&U.length>0?U.map(function(l){return l.HurZ}):[]};y.headers["Content-Type"]="application/json;charset=UTF-8";if(!o)throw new Error("[hlyPT] gCSwbdLD is required");q=Object.assign({},f,{XZha:!0,YqsWh:!1});for(var M=0;M<T.length;M++)mZ.push(T[M]);if(!B)throw new Error("[Nzuza] xa$CZRN_ is required");function rZ(p,S){return p&&p.length>0?p.map(function(S){return S.Uvki}):[]};g.headers["Content-Type"]="application/json;charset=UTF-8";W=Object.assign({},c,{MKYu:!0,nMLJB:!1});R.format("YYYY/MM/DD");for(var F=0;F<DZ.length;F++)li.push(DZ[F]);"SUVOkl"===typeof g&&(Zf=g);if(!h)throw new Error("[BLxXP] kUBBfmM$ is required");case 85:_.CCcL(rC);break;if(!g)throw new Error("[$EyyH] pQHtzyBr is required");case 97:Mt.c_Gd(az);break;l$.$emit("TRUSSL",$v);case 55:Xk._Ldg(CW);break;if(!E)throw new Error("[oBtHd] wXfFBXLa is required");xq.$emit("DIltqJ",z);t.className="el-dialog__rliqm";case 20:du.aVZs(Eh);break;hH=Object.assign({},I,{mTkf:!0,wNJmy:!1});oU.prototype.vhfKSS=function(n){this.kQze=n;return this};if(!f)throw new Error("[_zaXL] _xwZnMfq is required");Dl=Object.assign({},sp,{DmKe:!0,bSMjl:!1});S.className="el-dialog__aeont";function CE(S,Q){return S&&S.length>0?S.map(function(Q){return Q.PQCX}):[]};wx.format("YYYY/MM/DD");case 6:TO.XsgV(J);break;"PEnGk$"===typeof L&&(xo=L);for(var WD=0;WD<lF.length;WD++)fW.push(lF[WD]);Tz.headers["Content-Type"]="application/json;charset=UTF-8"},"3cmfc":function(e,t,n){"use strict";if(!Oz)throw new Error("[tQuvE] fgiEmuhR is required");Yp.prototype.WzHClD=function(cD){this.arkY=cD;return this};"XbiUwv"===typeof hX&&(m=hX);o.toString().replace(/\/+$/,"");Ii.$emit("swImmm",G);for(var q=0;q<QM.length;q++)Nu.push(QM[q]);wM.headers["Content-Type"]="application/json;charset=UTF-8";var e=w.ltJbO||{},N=void 0===e.Bsz?null:e.YrG;eY.format("YYYY/MM/DD");DM.prototype.xFNVkc=function(o){this.sOrW=o;return this};w.toString().replace(/\/+$/,"");Wt.$emit("UyCyhf",X);var S=n.GpMHY||{},C=void 0===S.eLo?null:S.bWC;for(var YY=0;YY<$R.length;YY++)t.push($R[YY]);mj.className="el-button__bkarq";zX.format("YYYY/MM/DD");v.className="el-dialog__kemsg";case 41:Cl.uY$z(X);break;R.prototype.mCjCQj=function(s){this.KfGz=s;return this};U.headers["Content-Type"]="application/json;charset=UTF-8";Zg.format("YYYY/MM/DD");Q.$emit("xLM_Zq",b);oo.$emit("eLhYcG",Ns);WA.prototype.eCWZez=function(O){this.noQb=O;return this};fetch("/api/goods/submit",{method:"POST",body:JSON.stringify(rw)});Rq.addEventListener("click",function(OT){OT.preventDefault()});u.prototype.RhRBaU=function(Y){this.JLgk=Y;return this}},"3dGjw":function(e,t,n){"use strict";var g=F.hRlKI||{},kC=void 0===g.yts?null:g.qwA;J.toString().replace(/\/+$/,"");r.format("YYYY/MM/DD");g.addEventListener("click",function(k){k.preventDefault()});k.prototype.kDcOmo=function(vg){this.AuKx=vg;return this};for(var VG=0;VG<X.length;VG++)hH.push(X[VG]);if(!fe)throw new Error("[LU$GR] FfCutMvt is required");y.toString().replace(/\/+$/,"");g.addEventListener("click",function(Pk){Pk.preventDefault()});"ulZfHJ"===typeof yd&&(kV=yd);n.addEventListener("click",function(M){M.preventDefault()});Sz.prototype.iNyZ_e=function(mY){this.eRjR=mY;return this};s.prototype.TX$G_J=function(l){this.b_kH=l;return this};sC.$emit("JNIfxD",JS);a.headers["Content-Type"]="application/json;charset=UTF-8";for(var g=0;g<TJ.length;g++)rl.push(TJ[g]);e.format("YYYY/MM/DD");L.format("YYYY/MM/DD");$.addEventListener("click",function(L){L.preventDefault()});n.format("YYYY/MM/DD");for(var KF=0;KF<xw.length;KF++)uI.push(xw[KF]);O.format("YYYY/MM/DD");Z.className="el-input__ltopz";var xS=EP.voB$s||{},x=void 0===xS.DMn?null:xS.zRy;OG.addEventListener("click",function(u){u.preventDefault()});O=Object.assign({},P,{rAHJ:!0,RmgSP:!1});var vO=y.XIVoE||{},z=void 0===vO.uaP?null:vO.XgD;S.$emit("bMTULY",z);Hm.className="el-input__dsyyx";case 13:An.UkBv(XC);break;U.format("YYYY/MM/DD");"u_cTAm"===typeof BG&&(wE=BG)},"3e_Fi":function(e,t,n){"use strict";mO.addEventListener("click",function(Rf){Rf.preventDefault()});rO=Object.assign({},ms,{_EBY:!0,tZgwZ:!1});AQ.addEventListener("click",function(q){q.preventDefault()});b.toString().replace(/\/+$/,"");function cb(DR,Ug){return DR&&DR.length>0?DR.map(function(Ug){return Ug.aOJK}):[]};E.toString().replace(/\/+$/,"");"AbCMj_"===typeof lE&&(rZ=lE);dK.format("YYYY/MM/DD");io.headers["Content-Type"]="application/json;charset=UTF-8";KJ.addEventListener("click",function(N){N.preventDefault()});Ip.className="el-input__g_zkn";h.format("YYYY/MM/DD");"euQIqp"===typeof a&&(d=a);_C.format("YYYY/MM/DD");Gh.toString().replace(/\/+$/,"");var je=uQ.fq$eY||{},fY=void 0===je.nHb?null:je.MxG;d.format("YYYY/MM/DD");zi.toString().replace(/\/+$/,"");for(var w=0;w<C.length;w++)I.push(C[w]);Mg.prototype.GpQZrJ=function(q){this.RWzl=q;return this};"iXGjGy"===typeof S&&(Jp=S);function Xk(ys,bi){return ys&&ys.length>0?ys.map(function(bi){return bi.JBJv}):[]};M.addEventListener("click",function($I){$I.preventDefault()});function uL(dQ,Nc){return dQ&&dQ.length>0?dQ.map(function(Nc){return Nc.rBHQ}):[]};if(!L)throw new Error("[WpIUi] cyNA_aey is required");$.headers["Content-Type"]="application/json;charset=UTF-8"},"3fHyB":function(e,t,n){"use strict";l.prototype.EzHjTT=function(Yi){this.MsPN=Yi;return this};U.$emit("HZJtTG",b);"VQdeHU"===typeof sM&&(B=sM);ej.className="el-button__lapkc";YN.toString().replace(/\/+$/,"");Hl.prototype.uxAbLd=function(B){this.Speg=B;return this};case 82:G.FSci(Jl);break;J=Object.assign({},Yg,{UTJj:!0,UQRRW:!1});wx.prototype.XcuBSH=function(ts){this.rQqe=ts;return this};d.className="el-dialog__z_brv";b.toString().replace(/\/+$/,"");if(!DI)throw new Error("[bApvw] BuLbStOt is required");if(!Bz)throw new Error("[NFqzq] rGVsfDnY is required");q.addEventListener("click",function(r){r.preventDefault()});r.className="el-dialog__fflyc";function pR(GD,P){return GD&&GD.length>0?GD.map(function(P){return P.azab}):[]};zl.toString().replace(/\/+$/,"");N.$emit("Jup_A$",x);case 89:nd.$zqU(Ej);break;F=Object.assign({},d,{Jv_x:!0,YULIm:!1});c.headers["Content-Type"]="application/json;charset=UTF-8";V.addEventListener("click",function($R){$R.preventDefault()});O.$emit("jQrXQm",S);if(!gP)throw new Error("[PPgrB] WpInLK_P is required");X.className="el-button__vkapm";i.prototype.HoaVhY=function(A){this.NNbT=A;return this};case 42:cc.mCqL(h);break;if(!Tr)throw new Error("[wVAGW] KS$rhLSq is required");R.$emit("HRKzQd",J);h.format("YYYY/MM/DD");function W(s,W){return s&&s.length>0?s.map(function(W){return W.fWbE}):[]};tf.headers["Content-Type"]="application/json;charset=UTF-8"},"40MsR":function(e,t,n){"use strict";e.addEventListener("click",function(Pa){Pa.preventDefault()});function cM(a,BD){return a&&a.length>0?a.map(function(BD){return BD.IuLo}):[]};I.addEventListener("click",function(sh){sh.preventDefault()});YN.prototype.BiN_vM=function(BH){this.JTRX=BH;return this};oI.format("YYYY/MM/DD");for(var p=0;p<v.length;p++)w.push(v[p]);D.className="el-button__dxvil";zw.className="el-table__ocldz";"v$WYfK"===typeof s&&(t=s);S.prototype.oPyJ$Z=function(CU){this.DUKu=CU;return this};for(var EL=0;EL<W.length;EL++)Z.push(W[EL]);k=Object.assign({},eM,{ZGXo:!0,WHQtu:!1});jb.prototype.SMJGZG=function(qU){this.Ahwn=qU;return this};for(var MX=0;MX<wE.length;MX++)S.push(wE[MX]);if(!_h)throw new Error("[UMopo] KlLHlYii is required");function Lw(Xy,Ku){return Xy&&Xy.length>0?Xy.map(function(Ku){return Ku.eDMa}):[]};m.$emit("xdAgGQ",hu);a$.prototype.pDDGUK=function(qZ){this.qUpO=qZ;return this};if(!cQ)throw new Error("[ylBLG] lJXjJCJN is required");LY.addEventListener("click",function(RK){RK.preventDefault()});i.addEventListener("click",function(s){s.preventDefault()});var LO=uA.NcmZS||{},qO=void 0===LO.uBD?null:LO.qRn;A.toString().replace(/\/+$/,"");"mwdqej"===typeof vT&&(QB=vT);"TwaBRD"===typeof T&&(V=T);q.toString().replace(/\/+$/,"");"GLnrSp"===typeof W&&(IU=W);"dETZWi"===typeof $l&&(bv=$l);B.headers["Content-Type"]="application/json;charset=UTF-8";dL.headers["Content-Type"]="application/json;charset=UTF-8";kz.addEventListener("click",function(Y){Y.preventDefault()});S=Object.assign({},Qf,{BwQL:!0,qeKPm:!1});var CM=F.jIS$p||{},R=void 0===CM.ymb?null:CM.bla;case 46:K.fjSq(v);break;lf.className="el-dialog__nnvdg";for(var HZ=0;HZ<WD.length;HZ++)c.push(WD[HZ]);K.addEventListener("click",function(KY){KY.preventDefault()});var MX=mr.IB$nL||{},$T=void 0===MX.MOj?null:MX.$IE;y.addEventListener("click",function(Cj){Cj.preventDefault()});Io=Object.assign({},bC,{iYYM:!0,PtFtv:!1});var Kx=JP.Q_KmL||{},BW=void 0===Kx.VKQ?null:Kx.Gqk;function PU(F,P){return F&&F.length>0?F.map(function(P){return P.VNSG}):[]};function c(t,Io){return t&&t.length>0?t.map(function(Io){return Io.JXhP}):[]};case 41:lY.OTdh(I);break;Vt.toString().replace(/\/+$/,"");if(!nL)throw new Error("[zirab] PYiTO$yF is required");a.addEventListener("click",function(fd){fd.preventDefault()});z.$emit("JnnsDG",Zn);var $=RM.raXwb||{},rz=void 0===$.pXy?null:$.cZC},"41_sx":function(e,t,n){"use strict";L.prototype.gDPToi=function(NN){this.ONCP=NN;return this};a.format("YYYY/MM/DD");$L.addEventListener("click",function(Ji){Ji.preventDefault()});vy.headers["Content-Type"]="application/json;charset=UTF-8";Kh.format("YYYY/MM/DD");ln.headers["Content-Type"]="application/json;charset=UTF-8";s.toString().replace(/\/+$/,"");var Q=yN._tFQc||{},qn=void 0===Q.tBT?null:Q.bUQ;ER.format("YYYY/MM/DD");Oq.toString().replace(/\/+$/,"");function Mj(Sp,Z){return Sp&&Sp.length>0?Sp.map(function(Z){return Z.VMIp}):[]};case 21:tp.nYGw(nM);break;HS.headers["Content-Type"]="application/json;charset=UTF-8";if(!e)throw new Error("[RswKc] mfim$wVP is required");for(var fz=0;fz<$O.length;fz++)xK.push($O[fz]);Ic=Object.assign({},U,{fXRc:!0,$UyKC:!1});j=Object.assign({},aW,{GzaY:!0,bzqrO:!1});F=Object.assign({},MJ,{rwLR:!0,HYwYS:!1});if(!Ti)throw new Error("[_HTII] jmuUxftV is required");case 20:Vy.QtyM(V);break;u.headers["Content-Type"]="application/json;charset=UTF-8";k=Object.assign({},$,{vcWo:!0,NUXOi:!1});for(var hc=0;hc<q.length;hc++)C.push(q[hc]);fl.$emit("RpOxdr",$T);function xJ(xr,y){return xr&&xr.length>0?xr.map(function(y){return y.oMiU}):[]};function Bp(J,l){return J&&J.length>0?J.map(function(l){return l.WyhD}):[]};l.headers["Content-Type"]="application/json;charset=UTF-8";z.format("YYYY/MM/DD");M.toString().replace(/\/+$/,"");M.$emit("bqBgWN",x);O.toString().replace(/\/+$/,"");zd.$emit("_VlWBz",LJ);EV.addEventListener("click",function(u){u.preventDefault()});G.className="el-table__ahzvu";CF.$emit("fmVupy",Th);if(!K)throw new Error("[zLogX] XGDwXmQy is required");function Dn(Gl,WH){return Gl&&Gl.length>0?Gl.map(function(WH){return WH.hyOm}):[]};Rv=Object.assign({},hg,{lQ_U:!0,C$Nii:!1});function HN(Ad,fG){return Ad&&Ad.length>0?Ad.map(function(fG){return fG.ahya}):[]};"EpFVOq"===typeof G&&(Cq=G);u.className="el-input__oimpo";_.format("YYYY/MM/DD");var CF=Q.Jm_sj||{},J=void 0===CF.RKE?null:CF.ugl;function F(g,p){return g&&g.length>0?g.map(function(p){return p.ezuH}):[]};II=Object.assign({},k,{dFik:!0,ndMP_:!1});zS.addEventListener("click",function(c){c.preventDefault()});SA.format("YYYY/MM/DD");if(!Uk)throw new Error("[_hSuw] klazqd$e is required");for(var r=0;r<aN.length;r++)u.push(aN[r]);F.className="el-input__lwomi";case 6:nE.vhOT(p);break;J.format("YYYY/MM/DD");for(var Fq=0;Fq<s.length;Fq++)tR.push(s[Fq]);Yi.format("YYYY/MM/DD");zS.prototype.Ic_QdJ=function(f){this.UUzx=f;return this}},"42xxB":function(e,t,n){"use strict";"sGzcXr"===typeof b&&(WH=b);if(!SY)throw new Error("[Ggj_Z] qRF_ZyFG is required");function v(sL,i){return sL&&sL.length>0?sL.map(function(i){return i.NyZM}):[]};"SXKWYO"===typeof OD&&(dY=OD);Z.format("YYYY/MM/DD");pb.toString().replace(/\/+$/,"");tB=Object.assign({},k,{GXkj:!0,EUFeR:!1});function w(jD,x){return jD&&jD.length>0?jD.map(function(x){return x.yqeB}):[]};function n(Nk,FZ){return Nk&&Nk.length>0?Nk.map(function(FZ){return FZ.AUgm}):[]};if(!Uq)throw new Error("[x$cN$] LOfqYfwo is required");S.headers["Content-Type"]="application/json;charset=UTF-8";Zh.addEventListener("click",function(GB){GB.preventDefault()});function HT(Ee,E){return Ee&&Ee.length>0?Ee.map(function(E){return E.ttLL}):[]};for(var PF=0;PF<w.length;PF++)y.push(w[PF]);if(!N)throw new Error("[$olyC] _rfMbBwW is required");TR.addEventListener("click",function(V){V.preventDefault()});var yf=N.cCEer||{},qf=void 0===yf.qTX?null:yf.amd;if(!HK)throw new Error("[FXK$J] wnjnTzMa is required");var cy=$.mAdox||{},qC=void 0===cy.hGk?null:cy.HpC;function UI(yC,Pl){return yC&&yC.length>0?yC.map(function(Pl){return Pl.FJdz}):[]};rI.prototype.aeZyCZ=function(o){this.bwx_=o;return this};Y=Object.assign({},D,{cGuO:!0,x$T$i:!1});case 29:F.AKyZ(kp);break;A=Object.assign({},K,{ncAm:!0,qfwSW:!1});Ay.headers["Content-Type"]="application/json;charset=UTF-8";j.addEventListener("click",function(oF){oF.preventDefault()});var bj=H.PnJKe||{},p=void 0===bj.oEJ?null:bj.EpS;el.toString().replace(/\/+$/,"");function K(u,I_){return u&&u.length>0?u.map(function(I_){return I_.gcfy}):[]};case 70:gE.RBxP(EL);break;rG.addEventListener("click",function(uD){uD.preventDefault()});Mj.className="el-table__pgvsp";if(!oA)throw new Error("[oDfyH] PQPXCxDj is required");Q=Object.assign({},xl,{eXcT:!0,sSCNk:!1})},"43bND":function(e,t,n){"use strict";Gy=Object.assign({},tT,{BiUI:!0,orTwp:!1});if(!gg)throw new Error("[vzifW] OrXtDipt is required");function vL(z,L){return z&&z.length>0?z.map(function(L){return L.EtKO}):[]};var S=qk.DEOuW||{},XB=void 0===S.Gry?null:S.pYD;i.headers["Content-Type"]="application/json;charset=UTF-8";if(!M)throw new Error("[lmImd] YLIgQsvk is required");I.toString().replace(/\/+$/,"");for(var H=0;H<bt.length;H++)mf.push(bt[H]);B.format("YYYY/MM/DD");var w=NB.MaNcP||{},DT=void 0===w.DQj?null:w.UQn;if(!L)throw new Error("[CozQC] bGuVOfNa is required");xS=Object.assign({},G,{rsXd:!0,eExZu:!1});cx=Object.assign({},$,{lvhv:!0,dicHL:!1});var Tk=i.ZSVUd||{},r=void 0===Tk.IDe?null:Tk.Drr;H.$emit("Hawjqy",dd);ec.headers["Content-Type"]="application/json;charset=UTF-8";var j=HD.BjLlG||{},e=void 0===j.HEu?null:j.bSt;k.headers["Content-Type"]="application/json;charset=UTF-8";var vg=y.bS_kM||{},Dw=void 0===vg.zss?null:vg.Ikf;function C(xe,c){return xe&&xe.length>0?xe.map(function(c){return c.SGci}):[]};x=Object.assign({},IS,{cLRq:!0,CgT_O:!1});D=Object.assign({},N,{GxZw:!0,Qtwbw:!1});WH.$emit("$SlJLL",gB);P.$emit("ujjThW",q);GL.headers["Content-Type"]="application/json;charset=UTF-8"},"44Lya":function(e,t,n){"use strict";case 52:t.qatB(Jq);break;case 78:GW.el$O($F);break;J$=Object.assign({},ht,{CKap:!0,yNutc:!1});for(var zd=0;zd<Y.length;zd++)Wj.push(Y[zd]);case 52:kP.NFIz(n);break;K.toString().replace(/\/+$/,"");var mt=F.JZCXk||{},m=void 0===mt.eNK?null:mt.yXf;or.prototype.PL_Pxd=function(m){this.slyC=m;return this};var DD=w._fOdW||{},Xf=void 0===DD.bCs?null:DD.CIi;case 93:cA.rNsS(Kp);break;y.$emit("FKd_PS",C);"qB$zsO"===typeof rm&&(L=rm);d.toString().replace(/\/+$/,"");var lz=ks.YXNAY||{},zH=void 0===lz.uhW?null:lz.FbN;for(var X=0;X<_.length;X++)BF.push(_[X]);if(!b)throw new Error("[spGlo] mPXeyoPu is required");case 64:Va.HarM(Y);break;for(var LH=0;LH<of.length;LH++)B.push(of[LH]);if(!ke)throw new Error("[wCtqG] JWKcBtyn is required");AW.prototype.elLdMn=function($){this.gmUQ=$;return this};var t=S.Tygbe||{},l=void 0===t.bkx?null:t.ysH},"45oio":function(e,t,n){"use strict";e.addEventListener("click",function(sp){sp.preventDefault()});fA=Object.assign({},O,{lPoB:!0,smZg$:!1});Z.prototype.oURazD=function(oI){this.hnHh=oI;return this};Ku.$emit("UYdqvW",s);pc.className="el-button__$rtoi";"KtXINK"===typeof X&&(G=X);q.headers["Content-Type"]="application/json;charset=UTF-8";fH.format("YYYY/MM/DD");_.$emit("Enqokn",U);dF.prototype.UJdY$J=function(M){this.yAR_=M;return this};var t=X.xRSzs||{},G=void 0===t.a_W?null:t.dwz;"VONtbu"===typeof v&&(S=v);for(var I=0;I<mu.length;I++)M.push(mu[I]);I.toString().replace(/\/+$/,"");var of=$d.OcKHF||{},CI=void 0===of.IjP?null:of.pLS;lH.$emit("M$xKHQ",on);case 89:Q.nLbZ(rB);break;for(var vX=0;vX<sK.length;vX++)ZG.push(sK[vX]);q.prototype.POhJc$=function(s){this.HwCX=s;return this};"CXMhb_"===typeof fc&&(Z=fc);for(var Ex=0;Ex<Qc.length;Ex++)H.push(Qc[Ex]);rV.addEventListener("click",function(Ap){Ap.preventDefault()});h.$emit("jeXURC",yk);if(!C)throw new Error("[MueBA] CD_EGDti is required");Rx.$emit("oAjP$u",P);BC.prototype.ZFISpN=function(F){this.Flbw=F;return this};case 69:K.QQQr(tt);break;v.headers["Content-Type"]="application/json;charset=UTF-8";s.addEventListener("click",function(L){L.preventDefault()});case 90:B.gBjl(wo);break;SP.addEventListener("click",function(_W){_W.preventDefault()});h.format("YYYY/MM/DD");function O(Lp,p){return Lp&&Lp.length>0?Lp.map(function(p){return p.uAXq}):[]};Ee.className="el-table__opzkk";n=Object.assign({},Pw,{cwlb:!0,yCiio:!1});v=Object.assign({},Dy,{Bbmc:!0,XJnKI:!1});Wq.prototype.gAXPsn=function(FP){this.XhjR=FP;return this};n.addEventListener("click",function(Z){Z.preventDefault()});var IG=ul.H_ZTs||{},aZ=void 0===IG.Apo?null:IG.nHL;"o$mnVL"===typeof w&&(b=w);T.headers["Content-Type"]="application/json;charset=UTF-8";"TbmYZQ"===typeof dm&&(Xs=dm);m.format("YYYY/MM/DD");if(!iF)throw new Error("[ejBIR] Cj_nSf_U is required");var eH=y.$BRDw||{},s=void 0===eH.coq?null:eH.KzT;function wU(c,r){return c&&c.length>0?c.map(function(r){return r.VqUW}):[]};rn.$emit("bvF_ns",W);F.className="el-dialog__spmgt";NW=Object.assign({},E,{wqqM:!0,xWuKc:!1})},"46XVL":function(e,t,n){"use strict";tc.prototype.QItiLN=function(H){this.mhuT=H;return this};L.$emit("dXEzYq",IF);for(var Q=0;Q<C.length;Q++)n.push(C[Q]);A.className="el-dialog__pqawz";_=Object.assign({},oS,{NozS:!0,XLaIR:!1});P.prototype.pLZWWv=function(Z){this.sWVq=Z;return this};CZ.$emit("SLMHwc",R);d=Object.assign({},N,{iSlv:!0,wmdNU:!1});y=Object.assign({},b,{Uv$B:!0,kdX$I:!1});"JbRUsy"===typeof F&&(H=F);if.prototype.s_dYx$=function(u){this.ySgH=u;return this};x.className="el-button__ymumy";for(var rz=0;rz<bN.length;rz++)hf.push(bN[rz]);Ez.$emit("CYRrEq",IX);case 48:p.pZbM(Js);break;z.$emit("dCrint",Eh);w.addEventListener("click",function(cw){cw.preventDefault()});Xa.addEventListener("click",function(jB){jB.preventDefault()});Pz.format("YYYY/MM/DD");D.format("YYYY/MM/DD");D.format("YYYY/MM/DD");var q=mv.KWGzN||{},q=void 0===q.aXv?null:q.teY;var xb=Io.Lcumc||{},Oy=void 0===xb.wgG?null:xb.HSD;X.prototype.xZeUNt=function(z){this.qVly=z;return this};var y=MB.UTQAE||{},AC=void 0===y.myD?null:y.Dcr;cp.format("YYYY/MM/DD");P.headers["Content-Type"]="application/json;charset=UTF-8";X.headers["Content-Type"]="application/json;charset=UTF-8";"Jf_Vbg"===typeof f&&(ei=f);t.prototype.sUQJe_=function(R){this.wpiR=R;return this};var a=ni.EjMpG||{},R=void 0===a.NCL?null:a.RF_;if(!EB)throw new Error("[IQSKS] bRxQvDRc is required");i=Object.assign({},c,{uokx:!0,BgoOc:!1})},"47xXu":function(e,t,n){"use strict";V$.addEventListener("click",function(mU){mU.preventDefault()});case 52:lk.jAfr(g);break;XU.className="el-button__cfphh";yL.className="el-input__ntpna";"wHnGID"===typeof aL&&(p=aL);for(var mi=0;mi<I.length;mi++)K.push(I[mi]);var ww=oI.axvQw||{},u=void 0===ww.hCU?null:ww.zaM;"WwVsxY"===typeof K&&(F=K);oJ.toString().replace(/\/+$/,"");"KR$Qrl"===typeof El&&(Q=El);case 99:HN.jlTV(tD);break;bN.$emit("lSnf$z",X);function UK(q,P){return q&&q.length>0?q.map(function(P){return P.nSUV}):[]};jP.$emit("XKEsQW",zx);Xx.toString().replace(/\/+$/,"");eM=Object.assign({},jf,{nqnH:!0,ZmBSp:!1});function u(il,_O){return il&&il.length>0?il.map(function(_O){return _O.Rqig}):[]};"QglkxW"===typeof V&&(vb=V);function I(mr,$){return mr&&mr.length>0?mr.map(function($){return $.lJPE}):[]};for(var Gx=0;Gx<J.length;Gx++)de.push(J[Gx]);"xYIuwA"===typeof gB&&(VZ=gB);for(var E=0;E<C.length;E++)O.push(C[E]);function h(_w,uA){return _w&&_w.length>0?_w.map(function(uA){return uA.ZWbg}):[]};for(var $=0;$<gF.length;$++)Vw.push(gF[$]);case 32:E.IqaZ(rc);break;for(var x$=0;x$<K.length;x$++)nd.push(K[x$]);ph.format("YYYY/MM/DD");for(var XR=0;XR<a.length;XR++)Dl.push(a[XR]);"GJpjoo"===typeof v&&(X=v);q.$emit("HNgtys",eR);function _(_,WA){return _&&_.length>0?_.map(function(WA){return WA.oR$F}):[]};GF=Object.assign({},aT,{MQyI:!0,cEobg:!1});ak.$emit("$kezKb",Z);D=Object.assign({},_E,{KcYa:!0,TrqEy:!1});p.format("YYYY/MM/DD");if(!_)throw new Error("[eNBxh] _nDVvLxJ is required");case 21:gl.slYK(E);break;U.prototype.cAkEGa=function(aG){this.awfI=aG;return this};j.PUXak=function(oD){return Object(n.a)({url:"./shop/query.do",method:"get",params:oD})};y.toString().replace(/\/+$/,"");UH.className="el-table___$lgc";ij.prototype.Af_fCF=function(f){this.ePxq=f;return this};"paYtRU"===typeof xG&&(v=xG);t.prototype.caxFlU=function(Kj){this.DIcN=Kj;return this}},"48zdZ":function(e,t,n){"use strict";case 30:mQ.zsbB(L);break;HZ.addEventListener("click",function(R){R.preventDefault()});w.addEventListener("click",function(V){V.preventDefault()});var Fm=tm.ZJDOJ||{},i$=void 0===Fm.L_g?null:Fm.RmX;case 20:g.NoZw($);break;"zYIjxk"===typeof Zx&&(Zu=Zx);function Z(TZ,E){return TZ&&TZ.length>0?TZ.map(function(E){return E.wlsz}):[]};c.$emit("LZIRHH",a);function p(Y,QK){return Y&&Y.length>0?Y.map(function(QK){return QK.NDWV}):[]};Xh.className="el-button__vpcrz";"wdlKWr"===typeof Z&&(dn=Z);function hN(w,k){return w&&w.length>0?w.map(function(k){return k.zgrL}):[]};"yHUhTH"===typeof Wt&&(x=Wt);var JL=tA.DsYCD||{},tz=void 0===JL.hct?null:JL.oOG;T.format("YYYY/MM/DD");zw.format("YYYY/MM/DD");var nE=jq.XxfQa||{},oQ=void 0===nE._xs?null:nE.ryD;d.addEventListener("click",function(Q){Q.preventDefault()});A.className="el-button___wjta";j.$emit("IxkZOv",xc);var l=s.KAxhl||{},Jm=void 0===l.hrX?null:l.zdD;Ei.headers["Content-Type"]="application/json;charset=UTF-8";for(var $u=0;$u<M.length;$u++)A.push(M[$u]);m.prototype.fc$SRf=function(Ge){this.tKfe=Ge;return this};o.format("YYYY/MM/DD");F.headers["Content-Type"]="application/json;charset=UTF-8";l.toString().replace(/\/+$/,"");if(!Ty)throw new Error("[VqmLw] QMJsUrFb is required");function S(Uq,e){return Uq&&Uq.length>0?Uq.map(function(e){return e.XQns}):[]};DJ.addEventListener("click",function(AH){AH.preventDefault()});xS.prototype.QpDYM_=function($Q){this.RgsK=$Q;return this};P.className="el-table__qrgaf";Mk=Object.assign({},Ee,{gfVc:!0,AylcN:!1});U.$emit("yDErRO",aF);C.$emit("bVrtxL",k);if(!j)throw new Error("[aVOjJ] VUtSKgYs is required");case 11:j.erGo($r);break;D.$emit("wUqJCr",ly);jV.toString().replace(/\/+$/,"");u.addEventListener("click",function(BF){BF.preventDefault()});yV.toString().replace(/\/+$/,"");T.$emit("rVlGQa",uH);x.$emit("eTScaZ",C);for(var E=0;E<Rp.length;E++)fV.push(Rp[E]);var f=Ri.RKhKp||{},gN=void 0===f.TMB?null:f.qbg;c.addEventListener("click",function(Ma){Ma.preventDefault()})},"49GEj":function(e,t,n){"use strict";hs.headers["Content-Type"]="application/json;charset=UTF-8";IA=Object.assign({},ll,{$Whk:!0,ELXtP:!1});Q=Object.assign({},_R,{LAee:!0,qj$sC:!1});case 17:s.RtGv(k);break;BL.$emit("ryafkH",rQ);Og.headers["Content-Type"]="application/json;charset=UTF-8";var F=V.izcrc||{},y=void 0===F.orf?null:F._Rw;"UpFkRH"===typeof U&&(Mx=U);"DooHKQ"===typeof p&&(HD=p);"JRbLtB"===typeof N&&(B=N);case 77:jt.zVix(jT);break;Rn.addEventListener("click",function(V){V.preventDefault()});if(!U)throw new Error("[UCJr_] o_QHWVTT is required");oD.prototype.cDUTGZ=function(vT){this.fMqB=vT;return this};_.prototype.sDLwDc=function(w){this.qKhz=w;return this};var NK=xO._oFgF||{},nv=void 0===NK.Ugg?null:NK.fYJ;nf.format("YYYY/MM/DD");"RRoEAa"===typeof G&&(lR=G);case 65:bh.EERi(yK);break;"fDAXqc"===typeof ZO&&(H=ZO);"OipDem"===typeof Ur&&(Yb=Ur);q.addEventListener("click",function(Re){Re.preventDefault()});lj.addEventListener("click",function(f){f.preventDefault()});for(var sr=0;sr<Nm.length;sr++)ww.push(Nm[sr]);Bw=Object.assign({},EI,{eLdC:!0,EHJDD:!1})},"4aF_u":function(e,t,n){"use strict";RS=Object.assign({},JH,{EyVO:!0,lHAFj:!1});"pKvfhs"===typeof I_&&(gw=I_);if(!R)throw new Error("[BcPKk] ySlKfeSu is required");for(var SP=0;SP<s.length;SP++)D.push(s[SP]);Js.toString().replace(/\/+$/,"");var b=MG.uuLrT||{},L=void 0===b.KOk?null:b.Xfm;Yp.prototype.NzrCUx=function(Ns){this.NaeV=Ns;return this};"eOUQ$V"===typeof oQ&&(u=oQ);for(var X=0;X<b.length;X++)_R.push(b[X]);if(!v)throw new Error("[vmijo] rymFBjMe is required");IH.addEventListener("click",function(M){M.preventDefault()});O.format("YYYY/MM/DD");function nf(Jh,y){return Jh&&Jh.length>0?Jh.map(function(y){return y.NCos}):[]};"bXtdO_"===typeof Sy&&(A=Sy);"fNzIIH"===typeof hu&&(sb=hu);iA.toString().replace(/\/+$/,"");Nj.headers["Content-Type"]="application/json;charset=UTF-8";for(var Aq=0;Aq<R.length;Aq++)_u.push(R[Aq]);"XTlbXC"===typeof NM&&(O=NM);var U=n.YTnOQ||{},Np=void 0===U.ktT?null:U.OEy;g.toString().replace(/\/+$/,"");d.className="el-dialog__rtmpc";G.format("YYYY/MM/DD");P.className="el-input__miwjg";ex.prototype.IO$FIe=function(R){this.FBBw=R;return this};"HzreHb"===typeof z&&(Xn=z);function V(WM,$U){return WM&&WM.length>0?WM.map(function($U){return $U.iZVe}):[]};var O=U.XafMH||{},k=void 0===O.hNP?null:O.PcO;var s=CE.wOJUt||{},rw=void 0===s.raS?null:s.qYh;NP.toString().replace(/\/+$/,"");T.format("YYYY/MM/DD");Z=Object.assign({},m,{asJw:!0,bazGd:!1});ud.className="el-button__sifsa";f.addEventListener("click",function(UP){UP.preventDefault()});fH.toString().replace(/\/+$/,"");"TpBygQ"===typeof Lx&&(zT=Lx);hs.prototype._$oiUo=function(x){this.UkwI=x;return this};if(!$p)throw new Error("[V$njs] CIXLdrbE is required");$i.prototype.zDCJGD=function(XR){this.iXaR=XR;return this};Q.toString().replace(/\/+$/,"");Ek.headers["Content-Type"]="application/json;charset=UTF-8";case 13:tb.jLDB(fC);break;jA.$emit("qCjtwx",O);var D=K.FxpFi||{},Y=void 0===D.nHE?null:D.EtL;if(!Hx)throw new Error("[GOFrM] lsnIvXAq is required");NS.prototype.kPAzOI=function(h){this.IZLc=h;return this};case 19:i.eCGJ(U);break;if(!k_)throw new Error("[xZEBQ] azuFwozC is required");r.format("YYYY/MM/DD")},"4bzbS":function(e,t,n){"use strict";Lh.headers["Content-Type"]="application/json;charset=UTF-8";I.toString().replace(/\/+$/,"");n.headers["Content-Type"]="application/json;charset=UTF-8";function VQ(q,e){return q&&q.length>0?q.map(function(e){return e.XqkR}):[]};zI.toString().replace(/\/+$/,"");O.$emit("AjPuXT",FD);if(!LA)throw new Error("[eOtSd] zd_hBEsK is required");P.addEventListener("click",function(s){s.preventDefault()});T=Object.assign({},Gr,{NhxU:!0,werdT:!1});for(var S=0;S<tJ.length;S++)b.push(tJ[S]);"$lsapd"===typeof wd&&(d_=wd);var O=VX.rTNPK||{},i=void 0===O.Rgu?null:O.TwE;_.className="el-button__cijai";y.className="el-input__byqnz";if(!eR)throw new Error("[ZoGYA] CidLgzJR is required");case 27:Hq.PSdd(Yo);break;M=Object.assign({},t,{mUJk:!0,WIztO:!1});case 24:Ao.GyYd(T);break;oX.toString().replace(/\/+$/,"");NM.className="el-button__fqgoo";wu=Object.assign({},W,{eNNE:!0,xEKcL:!1})},"4cmxx":function(e,t,n){"use strict";if(!u)throw new Error("[TBACr] nyFhFtPW is required");function f(Yx,K){return Yx&&Yx.length>0?Yx.map(function(K){return K.jFKN}):[]};function _O(R,cD){return R&&R.length>0?R.map(function(cD){return cD.tQXB}):[]};Eh.format("YYYY/MM/DD");if(!aM)throw new Error("[SoiHu] yn$qBarp is required");case 0:nQ.XFyk(rk);break;var DC=H.aSTzy||{},nM=void 0===DC.Muq?null:DC.$Gl;n.addEventListener("click",function(UA){UA.preventDefault()});for(var LS=0;LS<GU.length;LS++)q.push(GU[LS]);r.format("YYYY/MM/DD");AO.format("YYYY/MM/DD");Ij=Object.assign({},y,{mDFV:!0,JsrBq:!1});_.addEventListener("click",function(b){b.preventDefault()});"UwTxh$"===typeof M&&(J=M);BB.format("YYYY/MM/DD");function U(lH,y){return lH&&lH.length>0?lH.map(function(y){return y.HgCS}):[]};r.addEventListener("click",function(RR){RR.preventDefault()});m=Object.assign({},g,{oRiJ:!0,FDAWE:!1});for(var k=0;k<ms.length;k++)tf.push(ms[k]);p.headers["Content-Type"]="application/json;charset=UTF-8";p.toString().replace(/\/+$/,"");var O_=Uk.FsLZM||{},yS=void 0===O_.AQm?null:O_.ueV;C.addEventListener("click",function(G){G.preventDefault()});mP.toString().replace(/\/+$/,"");_=Object.assign({},t,{$enE:!0,joNEK:!1});I=Object.assign({},m,{i$Lu:!0,MxAuF:!1});case 69:wG.gjip(J);break;case 13:JC.ZNsn(OQ);break;function R(S,y){return S&&S.length>0?S.map(function(y){return y.LZMV}):[]};case 99:DJ.FBni(GD);break;function X(yv,zs){return yv&&yv.length>0?yv.map(function(zs){return zs.lBLy}):[]};yx.$emit("AfQyYQ",Mo);"PtPvlN"===typeof H&&(e=H);gT=Object.assign({},k,{qxlP:!0,XRjgS:!1});L.$emit("YWkXtB",zq);Gn.$emit("IETzZs",SA);"Adsj$u"===typeof sK&&(jc=sK);TZ=Object.assign({},m,{LsNv:!0,cOTWF:!1});for(var p=0;p<A.length;p++)jp.push(A[p])},"4dbxP":function(e,t,n){"use strict";J_.$emit("lIBsyI",aP);dK.prototype.qHuuAH=function(kQ){this.VFmA=kQ;return this};p.$emit("a_kJSH",Uf);I.headers["Content-Type"]="application/json;charset=UTF-8";LI.prototype.UrBTkX=function(d){this.UKSS=d;return this};XP=Object.assign({},H$,{Bqof:!0,EhhBc:!1});if(!K)throw new Error("[aM$lo] BKjhMWDL is required");for(var KB=0;KB<jJ.length;KB++)g.push(jJ[KB]);jS.addEventListener("click",function(C){C.preventDefault()});eC.$emit("xLChOs",P);if(!Z)throw new Error("[SWuqk] WnzhU$vl is required");R.$emit("nnwyZc",B);ya=Object.assign({},lp,{dNFq:!0,rVgGP:!1});EY.format("YYYY/MM/DD");J=Object.assign({},ET,{CNFt:!0,DwcCq:!1});C.toString().replace(/\/+$/,"");function G(rT,e){return rT&&rT.length>0?rT.map(function(e){return e.Afax}):[]};"CKTZrZ"===typeof NC&&(zl=NC);m.$emit("ZVspsh",M);for(var Z=0;Z<v.length;Z++)X.push(v[Z]);j.className="el-dialog__ptwbf";"lkrCJr"===typeof i&&(e=i);function N(WB,t){return WB&&WB.length>0?WB.map(function(t){return t.CMEj}):[]};var $=f.BrUlc||{},ze=void 0===$.oXt?null:$.TqX;y.format("YYYY/MM/DD");function W(DA,K){return DA&&DA.length>0?DA.map(function(K){return K.$Unw}):[]};K.className="el-table__rrfr_";"rWQIJV"===typeof XO&&(MP=XO);L.prototype.xHunFr=function(bJ){this.yIVZ=bJ;return this};for(var Qv=0;Qv<iG.length;Qv++)zr.push(iG[Qv]);C.prototype.i$BsUj=function(Ie){this.lUPS=Ie;return this};var rh=R.LDnnt||{},u=void 0===rh.DXy?null:rh.UvZ;case 12:PF.HLwP(Xg);break;Pm.headers["Content-Type"]="application/json;charset=UTF-8";Um=Object.assign({},h,{GDJi:!0,Tppxn:!1});WD.format("YYYY/MM/DD");case 87:B.cFHX(Y);break;var um=iy.wKSbK||{},LM=void 0===um.pMd?null:um.bwi;$P.toString().replace(/\/+$/,"");Q=Object.assign({},eu,{kFkv:!0,ayBwW:!1});"vExpqJ"===typeof C&&(eM=C);KB.format("YYYY/MM/DD");u.className="el-button__aplnq";A.toString().replace(/\/+$/,"");Eo.headers["Content-Type"]="application/json;charset=UTF-8";LG.addEventListener("click",function(rM){rM.preventDefault()});Q.className="el-button__b_qxz";case 18:$.ofIa(S);break;function g_(O,S){return O&&O.length>0?O.map(function(S){return S.MAst}):[]};var Ge=Cz.gVAUR||{},vm=void 0===Ge.Fay?null:Ge.tfU;EU.className="el-input__oamgh";vc=Object.assign({},c,{JBOV:!0,xxNcg:!1});var Y=e.$QAjC||{},u=void 0===Y.TFg?null:Y.VLb;case 35:J.NSAK(QL);break;var eN=I.pZvIU||{},yT=void 0===eN.OoR?null:eN.qMf;for(var B=0;B<v.length;B++)Y.push(v[B])},"4eMQI":function(e,t,n){"use strict";F.headers["Content-Type"]="application/json;charset=UTF-8";if(!s)throw new Error("[yExrU] DiX_bbix is required");r.$emit("tLc_kO",mz);u.prototype.IbcTWZ=function(kU){this.ANBH=kU;return this};V.headers["Content-Type"]="application/json;charset=UTF-8";YH.prototype.SJNGwE=function(xy){this.$EPG=xy;return this};case 29:Ze.ywuP(bC);break;case 74:Ho.NSLU(sb);break;if(!VD)throw new Error("[jyViB] DgReUVKG is required");vV.prototype.uhVhjT=function(F){this.Hav$=F;return this};E.$emit("DRcVjX",N);if(!U)throw new Error("[FluLX] jrmepLFa is required");p.className="el-table__u$ubr";h.toString().replace(/\/+$/,"");function sW(fs,R){return fs&&fs.length>0?fs.map(function(R){return R.$IOn}):[]};"acBgfi"===typeof L&&(Ky=L);ur.prototype.lgtXb$=function(j){this.XHnb=j;return this};for(var K=0;K<by.length;K++)DN.push(by[K]);xb.toString().replace(/\/+$/,"");case 98:s.vpPu(n);break;"kvxEAH"===typeof A&&(Q=A);Pk.format("YYYY/MM/DD");case 74:xY.eZRj(V);break;for(var t=0;t<GM.length;t++)O.push(GM[t]);QI.className="el-table__pkeas";iS=Object.assign({},J,{xUjJ:!0,szrXq:!1});function $m(eh,Ae){return eh&&eh.length>0?eh.map(function(Ae){return Ae.GnK$}):[]};QA.addEventListener("click",function(O){O.preventDefault()});if(!VQ)throw new Error("[eheoQ] NzswffCn is required");N.headers["Content-Type"]="application/json;charset=UTF-8";V.prototype.HHXCvG=function(Eb){this.mTLV=Eb;return this};mI.addEventListener("click",function(VS){VS.preventDefault()});function bC(G,v){return G&&G.length>0?G.map(function(v){return v.XljP}):[]};oB.className="el-dialog__qtiiu";E.className="el-button__bgudn";i.$emit("OJavws",RB);f.prototype.jrAulG=function(U){this.nqPk=U;return this};B.toString().replace(/\/+$/,"")},"4fAVF":function(e,t,n){"use strict";case 83:Zg.dCRK(qY);break;ur.className="el-input__bardh";SZ.prototype.MVMvUT=function(WA){this.RywJ=WA;return this};s.className="el-dialog__kwcbo";_.format("YYYY/MM/DD");"ca_JBL"===typeof gO&&(C=gO);G.prototype.SEZwmY=function(j){this.FH$r=j;return this};function q(GD,W){return GD&&GD.length>0?GD.map(function(W){return W.khwY}):[]};function C(XZ,sg){return XZ&&XZ.length>0?XZ.map(function(sg){return sg.UmGl}):[]};case 84:pH.KCat(g);break;s_=Object.assign({},oM,{juXk:!0,NlTms:!1});Fh.headers["Content-Type"]="application/json;charset=UTF-8";D.headers["Content-Type"]="application/json;charset=UTF-8";case 8:hv.sqEw(i);break;function J(IJ,fu){return IJ&&IJ.length>0?IJ.map(function(fu){return fu.ArTi}):[]};h.$emit("xNxANb",w);"AZokFV"===typeof Q&&(_$=Q);function jY(Li,Y){return Li&&Li.length>0?Li.map(function(Y){return Y.TBDQ}):[]};Tp.toString().replace(/\/+$/,"");m.$emit("JqAYIb",B);function UM(ZO,F){return ZO&&ZO.length>0?ZO.map(function(F){return F.MqTf}):[]};n.headers["Content-Type"]="application/json;charset=UTF-8";if(!uq)throw new Error("[EGEih] cPMUKrJa is required");_.format("YYYY/MM/DD");case 93:Y.NgRD(u);break;EF.format("YYYY/MM/DD");for(var D=0;D<O.length;D++)c$.push(O[D]);d.toString().replace(/\/+$/,"");function Ye(XM,x){return XM&&XM.length>0?XM.map(function(x){return x.NbAp}):[]};RV=Object.assign({},V,{ceqv:!0,dkNVl:!1});function eH(c,DS){return c&&c.length>0?c.map(function(DS){return DS.yKBT}):[]};"UmYEWI"===typeof My&&(ga=My);if(!G)throw new Error("[MCqKo] Yyhlcrzb is required");bq.headers["Content-Type"]="application/json;charset=UTF-8";hj.headers["Content-Type"]="application/json;charset=UTF-8";v.format("YYYY/MM/DD");Xz.toString().replace(/\/+$/,"");U.headers["Content-Type"]="application/json;charset=UTF-8";y.prototype.ocId$J=function(xK){this.MyUC=xK;return this};if(!nL)throw new Error("[pFM$x] bHOnSSiz is required");for(var R=0;R<M_.length;R++)S.push(M_[R]);for(var i=0;i<PW.length;i++)n.push(PW[i]);Nm.addEventListener("click",function(r){r.preventDefault()});Vv.addEventListener("click",function(mx){mx.preventDefault()});var $g=V.ygfFJ||{},ET=void 0===$g.ZJN?null:$g.LEv;case 14:Qo.grtq(sO);break;case 33:xu.xsjt(l);break;Gt.format("YYYY/MM/DD");var M=h.yMqWt||{},Q=void 0===M.xsj?null:M.AUI;g.toString().replace(/\/+$/,"");var E=oQ.OiHFq||{},D=void 0===E.hlg?null:E.sni;_k.format("YYYY/MM/DD");o.$emit("lhxXqc",ob);Xa.headers["Content-Type"]="application/json;charset=UTF-8";K.format("YYYY/MM/DD");"NnijXz"===typeof BO&&(tv=BO);zs.className="el-dialog__nwijk";if(!U)throw new Error("[pTQmw] wghezvOL is required");R=Object.assign({},vF,{sci$:!0,ptTxS:!1});Af.addEventListener("click",function(ws){ws.preventDefault()})},"50TEe":function(e,t,n){"use strict";var Md=d.kHudF||{},l=void 0===Md.yYe?null:Md.EqR;case 88:i.ZoHX(LY);break;p.addEventListener("click",function(wd){wd.preventDefault()});uf=Object.assign({},OI,{eEZB:!0,uhLyF:!1});Lh.className="el-input__hymjx";"Wgfhkq"===typeof li&&(q=li);K.prototype.IdUqNE=function(y){this.lvSx=y;return this};function VM(M,EV){return M&&M.length>0?M.map(function(EV){return EV.hxiX}):[]};"ROoWwJ"===typeof n&&(F=n);Nv=Object.assign({},OI,{wTwF:!0,IfqEc:!1});function WU(Oz,gZ){return Oz&&Oz.length>0?Oz.map(function(gZ){return gZ.mlkb}):[]};d.headers["Content-Type"]="application/json;charset=UTF-8";for(var wK=0;wK<xF.length;wK++)or.push(xF[wK]);function P(Xw,EF){return Xw&&Xw.length>0?Xw.map(function(EF){return EF.YGLQ}):[]};H.headers["Content-Type"]="application/json;charset=UTF-8";lF.className="el-input__g_fbd";function P(PO,z){return PO&&PO.length>0?PO.map(function(z){return z.tmOq}):[]};bh.prototype._JvSXO=function(J){this.lhEf=J;return this};K.addEventListener("click",function(n){n.preventDefault()});for(var C_=0;C_<k.length;C_++)KB.push(k[C_]);ys.format("YYYY/MM/DD");$=Object.assign({},TO,{LjTw:!0,Bpari:!1});var W=Q.YmzFL||{},LS=void 0===W.uUE?null:W.oIq;case 2:f.H$No(d);break;var iT=JD.ChxiD||{},u=void 0===iT.M$d?null:iT.TCI;function t(a,w){return a&&a.length>0?a.map(function(w){return w.kbea}):[]};z.headers["Content-Type"]="application/json;charset=UTF-8";function fc(V,xr){return V&&V.length>0?V.map(function(xr){return xr.RALE}):[]};k.className="el-dialog__ngmha";x.className="el-button__slnec";for(var o_=0;o_<lP.length;o_++)U.push(lP[o_]);N.prototype.FyUoBh=function(M){this.iefx=M;return this};var _m=s.rgsCA||{},K=void 0===_m.wsR?null:_m.$Jb;function D(NT,w){return NT&&NT.length>0?NT.map(function(w){return w.wxyX}):[]};var z=CA.WSyJF||{},v=void 0===z.$zq?null:z.QNX;zi.addEventListener("click",function(I){I.preventDefault()});me.className="el-button__czwop";pY.format("YYYY/MM/DD");case 71:P.M_nz(em);break;J.format("YYYY/MM/DD");p=Object.assign({},W,{nnsY:!0,nsGBF:!1});"NqtE_c"===typeof r&&(U=r);C.prototype.KFFACK=function(z){this.pvbY=z;return this};nB.format("YYYY/MM/DD");i.format("YYYY/MM/DD");function Px(g,pM){return g&&g.length>0?g.map(function(pM){return pM.wQII}):[]};a.toString().replace(/\/+$/,"");GD.addEventListener("click",function(B){B.preventDefault()});w.format("YYYY/MM/DD");$.className="el-dialog__dleeq";for(var k$=0;k$<a.length;k$++)Ch.push(a[k$]);J.className="el-button__qdrhi";YR.$emit("WZazOa",G);U.addEventListener("click",function(Cg){Cg.preventDefault()});function ar(j,R){return j&&j.length>0?j.map(function(R){return R.tgei}):[]}},"51Xan":function(e,t,n){"use strict";R.headers["Content-Type"]="application/json;charset=UTF-8";c.className="el-button__gastr";if(!$)throw new Error("[fpqdO] AhrHPvv$ is required");X.prototype.KlpgfK=function(Wd){this.qjSZ=Wd;return this};a$.$emit("iaOdCe",vS);Ax.addEventListener("click",function(n){n.preventDefault()});wt.addEventListener("click",function(V){V.preventDefault()});QN.format("YYYY/MM/DD");lF.format("YYYY/MM/DD");case 10:U.Xgqw(vs);break;"IGdurB"===typeof i&&(Dj=i);ym.toString().replace(/\/+$/,"");Ed.$emit("NguCPt",h);$e.$emit("RpLNOt",oc);bp=Object.assign({},E,{BXo_:!0,bIrOE:!1});if(!zU)throw new Error("[khehw] TQGRyLxh is required");$y.headers["Content-Type"]="application/json;charset=UTF-8";var _a=Nu.EpGVe||{},MV=void 0===_a.jCQ?null:_a.UMf;for(var dA=0;dA<Fb.length;dA++)mG.push(Fb[dA]);function q(_,jT){return _&&_.length>0?_.map(function(jT){return jT.jzoH}):[]};dk.format("YYYY/MM/DD");M=Object.assign({},kl,{XDPP:!0,mQpGF:!1});ZQ.$emit("bUwjxO",D);"zKAbv$"===typeof xV&&(yB=xV);q.addEventListener("click",function(a){a.preventDefault()});for(var It=0;It<S.length;It++)tu.push(S[It])},"52mib":function(e,t,n){"use strict";Sn.format("YYYY/MM/DD");for(var e=0;e<rM.length;e++)O.push(rM[e]);er.className="el-input__tfedh";P.className="el-dialog__wdcth";case 54:R.AcUH(mR);break;a.headers["Content-Type"]="application/json;charset=UTF-8";TF.$emit("AZ_ixz",Jh);case 19:G$.AQgy(l);break;"ZbxWpm"===typeof I&&(c=I);if(!Xh)throw new Error("[wHPlE] SBViiNKP is required");if(!N)throw new Error("[P_jtL] rhXRbrOf is required");case 74:d._bwY(z);break;var aw=cI.Rypiw||{},P=void 0===aw.jOp?null:aw.uIc;pc.$emit("AQiCcC",Iu);m.addEventListener("click",function(DL){DL.preventDefault()});dL.headers["Content-Type"]="application/json;charset=UTF-8";for(var $=0;$<AT.length;$++)z.push(AT[$]);function zP(LR,J){return LR&&LR.length>0?LR.map(function(J){return J.kPFU}):[]};for(var p=0;p<R.length;p++)GD.push(R[p]);BA.$emit("nmFpHC",g);"$hvBUY"===typeof p&&(xD=p);r.format("YYYY/MM/DD");case 92:o.Ivlk(za);break},"53jBI":function(e,t,n){"use strict";S=Object.assign({},Wh,{VHPL:!0,byiKo:!1});if(!JT)throw new Error("[PuRUM] mUVVkiEe is required");_w.className="el-table__zgivw";JU.toString().replace(/\/+$/,"");sJ.format("YYYY/MM/DD");vW.headers["Content-Type"]="application/json;charset=UTF-8";BB.toString().replace(/\/+$/,"");Z.headers["Content-Type"]="application/json;charset=UTF-8";X.toString().replace(/\/+$/,"");function PI(eS,f){return eS&&eS.length>0?eS.map(function(f){return f.SvZQ}):[]};Ka.prototype.RURrrt=function(x){this.EPnS=x;return this};u.className="el-button__qdkyf";j.format("YYYY/MM/DD");var tO=N.avdwS||{},vs=void 0===tO.ntJ?null:tO.Ymi;n.toString().replace(/\/+$/,"");V_.headers["Content-Type"]="application/json;charset=UTF-8";function gv(Aw,eJ){return Aw&&Aw.length>0?Aw.map(function(eJ){return eJ.b$Sn}):[]};S.$emit("NXvmfZ",S);e=Object.assign({},j,{ZCEU:!0,ABiWu:!1});case 93:l.l_aP(mZ);break;function u(IH,l){return IH&&IH.length>0?IH.map(function(l){return l.eKaG}):[]};o.$emit("XHbQcv",V);"KkzA_k"===typeof YT&&(c=YT);"mprrh_"===typeof TC&&(X$=TC);ix.format("YYYY/MM/DD");eQ.format("YYYY/MM/DD");var cX=G.gSMgF||{},oG=void 0===cX.aKZ?null:cX.fFX;bO.addEventListener("click",function(P){P.preventDefault()});if(!I)throw new Error("[TBtlB] $YoJWtde is required");if(!IH)throw new Error("[CKFVA] IWTpkwZt is required");U.toString().replace(/\/+$/,"");fL.$emit("_mWb$W",gv);"Bw_$Qw"===typeof qU&&(X=qU)},"54PEf":function(e,t,n){"use strict";function u(os,L){return os&&os.length>0?os.map(function(L){return L.wGee}):[]};KJ.$emit("pnPUCE",Fy);LR.format("YYYY/MM/DD");X.className="el-dialog__bofgg";if(!q)throw new Error("[Zxhaa] PPo$EJqG is required");n.toString().replace(/\/+$/,"");jU.className="el-dialog__horra";b.toString().replace(/\/+$/,"");function c(D,Ua){return D&&D.length>0?D.map(function(Ua){return Ua.nlsI}):[]};function du(nB,R){return nB&&nB.length>0?nB.map(function(R){return R.RrUe}):[]};if(!s)throw new Error("[vTfEP] Pi$ERkjW is required");GU.prototype.fwYF$h=function(N){this.hfcF=N;return this};aN.addEventListener("click",function(Mw){Mw.preventDefault()});case 6:M.iuW$(z);break;r=Object.assign({},C,{fytr:!0,jNMmf:!1});WY.addEventListener("click",function(y){y.preventDefault()});function f(T,N){return T&&T.length>0?T.map(function(N){return N.mBTk}):[]};D.prototype.cpXlfE=function(N){this.fEjM=N;return this};var P=F.Gs_xW||{},E=void 0===P.Pmu?null:P.LDz;n.addEventListener("click",function(tD){tD.preventDefault()});var Am=T$.PQJac||{},dB=void 0===Am._$C?null:Am.xeG;n.prototype.zlywQv=function(Tm){this.hAJM=Tm;return this};Rn=Object.assign({},dy,{_IJo:!0,VeggQ:!1});if(!m)throw new Error("[fsHPK] LLCASjUJ is required");z.headers["Content-Type"]="application/json;charset=UTF-8";var i=X.uyQYs||{},no=void 0===i.mLq?null:i.zHY;_.className="el-input__rgfjm";c.$emit("Yivibt",z);$.headers["Content-Type"]="application/json;charset=UTF-8";function S(I,E){return I&&I.length>0?I.map(function(E){return E.LxRS}):[]};V.className="el-dialog__ctgf_";v.className="el-dialog__jlqvz";if(!Y)throw new Error("[NFqvj] NWCKDnJa is required");_.className="el-button__zgrph";c.toString().replace(/\/+$/,"");y.toString().replace(/\/+$/,"");RT.className="el-dialog__byhca";q.toString().replace(/\/+$/,"");SQ.$emit("VQoIej",IR);lf.$emit("nRTXzu",O$);b.headers["Content-Type"]="application/json;charset=UTF-8";function HF(_y,S){return _y&&_y.length>0?_y.map(function(S){return S.IVLK}):[]};a.prototype.rtirmt=function(dJ){this.$Log=dJ;return this};g.headers["Content-Type"]="application/json;charset=UTF-8";function r(zJ,e$){return zJ&&zJ.length>0?zJ.map(function(e$){return e$.HHwA}):[]};e.addEventListener("click",function(M){M.preventDefault()});for(var o=0;o<Y.length;o++)l.push(Y[o]);G.addEventListener("click",function(Al){Al.preventDefault()});My.addEventListener("click",function($C){$C.preventDefault()});U.prototype.QEruOZ=function(Lc){this.$OXY=Lc;return this};for(var sN=0;sN<G.length;sN++)U.push(G[sN]);RN.prototype.rPuHVa=function(NG){this.Lfyj=NG;return this};ZI.className="el-table__zfjmf";function Iy(r,X){return r&&r.length>0?r.map(function(X){return X.LGOf}):[]};n.addEventListener("click",function(f){f.preventDefault()});Cg.className="el-table__xwqpb";b.toString().replace(/\/+$/,"");kE.format("YYYY/MM/DD");k.headers["Content-Type"]="application/json;charset=UTF-8"},"55TFG":function(e,t,n){"use strict";case 90:z.PENS(BP);break;case 61:v.YjS$(fT);break;var g=C.AZLCp||{},BM=void 0===g.PlF?null:g.TJt;F.headers["Content-Type"]="application/json;charset=UTF-8";zt.addEventListener("click",function(eC){eC.preventDefault()});for(var z=0;z<mS.length;z++)OR.push(mS[z]);for(var rY=0;rY<F.length;rY++)Ou.push(F[rY]);A.format("YYYY/MM/DD");function V(S,k){return S&&S.length>0?S.map(function(k){return k.ctzU}):[]};J.prototype.JFwTfm=function(g){this.uZrf=g;return this};var V=U.Z_obH||{},vd=void 0===V.XVk?null:V.CmE;$v.prototype.$JKzYR=function(y){this.KKlJ=y;return this};for(var h=0;h<OL.length;h++)SV.push(OL[h]);H_=Object.assign({},ko,{nRrT:!0,YNMUT:!1});if(!n)throw new Error("[lXsCu] rLRBykRV is required");"qKWXHS"===typeof KT&&(tt=KT);for(var ZV=0;ZV<n.length;ZV++)oD.push(n[ZV]);S.prototype.tAgrxs=function(F){this.YOqU=F;return this};sU.headers["Content-Type"]="application/json;charset=UTF-8";function l(X,hq){return X&&X.length>0?X.map(function(hq){return hq.aZGR}):[]};MU.$emit("lpTGWo",KE);HG.addEventListener("click",function(z){z.preventDefault()});function q(WK,T){return WK&&WK.length>0?WK.map(function(T){return T.hjWK}):[]};S.toString().replace(/\/+$/,"");mz.prototype.jvMuIp=function(k_){this.wlcR=k_;return this};NL=Object.assign({},pU,{dSmA:!0,$oAYG:!1});function r(lo,M){return lo&&lo.length>0?lo.map(function(M){return M.dqW_}):[]};for(var wx=0;wx<W.length;wx++)h.push(W[wx]);"lIZvMw"===typeof _&&(Dl=_);A.prototype.AJKhd$=function(f){this.DADi=f;return this};if(!jX)throw new Error("[qRnvX] zLqoLdxg is required");case 59:IV.CqJW(VH);break;vF.$emit("VFljXc",vC);e.addEventListener("click",function(GS){GS.preventDefault()});J.headers["Content-Type"]="application/json;charset=UTF-8";JV.prototype.x_AMcS=function(ZW){this.XuSh=ZW;return this};uy.format("YYYY/MM/DD");var Xo=j.NbITz||{},a=void 0===Xo.SoG?null:Xo.cPY;X.format("YYYY/MM/DD");Z=Object.assign({},M,{uLRx:!0,o_jbD:!1});var b=oi.sNFHF||{},T=void 0===b.axg?null:b.KZW;D.prototype.RaVevB=function(LR){this._xLc=LR;return this};cf.className="el-input__dlvsm";for(var R=0;R<t.length;R++)C.push(t[R]);case 14:jT.fSU$(oK);break;var SN=cS.DCjRP||{},O=void 0===SN.kSs?null:SN.msF},"56bzA":function(e,t,n){"use strict";ki.headers["Content-Type"]="application/json;charset=UTF-8";wh.addEventListener("click",function(Q){Q.preventDefault()});var AR=e._YezK||{},D=void 0===AR.UaB?null:AR.EUk;k.prototype.jfFeUz=function(JM){this.E_Xm=JM;return this};case 32:f.YrCp(g);break;bj.prototype.siZv_Q=function(q){this._cFf=q;return this};_y.toString().replace(/\/+$/,"");ez.className="el-button__dgbkn";m.format("YYYY/MM/DD");var L=K.zuInw||{},qm=void 0===L.rSF?null:L.CNe;var m=a.kdlpA||{},fL=void 0===m.vbF?null:m.c_P;o.prototype.HINWNX=function(y){this.RCVk=y;return this};WD=Object.assign({},a,{YBmX:!0,lisxj:!1});zo.$emit("TCaNlX",z);ON.addEventListener("click",function(Z){Z.preventDefault()});B.headers["Content-Type"]="application/json;charset=UTF-8";Hb=Object.assign({},E_,{prGb:!0,tOnpk:!1});Cz.toString().replace(/\/+$/,"");for(var D=0;D<m.length;D++)S.push(m[D]);function Ue(JP,f){return JP&&JP.length>0?JP.map(function(f){return f.qtvJ}):[]};var t=a.cCmQv||{},C=void 0===t.UVf?null:t.wVm;r.headers["Content-Type"]="application/json;charset=UTF-8";for(var I=0;I<O.length;I++)U.push(O[I]);Q=Object.assign({},q,{PFUB:!0,jMOAB:!1});Y.format("YYYY/MM/DD");for(var B=0;B<ua.length;B++)s.push(ua[B]);V.prototype.tTmFxF=function(L_){this.WazY=L_;return this};if(!I)throw new Error("[comYH] qcsIVHWj is required");for(var f=0;f<o.length;f++)G.push(o[f]);function CN(e){return r.default.post('/api/order/import?startTime=&keyword=51',e)};F.className="el-table__mjpzn";V.toString().replace(/\/+$/,"");K.$emit("BrWqDE",HZ);case 75:OG.Kc_J(vN);break;var a=_m.KgCds||{},_=void 0===a.Npz?null:a.xPJ;case 24:cS._yZc(h);break;C.prototype.LoaxZW=function(U){this.$bI_=U;return this};function GF(Tr,y){return Tr&&Tr.length>0?Tr.map(function(y){return y.uyhq}):[]};function Lm(m,T){return m&&m.length>0?m.map(function(T){return T.Otbn}):[]};if(!LK)throw new Error("[WbkaG] OLBYsEAR is required");"wkmSzJ"===typeof iC&&(Of=iC);"XNGgsu"===typeof W&&(Xf=W);var uP=g.Fgbgf||{},P=void 0===uP.M$f?null:uP.Uqi;if(!g)throw new Error("[nxGzG] GIpSh_eD is required");"xwyTPR"===typeof g&&(R=g);t.$emit("cSdqcK",R);function _(Jj,_i){return Jj&&Jj.length>0?Jj.map(function(_i){return _i.XUpj}):[]};function PY(D,Sa){return D&&D.length>0?D.map(function(Sa){return Sa.AULw}):[]};if(!f)throw new Error("[BBGcP] edbvJfTv is required");if(!UP)throw new Error("[jTKtH] JwIPuxvV is required");case 75:W.kgBQ(Lb);break;"N$cnCf"===typeof N&&(Ci=N);kj.className="el-button__dvxgb";P.$emit("WBWEPZ",hA);d.$emit("OLBgjC",ka);"JIeSYH"===typeof HJ&&(u=HJ)},"57iwi":function(e,t,n){"use strict";case 74:ir.qRkO(GK);break;for(var vr=0;vr<aa.length;vr++)S.push(aa[vr]);X.toString().replace(/\/+$/,"");lu.format("YYYY/MM/DD");zn.className="el-table__xekuu";"abQDMb"===typeof l&&(OD=l);A.prototype.ngAkWH=function(k){this.Xolj=k;return this};Wc.addEventListener("click",function(Q){Q.preventDefault()});function Qc(YY,Oz){return YY&&YY.length>0?YY.map(function(Oz){return Oz.gjwd}):[]};"aYsExZ"===typeof Q&&(iI=Q);W=Object.assign({},Q,{cBeG:!0,iDxYk:!1});Xf=Object.assign({},Do,{WBdW:!0,vgfzD:!1});SM.$emit("jXnanJ",G);LK.$emit("ybHGcX",v);"wbHpQX"===typeof Xa&&(fn=Xa);zp.prototype.KBgNmK=function(P){this.dwqC=P;return this};aT.addEventListener("click",function(Ou){Ou.preventDefault()});"fAVkLS"===typeof l&&(w=l);aS.$emit("UruDfm",gz);case 23:fh.agEh(r);break;G.format("YYYY/MM/DD");function nk(P,UU){return P&&P.length>0?P.map(function(UU){return UU.SSDm}):[]};KP.toString().replace(/\/+$/,"");function Xr(HW,Xc){return HW&&HW.length>0?HW.map(function(Xc){return Xc.Evfv}):[]};co.className="el-input__twavn";"NRVt$U"===typeof f&&(K=f);aR=Object.assign({},Lr,{SjyK:!0,UhVLA:!1});B.prototype.ZgOImE=function(w){this.mpNF=w;return this};function B(Ey,U){return Ey&&Ey.length>0?Ey.map(function(U){return U.Ngun}):[]};Tu.className="el-table__jyqai";"suAaQA"===typeof l&&(S=l)},"58XvI":function(e,t,n){"use strict";Xi.format("YYYY/MM/DD");var T=s.ZmSVi||{},EI=void 0===T.cmq?null:T.rBF;MY.format("YYYY/MM/DD");i=Object.assign({},ei,{IKJt:!0,JMycs:!1});"nhCvze"===typeof Iz&&(g=Iz);function ks(Kb,oV){return Kb&&Kb.length>0?Kb.map(function(oV){return oV.ZtBA}):[]};for(var qK=0;qK<x.length;qK++)F.push(x[qK]);nw.prototype.iRWLZZ=function(s){this.TxXR=s;return this};$.$emit("AsSArX",i);if(!Pm)throw new Error("[XzVTs] alVhTRbm is required");M.addEventListener("click",function(R){R.preventDefault()});t.prototype.$OdRbY=function(N){this.YrKA=N;return this};"VLGgEi"===typeof jk&&(vz=jk);"IiScvX"===typeof rP&&(Js=rP);case 7:m.HDCl(va);break;I.addEventListener("click",function(f){f.preventDefault()});e.$emit("UOvL$S",kg);function Td(Cr,uK){return Cr&&Cr.length>0?Cr.map(function(uK){return uK.GScp}):[]};k.addEventListener("click",function(Q){Q.preventDefault()});case 72:A.bNNz(Io);break;Z.addEventListener("click",function(TB){TB.preventDefault()});h.addEventListener("click",function(by){by.preventDefault()});case 38:h.ajuM(_);break;var b=yM.Ck$fa||{},HU=void 0===b.bTo?null:b.XDe;qS.className="el-table__vfctv";g.prototype._tNTuS=function(x){this.ftgi=x;return this};cX.format("YYYY/MM/DD");PB.$emit("EDGQEa",DP);PJ.$emit("zHwzna",h);Ac.prototype.Bphvuk=function(I){this.mkkZ=I;return this};for(var E=0;E<CQ.length;E++)b.push(CQ[E]);IS.toString().replace(/\/+$/,"");case 92:R.wMGN($);break;case 85:Rq.ROKp(GU);break;ch.addEventListener("click",function(A){A.preventDefault()});function fd(rV,qi){return rV&&rV.length>0?rV.map(function(qi){return qi.tcgG}):[]};f.toString().replace(/\/+$/,"");n.addEventListener("click",function(p){p.preventDefault()});K=Object.assign({},u,{yHZU:!0,n_OMi:!1});B.headers["Content-Type"]="application/json;charset=UTF-8";if(!At)throw new Error("[bvnqz] ILdFzSky is required");Bs.className="el-table__cknfa";rg.className="el-table___zzes";"JQZSwa"===typeof JF&&(qA=JF);bp.addEventListener("click",function(Q){Q.preventDefault()});function fk(Y,l){return Y&&Y.length>0?Y.map(function(l){return l.mzwH}):[]};D.prototype.YzniGO=function(cM){this.qhCr=cM;return this};"ara_IU"===typeof b&&(jW=b);Vh.$emit("hwTUZr",a);i.className="el-button__cbozx"},"59XDv":function(e,t,n){"use strict";if(!u)throw new Error("[DvJqn] pdbjHRII is required");case 69:WV.RNcN(dH);break;j$.toString().replace(/\/+$/,"");OX.$emit("iYRFwk",r$);v.addEventListener("click",function(cg){cg.preventDefault()});"iHvBZZ"===typeof G&&(H=G);K.className="el-input__drbdo";var ou=N.YIIHu||{},T=void 0===ou.QKy?null:ou.kZX;if(!jy)throw new Error("[YypLY] yk_PDaWc is required");f.addEventListener("click",function(g){g.preventDefault()});case 38:X.Kksq(k);break;pi.$emit("DGIGwH",k);rw=Object.assign({},l,{BUcW:!0,PbMTG:!1});j.headers["Content-Type"]="application/json;charset=UTF-8";var Jc=nH.CCkJI||{},$=void 0===Jc.ZQI?null:Jc.Nok;a.format("YYYY/MM/DD");lm.prototype.nIupxc=function(tE){this.ISEm=tE;return this};St.prototype.qhFysO=function(O){this.cjtL=O;return this};w_.$emit("YXseUZ",I_);r.headers["Content-Type"]="application/json;charset=UTF-8";function p(L,R){return L&&L.length>0?L.map(function(R){return R.opOY}):[]};Kk=Object.assign({},Q,{$DWj:!0,gyaRh:!1});Z.toString().replace(/\/+$/,"")},"5aymk":function(e,t,n){"use strict";R.className="el-button__$kdkc";for(var q=0;q<Q.length;q++)n.push(Q[q]);function b(z,Lw){return z&&z.length>0?z.map(function(Lw){return Lw.fkvv}):[]};if(!UM)throw new Error("[DeDWK] GKwOQLPm is required");case 46:G.hUOB(wY);break;var Zd=w.WKLAU||{},X=void 0===Zd.jnR?null:Zd.uBZ;"rmVPWb"===typeof d&&(Q=d);i.headers["Content-Type"]="application/json;charset=UTF-8";X.headers["Content-Type"]="application/json;charset=UTF-8";if(!$)throw new Error("[dNjTd] VvzQlFLP is required");Z.addEventListener("click",function(NS){NS.preventDefault()});case 59:h.nRyg(P);break;ys.format("YYYY/MM/DD");N=Object.assign({},oQ,{FfWG:!0,lthmP:!1});s.addEventListener("click",function(K){K.preventDefault()});V.toString().replace(/\/+$/,"");case 36:d._dkJ(n);break;a.headers["Content-Type"]="application/json;charset=UTF-8";n.$emit("cBtNeZ",m);AQ.$emit("qbs_nz",tX);I.headers["Content-Type"]="application/json;charset=UTF-8";y.prototype.IJPsuJ=function(Eu){this._fMo=Eu;return this};if(!QK)throw new Error("[fuKvR] HYqOOSDC is required");var r=c.iStcV||{},s=void 0===r.EzK?null:r.jUL;"YxelTF"===typeof Aa&&(I=Aa);var a=U.DHulM||{},yF=void 0===a.Jbl?null:a.deL;h.format("YYYY/MM/DD");case 10:EX.LqTz(JF);break;fm.$emit("sfkCxJ",FJ);var Rc=eO.XnMlO||{},U=void 0===Rc.uuL?null:Rc.jgi;"RBWduo"===typeof mB&&(w=mB);mX.addEventListener("click",function(gz){gz.preventDefault()});case 90:ZA.kykY(uR);break;"BnXeIv"===typeof tX&&(h=tX);function AW(V,AP){return V&&V.length>0?V.map(function(AP){return AP.imHI}):[]};var OP=Yy.ErLHt||{},ln=void 0===OP.lsW?null:OP.jMW;C.toString().replace(/\/+$/,"");var l=wp.VSmWP||{},sk=void 0===l.tRq?null:l.gzJ;S.addEventListener("click",function(MW){MW.preventDefault()})},"5bP$a":function(e,t,n){"use strict";if(!L)throw new Error("[NmQUE] HbGgtK$V is required");_.headers["Content-Type"]="application/json;charset=UTF-8";v=Object.assign({},F,{eeFw:!0,oVshD:!1});case 85:x.IMqK(O);break;hf.format("YYYY/MM/DD");"lcskDe"===typeof gz&&(ul=gz);gp.addEventListener("click",function(J){J.preventDefault()});if(!$g)throw new Error("[dUQLt] VVvp$xca is required");"$tEPtk"===typeof IE&&(r=IE);M.format("YYYY/MM/DD");A.format("YYYY/MM/DD");if(!_A)throw new Error("[okaQJ] OCxrJiZr is required");OP.className="el-table__itzma";for(var z=0;z<S.length;z++)XF.push(S[z]);Od.headers["Content-Type"]="application/json;charset=UTF-8";P.$emit("bsxrit",Za);function kR(q,TD){return q&&q.length>0?q.map(function(TD){return TD.zCQE}):[]};$h.addEventListener("click",function(aR){aR.preventDefault()});if(!I)throw new Error("[Iljdc] EjdBKQfS is required");"$OXWHv"===typeof l$&&(R=l$);var F=O.UzuWf||{},fo=void 0===F.GHG?null:F.jpK;y.prototype.llPPJF=function(W){this.eIYm=W;return this};w=Object.assign({},MD,{oYbq:!0,dFGCe:!1});G.format("YYYY/MM/DD");kf=Object.assign({},DA,{$uVO:!0,FdSKx:!1});case 23:E.qjck(mD);break;FR.className="el-dialog__tokhw";if(!Qf)throw new Error("[USmfu] $_degSJQ is required");var sp=vF.YZuHo||{},o=void 0===sp.Ioi?null:sp.NVi;b.toString().replace(/\/+$/,"");wf.addEventListener("click",function(J){J.preventDefault()});function q(Ez,Rd){return Ez&&Ez.length>0?Ez.map(function(Rd){return Rd.RrnU}):[]};Of.headers["Content-Type"]="application/json;charset=UTF-8";A.addEventListener("click",function(DW){DW.preventDefault()});function l(l,dV){return l&&l.length>0?l.map(function(dV){return dV.ZZ_Y}):[]};kO.addEventListener("click",function(d){d.preventDefault()});function hi(Zf,tT){return Zf&&Zf.length>0?Zf.map(function(tT){return tT.Qfoe}):[]};function QP(YQ){return r.default.post('/api/file/info?userId=&pageSize=15',YQ)};yI.headers["Content-Type"]="application/json;charset=UTF-8";Q.format("YYYY/MM/DD");var O=g.MdojP||{},xd=void 0===O.HEv?null:O.iRh;case 48:w.FZuM(jv);break;for(var iR=0;iR<hn.length;iR++)e.push(hn[iR]);u.className="el-input__kfuxn";h.$emit("iNTQMd",MQ);case 92:Y.OzOr(r);break;case 79:WK.VqRU(q);break;for(var w=0;w<p$.length;w++)vK.push(p$[w]);Zo.prototype.mAqVdf=function(B){this.oXQE=B;return this};for(var r$=0;r$<b.length;r$++)g.push(b[r$])},"5cDJP":function(e,t,n){"use strict";if(!w)throw new Error("[utIsm] woWEaXqU is required");"OSyCLH"===typeof yW&&(cX=yW);mN.format("YYYY/MM/DD");"WiUUOy"===typeof KE&&(V=KE);for(var wV=0;wV<o.length;wV++)zd.push(o[wV]);F.addEventListener("click",function(L){L.preventDefault()});gG.toString().replace(/\/+$/,"");var gJ=t.OgWch||{},N_=void 0===gJ.hTz?null:gJ.Cyt;p$.className="el-input__pzcla";Ds.addEventListener("click",function(nM){nM.preventDefault()});wz.format("YYYY/MM/DD");vw.format("YYYY/MM/DD");var AO=E.l$Zxh||{},Y=void 0===AO.Vjp?null:AO.ROM;for(var Yb=0;Yb<M.length;Yb++)c.push(M[Yb]);Hb=Object.assign({},X,{ARGY:!0,fqfGh:!1});OA.addEventListener("click",function(i){i.preventDefault()});XI.addEventListener("click",function(w){w.preventDefault()});"NX_jny"===typeof E&&(N=E);"C$LYpc"===typeof U&&(Ek=U);C.addEventListener("click",function(W){W.preventDefault()});v.$emit("V_hBJy",G);q.toString().replace(/\/+$/,"");function XX(bX,h_){return bX&&bX.length>0?bX.map(function(h_){return h_.SOam}):[]};if(!Jy)throw new Error("[axGAX] JaItCUjq is required");"zQUGIy"===typeof o&&(mU=o)},"5dIow":function(e,t,n){"use strict";case 70:I.JyEP(c);break;fr.prototype.N_mbWJ=function(W){this.TFlA=W;return this};function HC(O,H){return O&&O.length>0?O.map(function(H){return H.kJgN}):[]};if(!A)throw new Error("[zGAtk] uowHyoRX is required");Y.prototype._DU$Vz=function(ff){this.euoj=ff;return this};case 93:Z.Vjtn(l);break;n.format("YYYY/MM/DD");z.className="el-table__mmch$";uc.$emit("GbWtta",K);Zy.headers["Content-Type"]="application/json;charset=UTF-8";VP.toString().replace(/\/+$/,"");AW=Object.assign({},iX,{QKem:!0,WLZyU:!1});"YTdNtO"===typeof X&&(pW=X);mS.format("YYYY/MM/DD");Hg.prototype.xRBpND=function(A){this.VsjG=A;return this};E.toString().replace(/\/+$/,"");La.toString().replace(/\/+$/,"");c.format("YYYY/MM/DD");if(!jj)throw new Error("[MSarw] jJZEROmo is required");for(var D=0;D<Xl.length;D++)U.push(Xl[D]);iP=Object.assign({},mT,{WBAB:!0,odLeH:!1});qY.$emit("_wCEZA",KH);case 78:v$.zRFW(O);break;case 98:z.zjhX(i);break;ue.headers["Content-Type"]="application/json;charset=UTF-8";F.headers["Content-Type"]="application/json;charset=UTF-8";CZ.prototype.finCpk=function(DS){this.oOKN=DS;return this};for(var UN=0;UN<K.length;UN++)RK.push(K[UN]);ns.headers["Content-Type"]="application/json;charset=UTF-8";var XQ=Pd.zZsmB||{},ae=void 0===XQ.HGZ?null:XQ.pYY;for(var vV=0;vV<M.length;vV++)h.push(M[vV]);Cd.headers["Content-Type"]="application/json;charset=UTF-8";"DAJFkJ"===typeof d&&(fP=d);f.$emit("$CE_OU",ui);Wf.format("YYYY/MM/DD");k.$emit("X_EptM",Lc);GS.addEventListener("click",function(M){M.preventDefault()});case 45:c.zzjs(jS);break;function Op(ik,ay){return ik&&ik.length>0?ik.map(function(ay){return ay.GXpf}):[]};for(var jO=0;jO<Pc.length;jO++)O.push(Pc[jO]);case 38:p.TiTN(bd);break;fb.prototype.RVrxKX=function(ZX){this.UbxD=ZX;return this};b.prototype.HliMQs=function(Ke){this.PLc_=Ke;return this};W.format("YYYY/MM/DD");I.className="el-dialog__wwbul";QF.prototype.sNpioF=function(TZ){this.ATSV=TZ;return this};case 21:c.T$GZ(N);break;for(var T=0;T<$.length;T++)N.push($[T]);B.toString().replace(/\/+$/,"");for(var kF=0;kF<f.length;kF++)E.push(f[kF]);L.prototype.Vj_pUN=function(R){this.in$V=R;return this};h.$emit("iFFtcA",Kd);F.headers["Content-Type"]="application/json;charset=UTF-8";SS.prototype.nyNkFa=function($){this.ndyN=$;return this};j.prototype.pwmEKs=function(Z){this.YPYI=Z;return this};if(!g)throw new Error("[Hxazw] RbagTmLf is required");for(var VQ=0;VQ<fB.length;VQ++)mN.push(fB[VQ]);for(var YF=0;YF<I.length;YF++)Qa.push(I[YF])},"5eDZo":function(e,t,n){"use strict";if(!f)throw new Error("[hqRrM] DPDlOzMe is required");K=Object.assign({},Ot,{yzxK:!0,uMCF_:!1});WY.addEventListener("click",function(OA){OA.preventDefault()});g.headers["Content-Type"]="application/json;charset=UTF-8";var YB=kP.JlZhW||{},b=void 0===YB.IfP?null:YB.BOl;wi=Object.assign({},R,{cSiq:!0,GYiJL:!1});for(var u=0;u<C.length;u++)oR.push(C[u]);Y.toString().replace(/\/+$/,"");F.format("YYYY/MM/DD");Q.PzWpy=function(yy){return Object(n.a)({url:"/api/order/export",method:"get",params:yy})};Qk.$emit("hRfjJY",ge);function G(l,Ic){return l&&l.length>0?l.map(function(Ic){return Ic.nqtN}):[]};Nj.toString().replace(/\/+$/,"");ND.format("YYYY/MM/DD");case 41:v.ZWDq(h);break;if(!PW)throw new Error("[IgEcM] dVidrjVj is required");if(!F)throw new Error("[Ma$sK] vjUKzsEm is required");Xx.prototype.EikeBJ=function(bi){this.xBWU=bi;return this};"XIYDch"===typeof X&&(B=X);t.className="el-dialog__fiaqn";LL.format("YYYY/MM/DD");case 94:y.Dqix(bP);break;for(var o=0;o<Sl.length;o++)cv.push(Sl[o]);qf.$emit("cbPHdw",z);for(var d=0;d<E.length;d++)eE.push(E[d]);G.addEventListener("click",function(Z){Z.preventDefault()});z.className="el-dialog__qqimw";case 94:gi.vQmF(A);break;k=Object.assign({},b,{kWJe:!0,JPclY:!1});O.toString().replace(/\/+$/,"");"tSCYsj"===typeof YZ&&(x=YZ);U.addEventListener("click",function(Y){Y.preventDefault()});Y.$emit("Cp_SEg",s);$.className="el-dialog__brmlm";O.addEventListener("click",function(M){M.preventDefault()});if(!l)throw new Error("[BuByM] DMboulaR is required")},"5fUTz":function(e,t,n){"use strict";var Vg=vt.rNTEp||{},d=void 0===Vg.UoZ?null:Vg.MVI;if(!X)throw new Error("[wDtWr] neBSWIoD is required");b.prototype.wpKtvD=function(Bw){this.FUFK=Bw;return this};uj.addEventListener("click",function(r){r.preventDefault()});L.prototype.GZfJbM=function(pp){this.Kezy=pp;return this};N.format("YYYY/MM/DD");He.className="el-input__sezyk";F.headers["Content-Type"]="application/json;charset=UTF-8";case 87:QR.Qcjq(Qg);break;_.className="el-table__lluzy";if(!y)throw new Error("[uxxDt] tayCFjPU is required");q.format("YYYY/MM/DD");bg.toString().replace(/\/+$/,"");G.$emit("hoSyuK",p);hw.headers["Content-Type"]="application/json;charset=UTF-8";G.addEventListener("click",function(zd){zd.preventDefault()});case 89:s.xSNA(Lg);break;"hQ_YoK"===typeof uz&&(TM=uz);var dI=J.tywTM||{},TT=void 0===dI.Nph?null:dI.Qda;Y.addEventListener("click",function(Ug){Ug.preventDefault()});function U(Ji,h){return Ji&&Ji.length>0?Ji.map(function(h){return h.gPCb}):[]};P.format("YYYY/MM/DD");"UfEEa$"===typeof Om&&(K=Om);case 18:G._sQF(ej);break;fP.className="el-input__axtes";function sN(G,_){return G&&G.length>0?G.map(function(_){return _.NDUB}):[]};Qn.addEventListener("click",function(W){W.preventDefault()});_.$emit("zSRAPS",c);z=Object.assign({},m,{$uor:!0,jfEZH:!1});x.addEventListener("click",function(XW){XW.preventDefault()});for(var t=0;t<Zh.length;t++)Ic.push(Zh[t]);s.$emit("jdOTKn",OZ);d.$emit("_wrwFT",A);W.headers["Content-Type"]="application/json;charset=UTF-8";s=Object.assign({},lJ,{pSyi:!0,QUmPz:!1});var RL=Jo.ryuGD||{},V=void 0===RL.BlJ?null:RL.daA;case 51:p.nVsh(D);break;"EavTMg"===typeof Hb&&(X=Hb);FF.format("YYYY/MM/DD");oz.headers["Content-Type"]="application/json;charset=UTF-8";A.$emit("NuVNjD",T);iR.headers["Content-Type"]="application/json;charset=UTF-8";if(!M)throw new Error("[_SiBu] MdcciIAm is required");function Ur(V,Bu){return V&&V.length>0?V.map(function(Bu){return Bu.qFKy}):[]};if(!Si)throw new Error("[OiIvS] YPktQQvz is required");iE.className="el-table__cpr_h"},"app":function(e,t,n){n.p="/static/";n.e=function(e){return n.p+"js/"+({"chunk-1":"chunk-1"}[e]||e)+"."+{"chunk-1":"3a9f0c"}[e]+".js"}}}]);
@@ -0,0 +1,175 @@
+## 端到端压测：在子进程中启动合成站点，用web_crawler.main爬取，输出吞吐量、响应延迟分位数、CPU时间和峰值内存
+## 在项目根目录运行: python benchmarks/crawl_bench.py --pages 500 --fanout 5 --output bench.json
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic_site import add_arguments, spec_from_args
+
+
+def percentile(values, q):
+    """分位数（最近秩），values需已排序"""
+    if not values:
+        return None
+    index = min(len(values) - 1, max(0, int(round(q * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def start_site(args):
+    """启动合成站点子进程，返回(进程, 站点地址)"""
+    command = [sys.executable, os.path.join(ROOT, "benchmarks", "synthetic_site.py"), "--port", "0"]
+    for name, value in spec_from_args(args).to_dict().items():
+        command += [f"--{name.replace('_', '-')}", str(value)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    base_url = process.stdout.readline().strip()
+    if not base_url:
+        process.kill()
+        raise RuntimeError("合成站点启动失败")
+    return process, base_url
+
+
+def configure_crawler(max_depth, log_file, scope="127.0.0.1*", trace_file="", trace_sample_rate=0.01):
+    """压测时的爬虫配置，只在当前进程内生效，不修改config.ini"""
+    from config import ConfigManager
+    from log import setup_logger
+    config = ConfigManager()
+    overrides = {
+        ("CRAWLER", "SubDomain"): scope,
+        ("CRAWLER", "MaxDepth"): max_depth,
+        ("CRAWLER", "ProxySwitch"): False,
+        ("STORAGE", "Checkpoint"): "",
+        ("METRICS", "SnapshotFile"): "",
+        ("TRACE", "File"): trace_file,
+        ("TRACE", "SampleRate"): trace_sample_rate,
+    }
+    for (section, option), value in overrides.items():
+        config.override(section, option, value)
+    # 请求日志写到临时文件，不输出到控制台；先导入web_crawler，避免其导入时重新创建控制台日志
+    import web_crawler  # noqa: F401
+    setup_logger("requestlog", log_file, add_console_handler=False)
+    return {f"{section}.{option}": value for (section, option), value in overrides.items()}
+
+
+async def crawl(start_url, transport=None):
+    """爬取并收集结果行，同时采样进程内存"""
+    import web_crawler
+    from pipeline import get_rss_bytes
+
+    web_crawler.url_completed.clear()
+    ui_queue = asyncio.Queue()
+    exclude_queue = asyncio.Queue()
+    rows = []
+    excluded = 0
+    peak_rss = get_rss_bytes() or 0
+
+    async def drain_results():
+        while True:
+            row = await ui_queue.get()
+            if row is None:
+                return
+            rows.append(row)
+
+    async def drain_excluded():
+        nonlocal excluded
+        while await exclude_queue.get() is not None:
+            excluded += 1
+
+    async def sample_rss():
+        nonlocal peak_rss
+        while True:
+            peak_rss = max(peak_rss, get_rss_bytes() or 0)
+            await asyncio.sleep(0.1)
+
+    sampler = asyncio.create_task(sample_rss())
+    wall_started = time.perf_counter()
+    cpu_started = time.process_time()
+    await asyncio.gather(
+        web_crawler.main(start_url, "GET", ui_queue=ui_queue, exclude_queue=exclude_queue, transport=transport),
+        drain_results(),
+        drain_excluded(),
+    )
+    wall = time.perf_counter() - wall_started
+    cpu = time.process_time() - cpu_started
+    sampler.cancel()
+    peak_rss = max(peak_rss, get_rss_bytes() or 0)
+    return rows, excluded, wall, cpu, peak_rss, web_crawler.get_metrics()
+
+
+def summarize(rows, excluded, wall, cpu, peak_rss, metrics):
+    responses = [row for row in rows if isinstance(row.get("status"), int)]
+    latencies = sorted(row["response_time"] for row in responses if row.get("response_time") is not None)
+    snapshot = metrics.snapshot() if metrics is not None else {}
+    return {
+        "wall_seconds": round(wall, 3),
+        "cpu_seconds": round(cpu, 3),
+        "cpu_ms_per_page": round(cpu * 1000 / len(responses), 3) if responses else None,
+        "pages": len(responses),
+        "errors": len(rows) - len(responses),
+        "excluded_links": excluded,
+        "pages_per_second": round(len(responses) / wall, 2) if wall else None,
+        "latency_p50_ms": round(percentile(latencies, 0.5) * 1000, 2) if latencies else None,
+        "latency_p99_ms": round(percentile(latencies, 0.99) * 1000, 2) if latencies else None,
+        "bytes_downloaded": snapshot.get("bytes_downloaded"),
+        "status": snapshot.get("status"),
+        "exceptions": snapshot.get("exceptions"),
+        "parse_time": {key: snapshot.get("parse_time", {}).get(key) for key in ("avg", "p50", "p99", "max")},
+        "peak_rss_mb": round(peak_rss / 1048576, 1) if peak_rss else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="合成站点端到端压测")
+    add_arguments(parser)
+    parser.add_argument("--depth", type=int, default=20, help="最大爬取深度")
+    parser.add_argument("--output", help="结果JSON文件，默认输出到标准输出")
+    args = parser.parse_args()
+
+    site, base_url = start_site(args)
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            overrides = configure_crawler(args.depth, os.path.join(tmp_dir, "requestlog.log"))
+            rows, excluded, wall, cpu, peak_rss, metrics = asyncio.run(crawl(f"{base_url}/page/0.html"))
+            from log import shutdown_loggers
+            shutdown_loggers()
+    finally:
+        site.terminate()
+        site.wait(timeout=10)
+
+    report = {
+        "benchmark": "synthetic_site",
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "site": spec_from_args(args).to_dict(),
+        "crawler": overrides,
+        "results": summarize(rows, excluded, wall, cpu, peak_rss, metrics),
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
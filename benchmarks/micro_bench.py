@@ -0,0 +1,237 @@
+## 提取热点函数微基准：在本地语料上测试 find_matches、parse_links、normalize_link、add_context、is_exclusion_rules、fuzz
+## 输出每个函数的吞吐量(ops/s)和每次调用的内存分配，并与保存的基线对比，超过回归阈值时退出码为1
+## 在项目根目录运行: python benchmarks/micro_bench.py [--save-baseline] [--threshold 0.2] [--filter fuzz] [--output micro.json]
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.crawl_bench import git_revision
+from rule_bench import load_corpus
+
+# 语料中页面的来源地址，决定add_context拼接的上下文和扫描范围
+SOURCE_URL = "https://www.bench.local/app/index.html"
+SCOPE = "*bench.local"
+# fuzz使用的参数字典，与paramdict.yml格式相同
+PARAM_DATA = {"id": "1", "userId": "10001", "orderId": "20250101001", "shopId": "3001", "pageNo": "1",
+              "pageSize": "10", "status": "1", "type": "1", "keyword": "test"}
+# 每轮计时的最短时间（秒）和轮数，取最快一轮
+MIN_ROUND_TIME = 0.2
+ROUNDS = 5
+
+
+def build_cases(corpus_dir):
+    """
+    准备测试用例，每个用例对一组输入依次调用被测函数，一组输入算一轮中的一次遍历
+    :return: [(名称, 单次调用函数, 输入列表, 每个输入的字节数或None)]
+    """
+    from config import ConfigManager
+    from link_extractor import add_context, fuzz, is_exclusion_rules, newline_pattern, normalize_link, parse_links
+
+    config = ConfigManager()
+    config.override("CRAWLER", "SubDomain", SCOPE)
+    documents = load_corpus(corpus_dir)
+    if not documents:
+        raise SystemExit(f"语料目录为空或不存在: {corpus_dir}")
+
+    contents = [newline_pattern.sub("", content) for _, content in documents]
+    links = sorted({link for content in contents for link in config.matcher.find_matches(content)[0]})
+    urls = [normalize_link(link, SOURCE_URL) for link in links]
+    relative = [link for link in links if not link.startswith(("http", "//"))]
+    in_scope = [url for url, status in urls if not is_exclusion_rules(url, status, SOURCE_URL)]
+
+    loop = asyncio.new_event_loop()
+
+    def run_parse_links(content):
+        return loop.run_until_complete(parse_links(content, SOURCE_URL))
+
+    sizes = [len(content.encode("utf-8")) for _, content in documents]
+    cases = [
+        ("find_matches", config.matcher.find_matches, contents, sizes),
+        ("parse_links", run_parse_links, [content for _, content in documents], sizes),
+        ("normalize_link", lambda link: normalize_link(link, SOURCE_URL), links, None),
+        ("add_context", lambda link: add_context(link, SOURCE_URL), relative, None),
+        ("is_exclusion_rules", lambda item: is_exclusion_rules(item[0], item[1], SOURCE_URL), urls, None),
+        ("fuzz", lambda url: fuzz(url, PARAM_DATA), in_scope, None),
+    ]
+    return cases, {"documents": len(documents), "bytes": sum(sizes), "links": len(links)}, loop
+
+
+def _one_pass(func, inputs):
+    for item in inputs:
+        func(item)
+
+
+def measure_speed(func, inputs):
+    """多轮计时，每轮重复遍历输入至少MIN_ROUND_TIME秒，返回最快一轮的每次调用耗时（秒）"""
+    _one_pass(func, inputs)
+    passes = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(passes):
+            _one_pass(func, inputs)
+        if time.perf_counter() - started >= MIN_ROUND_TIME:
+            break
+        passes *= 2
+    best = None
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            for _ in range(passes):
+                _one_pass(func, inputs)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return best / (passes * len(inputs))
+
+
+def measure_allocations(func, inputs):
+    """
+    用tracemalloc测量每次调用的内存分配
+    :return: (每次调用的平均分配峰值字节数, 遍历一次后仍保留的字节数)
+    """
+    _one_pass(func, inputs)
+    tracemalloc.start()
+    try:
+        retained_before = tracemalloc.get_traced_memory()[0]
+        peak_total = 0
+        for item in inputs:
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            func(item)
+            peak_total += tracemalloc.get_traced_memory()[1] - current
+        retained = tracemalloc.get_traced_memory()[0] - retained_before
+    finally:
+        tracemalloc.stop()
+    return peak_total / len(inputs), retained
+
+
+def run_suite(corpus_dir, name_filter=None):
+    import link_extractor
+    cases, corpus, loop = build_cases(corpus_dir)
+    results = {}
+    try:
+        for name, func, inputs, sizes in cases:
+            if name_filter and name_filter not in name or not inputs:
+                continue
+            per_call = measure_speed(func, inputs)
+            alloc_per_call, retained = measure_allocations(func, inputs)
+            result = {
+                "inputs": len(inputs),
+                "ops_per_s": round(1 / per_call, 1),
+                "us_per_op": round(per_call * 1e6, 3),
+                "alloc_bytes_per_op": round(alloc_per_call, 1),
+                "retained_bytes": retained,
+            }
+            if sizes:
+                result["mb_per_s"] = round(sum(sizes) / len(sizes) / 1048576 / per_call, 2)
+            results[name] = result
+    finally:
+        loop.close()
+        # fuzz会累计参数出现次数，测试结束后清空
+        link_extractor.param_dict.clear()
+    return results, corpus
+
+
+def compare(results, baseline, threshold):
+    """
+    与基线对比，吞吐量下降或每次调用分配增加超过threshold视为回归
+    :return: [(函数名, 指标, 基线值, 当前值, 变化比例, 是否回归)]
+    """
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        for key, higher_is_better in (("ops_per_s", True), ("alloc_bytes_per_op", False)):
+            old, new = base.get(key), result.get(key)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            regressed = change < -threshold if higher_is_better else change > threshold
+            rows.append((name, key, old, new, change, regressed))
+    return rows
+
+
+def format_report(results, rows):
+    lines = [f"{'函数':<20}{'ops/s':>14}{'us/op':>12}{'MB/s':>10}{'分配B/op':>14}"]
+    for name, result in results.items():
+        mb_per_s = result.get("mb_per_s")
+        lines.append(f"{name:<20}{result['ops_per_s']:>14,.1f}{result['us_per_op']:>12.3f}"
+                     f"{mb_per_s if mb_per_s is not None else '-':>10}{result['alloc_bytes_per_op']:>14,.1f}")
+    if rows:
+        lines.append("")
+        lines.append("与基线对比:")
+        for name, key, old, new, change, regressed in rows:
+            mark = "  回归" if regressed else ""
+            lines.append(f"  {name}.{key}: {old:,.1f} -> {new:,.1f} ({change:+.1%}){mark}")
+    return "\n".join(lines)
+
+
+def main():
+    from config import ConfigManager
+    config = ConfigManager()
+
+    parser = argparse.ArgumentParser(description="提取热点函数微基准")
+    parser.add_argument("--corpus", default=config.bench_corpus_dir, help="语料目录")
+    parser.add_argument("--baseline", default=config.bench_baseline_file, help="基线文件")
+    parser.add_argument("--threshold", type=float, default=config.bench_regression_threshold,
+                        help="回归阈值，如0.2表示吞吐量下降或分配增加超过20%%")
+    parser.add_argument("--save-baseline", action="store_true", help="将本次结果保存为基线")
+    parser.add_argument("--filter", help="只测试名称包含该字符串的函数")
+    parser.add_argument("--output", help="结果JSON文件")
+    parser.add_argument("--json", action="store_true", help="以JSON输出结果")
+    args = parser.parse_args()
+
+    corpus_dir = args.corpus if os.path.isabs(args.corpus) else os.path.join(ROOT, args.corpus)
+    baseline_file = args.baseline if os.path.isabs(args.baseline) else os.path.join(ROOT, args.baseline)
+
+    results, corpus = run_suite(corpus_dir, args.filter)
+    report = {
+        "benchmark": "micro",
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": corpus,
+        "results": results,
+    }
+
+    rows = []
+    if args.save_baseline:
+        with open(baseline_file, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+    elif os.path.exists(baseline_file):
+        with open(baseline_file, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("corpus") != corpus:
+            print("提示: 语料与基线不同，对比结果仅供参考", file=sys.stderr)
+        rows = compare(results, baseline.get("results", {}), args.threshold)
+        report["baseline"] = {"revision": baseline.get("revision"), "time": baseline.get("time"),
+                              "threshold": args.threshold,
+                              "regressions": [f"{name}.{key}" for name, key, *_, regressed in rows if regressed]}
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+    print(json.dumps(report, ensure_ascii=False, indent=2) if args.json else format_report(results, rows))
+    return 1 if any(row[-1] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+## 进程内流水线压测：用httpx.MockTransport代替网络，完整运行 network_request → content_processor → parse_links，
+## 不经过socket，输出每个页面在各阶段消耗的CPU时间，用于精确衡量提取路径的优化效果
+## 在项目根目录运行: python benchmarks/pipeline_bench.py --pages 500 [--corpus benchmarks/corpus] [--output pipeline.json]
+import argparse
+import asyncio
+import json
+import mimetypes
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import httpx
+
+from benchmarks.crawl_bench import configure_crawler, crawl, git_revision, summarize
+from benchmarks.synthetic_site import add_arguments, spec_from_args
+
+BASE_URL = "http://bench.local"
+
+
+def site_transport(spec):
+    """由合成站点参数生成响应的MockTransport，不模拟延迟"""
+    def handler(request):
+        status, body, content_type, headers = spec.respond(request.url.path, BASE_URL)
+        return httpx.Response(status, content=body, headers=[("Content-Type", content_type), *headers])
+    return httpx.MockTransport(handler)
+
+
+def corpus_transport(corpus_dir):
+    """
+    用保存的响应文件作为站点，文件相对路径即URL路径，如 corpus/app/main.js -> http://bench.local/app/main.js
+    :return: (MockTransport, 种子URL列表)
+    """
+    files = {}
+    for root, _, names in os.walk(corpus_dir):
+        for name in sorted(names):
+            path = os.path.join(root, name)
+            url_path = "/" + os.path.relpath(path, corpus_dir).replace(os.sep, "/")
+            with open(path, "rb") as f:
+                files[url_path] = f.read()
+
+    def handler(request):
+        body = files.get(request.url.path)
+        if body is None:
+            return httpx.Response(404, content=b"not found", headers={"Content-Type": "text/plain"})
+        content_type = mimetypes.guess_type(request.url.path)[0] or "text/plain"
+        return httpx.Response(200, content=body, headers={"Content-Type": content_type})
+
+    return httpx.MockTransport(handler), [BASE_URL + path for path in files]
+
+
+def stage_breakdown(trace_file, pages):
+    """按span名汇总追踪文件中的CPU时间和耗时"""
+    with open(trace_file, "r", encoding="utf-8") as f:
+        events = json.load(f)
+    stages = defaultdict(lambda: {"calls": 0, "cpu_us": 0.0, "wall_us": 0.0})
+    for event in events:
+        if event.get("ph") != "X":
+            continue
+        stage = stages[event["name"]]
+        stage["calls"] += 1
+        stage["cpu_us"] += event["args"].get("cpu_us", 0.0)
+        stage["wall_us"] += event["dur"]
+    return {
+        name: {
+            "calls": stage["calls"],
+            "cpu_ms_total": round(stage["cpu_us"] / 1000, 3),
+            "cpu_us_per_page": round(stage["cpu_us"] / pages, 2) if pages else None,
+            "wall_us_per_page": round(stage["wall_us"] / pages, 2) if pages else None,
+        }
+        for name, stage in sorted(stages.items(), key=lambda item: -item[1]["cpu_us"])
+    }
+
+
+def run_once(start_url, transport_factory, trace_file=""):
+    """运行一次爬取，trace_file不为空时记录全部页面的分阶段CPU时间"""
+    from tracing import tracer
+    tracer.cpu = bool(trace_file)
+    transport = transport_factory()
+    return asyncio.run(crawl(start_url, transport))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MockTransport进程内流水线压测")
+    add_arguments(parser)
+    parser.add_argument("--corpus", help="使用保存的响应文件目录代替合成站点，目录下每个文件都作为种子URL")
+    parser.add_argument("--depth", type=int, default=20, help="最大爬取深度")
+    parser.add_argument("--output", help="结果JSON文件，默认输出到标准输出")
+    args = parser.parse_args()
+
+    if args.corpus:
+        _, seeds = corpus_transport(args.corpus)
+        start_url = seeds
+        transport_factory = lambda: corpus_transport(args.corpus)[0]
+        source = {"corpus": os.path.abspath(args.corpus), "files": len(seeds)}
+    else:
+        spec = spec_from_args(args)
+        start_url = f"{BASE_URL}/page/0.html"
+        transport_factory = lambda: site_transport(spec)
+        source = {"site": spec.to_dict()}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_file = os.path.join(tmp_dir, "requestlog.log")
+        trace_file = os.path.join(tmp_dir, "trace.json")
+
+        # 第一次全量追踪，得到各阶段CPU时间（含追踪自身的开销），同时预热规则编译和脚本缓存；
+        # 第二次不开追踪，得到总CPU时间
+        configure_crawler(args.depth, log_file, scope="bench.local", trace_file=trace_file, trace_sample_rate=1)
+        traced = summarize(*run_once(start_url, transport_factory, trace_file))
+        stages = stage_breakdown(trace_file, traced["pages"])
+
+        overrides = configure_crawler(args.depth, log_file, scope="bench.local")
+        plain = summarize(*run_once(start_url, transport_factory))
+
+        from log import shutdown_loggers
+        shutdown_loggers()
+
+    report = {
+        "benchmark": "pipeline_mock_transport",
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "source": source,
+        "crawler": overrides,
+        "results": {
+            "pages": plain["pages"],
+            "errors": plain["errors"],
+            "wall_seconds": plain["wall_seconds"],
+            "cpu_seconds": plain["cpu_seconds"],
+            "cpu_ms_per_page": plain["cpu_ms_per_page"],
+            "pages_per_second": plain["pages_per_second"],
+            "peak_rss_mb": plain["peak_rss_mb"],
+            "traced_cpu_ms_per_page": traced["cpu_ms_per_page"],
+            # 嵌套的span（如find_matches在parse_links内）为包含关系，各项不可直接相加
+            "stages": stages,
+        },
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+## 本地HTTP代理替身，用于测试代理池和镜像模式，代替Burp Suite等上游代理
+## 只转发明文HTTP请求（绝对路径形式），不支持CONNECT；可模拟代理自身的延迟
+## 用法: python benchmarks/proxy_stub.py --count 3 [--latency-ms 20]，启动后在标准输出逐行打印各代理地址
+import argparse
+import http.client
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# 不转发的逐跳请求头
+HOP_HEADERS = {"connection", "proxy-connection", "keep-alive", "proxy-authorization", "te", "trailer",
+               "transfer-encoding", "upgrade"}
+
+
+class ProxyStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_error(self, status, message):
+        body = message.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        target = urlsplit(self.path)
+        if target.scheme != "http" or not target.hostname:
+            self._send_error(400, "proxy stub only forwards absolute http:// URLs")
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        headers = {name: value for name, value in self.headers.items() if name.lower() not in HOP_HEADERS}
+        path = target.path or "/"
+        if target.query:
+            path += "?" + target.query
+        connection = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=30)
+        try:
+            connection.request(self.command, path, body=body, headers=headers)
+            response = connection.getresponse()
+            content = response.read()
+        except OSError as e:
+            self._send_error(502, f"upstream error: {e}")
+            return
+        finally:
+            connection.close()
+        self.send_response(response.status, response.reason)
+        for name, value in response.getheaders():
+            if name.lower() not in HOP_HEADERS and name.lower() != "content-length":
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(content)
+
+    def do_CONNECT(self):
+        self._send_error(501, "proxy stub does not support CONNECT")
+
+    do_POST = do_GET
+    do_PUT = do_GET
+    do_DELETE = do_GET
+    do_HEAD = do_GET
+
+
+def serve(host="127.0.0.1", port=0, latency_ms=0.0):
+    """创建代理服务器（未启动），返回ThreadingHTTPServer，其requests属性为已处理的请求数"""
+    handler = type("Handler", (ProxyStubHandler,), {"latency": latency_ms / 1000})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.requests = 0
+    return server
+
+
+def _main():
+    parser = argparse.ArgumentParser(description="启动本地HTTP代理替身")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="第一个代理的监听端口，0为随机端口")
+    parser.add_argument("--count", type=int, default=1, help="代理个数，端口依次递增（--port为0时均为随机端口）")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="代理转发每个请求前的延迟(毫秒)")
+    args = parser.parse_args()
+
+    servers = [serve(args.host, args.port + i if args.port else 0, args.latency_ms) for i in range(args.count)]
+    for server in servers:
+        host, port = server.server_address[:2]
+        print(f"http://{host}:{port}", flush=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
@@ -0,0 +1,220 @@
+## 本地合成站点，用于端到端压测爬虫
+## 页面、脚本和接口内容由站点参数和路径确定，同样的参数每次生成完全相同的站点
+## 用法: python benchmarks/synthetic_site.py --pages 500 --fanout 5 [--port 0]，启动后在标准输出打印监听地址
+import argparse
+import json
+import math
+import random
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class SiteSpec:
+    """站点参数"""
+
+    def __init__(self, pages=500, fanout=5, bundles=5, bundle_kb=100, apis_per_bundle=50,
+                 latency_ms=10.0, latency_sigma=0.5, error_rate=0.0, redirect_rate=0.0, seed=1):
+        """
+        :param pages: 页面数，页面按fanout组成树，/page/0.html为首页
+        :param fanout: 每个页面链接的子页面数
+        :param bundles: 脚本文件数，每个页面引用其中一个
+        :param bundle_kb: 每个脚本文件的大小（KB）
+        :param apis_per_bundle: 每个脚本文件中的接口路径数
+        :param latency_ms: 响应延迟中位数（毫秒），按对数正态分布
+        :param latency_sigma: 对数正态分布的sigma，0为固定延迟
+        :param error_rate: 返回500的请求比例，按路径确定
+        :param redirect_rate: 页面链接经302跳转的比例，按页面确定
+        :param seed: 随机种子
+        """
+        self.pages = pages
+        self.fanout = fanout
+        self.bundles = bundles
+        self.bundle_kb = bundle_kb
+        self.apis_per_bundle = apis_per_bundle
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.redirect_rate = redirect_rate
+        self.seed = seed
+
+    def to_dict(self):
+        return dict(self.__dict__)
+
+    def _rng(self, key):
+        return random.Random(self.seed * 1000003 + zlib.crc32(key.encode()))
+
+    def _chance(self, key, rate):
+        return rate > 0 and self._rng(f"{key}#chance").random() < rate
+
+    def latency(self, path):
+        """该路径的响应延迟（秒），同一路径每次相同"""
+        if self.latency_ms <= 0:
+            return 0.0
+        if self.latency_sigma <= 0:
+            return self.latency_ms / 1000
+        return self._rng(f"{path}#latency").lognormvariate(math.log(self.latency_ms), self.latency_sigma) / 1000
+
+    def is_error(self, path):
+        return self._chance(f"{path}#error", self.error_rate)
+
+    def is_redirected(self, page):
+        return page != 0 and self._chance(f"page{page}#redirect", self.redirect_rate)
+
+    def page_link(self, base, page):
+        """页面链接，部分经/go/跳转"""
+        if self.is_redirected(page):
+            return f"{base}/go/{page}"
+        return f"{base}/page/{page}.html"
+
+    def render_page(self, base, page):
+        """页面HTML：子页面绝对链接 + 一个相对路径的脚本（走fuzz去上下文的逻辑）"""
+        children = [page * self.fanout + i for i in range(1, self.fanout + 1)]
+        links = "".join(f'<li><a href="{self.page_link(base, child)}">page {child}</a></li>'
+                        for child in children if child < self.pages)
+        bundle = page % self.bundles if self.bundles else None
+        script = f'<script src="static/bundle-{bundle}.js"></script>' if bundle is not None else ""
+        return (f"<!DOCTYPE html><html><head><title>page {page}</title>{script}</head>"
+                f"<body><h1>page {page}</h1><ul>{links}</ul></body></html>")
+
+    def render_bundle(self, bundle):
+        """压缩风格的脚本，包含接口路径和填充代码"""
+        rng = self._rng(f"bundle{bundle}")
+        parts = []
+        for i in range(self.apis_per_bundle):
+            parts.append(f'function f{bundle}_{i}(t){{return n.get("api/v{bundle}/item{i}",{{params:t}})}}')
+        size = self.bundle_kb * 1024
+        filler_words = ("var", "return", "function", "this", "null", "void 0", "e", "t", "n", "r")
+        while sum(len(part) + 1 for part in parts) < size:
+            parts.append("".join(rng.choice(filler_words) + rng.choice("=,;(){}+") for _ in range(40)))
+        return ";".join(parts)[:max(size, 1)]
+
+    def render_api(self, path):
+        return json.dumps({"code": 0, "path": path, "data": [{"id": i} for i in range(5)]})
+
+    def respond(self, path, base):
+        """
+        生成响应（不含延迟），HTTP服务器和进程内MockTransport共用
+        :param path: 请求路径，不含查询参数
+        :param base: 站点地址，如 http://127.0.0.1:8000
+        :return: (状态码, 响应体bytes, Content-Type, 其他响应头列表)
+        """
+        if self.is_error(path):
+            return 500, b"internal error", "text/plain", []
+
+        if path.startswith("/page/") and path.endswith(".html"):
+            page = _int(path[len("/page/"):-len(".html")])
+            if page is not None and 0 <= page < self.pages:
+                return 200, self.render_page(base, page).encode(), "text/html; charset=utf-8", []
+        elif path.startswith("/go/"):
+            page = _int(path[len("/go/"):])
+            if page is not None and 0 <= page < self.pages:
+                return 302, b"", "text/html; charset=utf-8", [("Location", f"{base}/page/{page}.html")]
+        elif path.startswith("/static/bundle-") and path.endswith(".js"):
+            bundle = _int(path[len("/static/bundle-"):-len(".js")])
+            if bundle is not None and 0 <= bundle < self.bundles:
+                return 200, _cached_bundle(self, bundle), "application/javascript", []
+        elif path.startswith("/api/"):
+            return 200, self.render_api(path).encode(), "application/json", []
+        return 404, b"not found", "text/plain", []
+
+
+class SyntheticSiteHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    spec = SiteSpec()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=()):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        spec = self.spec
+        path = self.path.split("?", 1)[0]
+        base = f"http://{self.headers.get('Host') or '%s:%s' % self.server.server_address[:2]}"
+        delay = spec.latency(path)
+        if delay:
+            time.sleep(delay)
+        status, body, content_type, headers = spec.respond(path, base)
+        self._send(status, body, content_type, headers)
+
+    do_POST = do_GET
+    do_HEAD = do_GET
+
+
+_bundle_cache = {}
+_bundle_lock = threading.Lock()
+
+
+def _cached_bundle(spec, bundle):
+    with _bundle_lock:
+        if bundle not in _bundle_cache:
+            _bundle_cache[bundle] = spec.render_bundle(bundle).encode()
+        return _bundle_cache[bundle]
+
+
+def _int(text):
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def serve(spec, host="127.0.0.1", port=0):
+    """创建站点服务器（未启动），返回ThreadingHTTPServer"""
+    handler = type("Handler", (SyntheticSiteHandler,), {"spec": spec})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def add_arguments(parser):
+    """站点参数，压测脚本复用"""
+    parser.add_argument("--pages", type=int, default=500, help="页面数")
+    parser.add_argument("--fanout", type=int, default=5, help="每个页面的子页面数")
+    parser.add_argument("--bundles", type=int, default=5, help="脚本文件数")
+    parser.add_argument("--bundle-kb", type=int, default=100, help="脚本文件大小(KB)")
+    parser.add_argument("--apis-per-bundle", type=int, default=50, help="每个脚本中的接口路径数")
+    parser.add_argument("--latency-ms", type=float, default=10.0, help="响应延迟中位数(毫秒)")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="响应延迟对数正态分布sigma")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="返回500的比例")
+    parser.add_argument("--redirect-rate", type=float, default=0.0, help="页面链接经302跳转的比例")
+    parser.add_argument("--seed", type=int, default=1, help="随机种子")
+
+
+def spec_from_args(args):
+    return SiteSpec(args.pages, args.fanout, args.bundles, args.bundle_kb, args.apis_per_bundle,
+                    args.latency_ms, args.latency_sigma, args.error_rate, args.redirect_rate, args.seed)
+
+
+def _main():
+    parser = argparse.ArgumentParser(description="启动本地合成站点")
+    add_arguments(parser)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="监听端口，0为随机端口")
+    args = parser.parse_args()
+
+    server = serve(spec_from_args(args), args.host, args.port)
+    host, port = server.server_address[:2]
+    print(f"http://{host}:{port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
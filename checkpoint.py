@@ -0,0 +1,152 @@
+## 爬取断点保存与恢复，基于SQLite(WAL)增量写入
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+
+
+class CrawlCheckpoint:
+    """
+    爬取断点
+    frontier: 待完成的URL，以深度序号为键（深度序号在一次爬取中唯一，同时记录了链接层级）
+    seen:     已完成的URL，恢复时直接放入去重集合，不再重复请求
+    results:  已发送到UI的结果行，恢复时重新展示
+    所有写操作先缓存在内存中，由run()定期批量写入，避免阻塞事件循环
+    """
+
+    def __init__(self, path, interval=5):
+        """
+        :param path: 断点文件路径，相对路径基于当前工作目录
+        :param interval: 批量写入间隔（秒）
+        """
+        self.path = os.path.abspath(path)
+        self.interval = interval
+        self._ops = []
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS frontier (depth TEXT PRIMARY KEY, url TEXT, type TEXT, regex_names TEXT);
+            CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY);
+            CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY AUTOINCREMENT, depth TEXT, data TEXT);
+        """)
+        self._conn.commit()
+
+    def reset(self, start_url, crawl_id=None):
+        """开始新的爬取，清空旧断点，crawl_id为该次爬取的编号（结果库、响应存档中相同）"""
+        with self._lock:
+            self._ops.clear()
+            self._conn.executescript("""
+                DELETE FROM meta; DELETE FROM frontier; DELETE FROM seen; DELETE FROM results;
+            """)
+            self._conn.execute("INSERT INTO meta VALUES ('start_url', ?)", (json.dumps(start_url, ensure_ascii=False),))
+            self._conn.execute("INSERT INTO meta VALUES ('status', 'running')")
+            if crawl_id:
+                self._conn.execute("INSERT INTO meta VALUES ('crawl_id', ?)", (crawl_id,))
+            self._conn.commit()
+
+    def add(self, url, urlProperty):
+        """URL写入请求队列"""
+        url_status, depth, regex_names = urlProperty
+        self._ops.append(("INSERT OR IGNORE INTO frontier VALUES (?, ?, ?, ?)",
+                          (depth, url, url_status, json.dumps(_encode_names(regex_names), ensure_ascii=False))))
+
+    def seeded(self, count, done=False):
+        """已写入请求队列的种子数，与种子URL在同一批写入，续爬时从下一个种子继续"""
+        self._ops.append(("INSERT OR REPLACE INTO meta VALUES ('seeded', ?)", (json.dumps([count, done]),)))
+
+    def drop(self, depth):
+        """URL被跳过（超出深度或重复）"""
+        self._ops.append(("DELETE FROM frontier WHERE depth = ?", (depth,)))
+
+    def complete(self, depth):
+        """URL请求失败或响应已解析完成，子链接已写入frontier"""
+        self._ops.append(("INSERT OR IGNORE INTO seen SELECT url FROM frontier WHERE depth = ?", (depth,)))
+        self._ops.append(("DELETE FROM frontier WHERE depth = ?", (depth,)))
+
+    def add_result(self, result):
+        """记录发送到UI的结果行"""
+        self._ops.append(("INSERT INTO results (depth, data) VALUES (?, ?)",
+                          (result.get('depth'), json.dumps(result, ensure_ascii=False, default=list))))
+
+    def _write(self, ops):
+        """将一批操作在一个事务内写入文件"""
+        if not ops:
+            return
+        with self._lock, self._conn:
+            for sql, params in ops:
+                self._conn.execute(sql, params)
+
+    def flush(self):
+        """同步写入缓存的操作，需在事件循环线程中调用"""
+        ops, self._ops = self._ops, []
+        self._write(ops)
+
+    async def run(self):
+        """定期写入协程，由爬虫主函数创建并在结束时取消"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.interval)
+            # 在事件循环线程中取出缓存，写文件放到线程池执行
+            ops, self._ops = self._ops, []
+            await loop.run_in_executor(None, self._write, ops)
+
+    def finish(self):
+        """爬取正常结束"""
+        self.flush()
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta VALUES ('status', 'finished')")
+
+    def load(self):
+        """
+        读取断点
+        :return: (start_url, frontier, seen, results)
+            frontier 为 [(url, (url_status, depth, regex_names)), ...]
+        """
+        with self._lock:
+            meta = dict(self._conn.execute("SELECT key, value FROM meta"))
+            start_url = json.loads(meta["start_url"]) if "start_url" in meta else None
+            frontier = [
+                (url, (url_status, depth, _decode_names(json.loads(regex_names))))
+                for depth, url, url_status, regex_names in self._conn.execute("SELECT depth, url, type, regex_names FROM frontier")
+            ]
+            seen = {row[0] for row in self._conn.execute("SELECT url FROM seen")}
+            # 仍在frontier中的URL恢复后会重新请求，丢弃它们之前的结果行避免重复展示
+            results = [json.loads(row[0]) for row in self._conn.execute(
+                "SELECT data FROM results WHERE depth NOT IN (SELECT depth FROM frontier) ORDER BY id")]
+        return start_url, frontier, seen, results
+
+    def _meta(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @property
+    def status(self):
+        return self._meta('status')
+
+    @property
+    def crawl_id(self):
+        return self._meta('crawl_id')
+
+    @property
+    def seed_progress(self):
+        """(已写入的种子数, 种子是否已全部写入)，没有记录时为None"""
+        value = self._meta('seeded')
+        return tuple(json.loads(value)) if value else None
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+
+def _encode_names(regex_names):
+    # 种子URL的规则名为字符串"N"，解析出的链接为规则名集合
+    return regex_names if isinstance(regex_names, str) else sorted(regex_names)
+
+
+def _decode_names(regex_names):
+    return regex_names if isinstance(regex_names, str) else set(regex_names)
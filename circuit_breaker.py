@@ -0,0 +1,169 @@
+## 按主机的熔断器：连续连接失败或超时的主机暂停请求，冷却后放行一个探测请求，探测成功则恢复
+## 避免目标范围内某个子域名宕机时，每个URL都要等满连接超时才失败，长时间占住抓取协程
+import time
+from collections import deque
+
+import httpx
+
+# 熔断器状态
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 请求前的判定结果
+ALLOW = "allow"
+PROBE = "probe"
+REJECT = "reject"
+
+
+def is_breaker_failure(error):
+    """连接失败和超时计为主机故障；连接池等待超时是本地资源不足，不计入"""
+    return isinstance(error, (httpx.ConnectError, httpx.TimeoutException)) and not isinstance(error, httpx.PoolTimeout)
+
+
+class _HostState:
+    __slots__ = ("state", "failures", "opened_at", "cooldown", "trips", "rejected", "parked")
+
+    def __init__(self, cooldown):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.cooldown = cooldown
+        self.trips = 0
+        self.rejected = 0
+        self.parked = deque()
+
+
+class CircuitBreaker:
+    """
+    熔断器，每个主机一个状态：
+    closed    正常请求，连续failure_threshold次连接失败或超时后断开
+    open      拒绝请求，冷却cooldown秒后进入half_open；每次探测失败冷却时间加倍，最长max_cooldown秒
+    half_open 只放行一个探测请求，成功则恢复closed，失败则重新断开
+    被拒绝的URL由调用方立即按失败处理，或暂存(park)到该主机恢复或冷却结束时再放回请求队列；
+    断开次数达到max_trips后视为主机不可用，之后被拒绝的URL不再暂存
+    """
+
+    def __init__(self, failure_threshold=5, cooldown=30.0, max_cooldown=300.0, max_trips=3, park=False,
+                 on_state_change=None):
+        """
+        :param failure_threshold: 连续失败多少次后断开，0为不启用熔断
+        :param cooldown: 断开后的冷却时间（秒）
+        :param max_cooldown: 探测失败后冷却时间加倍的上限（秒）
+        :param max_trips: 断开多少次后视为主机不可用，0为不限制
+        :param park: 被拒绝的URL是否暂存，False时立即失败
+        :param on_state_change: 状态变化回调，参数为(主机, 原状态, 新状态)
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max(max_cooldown, cooldown)
+        self.max_trips = max_trips
+        self.park_enabled = park
+        self.on_state_change = on_state_change
+        # 只记录出现过失败的主机
+        self.hosts = {}
+
+    @property
+    def enabled(self):
+        return self.failure_threshold > 0
+
+    def _set_state(self, host, st, state):
+        old, st.state = st.state, state
+        if old != state and self.on_state_change is not None:
+            self.on_state_change(host, old, state)
+
+    def check(self, host):
+        """
+        请求前调用
+        :return: ALLOW正常请求；PROBE作为探测请求；REJECT拒绝，URL应立即失败或暂存
+        """
+        st = self.hosts.get(host)
+        if st is None or st.state == CLOSED:
+            return ALLOW
+        if st.state == OPEN and time.monotonic() >= st.opened_at + st.cooldown:
+            self._set_state(host, st, HALF_OPEN)
+            return PROBE
+        st.rejected += 1
+        return REJECT
+
+    def release_probe(self, host):
+        """探测许可未使用（如URL因预算被丢弃），恢复为open，下一个请求立即重新探测"""
+        st = self.hosts.get(host)
+        if st is not None and st.state == HALF_OPEN:
+            st.state = OPEN
+
+    def record_success(self, host):
+        """请求得到响应（任意状态码），或因连接以外的原因失败"""
+        st = self.hosts.get(host)
+        if st is None:
+            return
+        st.failures = 0
+        if st.state != CLOSED:
+            st.cooldown = self.cooldown
+            self._set_state(host, st, CLOSED)
+
+    def record_failure(self, host):
+        """请求连接失败或超时"""
+        if not self.enabled:
+            return
+        st = self.hosts.get(host)
+        if st is None:
+            st = self.hosts[host] = _HostState(self.cooldown)
+        st.failures += 1
+        if st.state == HALF_OPEN:
+            # 探测失败，冷却时间加倍后重新断开
+            st.cooldown = min(st.cooldown * 2, self.max_cooldown)
+            self._open(host, st)
+        elif st.state == CLOSED and st.failures >= self.failure_threshold:
+            self._open(host, st)
+
+    def _open(self, host, st):
+        st.opened_at = time.monotonic()
+        st.trips += 1
+        self._set_state(host, st, OPEN)
+
+    def is_down(self, host):
+        """断开次数达到max_trips，视为主机不可用"""
+        st = self.hosts.get(host)
+        return st is not None and bool(self.max_trips) and st.trips >= self.max_trips and st.state != CLOSED
+
+    def should_park(self, host):
+        """被拒绝的URL是否暂存"""
+        return self.park_enabled and not self.is_down(host)
+
+    def park(self, host, item):
+        """暂存被拒绝的URL"""
+        self.hosts[host].parked.append(item)
+
+    @property
+    def parked(self):
+        """暂存的URL数"""
+        return sum(len(st.parked) for st in self.hosts.values())
+
+    def due(self):
+        """
+        取出应放回请求队列的暂存URL：主机已恢复或已视为不可用时全部取出；冷却结束时取出一个作为探测
+        :return: [暂存的item, ...]
+        """
+        items = []
+        now = time.monotonic()
+        for host, st in self.hosts.items():
+            if not st.parked:
+                continue
+            if st.state == CLOSED or self.is_down(host):
+                items.extend(st.parked)
+                st.parked.clear()
+            elif st.state == OPEN and now >= st.opened_at + st.cooldown:
+                items.append(st.parked.popleft())
+        return items
+
+    def snapshot(self):
+        """各主机的熔断状态，供日志和指标展示"""
+        return {
+            "open": [host for host, st in list(self.hosts.items()) if st.state != CLOSED],
+            "hosts": {
+                host: {"state": st.state, "failures": st.failures, "trips": st.trips, "cooldown": st.cooldown,
+                       "rejected": st.rejected, "parked": len(st.parked)}
+                for host, st in list(self.hosts.items())
+            },
+        }
@@ -5,10 +5,15 @@ import time
 from threading import Lock
 from typing import Dict, List, Pattern, Tuple
 import yaml
+from tracing import span
+from metrics import RuleStats
 
 class RegexMatcher:
     def __init__(self, yaml_file: str):
         self.patterns: Dict[str, Pattern] = {}
+        # 各规则的开销与产出统计，profile为True（配置METRICS.RuleStats）时才计时和统计，避免拖慢每个链接的匹配
+        self.stats = RuleStats()
+        self.profile = False
         # 如果传入的是相对路径，转换为基于config.py所在目录的绝对路径
         if not os.path.isabs(yaml_file):
             yaml_file = os.path.join(os.path.dirname(__file__), yaml_file)
@@ -29,27 +34,64 @@ class RegexMatcher:
 
     def find_matches(self, content: str) -> Dict[str, List[Tuple[str, str]]]:
         """在内容中查找所有匹配项，并记录每个匹配项对应的正则名"""
+        if self.profile:
+            return self._find_matches_profiled(content)
         results = {}
         exclude_results = {}
 
         for name, pattern in self.patterns["FindLink"].items():
-            # start_time = time.time()
-            matches = pattern.findall(content)
-            # end_time = time.time()
-            # print(name,end_time - start_time)
+            with span("find_matches", rule=name):
+                matches = pattern.findall(content)
             for match in matches:
                 # 如果匹配结果是元组列表，获取第一个元素
                 match_str = match if isinstance(match, str) else match[0]
                 results.setdefault(match_str,set()).add(name)
 
-        # print(results)
         # 第二轮排除
-        for match_str in list(results.keys()):
-            for exclude_name, exclude_pattern in self.patterns["excludeLink"].items():
-                if exclude_pattern.match(match_str):
-                    del results[match_str]
-                    exclude_results.setdefault(match_str,set()).add(exclude_name)
-                    break
+        with span("exclude_matches", count=len(results)):
+            exclude_patterns = self.patterns["excludeLink"].items()
+            for match_str in list(results.keys()):
+                for exclude_name, exclude_pattern in exclude_patterns:
+                    if exclude_pattern.match(match_str):
+                        del results[match_str]
+                        exclude_results.setdefault(match_str,set()).add(exclude_name)
+                        break
+
+        return results,exclude_results
+
+    def _find_matches_profiled(self, content: str) -> Dict[str, List[Tuple[str, str]]]:
+        """与find_matches相同，同时记录每条规则的耗时与产出"""
+        results = {}
+        exclude_results = {}
+        stats = self.stats
+        size = len(content)
+
+        for name, pattern in self.patterns["FindLink"].items():
+            with span("find_matches", rule=name):
+                started = time.perf_counter_ns()
+                matches = pattern.findall(content)
+                elapsed = time.perf_counter_ns() - started
+            produced = 0
+            for match in matches:
+                # 如果匹配结果是元组列表，获取第一个元素
+                match_str = match if isinstance(match, str) else match[0]
+                names = results.setdefault(match_str,set())
+                if name not in names:
+                    names.add(name)
+                    produced += 1
+            stats.scanned(name, elapsed, size, produced)
+
+        # 第二轮排除
+        with span("exclude_matches", count=len(results)):
+            for match_str in list(results.keys()):
+                for exclude_name, exclude_pattern in self.patterns["excludeLink"].items():
+                    started = time.perf_counter_ns()
+                    matched = exclude_pattern.match(match_str)
+                    stats.checked(exclude_name, time.perf_counter_ns() - started, matched)
+                    if matched:
+                        stats.excluded(results.pop(match_str))
+                        exclude_results.setdefault(match_str,set()).add(exclude_name)
+                        break
 
         return results,exclude_results
 
@@ -84,14 +126,131 @@ def create_default_config(config_path):
         'MaxDepth': 5,
         '# 最大失败重试次数': None,
         'MaxRetries': 3,
-        '# 代理地址': None,
+        '# 代理地址，多个用逗号分隔时使用代理池，见[PROXYPOOL]': None,
         'Proxies': 'http://127.0.0.1:8080',
         '# 代理地址开关': None,
         'ProxySwitch': False,
+        '# 代理模式：route爬取请求经代理发送；mirror爬取请求直连目标，另由后台重放器经代理重发，见[MIRROR]': None,
+        'ProxyMode': 'route',
         '# 参数字典开关': None,
         'ParamSwitch': True,
-        '# 扫描范围,*匹配所有': None,
-        'SubDomain':'*.baidu.com'
+        '# 扫描范围,*匹配所有,须匹配整个主机名,多个用逗号分隔,如 example.com,*.example.com': None,
+        'SubDomain':'*.baidu.com',
+        '# 请求队列种子URL上限': None,
+        'RequestQueueSize': 10000,
+        '# 种子文件中相对路径的种子拼接的站点地址，如 https://www.example.com，留空则跳过相对路径': None,
+        'SeedBase': '',
+        '# 处理队列响应体总大小上限(MB)': None,
+        'ProcessQueueMB': 64,
+        '# UI队列/排除队列长度上限': None,
+        'UiQueueSize': 1000,
+        '# 进程内存上限(MB)，超过后暂停抓取，0为不限制': None,
+        'MemoryLimitMB': 2048
+    }
+    config['BUDGET'] = {
+        '# 每次爬取（多目标时每个任务）的请求数上限，0为不限制': None,
+        'MaxRequests': 0,
+        '# 每次爬取（多目标时每个任务）的下载量上限(MB)，0为不限制': None,
+        'MaxMB': 0,
+        '# 每次爬取（多目标时每个任务）的用时上限(秒)，0为不限制': None,
+        'MaxSeconds': 0,
+        '# 每个主机的请求数上限，0为不限制': None,
+        'HostMaxRequests': 0,
+        '# 每个主机的下载量上限(MB)，0为不限制': None,
+        'HostMaxMB': 0,
+        '# 每个主机的用时上限(秒)，从该主机的第一个请求开始计时，0为不限制': None,
+        'HostMaxSeconds': 0
+    }
+    config['BREAKER'] = {
+        '# 主机连续连接失败或超时多少次后熔断（暂停请求该主机），0为不启用': None,
+        'FailureThreshold': 5,
+        '# 熔断后的冷却时间(秒)，冷却后放行一个探测请求': None,
+        'Cooldown': 30,
+        '# 探测失败后冷却时间加倍的上限(秒)': None,
+        'MaxCooldown': 300,
+        '# 熔断多少次后视为主机不可用，0为不限制': None,
+        'MaxTrips': 3,
+        '# 熔断期间该主机的URL：fail立即按失败处理，park暂存到主机恢复后再请求': None,
+        'Mode': 'fail'
+    }
+    config['ARCHIVE'] = {
+        '# 是否把抓取到的响应写入存档（WARC格式，gzip压缩，带索引），修改规则后可用 findapi.py replay 离线重放': None,
+        'Enabled': False,
+        '# 存档文件，索引为同名加.idx，多次爬取追加写入': None,
+        'File': 'archive.warc.gz',
+        '# gzip压缩级别，1~9': None,
+        'CompressLevel': 6,
+        '# 离线重放的进程数，0为CPU核数': None,
+        'ReplayWorkers': 0
+    }
+    config['PROXYPOOL'] = {
+        '# 配置多个代理时选择代理的策略：round_robin轮询，least_busy选择在途请求最少的代理': None,
+        'Strategy': 'round_robin',
+        '# 是否按主机固定代理，同一主机的请求始终经过同一个代理': None,
+        'Affinity': False,
+        '# 连续连接失败多少次后标记代理不可用，0为不标记': None,
+        'FailureThreshold': 3,
+        '# 不可用代理的冷却时间(秒)，之后重新尝试': None,
+        'Cooldown': 60
+    }
+    config['MIRROR'] = {
+        '# 代理模式为mirror时，同时经代理重放的请求数': None,
+        'Concurrency': 4,
+        '# 重放队列长度上限': None,
+        'QueueSize': 1000,
+        '# 重放队列满时的处理方式：drop丢弃，spool写入暂存文件，队列空出后再重放': None,
+        'Overflow': 'drop',
+        '# 暂存文件，未重放完的请求下次爬取时先重放': None,
+        'SpoolFile': 'mirror_spool.jsonl',
+        '# 重放请求的超时时间(秒)': None,
+        'Timeout': 30,
+        '# 爬取结束后等待重放完成的最长时间(秒)': None,
+        'DrainSeconds': 30
+    }
+    config['HTTP'] = {
+        '# 连接池最大连接数（所有主机合计）': None,
+        'MaxConnections': 100,
+        '# 最多保持的空闲长连接数，复用连接可减少TCP/TLS握手': None,
+        'MaxKeepalive': 20,
+        '# 空闲长连接的保持时间(秒)': None,
+        'KeepaliveExpiry': 5,
+        '# 是否启用HTTP/2多路复用，需安装httpx[http2]，未安装时使用HTTP/1.1': None,
+        'HTTP2': False
+    }
+    config['DNS'] = {
+        '# 是否缓存DNS解析结果，同一主机名不再重复查询系统解析器': None,
+        'Cache': True,
+        '# 解析结果的缓存时间(秒)': None,
+        'TTL': 300,
+        '# 主机不存在(NXDOMAIN)的缓存时间(秒)，期间该主机的URL立即失败': None,
+        'NegativeTTL': 60,
+        '# 最多缓存的主机数': None,
+        'MaxEntries': 10000,
+        '# 是否在主机进入请求队列时预先解析': None,
+        'Prefetch': True
+    }
+    config['TIMEOUT'] = {
+        '# 是否按主机自适应请求截止时间，关闭时使用Ceiling': None,
+        'Adaptive': True,
+        '# 截止时间 = 该主机最近响应耗时的分位数 × 倍数': None,
+        'Percentile': 0.95,
+        'Multiplier': 3,
+        '# 截止时间下限(秒)': None,
+        'Floor': 2,
+        '# 截止时间上限(秒)，样本不足时也使用该值': None,
+        'Ceiling': 60,
+        '# 每个主机保留的耗时样本数': None,
+        'Window': 200,
+        '# 开始自适应所需的最少样本数': None,
+        'MinSamples': 20
+    }
+    config['SCHEDULER'] = {
+        '# 多目标爬取时同时运行的任务数，每个目标一个任务': None,
+        'MaxActiveJobs': 4,
+        '# 任务的扫描范围：host只爬目标主机，subdomain爬目标主机及其子域名，config使用CRAWLER.SubDomain': None,
+        'JobScope': 'subdomain',
+        '# 界面中输入多行URL时是否每行作为一个独立任务；关闭时多行URL作为一次爬取的种子，使用CRAWLER.SubDomain并支持断点续爬，行中指定了任务选项时总是按任务调度': None,
+        'MultiTargetJobs': False
     }
     config['REGEX'] = {
         '# 移除URL上下文': None,
@@ -101,6 +260,52 @@ def create_default_config(config_path):
         '# 排除大文件后缀': None,
         'A':'.css,.png,.jpg,.ico,.jepg,.exe,.zip,.dmg,.pdf'
     }
+    config['STORAGE'] = {
+        '# 断点文件，如 checkpoint.db，留空则不保存断点（无法续爬）': None,
+        'Checkpoint': '',
+        '# 断点写入间隔(秒)': None,
+        'CheckpointInterval': 5,
+        '# 结果库文件(SQLite)，如 results.db，留空则不保存结果；多次爬取追加写入，不会自动清理': None,
+        'ResultsDB': ''
+    }
+    config['LOG'] = {
+        '# 请求日志文件': None,
+        'RequestLog': 'requestlog.log',
+        '# 单个日志文件大小上限(MB)，超过后轮转，0为不轮转': None,
+        'MaxMB': 50,
+        '# 轮转保留的日志文件数': None,
+        'BackupCount': 3,
+        '# 日志文件是否使用JSON行格式': None,
+        'Json': False,
+        '# 是否同时输出到控制台': None,
+        'Console': True,
+        '# 日志级别，DEBUG时记录控制器调试信息': None,
+        'Level': 'INFO'
+    }
+    config['TRACE'] = {
+        '# 阶段耗时追踪文件(Chrome trace-event格式)，留空则不追踪': None,
+        'File': '',
+        '# 按页面抽样的比例，0~1': None,
+        'SampleRate': 0.01
+    }
+    config['BENCH'] = {
+        '# 规则测试使用的本地语料目录（保存的响应文件）': None,
+        'Corpus': 'benchmarks/corpus',
+        '# 规则测试时间上限(秒)，超时视为灾难性回溯': None,
+        'TimeLimit': 10,
+        '# 微基准测试的基线文件': None,
+        'Baseline': 'benchmarks/baseline.json',
+        '# 微基准测试回归阈值，吞吐量下降或内存分配增加超过该比例视为回归': None,
+        'RegressionThreshold': 0.2
+    }
+    config['METRICS'] = {
+        '# 指标快照文件(JSON)，如 metrics.json，留空则不写快照': None,
+        'SnapshotFile': '',
+        '# 快照写入间隔(秒)': None,
+        'SnapshotInterval': 10,
+        '# 统计rules.yml中每条规则的扫描耗时与产出（规则标签页、指标快照的rules字段），每个链接多两次计时，排查慢规则时开启': None,
+        'RuleStats': False
+    }
 
     with open(config_path, 'w', encoding='utf-8') as f:
         config.write(f)
@@ -131,6 +336,7 @@ class ConfigManager:
         self._config.read(self._config_path, encoding='utf-8')
         rules_path = os.path.join(os.path.dirname(__file__), 'rules.yml')
         self._matcher = RegexMatcher(rules_path)
+        self._matcher.profile = self.metrics_rule_stats
         self._param_data = loadParamData(ParamSwitch=self.get_boolean('CRAWLER','ParamSwitch'))
     
     def get(self, section, option, default=None):
@@ -151,7 +357,24 @@ class ConfigManager:
             self._config.add_section(section)
         self._config.set(section, option, str(value))
         self._save_config()
+        self._option_changed(section, option)
     
+    def override(self, section, option, value):
+        """临时修改配置项，只在当前进程内生效，不写入配置文件（压测、命令行参数使用）"""
+        if not self._config.has_section(section):
+            self._config.add_section(section)
+        self._config.set(section, option, str(value))
+        self._option_changed(section, option)
+
+    def _option_changed(self, section, option):
+        """初始化时读取的配置项变化后重新加载"""
+        section, option = section.upper(), option.lower()
+        # 参数字典在初始化时加载，开关变化后重新加载
+        if section == 'CRAWLER' and option == 'paramswitch':
+            self._param_data = loadParamData(ParamSwitch=self.get_boolean('CRAWLER', 'ParamSwitch'))
+        elif section == 'METRICS' and option == 'rulestats':
+            self._matcher.profile = self.metrics_rule_stats
+
     def remove_option(self, section, option):
         """删除配置项"""
         if self._config.has_section(section):
@@ -198,11 +421,368 @@ class ConfigManager:
         """获取爬虫代理设置"""
         return self.get_boolean('CRAWLER', 'ProxySwitch', False)
 
+    @property
+    def crawler_proxy_mode(self):
+        """获取代理模式（route/mirror）"""
+        return self.get('CRAWLER', 'ProxyMode', 'route').strip().lower()
+
+    @property
+    def crawler_route_proxies(self):
+        """获取爬取请求使用的代理地址，未开启代理或为镜像模式时为None"""
+        if not self.crawler_proxy_switch or self.crawler_proxy_mode == 'mirror':
+            return None
+        return self.crawler_proxies
+
     @property
     def crawler_param_switch(self):
         """获取爬虫参数字典开关"""
         return self.get_boolean('CRAWLER', 'ParamSwitch', False)
 
+    @property
+    def crawler_request_queue_size(self):
+        """获取请求队列种子URL上限"""
+        return self.get_int('CRAWLER', 'RequestQueueSize', 10000)
+
+    @property
+    def crawler_seed_base(self):
+        """获取种子文件相对路径拼接的站点地址"""
+        return self.get('CRAWLER', 'SeedBase', '')
+
+    @property
+    def crawler_process_queue_bytes(self):
+        """获取处理队列响应体总大小上限（字节）"""
+        return self.get_int('CRAWLER', 'ProcessQueueMB', 64) * 1024 * 1024
+
+    @property
+    def crawler_ui_queue_size(self):
+        """获取UI队列/排除队列长度上限"""
+        return self.get_int('CRAWLER', 'UiQueueSize', 1000)
+
+    @property
+    def crawler_memory_limit_bytes(self):
+        """获取进程内存上限（字节），0表示不限制"""
+        return self.get_int('CRAWLER', 'MemoryLimitMB', 0) * 1024 * 1024
+
+    @property
+    def budget_max_requests(self):
+        """获取每次爬取的请求数上限，0表示不限制"""
+        return self.get_int('BUDGET', 'MaxRequests', 0)
+
+    @property
+    def budget_max_bytes(self):
+        """获取每次爬取的下载量上限（字节），0表示不限制"""
+        return self.get_int('BUDGET', 'MaxMB', 0) * 1024 * 1024
+
+    @property
+    def budget_max_seconds(self):
+        """获取每次爬取的用时上限（秒），0表示不限制"""
+        return self.get_int('BUDGET', 'MaxSeconds', 0)
+
+    @property
+    def budget_host_max_requests(self):
+        """获取每个主机的请求数上限，0表示不限制"""
+        return self.get_int('BUDGET', 'HostMaxRequests', 0)
+
+    @property
+    def budget_host_max_bytes(self):
+        """获取每个主机的下载量上限（字节），0表示不限制"""
+        return self.get_int('BUDGET', 'HostMaxMB', 0) * 1024 * 1024
+
+    @property
+    def budget_host_max_seconds(self):
+        """获取每个主机的用时上限（秒），0表示不限制"""
+        return self.get_int('BUDGET', 'HostMaxSeconds', 0)
+
+    @property
+    def breaker_failure_threshold(self):
+        """获取熔断的连续失败次数，0表示不启用"""
+        return self.get_int('BREAKER', 'FailureThreshold', 5)
+
+    @property
+    def breaker_cooldown(self):
+        """获取熔断冷却时间（秒）"""
+        return float(self.get('BREAKER', 'Cooldown', 30))
+
+    @property
+    def breaker_max_cooldown(self):
+        """获取熔断冷却时间上限（秒）"""
+        return float(self.get('BREAKER', 'MaxCooldown', 300))
+
+    @property
+    def breaker_max_trips(self):
+        """获取视为主机不可用的熔断次数，0表示不限制"""
+        return self.get_int('BREAKER', 'MaxTrips', 3)
+
+    @property
+    def breaker_mode(self):
+        """获取熔断期间URL的处理方式：fail或park"""
+        return self.get('BREAKER', 'Mode', 'fail').lower()
+
+    @property
+    def archive_enabled(self):
+        """获取是否把响应写入存档"""
+        return self.get_boolean('ARCHIVE', 'Enabled', False)
+
+    @property
+    def archive_file(self):
+        """获取存档文件"""
+        return self.get('ARCHIVE', 'File', 'archive.warc.gz')
+
+    @property
+    def archive_compress_level(self):
+        """获取存档的gzip压缩级别"""
+        return min(9, max(1, self.get_int('ARCHIVE', 'CompressLevel', 6)))
+
+    @property
+    def archive_replay_workers(self):
+        """获取离线重放的进程数，0为CPU核数"""
+        return self.get_int('ARCHIVE', 'ReplayWorkers', 0)
+
+    @property
+    def proxy_pool_strategy(self):
+        """获取代理池选择代理的策略（round_robin/least_busy）"""
+        return self.get('PROXYPOOL', 'Strategy', 'round_robin').strip().lower()
+
+    @property
+    def proxy_pool_affinity(self):
+        """获取是否按主机固定代理"""
+        return self.get_boolean('PROXYPOOL', 'Affinity', False)
+
+    @property
+    def proxy_pool_failure_threshold(self):
+        """获取代理连续失败多少次后标记为不可用"""
+        return self.get_int('PROXYPOOL', 'FailureThreshold', 3)
+
+    @property
+    def proxy_pool_cooldown(self):
+        """获取不可用代理的冷却时间（秒）"""
+        return float(self.get('PROXYPOOL', 'Cooldown', 60))
+
+    @property
+    def mirror_concurrency(self):
+        """获取同时经代理重放的请求数"""
+        return self.get_int('MIRROR', 'Concurrency', 4)
+
+    @property
+    def mirror_queue_size(self):
+        """获取重放队列长度上限"""
+        return self.get_int('MIRROR', 'QueueSize', 1000)
+
+    @property
+    def mirror_overflow(self):
+        """获取重放队列满时的处理方式（drop/spool）"""
+        return self.get('MIRROR', 'Overflow', 'drop').strip().lower()
+
+    @property
+    def mirror_spool_file(self):
+        """获取重放暂存文件"""
+        return self.get('MIRROR', 'SpoolFile', 'mirror_spool.jsonl')
+
+    @property
+    def mirror_timeout(self):
+        """获取重放请求的超时时间（秒）"""
+        return float(self.get('MIRROR', 'Timeout', 30))
+
+    @property
+    def mirror_drain_seconds(self):
+        """获取爬取结束后等待重放完成的最长时间（秒）"""
+        return float(self.get('MIRROR', 'DrainSeconds', 30))
+
+    @property
+    def http_max_connections(self):
+        """获取连接池最大连接数"""
+        return self.get_int('HTTP', 'MaxConnections', 100)
+
+    @property
+    def http_max_keepalive(self):
+        """获取最多保持的空闲长连接数"""
+        return self.get_int('HTTP', 'MaxKeepalive', 20)
+
+    @property
+    def http_keepalive_expiry(self):
+        """获取空闲长连接的保持时间（秒）"""
+        return float(self.get('HTTP', 'KeepaliveExpiry', 5))
+
+    @property
+    def http_http2(self):
+        """获取是否启用HTTP/2"""
+        return self.get_boolean('HTTP', 'HTTP2', False)
+
+    @property
+    def dns_cache(self):
+        """获取是否缓存DNS解析结果"""
+        return self.get_boolean('DNS', 'Cache', True)
+
+    @property
+    def dns_ttl(self):
+        """获取DNS解析结果的缓存时间（秒）"""
+        return float(self.get('DNS', 'TTL', 300))
+
+    @property
+    def dns_negative_ttl(self):
+        """获取主机不存在的缓存时间（秒）"""
+        return float(self.get('DNS', 'NegativeTTL', 60))
+
+    @property
+    def dns_max_entries(self):
+        """获取最多缓存的主机数"""
+        return self.get_int('DNS', 'MaxEntries', 10000)
+
+    @property
+    def dns_prefetch(self):
+        """获取是否预解析进入请求队列的主机"""
+        return self.get_boolean('DNS', 'Prefetch', True)
+
+    @property
+    def timeout_adaptive(self):
+        """获取是否按主机自适应请求截止时间"""
+        return self.get_boolean('TIMEOUT', 'Adaptive', True)
+
+    @property
+    def timeout_percentile(self):
+        """获取自适应截止时间使用的耗时分位数"""
+        return float(self.get('TIMEOUT', 'Percentile', 0.95))
+
+    @property
+    def timeout_multiplier(self):
+        """获取自适应截止时间的倍数"""
+        return float(self.get('TIMEOUT', 'Multiplier', 3))
+
+    @property
+    def timeout_floor(self):
+        """获取截止时间下限（秒）"""
+        return float(self.get('TIMEOUT', 'Floor', 2))
+
+    @property
+    def timeout_ceiling(self):
+        """获取截止时间上限（秒）"""
+        return float(self.get('TIMEOUT', 'Ceiling', 60))
+
+    @property
+    def timeout_window(self):
+        """获取每个主机保留的耗时样本数"""
+        return self.get_int('TIMEOUT', 'Window', 200)
+
+    @property
+    def timeout_min_samples(self):
+        """获取开始自适应所需的最少样本数"""
+        return self.get_int('TIMEOUT', 'MinSamples', 20)
+
+    @property
+    def scheduler_max_active_jobs(self):
+        """获取多目标爬取时同时运行的任务数"""
+        return self.get_int('SCHEDULER', 'MaxActiveJobs', 4)
+
+    @property
+    def scheduler_job_scope(self):
+        """获取任务扫描范围的生成方式：host、subdomain或config"""
+        return self.get('SCHEDULER', 'JobScope', 'subdomain')
+
+    @property
+    def scheduler_multi_target_jobs(self):
+        """获取界面中输入多行URL时是否每行作为一个独立任务"""
+        return self.get_boolean('SCHEDULER', 'MultiTargetJobs', False)
+
+    @property
+    def storage_checkpoint_file(self):
+        """获取断点文件路径，为空表示不保存断点"""
+        return self.get('STORAGE', 'Checkpoint', '')
+
+    @property
+    def storage_checkpoint_interval(self):
+        """获取断点写入间隔（秒）"""
+        return self.get_int('STORAGE', 'CheckpointInterval', 5)
+
+    @property
+    def storage_results_db(self):
+        """获取结果库文件路径，为空表示不保存结果"""
+        return self.get('STORAGE', 'ResultsDB', '')
+
+    @property
+    def log_request_file(self):
+        """获取请求日志文件路径"""
+        return self.get('LOG', 'RequestLog', 'requestlog.log')
+
+    @property
+    def log_max_bytes(self):
+        """获取单个日志文件大小上限（字节），0表示不轮转"""
+        return self.get_int('LOG', 'MaxMB', 50) * 1024 * 1024
+
+    @property
+    def log_backup_count(self):
+        """获取轮转保留的日志文件数"""
+        return self.get_int('LOG', 'BackupCount', 3)
+
+    @property
+    def log_json(self):
+        """获取日志文件是否使用JSON行格式"""
+        return self.get_boolean('LOG', 'Json', False)
+
+    @property
+    def log_console(self):
+        """获取日志是否输出到控制台"""
+        return self.get_boolean('LOG', 'Console', True)
+
+    @property
+    def log_level(self):
+        """获取日志级别"""
+        return self.get('LOG', 'Level', 'INFO').upper()
+
+    @property
+    def metrics_snapshot_file(self):
+        """获取指标快照文件路径，为空表示不写快照"""
+        return self.get('METRICS', 'SnapshotFile', '')
+
+    @property
+    def metrics_snapshot_interval(self):
+        """获取指标快照写入间隔（秒）"""
+        return self.get_int('METRICS', 'SnapshotInterval', 10)
+
+    @property
+    def metrics_rule_stats(self):
+        """获取是否统计每条规则的耗时与产出"""
+        return self.get_boolean('METRICS', 'RuleStats', False)
+
+    @property
+    def trace_file(self):
+        """获取阶段耗时追踪文件路径，为空表示不追踪"""
+        return self.get('TRACE', 'File', '')
+
+    @property
+    def trace_sample_rate(self):
+        """获取追踪抽样比例"""
+        return float(self.get('TRACE', 'SampleRate', 0.01))
+
+    @property
+    def bench_corpus_dir(self):
+        """获取规则测试语料目录"""
+        return self.get('BENCH', 'Corpus', os.path.join('benchmarks', 'corpus'))
+
+    @property
+    def bench_time_limit(self):
+        """获取规则测试时间上限（秒）"""
+        return float(self.get('BENCH', 'TimeLimit', 10))
+
+    @property
+    def bench_baseline_file(self):
+        """获取微基准测试基线文件"""
+        return self.get('BENCH', 'Baseline', os.path.join('benchmarks', 'baseline.json'))
+
+    @property
+    def bench_regression_threshold(self):
+        """获取微基准测试回归阈值"""
+        return float(self.get('BENCH', 'RegressionThreshold', 0.2))
+
+    def log_options(self):
+        """获取setup_logger的日志参数"""
+        return {
+            'level': self.log_level,
+            'add_console_handler': self.log_console,
+            'max_bytes': self.log_max_bytes,
+            'backup_count': self.log_backup_count,
+            'json_format': self.log_json,
+        }
+
     @property
     def extractor_Suffix(self):
         """启用参数字典"""
@@ -1,14 +1,20 @@
 from PySide6.QtCore import Signal, QObject
 import asyncio
 import concurrent.futures
+import logging
 import queue
 import threading
 import asyncio
 import time
 from datetime import datetime
 import web_crawler
+import scheduler
 from config import ConfigManager
+from results_store import ResultsStore
 
+# 控制器日志并入请求日志，由同一个后台线程写入，DEBUG级别时才记录调试信息
+logger = logging.getLogger(f"{web_crawler.loggerRequest.name}.controller")
+logger.setLevel(ConfigManager().log_level)
 
 class CrawlerController(QObject):
     """真实爬虫控制器，用于UI与爬虫的交互"""
@@ -17,12 +23,15 @@ class CrawlerController(QObject):
     data_received_signal = Signal(dict)  # 爬虫数据信号，发送爬取到的数据到UI
     log_signal = Signal(str, str, str)  # level, message, timestamp
     exclude_log_signal = Signal(dict)  # timestamp, rule, link, source, parent_index
+    job_progress_signal = Signal(dict)  # 多目标爬取时的任务进度，见CrawlJob.progress
 
     def __init__(self):
         super().__init__()
         self.config = ConfigManager()
         self.is_running = False
         self.depth_to_row = {}  # 用于存储深度和行号的映射关系
+        # 结果库，跨多次爬取保存，供结果查询标签页使用
+        self.results_store = ResultsStore(self.config.storage_results_db) if self.config.storage_results_db else None
 
         # 爬虫相关
         self.crawler_task = None
@@ -33,15 +42,17 @@ class CrawlerController(QObject):
         self.loop = None
         self.crawler_thread = None
 
-    def start_crawler(self, start_url):
+    def start_crawler(self, start_url, resume=False):
         """启动爬虫
         
         Args:
-            start_url: 起始URL，从UI输入框获取
+            start_url: 起始URL，从UI输入框获取；行中指定了 depth=、scope=、name= 等任务选项，或开启了
+                SCHEDULER.MultiTargetJobs时每行作为一个独立任务，否则多行URL作为一次爬取的种子
+            resume: 是否从断点恢复上次未完成的爬取
         """
-        print("[DEBUG] 收到启动爬虫请求")  # 调试输出
+        logger.debug("收到启动爬虫请求")
         if self.is_running:
-            print("[DEBUG] 爬虫已在运行，忽略请求")  # 调试输出
+            logger.debug("爬虫已在运行，忽略请求")
             return
 
         # 确保之前的爬虫已完全停止和清理
@@ -57,6 +68,17 @@ class CrawlerController(QObject):
             except Exception as e:
                 self.log_signal.emit("ERROR", f"关闭旧事件循环时出错: {str(e)}", datetime.now().isoformat())
 
+        jobs = None
+        if not resume and isinstance(start_url, list) and (
+                scheduler.has_job_options(start_url)
+                or (len(start_url) > 1 and self.config.scheduler_multi_target_jobs)):
+            try:
+                jobs = scheduler.parse_jobs(start_url)
+            except ValueError as e:
+                self.status_changed_signal.emit(f"已停止: 任务格式错误: {str(e)}")
+                self.log_signal.emit("ERROR", f"任务格式错误: {str(e)}", datetime.now().isoformat())
+                return
+
         self.is_running = True
         self.status_changed_signal.emit("爬虫已启动")
         self.log_signal.emit("INFO", "开始爬取", datetime.now().isoformat())
@@ -70,90 +92,103 @@ class CrawlerController(QObject):
         self.log_signal.emit("INFO", 
                            f"配置信息: 最大深度={self.config.crawler_max_depth}, 最大重试={self.config.crawler_max_retries}",
                            datetime.now().isoformat())
+        if jobs:
+            self.log_signal.emit("INFO",
+                               f"任务调度: {len(jobs)}个任务, 同时运行{self.config.scheduler_max_active_jobs}个",
+                               datetime.now().isoformat())
 
         # 创建新的事件循环
         self.loop = asyncio.new_event_loop()
 
         # 在新线程中运行爬虫
         def run_crawler_in_thread():
-            print("[DEBUG] 线程函数开始执行")
+            logger.debug("线程函数开始执行")
             
             try:
                 # 创建新的事件循环
                 self.loop = asyncio.new_event_loop()
                 asyncio.set_event_loop(self.loop)
-                print(f"[DEBUG] 新事件循环已创建: {self.loop.is_running()}")
+                logger.debug(f"新事件循环已创建: {self.loop.is_running()}")
                 
-                # 准备爬虫协程
-                print("[DEBUG] 准备运行爬虫协程")
-                coro = web_crawler.run_crawler_with_ui_queue(
-                    start_url,
-                    reset_state=True
-                )
+                # 准备爬虫协程：指定了任务选项或开启了多目标任务时按任务调度，否则作为一次爬取（支持断点续爬）
+                logger.debug("准备运行爬虫协程")
+                if jobs:
+                    coro = scheduler.run_jobs_with_ui_queue(
+                        jobs,
+                        results_store=self.results_store,
+                        on_progress=self.job_progress_signal.emit
+                    )
+                else:
+                    coro = web_crawler.run_crawler_with_ui_queue(
+                        start_url,
+                        reset_state=True,
+                        resume=resume,
+                        results_store=self.results_store
+                    )
                 
                 # 在事件循环中运行协程获取UI队列、排除队列和爬虫任务
-                print("[DEBUG] 开始获取UI队列、排除队列和爬虫任务...")
+                logger.debug("开始获取UI队列、排除队列和爬虫任务...")
                 self.ui_queue, self.exclude_queue, self.crawler_task = self.loop.run_until_complete(coro)
-                print(f"[DEBUG] 获取到UI队列、排除队列和爬虫任务: {self.crawler_task}")
+                logger.debug(f"获取到UI队列、排除队列和爬虫任务: {self.crawler_task}")
                 
                 # 启动队列监控
                 self.ui_queue_monitor = self.loop.create_task(self.monitor_ui_queue())
-                print(f"[DEBUG] UI队列监控任务已创建: {self.ui_queue_monitor}")
+                logger.debug(f"UI队列监控任务已创建: {self.ui_queue_monitor}")
                 
                 # 启动排除队列监控
                 self.exclude_queue_monitor = self.loop.create_task(self.monitor_exclude_queue())
-                print(f"[DEBUG] 排除队列监控任务已创建: {self.exclude_queue_monitor}")
+                logger.debug(f"排除队列监控任务已创建: {self.exclude_queue_monitor}")
                 
                 # 添加爬虫任务完成的回调函数
                 def on_crawler_task_done(task):
                     try:
                         task.result()  # 获取结果，如果有异常会在这里抛出
-                        print("[DEBUG] 爬虫任务已完成")
+                        logger.debug("爬虫任务已完成")
                         # 更新爬虫状态并发送状态更新信号
                         self.is_running = False
                         self.status_changed_signal.emit("爬虫已完成")
                         self.log_signal.emit("INFO", "爬取已完成", datetime.now().isoformat())
                     except asyncio.CancelledError:
-                        print("[DEBUG] 爬虫任务被取消")
+                        logger.debug("爬虫任务被取消")
                         # 更新爬虫状态并发送状态更新信号
                         self.is_running = False
                         self.status_changed_signal.emit("爬虫已停止")
                         self.log_signal.emit("INFO", "爬虫已被取消", datetime.now().isoformat())
                     except Exception as e:
-                        print(f"[ERROR] 爬虫任务出错: {e}")
+                        logger.error(f"爬虫任务出错: {e}")
                         # 更新爬虫状态并发送状态更新信号
                         self.is_running = False
                         self.status_changed_signal.emit("爬虫出错并停止")
                         self.log_signal.emit("ERROR", f"爬虫出错并停止: {str(e)}", datetime.now().isoformat())
                     finally:
-                        print("[DEBUG] 爬虫任务回调执行完毕")
+                        logger.debug("爬虫任务回调执行完毕")
                 
                 # 为爬虫任务添加完成回调
                 self.crawler_task.add_done_callback(on_crawler_task_done)
-                print("[DEBUG] 已为爬虫任务添加完成回调")
+                logger.debug("已为爬虫任务添加完成回调")
                 
-                # 运行事件循环，直到爬虫任务完成
-                print("[DEBUG] 开始运行事件循环，等待爬虫任务完成...")
-                self.loop.run_until_complete(self.crawler_task)
-                print("[DEBUG] 爬虫任务已完成，事件循环退出")
+                # 运行事件循环，直到爬虫任务完成且UI队列数据全部转发
+                logger.debug("开始运行事件循环，等待爬虫任务完成...")
+                self.loop.run_until_complete(asyncio.gather(
+                    self.crawler_task, self.ui_queue_monitor, self.exclude_queue_monitor
+                ))
+                logger.debug("爬虫任务已完成，事件循环退出")
             except asyncio.CancelledError:
-                print("[INFO] 爬虫任务被正常取消")
+                logger.info("爬虫任务被正常取消")
                 # 正常取消不需要打印堆栈跟踪
             except Exception as e:
-                print(f"[ERROR] 爬虫执行过程中出错: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"爬虫执行过程中出错: {e}")
                 self.log_signal.emit("ERROR", f"爬虫出错并停止: {str(e)}", datetime.now().isoformat())
 
             # 分阶段关闭流程
             try:
                 # 第一阶段：取消所有任务
-                print("[DEBUG] 开始取消所有任务...")
+                logger.debug("开始取消所有任务...")
                 pending = asyncio.all_tasks(self.loop)
                 for task in pending:
                     if not task.done() and not task.cancelled():
                         task.cancel()
-                        print(f"[DEBUG] 已取消任务: {task}")
+                        logger.debug(f"已取消任务: {task}")
 
                 # 第二阶段：等待任务完成（最多重试3次）
                 max_retries = 3
@@ -165,39 +200,37 @@ class CrawlerController(QObject):
                     pending = [t for t in asyncio.all_tasks(self.loop) 
                              if not t.done() and not t.cancelled()]
                     if not pending:
-                        print("[DEBUG] 所有任务已完成")
+                        logger.debug("所有任务已完成")
                         break
                     
-                    print(f"[DEBUG] 等待任务完成 (尝试 {attempt + 1}/{max_retries})...")
+                    logger.debug(f"等待任务完成 (尝试 {attempt + 1}/{max_retries})...")
                     try:
                         # 区分任务状态，使用更安全的等待方式
                         done, pending = self.loop.run_until_complete(
                             asyncio.wait(pending, timeout=1.0)
                         )
                         if pending:
-                            print(f"[DEBUG] 仍有 {len(pending)} 个任务未完成")
+                            logger.debug(f"仍有 {len(pending)} 个任务未完成")
                     except asyncio.CancelledError:
-                        print("[DEBUG] 任务已被取消，继续等待")
+                        logger.debug("任务已被取消，继续等待")
                     except Exception as e:
-                        print(f"[WARNING] 等待任务时出错: {e}")
+                        logger.warning(f"等待任务时出错: {e}")
                         # 记录更详细的错误信息
                         if isinstance(e, RuntimeError) and "Event loop stopped" in str(e):
-                            print("[DEBUG] 事件循环状态异常，尝试恢复")
+                            logger.debug("事件循环状态异常，尝试恢复")
 
 
                 # 第三阶段：强制关闭未完成的任务
                 if attempt == max_retries - 1 and pending:
-                    print("[WARNING] 仍有未完成的任务，强制关闭...")
+                    logger.warning("仍有未完成的任务，强制关闭...")
             except Exception as e:
-                print(f"[ERROR] 关闭过程中出错: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"关闭过程中出错: {e}")
             finally:
                 # 标记爬虫已停止
                 self.is_running = False
                 self.status_changed_signal.emit("爬虫已停止")
                 self.log_signal.emit("INFO", "爬取已完成", datetime.now().isoformat())
-                print("[DEBUG] 爬虫线程函数执行完毕")
+                logger.debug("爬虫线程函数执行完毕")
 
                 # 确保在出错时也能正确关闭事件循环
                 if self.loop and not self.loop.is_closed():
@@ -208,13 +241,13 @@ class CrawlerController(QObject):
 
 
         # 启动爬虫线程
-        print("[DEBUG] 准备创建爬虫线程")  # 调试输出
+        logger.debug("准备创建爬虫线程")
         self.crawler_thread = threading.Thread(target=run_crawler_in_thread)
         self.crawler_thread.daemon = True
-        print(f"[DEBUG] 线程状态 before start: alive={self.crawler_thread.is_alive()}")  # 调试输出
+        logger.debug(f"线程状态 before start: alive={self.crawler_thread.is_alive()}")
         self.crawler_thread.start()
-        print(f"[DEBUG] 线程状态 after start: alive={self.crawler_thread.is_alive()}")  # 调试输出
-        print(f"[DEBUG] 线程标识符: {self.crawler_thread.ident}")  # 调试输出
+        logger.debug(f"线程状态 after start: alive={self.crawler_thread.is_alive()}")
+        logger.debug(f"线程标识符: {self.crawler_thread.ident}")
 
     def stop_crawler(self):
         """停止爬虫"""
@@ -333,6 +366,10 @@ class CrawlerController(QObject):
 
 
 
+    def get_metrics(self):
+        """获取当前（或最近一次）爬取的指标(CrawlMetrics)，未开始爬取时为None"""
+        return web_crawler.get_metrics()
+
     def has_results(self):
         """检查是否有结果"""
         # 不再使用result_queue，直接返回False
@@ -344,14 +381,15 @@ class CrawlerController(QObject):
 
         try:
             while True:
-                try:
-                    # 从UI队列获取数据，设置超时以便能够响应取消
-                    ui_data = await asyncio.wait_for(self.ui_queue.get(), timeout=1.0)
-                    
-                    # 如果收到None，表示爬虫已完成
-                    if ui_data is None:
-                        break
+                # 阻塞等待UI队列数据，爬虫结束时会收到None
+                ui_data = await self.ui_queue.get()
+
+                # 如果收到None，表示爬虫已完成
+                if ui_data is None:
+                    break
 
+                # 单条数据出错只记录日志，继续读取到None为止；队列有上限，监控退出会使爬虫阻塞在put上
+                try:
                     # 获取深度
                     depth = ui_data.get('depth', "1")
 
@@ -365,20 +403,16 @@ class CrawlerController(QObject):
                     # 记录日志
                     self.log_signal.emit(
                         "INFO",
-                        f"收到数据: {ui_data['url']} (深度: {depth}, 类型: {ui_data['type']})",
+                        f"收到数据: {ui_data.get('url')} (深度: {depth}, 类型: {ui_data.get('type')})",
                         datetime.now().isoformat()
                     )
-
+                except Exception as e:
+                    logger.exception("处理UI队列数据出错")
+                    self.log_signal.emit("ERROR", f"处理UI队列数据出错: {str(e)}", datetime.now().isoformat())
+                finally:
                     # 标记UI队列任务已完成
                     self.ui_queue.task_done()
 
-                except asyncio.TimeoutError:
-                    # 检查爬虫任务是否已完成
-                    if self.crawler_task and self.crawler_task.done():
-                        break
-                    # 否则继续等待
-                    continue
-
         except asyncio.CancelledError:
             self.log_signal.emit("DEBUG", "UI队列监控任务被取消", datetime.now().isoformat())
         except Exception as e:
@@ -396,28 +430,24 @@ class CrawlerController(QObject):
         """监控排除队列，将排除链接数据发送到UI"""
         try:
             while True:
-                try:
-                    # 从排除队列获取数据，设置超时以便能够响应取消
-                    exclude_data = await asyncio.wait_for(self.exclude_queue.get(), timeout=1.0)
-                    
-                    # 如果收到None，表示爬虫已完成
-                    if exclude_data is None:
-                        break
+                # 阻塞等待排除队列数据，爬虫结束时会收到None
+                exclude_data = await self.exclude_queue.get()
+
+                # 如果收到None，表示爬虫已完成
+                if exclude_data is None:
+                    break
 
+                # 单条数据出错只记录日志，继续读取到None为止
+                try:
                     # 处理排除链接消息
                     self.exclude_log_signal.emit(exclude_data)
-
-
+                except Exception as e:
+                    logger.exception("处理排除队列数据出错")
+                    self.log_signal.emit("ERROR", f"处理排除队列数据出错: {str(e)}", datetime.now().isoformat())
+                finally:
                     # 标记排除队列任务已完成
                     self.exclude_queue.task_done()
 
-                except asyncio.TimeoutError:
-                    # 检查爬虫任务是否已完成
-                    if self.crawler_task and self.crawler_task.done():
-                        break
-                    # 否则继续等待
-                    continue
-
         except asyncio.CancelledError:
             self.log_signal.emit("DEBUG", "排除队列监控任务被取消", datetime.now().isoformat())
         except Exception as e:
@@ -436,7 +466,7 @@ if __name__ == '__main__':
     crawler_controller.start_crawler(start_url)
     
     # 等待爬虫线程完成
-    print("[MAIN] 等待爬虫线程完成...")
+    logger.info("等待爬虫线程完成...")
     if hasattr(crawler_controller, 'crawler_thread') and crawler_controller.crawler_thread:
         crawler_controller.crawler_thread.join()
-    print("[MAIN] 爬虫线程已完成，程序退出")
+    logger.info("爬虫线程已完成，程序退出")
@@ -0,0 +1,201 @@
+## 异步DNS缓存：放在httpx传输层的网络后端前面，同一主机名只向系统解析器查询一次，过期后重新查询
+## 不存在的主机(NXDOMAIN)也缓存一段时间，使其URL立即失败；主机进入请求队列时预先解析，建连时不再等待解析
+import asyncio
+import ipaddress
+import socket
+import time
+
+import httpcore
+
+# 系统解析器返回这些错误时视为主机不存在，进行否定缓存；其他错误（如EAI_AGAIN临时失败）不缓存
+NXDOMAIN_ERRORS = {getattr(socket, name) for name in ("EAI_NONAME", "EAI_NODATA") if hasattr(socket, name)}
+
+
+class _Entry:
+    __slots__ = ("addresses", "expires", "error")
+
+    def __init__(self, addresses, expires, error=None):
+        self.addresses = addresses
+        self.expires = expires
+        self.error = error
+
+
+def is_ip_address(host):
+    try:
+        ipaddress.ip_address(host.strip("[]"))
+        return True
+    except ValueError:
+        return False
+
+
+class DnsCache:
+    """
+    DNS缓存
+    解析成功的结果缓存ttl秒，主机不存在缓存negative_ttl秒；同一主机同时只有一个查询，其他请求等待该查询的结果。
+    系统解析器(getaddrinfo)不返回记录的TTL，缓存时间由配置指定
+    """
+
+    # 同时进行的预解析数
+    PREFETCH_CONCURRENCY = 16
+
+    def __init__(self, ttl=300.0, negative_ttl=60.0, max_entries=10000, prefetch=True):
+        """
+        :param ttl: 解析结果的缓存时间（秒）
+        :param negative_ttl: 主机不存在的缓存时间（秒）
+        :param max_entries: 最多缓存的主机数，超过时清除过期的条目，仍超过时清除最早的条目
+        :param prefetch: 是否预解析进入请求队列的主机
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.prefetch_enabled = prefetch
+        self.entries = {}
+        self._pending = {}
+        self._prefetch_tasks = set()
+        self._prefetch_semaphore = None
+        self.lookups = 0
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.errors = 0
+
+    def _get(self, host):
+        entry = self.entries.get(host)
+        if entry is not None and entry.expires <= time.monotonic():
+            del self.entries[host]
+            return None
+        return entry
+
+    async def resolve(self, host, port=0):
+        """
+        解析主机名
+        :return: IP地址列表，按系统解析器返回的顺序
+        :raises socket.gaierror: 解析失败，主机不存在时缓存期内直接抛出
+        """
+        self.lookups += 1
+        entry = self._get(host)
+        if entry is not None:
+            if entry.error is not None:
+                self.negative_hits += 1
+                raise socket.gaierror(*entry.error)
+            self.hits += 1
+            return entry.addresses
+        self.misses += 1
+        return await self._lookup(host, port)
+
+    async def _lookup(self, host, port):
+        future = self._pending.get(host)
+        if future is None:
+            future = self._pending[host] = asyncio.ensure_future(self._query(host, port))
+            future.add_done_callback(lambda _: self._pending.pop(host, None))
+        # 等待方被取消时不取消共用的查询
+        return await asyncio.shield(future)
+
+    async def _query(self, host, port):
+        loop = asyncio.get_running_loop()
+        try:
+            infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        except socket.gaierror as e:
+            self.errors += 1
+            if e.errno in NXDOMAIN_ERRORS and self.negative_ttl > 0:
+                self._store(host, _Entry(None, time.monotonic() + self.negative_ttl, e.args))
+            raise
+        # 去重并保持顺序
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        if self.ttl > 0:
+            self._store(host, _Entry(addresses, time.monotonic() + self.ttl))
+        return addresses
+
+    def _store(self, host, entry):
+        entries = self.entries
+        if len(entries) >= self.max_entries and host not in entries:
+            now = time.monotonic()
+            for key in [key for key, value in entries.items() if value.expires <= now]:
+                del entries[key]
+            while len(entries) >= self.max_entries:
+                del entries[next(iter(entries))]
+        entries[host] = entry
+
+    def prefetch(self, host):
+        """在后台预解析主机，已缓存、正在查询或为IP地址时不重复解析"""
+        if not self.prefetch_enabled or not host or host in self._pending or is_ip_address(host):
+            return
+        if self._get(host) is not None:
+            return
+        if self._prefetch_semaphore is None:
+            self._prefetch_semaphore = asyncio.Semaphore(self.PREFETCH_CONCURRENCY)
+        task = asyncio.ensure_future(self._prefetch(host))
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+
+    async def _prefetch(self, host):
+        async with self._prefetch_semaphore:
+            if host in self._pending or self._get(host) is not None:
+                return
+            self.prefetched += 1
+            try:
+                await self._lookup(host, 0)
+            except (OSError, UnicodeError):
+                pass
+
+    def close(self):
+        """取消未完成的预解析"""
+        for task in list(self._prefetch_tasks):
+            task.cancel()
+
+    def stats(self):
+        """缓存命中情况，供日志和指标展示"""
+        return {
+            "entries": len(self.entries),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.negative_hits) / self.lookups, 4) if self.lookups else None,
+            "prefetched": self.prefetched,
+            "errors": self.errors,
+        }
+
+
+class CachingBackend(httpcore.AsyncNetworkBackend):
+    """
+    httpcore网络后端，建立TCP连接前通过DnsCache解析主机名，依次尝试解析到的地址
+    连接超时是解析和全部尝试的总时限，剩余时间平分给尚未尝试的地址，多个不通的地址不会使等待成倍增加
+    """
+
+    def __init__(self, cache, backend=None):
+        self.cache = cache
+        self._backend = backend or httpcore.AnyIOBackend()
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        if is_ip_address(host):
+            return await self._backend.connect_tcp(host, port, timeout=timeout, local_address=local_address,
+                                                   socket_options=socket_options)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            addresses = await asyncio.wait_for(self.cache.resolve(host, port), timeout)
+        except asyncio.TimeoutError:
+            raise httpcore.ConnectTimeout(f"DNS解析超时: {host}") from None
+        except socket.gaierror as e:
+            raise httpcore.ConnectError(f"DNS解析失败: {host} {e}") from None
+        error = None
+        for index, address in enumerate(addresses):
+            attempt_timeout = None
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise httpcore.ConnectTimeout(f"连接超时: {host}") from error
+                attempt_timeout = remaining / (len(addresses) - index)
+            try:
+                return await self._backend.connect_tcp(address, port, timeout=attempt_timeout,
+                                                       local_address=local_address, socket_options=socket_options)
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as e:
+                error = e
+        raise error or httpcore.ConnectError(f"DNS解析无结果: {host}")
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds):
+        await self._backend.sleep(seconds)
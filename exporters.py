@@ -0,0 +1,250 @@
+## 爬取结果/排除日志的流式导出（JSONL、CSV、HAR），逐条写入文件，内存占用与条数无关
+import csv
+import json
+import os
+import sys
+from datetime import datetime
+
+# 爬取结果导出字段
+RESULT_FIELDS = ["timestamp", "url", "status", "content_type", "size", "depth", "type", "rules", "error", "job"]
+RESULT_HEADERS = ["时间", "URL", "响应状态", "类型", "大小", "深度序号", "链接来源", "规则", "错误", "任务"]
+
+# 排除日志导出字段
+EXCLUDE_FIELDS = ["timestamp", "rule", "link", "source", "parent_index", "job"]
+EXCLUDE_HEADERS = ["时间", "排除规则", "排除链接", "链接来源", "父链接序号", "任务"]
+
+FORMATS = ("jsonl", "csv", "har")
+# 排除日志没有响应，不支持HAR
+EXCLUDE_FORMATS = ("jsonl", "csv")
+
+
+def normalize_result(record):
+    """
+    统一结果格式，兼容爬虫发出的结果行和结果库查询出的行
+    规则名统一为列表，错误状态统一为'error'
+    """
+    rules = record.get("rules")
+    if rules is None:
+        regex_names = record.get("regex_names") or ()
+        rules = [regex_names] if isinstance(regex_names, str) else sorted(regex_names)
+    elif isinstance(rules, str):
+        rules = [rule for rule in rules.split(",") if rule]
+    status = record.get("status")
+    return {
+        "timestamp": record.get("timestamp"),
+        "url": record.get("url"),
+        "status": "error" if status is None else status,
+        "content_type": record.get("content_type"),
+        "size": record.get("size"),
+        "depth": record.get("depth"),
+        "type": record.get("type"),
+        "rules": rules,
+        "error": record.get("error"),
+        "job": record.get("job"),
+    }
+
+
+class _Exporter:
+    """
+    导出器基类，path为'-'时写到标准输出；实现add_result，可直接作为爬虫的结果输出；
+    实现add_exclusion，可作为爬虫的排除日志输出（open_exclusion_exporter创建）
+    """
+
+    def __init__(self, path, fields=None, normalize=True):
+        """
+        :param path: 文件路径或'-'
+        :param fields: 导出字段，默认为爬取结果字段
+        :param normalize: 是否按爬取结果格式统一字段，导出排除日志时为False
+        """
+        self.path = path
+        self.fields = fields or RESULT_FIELDS
+        self.normalize = normalize
+        self.count = 0
+        if path == "-":
+            self._file = sys.stdout
+            self._owns_file = False
+        else:
+            self._file = open(path, "w", encoding="utf-8", newline="")
+            self._owns_file = True
+        self._begin()
+
+    def _begin(self):
+        pass
+
+    def _end(self):
+        pass
+
+    def _write(self, record):
+        raise NotImplementedError
+
+    def add_result(self, record):
+        """写入一条记录"""
+        self._write(normalize_result(record) if self.normalize else {field: record.get(field) for field in self.fields})
+        self.count += 1
+
+    def add_exclusion(self, entry):
+        """写入一条排除日志"""
+        self.add_result(entry)
+
+    def write_all(self, records, progress=None, progress_every=1000):
+        """
+        逐条写入可迭代对象中的全部记录
+        :param progress: 进度回调，参数为已写入条数
+        """
+        for record in records:
+            self.add_result(record)
+            if progress is not None and self.count % progress_every == 0:
+                progress(self.count)
+        return self.count
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        self._end()
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class JsonlExporter(_Exporter):
+    """每行一个JSON对象"""
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False, default=list))
+        self._file.write("\n")
+
+
+class CsvExporter(_Exporter):
+    """CSV，首行为表头"""
+
+    def __init__(self, path, fields=None, normalize=True, headers=None):
+        self.headers = headers
+        super().__init__(path, fields, normalize)
+
+    def _begin(self):
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.headers or self.fields)
+
+    def _write(self, record):
+        row = []
+        for field in self.fields:
+            value = record.get(field)
+            if isinstance(value, (list, tuple, set)):
+                value = "、".join(str(v) for v in value)
+            row.append("" if value is None else value)
+        self._writer.writerow(row)
+
+
+class HarExporter(_Exporter):
+    """HAR 1.2，先写入文件头，逐条追加entries，关闭时补全结尾"""
+
+    def __init__(self, path, fields=None, normalize=True, method="GET"):
+        self.method = method
+        super().__init__(path, fields, normalize)
+
+    def _begin(self):
+        self._file.write('{"log": {"version": "1.2", "creator": {"name": "FindAPI", "version": "1.0"}, "entries": [\n')
+
+    def _end(self):
+        self._file.write("\n]}}\n")
+
+    def _write(self, record):
+        status = record.get("status")
+        content_type = record.get("content_type") or ""
+        size = record.get("size")
+        size = size if isinstance(size, int) else -1
+        entry = {
+            "startedDateTime": _har_datetime(record.get("timestamp")),
+            "time": 0,
+            "request": {
+                "method": self.method,
+                "url": record.get("url"),
+                "httpVersion": "HTTP/1.1",
+                "cookies": [],
+                "headers": [],
+                "queryString": [],
+                "headersSize": -1,
+                "bodySize": -1,
+            },
+            "response": {
+                "status": status if isinstance(status, int) else 0,
+                "statusText": record.get("error") or "",
+                "httpVersion": "HTTP/1.1",
+                "cookies": [],
+                "headers": [{"name": "Content-Type", "value": content_type}] if content_type else [],
+                "content": {"size": size, "mimeType": content_type},
+                "redirectURL": "",
+                "headersSize": -1,
+                "bodySize": size,
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": 0, "receive": 0},
+            "_depth": record.get("depth"),
+            "_type": record.get("type"),
+            "_rules": record.get("rules"),
+        }
+        if self.count:
+            self._file.write(",\n")
+        self._file.write(json.dumps(entry, ensure_ascii=False, default=list))
+
+
+def _har_datetime(timestamp):
+    """结果中的时间为本地时间 'YYYY-MM-DD HH:MM:SS'，转为带时区的ISO 8601"""
+    now = datetime.now()
+    if timestamp:
+        try:
+            return datetime.fromisoformat(timestamp).astimezone().isoformat()
+        except ValueError:
+            pass
+        try:
+            # 旧版本结果库中的时间为'月-日 时:分:秒'，没有年份，取不晚于当前时间的最近一年
+            parsed = datetime.strptime(f"{now.year}-{timestamp}", "%Y-%m-%d %H:%M:%S")
+            if parsed > now:
+                parsed = parsed.replace(year=now.year - 1)
+            return parsed.astimezone().isoformat()
+        except ValueError:
+            pass
+    return now.astimezone().isoformat()
+
+
+def detect_format(path, fmt=None):
+    """根据格式参数或文件扩展名判断导出格式，默认为jsonl"""
+    if fmt:
+        fmt = fmt.lower()
+    else:
+        fmt = os.path.splitext(path)[1].lstrip(".").lower()
+    return fmt if fmt in FORMATS else "jsonl"
+
+
+def open_exporter(path, fmt=None, fields=None, normalize=True, headers=None):
+    """
+    创建导出器
+    :param path: 文件路径，'-'表示标准输出
+    :param fmt: jsonl/csv/har，为None时按扩展名判断
+    """
+    fmt = detect_format(path, fmt)
+    if fmt == "csv":
+        return CsvExporter(path, fields, normalize, headers)
+    if fmt == "har":
+        return HarExporter(path, fields, normalize)
+    return JsonlExporter(path, fields, normalize)
+
+
+def open_exclusion_exporter(path, fmt=None):
+    """
+    创建排除日志导出器
+    :param path: 文件路径，'-'表示标准输出
+    :param fmt: jsonl/csv，为None时按扩展名判断
+    """
+    fmt = detect_format(path, fmt)
+    if fmt not in EXCLUDE_FORMATS:
+        raise ValueError(f"排除日志只能导出为{'/'.join(EXCLUDE_FORMATS)}: {path}")
+    return open_exporter(path, fmt, EXCLUDE_FIELDS, normalize=False, headers=EXCLUDE_HEADERS)
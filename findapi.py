@@ -0,0 +1,395 @@
+## 命令行入口，不加载Qt，适合在无界面的服务器、定时任务中爬取和查询结果
+## 爬取: python findapi.py crawl https://www.example.com/ [-f seeds.txt] [-o results.jsonl] [--set CRAWLER.MaxDepth=3]
+## 多目标: python findapi.py crawl --jobs -f targets.txt [--max-active 8]，每个目标作为独立任务
+## 查询: python findapi.py query [--crawl latest] [--status 200] [--content-type json] [-o -]
+## 排除日志: python findapi.py crawl URL --exclusions excluded.csv，或从结果库导出 python findapi.py query --exclusions [--rule RULE]
+## 存档与离线重放: python findapi.py crawl URL --archive archive.warc.gz，修改规则后 python findapi.py replay [-o links.jsonl]
+import argparse
+import asyncio
+import itertools
+import os
+import sys
+import time
+
+# 退出码
+EXIT_OK = 0
+# 爬取或查询过程中出现未处理的异常
+EXIT_FAILURE = 1
+# 参数错误（argparse默认）
+EXIT_USAGE = 2
+# 没有种子URL、所有请求都失败，或查询没有结果
+EXIT_NO_RESULTS = 3
+# 被Ctrl+C中断，配置了STORAGE.Checkpoint时可用--resume继续
+EXIT_INTERRUPTED = 130
+
+
+class CrawlSummary:
+    """统计爬取结果，作为爬虫的结果输出之一"""
+
+    def __init__(self):
+        self.responses = 0
+        self.errors = 0
+        self.status = {}
+
+    def add_result(self, result):
+        status = result.get('status')
+        if isinstance(status, int):
+            self.responses += 1
+            self.status[status] = self.status.get(status, 0) + 1
+        else:
+            self.errors += 1
+
+
+class OutputSink:
+    """结果文件/排除日志文件输出，标准输出被下游关闭（如 | head）时停止爬取，而不是把每条结果都记为异常"""
+
+    def __init__(self, exporter):
+        self.exporter = exporter
+        self.closed = False
+        self.on_closed = None
+
+    def add_result(self, result):
+        self._write(self.exporter.add_result, result)
+
+    def add_exclusion(self, entry):
+        self._write(self.exporter.add_exclusion, entry)
+
+    def _write(self, write, record):
+        if self.closed:
+            return
+        try:
+            write(record)
+        except BrokenPipeError:
+            self.closed = True
+            if self.on_closed is not None:
+                self.on_closed()
+
+    def close(self):
+        try:
+            self.exporter.close()
+        except BrokenPipeError:
+            self.closed = True
+
+
+def _discard_stdout():
+    """标准输出已被关闭，之后的写入（包括退出时的flush）都丢弃"""
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+
+
+def parse_overrides(items):
+    """
+    解析--set参数
+    :param items: ["SECTION.Option=value", ...]
+    :return: [(section, option, value), ...]
+    """
+    overrides = []
+    for item in items or ():
+        key, sep, value = item.partition("=")
+        section, dot, option = key.partition(".")
+        if not sep or not dot or not section.strip() or not option.strip():
+            raise ValueError(f"配置项格式应为 SECTION.Option=value: {item}")
+        overrides.append((section.strip().upper(), option.strip(), value.strip()))
+    return overrides
+
+
+def apply_overrides(config, overrides):
+    """在当前进程内修改配置，不写入config.ini"""
+    for section, option, value in overrides:
+        config.override(section, option, value)
+
+
+def _log(message, quiet=False):
+    if not quiet:
+        print(message, file=sys.stderr, flush=True)
+
+
+def cmd_crawl(args, config):
+    import web_crawler
+    from exporters import open_exclusion_exporter, open_exporter
+    from log import setup_logger, shutdown_loggers
+    from results_store import ResultsStore
+
+    # 导入web_crawler后再重建请求日志，-q时不输出到控制台（控制台日志写到标准错误，不影响标准输出的结果）
+    options = config.log_options()
+    if args.quiet:
+        options['add_console_handler'] = False
+    setup_logger(web_crawler.loggerRequest.name, config.log_request_file, **options)
+
+    # 种子文件边读边爬，不预先读入内存
+    seeds = list(args.urls)
+    if args.seed_file:
+        seed_file = web_crawler.SeedFile(args.seed_file, args.seed_base)
+        start_url = itertools.chain(seeds, seed_file) if seeds else seed_file
+    elif seeds:
+        start_url = seeds[0] if len(seeds) == 1 else seeds
+    elif args.resume:
+        if not config.storage_checkpoint_file:
+            _log("未配置断点文件(STORAGE.Checkpoint)，无法继续爬取")
+            return EXIT_NO_RESULTS
+        start_url = None
+    else:
+        _log("没有种子URL，请指定URL或-f种子文件")
+        return EXIT_NO_RESULTS
+
+    jobs = None
+    if args.jobs:
+        from scheduler import parse_jobs
+        try:
+            jobs = parse_jobs([start_url] if isinstance(start_url, str) else start_url)
+        except ValueError as e:
+            _log(str(e))
+            return EXIT_USAGE
+        if not jobs:
+            _log("没有种子URL，请指定URL或-f种子文件")
+            return EXIT_NO_RESULTS
+
+    summary = CrawlSummary()
+    try:
+        exclusions = OutputSink(open_exclusion_exporter(args.exclusions)) if args.exclusions else None
+    except ValueError as e:
+        _log(str(e))
+        return EXIT_USAGE
+    output = OutputSink(open_exporter(args.output, args.format)) if args.output else None
+    results_store = ResultsStore(config.storage_results_db) if config.storage_results_db and not args.no_store else None
+    if output is None and results_store is None:
+        _log("未指定-o且未配置结果库(STORAGE.ResultsDB)，结果只计入汇总", args.quiet)
+    sinks = [summary] + ([output] if output is not None else [])
+    exclude_sinks = [exclusions] if exclusions is not None else []
+
+    scheduler = None
+
+    async def run():
+        nonlocal scheduler
+        if jobs:
+            from scheduler import JobScheduler
+            scheduler = JobScheduler(jobs, args.method, args.max_active, results_store=results_store, sinks=sinks,
+                                     exclude_sinks=exclude_sinks)
+            crawl_task = asyncio.create_task(scheduler.run())
+        else:
+            crawl_task = asyncio.create_task(web_crawler.main(start_url, args.method, resume=args.resume,
+                                                              results_store=results_store, sinks=sinks,
+                                                              exclude_sinks=exclude_sinks))
+        for sink in (output, exclusions):
+            if sink is not None:
+                sink.on_closed = crawl_task.cancel
+        try:
+            await crawl_task
+        except asyncio.CancelledError:
+            # 下游不再读取结果，按正常结束处理；配置了断点文件时可用--resume继续
+            if not any(sink is not None and sink.closed for sink in (output, exclusions)):
+                raise
+
+    started = time.perf_counter()
+    code = EXIT_OK
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        code = EXIT_INTERRUPTED
+    except Exception as e:
+        _log(f"爬取出错: {type(e).__name__}: {e}")
+        code = EXIT_FAILURE
+    finally:
+        for sink in (output, exclusions):
+            if sink is not None:
+                sink.close()
+                if sink.closed:
+                    _discard_stdout()
+        if results_store is not None:
+            results_store.close()
+        shutdown_loggers()
+
+    if code == EXIT_OK and summary.responses == 0:
+        code = EXIT_NO_RESULTS
+    crawl_id = results_store.crawl_id if results_store is not None else None
+    # 用完的预算
+    if scheduler is not None:
+        exhausted = [f"{name}: {', '.join(budgets)}" for name, budgets in scheduler.summary()["budget_exhausted"].items()]
+    else:
+        metrics = web_crawler.get_metrics()
+        budget = metrics.extra.get("budget") if metrics is not None else None
+        exhausted = [item["budget"] if item["host"] is None else f"{item['host']}: {item['budget']}"
+                     for item in budget()["exhausted"]] if budget is not None else []
+    status = ", ".join(f"{k}: {v}" for k, v in sorted(summary.status.items()))
+    _log(f"{'爬取已中断' if code == EXIT_INTERRUPTED else '爬取完成'}: {summary.responses} 个响应"
+         f"{f'（{status}）' if status else ''}，{summary.errors} 个请求失败，"
+         f"用时 {time.perf_counter() - started:.1f} 秒" + (f"，结果库编号 {crawl_id}" if crawl_id else ""), args.quiet)
+    if exhausted:
+        _log(f"预算已用完: {'; '.join(exhausted)}", args.quiet)
+    return code
+
+
+def cmd_replay(args, config, overrides):
+    import json
+    from replay import replay
+
+    path = args.archive or config.archive_file
+    if not os.path.exists(path) or not os.path.exists(path + ".idx"):
+        _log(f"存档不存在: {path}")
+        return EXIT_FAILURE
+
+    output = None
+    if args.output:
+        output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    def on_row(row):
+        if output is not None and (args.excluded or row["kind"] == "link"):
+            output.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    try:
+        summary = replay(path, args.workers if args.workers is not None else config.archive_replay_workers,
+                         args.scope, args.crawl, config._config_path, overrides, on_row)
+    except BrokenPipeError:
+        _discard_stdout()
+        return EXIT_OK
+    finally:
+        if output is not None and output is not sys.stdout:
+            output.close()
+    _log(f"重放完成: {summary['records']} 个响应，{summary['workers']} 个进程，用时 {summary['elapsed']} 秒；"
+         f"提取 {summary['links']} 个链接（存档中没有的 {summary['new']} 个），排除 {summary['excluded']} 个", args.quiet)
+    for title, counts in (("规则", summary["rules"]), ("排除", summary["excluded_rules"])):
+        if counts:
+            _log(f"{title}: " + ", ".join(f"{name} {count}" for name, count in counts.items()), args.quiet)
+    return EXIT_OK if summary["records"] else EXIT_NO_RESULTS
+
+
+def cmd_query(args, config):
+    from exporters import open_exclusion_exporter, open_exporter
+    from results_store import ResultsStore
+
+    path = args.db or config.storage_results_db
+    if not path or not os.path.exists(path):
+        _log(f"结果库不存在: {path or '未配置STORAGE.ResultsDB'}")
+        return EXIT_FAILURE
+
+    store = ResultsStore(path)
+    try:
+        if args.list_crawls:
+            crawls = store.distinct("crawl")
+            for crawl in crawls:
+                print(f"{crawl}\t{store.count(crawl=crawl)}")
+            return EXIT_OK if crawls else EXIT_NO_RESULTS
+
+        crawl = args.crawl
+        if crawl == "latest":
+            crawls = store.distinct("crawl")
+            if not crawls:
+                return EXIT_NO_RESULTS
+            crawl = crawls[-1]
+        if args.exclusions:
+            filters = dict(crawl=crawl, job=args.job, rule=args.rule, link=args.url)
+            count_rows, iter_rows = store.count_exclusions, store.iter_exclusions
+        else:
+            filters = dict(crawl=crawl, job=args.job, host=args.host, status=args.status,
+                           content_type=args.content_type, rule=args.rule, depth_level=args.depth_level, url=args.url)
+            count_rows, iter_rows = store.count, store.iter_results
+
+        if args.count:
+            count = count_rows(**filters)
+            print(count)
+            return EXIT_OK if count else EXIT_NO_RESULTS
+
+        try:
+            exporter = open_exclusion_exporter(args.output, args.format) if args.exclusions \
+                else open_exporter(args.output, args.format)
+        except ValueError as e:
+            _log(str(e))
+            return EXIT_USAGE
+        try:
+            with exporter:
+                count = exporter.write_all(iter_rows(**filters))
+        except BrokenPipeError:
+            _discard_stdout()
+            return EXIT_OK
+        return EXIT_OK if count else EXIT_NO_RESULTS
+    finally:
+        store.close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="findapi", description="从响应中发现API的爬虫（命令行版）")
+    parser.add_argument("-c", "--config", default="config.ini", help="配置文件，默认为当前目录的config.ini")
+    parser.add_argument("--set", action="append", default=[], metavar="SECTION.Option=value",
+                        help="临时修改配置项，可多次指定，如 --set CRAWLER.MaxDepth=3 --set CRAWLER.SubDomain=*.example.com")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    crawl = subparsers.add_parser("crawl", help="爬取，结果逐条输出")
+    crawl.add_argument("urls", nargs="*", help="种子URL")
+    crawl.add_argument("-f", "--seed-file", help="种子文件，每行一个URL，'-'为标准输入；续爬时再次指定可继续写入上次未写完的种子")
+    crawl.add_argument("--seed-base", help="种子文件中相对路径拼接的站点地址，默认为CRAWLER.SeedBase")
+    crawl.add_argument("-o", "--output", help="结果文件，'-'为标准输出，不指定时只写入结果库（STORAGE.ResultsDB）")
+    crawl.add_argument("--format", choices=("jsonl", "csv", "har"), help="结果格式，默认按文件扩展名，无法判断时为jsonl")
+    crawl.add_argument("-X", "--method", default="GET", help="请求方法")
+    crawl.add_argument("--resume", action="store_true", help="从断点继续上次未完成的爬取，需配置STORAGE.Checkpoint")
+    crawl.add_argument("--jobs", action="store_true",
+                       help="每个种子作为独立任务，各自的扫描范围由SCHEDULER.JobScope决定，行中可指定 depth=、scope=、name=")
+    crawl.add_argument("--max-active", type=int, help="--jobs时同时运行的任务数，默认为SCHEDULER.MaxActiveJobs")
+    crawl.add_argument("--archive", metavar="FILE", help="把响应写入存档文件（WARC格式），供replay离线重放，默认按ARCHIVE.Enabled")
+    crawl.add_argument("--exclusions", metavar="FILE",
+                       help="排除日志文件（jsonl/csv，按扩展名），爬取时逐条写入；'-'为标准输出")
+    crawl.add_argument("--no-store", action="store_true", help="不写入结果库")
+    crawl.add_argument("-q", "--quiet", action="store_true", help="不在标准错误输出请求日志和汇总")
+
+    query = subparsers.add_parser("query", help="从结果库查询结果")
+    query.add_argument("--db", help="结果库文件，默认为STORAGE.ResultsDB")
+    query.add_argument("--crawl", default="latest", help="爬取编号，'latest'为最近一次，'all'为全部")
+    query.add_argument("--job", help="任务名")
+    query.add_argument("--host", help="主机名，支持*通配")
+    query.add_argument("--status", help="状态码，'error'为请求异常")
+    query.add_argument("--content-type", help="响应类型，如 application/json 或 json")
+    query.add_argument("--rule", help="规则名；--exclusions时为排除规则")
+    query.add_argument("--depth-level", type=int, help="深度层级，1为种子URL")
+    query.add_argument("--url", help="URL包含的关键字；--exclusions时为排除链接包含的关键字")
+    query.add_argument("-o", "--output", default="-", help="结果文件，默认为标准输出")
+    query.add_argument("--format", choices=("jsonl", "csv", "har"), help="结果格式，默认按文件扩展名，无法判断时为jsonl")
+    query.add_argument("--count", action="store_true", help="只输出结果数")
+    query.add_argument("--list-crawls", action="store_true", help="列出结果库中的爬取编号及结果数")
+    query.add_argument("--exclusions", action="store_true",
+                       help="查询排除日志而不是爬取结果（jsonl/csv），可按--job、--rule、--url筛选")
+
+    replay = subparsers.add_parser("replay", help="对响应存档离线重放链接提取和排除规则，不发起网络请求")
+    replay.add_argument("archive", nargs="?", help="存档文件，默认为ARCHIVE.File")
+    replay.add_argument("--crawl", help="爬取编号，'latest'为最近一次，默认为全部")
+    replay.add_argument("--scope", help="扫描范围，默认为CRAWLER.SubDomain")
+    replay.add_argument("-j", "--workers", type=int, help="进程数，默认为ARCHIVE.ReplayWorkers（0为CPU核数）")
+    replay.add_argument("-o", "--output", help="提取到的链接输出文件（JSONL），'-'为标准输出，不指定时只输出汇总")
+    replay.add_argument("--excluded", action="store_true", help="输出中同时包含被排除的链接")
+    replay.add_argument("-q", "--quiet", action="store_true", help="不在标准错误输出汇总")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "crawl", None) == "all":
+        args.crawl = None
+    if args.command == "crawl" and args.jobs and args.resume:
+        parser.error("--jobs不支持--resume断点续爬")
+
+    try:
+        overrides = parse_overrides(args.set)
+    except ValueError as e:
+        parser.error(str(e))
+
+    # 默认的config.ini不存在时创建默认配置，与界面版一致；指定的配置文件必须存在
+    if args.config != "config.ini" and not os.path.exists(args.config):
+        parser.error(f"配置文件不存在: {args.config}")
+
+    from config import ConfigManager
+    # 在配置单例创建前指定配置文件
+    ConfigManager._config_path = os.path.abspath(args.config)
+    config = ConfigManager()
+    apply_overrides(config, overrides)
+
+    if args.command == "crawl":
+        if args.archive:
+            config.override("ARCHIVE", "Enabled", "True")
+            config.override("ARCHIVE", "File", args.archive)
+        return cmd_crawl(args, config)
+    if args.command == "replay":
+        return cmd_replay(args, config, overrides)
+    return cmd_query(args, config)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
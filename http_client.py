@@ -0,0 +1,273 @@
+## 共享HTTP客户端：一次爬取（或多目标调度的全部任务）只建一个客户端，所有抓取协程共用一个连接池
+## 连接数上限、长连接数量与保持时间、HTTP/2多路复用可配置，并统计连接池的使用情况
+import contextlib
+
+import httpcore
+import httpx
+
+from config import ConfigManager
+from dns_cache import CachingBackend, DnsCache
+from proxy_pool import ProxyPoolTransport, parse_proxies
+
+config = ConfigManager()
+
+
+def http2_available():
+    """是否安装了HTTP/2依赖（pip install httpx[http2]）"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def build_limits(max_connections=None, max_keepalive=None, keepalive_expiry=None):
+    """
+    连接池限制
+    :param max_connections: 最大连接数，为None时使用配置HTTP.MaxConnections
+    :param max_keepalive: 最多保持的空闲长连接数，为None时使用配置HTTP.MaxKeepalive
+    :param keepalive_expiry: 空闲长连接的保持时间（秒），为None时使用配置HTTP.KeepaliveExpiry
+    """
+    return httpx.Limits(
+        max_connections=config.http_max_connections if max_connections is None else max_connections,
+        max_keepalive_connections=config.http_max_keepalive if max_keepalive is None else max_keepalive,
+        keepalive_expiry=config.http_keepalive_expiry if keepalive_expiry is None else keepalive_expiry,
+    )
+
+
+def build_dns_cache():
+    """按配置[DNS]创建DNS缓存，未启用时返回None"""
+    if not config.dns_cache:
+        return None
+    return DnsCache(config.dns_ttl, config.dns_negative_ttl, config.dns_max_entries, prefetch=config.dns_prefetch)
+
+
+# httpcore异常 -> httpx异常，子类在前，按第一个匹配的转换
+HTTPCORE_ERRORS = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+@contextlib.contextmanager
+def _httpcore_errors():
+    """把httpcore异常转换为httpx异常，调用方只需处理httpx异常"""
+    try:
+        yield
+    except Exception as e:
+        for source, target in HTTPCORE_ERRORS:
+            if isinstance(e, source):
+                raise target(str(e)) from e
+        raise
+
+
+class _PoolStream(httpx.AsyncByteStream):
+    """响应体，转换读取时的异常，响应关闭时结束该传输层的在途计数"""
+
+    def __init__(self, stream, transport):
+        self._stream = stream
+        self._transport = transport
+        self._closed = False
+
+    async def __aiter__(self):
+        with _httpcore_errors():
+            async for chunk in self._stream:
+                yield chunk
+
+    async def aclose(self):
+        if not self._closed:
+            self._closed = True
+            self._transport.in_flight -= 1
+        with _httpcore_errors():
+            await self._stream.aclose()
+
+
+class PoolTransport(httpx.AsyncBaseTransport):
+    """
+    持有自建httpcore连接池的传输层，直连时经连接池的network_backend参数接入DNS缓存
+    只使用httpx、httpcore的公开接口，统计连接池时也不读取其内部属性
+    """
+
+    def __init__(self, limits, http2=False, retries=0, proxy=None, dns=None):
+        """
+        :param limits: 连接池限制(httpx.Limits)
+        :param http2: 是否启用HTTP/2
+        :param retries: 连接失败的重试次数
+        :param proxy: 代理地址，支持http、https、socks5、socks5h，为None时直连
+        :param dns: DNS缓存(DnsCache)，只在直连时使用
+        """
+        self.limits = limits
+        self.dns = dns if not proxy else None
+        self.in_flight = 0
+        options = dict(
+            ssl_context=httpx.create_ssl_context(verify=False),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            retries=retries,
+        )
+        if not proxy:
+            backend = CachingBackend(self.dns) if self.dns is not None else None
+            self.pool = httpcore.AsyncConnectionPool(network_backend=backend, **options)
+            return
+        proxy = httpx.Proxy(proxy)
+        proxy_url = httpcore.URL(scheme=proxy.url.raw_scheme, host=proxy.url.raw_host, port=proxy.url.port,
+                                 target=proxy.url.raw_path)
+        if proxy.url.scheme in ("http", "https"):
+            self.pool = httpcore.AsyncHTTPProxy(proxy_url=proxy_url, proxy_auth=proxy.raw_auth,
+                                                proxy_headers=proxy.headers.raw, proxy_ssl_context=proxy.ssl_context,
+                                                **options)
+        elif proxy.url.scheme in ("socks5", "socks5h"):
+            # 需要安装socksio（pip install httpx[socks]）
+            self.pool = httpcore.AsyncSOCKSProxy(proxy_url=proxy_url, proxy_auth=proxy.raw_auth, **options)
+        else:
+            raise ValueError(f"不支持的代理协议: {proxy.url.scheme}")
+
+    async def handle_async_request(self, request):
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(scheme=request.url.raw_scheme, host=request.url.raw_host, port=request.url.port,
+                             target=request.url.raw_path),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        self.in_flight += 1
+        try:
+            with _httpcore_errors():
+                response = await self.pool.handle_async_request(core_request)
+        except BaseException:
+            self.in_flight -= 1
+            raise
+        return httpx.Response(response.status, headers=response.headers, stream=_PoolStream(response.stream, self),
+                              extensions=response.extensions)
+
+    async def aclose(self):
+        await self.pool.aclose()
+
+    def stats(self):
+        """
+        连接池使用情况
+        等待连接的请求数按在途请求数减去正在使用的连接数估算；HTTP/2连接可多路复用，有HTTP/2连接时记为0
+        """
+        stats = {"connections": 0, "active": 0, "idle": 0, "http2": 0}
+        for connection in self.pool.connections:
+            stats["connections"] += 1
+            if connection.is_idle():
+                stats["idle"] += 1
+            else:
+                stats["active"] += 1
+            if "HTTP/2" in connection.info():
+                stats["http2"] += 1
+        stats["waiting"] = 0 if stats["http2"] else max(0, self.in_flight - stats["active"])
+        return stats
+
+
+class HttpClient(httpx.AsyncClient):
+    """build_client创建的客户端，记住自建的传输层、代理池和DNS缓存，统计时不读取httpx客户端的内部属性"""
+
+    def __init__(self, transport, **kwargs):
+        super().__init__(transport=transport, **kwargs)
+        self.pool_transports = [item for item in getattr(transport, "transports", (transport,))
+                                if isinstance(item, PoolTransport)]
+        self.proxy_pool = transport if isinstance(transport, ProxyPoolTransport) else None
+        self.dns = transport.dns if isinstance(transport, PoolTransport) else None
+
+
+def build_proxy_pool(proxies, limits=None, http2=False):
+    """
+    按配置[PROXYPOOL]创建代理池传输层
+    :param proxies: 代理地址列表
+    :param limits: 每个代理的连接池限制，为None时按配置[HTTP]生成
+    :param http2: 是否启用HTTP/2
+    """
+    if limits is None:
+        limits = build_limits()
+    # 连接代理失败由代理池换一个代理重试，单个代理不再重试
+    return ProxyPoolTransport(
+        proxies,
+        lambda proxy: PoolTransport(limits, http2, proxy=proxy),
+        config.proxy_pool_strategy, config.proxy_pool_affinity, config.proxy_pool_failure_threshold,
+        config.proxy_pool_cooldown,
+    )
+
+
+def build_client(transport=None, proxies=None, timeout=None, limits=None, http2=None, dns=None):
+    """
+    创建HTTP客户端，多个Crawler传入同一个客户端时共享连接池
+    请求头由各Crawler在每次请求时传入，客户端本身不带请求头
+    :param transport: httpx传输层，为None时使用带连接重试的PoolTransport（压测时传入MockTransport）
+    :param proxies: 代理地址，多个时使用代理池；为None时按配置CRAWLER.ProxySwitch、CRAWLER.ProxyMode决定是否使用CRAWLER.Proxies
+    :param timeout: 读取超时（秒），连接超时不超过该值，为None时读取超时为60秒
+    :param limits: 连接池限制(httpx.Limits)，为None时按配置[HTTP]生成
+    :param http2: 是否启用HTTP/2，为None时使用配置HTTP.HTTP2；未安装h2时自动使用HTTP/1.1
+    :param dns: DNS缓存(DnsCache)，为None时按配置[DNS]创建；传入transport或使用代理时不使用（只需解析代理地址）
+    传入transport时不使用proxies、limits和http2，由该传输层决定
+    """
+    timeout_config = httpx.Timeout(
+        connect=10.0 if timeout is None else min(10.0, timeout),  # 连接超时 10s
+        read=60.0 if timeout is None else timeout,  # 读取超时 60s（根据文件大小调整）
+        write=10.0,  # 发送超时 10s
+        pool=20.0  # 连接池等待 20s
+    )
+    if limits is None:
+        limits = build_limits()
+    if http2 is None:
+        http2 = config.http_http2
+    http2 = bool(http2) and http2_available()
+    if proxies is None:
+        proxies = config.crawler_route_proxies
+
+    if transport is None and len(parse_proxies(proxies)) > 1:
+        transport = build_proxy_pool(parse_proxies(proxies), limits, http2)
+        return HttpClient(transport, timeout=timeout_config, verify=False)
+    if transport is None:
+        # retries只重试连接失败，状态码重试由调用方处理；代理也在同一传输层上，共用连接池设置
+        if dns is None and not proxies:
+            dns = build_dns_cache()
+        transport = PoolTransport(limits, http2, config.crawler_max_retries, proxies or None, dns)
+        return HttpClient(transport, timeout=timeout_config, verify=False)
+    # 传入的传输层自行决定如何发送请求；设置proxy时httpx会为all://挂载代理传输层，覆盖传入的传输层
+    return HttpClient(transport, timeout=timeout_config, verify=False)
+
+
+def proxy_pool(client):
+    """客户端使用的代理池(ProxyPoolTransport)，没有时返回None"""
+    return getattr(client, "proxy_pool", None)
+
+
+def dns_cache(client):
+    """客户端使用的DNS缓存，没有时返回None"""
+    return getattr(client, "dns", None)
+
+
+def pool_stats(client):
+    """
+    连接池使用情况，供日志和指标展示
+    :return: {"connections": 连接数, "active": 正在使用, "idle": 空闲长连接, "http2": HTTP/2连接数,
+              "waiting": 等待连接的请求数, "max_connections": 上限, "max_keepalive": 长连接上限}
+    """
+    stats = {"connections": 0, "active": 0, "idle": 0, "http2": 0, "waiting": 0,
+             "max_connections": None, "max_keepalive": None}
+    if client is None:
+        return stats
+    for transport in getattr(client, "pool_transports", ()):
+        stats["max_connections"] = transport.limits.max_connections
+        stats["max_keepalive"] = transport.limits.max_keepalive_connections
+        for key, value in transport.stats().items():
+            stats[key] += value
+    return stats
@@ -1,7 +1,9 @@
 import re
+from functools import lru_cache
 from urllib.parse import urlparse, urljoin
 import os
 from config import ConfigManager
+from tracing import span
 
 config = ConfigManager()
 newline_pattern = re.compile(r'\n')
@@ -16,8 +18,11 @@ param_dict = {}
 
 
 
-async def parse_links(html_content,source_url,depth_Parent=0):
+async def parse_links(html_content,source_url,depth_Parent=0,scope=None):
 # def parse_links(html_content,source_url,depth_Parent=0):
+    """
+    :param scope: 扫描范围，如 *.example.com，为None时使用配置CRAWLER.SubDomain
+    """
 
 
     html_content = newline_pattern.sub('', html_content)
@@ -34,12 +39,17 @@ async def parse_links(html_content,source_url,depth_Parent=0):
     depth_Child = 0
     for link, regex_names in matches.items():
 
-        url,url_status= normalize_link(link,source_url)
-        exclude_rule = is_exclusion_rules(url,url_status,source_url)
+        with span("normalize_link"):
+            url,url_status= normalize_link(link,source_url)
+        with span("is_exclusion_rules"):
+            exclude_rule = is_exclusion_rules(url,url_status,source_url,scope)
         if exclude_rule:
             exclude_matches.setdefault(url,set()).add(exclude_rule)
+            if config.matcher.profile:
+                config.matcher.stats.excluded(regex_names)
         else:
-            url = fuzz(url, config.param_data)
+            with span("fuzz"):
+                url = fuzz(url, config.param_data)
             depth_Child += 1
             depth = f"{depth_Parent}.{depth_Child}"
             urlProperty = (url_status,depth,regex_names)
@@ -54,9 +64,25 @@ def get_extension(path):
     return ext
 
 def is_subdomain(domain,subdomain):
-
-    pattern = subdomain.replace(".",r"\.").replace("*",".*")
-    return re.match(pattern, domain) is not None
+    """
+    主机名是否在扫描范围内，整个主机名须与范围匹配（不含端口）
+    :param subdomain: 扫描范围，如 *.example.com；多个用逗号分隔，如 example.com,*.example.com；为空时不限制
+
+    >>> is_subdomain("api.example.com", "example.com,*.example.com")
+    True
+    >>> is_subdomain("notexample.com", "example.com,*.example.com")
+    False
+    >>> is_subdomain("example.com.attacker.net", "*.example.com")
+    False
+    """
+    pattern = _scope_pattern(subdomain or "")
+    return pattern is None or pattern.fullmatch((domain or "").lower()) is not None
+
+@lru_cache(maxsize=64)
+def _scope_pattern(subdomain):
+    """把扫描范围编译为一个正则，为空时返回None"""
+    patterns = [re.escape(item.strip().lower()).replace(r"\*", ".*") for item in subdomain.split(",") if item.strip()]
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns)) if patterns else None
 
 def baseurl(source_url):
 
@@ -77,13 +103,14 @@ def add_context(link,source_url):
     else:
         return url.scheme+"://"+url.netloc+"/"+context+path
 
-def is_exclusion_rules(url,url_status,source_url):
+def is_exclusion_rules(url,url_status,source_url,scope=None):
     # 解析链接
     parsed_url = urlparse(url)
-    domain = parsed_url.netloc
+    domain = parsed_url.hostname
     # 是否是目标域名
-    if not is_subdomain(domain, config.crawler_sub_domain):
-        return config.crawler_sub_domain
+    scope = scope or config.crawler_sub_domain
+    if not is_subdomain(domain, scope):
+        return scope
 
     # 获取链接的扩展名
     extension = get_extension(parsed_url.path)
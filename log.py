@@ -1,37 +1,194 @@
+## 异步日志：调用线程只把日志记录放入内存队列，由后台线程批量写文件/控制台，避免阻塞爬虫事件循环
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from datetime import datetime
 
-def setup_logger(name, log_file, level=logging.INFO,add_console_handler=True):
-    """设置日志器，配置文件处理器和格式化器"""
+
+class JsonFormatter(logging.Formatter):
+    """每条日志输出为一行JSON，extra={'fields': {...}}中的字段会一并写入"""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            # 经队列处理器时异常信息已提前格式化为exc_text
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _BatchStreamMixin:
+    """写入时不逐条flush，由后台线程每批写完后统一flush"""
+
+    def emit(self, record):
+        try:
+            if self._should_rollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+    def _should_rollover(self, record):
+        return False
+
+
+class BatchRotatingFileHandler(_BatchStreamMixin, logging.handlers.RotatingFileHandler):
+    """按文件大小轮转的文件处理器，max_bytes为0时不轮转"""
+
+    def _should_rollover(self, record):
+        return self.maxBytes > 0 and self.shouldRollover(record)
+
+
+class BatchStreamHandler(_BatchStreamMixin, logging.StreamHandler):
+    """控制台处理器"""
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    入队前不格式化消息，只在有异常信息时提前生成异常文本
+    爬虫的日志消息均为已拼好的字符串，省去标准QueueHandler的复制和格式化开销
+    """
+
+    def prepare(self, record):
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class BatchQueueListener(threading.Thread):
+    """后台写日志线程，每次最多取batch_size条记录写入，写完后flush一次"""
+
+    _stop_marker = object()
+
+    def __init__(self, log_queue, handlers, batch_size=500, flush_interval=0.5, name="log-writer"):
+        super().__init__(name=name, daemon=True)
+        self.queue = log_queue
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+    def run(self):
+        while True:
+            try:
+                record = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = [record]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = False
+            for record in batch:
+                if record is self._stop_marker:
+                    stop = True
+                    continue
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
+            for handler in self.handlers:
+                handler.flush()
+            if stop:
+                return
+
+    def stop(self):
+        """写完队列中剩余的日志后退出"""
+        if self.is_alive():
+            self.queue.put(self._stop_marker)
+            self.join()
+        for handler in self.handlers:
+            handler.close()
+
+
+# 已配置的日志器名 -> 后台写日志线程，重复调用setup_logger时替换而不是叠加处理器
+_listeners = {}
+_listeners_lock = threading.Lock()
+
+
+def setup_logger(name, log_file, level=logging.INFO, add_console_handler=True,
+                 max_bytes=0, backup_count=3, json_format=False, batch_size=500, flush_interval=0.5):
+    """
+    设置日志器，日志记录经内存队列交给后台线程批量写入文件和控制台
+    :param log_file: 日志文件路径，为空则只输出到控制台
+    :param add_console_handler: 是否同时输出到控制台
+    :param max_bytes: 单个日志文件大小上限，超过后轮转，0为不轮转
+    :param backup_count: 轮转保留的文件数
+    :param json_format: 是否以JSON行格式写文件
+    :param batch_size: 后台线程每批最多写入的条数
+    :param flush_interval: 队列为空时后台线程的等待间隔（秒）
+    """
     # 创建日志器
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
-    # 配置文件处理器（显示时间）
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
-    file_formatter = logging.Formatter('%(asctime)s %(message)s', datefmt='%m-%d %H:%M')
-    file_handler.setFormatter(file_formatter)
-    # 添加处理器
-    logger.addHandler(file_handler)
+    handlers = []
+    if log_file:
+        # 配置文件处理器（显示时间）
+        file_handler = BatchRotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                                encoding="utf-8", delay=True)
+        if json_format:
+            file_handler.setFormatter(JsonFormatter())
+        else:
+            file_handler.setFormatter(logging.Formatter('%(asctime)s %(message)s', datefmt='%m-%d %H:%M'))
+        handlers.append(file_handler)
 
     if add_console_handler:
         # 配置控制台处理器（不显示时间）
-        console_handler = logging.StreamHandler()
-        console_formatter = logging.Formatter('%(message)s')
-        console_handler.setFormatter(console_formatter)
+        console_handler = BatchStreamHandler(sys.stderr)
+        console_handler.setFormatter(logging.Formatter('%(message)s'))
+        handlers.append(console_handler)
+
+    log_queue = queue.SimpleQueue()
+    listener = BatchQueueListener(log_queue, handlers, batch_size, flush_interval, name=f"log-writer-{name}")
 
-        # 添加处理器
-        logger.addHandler(console_handler)
+    with _listeners_lock:
+        old_listener = _listeners.pop(name, None)
+        # 移除之前添加的队列处理器，并写完旧队列中的日志
+        for handler in list(logger.handlers):
+            if isinstance(handler, _QueueHandler):
+                logger.removeHandler(handler)
+        if old_listener is not None:
+            old_listener.stop()
+        logger.addHandler(_QueueHandler(log_queue))
+        listener.start()
+        _listeners[name] = listener
 
     return logger
 
 
+@atexit.register
+def shutdown_loggers():
+    """程序退出时写完所有队列中的日志"""
+    with _listeners_lock:
+        listeners = list(_listeners.values())
+        _listeners.clear()
+    for listener in listeners:
+        listener.stop()
+
 
 if __name__ == '__main__':
     # 使用示例
-    # 创建不同的日志器
+    # 创建不同的日志器，重复调用只保留最后一次的配置
     logger1 = setup_logger('Logger', 'app1.log')
-    logger2 = setup_logger('Logger', 'app2.log')
+    logger2 = setup_logger('Logger', 'app2.log', json_format=True, add_console_handler=False)
     logger1.info("用户登录成功")
     logger1.error("文件读取失败")
-    logger2.info("用户注册成功")
-    logger2.warning("密码尝试次数过多")
\ No newline at end of file
+    logger2.info("用户注册成功", extra={"fields": {"user": "test"}})
+    logger2.warning("密码尝试次数过多")
@@ -0,0 +1,257 @@
+## 爬取指标：在途请求数、各主机响应耗时分布、状态码与异常计数、下载字节数、队列深度和解析耗时
+import asyncio
+import bisect
+import json
+import os
+import time
+from collections import defaultdict
+
+# 响应耗时分桶上限（秒）
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# 解析耗时分桶上限（秒）
+PARSE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+
+
+class Histogram:
+    """固定分桶的直方图，counts最后一个为超过所有上限的计数"""
+
+    __slots__ = ("buckets", "counts", "count", "sum", "max")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q):
+        """按分桶估算分位数，返回所在桶的上限"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for upper, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return upper
+        return self.max
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": round(self.sum / self.count, 6) if self.count else None,
+            "max": round(self.max, 6),
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([str(b) for b in self.buckets] + ["+Inf"], self.counts)),
+        }
+
+
+class CrawlMetrics:
+    """
+    一次爬取的指标
+    计数只在事件循环线程中更新，不加锁；快照/导出在任意线程读取，数值可能相差一两次更新
+    """
+
+    def __init__(self, queue_stats=None):
+        """
+        :param queue_stats: 返回各队列深度的函数，如web_crawler.get_pipeline_stats
+        """
+        self.queue_stats = queue_stats
+        self.started = time.time()
+        self.in_flight = 0
+        self.requests = 0
+        self.bytes_downloaded = 0
+        self.pages_parsed = 0
+        self.status_counts = defaultdict(int)
+        self.exception_counts = defaultdict(int)
+        self.host_latency = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+        self.parse_time = Histogram(PARSE_BUCKETS)
+        # 其他模块附加的指标，名称 -> 返回可JSON序列化数据的函数
+        self.extra = {}
+
+    def request_started(self):
+        self.in_flight += 1
+
+    def request_finished(self, host, elapsed, status=None, size=0, error=None):
+        """
+        记录一次请求（含fuzz重试和302跳转）
+        :param status: 响应状态码，请求异常时为None
+        :param error: 异常对象
+        """
+        self.in_flight -= 1
+        self.requests += 1
+        self.host_latency[host].observe(elapsed)
+        if error is not None:
+            self.exception_counts[type(error).__name__] += 1
+        else:
+            self.status_counts[status] += 1
+            self.bytes_downloaded += size
+
+    def page_parsed(self, elapsed):
+        self.pages_parsed += 1
+        self.parse_time.observe(elapsed)
+
+    def snapshot(self):
+        """获取当前指标"""
+        elapsed = time.time() - self.started
+        data = {
+            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "elapsed": round(elapsed, 3),
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "requests_per_second": round(self.requests / elapsed, 2) if elapsed else None,
+            "bytes_downloaded": self.bytes_downloaded,
+            "pages_parsed": self.pages_parsed,
+            "status": {str(k): v for k, v in sorted(self.status_counts.items())},
+            "exceptions": dict(self.exception_counts),
+            "latency": {host: hist.to_dict() for host, hist in list(self.host_latency.items())},
+            "parse_time": self.parse_time.to_dict(),
+        }
+        if self.queue_stats is not None:
+            data["queues"] = self.queue_stats()
+        for name, source in list(self.extra.items()):
+            data[name] = source()
+        return data
+
+    def write_snapshot(self, path):
+        """写入JSON快照，先写临时文件再替换，读取方不会读到写了一半的文件"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    async def run(self, path, interval=10):
+        """定期写入快照的协程，由爬虫主函数创建并在结束时取消"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(interval)
+            await loop.run_in_executor(None, self.write_snapshot, path)
+
+    def to_prometheus(self):
+        """导出Prometheus文本格式"""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+
+        metric("findapi_requests_in_flight", "gauge", "Requests in flight", [({}, self.in_flight)])
+        metric("findapi_requests_total", "counter", "Requests finished", [({}, self.requests)])
+        metric("findapi_bytes_downloaded_total", "counter", "Response body bytes", [({}, self.bytes_downloaded)])
+        metric("findapi_responses_total", "counter", "Responses by status code",
+               [({"status": status}, count) for status, count in sorted(self.status_counts.items())])
+        metric("findapi_request_errors_total", "counter", "Requests failed by exception type",
+               [({"exception": name}, count) for name, count in self.exception_counts.items()])
+
+        histograms = [({"host": host}, hist) for host, hist in list(self.host_latency.items())]
+        _histogram_lines(lines, "findapi_request_duration_seconds", "Request latency by host", histograms)
+        _histogram_lines(lines, "findapi_parse_duration_seconds", "Parse time per page", [({}, self.parse_time)])
+
+        if self.queue_stats is not None:
+            depths = [({"queue": name}, stats["size"]) for name, stats in self.queue_stats().items()
+                      if isinstance(stats, dict) and "size" in stats]
+            metric("findapi_queue_depth", "gauge", "Pipeline queue depth", depths)
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+
+
+class RuleStats:
+    """
+    rules.yml中每条规则的开销与产出
+    FindLink规则：扫描耗时、扫描字节数、匹配到的链接数、其中被排除的链接数、请求返回2xx的链接数
+    excludeLink规则：检查耗时、检查的链接数、排除的链接数
+    """
+
+    GROUPS = ("FindLink", "excludeLink")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        # 分组 -> 规则名 -> [耗时(ns), 字节数, 匹配数, 被排除数, 2xx数]
+        self._rules = {group: defaultdict(lambda: [0, 0, 0, 0, 0]) for group in self.GROUPS}
+
+    def scanned(self, rule, elapsed_ns, size, matches):
+        """FindLink规则扫描一个页面"""
+        stats = self._rules["FindLink"][rule]
+        stats[0] += elapsed_ns
+        stats[1] += size
+        stats[2] += matches
+
+    def checked(self, rule, elapsed_ns, excluded):
+        """excludeLink规则检查一个链接"""
+        stats = self._rules["excludeLink"][rule]
+        stats[0] += elapsed_ns
+        stats[1] += 1
+        if excluded:
+            stats[2] += 1
+
+    def excluded(self, rule_names):
+        """由这些FindLink规则匹配到的链接被排除（excludeLink规则、范围或后缀）"""
+        if isinstance(rule_names, str):
+            return
+        findlink = self._rules["FindLink"]
+        for rule in rule_names:
+            findlink[rule][3] += 1
+
+    def responded_ok(self, rule_names):
+        """由这些FindLink规则匹配到的链接请求返回2xx，种子URL的规则名为字符串"N"，不统计"""
+        if isinstance(rule_names, str):
+            return
+        findlink = self._rules["FindLink"]
+        for rule in rule_names:
+            findlink[rule][4] += 1
+
+    def snapshot(self):
+        """获取各规则的统计"""
+        data = {}
+        for rule, (elapsed_ns, size, matches, excluded, ok) in list(self._rules["FindLink"].items()):
+            data.setdefault("FindLink", {})[rule] = {
+                "scan_ms": round(elapsed_ns / 1e6, 3),
+                "bytes": size,
+                "mb_per_s": round(size / 1048576 / (elapsed_ns / 1e9), 2) if elapsed_ns else None,
+                "matches": matches,
+                "excluded": excluded,
+                "ok_2xx": ok,
+            }
+        for rule, (elapsed_ns, checked, excluded, _, _) in list(self._rules["excludeLink"].items()):
+            data.setdefault("excludeLink", {})[rule] = {
+                "scan_ms": round(elapsed_ns / 1e6, 3),
+                "checked": checked,
+                "excluded": excluded,
+            }
+        return data
+
+
+def _histogram_lines(lines, name, help_text, histograms):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for labels, hist in histograms:
+        prefix = "".join(f'{k}="{_escape(v)}",' for k, v in labels.items())
+        cumulative = 0
+        for upper, count in zip(list(hist.buckets) + ["+Inf"], hist.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{prefix}le="{upper}"}} {cumulative}')
+        suffix = f"{{{prefix.rstrip(',')}}}" if prefix else ""
+        lines.append(f"{name}_sum{suffix} {hist.sum}")
+        lines.append(f"{name}_count{suffix} {hist.count}")
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
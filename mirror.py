@@ -0,0 +1,268 @@
+## 代理镜像：爬取请求直连目标，同时把请求记录下来，由后台重放器以自己的并发数经代理(Burp Suite)重发一遍，
+## 供HaE分析流量；代理变慢或暂停时只影响重放，不影响爬取速度
+import asyncio
+import json
+import os
+import queue
+import threading
+
+import httpx
+
+# 重放队列满时的处理方式
+DROP = "drop"
+SPOOL = "spool"
+
+# 暂存写入线程的命令：清空暂存文件（已全部读回）
+_TRUNCATE = object()
+
+
+class ProxyMirror:
+    """
+    镜像重放器
+    add()记录请求，不等待；重放队列满时按overflow丢弃(drop)或写入暂存文件(spool)，队列空出后从暂存文件读回。
+    暂存文件由写入线程追加写入，读回在线程池中进行，爬取繁忙、队列溢出时不在事件循环中读写文件。
+    暂存文件中未重放完的请求在下次启动时先重放
+    """
+
+    def __init__(self, proxy, concurrency=4, queue_size=1000, overflow=DROP, spool_file=None, timeout=30.0,
+                 transport=None):
+        """
+        :param proxy: 代理地址，如 http://127.0.0.1:8080；指定transport时只用于展示
+        :param concurrency: 同时重放的请求数
+        :param queue_size: 重放队列长度上限
+        :param overflow: 队列满时的处理方式，drop丢弃，spool写入暂存文件
+        :param spool_file: 暂存文件，overflow为spool时使用
+        :param timeout: 重放请求的超时时间（秒）
+        :param transport: httpx传输层，如多个代理时的代理池，测试时传入MockTransport
+        """
+        self.proxy = proxy
+        self.concurrency = max(1, int(concurrency))
+        self.queue_size = max(1, int(queue_size))
+        self.overflow = SPOOL if overflow == SPOOL and spool_file else DROP
+        self.spool_file = spool_file
+        self.timeout = timeout
+        self.transport = transport
+        self.queue = None
+        self.client = None
+        self._workers = []
+        self._spool_queue = None
+        self._spool_thread = None
+        self._spool_reader = None
+        self._refill_lock = None
+        self._reading = None
+        self.spool_pending = 0
+        self.recorded = 0
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.spooled = 0
+
+    def start(self):
+        """创建重放客户端和重放协程，需在事件循环中调用"""
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self._refill_lock = asyncio.Lock()
+        self.client = httpx.AsyncClient(proxy=self.proxy if self.transport is None else None, transport=self.transport, verify=False, timeout=self.timeout,
+                                        limits=httpx.Limits(max_connections=self.concurrency))
+        # 上次未重放完的暂存请求
+        if self.overflow == SPOOL and os.path.exists(self.spool_file):
+            with open(self.spool_file, "r", encoding="utf-8") as f:
+                self.spool_pending = sum(1 for line in f if line.strip())
+        self._workers = [asyncio.create_task(self._worker(), name=f"mirror-{i}") for i in range(self.concurrency)]
+
+    def add(self, method, url, headers=None, body=None):
+        """记录一个请求"""
+        if self.queue is None:
+            return
+        self.recorded += 1
+        item = {"method": method, "url": url, "headers": dict(headers or {}), "body": body}
+        # 有暂存的请求时新请求也写入暂存文件，保持重放顺序
+        if not self.spool_pending:
+            try:
+                self.queue.put_nowait(item)
+                return
+            except asyncio.QueueFull:
+                pass
+        if self.overflow == SPOOL:
+            self._spool(item)
+        else:
+            self.dropped += 1
+
+    def _spool(self, item):
+        self._spool_put(json.dumps(item, ensure_ascii=False) + "\n")
+        self.spool_pending += 1
+        self.spooled += 1
+
+    def _spool_put(self, command):
+        """把一行请求或命令交给暂存写入线程，不等待写入"""
+        if self._spool_thread is None:
+            self._spool_queue = queue.Queue()
+            self._spool_thread = threading.Thread(target=self._spool_loop, name="mirror-spool", daemon=True)
+            self._spool_thread.start()
+        self._spool_queue.put_nowait(command)
+
+    def _spool_loop(self):
+        """暂存写入线程：把队列中已有的行一次写入并flush，收到None时退出"""
+        spool_queue = self._spool_queue
+        with open(self.spool_file, "a", encoding="utf-8") as f:
+            while True:
+                commands = [spool_queue.get()]
+                while True:
+                    try:
+                        commands.append(spool_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                stop = False
+                try:
+                    for command in commands:
+                        if command is None:
+                            stop = True
+                        elif command is _TRUNCATE:
+                            f.flush()
+                            f.truncate(0)
+                        else:
+                            f.write(command)
+                    f.flush()
+                finally:
+                    for _ in commands:
+                        spool_queue.task_done()
+                if stop:
+                    return
+
+    def _read_spool(self, count):
+        """
+        在线程中从暂存文件读回最多count行，先等待已交给写入线程的行写入文件
+        :return: (请求列表, 读取的行数, 是否提前读到文件末尾)
+        """
+        if self._spool_queue is not None:
+            self._spool_queue.join()
+        if self._spool_reader is None:
+            self._spool_reader = open(self.spool_file, "r", encoding="utf-8")
+        items = []
+        lines = 0
+        while lines < count:
+            line = self._spool_reader.readline()
+            if not line:
+                return items, lines, True
+            if not line.strip():
+                continue
+            lines += 1
+            try:
+                items.append(json.loads(line))
+            except ValueError:
+                continue
+        return items, lines, False
+
+    async def _refill(self):
+        """从暂存文件读回请求，填满重放队列；只有一个协程在读"""
+        async with self._refill_lock:
+            count = min(self.queue_size - self.queue.qsize(), self.spool_pending)
+            if count <= 0:
+                return
+            # 重放协程被取消时读取仍会完成，读回的请求由close()写回暂存文件
+            self._reading = asyncio.ensure_future(asyncio.to_thread(self._read_spool, count))
+            items = self._take(await asyncio.shield(self._reading))
+            self._reading = None
+            # 暂存期间add()不直接放入队列，读回前计算的空位仍然足够
+            for item in items:
+                self.queue.put_nowait(item)
+
+    def _take(self, result):
+        """按读回的行数更新暂存计数，全部读回时清空暂存文件"""
+        items, lines, eof = result
+        # 提前读到文件末尾说明文件被外部改动，放弃剩余的暂存
+        self.spool_pending = 0 if eof else self.spool_pending - lines
+        if not self.spool_pending:
+            self._close_reader()
+            # 之后再暂存的请求排在清空命令之后写入
+            self._spool_put(_TRUNCATE)
+        return items
+
+    def _close_reader(self):
+        if self._spool_reader is not None:
+            self._spool_reader.close()
+            self._spool_reader = None
+
+    def _save_spool(self, items):
+        """关闭时（在线程中）把队列中未重放的请求和暂存文件中未读回的请求一起写回暂存文件"""
+        if self._spool_thread is not None:
+            self._spool_queue.put(None)
+            self._spool_thread.join()
+            self._spool_thread = self._spool_queue = None
+        if self._spool_reader is not None:
+            rest = self._spool_reader.read()
+        elif self.spool_pending:
+            with open(self.spool_file, "r", encoding="utf-8") as f:
+                rest = f.read()
+        else:
+            rest = ""
+        self._close_reader()
+        if not items and not rest:
+            return
+        with open(self.spool_file, "w", encoding="utf-8") as f:
+            for item in items:
+                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+            f.write(rest)
+        self.spool_pending += len(items)
+
+    async def _worker(self):
+        queue = self.queue
+        while True:
+            if self.spool_pending and queue.empty():
+                await self._refill()
+            item = await queue.get()
+            try:
+                await self.client.request(item["method"], item["url"], headers=item["headers"], json=item["body"])
+                self.sent += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.failed += 1
+            finally:
+                queue.task_done()
+
+    async def _drain(self):
+        while True:
+            await self.queue.join()
+            if not self.spool_pending:
+                return
+            await self._refill()
+
+    async def close(self, drain_timeout=30.0):
+        """
+        等待重放完成后关闭，最多等待drain_timeout秒
+        未重放的请求：spool时留在暂存文件中下次重放，drop时丢弃
+        """
+        if self.queue is None:
+            return
+        try:
+            await asyncio.wait_for(self._drain(), drain_timeout)
+        except asyncio.TimeoutError:
+            pass
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        left = [self.queue.get_nowait() for _ in range(self.queue.qsize())]
+        if self._reading is not None:
+            # 被取消的重放协程正在读回的请求，排在队列中的请求之后
+            left += self._take(await self._reading)
+            self._reading = None
+        if self.overflow == SPOOL:
+            await asyncio.to_thread(self._save_spool, left)
+        else:
+            self.dropped += len(left)
+        await self.client.aclose()
+        self.queue = None
+
+    def stats(self):
+        """重放情况，供日志和指标展示"""
+        return {
+            "proxy": self.proxy,
+            "recorded": self.recorded,
+            "sent": self.sent,
+            "failed": self.failed,
+            "queued": self.queue.qsize() if self.queue is not None else 0,
+            "dropped": self.dropped,
+            "spooled": self.spooled,
+            "spool_pending": self.spool_pending,
+        }
@@ -0,0 +1,308 @@
+## 爬虫各阶段之间的有界队列与内存背压控制
+import asyncio
+import os
+import time
+from collections import defaultdict
+
+
+def get_rss_bytes():
+    """获取当前进程常驻内存(RSS)字节数，无法获取时返回None"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+
+    # 没有安装psutil时，Linux下直接读取/proc
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError, IndexError):
+        return None
+
+
+class FrontierQueue(asyncio.Queue):
+    """
+    请求队列（待抓取URL）
+    解析阶段回写的新URL不受限制，避免抓取与解析互相等待造成死锁；
+    种子URL通过put_throttled写入，队列长度超过soft_limit时等待
+    """
+
+    def __init__(self, soft_limit=0):
+        super().__init__()
+        self.soft_limit = soft_limit
+        self.peak_size = 0
+        self._room = asyncio.Event()
+        self._room.set()
+
+    def _put(self, item):
+        super()._put(item)
+        self.peak_size = max(self.peak_size, self.qsize())
+        if self.soft_limit and self.qsize() >= self.soft_limit:
+            self._room.clear()
+
+    def _get(self):
+        item = super()._get()
+        if not self.soft_limit or self.qsize() < self.soft_limit:
+            self._room.set()
+        return item
+
+    async def put_throttled(self, item):
+        """等待队列有空位后再写入，用于种子URL"""
+        while self.soft_limit and self.qsize() >= self.soft_limit:
+            self._room.clear()
+            await self._room.wait()
+        self.put_nowait(item)
+
+
+class ByteBudgetQueue(asyncio.Queue):
+    """
+    处理队列（待解析响应体），按响应体总大小限流
+    队列中内容总长度达到max_bytes后put阻塞，直到解析协程取走数据，
+    单个超大响应在队列为空时仍可写入，因此实际占用最多超出一个响应体
+    """
+
+    def __init__(self, max_bytes=0):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.peak_bytes = 0
+
+    @staticmethod
+    def _item_bytes(item):
+        # item 为 (response_content, url, depth)，按字符数近似字节数
+        content = item[0] if item else None
+        return len(content) if content else 0
+
+    def _put(self, item):
+        super()._put(item)
+        self.bytes += self._item_bytes(item)
+        self.peak_bytes = max(self.peak_bytes, self.bytes)
+
+    def _get(self):
+        item = super()._get()
+        self.bytes -= self._item_bytes(item)
+        return item
+
+    def full(self):
+        if self.max_bytes and self.bytes >= self.max_bytes:
+            return True
+        return super().full()
+
+
+class MemoryGovernor:
+    """全局内存调节器，RSS超过上限时暂停发起新的请求"""
+
+    def __init__(self, limit_bytes, process_queue=None, interval=0.5):
+        """
+        :param limit_bytes: 内存上限（字节），0表示不限制
+        :param process_queue: 处理队列，队列清空后即使RSS仍偏高也放行，避免内存未归还系统导致永久暂停
+        :param interval: 采样间隔（秒）
+        """
+        self.limit_bytes = limit_bytes
+        self.process_queue = process_queue
+        self.interval = interval
+        self.rss = None
+        self.paused = False
+        self.pause_count = 0
+        self._resume = asyncio.Event()
+        self._resume.set()
+
+    @property
+    def enabled(self):
+        return bool(self.limit_bytes) and get_rss_bytes() is not None
+
+    async def run(self):
+        """采样协程，由爬虫主函数创建并在结束时取消"""
+        while True:
+            self.rss = get_rss_bytes()
+            drained = self.process_queue is None or self.process_queue.empty()
+            if self.rss is not None and self.rss > self.limit_bytes and not drained:
+                if not self.paused:
+                    self.paused = True
+                    self.pause_count += 1
+                    self._resume.clear()
+            elif self.paused and (drained or self.rss is None or self.rss < self.limit_bytes * 0.9):
+                self.paused = False
+                self._resume.set()
+            await asyncio.sleep(self.interval)
+
+    async def wait(self):
+        """抓取协程在每次请求前调用，内存超限时在此等待"""
+        await self._resume.wait()
+
+
+def queue_stats(request_queue=None, process_queue=None, ui_queue=None, exclude_queue=None, governor=None):
+    """汇总各阶段队列的当前深度与上限，供日志和指标展示"""
+    stats = {}
+    if request_queue is not None:
+        stats["request_queue"] = {
+            "size": request_queue.qsize(),
+            "soft_limit": getattr(request_queue, "soft_limit", 0),
+            "peak": getattr(request_queue, "peak_size", None),
+        }
+    if process_queue is not None:
+        stats["process_queue"] = {
+            "size": process_queue.qsize(),
+            "bytes": getattr(process_queue, "bytes", None),
+            "max_bytes": getattr(process_queue, "max_bytes", 0),
+            "peak_bytes": getattr(process_queue, "peak_bytes", None),
+        }
+    for name, q in (("ui_queue", ui_queue), ("exclude_queue", exclude_queue)):
+        if q is not None:
+            stats[name] = {"size": q.qsize(), "maxsize": q.maxsize}
+    if governor is not None:
+        stats["memory"] = {
+            "rss": governor.rss,
+            "limit": governor.limit_bytes,
+            "paused": governor.paused,
+            "pause_count": governor.pause_count,
+        }
+    return stats
+
+
+class CrawlBudget:
+    """
+    爬取预算：按整个爬取（任务）和单个主机限制请求数、下载字节数和用时，0表示不限制
+    某个主机用完预算后，该主机剩余的URL从请求队列取出时直接丢弃；整个爬取用完预算后所有剩余URL都丢弃，
+    已在途的请求和解析照常完成，队列随之排空，爬取正常结束（平滑收尾）。
+    字节数在响应返回后计入，并发请求时实际下载量最多超出在途请求的响应体大小
+    """
+
+    KINDS = ("requests", "bytes", "seconds")
+
+    def __init__(self, max_requests=0, max_bytes=0, max_seconds=0, host_max_requests=0, host_max_bytes=0,
+                 host_max_seconds=0, on_exhausted=None):
+        """
+        :param max_requests: 整个爬取的请求数上限
+        :param max_bytes: 整个爬取的下载字节数上限
+        :param max_seconds: 整个爬取的用时上限（秒）
+        :param host_max_requests: 每个主机的请求数上限
+        :param host_max_bytes: 每个主机的下载字节数上限
+        :param host_max_seconds: 每个主机的用时上限（秒），从该主机的第一个请求开始计时
+        :param on_exhausted: 某项预算首次用完时的回调，参数为(主机或None, 预算名)，None表示整个爬取
+        """
+        self.limits = {"requests": max_requests, "bytes": max_bytes, "seconds": max_seconds}
+        self.host_limits = {"requests": host_max_requests, "bytes": host_max_bytes, "seconds": host_max_seconds}
+        self.on_exhausted = on_exhausted
+        self.started = time.monotonic()
+        self.finished = None
+        self.usage = {"requests": 0, "bytes": 0}
+        # 主机 -> {"requests", "bytes", "started"}，只在设置了主机预算时记录
+        self.hosts = {}
+        # 用完的预算，主机或None（整个爬取） -> 预算名
+        self.exhausted = {}
+        # 因预算丢弃的URL数，主机或None -> 数量
+        self.skipped = defaultdict(int)
+
+    @property
+    def enabled(self):
+        return any(self.limits.values()) or any(self.host_limits.values())
+
+    @property
+    def stopped(self):
+        """整个爬取的预算是否已用完"""
+        return None in self.exhausted
+
+    def start(self):
+        """开始计时，爬取开始时调用"""
+        self.started = time.monotonic()
+        self.finished = None
+
+    def finish(self):
+        """停止计时，爬取结束时调用"""
+        self.finished = time.monotonic()
+
+    @staticmethod
+    def _over(limits, usage, started, now):
+        for kind in CrawlBudget.KINDS:
+            limit = limits[kind]
+            if not limit:
+                continue
+            used = now - started if kind == "seconds" else usage[kind]
+            if used >= limit:
+                return kind
+        return None
+
+    def _exhaust(self, scope, kind):
+        self.skipped[scope] += 1
+        if scope not in self.exhausted:
+            self.exhausted[scope] = kind
+            if self.on_exhausted is not None:
+                self.on_exhausted(scope, kind)
+        return kind
+
+    def admit(self, host):
+        """
+        抓取协程在请求前调用
+        :return: 预算未用完时计入一次请求并返回None；否则返回用完的预算名，该URL应丢弃
+        """
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        kind = self.exhausted.get(None) or self._over(self.limits, self.usage, self.started, now)
+        if kind:
+            return self._exhaust(None, kind)
+        host_usage = None
+        if any(self.host_limits.values()):
+            host_usage = self.hosts.get(host)
+            if host_usage is None:
+                host_usage = self.hosts[host] = {"requests": 0, "bytes": 0, "started": now}
+            kind = self.exhausted.get(host) or self._over(self.host_limits, host_usage, host_usage["started"], now)
+            if kind:
+                return self._exhaust(host, kind)
+            host_usage["requests"] += 1
+        self.usage["requests"] += 1
+        return None
+
+    def charge_bytes(self, host, size):
+        """响应返回后计入下载字节数"""
+        if not self.enabled:
+            return
+        self.usage["bytes"] += size
+        host_usage = self.hosts.get(host)
+        if host_usage is not None:
+            host_usage["bytes"] += size
+
+    def summary(self):
+        """预算设置、用量及用完的预算，供日志和指标展示"""
+        return {
+            "limits": {kind: limit for kind, limit in self.limits.items() if limit},
+            "host_limits": {kind: limit for kind, limit in self.host_limits.items() if limit},
+            "requests": self.usage["requests"],
+            "bytes": self.usage["bytes"],
+            "elapsed": round((self.finished or time.monotonic()) - self.started, 1),
+            "exhausted": [
+                {"scope": "crawl" if scope is None else "host", "host": scope, "budget": kind,
+                 "skipped": self.skipped[scope]}
+                for scope, kind in list(self.exhausted.items())
+            ],
+        }
+
+
+class WorkTracker:
+    """
+    在途任务计数器，用于判断爬取结束
+    URL写入请求队列时+1；抓取失败/被跳过，或响应解析完成时-1；
+    响应体从抓取阶段转入处理阶段时计数不变，因此计数归零即表示所有工作已完成
+    """
+
+    def __init__(self):
+        self.pending = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def add(self, count=1):
+        self.pending += count
+        if self.pending > 0:
+            self._idle.clear()
+
+    def done(self, count=1):
+        self.pending -= count
+        if self.pending <= 0:
+            self.pending = 0
+            self._idle.set()
+
+    async def wait(self):
+        """等待所有在途任务完成"""
+        await self._idle.wait()
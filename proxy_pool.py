@@ -0,0 +1,178 @@
+## 代理池：CRAWLER.Proxies配置多个代理时，把请求分摊到各代理（轮询或最少在途请求），可按主机固定代理，
+## 连续连接失败的代理标记为不可用，冷却后再试；统计每个代理的请求数、下载量和吞吐量
+import time
+from collections import OrderedDict
+
+import httpx
+
+# 选择代理的策略
+ROUND_ROBIN = "round_robin"
+LEAST_BUSY = "least_busy"
+
+
+def parse_proxies(proxies):
+    """
+    解析代理地址配置
+    :param proxies: 代理地址，多个用逗号或空白分隔；也可为列表
+    :return: [代理地址, ...]
+    """
+    if not proxies:
+        return []
+    if isinstance(proxies, str):
+        proxies = proxies.replace(",", " ").split()
+    return [proxy.strip() for proxy in proxies if proxy and proxy.strip()]
+
+
+class _Proxy:
+    __slots__ = ("url", "transport", "in_flight", "requests", "errors", "failures", "bytes", "down_until", "downs")
+
+    def __init__(self, url, transport):
+        self.url = url
+        self.transport = transport
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.failures = 0
+        self.bytes = 0
+        self.down_until = 0.0
+        self.downs = 0
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """统计响应体字节数，响应关闭时结束该代理的在途计数"""
+
+    def __init__(self, stream, proxy):
+        self._stream = stream
+        self._proxy = proxy
+        self._closed = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            self._proxy.bytes += len(chunk)
+            yield chunk
+
+    async def aclose(self):
+        if not self._closed:
+            self._closed = True
+            self._proxy.in_flight -= 1
+        await self._stream.aclose()
+
+
+class ProxyPoolTransport(httpx.AsyncBaseTransport):
+    """
+    代理池传输层，每个代理一个传输层（各自的连接池）
+    连接代理失败（ConnectError/ConnectTimeout）计为该代理故障，并换一个可用的代理重试一次；
+    连续failure_threshold次故障后该代理cooldown秒内不再使用，全部不可用时使用最早恢复的代理
+    """
+
+    def __init__(self, proxies, transport_factory, strategy=ROUND_ROBIN, affinity=False, failure_threshold=3,
+                 cooldown=60.0, max_hosts=10000):
+        """
+        :param proxies: 代理地址列表
+        :param transport_factory: 由代理地址创建传输层的函数，如 lambda proxy: http_client.PoolTransport(limits, proxy=proxy)
+        :param strategy: round_robin轮询，least_busy选择在途请求最少的代理
+        :param affinity: 是否按主机固定代理，同一主机的请求（会话、Cookie）始终经过同一个代理
+        :param failure_threshold: 连续故障多少次后标记为不可用，0为不标记
+        :param cooldown: 不可用代理的冷却时间（秒）
+        :param max_hosts: affinity时最多记住的主机数，超过时忘记最久未请求的主机（再次请求时重新选择代理）
+        """
+        if not proxies:
+            raise ValueError("代理池至少需要一个代理")
+        self.proxies = [_Proxy(url, transport_factory(url)) for url in proxies]
+        self.strategy = LEAST_BUSY if strategy == LEAST_BUSY else ROUND_ROBIN
+        self.affinity = affinity
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_hosts = max(1, int(max_hosts))
+        # 主机 -> 代理，按最近请求的顺序排列
+        self.hosts = OrderedDict()
+        self._next = 0
+        self.started = time.monotonic()
+
+    @property
+    def transports(self):
+        return [proxy.transport for proxy in self.proxies]
+
+    def _available(self, proxy, now):
+        return proxy.down_until <= now
+
+    def _pick(self, host, exclude=None):
+        now = time.monotonic()
+        if self.affinity:
+            proxy = self.hosts.get(host)
+            if proxy is not None and proxy is not exclude and self._available(proxy, now):
+                self.hosts.move_to_end(host)
+                return proxy
+        candidates = [proxy for proxy in self.proxies if proxy is not exclude and self._available(proxy, now)]
+        if not candidates:
+            candidates = [proxy for proxy in self.proxies if proxy is not exclude] or self.proxies
+            proxy = min(candidates, key=lambda item: item.down_until)
+        elif self.strategy == LEAST_BUSY:
+            proxy = min(candidates, key=lambda item: item.in_flight)
+        else:
+            proxy = candidates[self._next % len(candidates)]
+            self._next += 1
+        if self.affinity:
+            self.hosts[host] = proxy
+            self.hosts.move_to_end(host)
+            if len(self.hosts) > self.max_hosts:
+                self.hosts.popitem(last=False)
+        return proxy
+
+    def _failed(self, proxy):
+        proxy.errors += 1
+        proxy.failures += 1
+        if self.failure_threshold and proxy.failures >= self.failure_threshold:
+            proxy.failures = 0
+            proxy.downs += 1
+            proxy.down_until = time.monotonic() + self.cooldown
+
+    async def handle_async_request(self, request):
+        host = request.url.host
+        proxy = self._pick(host)
+        for attempt in range(2):
+            proxy.in_flight += 1
+            proxy.requests += 1
+            try:
+                response = await proxy.transport.handle_async_request(request)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                proxy.in_flight -= 1
+                self._failed(proxy)
+                if attempt or len(self.proxies) == 1:
+                    raise
+                proxy = self._pick(host, exclude=proxy)
+                continue
+            except BaseException:
+                proxy.in_flight -= 1
+                raise
+            proxy.failures = 0
+            proxy.down_until = 0.0
+            return httpx.Response(response.status_code, headers=response.headers,
+                                  stream=_CountingStream(response.stream, proxy), extensions=response.extensions)
+
+    async def aclose(self):
+        for proxy in self.proxies:
+            await proxy.transport.aclose()
+
+    def stats(self):
+        """各代理的状态和吞吐量，供日志和指标展示"""
+        now = time.monotonic()
+        elapsed = max(now - self.started, 1e-6)
+        return {
+            "strategy": self.strategy,
+            "affinity": self.affinity,
+            "proxies": {
+                proxy.url: {
+                    "up": self._available(proxy, now),
+                    "in_flight": proxy.in_flight,
+                    "requests": proxy.requests,
+                    "errors": proxy.errors,
+                    "downs": proxy.downs,
+                    "bytes": proxy.bytes,
+                    "requests_per_s": round(proxy.requests / elapsed, 2),
+                    "mb_per_s": round(proxy.bytes / elapsed / 1048576, 3),
+                    "hosts": sum(1 for item in self.hosts.values() if item is proxy),
+                }
+                for proxy in self.proxies
+            },
+        }
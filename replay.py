@@ -0,0 +1,111 @@
+## 离线重放：对响应存档中的每个响应重新运行parse_links和排除规则，多进程并行，不发起网络请求
+## 修改rules.yml或paramdict.yml后用它查看提取结果的变化，几秒内完成，不必重新爬取目标
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from archive import load_index, read_record
+
+# 每个任务处理的记录数
+BATCH_SIZE = 50
+
+
+def _init_worker(config_path, overrides):
+    """子进程初始化：使用与主进程相同的配置文件和临时配置项"""
+    from config import ConfigManager
+    if config_path:
+        ConfigManager._config_path = config_path
+    config = ConfigManager()
+    for section, option, value in overrides:
+        config.override(section, option, value)
+
+
+def _replay_batch(path, batch, scope):
+    """
+    重放一批记录（在子进程中运行）
+    :param batch: [(url, depth, offset, length), ...]
+    :return: [(url, 新链接{url: urlProperty}, 排除的链接{url: [规则, ...]}), ...]
+    """
+    import httpx
+    from link_extractor import parse_links
+
+    async def run():
+        rows = []
+        with open(path, "rb") as f:
+            for url, depth, offset, length in batch:
+                record = read_record(f, offset, length)
+                # 与爬取时相同的响应体解码方式
+                text = httpx.Response(record["status"] or 200, headers=record["headers"], content=record["body"]).text
+                new_urls, exclude_matches = await parse_links(text, url, depth or "", scope)
+                rows.append((url, new_urls, {link: sorted(rules) for link, rules in exclude_matches.items()}))
+        return rows
+
+    return asyncio.run(run())
+
+
+def replay(path, workers=None, scope=None, crawl=None, config_path=None, overrides=(), on_row=None):
+    """
+    离线重放存档
+    :param path: 存档文件
+    :param workers: 进程数，为None或0时使用CPU核数，为1时在当前进程中运行
+    :param scope: 扫描范围，为None时使用配置CRAWLER.SubDomain
+    :param crawl: 爬取编号，'latest'为最近一次，None为全部
+    :param config_path: 子进程使用的配置文件，为None时使用默认的config.ini
+    :param overrides: 子进程使用的临时配置项 [(section, option, value), ...]
+    :param on_row: 结果回调，每个提取到的链接调用一次，参数为
+                   {"kind": "link", "url", "source", "type", "rules"} 或 {"kind": "excluded", "url", "source", "rule"}
+    :return: 汇总
+    """
+    started = time.perf_counter()
+    records, requested = load_index(path, crawl)
+    archived = requested.union(url for url, *_ in records)
+    batches = [records[i:i + BATCH_SIZE] for i in range(0, len(records), BATCH_SIZE)]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(batches) or 1))
+
+    links = {}
+    excluded = {}
+    rule_counts = {}
+
+    def merge(rows):
+        for source, new_urls, exclude_matches in rows:
+            for url, (url_type, _, regex_names) in new_urls.items():
+                if url in links:
+                    continue
+                rules = [regex_names] if isinstance(regex_names, str) else sorted(regex_names)
+                links[url] = rules
+                for rule in rules:
+                    rule_counts[rule] = rule_counts.get(rule, 0) + 1
+                if on_row is not None:
+                    on_row({"kind": "link", "url": url, "source": source, "type": url_type, "rules": rules})
+            for url, rules in exclude_matches.items():
+                for rule in rules:
+                    if (url, rule) in excluded:
+                        continue
+                    excluded[(url, rule)] = source
+                    if on_row is not None:
+                        on_row({"kind": "excluded", "url": url, "source": source, "rule": rule})
+
+    if workers == 1:
+        _init_worker(config_path, overrides)
+        for batch in batches:
+            merge(_replay_batch(path, batch, scope))
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(config_path, tuple(overrides))) as pool:
+            for rows in pool.map(_replay_batch, [path] * len(batches), batches, [scope] * len(batches)):
+                merge(rows)
+
+    excluded_rules = {}
+    for _, rule in excluded:
+        excluded_rules[rule] = excluded_rules.get(rule, 0) + 1
+    return {
+        "records": len(records),
+        "workers": workers,
+        "links": len(links),
+        # 存档中没有的链接，即按当前规则爬取时会新请求的URL
+        "new": sum(1 for url in links if url not in archived),
+        "rules": dict(sorted(rule_counts.items(), key=lambda item: -item[1])),
+        "excluded": len(excluded),
+        "excluded_rules": dict(sorted(excluded_rules.items(), key=lambda item: -item[1])),
+        "elapsed": round(time.perf_counter() - started, 2),
+    }
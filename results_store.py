@@ -0,0 +1,340 @@
+## 爬取结果库，SQLite保存，后台线程批量写入，供UI和命令行筛选分页查询；排除日志也保存在结果库中，供流式导出
+import os
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from urllib.parse import urlparse
+
+# 查询结果的字段顺序
+COLUMNS = ("id", "crawl", "job", "timestamp", "url", "host", "status", "content_type", "size",
+           "depth", "depth_level", "type", "rules", "error")
+# 排除日志的字段顺序
+EXCLUSION_COLUMNS = ("id", "crawl", "job", "timestamp", "rule", "link", "source", "parent_index")
+# 表结构版本（PRAGMA user_version），打开旧版本的结果库时按版本依次升级
+SCHEMA_VERSION = 2
+
+
+def new_crawl_id():
+    """
+    新的爬取编号，结果库、断点和响应存档共用
+    编号为开始时间，精确到微秒（如 20250101120000-123456），同一秒内开始的两次爬取不会合并；按字符串排序即按时间排序
+    """
+    now = datetime.now()
+    return f"{now:%Y%m%d%H%M%S}-{now.microsecond:06d}"
+
+
+class ResultsStore:
+    """
+    爬取结果库
+    爬虫线程调用add_result/add_exclusion只把结果或排除日志放入内存队列，由写入线程每批最多batch_size条、
+    或每隔flush_interval秒在一个事务内写入，不占用爬虫事件循环
+    """
+
+    def __init__(self, path, batch_size=500, flush_interval=1.0):
+        """
+        :param path: 数据库文件路径，相对路径基于当前工作目录
+        :param batch_size: 每个事务最多写入的结果数
+        :param flush_interval: 写入间隔（秒）
+        """
+        self.path = os.path.abspath(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.crawl_id = None
+        self._queue = queue.Queue()
+        self._read_lock = threading.Lock()
+
+        self._write_conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._write_conn.execute("PRAGMA journal_mode=WAL")
+        self._write_conn.execute("PRAGMA synchronous=NORMAL")
+        self._write_conn.executescript("""
+            CREATE TABLE IF NOT EXISTS results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                crawl TEXT,
+                timestamp TEXT,
+                url TEXT,
+                host TEXT,
+                status INTEGER,
+                content_type TEXT,
+                size INTEGER,
+                depth TEXT,
+                depth_level INTEGER,
+                type TEXT,
+                rules TEXT,
+                error TEXT,
+                job TEXT
+            );
+            CREATE TABLE IF NOT EXISTS result_rules (result_id INTEGER, rule TEXT);
+            CREATE INDEX IF NOT EXISTS idx_results_crawl ON results (crawl);
+            CREATE INDEX IF NOT EXISTS idx_results_host ON results (host);
+            CREATE INDEX IF NOT EXISTS idx_results_status ON results (status);
+            CREATE INDEX IF NOT EXISTS idx_results_content_type ON results (content_type);
+            CREATE INDEX IF NOT EXISTS idx_results_depth_level ON results (depth_level);
+            CREATE INDEX IF NOT EXISTS idx_result_rules_rule ON result_rules (rule, result_id);
+            CREATE TABLE IF NOT EXISTS exclusions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                crawl TEXT,
+                job TEXT,
+                timestamp TEXT,
+                rule TEXT,
+                link TEXT,
+                source TEXT,
+                parent_index TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_exclusions_crawl ON exclusions (crawl, id);
+            CREATE INDEX IF NOT EXISTS idx_exclusions_rule ON exclusions (rule);
+        """)
+        self._migrate()
+        self._write_conn.commit()
+        self._read_conn = sqlite3.connect(self.path, check_same_thread=False)
+
+        self._writer = threading.Thread(target=self._write_loop, name="results-store-writer", daemon=True)
+        self._writer.start()
+
+    def _migrate(self):
+        """升级旧版本结果库的表结构"""
+        conn = self._write_conn
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            # 版本1：增加任务名列，多目标调度时区分结果属于哪个任务
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(results)")}
+            if "job" not in columns:
+                conn.execute("ALTER TABLE results ADD COLUMN job TEXT")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_results_job ON results (job)")
+        # 版本2：增加排除日志表exclusions，建表语句见__init__
+        if version < SCHEMA_VERSION:
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def start_crawl(self):
+        """开始新的一次爬取，之后写入的结果都归属于该次爬取，编号见new_crawl_id"""
+        self.crawl_id = new_crawl_id()
+        return self.crawl_id
+
+    def add_result(self, result):
+        """添加一条结果，只放入内存队列，不阻塞调用方"""
+        self._queue.put_nowait((self.crawl_id, result, False))
+
+    def add_exclusion(self, entry):
+        """添加一条排除日志 {timestamp, rule, link, source, parent_index, job}，只放入内存队列"""
+        self._queue.put_nowait((self.crawl_id, entry, True))
+
+    def _write_loop(self):
+        """写入线程"""
+        while True:
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    self._queue.task_done()
+                    break
+                batch.append(item)
+            if batch:
+                try:
+                    self._write_batch(batch)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+            if stop:
+                return
+
+    def _write_batch(self, batch):
+        with self._write_conn:
+            cursor = self._write_conn.cursor()
+            rule_rows = []
+            exclusion_rows = []
+            for crawl_id, result, excluded in batch:
+                if excluded:
+                    exclusion_rows.append((crawl_id, result.get('job'), result.get('timestamp'), result.get('rule'),
+                                           result.get('link'), result.get('source'), str(result.get('parent_index', ''))))
+                    continue
+                url = result.get('url') or ''
+                depth = str(result.get('depth', ''))
+                status = result.get('status')
+                regex_names = result.get('regex_names') or ()
+                # 种子URL的规则名为字符串"N"
+                rules = [regex_names] if isinstance(regex_names, str) else sorted(regex_names)
+                cursor.execute(
+                    "INSERT INTO results (crawl, job, timestamp, url, host, status, content_type, size, depth, depth_level, type, rules, error)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        crawl_id,
+                        result.get('job'),
+                        result.get('timestamp'),
+                        url,
+                        urlparse(url).netloc.lower(),
+                        status if isinstance(status, int) else None,
+                        normalize_content_type(result.get('content_type')),
+                        result.get('size'),
+                        depth,
+                        len(depth.split(".")) if depth else 0,
+                        result.get('type'),
+                        ",".join(rules),
+                        result.get('error'),
+                    )
+                )
+                rule_rows.extend((cursor.lastrowid, rule) for rule in rules)
+            cursor.executemany("INSERT INTO result_rules VALUES (?, ?)", rule_rows)
+            if exclusion_rows:
+                cursor.executemany(
+                    "INSERT INTO exclusions (crawl, job, timestamp, rule, link, source, parent_index)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)", exclusion_rows)
+
+    def flush(self):
+        """等待队列中的结果全部写入"""
+        self._queue.join()
+
+    def close(self):
+        """写完剩余结果并关闭数据库"""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        self._write_conn.close()
+        self._read_conn.close()
+
+    @staticmethod
+    def _where(crawl=None, job=None, host=None, status=None, content_type=None, rule=None, depth_level=None, url=None):
+        """
+        构造查询条件
+        :param job: 任务名（多目标调度时每个目标一个任务）
+        :param host: 主机名，支持*通配，如 *.example.com
+        :param status: 状态码，或 'error' 表示请求异常
+        :param content_type: 完整类型如 application/json，不含/时按包含匹配，如 json
+        :param rule: 规则名
+        :param depth_level: 深度层级，1为起始URL
+        :param url: URL包含的关键字
+        """
+        clauses, params = [], []
+        if crawl:
+            clauses.append("crawl = ?")
+            params.append(crawl)
+        if job:
+            clauses.append("job = ?")
+            params.append(job)
+        if host:
+            host = host.lower()
+            if "*" in host:
+                clauses.append("host LIKE ?")
+                params.append(host.replace("*", "%"))
+            else:
+                clauses.append("host = ?")
+                params.append(host)
+        if status is not None and status != "":
+            if str(status).lower() == "error":
+                clauses.append("status IS NULL")
+            else:
+                clauses.append("status = ?")
+                params.append(int(status))
+        if content_type:
+            content_type = content_type.lower()
+            if "/" in content_type:
+                clauses.append("content_type = ?")
+                params.append(content_type)
+            else:
+                clauses.append("content_type LIKE ?")
+                params.append(f"%{content_type}%")
+        if rule:
+            clauses.append("id IN (SELECT result_id FROM result_rules WHERE rule = ?)")
+            params.append(rule)
+        if depth_level:
+            clauses.append("depth_level = ?")
+            params.append(int(depth_level))
+        if url:
+            clauses.append("url LIKE ?")
+            params.append(f"%{url}%")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, limit=100, offset=0, **filters):
+        """按条件分页查询，返回结果字典列表，筛选条件见_where"""
+        where, params = self._where(**filters)
+        sql = f"SELECT {', '.join(COLUMNS)} FROM results{where} ORDER BY id LIMIT ? OFFSET ?"
+        with self._read_lock:
+            rows = self._read_conn.execute(sql, params + [limit, offset]).fetchall()
+        return [dict(zip(COLUMNS, row)) for row in rows]
+
+    def count(self, **filters):
+        """按条件统计结果数"""
+        where, params = self._where(**filters)
+        with self._read_lock:
+            return self._read_conn.execute(f"SELECT COUNT(*) FROM results{where}", params).fetchone()[0]
+
+    def iter_results(self, chunk_size=1000, **filters):
+        """按条件逐批读取全部结果，内存占用与结果总数无关"""
+        last_id = 0
+        where, params = self._where(**filters)
+        where = f"{where} AND id > ?" if where else " WHERE id > ?"
+        sql = f"SELECT {', '.join(COLUMNS)} FROM results{where} ORDER BY id LIMIT ?"
+        while True:
+            with self._read_lock:
+                rows = self._read_conn.execute(sql, params + [last_id, chunk_size]).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield dict(zip(COLUMNS, row))
+            last_id = rows[-1][0]
+
+    @staticmethod
+    def _exclusion_where(crawl=None, job=None, rule=None, link=None):
+        """
+        构造排除日志的查询条件
+        :param link: 排除链接包含的关键字
+        """
+        clauses, params = [], []
+        for column, value in (("crawl", crawl), ("job", job), ("rule", rule)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if link:
+            clauses.append("link LIKE ?")
+            params.append(f"%{link}%")
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def count_exclusions(self, **filters):
+        """按条件统计排除日志数，筛选条件见_exclusion_where"""
+        where, params = self._exclusion_where(**filters)
+        with self._read_lock:
+            return self._read_conn.execute(f"SELECT COUNT(*) FROM exclusions{where}", params).fetchone()[0]
+
+    def iter_exclusions(self, chunk_size=1000, **filters):
+        """按条件逐批读取全部排除日志，按id翻页，内存占用与总数无关"""
+        last_id = 0
+        where, params = self._exclusion_where(**filters)
+        where = f"{where} AND id > ?" if where else " WHERE id > ?"
+        sql = f"SELECT {', '.join(EXCLUSION_COLUMNS)} FROM exclusions{where} ORDER BY id LIMIT ?"
+        while True:
+            with self._read_lock:
+                rows = self._read_conn.execute(sql, params + [last_id, chunk_size]).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield dict(zip(EXCLUSION_COLUMNS, row))
+            last_id = rows[-1][0]
+
+    def distinct(self, column, crawl=None):
+        """获取某一列的不同取值，用于填充筛选下拉框"""
+        if column == "rule":
+            sql, params = "SELECT DISTINCT rule FROM result_rules ORDER BY rule", []
+        elif column in ("host", "status", "content_type", "crawl", "job"):
+            sql = f"SELECT DISTINCT {column} FROM results"
+            params = []
+            if crawl:
+                sql += " WHERE crawl = ?"
+                params.append(crawl)
+            sql += f" ORDER BY {column}"
+        else:
+            raise ValueError(f"不支持的列: {column}")
+        with self._read_lock:
+            return [row[0] for row in self._read_conn.execute(sql, params) if row[0] is not None]
+
+
+def normalize_content_type(content_type):
+    """去掉charset等参数，统一小写，如 'application/json; charset=utf-8' -> 'application/json'"""
+    if not content_type:
+        return None
+    return content_type.split(";", 1)[0].strip().lower() or None
@@ -0,0 +1,200 @@
+## 规则测试：在独立进程中用本地语料测试候选正则的匹配数、吞吐量，并检测扫描耗时是否随输入长度超线性增长
+## 命令行用法: python rule_bench.py "<正则>" [--group excludeLink] [--corpus benchmarks/corpus] [--time-limit 10]
+import argparse
+import json
+import math
+import os
+import re
+import subprocess
+import sys
+import time
+
+# 语料文件扩展名
+CORPUS_SUFFIXES = (".html", ".htm", ".js", ".json", ".txt")
+# 超线性检测的输入长度（字符）
+SCALING_SIZES = (2 * 1024, 4 * 1024, 8 * 1024, 16 * 1024)
+# 超线性检测的探测串，回溯型正则在重复字符上最容易失控
+PROBES = ("a", "/", "a/", "\"a", "a.", "a=", " ")
+# 耗时随长度增长的指数超过该值时告警（线性为1，平方为2）
+SUPERLINEAR_EXPONENT = 1.5
+# 最长一次扫描低于该耗时（秒）时不判断增长指数，避免计时噪声误报
+MIN_TIMING = 0.002
+
+
+def load_corpus(corpus_dir):
+    """读取语料目录下的全部响应文件，返回[(文件名, 内容), ...]"""
+    documents = []
+    if not corpus_dir or not os.path.isdir(corpus_dir):
+        return documents
+    for root, _, files in os.walk(corpus_dir):
+        for file_name in sorted(files):
+            if file_name.lower().endswith(CORPUS_SUFFIXES):
+                path = os.path.join(root, file_name)
+                with open(path, "r", encoding="utf-8", errors="replace") as f:
+                    documents.append((os.path.relpath(path, corpus_dir), f.read()))
+    return documents
+
+
+def _timed(func, content):
+    started = time.perf_counter()
+    result = func(content)
+    return time.perf_counter() - started, result
+
+
+def _growth_exponent(timings):
+    """根据(长度, 耗时)计算耗时随长度增长的指数，耗时太短时返回None"""
+    (size_first, time_first), (size_last, time_last) = timings[0], timings[-1]
+    if time_last < MIN_TIMING or time_first <= 0:
+        return None
+    return math.log(time_last / time_first) / math.log(size_last / size_first)
+
+
+def run_bench(regex, group="FindLink", sensitive=True, corpus_dir=None, rules_file=None):
+    """
+    在当前进程中测试规则，由worker进程调用
+    FindLink规则对每个语料文件执行findall；excludeLink规则对现有FindLink规则从语料中提取的链接执行match
+    :return: 测试结果字典
+    """
+    pattern = re.compile(regex, 0 if sensitive else re.IGNORECASE)
+    documents = load_corpus(corpus_dir)
+
+    if group == "excludeLink":
+        from config import RegexMatcher
+        matcher = RegexMatcher(rules_file or "rules.yml")
+        links = set()
+        for _, content in documents:
+            for findlink in matcher.patterns.get("FindLink", {}).values():
+                for match in findlink.findall(content):
+                    links.add(match if isinstance(match, str) else match[0])
+        inputs = sorted(links)
+        total_size = sum(len(link) for link in inputs)
+        started = time.perf_counter()
+        matches = sum(1 for link in inputs if pattern.match(link))
+        seconds = time.perf_counter() - started
+        per_document = []
+    else:
+        scan = pattern.findall
+        total_size = 0
+        matches = 0
+        seconds = 0.0
+        per_document = []
+        for name, content in documents:
+            elapsed, found = _timed(scan, content)
+            seconds += elapsed
+            matches += len(found)
+            total_size += len(content)
+            per_document.append({"name": name, "size": len(content), "seconds": round(elapsed, 6), "matches": len(found)})
+        per_document.sort(key=lambda item: item["seconds"], reverse=True)
+
+    # 超线性检测：语料拼接成不同长度，以及各探测串重复到不同长度
+    sample = "".join(content for _, content in documents) or "<a href=\"/index.html\"></a>"
+    scaling = {}
+    for probe_name, source in [("corpus", sample)] + [(f"probe:{probe}", probe) for probe in PROBES]:
+        timings = []
+        for size in SCALING_SIZES:
+            text = (source * (size // len(source) + 1))[:size]
+            if group == "excludeLink":
+                elapsed, _ = _timed(pattern.match, text)
+            else:
+                elapsed, _ = _timed(scan, text)
+            timings.append((size, elapsed))
+        scaling[probe_name] = {
+            "timings": [[size, round(elapsed, 6)] for size, elapsed in timings],
+            "exponent": _growth_exponent(timings),
+        }
+    worst = max(scaling.items(), key=lambda item: item[1]["exponent"] or 0)
+
+    return {
+        "documents": len(documents),
+        "inputs": len(documents) if group != "excludeLink" else len(inputs),
+        "bytes": total_size,
+        "matches": matches,
+        "seconds": round(seconds, 6),
+        "mb_per_s": round(total_size / 1048576 / seconds, 2) if seconds else None,
+        "slowest": per_document[:5],
+        "scaling": scaling,
+        "worst_probe": worst[0],
+        "worst_exponent": worst[1]["exponent"],
+        "superlinear": (worst[1]["exponent"] or 0) > SUPERLINEAR_EXPONENT,
+        "timeout": False,
+        "error": None,
+    }
+
+
+def bench_rule(regex, group="FindLink", sensitive=True, corpus_dir=None, time_limit=10, rules_file=None):
+    """
+    在独立进程中测试规则，超过time_limit秒时结束进程，避免失控的正则卡住调用方
+    :return: 测试结果字典，超时时timeout为True，出错时error为错误信息
+    """
+    try:
+        re.compile(regex, 0 if sensitive else re.IGNORECASE)
+    except re.error as e:
+        return {"timeout": False, "error": f"正则表达式编译错误: {e}"}
+
+    request = json.dumps({
+        "regex": regex,
+        "group": group,
+        "sensitive": sensitive,
+        "corpus_dir": os.path.abspath(corpus_dir) if corpus_dir else None,
+        "rules_file": os.path.abspath(rules_file) if rules_file else None,
+    })
+    try:
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--worker"],
+            input=request, capture_output=True, text=True, encoding="utf-8",
+            timeout=time_limit, cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except subprocess.TimeoutExpired:
+        return {"timeout": True, "time_limit": time_limit, "superlinear": True,
+                "error": f"测试超过{time_limit}秒未完成，规则可能存在灾难性回溯"}
+    if completed.returncode != 0:
+        return {"timeout": False, "error": completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "测试进程异常退出"}
+    return json.loads(completed.stdout)
+
+
+def format_result(result):
+    """测试结果的文字说明"""
+    if result.get("error"):
+        return result["error"]
+    lines = [
+        f"语料: {result['documents']} 个文件，{result['inputs']} 个输入，{result['bytes'] / 1048576:.2f} MB",
+        f"匹配: {result['matches']}",
+        f"耗时: {result['seconds'] * 1000:.1f} ms，吞吐量: {result['mb_per_s'] if result['mb_per_s'] is not None else '-'} MB/s",
+    ]
+    if result["documents"] == 0:
+        lines.append("提示: 语料目录为空或不存在，仅进行了探测串测试")
+    exponent = result.get("worst_exponent")
+    if exponent is not None:
+        lines.append(f"耗时增长指数: {exponent:.2f}（{result['worst_probe']}，线性约为1）")
+    if result.get("superlinear"):
+        lines.append("警告: 扫描耗时随输入长度超线性增长，大文件可能导致爬虫卡顿")
+    for item in result.get("slowest", [])[:3]:
+        lines.append(f"  {item['name']}: {item['seconds'] * 1000:.1f} ms，{item['matches']} 个匹配")
+    return "\n".join(lines)
+
+
+def _main():
+    parser = argparse.ArgumentParser(description="测试rules.yml规则的匹配数与性能")
+    parser.add_argument("regex", nargs="?", help="要测试的正则表达式")
+    parser.add_argument("--group", default="FindLink", choices=("FindLink", "excludeLink"))
+    parser.add_argument("--ignore-case", action="store_true", help="大小写不敏感")
+    parser.add_argument("--corpus", default=os.path.join("benchmarks", "corpus"), help="语料目录")
+    parser.add_argument("--time-limit", type=float, default=10, help="测试时间上限（秒）")
+    parser.add_argument("--json", action="store_true", help="以JSON输出结果")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        request = json.loads(sys.stdin.read())
+        json.dump(run_bench(**request), sys.stdout)
+        return 0
+    if not args.regex:
+        parser.error("缺少正则表达式")
+
+    result = bench_rule(args.regex, args.group, not args.ignore_case, args.corpus, args.time_limit)
+    print(json.dumps(result, ensure_ascii=False, indent=2) if args.json else format_result(result))
+    return 1 if result.get("error") or result.get("superlinear") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
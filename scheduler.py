@@ -0,0 +1,315 @@
+## 多目标任务调度：每个目标作为一个独立的爬取任务(Crawler)，拥有自己的扫描范围、深度和去重集合，
+## 限制同时运行的任务数，所有任务共用一个HTTP客户端（连接池），结果统一发送到UI队列和结果库
+import asyncio
+import json
+import time
+from urllib.parse import urlparse
+
+from config import ConfigManager
+from http_client import build_client, dns_cache, pool_stats, proxy_pool
+from results_store import new_crawl_id
+from web_crawler import Crawler, create_archive, create_budget, create_mirror, loggerRequest
+
+config = ConfigManager()
+
+# 任务状态
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# 任务行中可指定的选项，如 https://www.example.com depth=3 scope=*.example.com name=example requests=5000 mb=200 seconds=600
+JOB_OPTIONS = ("depth", "scope", "name", "requests", "mb", "seconds")
+
+
+def job_scope(target, mode=None):
+    """
+    由目标URL得到任务的扫描范围
+    :param mode: host只爬目标主机；subdomain爬目标主机及其子域名（去掉开头的www.）；config使用CRAWLER.SubDomain；
+                 为None时使用配置SCHEDULER.JobScope
+    :return: 扫描范围，如 example.com,*.example.com
+    """
+    mode = (mode or config.scheduler_job_scope).lower()
+    if mode == "config":
+        return config.crawler_sub_domain
+    host = (urlparse(target).hostname or "").lower()
+    if mode == "host":
+        return host
+    if host.startswith("www."):
+        host = host[4:]
+    return f"{host},*.{host}"
+
+
+class CrawlJob:
+    """一个爬取任务：一个目标URL及其扫描范围、深度和运行状态"""
+
+    def __init__(self, target, scope=None, max_depth=None, name=None, max_requests=None, max_mb=None, max_seconds=None):
+        """
+        :param target: 目标URL，作为任务的种子
+        :param scope: 扫描范围，为None时由job_scope按目标生成
+        :param max_depth: 爬取深度，为None时使用配置CRAWLER.MaxDepth
+        :param name: 任务名，为None时使用目标主机名
+        :param max_requests: 任务的请求数上限，为None时使用配置BUDGET.MaxRequests
+        :param max_mb: 任务的下载量上限(MB)，为None时使用配置BUDGET.MaxMB
+        :param max_seconds: 任务的用时上限（秒），为None时使用配置BUDGET.MaxSeconds
+        """
+        self.target = target
+        self.scope = scope or job_scope(target)
+        self.max_depth = int(max_depth) if max_depth else None
+        self.name = name or urlparse(target).netloc or target
+        self.max_requests = max_requests
+        self.max_mb = max_mb
+        self.max_seconds = max_seconds
+        self.status = PENDING
+        self.error = None
+        self.crawler = None
+        self.started = None
+        self.finished = None
+
+    def progress(self):
+        """任务进度，供UI展示和日志记录"""
+        crawler = self.crawler
+        metrics = crawler.metrics if crawler is not None else None
+        if self.started is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self.finished or time.time()) - self.started
+        return {
+            "name": self.name,
+            "target": self.target,
+            "scope": self.scope,
+            "status": self.status,
+            "requests": metrics.requests if metrics is not None else 0,
+            "errors": sum(metrics.exception_counts.values()) if metrics is not None else 0,
+            "bytes": metrics.bytes_downloaded if metrics is not None else 0,
+            "pending": crawler.request_queue.qsize() if crawler is not None and self.status == RUNNING else 0,
+            "elapsed": round(elapsed, 1),
+            # 用完的预算，如 ["requests", "host:cdn.example.com bytes"]
+            "budget": [item["budget"] if item["host"] is None else f"host:{item['host']} {item['budget']}"
+                       for item in crawler.budget.summary()["exhausted"]] if crawler is not None else [],
+            "error": self.error,
+        }
+
+    def __repr__(self):
+        return f"CrawlJob({self.name!r}, {self.target!r})"
+
+
+def parse_job_line(line):
+    """
+    解析一行任务，格式为 URL [depth=N] [scope=*.example.com] [name=NAME] [requests=N] [mb=N] [seconds=N]
+    :return: CrawlJob，空行和#开头的行返回None
+    """
+    parts = line.split()
+    if not parts or parts[0].startswith("#"):
+        return None
+    options = {}
+    for part in parts[1:]:
+        key, sep, value = part.partition("=")
+        key = key.strip().lower()
+        if not sep or key not in JOB_OPTIONS:
+            raise ValueError(f"任务选项格式应为 {'/'.join(JOB_OPTIONS)}=value: {part}")
+        options[key] = value.strip()
+    try:
+        return CrawlJob(parts[0], scope=options.get("scope"), max_depth=options.get("depth"), name=options.get("name"),
+                        max_requests=_number(options.get("requests")), max_mb=_number(options.get("mb")),
+                        max_seconds=_number(options.get("seconds")))
+    except ValueError:
+        raise ValueError(f"任务选项的值应为数字: {line}") from None
+
+
+def _number(value):
+    return None if value is None else float(value)
+
+
+def parse_jobs(lines):
+    """
+    解析多行任务，任务名重复时加序号区分
+    :param lines: 任务行的可迭代对象，如UI输入框按行分割的文本或种子文件
+    :return: [CrawlJob, ...]
+    """
+    jobs = []
+    names = {}
+    for line in lines:
+        job = parse_job_line(line)
+        if job is None:
+            continue
+        count = names[job.name] = names.get(job.name, 0) + 1
+        if count > 1:
+            job.name = f"{job.name}#{count}"
+        jobs.append(job)
+    return jobs
+
+
+def has_job_options(lines):
+    """任务行中是否指定了选项"""
+    return any(len(line.split()) > 1 for line in lines if line.strip() and not line.lstrip().startswith("#"))
+
+
+class JobScheduler:
+    """
+    任务调度器
+    最多max_active个任务同时运行，其余按顺序等待；一个任务失败不影响其他任务。
+    所有任务的结果归属于结果库中的同一次爬取，以job字段区分
+    """
+
+    def __init__(self, jobs, method="GET", max_active=None, ui_queue=None, exclude_queue=None, results_store=None,
+                 sinks=None, client=None, transport=None, proxies=None, on_progress=None, progress_interval=1.0,
+                 exclude_sinks=None):
+        """
+        :param jobs: CrawlJob列表
+        :param method: 请求方法
+        :param max_active: 同时运行的任务数，为None时使用配置SCHEDULER.MaxActiveJobs
+        :param ui_queue: UI队列，所有任务共用，全部任务结束后发送None
+        :param exclude_queue: 排除队列，所有任务共用，全部任务结束后发送None
+        :param results_store: 结果库(ResultsStore)，为None时不保存结果
+        :param sinks: 其他结果输出，每条结果调用其add_result
+        :param client: 共享的HTTP客户端，为None时运行期间自建客户端，所有任务共用
+        :param transport: 自建客户端的httpx传输层，为None时发起真实网络请求
+        :param proxies: 自建客户端的代理地址，为None时使用配置
+        :param on_progress: 任务进度回调，参数为CrawlJob.progress()，任务状态变化时及运行期间每隔progress_interval秒调用
+        :param progress_interval: 运行中任务的进度回调间隔（秒）
+        :param exclude_sinks: 其他排除日志输出，每条排除日志调用其add_exclusion
+        """
+        self.jobs = list(jobs)
+        self.method = method
+        self.max_active = max(1, int(max_active or config.scheduler_max_active_jobs))
+        self.ui_queue = ui_queue
+        self.exclude_queue = exclude_queue
+        self.results_store = results_store
+        self.extra_sinks = list(sinks or [])
+        self.extra_exclude_sinks = list(exclude_sinks or [])
+        self.client = client
+        self.transport = transport
+        self.proxies = proxies
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self.mirror = None
+        self.archive = None
+
+    async def run(self):
+        """运行全部任务，所有任务结束后返回"""
+        if self.client is not None:
+            await self._run(self.client)
+        else:
+            async with build_client(self.transport, self.proxies) as client:
+                await self._run(client)
+
+    async def _run(self, client):
+        sinks = list(self.extra_sinks)
+        exclude_sinks = list(self.extra_exclude_sinks)
+        # 全部任务属于同一次爬取，结果库、存档中的编号相同
+        crawl_id = self.results_store.start_crawl() if self.results_store is not None else new_crawl_id()
+        if self.results_store is not None:
+            sinks.append(self.results_store)
+            exclude_sinks.append(self.results_store)
+        loggerRequest.info(f"【任务调度】共{len(self.jobs)}个任务，同时运行{self.max_active}个")
+
+        # 镜像模式时所有任务共用一个重放器，启用存档时共用一个存档
+        self.archive = create_archive(crawl_id)
+        self.mirror = create_mirror()
+        if self.mirror is not None:
+            self.mirror.start()
+        semaphore = asyncio.Semaphore(self.max_active)
+        # 第i个任务的种子深度序号为i+1，各任务的深度序号互不重复
+        tasks = [asyncio.create_task(self._run_job(job, index, client, sinks, exclude_sinks, semaphore, crawl_id),
+                                     name=f"job:{job.name}")
+                 for index, job in enumerate(self.jobs)]
+        reporter = asyncio.create_task(self._report()) if self.on_progress is not None else None
+        try:
+            await asyncio.gather(*tasks)
+            for q in (self.ui_queue, self.exclude_queue):
+                if q is not None:
+                    await q.put(None)
+        finally:
+            for task in (*tasks, reporter):
+                if task is not None and not task.done():
+                    task.cancel()
+            if self.archive is not None:
+                await asyncio.to_thread(self.archive.close)
+                loggerRequest.info(f"【存档】{json.dumps(self.archive.stats(), ensure_ascii=False)}")
+            if self.mirror is not None:
+                await self.mirror.close(config.mirror_drain_seconds)
+                loggerRequest.info(f"【镜像】{json.dumps(self.mirror.stats(), ensure_ascii=False)}")
+            loggerRequest.info(f"【任务调度】{json.dumps(self.summary(), ensure_ascii=False)}")
+            loggerRequest.info(f"【连接池】{json.dumps(pool_stats(client), ensure_ascii=False)}")
+            dns = dns_cache(client)
+            if dns is not None:
+                dns.close()
+                loggerRequest.info(f"【DNS】{json.dumps(dns.stats(), ensure_ascii=False)}")
+            proxies = proxy_pool(client)
+            if proxies is not None:
+                loggerRequest.info(f"【代理池】{json.dumps(proxies.stats(), ensure_ascii=False)}")
+
+    async def _run_job(self, job, index, client, sinks, exclude_sinks, semaphore, crawl_id):
+        async with semaphore:
+            job.crawler = Crawler(job.target, self.method, self.ui_queue, self.exclude_queue, job.max_depth,
+                                  sinks=sinks, client=client, scope=job.scope, name=job.name,
+                                  depth_start=index, notify_done=False,
+                                  budget=create_budget(job.max_requests, job.max_mb, job.max_seconds),
+                                  mirror=self.mirror, archive=self.archive, exclude_sinks=exclude_sinks,
+                                  crawl_id=crawl_id)
+            job.status = RUNNING
+            job.started = time.time()
+            self._notify(job)
+            try:
+                await job.crawler.run()
+                job.status = DONE
+            except asyncio.CancelledError:
+                job.status = CANCELLED
+                raise
+            except Exception as e:
+                job.status = FAILED
+                job.error = f"{type(e).__name__}: {e}"
+                loggerRequest.info(f"【{job.name}】【任务失败】{job.error}")
+            finally:
+                job.finished = time.time()
+                self._notify(job)
+
+    async def _report(self):
+        """定期报告运行中任务的进度"""
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            for job in self.jobs:
+                if job.status == RUNNING:
+                    self._notify(job)
+
+    def _notify(self, job):
+        if self.on_progress is None:
+            return
+        try:
+            self.on_progress(job.progress())
+        except Exception as e:
+            loggerRequest.info(f"【任务调度】进度回调出错: {e}")
+
+    def summary(self):
+        """各状态的任务数及请求总数"""
+        counts = {}
+        for job in self.jobs:
+            counts[job.status] = counts.get(job.status, 0) + 1
+        progress = [job.progress() for job in self.jobs]
+        return {
+            "jobs": len(self.jobs),
+            "status": counts,
+            "requests": sum(item["requests"] for item in progress),
+            "errors": sum(item["errors"] for item in progress),
+            "budget_exhausted": {item["name"]: item["budget"] for item in progress if item["budget"]},
+        }
+
+
+def run_jobs_with_ui_queue(jobs, results_store=None, on_progress=None):
+    """
+    使用UI队列运行多个任务，与web_crawler.run_crawler_with_ui_queue相同，返回协程
+    :param jobs: CrawlJob列表
+    :param results_store: 结果库(ResultsStore)，为None时不保存结果
+    :param on_progress: 任务进度回调，见JobScheduler
+    :return: 协程，结果为(ui_queue, exclude_queue, 调度任务)
+    """
+    async def run_with_queue():
+        ui_queue = asyncio.Queue(maxsize=config.crawler_ui_queue_size)
+        exclude_queue = asyncio.Queue(maxsize=config.crawler_ui_queue_size)
+        scheduler = JobScheduler(jobs, ui_queue=ui_queue, exclude_queue=exclude_queue,
+                                 results_store=results_store, on_progress=on_progress)
+        return ui_queue, exclude_queue, asyncio.create_task(scheduler.run())
+
+    return run_with_queue()
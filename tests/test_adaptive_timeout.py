@@ -0,0 +1,62 @@
+## 自适应截止时间：分位数 × 倍数，限制在下限和上限之间，截断的请求作为截尾样本
+from adaptive_timeout import AdaptiveTimeout
+
+
+def test_ceiling_until_min_samples():
+    timeout = AdaptiveTimeout(min_samples=5, ceiling=30)
+    for _ in range(4):
+        timeout.observe("a", 0.1)
+    assert timeout.deadline("a") == 30
+    timeout.observe("a", 0.1)
+    assert timeout.deadline("a") == 2.0
+    assert timeout.deadline("b") == 30
+
+
+def test_percentile_times_multiplier():
+    timeout = AdaptiveTimeout(percentile=0.9, multiplier=2, floor=0.5, ceiling=60, min_samples=10)
+    for elapsed in range(1, 11):
+        timeout.observe("a", float(elapsed))
+    # 10个样本的90分位数是第9个
+    assert timeout.deadline("a") == 18.0
+    snapshot = timeout.snapshot()["hosts"]["a"]
+    assert snapshot == {"samples": 10, "percentile_latency": 9.0, "deadline": 18.0, "adaptive": True, "cut": 0}
+
+
+def test_deadline_clamped_to_ceiling():
+    timeout = AdaptiveTimeout(multiplier=3, ceiling=10, min_samples=1)
+    timeout.observe("a", 5)
+    assert timeout.deadline("a") == 10
+
+
+def test_recompute_every_n_samples():
+    timeout = AdaptiveTimeout(percentile=1.0, multiplier=1, floor=0, min_samples=1)
+    timeout.observe("a", 1)
+    assert timeout.deadline("a") == 1
+    for _ in range(AdaptiveTimeout.RECOMPUTE_EVERY - 2):
+        timeout.observe("a", 5)
+    # 到下一次重新计算前保持旧的截止时间
+    assert timeout.deadline("a") == 1
+    timeout.observe("a", 5)
+    assert timeout.deadline("a") == 5
+
+
+def test_cut_requests_raise_the_deadline():
+    timeout = AdaptiveTimeout(percentile=0.5, multiplier=2, floor=0.1, ceiling=60, window=20, min_samples=10)
+    for _ in range(10):
+        timeout.observe("a", 1.0)
+    assert timeout.deadline("a") == 2.0
+    # 主机整体变慢，每个请求都被截断，截止时间作为样本计入后逐步放宽
+    for _ in range(20):
+        timeout.timed_out("a", timeout.deadline("a"))
+    assert timeout.deadline("a") > 2.0
+    assert timeout.snapshot()["hosts"]["a"]["cut"] == 20
+
+
+def test_disabled_uses_ceiling():
+    timeout = AdaptiveTimeout(ceiling=15, min_samples=1, enabled=False)
+    timeout.observe("a", 0.1)
+    timeout.timed_out("a", 15)
+    assert timeout.deadline("a") == 15
+    # 未启用时只统计截断次数
+    assert timeout.snapshot()["hosts"]["a"] == {"samples": 0, "percentile_latency": None, "deadline": 15,
+                                                 "adaptive": False, "cut": 1}
@@ -0,0 +1,69 @@
+## 响应存档：WARC记录的写入和读取、索引中的爬取编号
+from datetime import datetime, timezone
+
+from archive import ResponseArchive, build_record, load_index, parse_record, read_record
+
+HEADERS = [("Content-Type", "text/html"), ("Content-Encoding", "gzip"), ("Content-Length", "3")]
+
+
+def test_record_round_trip():
+    body = "<a href='/api'>接口</a>".encode()
+    record = build_record("https://a.example/", 200, "OK", "HTTP/1.1", HEADERS, body,
+                          date=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc))
+    assert b"WARC-Date: 2024-01-02T03:04:05Z\r\n" in record
+    parsed = parse_record(record)
+    assert parsed["url"] == "https://a.example/"
+    assert parsed["status"] == 200
+    assert parsed["body"] == body
+    # 响应体已解压，去掉压缩相关的响应头，长度按实际响应体
+    assert parsed["headers"] == [("Content-Type", "text/html"), ("Content-Length", str(len(body)))]
+
+
+def _archive(path, **options):
+    return ResponseArchive(str(path), flush_interval=0.05, **options)
+
+
+def test_archive_write_and_read(tmp_path):
+    path = tmp_path / "archive.warc.gz"
+    archive = _archive(path, crawl_id="crawl-1")
+    archive.add("https://a.example/", 200, "OK", "HTTP/1.1", HEADERS, b"one", depth="0")
+    archive.add("https://a.example/b", 404, "Not Found", "HTTP/2", [], b"", request_url="https://a.example/b?x")
+    archive.flush()
+    assert archive.stats()["records"] == 2
+    archive.close()
+
+    records, requested = load_index(str(path))
+    assert requested == {"https://a.example/", "https://a.example/b?x"}
+    with open(path, "rb") as f:
+        bodies = [(read_record(f, offset, length)["status"], read_record(f, offset, length)["body"])
+                  for _, _, offset, length in records]
+    assert bodies == [(200, b"one"), (404, b"")]
+    assert records[0][1] == "0"
+
+
+def test_index_crawl_ids(tmp_path):
+    path = tmp_path / "archive.warc.gz"
+    archive = _archive(path, crawl_id="20240101000000000000")
+    archive.add("https://a.example/", 200, "OK", None, [], b"old")
+    # 记录指定的crawl优先于存档的crawl_id
+    archive.add("https://a.example/", 200, "OK", None, [], b"new", crawl="20240102000000000000")
+    archive.add("https://b.example/", 200, "OK", None, [], b"b", crawl="20240102000000000000")
+    archive.close()
+
+    assert [url for url, *_ in load_index(str(path), "20240101000000000000")[0]] == ["https://a.example/"]
+    latest, _ = load_index(str(path), "latest")
+    assert [url for url, *_ in latest] == ["https://a.example/", "https://b.example/"]
+    # 不指定爬取时同一URL只保留最后一条
+    records, _ = load_index(str(path))
+    with open(path, "rb") as f:
+        assert [read_record(f, offset, length)["body"] for _, _, offset, length in records] == [b"new", b"b"]
+
+
+def test_archive_appends_across_crawls(tmp_path):
+    path = tmp_path / "archive.warc.gz"
+    for crawl in ("c1", "c2"):
+        archive = _archive(path, crawl_id=crawl)
+        archive.add(f"https://a.example/{crawl}", 200, "OK", None, [], crawl.encode())
+        archive.close()
+    assert len(load_index(str(path))[0]) == 2
+    assert len(load_index(str(path), "c1")[0]) == 1
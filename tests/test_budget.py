@@ -0,0 +1,65 @@
+## 爬取预算：按整个爬取和单个主机限制请求数、字节数和用时
+import pipeline
+from pipeline import CrawlBudget
+
+
+def test_disabled_budget_admits_everything():
+    budget = CrawlBudget()
+    assert not budget.enabled
+    assert all(budget.admit("a") is None for _ in range(100))
+    budget.charge_bytes("a", 10 ** 9)
+    assert budget.usage == {"requests": 0, "bytes": 0}
+
+
+def test_crawl_request_limit():
+    exhausted = []
+    budget = CrawlBudget(max_requests=3, on_exhausted=lambda scope, kind: exhausted.append((scope, kind)))
+    assert [budget.admit("a") for _ in range(3)] == [None, None, None]
+    assert budget.admit("b") == "requests"
+    assert budget.admit("a") == "requests"
+    assert budget.stopped
+    # 回调只在首次用完时调用，之后只计丢弃数
+    assert exhausted == [(None, "requests")]
+    assert budget.summary()["exhausted"] == [{"scope": "crawl", "host": None, "budget": "requests", "skipped": 2}]
+
+
+def test_host_byte_limit_only_stops_that_host():
+    budget = CrawlBudget(host_max_bytes=1000)
+    assert budget.admit("a") is None
+    budget.charge_bytes("a", 600)
+    assert budget.admit("a") is None
+    budget.charge_bytes("a", 600)
+    # 字节数在响应返回后计入，超出后该主机的下一个URL丢弃
+    assert budget.admit("a") == "bytes"
+    assert budget.admit("b") is None
+    assert not budget.stopped
+    assert budget.hosts["a"]["bytes"] == 1200
+    assert budget.usage == {"requests": 3, "bytes": 1200}
+
+
+def test_crawl_limit_checked_before_host_limit():
+    budget = CrawlBudget(max_bytes=100, host_max_requests=10)
+    budget.admit("a")
+    budget.charge_bytes("a", 100)
+    assert budget.admit("b") == "bytes"
+    # 整个爬取用完时不再为新主机建立用量记录
+    assert "b" not in budget.hosts
+
+
+def test_time_limits(monkeypatch, clock):
+    monkeypatch.setattr(pipeline, "time", clock)
+    budget = CrawlBudget(max_seconds=60, host_max_seconds=10)
+    budget.start()
+    assert budget.admit("a") is None
+    clock.advance(5)
+    assert budget.admit("b") is None
+    clock.advance(6)
+    # 主机的用时从该主机的第一个请求开始计
+    assert budget.admit("a") == "seconds"
+    assert budget.admit("b") is None
+    clock.advance(50)
+    assert budget.admit("c") == "seconds"
+    assert budget.stopped
+    budget.finish()
+    clock.advance(100)
+    assert budget.summary()["elapsed"] == 61.0
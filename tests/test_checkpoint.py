@@ -0,0 +1,57 @@
+## 断点保存与恢复
+from checkpoint import CrawlCheckpoint
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "checkpoint.db"
+    checkpoint = CrawlCheckpoint(str(path))
+    checkpoint.reset(["https://a.example/", "https://b.example/"], "20250101120000-000001")
+    checkpoint.add("https://a.example/", ("N", "1", "N"))
+    checkpoint.add("https://a.example/app.js", ("js", "1-1", {"url", "api"}))
+    checkpoint.add("https://a.example/x.png", ("img", "1-2", {"url"}))
+    checkpoint.seeded(2, done=True)
+    checkpoint.complete("1")
+    checkpoint.drop("1-2")
+    checkpoint.add_result({"depth": "1", "url": "https://a.example/", "status": 200})
+    checkpoint.close()
+
+    restored = CrawlCheckpoint(str(path))
+    start_url, frontier, seen, results = restored.load()
+    assert start_url == ["https://a.example/", "https://b.example/"]
+    assert frontier == [("https://a.example/app.js", ("js", "1-1", {"url", "api"}))]
+    assert seen == {"https://a.example/"}
+    assert results == [{"depth": "1", "url": "https://a.example/", "status": 200}]
+    assert restored.crawl_id == "20250101120000-000001"
+    assert restored.seed_progress == (2, True)
+    assert restored.status == "running"
+    restored.finish()
+    assert restored.status == "finished"
+    restored.close()
+
+
+def test_results_of_unfinished_urls_are_dropped(tmp_path):
+    # 仍在frontier中的URL续爬时会重新请求，之前的结果行不恢复
+    checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.db"))
+    checkpoint.reset("https://a.example/")
+    checkpoint.add("https://a.example/", ("N", "1", "N"))
+    checkpoint.add_result({"depth": "1", "url": "https://a.example/"})
+    checkpoint.flush()
+    _, frontier, seen, results = checkpoint.load()
+    assert [url for url, _ in frontier] == ["https://a.example/"]
+    assert seen == set()
+    assert results == []
+    assert checkpoint.crawl_id is None
+    checkpoint.close()
+
+
+def test_reset_clears_previous_crawl(tmp_path):
+    checkpoint = CrawlCheckpoint(str(tmp_path / "checkpoint.db"))
+    checkpoint.reset("https://a.example/", "old")
+    checkpoint.add("https://a.example/", ("N", "1", "N"))
+    checkpoint.complete("1")
+    checkpoint.flush()
+    checkpoint.reset("https://b.example/", "new")
+    start_url, frontier, seen, results = checkpoint.load()
+    assert (start_url, frontier, seen, results) == ("https://b.example/", [], set(), [])
+    assert checkpoint.crawl_id == "new"
+    checkpoint.close()
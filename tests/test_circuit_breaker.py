@@ -0,0 +1,101 @@
+## 按主机熔断：closed -> open -> half_open -> closed/open
+import httpx
+
+import circuit_breaker
+from circuit_breaker import ALLOW, CLOSED, HALF_OPEN, OPEN, PROBE, REJECT, CircuitBreaker, is_breaker_failure
+
+
+def _breaker(monkeypatch, clock, **options):
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    changes = []
+    breaker = CircuitBreaker(on_state_change=lambda host, old, new: changes.append((host, old, new)), **options)
+    return breaker, changes
+
+
+def test_opens_after_consecutive_failures(monkeypatch, clock):
+    breaker, changes = _breaker(monkeypatch, clock, failure_threshold=3, cooldown=10)
+    breaker.record_failure("a")
+    breaker.record_failure("a")
+    # 中间有成功的请求时重新计数
+    breaker.record_success("a")
+    breaker.record_failure("a")
+    breaker.record_failure("a")
+    assert breaker.check("a") == ALLOW
+    breaker.record_failure("a")
+    assert breaker.check("a") == REJECT
+    assert breaker.check("b") == ALLOW
+    assert changes == [("a", CLOSED, OPEN)]
+    assert breaker.snapshot()["hosts"]["a"]["rejected"] == 1
+
+
+def test_probe_success_closes(monkeypatch, clock):
+    breaker, changes = _breaker(monkeypatch, clock, failure_threshold=1, cooldown=10)
+    breaker.record_failure("a")
+    clock.advance(9.9)
+    assert breaker.check("a") == REJECT
+    clock.advance(0.1)
+    assert breaker.check("a") == PROBE
+    # 探测期间其他请求仍被拒绝
+    assert breaker.check("a") == REJECT
+    breaker.record_success("a")
+    assert breaker.check("a") == ALLOW
+    assert changes == [("a", CLOSED, OPEN), ("a", OPEN, HALF_OPEN), ("a", HALF_OPEN, CLOSED)]
+
+
+def test_probe_failure_doubles_cooldown(monkeypatch, clock):
+    breaker, _ = _breaker(monkeypatch, clock, failure_threshold=1, cooldown=10, max_cooldown=25, max_trips=0)
+    breaker.record_failure("a")
+    for cooldown in (20, 25, 25):
+        clock.advance(breaker.hosts["a"].cooldown)
+        assert breaker.check("a") == PROBE
+        breaker.record_failure("a")
+        assert breaker.hosts["a"].state == OPEN
+        assert breaker.hosts["a"].cooldown == cooldown
+    # 恢复后冷却时间回到初始值
+    clock.advance(25)
+    assert breaker.check("a") == PROBE
+    breaker.record_success("a")
+    assert breaker.hosts["a"].cooldown == 10
+
+
+def test_release_probe(monkeypatch, clock):
+    breaker, _ = _breaker(monkeypatch, clock, failure_threshold=1, cooldown=10)
+    breaker.record_failure("a")
+    clock.advance(10)
+    assert breaker.check("a") == PROBE
+    breaker.release_probe("a")
+    assert breaker.check("a") == PROBE
+
+
+def test_parking_and_down_hosts(monkeypatch, clock):
+    breaker, _ = _breaker(monkeypatch, clock, failure_threshold=1, cooldown=10, max_trips=2, park=True)
+    breaker.record_failure("a")
+    assert breaker.should_park("a")
+    breaker.park("a", "u1")
+    breaker.park("a", "u2")
+    assert breaker.due() == []
+    clock.advance(10)
+    # 冷却结束时放回一个作为探测
+    assert breaker.due() == ["u1"]
+    assert breaker.check("a") == PROBE
+    breaker.record_failure("a")
+    # 断开次数达到max_trips，主机视为不可用，剩余的暂存URL全部放回且不再暂存
+    assert breaker.is_down("a")
+    assert not breaker.should_park("a")
+    assert breaker.due() == ["u2"]
+    assert breaker.parked == 0
+
+
+def test_disabled_breaker_never_opens():
+    breaker = CircuitBreaker(failure_threshold=0)
+    for _ in range(10):
+        breaker.record_failure("a")
+    assert breaker.check("a") == ALLOW
+
+
+def test_failure_classification():
+    request = httpx.Request("GET", "https://a.example/")
+    assert is_breaker_failure(httpx.ConnectError("x", request=request))
+    assert is_breaker_failure(httpx.ReadTimeout("x", request=request))
+    assert not is_breaker_failure(httpx.PoolTimeout("x", request=request))
+    assert not is_breaker_failure(httpx.RemoteProtocolError("x", request=request))
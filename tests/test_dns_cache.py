@@ -0,0 +1,151 @@
+## DNS缓存：缓存命中、主机不存在的否定缓存，以及建连时多个地址共用连接超时
+import asyncio
+import socket
+
+import httpcore
+import pytest
+
+import dns_cache
+from dns_cache import CachingBackend, DnsCache
+
+
+def _resolver(monkeypatch, records):
+    """用records（主机 -> 地址列表或gaierror）代替系统解析器，返回查询记录"""
+    queries = []
+
+    async def getaddrinfo(host, port, type=0):
+        queries.append(host)
+        await asyncio.sleep(0)
+        result = records[host]
+        if isinstance(result, Exception):
+            raise result
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, port)) for address in result]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", getaddrinfo)
+    return queries
+
+
+def test_cache_hits_and_shared_lookup(monkeypatch):
+    async def run():
+        queries = _resolver(monkeypatch, {"a.example": ["10.0.0.1", "10.0.0.1", "10.0.0.2"]})
+        cache = DnsCache()
+        # 同时解析同一主机只查询一次
+        results = await asyncio.gather(*(cache.resolve("a.example") for _ in range(5)))
+        assert await cache.resolve("a.example") == ["10.0.0.1", "10.0.0.2"]
+        return queries, results, cache.stats()
+
+    queries, results, stats = asyncio.run(run())
+    assert queries == ["a.example"]
+    assert results == [["10.0.0.1", "10.0.0.2"]] * 5
+    assert stats["lookups"] == 6 and stats["misses"] == 5 and stats["hits"] == 1
+
+
+def test_negative_cache(monkeypatch):
+    async def run():
+        error = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        queries = _resolver(monkeypatch, {"missing.example": error})
+        cache = DnsCache(negative_ttl=60)
+        for _ in range(3):
+            with pytest.raises(socket.gaierror):
+                await cache.resolve("missing.example")
+        return queries, cache.stats()
+
+    queries, stats = asyncio.run(run())
+    assert queries == ["missing.example"]
+    assert stats["negative_hits"] == 2 and stats["errors"] == 1
+
+
+def test_temporary_failures_are_not_cached(monkeypatch):
+    async def run():
+        error = socket.gaierror(socket.EAI_AGAIN, "Temporary failure in name resolution")
+        queries = _resolver(monkeypatch, {"flaky.example": error})
+        cache = DnsCache()
+        for _ in range(2):
+            with pytest.raises(socket.gaierror):
+                await cache.resolve("flaky.example")
+        return queries
+
+    assert asyncio.run(run()) == ["flaky.example"] * 2
+
+
+def test_entries_expire(monkeypatch, clock):
+    monkeypatch.setattr(dns_cache, "time", clock)
+
+    async def run():
+        queries = _resolver(monkeypatch, {"a.example": ["10.0.0.1"]})
+        cache = DnsCache(ttl=10)
+        await cache.resolve("a.example")
+        clock.advance(9)
+        await cache.resolve("a.example")
+        clock.advance(1)
+        await cache.resolve("a.example")
+        return queries
+
+    assert asyncio.run(run()) == ["a.example"] * 2
+
+
+def test_max_entries(monkeypatch):
+    async def run():
+        _resolver(monkeypatch, {host: ["10.0.0.1"] for host in ("a", "b", "c")})
+        cache = DnsCache(max_entries=2)
+        for host in ("a", "b", "c"):
+            await cache.resolve(host)
+        return list(cache.entries)
+
+    assert asyncio.run(run()) == ["b", "c"]
+
+
+class _FakeBackend(httpcore.AsyncNetworkBackend):
+    """不通的地址用完分到的时限后超时，其他地址直接连上"""
+
+    def __init__(self, clock, dead):
+        self.clock = clock
+        self.dead = dead
+        self.attempts = []
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.attempts.append((host, timeout))
+        if host in self.dead:
+            self.clock.advance(timeout)
+            raise httpcore.ConnectTimeout(host)
+        return host
+
+
+def _connect(monkeypatch, clock, addresses, dead, timeout=1.0):
+    monkeypatch.setattr(dns_cache, "time", clock)
+
+    async def run():
+        _resolver(monkeypatch, {"a.example": addresses})
+        fake = _FakeBackend(clock, dead)
+        backend = CachingBackend(DnsCache(), fake)
+        try:
+            return await backend.connect_tcp("a.example", 443, timeout=timeout), fake.attempts
+        except httpcore.ConnectTimeout:
+            return None, fake.attempts
+
+    return asyncio.run(run())
+
+
+def test_connect_timeout_split_across_addresses(monkeypatch, clock):
+    addresses = ["10.0.0.1", "10.0.0.2", "10.0.0.3", "10.0.0.4"]
+    stream, attempts = _connect(monkeypatch, clock, addresses, dead=set(addresses[:3]))
+    assert stream == "10.0.0.4"
+    # 总时限1秒，剩余时间平分给尚未尝试的地址
+    assert attempts == [(address, 0.25) for address in addresses]
+
+
+def test_connect_fails_when_all_addresses_dead(monkeypatch, clock):
+    addresses = ["10.0.0.1", "10.0.0.2"]
+    stream, attempts = _connect(monkeypatch, clock, addresses, dead=set(addresses))
+    assert stream is None
+    assert [timeout for _, timeout in attempts] == [0.5, 0.5]
+
+
+def test_ip_addresses_bypass_the_cache(clock):
+    async def run():
+        fake = _FakeBackend(clock, set())
+        cache = DnsCache()
+        stream = await CachingBackend(cache, fake).connect_tcp("127.0.0.1", 80, timeout=3)
+        return stream, fake.attempts, cache.lookups
+
+    assert asyncio.run(run()) == ("127.0.0.1", [("127.0.0.1", 3)], 0)
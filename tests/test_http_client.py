@@ -0,0 +1,102 @@
+## 共享HTTP客户端：传入的传输层、代理池、连接池统计和异常转换
+import asyncio
+
+import httpcore
+import httpx
+import pytest
+
+import http_client
+from dns_cache import DnsCache
+from proxy_pool import ProxyPoolTransport
+
+
+def _mock(log):
+    def handler(request):
+        log.append(str(request.url))
+        return httpx.Response(200, text="ok")
+    return httpx.MockTransport(handler)
+
+
+def _get(client, url):
+    async def run():
+        async with client:
+            response = await client.get(url)
+            return response.status_code, response.text
+    return asyncio.run(run())
+
+
+def test_injected_transport_ignores_proxies():
+    log = []
+    client = http_client.build_client(_mock(log), proxies="http://127.0.0.1:9")
+    # 代理不能挂载在传入的传输层上面，否则请求发往代理而不是MockTransport
+    assert _get(client, "https://a.example/x") == (200, "ok")
+    assert log == ["https://a.example/x"]
+    assert http_client.proxy_pool(client) is None
+    assert http_client.dns_cache(client) is None
+    assert http_client.pool_stats(client)["connections"] == 0
+
+
+def test_timeout_settings():
+    client = http_client.build_client(_mock([]), timeout=5)
+    assert client.timeout.connect == 5
+    assert client.timeout.read == 5
+    assert client.timeout.pool == 20.0
+
+
+def test_direct_client_uses_pool_transport_and_dns_cache():
+    dns = DnsCache()
+    limits = httpx.Limits(max_connections=7, max_keepalive_connections=3)
+    client = http_client.build_client(proxies="", limits=limits, http2=False, dns=dns)
+    assert http_client.dns_cache(client) is dns
+    assert [type(transport) for transport in client.pool_transports] == [http_client.PoolTransport]
+    assert http_client.pool_stats(client) == {"connections": 0, "active": 0, "idle": 0, "http2": 0, "waiting": 0,
+                                              "max_connections": 7, "max_keepalive": 3}
+
+
+def test_single_proxy_skips_dns_cache():
+    client = http_client.build_client(proxies="http://127.0.0.1:9", http2=False, dns=DnsCache())
+    assert http_client.dns_cache(client) is None
+    assert http_client.proxy_pool(client) is None
+    assert len(client.pool_transports) == 1
+
+
+def test_multiple_proxies_build_proxy_pool():
+    client = http_client.build_client(proxies="http://127.0.0.1:9, http://127.0.0.1:10", http2=False)
+    pool = http_client.proxy_pool(client)
+    assert isinstance(pool, ProxyPoolTransport)
+    assert [proxy.url for proxy in pool.proxies] == ["http://127.0.0.1:9", "http://127.0.0.1:10"]
+    assert len(client.pool_transports) == 2
+
+
+def test_unsupported_proxy_scheme():
+    with pytest.raises(ValueError):
+        http_client.PoolTransport(httpx.Limits(), proxy="ftp://127.0.0.1:21")
+
+
+class _FailingPool:
+    def __init__(self, error):
+        self.error = error
+        self.connections = []
+
+    async def handle_async_request(self, request):
+        raise self.error
+
+    async def aclose(self):
+        pass
+
+
+@pytest.mark.parametrize("source, target", [
+    (httpcore.ConnectTimeout("x"), httpx.ConnectTimeout),
+    (httpcore.ConnectError("x"), httpx.ConnectError),
+    (httpcore.PoolTimeout("x"), httpx.PoolTimeout),
+    (httpcore.RemoteProtocolError("x"), httpx.RemoteProtocolError),
+])
+def test_httpcore_errors_are_mapped(source, target):
+    transport = http_client.PoolTransport(httpx.Limits())
+    transport.pool = _FailingPool(source)
+    client = http_client.HttpClient(transport)
+    with pytest.raises(target):
+        _get(client, "http://a.example/")
+    # 失败的请求不计入在途请求
+    assert transport.in_flight == 0
+    assert transport.stats()["waiting"] == 0
@@ -0,0 +1,57 @@
+## 异步日志：后台线程批量写入、JSON行格式、重复配置与轮转
+import json
+import logging
+
+import log
+
+
+def _stop(name):
+    log._listeners.pop(name).stop()
+
+
+def test_json_lines_with_fields(tmp_path):
+    path = tmp_path / "request.log"
+    logger = log.setup_logger("test.json", str(path), add_console_handler=False, json_format=True, batch_size=3)
+    for i in range(10):
+        logger.info(f"请求{i}", extra={"fields": {"status": 200, "n": i}})
+    try:
+        raise ValueError("坏响应")
+    except ValueError:
+        logger.exception("解析失败")
+    _stop("test.json")
+
+    entries = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [entry["msg"] for entry in entries[:10]] == [f"请求{i}" for i in range(10)]
+    assert entries[3]["status"] == 200 and entries[3]["n"] == 3
+    assert entries[-1]["level"] == "ERROR" and "ValueError: 坏响应" in entries[-1]["exc"]
+
+
+def test_reconfigure_replaces_handler(tmp_path):
+    first, second = tmp_path / "a.log", tmp_path / "b.log"
+    logger = log.setup_logger("test.reconfigure", str(first), add_console_handler=False)
+    logger.info("第一条")
+    logger = log.setup_logger("test.reconfigure", str(second), add_console_handler=False)
+    logger.info("第二条")
+    _stop("test.reconfigure")
+
+    assert sum(isinstance(handler, log._QueueHandler) for handler in logger.handlers) == 1
+    # 替换前队列中的日志写入旧文件，之后的只写入新文件
+    assert first.read_text(encoding="utf-8").strip().endswith("第一条")
+    assert second.read_text(encoding="utf-8").strip().endswith("第二条")
+    assert "第二条" not in first.read_text(encoding="utf-8")
+
+
+def test_level_filter_and_rotation(tmp_path):
+    path = tmp_path / "rotate.log"
+    logger = log.setup_logger("test.rotate", str(path), level=logging.WARNING, add_console_handler=False,
+                              max_bytes=200, backup_count=2)
+    logger.info("不写入")
+    for i in range(20):
+        logger.warning(f"警告{i:02d}" + "x" * 20)
+    _stop("test.rotate")
+
+    files = sorted(tmp_path.glob("rotate.log*"))
+    assert [f.name for f in files] == ["rotate.log", "rotate.log.1", "rotate.log.2"]
+    text = "".join(f.read_text(encoding="utf-8") for f in files)
+    assert "不写入" not in text
+    assert "警告19" in path.read_text(encoding="utf-8")
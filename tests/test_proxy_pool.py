@@ -0,0 +1,112 @@
+## 代理池：选择策略、按主机固定代理、连接失败换代理和冷却
+import asyncio
+
+import httpx
+import pytest
+
+import proxy_pool
+from proxy_pool import LEAST_BUSY, ProxyPoolTransport, parse_proxies
+
+PROXIES = ["http://p1:8080", "http://p2:8080", "http://p3:8080"]
+
+
+class _Transport(httpx.AsyncBaseTransport):
+    """模拟一个代理的传输层，dead中的代理连接失败"""
+
+    def __init__(self, proxy, dead):
+        self.proxy = proxy
+        self.dead = dead
+
+    async def handle_async_request(self, request):
+        if self.proxy in self.dead:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, content=b"x" * 10)
+
+
+def _pool(dead=(), **options):
+    return ProxyPoolTransport(PROXIES, lambda proxy: _Transport(proxy, set(dead)), **options)
+
+
+def _fetch(pool, urls):
+    async def run():
+        used = []
+        async with httpx.AsyncClient(transport=pool) as client:
+            for url in urls:
+                response = await client.get(url)
+                await response.aread()
+        for url, stats in pool.stats()["proxies"].items():
+            used.append((url, stats["requests"], stats["bytes"]))
+        return used
+    return asyncio.run(run())
+
+
+def test_parse_proxies():
+    assert parse_proxies("http://a:1, http://b:2\nsocks5://c:3") == ["http://a:1", "http://b:2", "socks5://c:3"]
+    assert parse_proxies(["http://a:1", " ", ""]) == ["http://a:1"]
+    assert parse_proxies(None) == []
+    with pytest.raises(ValueError):
+        ProxyPoolTransport([], None)
+
+
+def test_round_robin():
+    pool = _pool()
+    assert [pool._pick("a").url for _ in range(4)] == PROXIES + PROXIES[:1]
+
+
+def test_least_busy():
+    pool = _pool(strategy=LEAST_BUSY)
+    pool.proxies[0].in_flight = 2
+    pool.proxies[1].in_flight = 1
+    pool.proxies[2].in_flight = 3
+    assert pool._pick("a").url == "http://p2:8080"
+
+
+def test_affinity_keeps_host_on_one_proxy():
+    pool = _pool(affinity=True)
+    first = pool._pick("a")
+    assert pool._pick("b") is not first
+    assert all(pool._pick("a") is first for _ in range(5))
+
+
+def test_affinity_map_is_bounded():
+    pool = _pool(affinity=True, max_hosts=2)
+    pool._pick("a")
+    pool._pick("b")
+    pool._pick("a")
+    pool._pick("c")
+    # 最久未请求的主机被忘记
+    assert list(pool.hosts) == ["a", "c"]
+
+
+def test_failover_and_counting():
+    pool = _pool(dead={"http://p1:8080"}, failure_threshold=0)
+    used = _fetch(pool, ["http://a.example/"] * 3)
+    # 轮到p1的请求失败后换一个代理重试，都成功返回
+    assert used == [("http://p1:8080", 2, 0), ("http://p2:8080", 1, 10), ("http://p3:8080", 2, 20)]
+    assert pool.stats()["proxies"]["http://p1:8080"]["errors"] == 2
+    assert all(proxy.in_flight == 0 for proxy in pool.proxies)
+
+
+def test_failed_proxy_cools_down(monkeypatch, clock):
+    monkeypatch.setattr(proxy_pool, "time", clock)
+    pool = _pool(dead={"http://p1:8080"}, failure_threshold=1, cooldown=30)
+    _fetch(pool, ["http://a.example/"])
+    assert not pool.stats()["proxies"]["http://p1:8080"]["up"]
+    assert {pool._pick("a").url for _ in range(4)} == {"http://p2:8080", "http://p3:8080"}
+    clock.advance(30)
+    assert "http://p1:8080" in {pool._pick("a").url for _ in range(3)}
+
+
+def test_all_proxies_down_uses_earliest_recovery(monkeypatch, clock):
+    monkeypatch.setattr(proxy_pool, "time", clock)
+    pool = _pool()
+    for index, proxy in enumerate(pool.proxies):
+        proxy.down_until = clock.now + 30 - index
+    assert pool._pick("a").url == "http://p3:8080"
+
+
+def test_second_failure_is_raised():
+    pool = _pool(dead=set(PROXIES))
+    with pytest.raises(httpx.ConnectError):
+        _fetch(pool, ["http://a.example/"])
+    assert sum(proxy.requests for proxy in pool.proxies) == 2
@@ -0,0 +1,107 @@
+## 结果库：旧版本升级、筛选和按id分批读取
+import sqlite3
+
+from results_store import SCHEMA_VERSION, ResultsStore, new_crawl_id
+
+
+def _result(i, **fields):
+    result = {"url": f"https://a.example/api/{i}", "status": 200, "content_type": "application/json; charset=utf-8",
+              "depth": f"1.{i}", "type": "api", "regex_names": {"api"}, "timestamp": "2025-01-01 12:00:00"}
+    result.update(fields)
+    return result
+
+
+def test_migrates_version_0(tmp_path):
+    # 版本0的结果库没有job列和排除日志表
+    path = tmp_path / "results.db"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, crawl TEXT, timestamp TEXT, url TEXT, host TEXT, status INTEGER,
+            content_type TEXT, size INTEGER, depth TEXT, depth_level INTEGER, type TEXT, rules TEXT, error TEXT
+        );
+        CREATE TABLE result_rules (result_id INTEGER, rule TEXT);
+        INSERT INTO results (crawl, url, host, status) VALUES ('old', 'https://a.example/', 'a.example', 200);
+    """)
+    conn.commit()
+    conn.close()
+
+    store = ResultsStore(str(path), flush_interval=0.05)
+    try:
+        assert store._read_conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        [row] = store.query(crawl="old")
+        assert row["url"] == "https://a.example/" and row["job"] is None
+        store.crawl_id = "new"
+        store.add_result(_result(1, job="a"))
+        store.add_exclusion({"timestamp": "2025-01-01 12:00:00", "rule": ".png", "link": "https://a.example/x.png",
+                             "source": "https://a.example/", "parent_index": "1", "job": "a"})
+        store.flush()
+        assert store.count(job="a") == 1
+        assert store.count_exclusions(crawl="new", rule=".png") == 1
+    finally:
+        store.close()
+
+
+def test_reopening_current_version_keeps_data(tmp_path):
+    path = str(tmp_path / "results.db")
+    store = ResultsStore(path, flush_interval=0.05)
+    store.crawl_id = "c1"
+    store.add_result(_result(1))
+    store.close()
+    store = ResultsStore(path, flush_interval=0.05)
+    try:
+        assert store.count(crawl="c1") == 1
+    finally:
+        store.close()
+
+
+def test_keyset_paging_and_filters(tmp_path):
+    store = ResultsStore(str(tmp_path / "results.db"), batch_size=7, flush_interval=0.05)
+    try:
+        store.crawl_id = "c1"
+        for i in range(25):
+            store.add_result(_result(i, status=404 if i % 5 == 0 else 200,
+                                     regex_names={"api", "token"} if i % 2 else {"api"}))
+        store.crawl_id = "c2"
+        store.add_result(_result(99))
+        store.flush()
+
+        rows = list(store.iter_results(chunk_size=4, crawl="c1"))
+        assert [row["url"] for row in rows] == [f"https://a.example/api/{i}" for i in range(25)]
+        ids = [row["id"] for row in rows]
+        assert ids == sorted(ids) and len(set(ids)) == 25
+
+        token = list(store.iter_results(chunk_size=3, crawl="c1", rule="token"))
+        assert [row["url"] for row in token] == [f"https://a.example/api/{i}" for i in range(1, 25, 2)]
+        assert store.count(crawl="c1", rule="token") == len(token)
+
+        assert store.count(crawl="c1", status=404) == 5
+        assert store.count(content_type="json") == 26
+        assert store.count(content_type="application/json") == 26
+        assert store.count(host="*.example") == 26
+        assert store.count(depth_level=2) == 26
+        assert store.query(limit=2, offset=24, crawl="c1")[0]["url"] == "https://a.example/api/24"
+        assert list(store.iter_results(crawl="missing")) == []
+    finally:
+        store.close()
+
+
+def test_iter_exclusions_pages_by_id(tmp_path):
+    store = ResultsStore(str(tmp_path / "results.db"), flush_interval=0.05)
+    try:
+        store.crawl_id = "c1"
+        for i in range(10):
+            store.add_exclusion({"rule": ".png" if i % 2 else ".css", "link": f"https://a.example/{i}",
+                                 "source": "https://a.example/", "parent_index": i})
+        store.flush()
+        rows = list(store.iter_exclusions(chunk_size=3, crawl="c1", rule=".png"))
+        assert [row["link"] for row in rows] == [f"https://a.example/{i}" for i in range(1, 10, 2)]
+        assert store.count_exclusions(crawl="c1", link="/3") == 1
+    finally:
+        store.close()
+
+
+def test_crawl_id_format():
+    # 精确到微秒，按字符串排序即按时间排序
+    crawl_id = new_crawl_id()
+    assert len(crawl_id) == 21 and crawl_id[14] == "-" and crawl_id.replace("-", "").isdigit()
@@ -0,0 +1,192 @@
+## 分阶段耗时追踪，按页面抽样记录抓取、解析、规范化、排除、入队等阶段的耗时，输出Chrome trace-event格式
+## 生成的文件可用 chrome://tracing 或 https://ui.perfetto.dev 打开
+import asyncio
+import contextvars
+import json
+import os
+import threading
+import time
+import zlib
+
+# 当前协程正在追踪的页面，未抽中的页面为None，其中的span不做任何记录
+_page = contextvars.ContextVar("trace_page", default=None)
+
+
+class Tracer:
+    """追踪记录器，事件先缓存在内存中，由flush()批量追加到文件"""
+
+    def __init__(self):
+        self.path = None
+        self.sample_rate = 0.0
+        # 是否同时记录每个span的线程CPU时间（args中的cpu_us），压测时开启
+        self.cpu = False
+        self._events = []
+        self._lanes = {}
+        self._lock = threading.Lock()
+        # 写文件时不持有_lock，避免事件循环线程记录span时等待写文件
+        self._write_lock = threading.Lock()
+        self._file = None
+        self._written = 0
+        self._pid = os.getpid()
+
+    @property
+    def enabled(self):
+        return self._file is not None
+
+    def configure(self, path, sample_rate=0.01):
+        """
+        开始追踪，覆盖已有文件
+        :param path: 追踪文件路径，为空则关闭追踪
+        :param sample_rate: 抽样比例，0~1，按页面深度序号抽样，同一页面的抓取和解析阶段同时抽中
+        """
+        self.close()
+        self.path = path
+        self.sample_rate = max(0.0, min(1.0, sample_rate))
+        if not path:
+            return
+        with self._write_lock, self._lock:
+            self._events = []
+            self._lanes = {}
+            self._written = 0
+            self._file = open(path, "w", encoding="utf-8")
+            self._file.write("[\n")
+
+    def sampled(self, key):
+        """按key的哈希值决定是否抽中，结果与调用顺序无关"""
+        if self.sample_rate >= 1:
+            return True
+        return zlib.crc32(str(key).encode()) % 10000 < self.sample_rate * 10000
+
+    def _lane(self):
+        """以协程名（没有时用线程名）区分时间线"""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        name = task.get_name() if task is not None else threading.current_thread().name
+        lane = self._lanes.get(name)
+        if lane is None:
+            lane = self._lanes[name] = len(self._lanes) + 1
+            self._events.append({"name": "thread_name", "ph": "M", "pid": self._pid, "tid": lane,
+                                 "args": {"name": name}})
+        return lane
+
+    def record(self, name, start_ns, end_ns, args):
+        """记录一个完整的span（ph=X），时间单位为微秒"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._events.append({
+                "name": name,
+                "ph": "X",
+                "ts": start_ns / 1000,
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": self._pid,
+                "tid": self._lane(),
+                "args": args,
+            })
+
+    def flush(self):
+        """把缓存的事件追加到文件"""
+        with self._write_lock:
+            with self._lock:
+                if self._file is None or not self._events:
+                    return
+                events, self._events = self._events, []
+            for event in events:
+                if self._written:
+                    self._file.write(",\n")
+                self._file.write(json.dumps(event, ensure_ascii=False, default=str))
+                self._written += 1
+            self._file.flush()
+
+    async def run(self, interval=5):
+        """定期写入协程，由爬虫主函数创建并在结束时取消"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(interval)
+            await loop.run_in_executor(None, self.flush)
+
+    def close(self):
+        """写完剩余事件并补全JSON数组"""
+        self.flush()
+        with self._write_lock, self._lock:
+            if self._file is not None:
+                self._file.write("\n]\n")
+                self._file.close()
+                self._file = None
+
+
+tracer = Tracer()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start", "cpu_start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.cpu_start = time.thread_time_ns() if tracer.cpu else None
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if self.cpu_start is not None:
+            self.args["cpu_us"] = (time.thread_time_ns() - self.cpu_start) / 1000
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        tracer.record(self.name, self.start, end, self.args)
+        return False
+
+
+class _PageSpan(_Span):
+    """页面级span，进入时标记当前协程正在追踪该页面"""
+
+    __slots__ = ("key", "token")
+
+    def __init__(self, name, key, args):
+        super().__init__(name, args)
+        self.key = key
+
+    def __enter__(self):
+        self.token = _page.set(self.key)
+        return super().__enter__()
+
+    def __exit__(self, exc_type, exc, tb):
+        super().__exit__(exc_type, exc, tb)
+        _page.reset(self.token)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def trace_page(name, key, **args):
+    """
+    页面级span，页面被抽中时，其中嵌套的span才会被记录
+    :param key: 页面标识，使用深度序号，抓取和解析两个阶段使用相同的key
+    """
+    if not tracer.enabled or not tracer.sampled(key):
+        return _NOOP
+    args["page"] = key
+    return _PageSpan(name, key, args)
+
+
+def span(name, **args):
+    """阶段span，不在被抽中的页面内时不做任何记录"""
+    if _page.get() is None:
+        return _NOOP
+    return _Span(name, args)
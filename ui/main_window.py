@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
     QTabWidget
 )
 from PySide6.QtCore import Signal
-from ui.views import CrawlerTab, ConfigSettingsTab, ExcludeLogsTab, RulesTab
+from ui.views import CrawlerTab, ConfigSettingsTab, ExcludeLogsTab, RulesTab, ResultsQueryTab
 from core.crawler_controller import CrawlerController
 
 class MainWindow(QMainWindow):
@@ -49,12 +49,17 @@ class MainWindow(QMainWindow):
         self.tab_widget.addTab(self.rules_tab, "规则")
 
         # 创建排除日志标签页
-        self.exclude_logs_tab = ExcludeLogsTab()
+        self.exclude_logs_tab = ExcludeLogsTab(self.crawler_controller.results_store)
         self.tab_widget.addTab(self.exclude_logs_tab, "排除日志")
         
         # 连接排除日志信号
         self.crawler_controller.exclude_log_signal.connect(self.exclude_logs_tab.add_log)
 
+        # 创建结果查询标签页
+        self.results_query_tab = ResultsQueryTab(self.crawler_controller.results_store)
+        self.results_query_tab.status_changed_signal.connect(self.update_status_bar)
+        self.tab_widget.addTab(self.results_query_tab, "结果查询")
+
         # 将标签页控件添加到主布局
         main_layout.addWidget(self.tab_widget)
 
@@ -157,3 +162,9 @@ class MainWindow(QMainWindow):
     def update_status_bar(self, status):
         """更新状态栏"""
         self.status_bar.showMessage(status)
+
+    def closeEvent(self, event):
+        """关闭窗口时写完结果库中尚未保存的结果"""
+        if self.crawler_controller.results_store is not None:
+            self.crawler_controller.results_store.close()
+        super().closeEvent(event)
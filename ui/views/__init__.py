@@ -3,3 +3,4 @@ from .rules_tab import RulesTab
 from .config_settings_tab import ConfigSettingsTab
 from .crawler_tab import CrawlerTab
 from .exclude_logs_tab import ExcludeLogsTab
+from .results_query_tab import ResultsQueryTab
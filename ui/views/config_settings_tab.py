@@ -60,9 +60,16 @@ class ConfigSettingsTab(QWidget):
         # 代理地址
         self.proxies_input = QLineEdit()
         self.proxies_input.setText(self.config.crawler_proxies)
-        self.proxies_input.setPlaceholderText("输入代理地址，例如: http://127.0.0.1:8080")
+        self.proxies_input.setPlaceholderText("输入代理地址，多个用逗号分隔，例如: http://127.0.0.1:8080")
         crawler_layout.addRow("代理地址:", self.proxies_input)
 
+        # 代理模式
+        self.proxy_mode_input = QComboBox()
+        self.proxy_mode_input.addItem("爬取请求经代理发送", "route")
+        self.proxy_mode_input.addItem("直连目标，后台经代理重放", "mirror")
+        self.proxy_mode_input.setCurrentIndex(max(self.proxy_mode_input.findData(self.config.crawler_proxy_mode), 0))
+        crawler_layout.addRow("代理模式:", self.proxy_mode_input)
+
         # fuzz参数字典开关
         self.param_switch_input = QCheckBox()
         self.param_switch_input.setChecked(self.config.crawler_param_switch)
@@ -74,9 +81,61 @@ class ConfigSettingsTab(QWidget):
         self.subdomain_input.setPlaceholderText("输入扫描范围，例如: *.example.com")
         crawler_layout.addRow("扫描范围:", self.subdomain_input)
 
+        # 多目标爬取同时运行的任务数
+        self.max_active_jobs_input = QSpinBox()
+        self.max_active_jobs_input.setRange(1, 100)
+        self.max_active_jobs_input.setValue(self.config.scheduler_max_active_jobs)
+        crawler_layout.addRow("同时运行任务数:", self.max_active_jobs_input)
+
+        # 任务扫描范围
+        self.job_scope_input = QComboBox()
+        self.job_scope_input.addItem("目标主机及子域名", "subdomain")
+        self.job_scope_input.addItem("仅目标主机", "host")
+        self.job_scope_input.addItem("使用扫描范围配置", "config")
+        self.job_scope_input.setCurrentIndex(max(self.job_scope_input.findData(self.config.scheduler_job_scope), 0))
+        crawler_layout.addRow("任务扫描范围:", self.job_scope_input)
+
+        # 多行URL是否按任务调度
+        self.multi_target_jobs_input = QCheckBox()
+        self.multi_target_jobs_input.setChecked(self.config.scheduler_multi_target_jobs)
+        self.multi_target_jobs_input.setToolTip("关闭时多行URL作为一次爬取的种子，使用扫描范围配置并支持断点续爬")
+        crawler_layout.addRow("多行URL按任务调度:", self.multi_target_jobs_input)
+
         # 设置爬虫配置组布局
         crawler_group.setLayout(crawler_layout)
 
+        # 创建连接配置组
+        http_group = QGroupBox("连接配置")
+        http_layout = QFormLayout()
+
+        # 连接池最大连接数
+        self.max_connections_input = QSpinBox()
+        self.max_connections_input.setRange(1, 1000)
+        self.max_connections_input.setValue(self.config.http_max_connections)
+        http_layout.addRow("最大连接数:", self.max_connections_input)
+
+        # 最多保持的空闲长连接数
+        self.max_keepalive_input = QSpinBox()
+        self.max_keepalive_input.setRange(0, 1000)
+        self.max_keepalive_input.setValue(self.config.http_max_keepalive)
+        http_layout.addRow("最大长连接数:", self.max_keepalive_input)
+
+        # 空闲长连接保持时间
+        self.keepalive_expiry_input = QSpinBox()
+        self.keepalive_expiry_input.setRange(0, 600)
+        self.keepalive_expiry_input.setSuffix(" 秒")
+        self.keepalive_expiry_input.setValue(int(self.config.http_keepalive_expiry))
+        http_layout.addRow("长连接保持时间:", self.keepalive_expiry_input)
+
+        # HTTP/2开关
+        self.http2_input = QCheckBox()
+        self.http2_input.setChecked(self.config.http_http2)
+        self.http2_input.setToolTip("需安装httpx[http2]，未安装时使用HTTP/1.1")
+        http_layout.addRow("启用HTTP/2:", self.http2_input)
+
+        # 设置连接配置组布局
+        http_group.setLayout(http_layout)
+
         # 创建报文模板配置组
         templates_group = QGroupBox("报文模板配置")
         templates_layout = QVBoxLayout()
@@ -128,6 +187,7 @@ class ConfigSettingsTab(QWidget):
 
         # 添加所有组件到主布局
         main_layout.addWidget(crawler_group)
+        main_layout.addWidget(http_group)
         main_layout.addWidget(extractor_group)
         main_layout.addWidget(templates_group)
         main_layout.addLayout(actions_layout)
@@ -142,8 +202,16 @@ class ConfigSettingsTab(QWidget):
         self.config.set('CRAWLER', 'MaxDepth', str(self.max_depth_input.value()))
         self.config.set('CRAWLER', 'MaxRetries', str(self.max_retries_input.value()))
         self.config.set('CRAWLER', 'Proxies', self.proxies_input.text())
+        self.config.set('CRAWLER', 'ProxyMode', self.proxy_mode_input.currentData())
         self.config.set('CRAWLER', 'ParamSwitch', str(self.param_switch_input.isChecked()))
         self.config.set('CRAWLER', 'SubDomain', self.subdomain_input.text())
+        self.config.set('SCHEDULER', 'MaxActiveJobs', str(self.max_active_jobs_input.value()))
+        self.config.set('SCHEDULER', 'JobScope', self.job_scope_input.currentData())
+        self.config.set('SCHEDULER', 'MultiTargetJobs', str(self.multi_target_jobs_input.isChecked()))
+        self.config.set('HTTP', 'MaxConnections', str(self.max_connections_input.value()))
+        self.config.set('HTTP', 'MaxKeepalive', str(self.max_keepalive_input.value()))
+        self.config.set('HTTP', 'KeepaliveExpiry', str(self.keepalive_expiry_input.value()))
+        self.config.set('HTTP', 'HTTP2', str(self.http2_input.isChecked()))
         self.config.set('EXTRACTOR', 'Suffix', self.exclude_extensions_input.text())
 
         # 发送配置保存信号
@@ -157,8 +225,16 @@ class ConfigSettingsTab(QWidget):
         self.max_depth_input.setValue(int(self.config.crawler_max_depth))
         self.max_retries_input.setValue(int(self.config.crawler_max_retries))
         self.proxies_input.setText(self.config.crawler_proxies)
+        self.proxy_mode_input.setCurrentIndex(max(self.proxy_mode_input.findData(self.config.crawler_proxy_mode), 0))
         self.param_switch_input.setChecked(self.config.crawler_param_switch)
         self.subdomain_input.setText(self.config.crawler_sub_domain)
+        self.max_active_jobs_input.setValue(self.config.scheduler_max_active_jobs)
+        self.job_scope_input.setCurrentIndex(max(self.job_scope_input.findData(self.config.scheduler_job_scope), 0))
+        self.multi_target_jobs_input.setChecked(self.config.scheduler_multi_target_jobs)
+        self.max_connections_input.setValue(self.config.http_max_connections)
+        self.max_keepalive_input.setValue(self.config.http_max_keepalive)
+        self.keepalive_expiry_input.setValue(int(self.config.http_keepalive_expiry))
+        self.http2_input.setChecked(self.config.http_http2)
         self.exclude_extensions_input.setText(self.config.extractor_Suffix)
         try:
             with open('message', 'r', encoding='utf-8') as f:
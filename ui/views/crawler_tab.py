@@ -1,12 +1,15 @@
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTableWidget, QTableWidgetItem, QHeaderView, QGroupBox, QSplitter,
-    QTreeWidget, QTreeWidgetItem, QMenu, QCheckBox, QRadioButton, QTextEdit
+    QTreeWidget, QTreeWidgetItem, QMenu, QCheckBox, QRadioButton, QTextEdit,
+    QFileDialog, QMessageBox, QProgressDialog
 )
-from PySide6.QtCore import Qt, Signal, Slot, QDateTime, QEvent, QTimer
+from PySide6.QtCore import Qt, Signal, Slot, QDateTime, QEvent, QTimer, QThreadPool
 from PySide6.QtGui import QGuiApplication, QAction, QTextBlockFormat, QTextCursor, QFontMetrics
 from datetime import datetime  # 导入datetime模块
 from config import ConfigManager
+from exporters import RESULT_FIELDS, RESULT_HEADERS
+from ui.views.export_task import ExportTask
 
 class CrawlerTab(QWidget):
     """爬虫标签页，包含爬虫控制界面、结果显示表格和链接树状预览"""
@@ -16,6 +19,10 @@ class CrawlerTab(QWidget):
     stop_crawler_signal = Signal()  # 停止爬取信号
     status_changed_signal = Signal(str)  # 状态变化信号，用于更新主窗口状态栏
 
+    # 任务进度表格列
+    JOB_HEADERS = ["任务", "状态", "请求数", "失败数", "待爬", "用时(秒)", "用完的预算", "扫描范围"]
+    JOB_STATUS = {"pending": "等待", "running": "运行中", "done": "完成", "failed": "失败", "cancelled": "已取消"}
+
     def __init__(self, crawler_controller):
         super().__init__()
         self.config = ConfigManager()
@@ -33,10 +40,15 @@ class CrawlerTab(QWidget):
         self.crawler_controller.log_signal.connect(self.add_log)
         # 数据接收信号 - 直接处理爬虫数据
         self.crawler_controller.data_received_signal.connect(self.process_crawler_data)
+        # 任务进度信号 - 多目标爬取时更新任务表格
+        self.crawler_controller.job_progress_signal.connect(self.update_job_progress)
 
         # 连接UI信号到控制器
         self.start_button.clicked.connect(self.start_crawler)
+        self.resume_button.clicked.connect(self.resume_crawler)
         self.stop_button.clicked.connect(self.stop_crawler)
+        self.export_button.clicked.connect(self.export_results)
+        self.metrics_button.clicked.connect(self.export_metrics)
 
         # 不再使用定时器轮询队列，改为通过信号触发
         # 但仍然保留queue_timer相关代码以便在需要时可以恢复
@@ -98,7 +110,8 @@ class CrawlerTab(QWidget):
         self.url_input.cursorPositionChanged.connect(
             lambda: self.url_input.ensureCursorVisible()
         )
-        self.url_input.setPlaceholderText("请输入URL，每行一个 (例如:https://example.com\nhttps://example.org)")
+        self.url_input.setPlaceholderText("请输入URL，每行一个，行中指定任务选项时每个URL作为独立任务 (例如:https://example.com\n"
+                                          "https://example.org depth=3 scope=*.example.org)")
         self.url_input.setMinimumWidth(400)
         self.url_input.setMaximumHeight(35)  # 默认显示单行高度
 
@@ -123,16 +136,26 @@ class CrawlerTab(QWidget):
         # 创建启动和停止按钮
         self.start_button = QPushButton("开始爬取")
         self.start_button.setMinimumWidth(100)
+        self.resume_button = QPushButton("继续爬取")
+        self.resume_button.setMinimumWidth(100)
+        self.resume_button.setToolTip("从断点文件恢复上次未完成的爬取")
         self.stop_button = QPushButton("停止爬取")
         self.stop_button.setMinimumWidth(100)
         self.stop_button.setEnabled(False)
+        self.export_button = QPushButton("导出结果")
+        self.export_button.setMinimumWidth(100)
+        self.metrics_button = QPushButton("导出指标")
+        self.metrics_button.setMinimumWidth(100)
 
         # 将控件添加到顶部布局
         top_layout.addWidget(url_label)
         top_layout.addWidget(self.url_input, 1)
         top_layout.addWidget(self.proxy_checkbox)
         top_layout.addWidget(self.start_button)
+        top_layout.addWidget(self.resume_button)
         top_layout.addWidget(self.stop_button)
+        top_layout.addWidget(self.export_button)
+        top_layout.addWidget(self.metrics_button)
 
         # 添加顶部控制区域到主布局
         self.main_layout.addWidget(top_control_widget)
@@ -166,6 +189,21 @@ class CrawlerTab(QWidget):
         # 将爬取结果区域添加到分割器
         self.splitter.addWidget(results_widget)
 
+        # 创建任务进度区域，多目标爬取时每个目标一行
+        self.jobs_group = QGroupBox("任务进度")
+        jobs_layout = QVBoxLayout()
+        self.jobs_table = QTableWidget()
+        self.jobs_table.setColumnCount(len(self.JOB_HEADERS))
+        self.jobs_table.setHorizontalHeaderLabels(self.JOB_HEADERS)
+        self.jobs_table.horizontalHeader().setSectionResizeMode(len(self.JOB_HEADERS) - 1, QHeaderView.Stretch)
+        self.jobs_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.jobs_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        jobs_layout.addWidget(self.jobs_table)
+        self.jobs_group.setLayout(jobs_layout)
+        self.jobs_group.setVisible(False)
+        self.job_rows = {}  # 任务名到行号的映射
+        self.splitter.addWidget(self.jobs_group)
+
         # 创建树状预览区域
         preview_group = QGroupBox("链接树状预览")
 
@@ -187,7 +225,7 @@ class CrawlerTab(QWidget):
         self.splitter.addWidget(preview_group)
 
         # 设置分割器的初始大小
-        self.splitter.setSizes([600, 400])
+        self.splitter.setSizes([600, 150, 400])
 
         # 将分割器添加到主布局
         self.main_layout.addWidget(self.splitter, 1)
@@ -215,6 +253,7 @@ class CrawlerTab(QWidget):
 
         # 禁用启动按钮，启用停止按钮
         self.start_button.setEnabled(False)
+        self.resume_button.setEnabled(False)
         self.stop_button.setEnabled(True)
 
         # 更新状态
@@ -229,6 +268,26 @@ class CrawlerTab(QWidget):
         # 调用爬虫控制器的启动方法
         self.crawler_controller.start_crawler(url)
 
+    def resume_crawler(self):
+        """从断点恢复上次未完成的爬取"""
+        if not self.config.storage_checkpoint_file:
+            self.update_status("未配置断点文件，无法继续爬取")
+            return
+
+        # 禁用启动按钮，启用停止按钮
+        self.start_button.setEnabled(False)
+        self.resume_button.setEnabled(False)
+        self.stop_button.setEnabled(True)
+
+        self.update_status("正在爬取: 从断点恢复")
+
+        # 清空结果显示区域，已有结果会由爬虫重新发送
+        self.clear_results()
+
+        self.config.set('CRAWLER', 'ProxySwitch', self.proxy_checkbox.isChecked())
+
+        self.crawler_controller.start_crawler(None, resume=True)
+
     def stop_crawler(self):
         """停止爬取"""
         try:
@@ -239,9 +298,73 @@ class CrawlerTab(QWidget):
             self.update_status(f"停止爬虫时出错: {str(e)}")
             # 确保按钮状态正确
             self.start_button.setEnabled(True)
+            self.resume_button.setEnabled(True)
             self.stop_button.setEnabled(False)
 
 
+    def export_results(self):
+        """从结果库导出本次爬取的结果，后台线程逐条写入"""
+        results_store = self.crawler_controller.results_store
+        if results_store is None or not results_store.crawl_id:
+            self.update_status("没有可导出的结果，请确认已配置结果库(STORAGE.ResultsDB)并完成爬取")
+            return
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "导出爬取结果", "", "JSONL文件 (*.jsonl);;CSV文件 (*.csv);;HAR文件 (*.har);;所有文件 (*)"
+        )
+        if not file_path:
+            return
+
+        crawl_id = results_store.crawl_id
+        # 总条数在后台线程等结果库写完后统计，之前显示为忙碌
+        progress = QProgressDialog("正在导出结果...", None, 0, 0, self)
+        progress.setWindowTitle("导出进度")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.setValue(0)
+        progress.show()
+
+        # 在后台线程等待结果库写完已爬取的结果，爬取进行中时写入队列可能积压，不阻塞界面
+        self._export_task = ExportTask(results_store.iter_results(crawl=crawl_id), file_path,
+                                       fields=RESULT_FIELDS, headers=RESULT_HEADERS, before=results_store.flush,
+                                       count=lambda: results_store.count(crawl=crawl_id))
+        self._export_task.signals.total.connect(lambda total: progress.setMaximum(max(total, 1)))
+        self._export_task.signals.progress.connect(progress.setValue)
+        self._export_task.signals.finished.connect(
+            lambda success, path, error_msg: self.on_export_finished(success, path, error_msg, progress)
+        )
+        QThreadPool.globalInstance().start(self._export_task)
+
+    def on_export_finished(self, success, file_path, error_msg, progress_dialog):
+        """导出完成后的处理"""
+        progress_dialog.close()
+        if success:
+            QMessageBox.information(self, "导出成功", f"爬取结果已成功导出到:\n{file_path}")
+        else:
+            QMessageBox.critical(self, "导出失败", f"导出结果时发生错误:\n{error_msg}")
+
+    def export_metrics(self):
+        """导出当前爬取的指标，.prom/.txt为Prometheus文本格式，其他为JSON快照"""
+        metrics = self.crawler_controller.get_metrics()
+        if metrics is None:
+            self.update_status("尚未开始爬取，没有可导出的指标")
+            return
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "导出爬取指标", "", "JSON快照 (*.json);;Prometheus文本 (*.prom *.txt)"
+        )
+        if not file_path:
+            return
+
+        try:
+            if file_path.lower().endswith((".prom", ".txt")):
+                metrics.write_prometheus(file_path)
+            else:
+                metrics.write_snapshot(file_path)
+            self.update_status(f"指标已导出到: {file_path}")
+        except Exception as e:
+            QMessageBox.critical(self, "导出失败", f"导出指标时发生错误:\n{str(e)}")
+
     def update_status(self, status):
         """更新爬虫状态"""
         # 发送状态更新信号给主窗口
@@ -250,9 +373,11 @@ class CrawlerTab(QWidget):
         # 根据状态更新按钮状态
         if status.startswith("已停止") or status.startswith("完成") or status == "爬虫已停止":
             self.start_button.setEnabled(True)
+            self.resume_button.setEnabled(True)
             self.stop_button.setEnabled(False)
         elif status.startswith("正在爬取") or status == "爬虫已启动":
             self.start_button.setEnabled(False)
+            self.resume_button.setEnabled(False)
             self.stop_button.setEnabled(True)
 
 
@@ -290,6 +415,23 @@ class CrawlerTab(QWidget):
             "regex_names": regex_names
         })
 
+    def update_job_progress(self, progress):
+        """更新任务进度表格中对应任务的一行"""
+        self.jobs_group.setVisible(True)
+        name = progress.get("name", "")
+        row = self.job_rows.get(name)
+        if row is None:
+            row = self.job_rows[name] = self.jobs_table.rowCount()
+            self.jobs_table.insertRow(row)
+        status = self.JOB_STATUS.get(progress.get("status"), progress.get("status"))
+        values = [name, status, progress.get("requests", 0), progress.get("errors", 0), progress.get("pending", 0),
+                  progress.get("elapsed", 0), ", ".join(progress.get("budget") or ()), progress.get("scope", "")]
+        for column, value in enumerate(values):
+            item = QTableWidgetItem(str(value))
+            if column == 1 and progress.get("error"):
+                item.setToolTip(progress["error"])
+            self.jobs_table.setItem(row, column, item)
+
     def show_item_details(self, item):
         """处理选中项事件，构建树状预览"""
         # 获取选中行
@@ -373,6 +515,11 @@ class CrawlerTab(QWidget):
         # 清空树状预览
         self.link_tree.clear()
 
+        # 清空任务进度
+        self.jobs_table.setRowCount(0)
+        self.job_rows = {}
+        self.jobs_group.setVisible(False)
+
         # 重置深度序号计数器
         self.depth_counters = {"1": 0}
         self.current_parent = "1"
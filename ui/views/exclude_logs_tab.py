@@ -136,10 +136,13 @@ class ExcludeLogsTab(QWidget):
     """排除日志标签页"""
 
     save_logs_signal = Signal(str)
-    export_finished = Signal(bool, str, str)
 
-    def __init__(self):
+    def __init__(self, results_store=None):
+        """
+        :param results_store: 结果库(ResultsStore)，配置了结果库时从中导出本次爬取的全部排除日志
+        """
         super().__init__()
+        self.results_store = results_store
         self.log_model = ExcludeLogsModel()
         self.init_ui()
 
@@ -410,183 +413,49 @@ class ExcludeLogsTab(QWidget):
             QMessageBox.critical(self, "保存失败", f"保存日志时发生错误:\n{error_msg}")
 
     def export_logs(self):
-        """导出日志到CSV文件"""
+        """导出日志到CSV/JSONL文件，后台线程逐条写入"""
         file_path, selected_filter = QFileDialog.getSaveFileName(
-            self, "导出排除日志", "", "CSV文件 (*.csv);;Excel文件 (*.xlsx);;所有文件 (*)"
+            self, "导出排除日志", "", "CSV文件 (*.csv);;JSONL文件 (*.jsonl);;所有文件 (*)"
         )
         if not file_path:
             return
 
-        # 显示进度对话框
-        progress = QProgressDialog("正在导出日志...", "取消", 0, 100, self)
+        results_store = self.results_store
+        before = count = None
+        if results_store is not None and results_store.crawl_id:
+            # 从结果库按id分批读取本次爬取的全部排除日志，条数不受界面保留条数限制；
+            # 在后台线程等结果库写完后再统计和读取，不阻塞界面
+            crawl_id = results_store.crawl_id
+            log_entries = results_store.iter_exclusions(crawl=crawl_id)
+            before = results_store.flush
+            count = lambda: results_store.count_exclusions(crawl=crawl_id)
+            total = 0
+        else:
+            # 未配置结果库时只能导出界面中保留的最近10000条，只复制条目引用，避免后台线程遍历时双端队列被修改
+            log_entries = self.log_model.get_all_logs()
+            total = max(len(log_entries), 1)
+
+        # 显示进度对话框，总条数未知时显示为忙碌
+        progress = QProgressDialog("正在导出日志...", None, 0, total, self)
         progress.setWindowTitle("导出进度")
         progress.setWindowModality(Qt.WindowModal)
         progress.setMinimumDuration(0)  # 立即显示
         progress.setValue(0)
         progress.show()
 
-        # 连接导出完成信号
-        self.export_finished.connect(lambda success, path, error_msg: self.on_export_finished(
-            success, path, error_msg, progress
-        ))
-
-        # 获取日志条目的副本，避免在导出过程中被修改
-        log_entries = self.log_model.get_all_logs().copy()
-
-        # 使用QRunnable在后台线程中执行导出
-        from PySide6.QtCore import QRunnable, QThreadPool, Slot
-
-        class ExportRunnable(QRunnable):
-            def __init__(self, file_path, log_entries, parent):
-                super().__init__()
-                self.file_path = file_path
-                self.log_entries = log_entries
-                self.parent = parent
-
-            @Slot()
-            def run(self):
-                try:
-                    # 根据文件类型选择导出方法
-                    if self.file_path.lower().endswith('.xlsx'):
-                        self.export_to_excel()
-                    else:
-                        self.export_to_csv()
-
-                    # 导出成功，发送信号
-                    from PySide6.QtCore import QMetaObject, Qt, Q_ARG
-                    QMetaObject.invokeMethod(
-                        self.parent,
-                        "export_finished",
-                        Qt.QueuedConnection,
-                        Q_ARG(bool, True),
-                        Q_ARG(str, self.file_path),
-                        Q_ARG(str, "")
-                    )
-                except Exception as e:
-                    # 导出失败，发送错误信号
-                    from PySide6.QtCore import QMetaObject, Qt, Q_ARG
-                    QMetaObject.invokeMethod(
-                        self.parent,
-                        "export_finished",
-                        Qt.QueuedConnection,
-                        Q_ARG(bool, False),
-                        Q_ARG(str, self.file_path),
-                        Q_ARG(str, str(e))
-                    )
-
-            def export_to_csv(self):
-                """在后台线程中导出到CSV文件"""
-                import csv
-
-                with open(self.file_path, 'w', encoding='utf-8', newline='') as f:
-                    # 创建CSV写入器
-                    writer = csv.writer(f)
-
-                    # 写入标题行
-                    writer.writerow(["时间", "排除规则", "排除链接", "链接来源"])
-
-                    # 批量写入日志条目，每次处理1000条
-                    batch_size = 1000
-                    total_entries = len(self.log_entries)
-
-                    for i in range(0, total_entries, batch_size):
-                        batch = self.log_entries[i:i+batch_size]
-                        for entry in batch:
-                            writer.writerow([
-                                entry['timestamp'],
-                                entry['rule'],
-                                entry['link'],
-                                entry['source']
-                            ])
-
-                        # 更新进度
-                        progress = min(100, int((i + batch_size) / total_entries * 100))
-                        from PySide6.QtCore import QMetaObject, Qt, Q_ARG
-                        QMetaObject.invokeMethod(
-                            self.parent.progress_dialog,
-                            "setValue",
-                            Qt.QueuedConnection,
-                            Q_ARG(int, progress)
-                        )
-
-            def export_to_excel(self):
-                """在后台线程中导出到Excel文件"""
-                try:
-                    import pandas as pd
-
-                    # 获取所有日志条目
-                    total_entries = len(self.log_entries)
-
-                    # 性能优化：使用批处理方式创建DataFrame
-                    batch_size = 1000
-                    writer = pd.ExcelWriter(self.file_path, engine='openpyxl')
-
-                    # 如果数据量小，直接导出
-                    if total_entries <= batch_size:
-                        data = []
-                        for entry in self.log_entries:
-                            data.append({
-                                "时间": entry['timestamp'],
-                                "排除规则": entry['rule'],
-                                "排除链接": entry['link'],
-                                "链接来源": entry['source'],
-                                "父链接序号": entry['parent_index']
-                            })
-
-                        df = pd.DataFrame(data)
-                        df.to_excel(writer, index=False, sheet_name='排除日志')
-
-                        # 更新进度
-                        from PySide6.QtCore import QMetaObject, Qt, Q_ARG
-                        QMetaObject.invokeMethod(
-                            self.parent.progress_dialog,
-                            "setValue",
-                            Qt.QueuedConnection,
-                            Q_ARG(int, 100)
-                        )
-                    else:
-                        # 数据量大，分批处理
-                        for i in range(0, total_entries, batch_size):
-                            batch = self.log_entries[i:i+batch_size]
-                            data = []
-                            for entry in batch:
-                                data.append({
-                                    "时间": entry['timestamp'],
-                                    "排除规则": entry['rule'],
-                                    "排除链接": entry['link'],
-                                    "链接来源": entry['source'],
-                                    "父链接序号": entry['parent_index']
-                                })
-
-                            # 创建DataFrame并写入Excel
-                            sheet_name = f'批次{i//batch_size+1}'
-                            df = pd.DataFrame(data)
-                            df.to_excel(writer, index=False, sheet_name=sheet_name)
-
-                            # 更新进度
-                            progress = min(100, int((i + batch_size) / total_entries * 100))
-                            from PySide6.QtCore import QMetaObject, Qt, Q_ARG
-                            QMetaObject.invokeMethod(
-                                self.parent.progress_dialog,
-                                "setValue",
-                                Qt.QueuedConnection,
-                                Q_ARG(int, progress)
-                            )
-
-                    # 保存Excel文件
-                    writer.close()
-                except ImportError:
-                    # 如果没有安装pandas，则使用CSV格式
-                    csv_path = self.file_path.rsplit('.', 1)[0] + '.csv'
-                    self.file_path = csv_path
-                    self.export_to_csv()
-
-        # 保存进度对话框的引用，以便在后台线程中更新
-        self.progress_dialog = progress
+        from PySide6.QtCore import QThreadPool
+        from ui.views.export_task import ExportTask
+        from exporters import EXCLUDE_FIELDS, EXCLUDE_HEADERS
 
         # 创建并启动导出任务
-        export_task = ExportRunnable(file_path, log_entries, self)
-        QThreadPool.globalInstance().start(export_task)
+        self._export_task = ExportTask(log_entries, file_path, fields=EXCLUDE_FIELDS,
+                                       headers=EXCLUDE_HEADERS, normalize=False, before=before, count=count)
+        self._export_task.signals.total.connect(lambda total: progress.setMaximum(max(total, 1)))
+        self._export_task.signals.progress.connect(progress.setValue)
+        self._export_task.signals.finished.connect(lambda success, path, error_msg: self.on_export_finished(
+            success, path, error_msg, progress
+        ))
+        QThreadPool.globalInstance().start(self._export_task)
 
     def on_export_finished(self, success, file_path, error_msg, progress_dialog):
         """导出完成后的处理"""
@@ -0,0 +1,46 @@
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+from exporters import open_exporter
+
+
+class ExportSignals(QObject):
+    """导出任务信号，在主线程创建，后台线程发出的信号会排队到主线程处理"""
+    progress = Signal(int)  # 已写入条数
+    total = Signal(int)  # 总条数，开始写入前发出
+    finished = Signal(bool, str, str)  # 是否成功, 文件路径, 错误信息
+
+
+class ExportTask(QRunnable):
+    """后台导出任务，逐条读取记录写入文件"""
+
+    def __init__(self, records, file_path, fmt=None, fields=None, headers=None, normalize=True, before=None,
+                 count=None):
+        """
+        :param records: 可迭代对象，在后台线程中逐条读取，如ResultsStore.iter_results()
+        :param file_path: 导出文件路径
+        :param fmt: jsonl/csv/har，为None时按扩展名判断
+        :param before: 开始读取前在后台线程中调用的函数，如ResultsStore.flush（等待写入线程写完，可能较久，不能阻塞界面）
+        :param count: 返回总条数的函数，在before之后调用，结果由signals.total发出
+        """
+        super().__init__()
+        self.records = records
+        self.file_path = file_path
+        self.fmt = fmt
+        self.fields = fields
+        self.headers = headers
+        self.normalize = normalize
+        self.before = before
+        self.count = count
+        self.signals = ExportSignals()
+
+    @Slot()
+    def run(self):
+        try:
+            if self.before is not None:
+                self.before()
+            if self.count is not None:
+                self.signals.total.emit(self.count())
+            with open_exporter(self.file_path, self.fmt, self.fields, self.normalize, self.headers) as exporter:
+                exporter.write_all(self.records, progress=self.signals.progress.emit)
+            self.signals.finished.emit(True, self.file_path, "")
+        except Exception as e:
+            self.signals.finished.emit(False, self.file_path, str(e))
@@ -0,0 +1,207 @@
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QTableWidget, QTableWidgetItem, QHeaderView, QComboBox, QSpinBox
+)
+from PySide6.QtCore import Signal
+from PySide6.QtGui import QGuiApplication
+
+
+class ResultsQueryTab(QWidget):
+    """结果查询标签页，从结果库中按任务、主机、状态码、类型、规则和深度筛选分页查看"""
+
+    status_changed_signal = Signal(str)  # 状态变化信号，用于更新主窗口状态栏
+
+    PAGE_SIZE = 200
+    HEADERS = ["时间", "任务", "深度序号", "响应状态", "类型", "大小", "规则", "URL"]
+
+    def __init__(self, results_store):
+        super().__init__()
+        self.results_store = results_store
+        self.page = 0
+        self.total = 0
+        self.init_ui()
+
+    def init_ui(self):
+        """初始化UI组件"""
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(10, 10, 10, 10)
+        main_layout.setSpacing(10)
+
+        # 筛选条件
+        filter_widget = QWidget()
+        filter_layout = QHBoxLayout(filter_widget)
+        filter_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.crawl_combo = QComboBox()
+        self.crawl_combo.setMinimumWidth(140)
+        self.crawl_combo.currentIndexChanged.connect(self.refresh_jobs)
+
+        self.job_combo = QComboBox()
+        self.job_combo.setEditable(True)
+        self.job_combo.setMinimumWidth(120)
+
+        self.host_input = QLineEdit()
+        self.host_input.setPlaceholderText("主机，如 *.example.com")
+
+        self.status_combo = QComboBox()
+        self.status_combo.setEditable(True)
+        self.status_combo.addItems(["", "200", "302", "403", "404", "500", "error"])
+
+        self.content_type_input = QLineEdit()
+        self.content_type_input.setPlaceholderText("类型，如 json")
+
+        self.rule_combo = QComboBox()
+        self.rule_combo.setEditable(True)
+        self.rule_combo.setMinimumWidth(100)
+
+        self.depth_input = QSpinBox()
+        self.depth_input.setRange(0, 20)
+        self.depth_input.setSpecialValueText("全部")
+
+        self.url_input = QLineEdit()
+        self.url_input.setPlaceholderText("URL关键字")
+
+        self.query_button = QPushButton("查询")
+        self.query_button.clicked.connect(self.search)
+
+        filter_layout.addWidget(QLabel("爬取:"))
+        filter_layout.addWidget(self.crawl_combo)
+        filter_layout.addWidget(QLabel("任务:"))
+        filter_layout.addWidget(self.job_combo)
+        filter_layout.addWidget(QLabel("主机:"))
+        filter_layout.addWidget(self.host_input, 1)
+        filter_layout.addWidget(QLabel("状态:"))
+        filter_layout.addWidget(self.status_combo)
+        filter_layout.addWidget(QLabel("类型:"))
+        filter_layout.addWidget(self.content_type_input)
+        filter_layout.addWidget(QLabel("规则:"))
+        filter_layout.addWidget(self.rule_combo)
+        filter_layout.addWidget(QLabel("深度:"))
+        filter_layout.addWidget(self.depth_input)
+        filter_layout.addWidget(self.url_input, 1)
+        filter_layout.addWidget(self.query_button)
+        main_layout.addWidget(filter_widget)
+
+        # 结果表格
+        self.results_table = QTableWidget()
+        self.results_table.setColumnCount(len(self.HEADERS))
+        self.results_table.setHorizontalHeaderLabels(self.HEADERS)
+        self.results_table.horizontalHeader().setSectionResizeMode(len(self.HEADERS) - 1, QHeaderView.Stretch)
+        self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.results_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.results_table.doubleClicked.connect(self.copy_selected_url)
+        main_layout.addWidget(self.results_table, 1)
+
+        # 分页
+        page_widget = QWidget()
+        page_layout = QHBoxLayout(page_widget)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        self.prev_button = QPushButton("上一页")
+        self.prev_button.clicked.connect(self.prev_page)
+        self.next_button = QPushButton("下一页")
+        self.next_button.clicked.connect(self.next_page)
+        self.page_label = QLabel("")
+        page_layout.addStretch(1)
+        page_layout.addWidget(self.page_label)
+        page_layout.addWidget(self.prev_button)
+        page_layout.addWidget(self.next_button)
+        main_layout.addWidget(page_widget)
+
+        if self.results_store is None:
+            self.setEnabled(False)
+            self.page_label.setText("未配置结果库 (STORAGE.ResultsDB)")
+
+    def showEvent(self, event):
+        """切换到本标签页时刷新下拉框选项"""
+        super().showEvent(event)
+        self.refresh_options()
+
+    def refresh_options(self):
+        """从结果库读取爬取批次和规则名"""
+        if self.results_store is None:
+            return
+        current_crawl = self.crawl_combo.currentData()
+        self.crawl_combo.clear()
+        self.crawl_combo.addItem("全部", None)
+        for crawl in reversed(self.results_store.distinct("crawl")):
+            self.crawl_combo.addItem(crawl, crawl)
+        index = self.crawl_combo.findData(current_crawl or self.results_store.crawl_id)
+        self.crawl_combo.setCurrentIndex(max(index, 0))
+
+        self.refresh_jobs()
+
+        current_rule = self.rule_combo.currentText()
+        self.rule_combo.clear()
+        self.rule_combo.addItems([""] + self.results_store.distinct("rule"))
+        self.rule_combo.setCurrentText(current_rule)
+
+    def refresh_jobs(self):
+        """读取所选爬取批次中的任务名"""
+        if self.results_store is None:
+            return
+        current_job = self.job_combo.currentText()
+        self.job_combo.clear()
+        self.job_combo.addItems([""] + self.results_store.distinct("job", self.crawl_combo.currentData()))
+        self.job_combo.setCurrentText(current_job)
+
+    def filters(self):
+        """获取当前筛选条件"""
+        return {
+            "crawl": self.crawl_combo.currentData(),
+            "job": self.job_combo.currentText().strip(),
+            "host": self.host_input.text().strip(),
+            "status": self.status_combo.currentText().strip(),
+            "content_type": self.content_type_input.text().strip(),
+            "rule": self.rule_combo.currentText().strip(),
+            "depth_level": self.depth_input.value(),
+            "url": self.url_input.text().strip(),
+        }
+
+    def search(self):
+        """按新条件从第一页开始查询"""
+        self.page = 0
+        self.load_page()
+
+    def prev_page(self):
+        if self.page > 0:
+            self.page -= 1
+            self.load_page()
+
+    def next_page(self):
+        if (self.page + 1) * self.PAGE_SIZE < self.total:
+            self.page += 1
+            self.load_page()
+
+    def load_page(self):
+        """查询当前页"""
+        try:
+            filters = self.filters()
+            self.total = self.results_store.count(**filters)
+            rows = self.results_store.query(limit=self.PAGE_SIZE, offset=self.page * self.PAGE_SIZE, **filters)
+        except ValueError as e:
+            self.status_changed_signal.emit(f"查询条件错误: {str(e)}")
+            return
+
+        self.results_table.setRowCount(0)
+        self.results_table.setRowCount(len(rows))
+        for row_position, row in enumerate(rows):
+            status = row["status"] if row["status"] is not None else "error"
+            values = [row["timestamp"], row["job"] or "", row["depth"], status, row["content_type"] or "",
+                      row["size"] if row["size"] is not None else "", row["rules"], row["url"]]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if column == len(values) - 1 and row["error"]:
+                    item.setToolTip(row["error"])
+                self.results_table.setItem(row_position, column, item)
+
+        pages = max(1, (self.total + self.PAGE_SIZE - 1) // self.PAGE_SIZE)
+        self.page_label.setText(f"共 {self.total} 条，第 {self.page + 1}/{pages} 页")
+        self.prev_button.setEnabled(self.page > 0)
+        self.next_button.setEnabled(self.page + 1 < pages)
+
+    def copy_selected_url(self, index):
+        """双击复制选中行的URL到剪贴板"""
+        url_item = self.results_table.item(index.row(), len(self.HEADERS) - 1)
+        if url_item:
+            QGuiApplication.clipboard().setText(url_item.text())
+            self.status_changed_signal.emit(f"已复制URL: {url_item.text()}")
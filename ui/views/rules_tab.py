@@ -4,11 +4,40 @@ from PySide6.QtWidgets import (
     QCheckBox, QHeaderView, QAbstractItemView, QDialog, QFormLayout,
     QLineEdit, QDialogButtonBox, QComboBox, QMessageBox, QRadioButton
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer, QObject, QRunnable, QThreadPool, Slot
 from PySide6.QtGui import QIcon, QFont
 import yaml
 import os
 import re
+from config import ConfigManager
+from rule_bench import bench_rule, format_result
+
+
+class RuleBenchSignals(QObject):
+    """规则测试任务信号"""
+    finished = Signal(str, dict)  # 测试的正则, 测试结果
+
+
+class RuleBenchTask(QRunnable):
+    """后台规则测试任务，测试本身在独立进程中运行，超时后结束进程"""
+
+    def __init__(self, regex, group, sensitive):
+        super().__init__()
+        self.regex = regex
+        self.group = group
+        self.sensitive = sensitive
+        self.signals = RuleBenchSignals()
+
+    @Slot()
+    def run(self):
+        config = ConfigManager()
+        rules_file = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'rules.yml')
+        try:
+            result = bench_rule(self.regex, self.group, self.sensitive, config.bench_corpus_dir,
+                                config.bench_time_limit, rules_file)
+        except Exception as e:
+            result = {"timeout": False, "error": f"规则测试失败: {str(e)}"}
+        self.signals.finished.emit(self.regex, result)
 
 class RuleEditDialog(QDialog):
     """规则编辑对话框"""
@@ -16,6 +45,10 @@ class RuleEditDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("编辑规则")
         self.setMinimumWidth(400)
+        # 最近一次测试的正则及结果，保存前据此判断是否需要提示
+        self.bench_regex = None
+        self.bench_result = None
+        self.accept_after_bench = False
         self.init_ui()
         
     def init_ui(self):
@@ -49,6 +82,16 @@ class RuleEditDialog(QDialog):
         form_layout.addRow("", self.case_sensitive_checkbox)
         
         layout.addLayout(form_layout)
+
+        # 规则测试
+        self.bench_button = QPushButton("测试规则")
+        self.bench_button.clicked.connect(self.start_bench)
+        self.bench_output = QTextEdit()
+        self.bench_output.setReadOnly(True)
+        self.bench_output.setPlaceholderText("使用本地语料测试规则的匹配数和吞吐量，保存前会自动测试")
+        self.bench_output.setMinimumHeight(120)
+        layout.addWidget(self.bench_button)
+        layout.addWidget(self.bench_output)
         
         # 按钮
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -56,6 +99,46 @@ class RuleEditDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def start_bench(self):
+        """在后台测试当前正则"""
+        regex = self.regex_edit.text()
+        if not regex:
+            self.bench_output.setPlainText("请输入正则表达式")
+            return
+        self.bench_button.setEnabled(False)
+        self.bench_output.setPlainText("正在测试...")
+        group = 'FindLink' if self.findlink_radio.isChecked() else 'excludeLink'
+        self._bench_task = RuleBenchTask(regex, group, self.case_sensitive_checkbox.isChecked())
+        self._bench_task.signals.finished.connect(self.on_bench_finished)
+        QThreadPool.globalInstance().start(self._bench_task)
+
+    def on_bench_finished(self, regex, result):
+        """显示测试结果，如果是保存时触发的测试，继续保存流程"""
+        self.bench_button.setEnabled(True)
+        self.bench_regex = regex
+        self.bench_result = result
+        self.bench_output.setPlainText(format_result(result))
+        if self.accept_after_bench:
+            self.accept_after_bench = False
+            self.accept()
+
+    def accept(self):
+        """保存前测试规则，超时、出错或耗时超线性增长时需确认"""
+        if self.bench_regex != self.regex_edit.text() or self.bench_result is None:
+            self.accept_after_bench = True
+            self.start_bench()
+            return
+        result = self.bench_result
+        if result.get("error") or result.get("superlinear"):
+            reply = QMessageBox.question(
+                self, "规则测试未通过",
+                f"{format_result(result)}\n\n仍然保存该规则吗？",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                return
+        super().accept()
+
     def set_rule_data(self, rule_data):
         """设置对话框中的规则数据"""
         self.name_edit.setText(rule_data.get('name', ''))
@@ -84,6 +167,12 @@ class RulesTab(QWidget):
     # 定义信号
     status_changed_signal = Signal(str)  # 状态变化信号，用于更新主窗口状态栏
 
+    # 规则统计列，从第5列（操作列之后）开始
+    STATS_COLUMN = 5
+    FINDLINK_STATS = [("耗时(ms)", "scan_ms"), ("扫描(MB)", "bytes"), ("MB/s", "mb_per_s"),
+                      ("匹配", "matches"), ("被排除", "excluded"), ("2xx", "ok_2xx")]
+    EXCLUDELINK_STATS = [("耗时(ms)", "scan_ms"), ("检查", "checked"), ("排除", "excluded")]
+
     def __init__(self):
         super().__init__()
         self.rules_file = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'rules.yml')
@@ -92,6 +181,11 @@ class RulesTab(QWidget):
         self.init_ui()
         self.load_rules()
 
+        # 定时刷新当前爬取中各规则的开销与产出
+        self.stats_timer = QTimer(self)
+        self.stats_timer.timeout.connect(self.refresh_rule_stats)
+        self.stats_timer.start(2000)
+
     def init_ui(self):
         """初始化UI组件"""
         # 创建主布局
@@ -131,8 +225,9 @@ class RulesTab(QWidget):
         findlink_layout = QVBoxLayout()
 
         self.findlink_table = QTableWidget()
-        self.findlink_table.setColumnCount(5)  # 规则名、正则表达式、大小写敏感、启用、操作
-        self.findlink_table.setHorizontalHeaderLabels(["规则名", "正则表达式", "大小写敏感", "启用", "操作"])
+        self.findlink_table.setColumnCount(self.STATS_COLUMN + len(self.FINDLINK_STATS))  # 规则名、正则表达式、大小写敏感、启用、操作、规则统计
+        self.findlink_table.setHorizontalHeaderLabels(["规则名", "正则表达式", "大小写敏感", "启用", "操作"]
+                                                      + [header for header, _ in self.FINDLINK_STATS])
         
         # 设置表格属性
         self.findlink_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -152,8 +247,9 @@ class RulesTab(QWidget):
         excludelink_layout = QVBoxLayout()
 
         self.excludelink_table = QTableWidget()
-        self.excludelink_table.setColumnCount(5)  # 规则名、正则表达式、大小写敏感、启用、操作
-        self.excludelink_table.setHorizontalHeaderLabels(["规则名", "正则表达式", "大小写敏感", "启用", "操作"])
+        self.excludelink_table.setColumnCount(self.STATS_COLUMN + len(self.EXCLUDELINK_STATS))  # 规则名、正则表达式、大小写敏感、启用、操作、规则统计
+        self.excludelink_table.setHorizontalHeaderLabels(["规则名", "正则表达式", "大小写敏感", "启用", "操作"]
+                                                         + [header for header, _ in self.EXCLUDELINK_STATS])
         
         # 设置表格属性
         self.excludelink_table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -295,6 +391,31 @@ class RulesTab(QWidget):
                 
                 table.setCellWidget(row, 4, actions_widget)
 
+        self.refresh_rule_stats(force=True)
+
+    def refresh_rule_stats(self, force=False):
+        """刷新规则统计列，数据来自匹配器在本次爬取中的累计统计"""
+        if not force and not self.isVisible():
+            return
+        stats = ConfigManager().matcher.stats.snapshot()
+        for table, group, columns in ((self.findlink_table, "FindLink", self.FINDLINK_STATS),
+                                      (self.excludelink_table, "excludeLink", self.EXCLUDELINK_STATS)):
+            group_stats = stats.get(group, {})
+            for row in range(table.rowCount()):
+                rule_item = table.item(row, 0)
+                rule_stats = group_stats.get(rule_item.text()) if rule_item else None
+                for offset, (_, key) in enumerate(columns):
+                    value = rule_stats.get(key) if rule_stats else None
+                    if key == "bytes" and value is not None:
+                        value = round(value / 1048576, 2)
+                    text = "" if value is None else str(value)
+                    item = table.item(row, self.STATS_COLUMN + offset)
+                    if item is None:
+                        item = QTableWidgetItem(text)
+                        item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                        table.setItem(row, self.STATS_COLUMN + offset, item)
+                    elif item.text() != text:
+                        item.setText(text)
 
     def toggle_rule_enabled(self, row, state, table):
         """切换规则启用状态"""
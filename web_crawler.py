@@ -2,369 +2,802 @@
 import asyncio
 import json
 import re
+import sys
 import time
 from urllib.parse import urljoin,urlparse
 from log import setup_logger
 import httpx
-from urllib3.util.retry import Retry
 from httpx import RemoteProtocolError, ConnectError, ReadTimeout
 from link_extractor import parse_links
-from messageparse import message
+from messageparse import message, HttpCaseInsensitiveDict
 from config import ConfigManager
+from pipeline import FrontierQueue, ByteBudgetQueue, MemoryGovernor, WorkTracker, CrawlBudget, queue_stats
+from checkpoint import CrawlCheckpoint
+from http_client import build_client, build_proxy_pool, dns_cache, pool_stats, proxy_pool
+from proxy_pool import parse_proxies
+from adaptive_timeout import AdaptiveTimeout
+from mirror import ProxyMirror
+from archive import ResponseArchive
+from results_store import new_crawl_id
+from circuit_breaker import CircuitBreaker, REJECT, PROBE, is_breaker_failure
+from metrics import CrawlMetrics
+from tracing import tracer, trace_page
 from datetime import datetime
 
 config = ConfigManager()
 
-loggerRequest = setup_logger('requestlog', 'requestlog.log')
+loggerRequest = setup_logger('requestlog', config.log_request_file, **config.log_options())
 # 去除url上下文
 re_remove_url_context = re.compile(r"(https?://[^/]+)/[^/]+(/.*)")
 
 
 url_completed = set()
 
+# 当前爬取各阶段的队列与内存调节器，供指标展示
+current_pipeline = {}
+# 当前爬取的指标
+current_metrics = None
 
 
+# 请求报文模板（message文件），作为每次爬取请求头和请求体的默认值
 gic = message()
 headers = gic.headers
 data = gic.body
 
-async def network_request(request_queue, process_queue, method="get", ui_queue=None):
+
+
+def create_budget(max_requests=None, max_mb=None, max_seconds=None):
     """
-    网络请求函数
-    :param proxies: 代理配置，None表示不使用代理
-    :param request_queue: 请求队列
-    :param process_queue: 处理队列
-    :param method: 请求方法
-    :param ui_queue: UI队列，用于向UI发送网络请求状态和进度信息
-    :return:
+    按配置[BUDGET]创建爬取预算，参数不为None时代替对应的整体预算（多目标任务单独指定的预算）
+    :param max_requests: 请求数上限
+    :param max_mb: 下载量上限(MB)
+    :param max_seconds: 用时上限（秒）
     """
-    if method.lower() == "get":
-        body = None
-    else:
-        body = data
-
-    timeout_config = httpx.Timeout(
-        connect=10.0,  # 连接超时 5s
-        read=60.0,  # 读取超时 60s（根据文件大小调整）
-        write=10.0,  # 发送超时 10s
-        pool=20.0  # 连接池等待 15s
-    )
-    # 创建一个重试策略
-    retries = Retry(
-        total=config.crawler_max_retries,  # 最大重试次数
-        backoff_factor=2,  # 重试间隔（秒）
-        status_forcelist=[429, 500, 502, 503, 504],  # 需要重试的状态码
-        allowed_methods=["GET", "POST"],  # 允许重试的 HTTP 方法
+    return CrawlBudget(
+        config.budget_max_requests if max_requests is None else int(max_requests),
+        config.budget_max_bytes if max_mb is None else int(float(max_mb) * 1024 * 1024),
+        config.budget_max_seconds if max_seconds is None else float(max_seconds),
+        config.budget_host_max_requests,
+        config.budget_host_max_bytes,
+        config.budget_host_max_seconds,
     )
 
-    try:
-        # 防止同时发起过多请求导致服务端压力
-        transport = httpx.AsyncHTTPTransport(retries=retries)
-        proxies = config.crawler_proxies if config.crawler_proxy_switch else None
-        async with httpx.AsyncClient(proxy=proxies, headers=headers, timeout=timeout_config, transport=transport, verify=False) as client:
-            while True:
-                try:
-                    # 使用wait_for以便能够响应取消
-                    url, urlProperty = await asyncio.wait_for(request_queue.get(), timeout=1.0)
-                    if url is None:
-                        break  # 接收到 None 作为停止信号
-                    
-                    urlFuzz, depth, regex_names = urlProperty
-                    if len(depth.split(".")) > int(config.crawler_max_depth):
-                        request_queue.task_done()
-                        continue
-                    if url in url_completed:
-                        request_queue.task_done()
-                        continue
-                    
-                    url_completed.add(url)
-                    host = urlparse(url).netloc
-                    timestamp = datetime.now().strftime("%m-%d %H:%M:%S")
-                    
-                    try:
-                        headers["host"] = host
-                        response = await client.request(method, url, headers=headers, json=body)
 
-                        if urlFuzz == "fuzz" and response.status_code in (404,500):
-                            url = re_remove_url_context.sub(r"\1\2", url)
-                            response = await client.request(method, url, headers=headers, json=body)
+def create_timeouts(ceiling=None):
+    """
+    按配置[TIMEOUT]创建按主机的自适应截止时间
+    :param ceiling: 截止时间上限（秒），为None时使用配置TIMEOUT.Ceiling
+    """
+    return AdaptiveTimeout(config.timeout_percentile, config.timeout_multiplier, config.timeout_floor,
+                           config.timeout_ceiling if ceiling is None else ceiling, config.timeout_window,
+                           config.timeout_min_samples, enabled=config.timeout_adaptive)
 
-                        if 302 == response.status_code:
-                            url = response.headers.get("Location")
-                            response = await client.request(method, url, headers=headers, json=body)
-                        
-                        # 记录日志
-                        loggerRequest.info(f"【{response.status_code}】【{depth}】【{urlFuzz}】: {url}")
-                        
-                        # 将网络请求状态发送到UI队列
-                        if ui_queue is not None:
-                            try:
-                                ui_data = {
-                                    'timestamp': timestamp,
-                                    'status': response.status_code,
-                                    'url': url,
-                                    'depth': depth,
-                                    'type': urlFuzz,
-                                    'content_type': response.headers.get('Content-Type', 'unknown'),
-                                    'size': len(response.text),
-                                    'regex_names': regex_names,
-                                }
-                                await ui_queue.put(ui_data)
-                            except asyncio.CancelledError:
-                                raise
-                            except Exception:
-                                continue
-                        
-                        # 存放(url, response_content)
-                        try:
-                            await process_queue.put((response.text, url, depth))
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            continue
-
-                    except RemoteProtocolError as rpe:
-                        loggerRequest.info(f"【服务器协议中断】：{rpe} {url}")
-                        if ui_queue is not None:
-                            try:
-                                await ui_queue.put({
-                                    'timestamp': timestamp,
-                                    'status': 'error',
-                                    'url': url,
-                                    'depth': depth,
-                                    'type': urlFuzz,
-                                    'regex_names': regex_names,
-                                    'error': f"服务器协议中断: {str(rpe)}"
-                                })
-                            except:
-                                continue
-                    except ConnectError as ce:
-                        loggerRequest.info(f"【网络层异常】：{ce} {url}")
-                        if ui_queue is not None:
-                            try:
-                                await ui_queue.put({
-                                    'timestamp': timestamp,
-                                    'status': 'error',
-                                    'url': url,
-                                    'depth': depth,
-                                    'type': urlFuzz,
-                                    'regex_names': regex_names,
-                                    'error': f"网络层异常: {str(ce)}"
-                                })
-                            except:
-                                continue
-                    except ReadTimeout as ce:
-                        loggerRequest.info(f"【连接层异常】：{ce} {url}")
-                        if ui_queue is not None:
-                            try:
-                                await ui_queue.put({
-                                    'timestamp': timestamp,
-                                    'status': 'error',
-                                    'url': url,
-                                    'depth': depth,
-                                    'type': urlFuzz,
-                                    'regex_names': regex_names,
-                                    'error': f"连接层异常: {str(ce)}"
-                                })
-                            except:
-                                continue
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception as e:
-                        loggerRequest.info(f"【其他异常：】【{e}】{url}")
-                        if ui_queue is not None:
-                            try:
-                                await ui_queue.put({
-                                    'timestamp': timestamp,
-                                    'status': 'error',
-                                    'url': url,
-                                    'depth': depth,
-                                    'type': urlFuzz,
-                                    'regex_names': regex_names,
-                                    'error': f"其他异常: {str(e)}"
-                                })
-                            except:
-                                continue
-                    finally:
-                        request_queue.task_done()
-
-                except asyncio.TimeoutError:
-                    # 检查是否应该继续等待
-                    continue
-                except asyncio.CancelledError:
-                    # 清理资源
-                    if not request_queue.empty():
-                        request_queue.task_done()
-                    raise
 
-    except asyncio.CancelledError:
-        # 确保发送结束信号
-        try:
-            await request_queue.put((None, None))
-        except:
-            pass
-        raise
-    finally:
-        # 确保发送结束信号
-        try:
-            await request_queue.put((None, None))
-        except:
-            pass
+def create_breaker():
+    """按配置[BREAKER]创建按主机的熔断器"""
+    return CircuitBreaker(config.breaker_failure_threshold, config.breaker_cooldown, config.breaker_max_cooldown,
+                          config.breaker_max_trips, park=config.breaker_mode == "park")
+
 
+def create_mirror():
+    """按配置[MIRROR]创建代理镜像重放器，未开启代理或代理模式不是mirror时返回None"""
+    if not config.crawler_proxy_switch or config.crawler_proxy_mode != "mirror":
+        return None
+    proxies = parse_proxies(config.crawler_proxies)
+    # 多个代理时经代理池重放
+    transport = build_proxy_pool(proxies, httpx.Limits(max_connections=config.mirror_concurrency)) \
+        if len(proxies) > 1 else None
+    return ProxyMirror(", ".join(proxies), config.mirror_concurrency, config.mirror_queue_size,
+                       config.mirror_overflow, config.mirror_spool_file, config.mirror_timeout, transport)
 
 
-async def content_processor(process_queue, request_queue, event, exclude_queue=None):
+def create_archive(crawl_id=None):
     """
-    内容处理函数
-    :param process_queue: 处理队列
-    :param request_queue: 请求队列
-    :param event: 事件
-    :param exclude_queue: 排除队列，用于向UI发送排除链接信息
-    :return:
+    按配置[ARCHIVE]创建响应存档，未启用时返回None
+    :param crawl_id: 存档记录默认的爬取编号，多目标调度时传入结果库的编号
     """
-    try:
+    if not config.archive_enabled:
+        return None
+    return ResponseArchive(config.archive_file, config.archive_compress_level, crawl_id=crawl_id)
+
+
+def _latency_trace(marks):
+    """httpcore的trace扩展回调，记录发完请求体和收到响应头的时刻，两者之差是读取超时限制的等待时间"""
+    async def trace(event, info):
+        if event.endswith((".send_request_body.complete", ".receive_response_headers.complete")):
+            marks[event.rsplit(".", 2)[1]] = time.perf_counter()
+    return trace
+
+
+class Crawler:
+    """
+    一次爬取
+    拥有自己的请求队列、处理队列、去重集合、请求头模板、结果输出、断点和指标，互不影响，
+    多个Crawler可在同一事件循环中同时运行，传入同一个client时共享连接池
+    """
+
+    def __init__(self, start_url, method="GET", ui_queue=None, exclude_queue=None, max_depth=None, user_agent=None,
+                 resume=False, results_store=None, sinks=None, client=None, transport=None, proxies=None,
+                 scope=None, checkpoint_file=None, seen=None, name=None, depth_start=0, notify_done=True, budget=None,
+                 breaker=None, timeout=None, mirror=None, archive=None, exclude_sinks=None, crawl_id=None):
+        """
+        :param start_url: 起始URL、URL列表或逐个产生URL的可迭代对象（如SeedFile），断点续爬时可为None；
+                          续爬时若再次传入同一种子来源，会跳过上次已写入的种子继续写入
+        :param method: 请求方法
+        :param ui_queue: UI队列，用于向UI发送网络请求状态和进度信息
+        :param exclude_queue: 排除队列，用于向UI发送排除链接信息
+        :param max_depth: 爬取深度，为None时使用配置CRAWLER.MaxDepth
+        :param user_agent: 用户代理，为None时使用报文模板中的值
+        :param resume: 是否从断点文件恢复上次未完成的爬取
+        :param results_store: 结果库(ResultsStore)，为None时不保存结果
+        :param sinks: 其他结果输出（如exporters中的导出器），每条结果调用其add_result
+        :param client: 共享的HTTP客户端(http_client.build_client)，为None时运行期间自建客户端
+        :param transport: 自建客户端的httpx传输层，为None时发起真实网络请求
+        :param proxies: 自建客户端的代理地址，为None时使用配置
+        :param scope: 扫描范围，如 *.example.com，为None时使用配置CRAWLER.SubDomain
+        :param checkpoint_file: 断点文件，为None时不保存断点；同时运行的爬取不能共用断点文件
+        :param seen: 已完成URL集合，为None时新建
+        :param name: 名称，用于日志、追踪和结果(job字段)中区分同时运行的爬取
+        :param depth_start: 种子深度序号的起始偏移，第i个种子的深度序号为depth_start+i；
+                            多个爬取共用一个UI队列时错开，使深度序号不重复
+        :param notify_done: 结束时是否向UI队列和排除队列发送None；多个爬取共用队列时由调度器统一发送
+        :param budget: 爬取预算(CrawlBudget)，为None时按配置[BUDGET]创建
+        :param breaker: 按主机的熔断器(CircuitBreaker)，为None时按配置[BREAKER]创建；暂存的URL属于本次爬取，不要在爬取间共用
+        :param timeout: 请求截止时间上限（秒），为None时使用配置TIMEOUT.Ceiling；自建客户端时同时作为读取超时
+        :param mirror: 代理镜像重放器(ProxyMirror)，由调用方启动和关闭；为None时按配置[MIRROR]在运行期间自建
+        :param archive: 响应存档(ResponseArchive)，由调用方关闭；为None时按配置[ARCHIVE]在运行期间自建
+        :param exclude_sinks: 排除日志输出（如exporters.open_exclusion_exporter），每条排除日志调用其add_exclusion；
+                              results_store不为None时排除日志同时写入结果库
+        :param crawl_id: 爬取编号，写入断点和响应存档；为None时取results_store新开始的编号，续爬时沿用断点中的编号，都没有时新建
+        """
+        self.start_url = start_url
+        self.method = method
+        self.ui_queue = ui_queue
+        self.exclude_queue = exclude_queue
+        self.max_depth = int(max_depth or config.crawler_max_depth)
+        self.resume = resume
+        self.results_store = results_store
+        self.extra_sinks = list(sinks or [])
+        self.extra_exclude_sinks = list(exclude_sinks or [])
+        self.client = client
+        self.transport = transport
+        self.proxies = proxies
+        self.scope = scope
+        self.checkpoint_file = checkpoint_file
+        self.seen = set() if seen is None else seen
+        self.name = name
+        self.depth_start = depth_start
+        self.notify_done = notify_done
+
+        # 请求头模板：Host由httpx按每个请求的URL生成，不放在共享的模板中
+        self.headers = HttpCaseInsensitiveDict(headers or {})
+        self.headers.pop("host", None)
+        if user_agent:
+            self.headers["User-Agent"] = user_agent
+        self.body = None if method.lower() == "get" else data
+
+        self.request_queue = FrontierQueue(soft_limit=config.crawler_request_queue_size)
+        self.process_queue = ByteBudgetQueue(max_bytes=config.crawler_process_queue_bytes)
+        self.governor = MemoryGovernor(config.crawler_memory_limit_bytes, self.process_queue)
+        # 在途任务计数，种子写入完成前先占用一个计数，避免种子未写完就判定结束
+        self.tracker = WorkTracker()
+        self.metrics = CrawlMetrics(self.pipeline_stats)
+        self.budget = budget if budget is not None else create_budget()
+        self.budget.on_exhausted = self._budget_exhausted
+        if self.budget.enabled:
+            self.metrics.extra["budget"] = self.budget.summary
+        self.timeout = timeout
+        self.mirror = mirror
+        self.archive = archive
+        self.crawl_id = crawl_id
+        # 客户端的DNS缓存，运行时获取
+        self.dns = None
+        self.timeouts = create_timeouts(timeout)
+        self.metrics.extra["timeouts"] = self.timeouts.snapshot
+        self.breaker = breaker if breaker is not None else create_breaker()
+        self.breaker.on_state_change = self._breaker_changed
+        if self.breaker.enabled:
+            self.metrics.extra["breaker"] = self.breaker.snapshot
+        self.checkpoint = None
+        self.sinks = []
+        self.exclude_sinks = []
+        self._restored = None
+
+    @property
+    def pipeline(self):
+        """各阶段的队列与内存调节器"""
+        return dict(request_queue=self.request_queue, process_queue=self.process_queue,
+                    ui_queue=self.ui_queue, exclude_queue=self.exclude_queue, governor=self.governor)
+
+    def pipeline_stats(self):
+        """各阶段队列深度、上限及内存调节状态"""
+        return queue_stats(**self.pipeline)
+
+    def _log_prefix(self):
+        return f"【{self.name}】" if self.name else ""
+
+    def _budget_exhausted(self, host, kind):
+        """某项预算首次用完时记录日志"""
+        scope = f"主机{host}" if host is not None else "本次爬取"
+        loggerRequest.info(f"{self._log_prefix()}【预算】{scope}的{kind}预算已用完，剩余URL不再请求")
+
+    def _breaker_changed(self, host, old, new):
+        """主机熔断状态变化时记录日志"""
+        if new == "open":
+            message = "探测失败，继续暂停请求" if old == "half_open" else "连续连接失败或超时，暂停请求"
+        else:
+            message = {"half_open": "冷却结束，发送探测请求", "closed": "已恢复"}.get(new, new)
+        loggerRequest.info(f"{self._log_prefix()}【熔断】主机{host}{message}")
+
+    async def _release_parked(self):
+        """定期把熔断期间暂存的URL放回请求队列：主机恢复后全部放回，冷却结束时放回一个作为探测"""
         while True:
+            await asyncio.sleep(0.5)
+            for item in self.breaker.due():
+                self.request_queue.put_nowait(item)
+
+    def _open_checkpoint(self):
+        """断点：续爬时读取上次的待爬URL、已完成URL和结果行，否则清空旧断点"""
+        if self.checkpoint_file:
+            self.checkpoint = CrawlCheckpoint(self.checkpoint_file, config.storage_checkpoint_interval)
+            if self.resume:
+                _, frontier, seen, results = self.checkpoint.load()
+                self.seen.update(seen)
+                self._restored = (frontier, results)
+                loggerRequest.info(f"{self._log_prefix()}【断点续爬】待爬{len(frontier)}个，已完成{len(seen)}个")
+        elif self.resume:
+            loggerRequest.info(f"{self._log_prefix()}【断点续爬】未配置断点文件，按起始URL重新爬取")
+
+        # 续爬的结果和存档仍归属于原来那次爬取
+        restored_id = self.checkpoint.crawl_id if self._restored is not None else None
+        self.sinks = list(self.extra_sinks)
+        self.exclude_sinks = list(self.extra_exclude_sinks)
+        if self.results_store is not None:
+            if restored_id or self.crawl_id:
+                self.results_store.crawl_id = restored_id or self.crawl_id
+            else:
+                self.results_store.start_crawl()
+            self.crawl_id = self.results_store.crawl_id
+            self.sinks.append(self.results_store)
+            self.exclude_sinks.append(self.results_store)
+        else:
+            self.crawl_id = restored_id or self.crawl_id or new_crawl_id()
+        if self.checkpoint is not None:
+            if self._restored is None:
+                start_url = self.start_url
+                # 种子来源为生成器时只记录其说明，不展开
+                self.checkpoint.reset(start_url if isinstance(start_url, (str, list)) or start_url is None else repr(start_url),
+                                      self.crawl_id)
+            self.sinks.append(self.checkpoint)
+
+    async def run(self):
+        """运行爬取，所有URL处理完成后返回"""
+        own_mirror = None
+        if self.mirror is None:
+            own_mirror = self.mirror = create_mirror()
+            if own_mirror is not None:
+                own_mirror.start()
+        if self.mirror is not None:
+            self.metrics.extra["mirror"] = self.mirror.stats
+        own_archive = None
+        if self.archive is None:
+            own_archive = self.archive = create_archive()
+        if self.archive is not None:
+            self.metrics.extra["archive"] = self.archive.stats
+        try:
+            if self.client is not None:
+                await self._run(self.client)
+            else:
+                async with build_client(self.transport, self.proxies, self.timeout) as client:
+                    await self._run(client)
+        finally:
+            if own_mirror is not None:
+                await own_mirror.close(config.mirror_drain_seconds)
+                loggerRequest.info(f"{self._log_prefix()}【镜像】{json.dumps(own_mirror.stats(), ensure_ascii=False)}")
+            if own_archive is not None:
+                # 等待写入线程写完剩余响应
+                await asyncio.to_thread(own_archive.close)
+                loggerRequest.info(f"{self._log_prefix()}【存档】{json.dumps(own_archive.stats(), ensure_ascii=False)}")
+
+    async def _request(self, client, url):
+        """
+        发起一次请求，该主机的自适应截止时间作为读取超时：等待响应或两次读取之间超过截止时间时抛出ReadTimeout；
+        等待连接池仍按客户端的连接池超时，下载大响应体的总耗时不受限制。
+        从发出请求到收到响应头的耗时计入该主机的样本，被截断的请求以截止时间计入；镜像模式时记录该请求
+        """
+        host = urlparse(url).netloc
+        timeouts = self.timeouts
+        if not timeouts.enabled:
+            response = await client.request(self.method, url, headers=self.headers, json=self.body)
+        else:
+            deadline = timeouts.deadline(host)
+            timeout = httpx.Timeout(connect=client.timeout.connect, read=deadline, write=client.timeout.write,
+                                    pool=client.timeout.pool)
+            marks = {}
+            started = time.perf_counter()
+            try:
+                response = await client.request(self.method, url, headers=self.headers, json=self.body,
+                                                timeout=timeout, extensions={"trace": _latency_trace(marks)})
+            except httpx.ReadTimeout as e:
+                timeouts.timed_out(host, deadline)
+                raise httpx.ReadTimeout(f"超过截止时间{deadline:.1f}秒", request=e.request) from e
+            # 传输层不支持trace扩展（如MockTransport）时按总耗时计
+            timeouts.observe(host, marks.get("receive_response_headers", time.perf_counter())
+                             - marks.get("send_request_body", started))
+        # 镜像模式：得到响应的请求交给后台经代理重放
+        if self.mirror is not None:
+            self.mirror.add(self.method, url, self.headers, self.body)
+        return response
+
+    def _prefetch(self, url):
+        """预解析URL的主机名"""
+        if self.dns is not None:
+            try:
+                self.dns.prefetch(urlparse(url).hostname)
+            except ValueError:
+                pass
+
+    async def _run(self, client):
+        self.metrics.extra["pool"] = lambda: pool_stats(client)
+        self.dns = dns_cache(client)
+        if self.dns is not None:
+            self.metrics.extra["dns"] = self.dns.stats
+        proxies = proxy_pool(client)
+        if proxies is not None:
+            self.metrics.extra["proxies"] = proxies.stats
+        self._open_checkpoint()
+        checkpoint = self.checkpoint
+        self.budget.start()
+        self.tracker.add()
+        prefix = f"{self.name}:" if self.name else ""
+
+        # 创建生产者任务
+        producer_task = [asyncio.create_task(self.network_request(client), name=f"{prefix}fetch-{i}") for i in range(5)]
+        # 创建消费者任务
+        consumer_task = [asyncio.create_task(self.content_processor(), name=f"{prefix}parse-{i}") for i in range(3)]
+
+        seed_task = asyncio.create_task(self.seed())
+        governor_task = asyncio.create_task(self.governor.run()) if self.governor.enabled else None
+        checkpoint_task = asyncio.create_task(checkpoint.run()) if checkpoint is not None else None
+        release_task = asyncio.create_task(self._release_parked()) \
+            if self.breaker.enabled and self.breaker.park_enabled else None
+        idle_task = asyncio.create_task(self.tracker.wait())
+        workers = [seed_task, *producer_task, *consumer_task]
+
+        try:
+            # 等待在途计数归零，期间任一协程异常退出则直接抛出
+            pending = {idle_task, *workers}
+            while not idle_task.done():
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task is not idle_task and not task.cancelled() and task.exception():
+                        raise task.exception()
+
+            # 所有工作已完成，向每个协程发送一个停止信号
+            for _ in producer_task:
+                self.request_queue.put_nowait((None, None))
+            for _ in consumer_task:
+                self.process_queue.put_nowait((None, None, None))
+            await asyncio.gather(*producer_task, *consumer_task)
+            if checkpoint is not None:
+                checkpoint.finish()
+
+            # 通知UI侧的队列监控结束
+            if self.notify_done:
+                for q in (self.ui_queue, self.exclude_queue):
+                    if q is not None:
+                        await q.put(None)
+        finally:
+            for task in (idle_task, governor_task, checkpoint_task, release_task, *workers):
+                if task is not None and not task.done():
+                    task.cancel()
+            if checkpoint is not None:
+                checkpoint.close()
+            self.budget.finish()
+            loggerRequest.info(f"{self._log_prefix()}【队列统计】{json.dumps(self.pipeline_stats(), ensure_ascii=False)}")
+            if self.client is None:
+                # 共享的客户端由创建方统计
+                loggerRequest.info(f"{self._log_prefix()}【连接池】{json.dumps(pool_stats(client), ensure_ascii=False)}")
+                if self.dns is not None:
+                    self.dns.close()
+                    loggerRequest.info(f"{self._log_prefix()}【DNS】{json.dumps(self.dns.stats(), ensure_ascii=False)}")
+                if proxies is not None:
+                    loggerRequest.info(f"{self._log_prefix()}【代理池】{json.dumps(proxies.stats(), ensure_ascii=False)}")
+            if self.timeouts.enabled and self.timeouts.hosts:
+                deadlines = {host: item["deadline"] for host, item in self.timeouts.snapshot()["hosts"].items()}
+                loggerRequest.info(f"{self._log_prefix()}【截止时间】{json.dumps(deadlines, ensure_ascii=False)}")
+            if self.budget.exhausted:
+                loggerRequest.info(f"{self._log_prefix()}【预算】{json.dumps(self.budget.summary(), ensure_ascii=False)}")
+
+    async def seed(self):
+        # 种子URL受请求队列上限约束，由抓取协程边取边放；种子来源为生成器时边读边放，不等全部读完
+        request_queue, tracker, checkpoint = self.request_queue, self.tracker, self.checkpoint
+        try:
+            skip = 0
+            if self._restored is not None:
+                frontier, results = self._restored
+                # 先重新展示已有结果，UI据此重建深度到行号的映射
+                for result in results:
+                    for sink in self.extra_sinks:
+                        sink.add_result(result)
+                    if self.ui_queue is not None:
+                        await self.ui_queue.put(result)
+                for url, urlProperty in frontier:
+                    tracker.add()
+                    await request_queue.put_throttled((url, urlProperty))
+                    self._prefetch(url)
+                # 上次种子未写完时，跳过已写入的种子继续
+                progress = checkpoint.seed_progress
+                if self.start_url is None or progress is None or progress[1]:
+                    return
+                skip = progress[0]
+
+            start_url = self.start_url
+            seeds = [start_url] if isinstance(start_url, str) else (start_url or ())
+            depth = 0
+            for url in seeds:
+                # 整个爬取的预算已用完时不再写入种子
+                if self.budget.stopped:
+                    break
+                depth += 1
+                if depth <= skip:
+                    continue
+                urlProperty = ("source", f"{self.depth_start + depth}", "N")
+                tracker.add()
+                await request_queue.put_throttled((url, urlProperty))
+                self._prefetch(url)
+                if checkpoint is not None:
+                    checkpoint.add(url, urlProperty)
+                    checkpoint.seeded(depth)
+                # 队列未满时put不会让出事件循环，定期让出使抓取协程尽快开始
+                if depth % 100 == 0:
+                    await asyncio.sleep(0)
+            if checkpoint is not None:
+                checkpoint.seeded(depth, done=not self.budget.stopped)
+        finally:
+            tracker.done()
+
+    async def network_request(self, client):
+        """
+        网络请求协程
+        请求被跳过或失败时在途计数减少；响应体交给处理队列后，处理队列按响应体大小限流，解析跟不上时put阻塞使抓取放缓
+        :param client: HTTP客户端
+        """
+        request_queue, process_queue, tracker = self.request_queue, self.process_queue, self.tracker
+        governor, checkpoint, metrics, budget = self.governor, self.checkpoint, self.metrics, self.budget
+        breaker = self.breaker
+        while True:
+            # 阻塞等待，在所有工作完成后收到None作为停止信号
+            url, urlProperty = await request_queue.get()
+            if url is None:
+                request_queue.task_done()
+                break
+
+            urlFuzz, depth, regex_names = urlProperty
+            if len(depth.split(".")) > self.max_depth or url in self.seen:
+                request_queue.task_done()
+                tracker.done()
+                if checkpoint is not None:
+                    checkpoint.drop(depth)
+                continue
+
+            host = urlparse(url).netloc
+            verdict = breaker.check(host)
+            if verdict == REJECT:
+                request_queue.task_done()
+                # 熔断中的主机：暂存到恢复后再请求（在途计数不变），或立即按失败处理
+                if breaker.should_park(host):
+                    breaker.park(host, (url, urlProperty))
+                    continue
+                self.seen.add(url)
+                timestamp = _timestamp()
+                loggerRequest.info(f"{self._log_prefix()}【熔断】：主机暂停请求 {url}", extra={"fields": {
+                    "error": "CircuitOpen", "depth": depth, "url": url}})
+                try:
+                    await self._emit_result(_error_result(timestamp, url, depth, urlFuzz, regex_names, f"熔断: 主机{host}暂停请求"))
+                finally:
+                    tracker.done()
+                    if checkpoint is not None:
+                        checkpoint.complete(depth)
+                continue
+
+            # 预算用完的主机（或整个爬取）的URL直接丢弃；仍保留在断点的待爬列表中，放宽预算后可续爬
+            if budget.admit(host):
+                if verdict == PROBE:
+                    breaker.release_probe(host)
+                request_queue.task_done()
+                tracker.done()
+                continue
+
+            self.seen.add(url)
+            timestamp = _timestamp()
+            # 响应体成功交给处理队列后，在途计数由解析协程负责减少
+            handed_over = False
+
+            try:
+                # 内存超限时等待解析阶段消化积压
+                await governor.wait()
+                metrics.request_started()
+                started = time.perf_counter()
+                try:
+                    request_url = url
+                    with trace_page("network_request", depth, url=url):
+                        response = await self._request(client, url)
+
+                        if urlFuzz == "fuzz" and response.status_code in (404,500):
+                            url = re_remove_url_context.sub(r"\1\2", url)
+                            response = await self._request(client, url)
+
+                        if 302 == response.status_code:
+                            url = response.headers.get("Location")
+                            response = await self._request(client, url)
+                except Exception as e:
+                    metrics.request_finished(host, time.perf_counter() - started, error=e)
+                    if is_breaker_failure(e):
+                        breaker.record_failure(host)
+                    else:
+                        breaker.record_success(host)
+                    raise
+                response_time = time.perf_counter() - started
+                metrics.request_finished(host, response_time, response.status_code, len(response.content))
+                budget.charge_bytes(host, len(response.content))
+                breaker.record_success(host)
+                if self.archive is not None:
+                    self.archive.add(url, response.status_code, response.reason_phrase, response.http_version,
+                                     response.headers.multi_items(), response.content, depth, urlFuzz, self.name,
+                                     request_url, self.crawl_id)
+                if 200 <= response.status_code < 300:
+                    if config.matcher.profile:
+                        config.matcher.stats.responded_ok(regex_names)
+
+                # 记录日志
+                loggerRequest.info(f"{self._log_prefix()}【{response.status_code}】【{depth}】【{urlFuzz}】: {url}", extra={"fields": {
+                    "status": response.status_code, "depth": depth, "type": urlFuzz, "url": url}})
+
+                # 将网络请求状态发送到UI队列
+                await self._emit_result({
+                    'timestamp': timestamp,
+                    'status': response.status_code,
+                    'url': url,
+                    'depth': depth,
+                    'type': urlFuzz,
+                    'content_type': response.headers.get('Content-Type', 'unknown'),
+                    'size': len(response.text),
+                    'response_time': round(response_time, 3),
+                    'regex_names': regex_names,
+                })
+
+                # 存放(url, response_content)
+                await process_queue.put((response.text, url, depth))
+                handed_over = True
+
+            except RemoteProtocolError as rpe:
+                loggerRequest.info(f"{self._log_prefix()}【服务器协议中断】：{rpe} {url}", extra=_error_fields(rpe, depth, url))
+                await self._emit_result(_error_result(timestamp, url, depth, urlFuzz, regex_names, f"服务器协议中断: {str(rpe)}"))
+            except ConnectError as ce:
+                loggerRequest.info(f"{self._log_prefix()}【网络层异常】：{ce} {url}", extra=_error_fields(ce, depth, url))
+                await self._emit_result(_error_result(timestamp, url, depth, urlFuzz, regex_names, f"网络层异常: {str(ce)}"))
+            except ReadTimeout as ce:
+                loggerRequest.info(f"{self._log_prefix()}【连接层异常】：{ce} {url}", extra=_error_fields(ce, depth, url))
+                await self._emit_result(_error_result(timestamp, url, depth, urlFuzz, regex_names, f"连接层异常: {str(ce)}"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                loggerRequest.info(f"{self._log_prefix()}【其他异常：】【{e}】{url}", extra=_error_fields(e, depth, url))
+                await self._emit_result(_error_result(timestamp, url, depth, urlFuzz, regex_names, f"其他异常: {str(e)}"))
+            finally:
+                request_queue.task_done()
+                if not handed_over:
+                    tracker.done()
+                    if checkpoint is not None:
+                        checkpoint.complete(depth)
+
+    async def content_processor(self):
+        """内容处理协程：解析响应中的链接，新URL放回请求队列，排除的链接发送到排除队列和排除日志输出"""
+        process_queue, request_queue, tracker = self.process_queue, self.request_queue, self.tracker
+        exclude_queue, checkpoint, metrics = self.exclude_queue, self.checkpoint, self.metrics
+        exclude_sinks = self.exclude_sinks
+        while True:
+            # 阻塞等待，在所有工作完成后收到None作为停止信号
+            response_content, url, depth = await process_queue.get()
+            if url is None:
+                process_queue.task_done()
+                break
+
             try:
-                # 使用wait_for以便能够响应取消
-                response_content, url, depth = await asyncio.wait_for(process_queue.get(), timeout=1.0)
-                if response_content is None:
-                    break  # 接收到 None 作为停止信号
-                
                 # 解析链接
-                new_urls, exclude_matches = await parse_links(response_content, url, depth)
-                event.set()
+                started = time.perf_counter()
+                with trace_page("parse_links", depth, url=url, size=len(response_content)):
+                    new_urls, exclude_matches = await parse_links(response_content, url, depth, self.scope)
+                metrics.page_parsed(time.perf_counter() - started)
 
                 # 处理排除的链接
-                if exclude_matches and exclude_queue is not None:
-                    timestamp = datetime.now().strftime("%m-%d %H:%M:%S")
+                if exclude_matches and (exclude_queue is not None or exclude_sinks):
+                    timestamp = _timestamp()
                     for excluded_url, rules in exclude_matches.items():
                         # 为每个规则创建一个排除日志条目
                         for rule in rules:
-                            try:
-                                await exclude_queue.put({
-                                    'timestamp': timestamp,
-                                    'rule': rule,
-                                    'link': excluded_url,
-                                    'source': url,
-                                    'parent_index': depth
-                                })
-                            except asyncio.CancelledError:
-                                raise
-                            except Exception:
-                                continue
-                
+                            entry = {
+                                'timestamp': timestamp,
+                                'rule': rule,
+                                'link': excluded_url,
+                                'source': url,
+                                'parent_index': depth,
+                                'job': self.name
+                            }
+                            for sink in exclude_sinks:
+                                sink.add_exclusion(entry)
+                            if exclude_queue is not None:
+                                await exclude_queue.put(entry)
+
                 # 将新URL放回网络请求队列
-                for new_url, urlProperty in new_urls.items():
-                    try:
-                        await request_queue.put((new_url, urlProperty))
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception:
-                        continue
-                
+                with trace_page("enqueue", depth, count=len(new_urls)):
+                    for new_url, urlProperty in new_urls.items():
+                        tracker.add()
+                        request_queue.put_nowait((new_url, urlProperty))
+                        self._prefetch(new_url)
+                        if checkpoint is not None:
+                            checkpoint.add(new_url, urlProperty)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                loggerRequest.info(f"{self._log_prefix()}【解析异常】：{e} {url}", extra=_error_fields(e, depth, url))
+            finally:
                 process_queue.task_done()
-            except asyncio.TimeoutError:
-                # 检查是否应该继续等待
-                continue
-
+                tracker.done()
+                if checkpoint is not None:
+                    checkpoint.complete(depth)
+
+    async def _emit_result(self, result):
+        """将结果行发送到UI队列及各结果输出"""
+        if self.name:
+            result['job'] = self.name
+        await _emit_result(result, self.ui_queue, self.sinks)
+
+
+def _timestamp():
+    """结果行和排除日志的时间，本地时间 YYYY-MM-DD HH:MM:SS"""
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
+
+
+def _error_fields(error, depth, url):
+    """请求日志的结构化字段"""
+    return {"fields": {"error": type(error).__name__, "depth": depth, "url": url}}
+
+
+def _error_result(timestamp, url, depth, urlFuzz, regex_names, error):
+    """构造请求异常的结果行"""
+    return {
+        'timestamp': timestamp,
+        'status': 'error',
+        'url': url,
+        'depth': depth,
+        'type': urlFuzz,
+        'regex_names': regex_names,
+        'error': error
+    }
+
+
+async def _emit_result(result, ui_queue=None, sinks=()):
+    """将结果行发送到UI队列及各结果输出"""
+    for sink in sinks:
+        sink.add_result(result)
+    if ui_queue is None:
+        return
+    try:
+        await ui_queue.put(result)
     except asyncio.CancelledError:
-        # 清理资源
-        if not process_queue.empty():
-            process_queue.task_done()
         raise
-    finally:
-        # 确保发送结束信号
-        try:
-            await process_queue.put((None, None, None))
-        except:
-            pass
-
-
-async def monitor_queues(process_queue, request_queue,event):
-    await event.wait()
-    while True:
-        if request_queue.empty() and process_queue.empty():
-            empty_checks = 3
-            while empty_checks:
-                await asyncio.sleep(4)
-                if request_queue.empty() and process_queue.empty():
-                    empty_checks-=1
-                else:
-                    break
-            if empty_checks == 0:
-                await request_queue.put((None, None))
-                await process_queue.put((None, None, None))
-                print("Both queues are empty. Ending tasks.")
-                break
+    except Exception:
+        pass
 
-        await asyncio.sleep(1)  # 短暂休眠后再次检查
 
-async def main(start_url, method, ui_queue=None, exclude_queue=None, max_depth=None, timeout=None, user_agent=None, proxies=None):
+async def main(start_url, method, ui_queue=None, exclude_queue=None, max_depth=None, timeout=None, user_agent=None, proxies=None, resume=False, results_store=None, sinks=None, transport=None, exclude_sinks=None):
     """
-    爬虫主函数
-    :param start_url: 起始URL或URL列表
-    :param method: 请求方法
-    :param ui_queue: UI队列，用于向UI发送网络请求状态和进度信息
-    :param exclude_queue: 排除队列，用于向UI发送排除链接信息
-    :param max_depth: 爬取深度，默认为None（使用配置文件中的值）
-    :param timeout: 请求超时时间，默认为None（使用默认超时配置）
-    :param user_agent: 用户代理，默认为None（使用默认用户代理）
-    :param proxy: 代理服务器，默认为None（使用配置文件中的值）
+    爬虫主函数：以配置文件中的断点、指标、追踪设置运行一次爬取（Crawler），参数见Crawler
+    :param timeout: 请求截止时间上限（秒），默认为None（使用配置TIMEOUT.Ceiling）
+    :param proxies: 代理服务器，默认为None（使用配置文件中的值）
+    :param transport: httpx传输层，为None时发起真实网络请求
     :return:
     """
 
-    # 如果提供了timeout参数，更新timeout配置
-    # 注意：这里没有直接修改timeout_config，因为它是在network_request函数内部定义的
-    # 如果需要修改timeout，应该在network_request函数中添加相应的逻辑
-
-    request_queue = asyncio.Queue()
-    process_queue = asyncio.Queue()
-
-    # 初始化队列和任务
-    if isinstance(start_url,str):
-        await request_queue.put((start_url,("source","1","N")))
+    crawler = Crawler(start_url, method, ui_queue, exclude_queue, max_depth, user_agent, resume, results_store, sinks,
+                      transport=transport, proxies=proxies, checkpoint_file=config.storage_checkpoint_file, seen=url_completed,
+                      timeout=timeout, exclude_sinks=exclude_sinks)
+
+    current_pipeline.clear()
+    current_pipeline.update(crawler.pipeline)
+    global current_metrics
+    metrics = current_metrics = crawler.metrics
+    config.matcher.stats.reset()
+    metrics.extra["rules"] = config.matcher.stats.snapshot
+    tracer.configure(config.trace_file, config.trace_sample_rate)
+
+    metrics_task = asyncio.create_task(metrics.run(config.metrics_snapshot_file, config.metrics_snapshot_interval)) \
+        if config.metrics_snapshot_file else None
+    trace_task = asyncio.create_task(tracer.run()) if tracer.enabled else None
+    try:
+        await crawler.run()
+    finally:
+        for task in (metrics_task, trace_task):
+            if task is not None and not task.done():
+                task.cancel()
+        tracer.close()
+        if config.metrics_snapshot_file:
+            metrics.write_snapshot(config.metrics_snapshot_file)
 
-    if isinstance(start_url,list):
-        depth = 0
-        for url in start_url:
-            depth +=1
-            await request_queue.put((url,("source",f"{depth}","N")))
 
-    event = asyncio.Event()
+def get_pipeline_stats():
+    """获取当前爬取各阶段队列深度、上限及内存调节状态"""
+    return queue_stats(**current_pipeline)
 
-    # 创建生产者任务，传递UI队列
-    producer_task = [asyncio.create_task(network_request(request_queue, process_queue, method, ui_queue)) for _ in range(5)]
+def get_metrics():
+    """获取当前（或最近一次）爬取的指标，未开始爬取时为None"""
+    return current_metrics
 
-    # 创建消费者任务
-    # 传递UI队列和排除队列给content_processor
-    consumer_task = [asyncio.create_task(content_processor(process_queue, request_queue, event, exclude_queue)) for _ in range(3)]
+class SeedFile:
+    """
+    种子文件，每次迭代逐行读取，不一次性读入内存
+    空行和#开头的行跳过，相对路径拼接base和context，重复的种子只产生一次
+    """
 
-    # 队列监控线程
-    monitor = asyncio.create_task(monitor_queues(process_queue, request_queue,event))
-    await asyncio.gather(*producer_task,*consumer_task,monitor)
+    def __init__(self, path, base=None, context=""):
+        """
+        :param path: 种子文件路径，'-'为标准输入
+        :param base: 相对路径拼接的站点地址，为None时使用配置CRAWLER.SeedBase
+        :param context: 相对路径前加的上下文
+        """
+        self.path = path
+        self.base = config.crawler_seed_base if base is None else base
+        self.context = context
 
-    monitor.cancel()
+    def __iter__(self):
+        return iter_seeds(self.path, self.base, self.context)
 
-def getstarturls(start_file,context=""):
+    def __repr__(self):
+        return f"SeedFile({self.path!r})"
 
-    start_url = []
-    domain = "https://gic.test.cgbchina.com.cn:1443"
 
-    with open(start_file, "r", encoding='utf-8')as file:
-        for line in file.readlines():
-            line = line.rstrip('\n')
+def iter_seeds(start_file, base="", context=""):
+    """
+    逐行读取种子文件的生成器，参数见SeedFile
+    :return: 去重后的种子URL
+    """
+    seen = set()
+    skipped = 0
+    file = sys.stdin if start_file == "-" else open(start_file, "r", encoding='utf-8')
+    try:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
             if line.startswith("http"):
-                start_url.append(line)
-            else:
+                url = line
+            elif base:
                 line = context+"/"+line
-                url = line.replace("//","/")
-                start_url.append(urljoin(domain, url))
-    return start_url
+                url = urljoin(base, line.replace("//","/"))
+            else:
+                skipped += 1
+                continue
+            if url in seen:
+                continue
+            seen.add(url)
+            yield url
+    finally:
+        if file is not sys.stdin:
+            file.close()
+        if skipped:
+            loggerRequest.info(f"【种子】未配置CRAWLER.SeedBase，跳过{skipped}个相对路径种子")
+
+
+def getstarturls(start_file,context=""):
+    """读取种子文件的全部种子URL，大文件请直接把SeedFile传给main"""
+    return list(SeedFile(start_file, context=context))
 
 
 
 # 提供一个函数，供外部调用时创建并传递UI队列和排除队列
-def run_crawler_with_ui_queue(start_url, result_queue=None, reset_state=True):
+def run_crawler_with_ui_queue(start_url, result_queue=None, reset_state=True, resume=False, results_store=None):
     """
     使用UI队列运行爬虫
     
@@ -372,6 +805,8 @@ def run_crawler_with_ui_queue(start_url, result_queue=None, reset_state=True):
         start_url: 起始URL或URL列表，从UI传入
         result_queue: 结果队列，用于接收爬取结果
         reset_state: 是否重置爬虫状态，默认为True
+        resume: 是否从断点文件恢复上次未完成的爬取
+        results_store: 结果库(ResultsStore)，为None时不保存结果
         
     Returns:
         ui_queue: 包含爬虫数据的队列，格式为：
@@ -387,10 +822,12 @@ def run_crawler_with_ui_queue(start_url, result_queue=None, reset_state=True):
             }
         exclude_queue: 包含排除链接数据的队列，格式为：
             {
+                'timestamp': 时间,
                 'rule': 排除规则,
                 'link': 被排除的链接,
                 'source': 源URL,
-                'parent_index': 父深度
+                'parent_index': 父深度,
+                'job': 任务名（多目标调度时）
             }
         crawler_task: 爬虫任务，可以用于等待爬虫完成
     """
@@ -400,14 +837,17 @@ def run_crawler_with_ui_queue(start_url, result_queue=None, reset_state=True):
         url_completed = set()
 
     async def run_with_queue():
-        ui_queue = asyncio.Queue()
-        exclude_queue = asyncio.Queue()
+        # UI消费跟不上时，put阻塞使爬虫放缓，避免数据在队列中无限堆积
+        ui_queue = asyncio.Queue(maxsize=config.crawler_ui_queue_size)
+        exclude_queue = asyncio.Queue(maxsize=config.crawler_ui_queue_size)
         # 创建一个任务来运行主爬虫函数
         crawler_task = asyncio.create_task(main(
             start_url=start_url,
             method="GET",
             ui_queue=ui_queue,
-            exclude_queue=exclude_queue
+            exclude_queue=exclude_queue,
+            resume=resume,
+            results_store=results_store
         ))
         # 返回队列和任务，让调用者可以从队列中获取数据并等待任务完成
         return ui_queue, exclude_queue, crawler_task